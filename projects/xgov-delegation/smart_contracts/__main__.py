@@ -86,6 +86,39 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
+APP_SPEC_EAGER = "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)\n"
+APP_SPEC_LAZY = """\
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+# Declared only: parsed on first use of `APP_SPEC`, not at import
+APP_SPEC: algokit_utils.Arc56Contract
+
+def __getattr__(name: str) -> algokit_utils.Arc56Contract:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+"""
+
+
+def defer_app_spec_parsing(client_path: Path) -> None:
+    """
+    Make a generated client parse its ARC-56 app spec on first use, not at import.
+
+    The client keeps exporting `APP_SPEC`, through a module `__getattr__`.
+    """
+    source = client_path.read_text()
+    if APP_SPEC_EAGER not in source:
+        raise Exception(f"Could not find the app spec parsing in {client_path}")
+    source = source.replace(APP_SPEC_EAGER, APP_SPEC_LAZY, 1)
+    source = source.replace("app_spec=APP_SPEC,", "app_spec=_get_app_spec(),")
+    source = source.replace(
+        "import dataclasses\n", "import dataclasses\nimport functools\n", 1
+    )
+    client_path.write_text(source)
+
+
 def build(output_dir: Path, contract_path: Path) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
@@ -158,6 +191,9 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+            # The generator names the client after the contract
+            for client_path in output_dir.glob("*_client.py"):
+                defer_app_spec_parsing(client_path)
     if client_file:
         return output_dir / client_file
     return output_dir
@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -19,8 +20,18 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "desc": "ID of xGov Registry app this Delegation Registry uses.", "name": "xgov_registry_id"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new Delegation Registry.\nThe registry is created as paused.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new DelegationRegistry Manager.", "name": "manager"}], "name": "set_manager", "returns": {"type": "void"}, "desc": "Sets the DelegationRegistry Manager.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64)", "desc": "Fees to pay for a vote.", "name": "vote_fees", "struct": "Fees"}, {"type": "uint64", "desc": "Fee to become a representative.", "name": "representative_fee"}, {"type": "uint64", "desc": "Fee received as a reward for triggering a vote casting.", "name": "vote_trigger_award"}], "name": "config_delegation_registry", "returns": {"type": "void"}, "desc": "Set the configuration of the Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "withdraw_balance", "returns": {"type": "void"}, "desc": "Withdraw outstanding Algos, excluding MBR and trigger award funds, from the Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_registry", "returns": {"type": "void"}, "desc": "Pause the Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_registry", "returns": {"type": "void"}, "desc": "Resume the Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[6]", "desc": "Contract name for which to load the approval program.", "name": "contract"}, {"type": "uint64", "desc": "The size of the approval program of a contract.", "name": "size"}], "name": "init_contract", "returns": {"type": "void"}, "desc": "Initialize loading of approval program for a contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[6]", "desc": "Contract name for which to load the approval program.", "name": "contract"}, {"type": "uint64", "desc": "The offset in the approval program.", "name": "offset"}, {"type": "byte[]", "desc": "The data to load into the approval program.", "name": "data"}], "name": "load_contract", "returns": {"type": "void"}, "desc": "Load the approval program for a contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to cover costs for the key (de)registration fee.", "name": "payment"}, {"type": "(uint64,uint64,uint64,byte[32],byte[32],byte[64])", "desc": "Key registration information to send.", "name": "key_reg_info", "struct": "KeyRegTxnInfo"}], "name": "key_reg_registry", "returns": {"type": "void"}, "desc": "Issues a key (de)registration transaction for the Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_registry", "returns": {"type": "void"}, "desc": "Updates the Delegation Registry contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}], "name": "update_voter", "returns": {"type": "void"}, "desc": "Update an existing Voter contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the representative.", "name": "representative_address"}], "name": "update_representative", "returns": {"type": "void"}, "desc": "Update an existing representative contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to cover the MBR.", "name": "payment"}], "name": "prepare_voter", "returns": {"type": "void"}, "desc": "Creates an unassigned Voter application that can be consumed by any Voter who registers.\nCan be called by anyone.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to cover the MBR.", "name": "payment"}, {"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "uint64", "desc": "App ID of an unassigned Voter app.", "name": "available_voter_id"}], "name": "register_voter", "returns": {"type": "uint64", "desc": "ID of assigned Voter."}, "desc": "Create a Voter for an xGov at Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment for the votes.", "name": "payment"}, {"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "uint64", "desc": "Number of votes to add.", "name": "add_votes"}], "name": "add_votes", "returns": {"type": "void"}, "desc": "Pays for the votes of an xGov.\nCan be called only by xgov_address, voting_address or voter's manager_address. If xGov is calling it, the fee is lower.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "uint64", "desc": "App ID of proposal on which to trigger vote.", "name": "proposal_id"}], "name": "trigger_vote", "returns": {"type": "void"}, "desc": "Trigger vote for xGov on a proposal.\nCan be called by anyone.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}], "name": "unregister_voter", "returns": {"type": "void"}, "desc": "Unregister Voter of an xGov from Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment to cover representative registration fee and MBR.", "name": "payment"}], "name": "register_representative", "returns": {"type": "uint64", "desc": "ID of created representative."}, "desc": "Create a new representative.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "unregister_representative", "returns": {"type": "void"}, "desc": "Unregister yourself as representative from the Delegation Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "xGov address.", "name": "xgov_address"}], "name": "get_voter_app_id", "returns": {"type": "(uint64,bool)", "desc": "Voter app ID. bool: `True` if Voter app exists, else `False`."}, "desc": "Get Voter app ID for an xGov.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Representative address.", "name": "representative_address"}], "name": "get_representative_app_id", "returns": {"type": "(uint64,bool)", "desc": "App ID of representative. bool: `True` if Representative app exists, else `False`."}, "desc": "Get the app ID of xGov.", "events": [], "readonly": true, "recommendations": {}}], "name": "DelegationRegistry", "state": {"keys": {"box": {"voter_approval_program": {"key": "c2Nfdm90", "keyType": "AVMBytes", "valueType": "AVMBytes"}, "representative_approval_program": {"key": "c2NfcmVw", "keyType": "AVMBytes", "valueType": "AVMBytes"}}, "global": {"manager_address": {"key": "bWFuYWdlcl9hZGRyZXNz", "keyType": "AVMBytes", "valueType": "address"}, "xgov_registry_app": {"key": "eGdvdl9yZWdpc3RyeV9hcHA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_fees": {"key": "dm90ZV9mZWVz", "keyType": "AVMBytes", "valueType": "Fees"}, "representative_fee": {"key": "cmVwcmVzZW50YXRpdmVfZmVl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_trigger_award": {"key": "dm90ZV90cmlnZ2VyX2F3YXJk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused_registry": {"key": "cGF1c2VkX3JlZ2lzdHJ5", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "votes_left": {"key": "dm90ZXNfbGVmdA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "trigger_fund": {"key": "dHJpZ2dlcl9mdW5k", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"voters_box": {"keyType": "address", "valueType": "uint64", "prefix": "dg=="}, "representatives_box": {"keyType": "address", "valueType": "uint64", "prefix": "cg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 32, "ints": 32}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Fees": [{"name": "xgov", "type": "uint64"}, {"name": "other", "type": "uint64"}], "KeyRegTxnInfo": [{"name": "vote_first", "type": "uint64"}, {"name": "vote_last", "type": "uint64"}, {"name": "vote_key_dilution", "type": "uint64"}, {"name": "vote_pk", "type": "byte[32]"}, {"name": "selection_pk", "type": "byte[32]"}, {"name": "state_proof_pk", "type": "byte[64]"}]}, "byteCode": {"approval": "CiAFAAEgBsADJhMPcGF1c2VkX3JlZ2lzdHJ5CnZvdGVzX2xlZnQPbWFuYWdlcl9hZGRyZXNzBBUffHUBdgZzY192b3QReGdvdl9yZWdpc3RyeV9hcHASdm90ZV90cmlnZ2VyX2F3YXJkBAqBAUMMdHJpZ2dlcl9mdW5kCXZvdGVfZmVlcwFyBnNjX3JlcBJyZXByZXNlbnRhdGl2ZV9mZWUEJ2MNZQSg6BhyBExcYboEJDeNPAAxGEAALDE1JBJEMTQkEkQxNxREMTYURCoyA2cnBiJnJw0iZycHImcoImcpImcnCSJngATih75QNhoAjgEApDEZFEQxGEEAjYITBJZn1t4EPY5vrwSztYSCBIb34OYEmDUuhgSjmesnBKpVsvQEyLi8jgR5iFHTBJ2SqB8EO1TAHwSSqcUSBK88U+gElMyeZgRUIFJZBF8IwUcEsQocAAQTGi3RBMpod7M2GgCOEwA1AEYApQDOANcA4AEKATYBkgHPAgwCdwOHBGwExQWsBkMGiQa2AIAEJA0vZzYaAI4BAA0AMRmBBBIxGBBEQgFxNhoBSRWBCBJEKjEAZxcnBkxnKCNnJxJJEkM2GgFJFSQSRIgGo0QqTGcjQzYaAUkVgRASRDYaAkkVgQgSRDYaA0kVgQgSRIgGf0QnCk8DZ0wXJw1MZxcnB0xniAZzIicJZUQyCnMARDIKcwFECQ5EIicKZURJVwAITFcICEsBp0QiJwdlRBanRCNDiAY7RDIKcwBEMgpzAUQJIicJZUQJSUSxIiplRLIHsggjshAisgGzI0OIBhJEKCNnI0OIBglEKCJnI0M2GgFHAhUlEkQ2GgJJTgMVgQgSRIgF7ES9RQFBAAVMF9MjQ0wXuUhC//c2GgFJFSUSRDYaAkkVgQgSRDYaA0kiWYECCEsBFRJEVwIAiAW0REwXTLsjQzEWIwlJOBAjEkQ2GgFJFYGYARJEiAWWREsBOAcyChJETDgIsUsBVxggSwJXOCBLAyJbSwSBCFtLBYEQW08GV1hAsj+yDrINsgyyC7IKgQKyELIBsyNDiAVURCNDNhoBSRUkEkSIBUZEJwRMUEm9RQFEJwW9RCcFIk8CurFMvkgXgQSyGScIskKyGLJAJw+yGiWyECKyAbMjQzYaAUkVJBJEiAUJRCcLTFBJvUUBRCcMvUQnDCJPArqxTL5IF4EEshknCLJCshiyQCcPsholshAisgGzI0MxFiMJSTgQIxJEMgpzAUQnBb1EJwUiTwK6sYEDsjiBCLI3gQiyNiSyNSSyNCcIskKyQCcQsholshAisgGztD2xcghEMgGyCLIHI7IQIrIBszIKcwFETAlLATgHMgoSREw4CDIBTwIIEkQjQzEWIwlJOBAjEkQ2GgFJFSQSRDYaAkkVgQgSREkXMgpzAUQiKGVEFEQnBEsEUEm9RQEURLEiJwZlRLIYJw6yGksEsholshAisgGztD5JVwQASRWBORJESwFXAAQrEkRMVwQ4TCEEU0RXACAxABIxAEsGEhFEJwW9RCcFIk8CurGBA7I4gQiyN4EIsjYksjUksjQnCLJCskAnELIaJbIQIrIBs7Q9sXIIRDIBsgiyByOyECKyAbNLAoAMeGdvdl9hZGRyZXNzZUhJFSQSRDIDEkSxMQBLA7IYgARukyMGshpPBbIasholshAisgGzTwIWvzIKcwFETAlLAjgHMgoSRE8COAgyAU8CCBJEK0xQsCNDIoAAMRYjCUk4ECMSRDYaAUcCFSQSRDYaAklOAhWBCBJEIihlRBREJwRLAVBJvUUBRL5IF0wxAElOAhJBAEQiJwplRCJbRQaxSwGyGIAEKSPz0bIaSwJJsholshAisgGzIillREwXTEsBCClMZ4gC9EsGC0sFSTgHMgoSRDgIEkQjQyInCmVEgQhbRQaxIicGZUSyGCcOshpLA7IaJbIQIrIBs7Q+SVcEAEkVgTkSREsBVwAEKxJETFcEOEwhBFNESwIqZUhJRQkVJBJEVwAgSwESQAAHSUsHEkEABSNEQv9mIkL/+DYaAUkVJBJENhoCSRWBCBJEIihlRBREJwRPAlBJvUUBRLG+SBeyGIAEdX4p/LIasholshAisgGzIillRCMJKUxniAI7sTEAIicHZUSyCLIHI7IQIrIBsyNDIjYaAUcCFSQSRDIKcwFMTgJEIihlRBREJwRLAVBJTgJJvUUBRL5IF0lOAiplSEyxIicGZUSyGCcOshqyGiWyECKyAbO0PklXBABJFYE5EkRLAVcABCsSRExXBDhMIQRTQQA/SwUxABJAAAhLATEAEkEAcCNESVcAIElFCEsCEkAAIEsGSwYSQAAYsUsCshiABLpg2FSyGksBsholshAisgGzSwJJKWVIIillREwJKUxniAFysYEFshmyGCcRsholshAisgGzSwO8SDIKcwFESwVMCbGyCEsFsgcjshAisgGzI0MiQv+NMRYjCUk4ECMSRDIKcwFEIihlRBREMQAnC0sBUEm9RQEURCcMvUQnDCJPArqxgQOyOIEJsjeBB7I2JLI1JLI0JwiyQrJAgATMaU6qshpMsholshAisgGztD2xSXIIRDIBsgiyByOyECKyAbMWTEsBvzIKcwFETwIJSwI4BzIKEkRPAjgIIicNZURPAggyAQgSRCtMULAjQzIKcwFEIihlRBREMQAnC0sBUEm9RQFEsUm+SBeBBbIZshgnEbIaJbIQIrIBs7xIMgpzAURPAkwJsbIIsgcjshAisgGzI0M2GgFJFSQSRCcETFBJvUlPAkhBABRLAb5EFxaAAQAiSwNUUCtMULAjQyJC/+02GgFJFSQSRCcLTFBJvUlPAkhBABRLAb5EFxaAAQAiSwNUUCtMULAjQyJC/+0xACIqZUQSiSInB2VEIillRAsnCUxniQ==", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgNiA0NDgKICAgIGJ5dGVjYmxvY2sgMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkgMHg3NjZmNzQ2NTczNWY2YzY1NjY3NCAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MyAweDE1MWY3Yzc1IDB4NzYgMHg3MzYzNWY3NjZmNzQgMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwIDB4NzY2Zjc0NjU1Zjc0NzI2OTY3Njc2NTcyNWY2MTc3NjE3MjY0IDB4MGE4MTAxNDMgMHg3NDcyNjk2NzY3NjU3MjVmNjY3NTZlNjQgMHg3NjZmNzQ2NTVmNjY2NTY1NzMgMHg3MiAweDczNjM1ZjcyNjU3MCAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjY2NjU2NSAweDI3NjMwZDY1IDB4YTBlODE4NzIgMHg0YzVjNjFiYSAweDI0Mzc4ZDNjIFRNUExfZW50cm9weQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDYtNDcKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gYXNzZXJ0IFR4bi5nbG9iYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkdMT0JBTF9CWVRFUywgZXJyLldST05HX0dMT0JBTF9CWVRFUwogICAgdHhuIEdsb2JhbE51bUJ5dGVTbGljZQogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBCeXRlcyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0OAogICAgLy8gYXNzZXJ0IFR4bi5nbG9iYWxfbnVtX3VpbnQgPT0gY2ZnLkdMT0JBTF9VSU5UUywgZXJyLldST05HX0dMT0JBTF9VSU5UUwogICAgdHhuIEdsb2JhbE51bVVpbnQKICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDkKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwCiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV91aW50ID09IGNmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTUKICAgIC8vIGtleT1jZmcuR1NfS0VZX01BTkFHRVJfQUREUkVTUywKICAgIGJ5dGVjXzIgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBhcmM0LkFkZHJlc3MoKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTItNTYKICAgIC8vICMgR2xvYmFsIFZhcmlhYmxlcwogICAgLy8gc2VsZi5tYW5hZ2VyX2FkZHJlc3MgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBhcmM0LkFkZHJlc3MoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9NQU5BR0VSX0FERFJFU1MsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTkKICAgIC8vIGtleT1jZmcuR1NfS0VZX1hHT1ZfUkVHSVNUUllfQVBQLAogICAgYnl0ZWMgNiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4CiAgICAvLyBBcHBsaWNhdGlvbigpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3LTYwCiAgICAvLyBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgQXBwbGljYXRpb24oKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NwogICAgLy8ga2V5PWNmZy5HU19LRVlfUkVQUkVTRU5UQVRJVkVfRkVFLAogICAgYnl0ZWMgMTMgLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2NjY1NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NS02OAogICAgLy8gc2VsZi5yZXByZXNlbnRhdGl2ZV9mZWUgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9SRVBSRVNFTlRBVElWRV9GRUUsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzEKICAgIC8vIGtleT1jZmcuR1NfS0VZX1ZPVEVfVFJJR0dFUl9BV0FSRCwKICAgIGJ5dGVjIDcgLy8gMHg3NjZmNzQ2NTVmNzQ3MjY5Njc2NzY1NzI1ZjYxNzc2MTcyNjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2OS03MgogICAgLy8gc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9WT1RFX1RSSUdHRVJfQVdBUkQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzMKICAgIC8vIHNlbGYucGF1c2VkX3JlZ2lzdHJ5ID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSkKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzQKICAgIC8vIHNlbGYudm90ZXNfbGVmdCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9WT1RFU19MRUZUKQogICAgYnl0ZWNfMSAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBzZWxmLnRyaWdnZXJfZnVuZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9UUklHR0VSX0ZVTkQpCiAgICBieXRlYyA5IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjY2NzU2ZTY0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzUtNDQKICAgIC8vIGNsYXNzIERlbGVnYXRpb25SZWdpc3RyeSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTAsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgcHVzaGJ5dGVzIDB4ZTI4N2JlNTAgLy8gbWV0aG9kICJ1cGRhdGVfcmVnaXN0cnkoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3VwZGF0ZV9yZWdpc3RyeV9yb3V0ZUA0CgptYWluX3N3aXRjaF9jYXNlX25leHRANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1LTQ0CiAgICAvLyBjbGFzcyBEZWxlZ2F0aW9uUmVnaXN0cnkoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAyNwogICAgcHVzaGJ5dGVzcyAweDk2NjdkNmRlIDB4M2Q4ZTZmYWYgMHhiM2I1ODQ4MiAweDg2ZjdlMGU2IDB4OTgzNTJlODYgMHhhMzk5ZWIyNyAweGFhNTViMmY0IDB4YzhiOGJjOGUgMHg3OTg4NTFkMyAweDlkOTJhODFmIDB4M2I1NGMwMWYgMHg5MmE5YzUxMiAweGFmM2M1M2U4IDB4OTRjYzllNjYgMHg1NDIwNTI1OSAweDVmMDhjMTQ3IDB4YjEwYTFjMDAgMHgxMzFhMmRkMSAweGNhNjg3N2IzIC8vIG1ldGhvZCAic2V0X21hbmFnZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJjb25maWdfZGVsZWdhdGlvbl9yZWdpc3RyeSgodWludDY0LHVpbnQ2NCksdWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ3aXRoZHJhd19iYWxhbmNlKCl2b2lkIiwgbWV0aG9kICJwYXVzZV9yZWdpc3RyeSgpdm9pZCIsIG1ldGhvZCAicmVzdW1lX3JlZ2lzdHJ5KCl2b2lkIiwgbWV0aG9kICJpbml0X2NvbnRyYWN0KGJ5dGVbNl0sdWludDY0KXZvaWQiLCBtZXRob2QgImxvYWRfY29udHJhY3QoYnl0ZVs2XSx1aW50NjQsYnl0ZVtdKXZvaWQiLCBtZXRob2QgImtleV9yZWdfcmVnaXN0cnkocGF5LCh1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzMyXSxieXRlWzMyXSxieXRlWzY0XSkpdm9pZCIsIG1ldGhvZCAidXBkYXRlX3ZvdGVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAidXBkYXRlX3JlcHJlc2VudGF0aXZlKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAicHJlcGFyZV92b3RlcihwYXkpdm9pZCIsIG1ldGhvZCAicmVnaXN0ZXJfdm90ZXIocGF5LGFkZHJlc3MsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiYWRkX3ZvdGVzKHBheSxhZGRyZXNzLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ0cmlnZ2VyX3ZvdGUoYWRkcmVzcyx1aW50NjQpdm9pZCIsIG1ldGhvZCAidW5yZWdpc3Rlcl92b3RlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJlZ2lzdGVyX3JlcHJlc2VudGF0aXZlKHBheSl1aW50NjQiLCBtZXRob2QgInVucmVnaXN0ZXJfcmVwcmVzZW50YXRpdmUoKXZvaWQiLCBtZXRob2QgImdldF92b3Rlcl9hcHBfaWQoYWRkcmVzcykodWludDY0LGJvb2wpIiwgbWV0aG9kICJnZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkKGFkZHJlc3MpKHVpbnQ2NCxib29sKSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHNldF9tYW5hZ2VyIGNvbmZpZ19kZWxlZ2F0aW9uX3JlZ2lzdHJ5IHdpdGhkcmF3X2JhbGFuY2UgcGF1c2VfcmVnaXN0cnkgcmVzdW1lX3JlZ2lzdHJ5IGluaXRfY29udHJhY3QgbG9hZF9jb250cmFjdCBrZXlfcmVnX3JlZ2lzdHJ5IHVwZGF0ZV92b3RlciB1cGRhdGVfcmVwcmVzZW50YXRpdmUgcHJlcGFyZV92b3RlciByZWdpc3Rlcl92b3RlciBhZGRfdm90ZXMgdHJpZ2dlcl92b3RlIHVucmVnaXN0ZXJfdm90ZXIgcmVnaXN0ZXJfcmVwcmVzZW50YXRpdmUgdW5yZWdpc3Rlcl9yZXByZXNlbnRhdGl2ZSBnZXRfdm90ZXJfYXBwX2lkIGdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWQKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAyNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1LTQ0CiAgICAvLyBjbGFzcyBEZWxlZ2F0aW9uUmVnaXN0cnkoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweDI0MGQyZjY3IC8vIG1ldGhvZCAiY3JlYXRlKHVpbnQ2NCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fdXBkYXRlX3JlZ2lzdHJ5X3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozMjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNCAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIFVwZGF0ZUFwcGxpY2F0aW9uICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGIgdXBkYXRlX3JlZ2lzdHJ5CgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0LTk3CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tIE1hbmFnZW1lbnQgIC0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOQogICAgLy8gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIGJ5dGVjXzIgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTAKICAgIC8vIHNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUgPSBBcHBsaWNhdGlvbih4Z292X3JlZ2lzdHJ5X2lkLmFzX3VpbnQ2NCgpKQogICAgYnRvaQogICAgYnl0ZWMgNiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTEKICAgIC8vIHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlID0gVUludDY0KDEpCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwNwogICAgLy8gcmV0dXJuIFRlbXBsYXRlVmFyW0J5dGVzXSgiZW50cm9weSIpICAjIHRyaWNrIHRvIGFsbG93IGZyZXNoIGRlcGxveW1lbnQKICAgIGJ5dGVjIDE4IC8vIFRNUExfZW50cm9weQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTEyCiAgICAvLyBhc3NlcnQgc2VsZi5lbnRyb3B5KCkgPT0gVGVtcGxhdGVWYXJbQnl0ZXNdKCJlbnRyb3B5IikKICAgIGR1cAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0LTk3CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tIE1hbmFnZW1lbnQgIC0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5zZXRfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjgKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjkKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlID0gbWFuYWdlcgogICAgYnl0ZWNfMiAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuY29uZmlnX2RlbGVnYXRpb25fcmVnaXN0cnlbcm91dGluZ10oKSAtPiB2b2lkOgpjb25maWdfZGVsZWdhdGlvbl9yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5GZWVzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNTIKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNTQKICAgIC8vIHNlbGYudm90ZV9mZWVzLnZhbHVlID0gdm90ZV9mZWVzLmNvcHkoKQogICAgYnl0ZWMgMTAgLy8gMHg3NjZmNzQ2NTVmNjY2NTY1NzMKICAgIHVuY292ZXIgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NQogICAgLy8gc2VsZi5yZXByZXNlbnRhdGl2ZV9mZWUudmFsdWUgPSByZXByZXNlbnRhdGl2ZV9mZWUuYXNfdWludDY0KCkKICAgIHN3YXAKICAgIGJ0b2kKICAgIGJ5dGVjIDEzIC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjY2NTY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTU2CiAgICAvLyBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSA9IHZvdGVfdHJpZ2dlcl9hd2FyZC5hc191aW50NjQoKQogICAgYnRvaQogICAgYnl0ZWMgNyAvLyAweDc2NmY3NDY1NWY3NDcyNjk2NzY3NjU3MjVmNjE3NzYxNzI2NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OC0xNTkKICAgIC8vICMgUmVjYWxjdWxhdGUgbmVlZGVkIHRyaWdnZXIgZnVuZAogICAgLy8gc2VsZi51cGRhdGVfdHJpZ2dlcl9mdW5kKCkKICAgIGNhbGxzdWIgdXBkYXRlX3RyaWdnZXJfZnVuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTYzCiAgICAvLyBzZWxmLnRyaWdnZXJfZnVuZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gMHg3NDcyNjk2NzY3NjU3MjVmNjY3NTZlNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50cmlnZ2VyX2Z1bmQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQKICAgIC8vIDw9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNjUKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQtMTY1CiAgICAvLyA8PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTYzLTE2NQogICAgLy8gc2VsZi50cmlnZ2VyX2Z1bmQudmFsdWUKICAgIC8vIDw9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTYxLTE2NgogICAgLy8gIyBWYWxpZGF0ZSBjb25maWcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi50cmlnZ2VyX2Z1bmQudmFsdWUKICAgIC8vICAgICA8PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vICAgICAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIC8vICksIGVyci5UUklHR0VSX0ZVTkRfSU5TVUZGSUNJRU5UCiAgICBhc3NlcnQgLy8gVHJpZ2dlciBmdW5kIGlzIGluc3VmZmljaWVudC4gRnVuZCB0aGUgUmVnaXN0cnkgb3IgcmVkdWNlIGF3YXJkLgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTY5CiAgICAvLyBzZWxmLnZvdGVfZmVlcy52YWx1ZS54Z292IDw9IHNlbGYudm90ZV9mZWVzLnZhbHVlLm90aGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gMHg3NjZmNzQ2NTVmNjY2NTY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX2ZlZXMgZXhpc3RzCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4CiAgICBzd2FwCiAgICBleHRyYWN0IDggOAogICAgZGlnIDEKICAgIGI+PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTY4LTE3MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnZvdGVfZmVlcy52YWx1ZS54Z292IDw9IHNlbGYudm90ZV9mZWVzLnZhbHVlLm90aGVyCiAgICAvLyApLCBlcnIuSU5DT05TSVNURU5UX1ZPVEVfRkVFUwogICAgYXNzZXJ0IC8vIHhHb3Ygdm90ZSBmZWVzIG11c3Qgbm90IGJlIGxhcmdlciB0aGFuIGZvciBvdGhlcnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MwogICAgLy8gc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUgPD0gc2VsZi52b3RlX2ZlZXMudmFsdWUueGdvdgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg3NjZmNzQ2NTVmNzQ3MjY5Njc2NzY1NzI1ZjYxNzc2MTcyNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQgZXhpc3RzCiAgICBpdG9iCiAgICBiPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3Mi0xNzQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUgPD0gc2VsZi52b3RlX2ZlZXMudmFsdWUueGdvdgogICAgLy8gKSwgZXJyLklOQ09OU0lTVEVOVF9UUklHR0VSX0FXQVJECiAgICBhc3NlcnQgLy8gVHJpZ2dlciByZXdhcmQgbXVzdCBub3QgYmUgbGFyZ2VyIHRoYW4gbWluaW11bSB2b3RlIGZlZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkud2l0aGRyYXdfYmFsYW5jZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CndpdGhkcmF3X2JhbGFuY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxODgKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxOTIKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxOTMKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxOTItMTkzCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTk0CiAgICAvLyAtIHNlbGYudHJpZ2dlcl9mdW5kLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAweDc0NzI2OTY3Njc2NTcyNWY2Njc1NmU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyaWdnZXJfZnVuZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5Mi0xOTQKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICAvLyAtIHNlbGYudHJpZ2dlcl9mdW5kLnZhbHVlCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxOTcKICAgIC8vIGFzc2VydCBhbW91bnQgPiAwLCBlcnIuSU5TVUZGSUNJRU5UX0ZVTkRTCiAgICBkdXAKICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgZnVuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5OC0yMDEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZS5uYXRpdmUsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5OQogICAgLy8gcmVjZWl2ZXI9c2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUubmF0aXZlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYW5hZ2VyX2FkZHJlc3MgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTk4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5OC0yMDEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZS5uYXRpdmUsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LnBhdXNlX3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKcGF1c2VfcmVnaXN0cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyMTQKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyMTUKICAgIC8vIHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlID0gVUludDY0KDEpCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucmVzdW1lX3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVzdW1lX3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjI4CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjI5CiAgICAvLyBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyMTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmluaXRfY29udHJhY3Rbcm91dGluZ10oKSAtPiB2b2lkOgppbml0X2NvbnRyYWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMyAvLyA2CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCA2PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjUwCiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjUzCiAgICAvLyBjb250ZW50cywgZXhpc3RzID0gYm94Lm1heWJlKCkKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjU0CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBpbml0X2NvbnRyYWN0X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyNTUKICAgIC8vIGJveC5yZXNpemUoc2l6ZS5hc191aW50NjQoKSkKICAgIHN3YXAKICAgIGJ0b2kKICAgIGJveF9yZXNpemUKCmluaXRfY29udHJhY3RfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKaW5pdF9jb250cmFjdF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1Ny0yNTgKICAgIC8vICMgSW5pdGlhbGl6ZSB0aGUgYXBwcm92YWwgcHJvZ3JhbQogICAgLy8gYm94LmNyZWF0ZShzaXplPXNpemUuYXNfdWludDY0KCkpCiAgICBzd2FwCiAgICBidG9pCiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIGIgaW5pdF9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDQKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkubG9hZF9jb250cmFjdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmxvYWRfY29udHJhY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyNjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDY+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjgxCiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Mjg1LTI4NgogICAgLy8gIyBMb2FkIHRoZSBhcHByb3ZhbCBwcm9ncmFtCiAgICAvLyBib3gucmVwbGFjZShzdGFydF9pbmRleD1vZmZzZXQuYXNfdWludDY0KCksIHZhbHVlPWRhdGEpCiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjYyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5rZXlfcmVnX3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKa2V5X3JlZ19yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMTUyIC8vIDE1MgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuS2V5UmVnVHhuSW5mbwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzA3CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzExCiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGRpZyAxCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozMDktMzEyCiAgICAvLyAjIENoZWNrIGlmIHBheW1lbnQgZm9yIGNvdmVyaW5nIHRoZSBrZXkgcmVnIGZlZSB3YXMgbWFkZSB0byB0aGlzIGNvbnRyYWN0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxMwogICAgLy8ga2V5X3JlZ190eG5fZmVlID0gcGF5bWVudC5hbW91bnQKICAgIHN3YXAKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzE1LTMyNAogICAgLy8gIyBJc3N1ZSB0aGUga2V5IHJlZ2lzdHJhdGlvbiB0cmFuc2FjdGlvbgogICAgLy8gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICAvLyAgICAgdm90ZV9rZXk9a2V5X3JlZ19pbmZvLnZvdGVfcGsuYnl0ZXMsCiAgICAvLyAgICAgc2VsZWN0aW9uX2tleT1rZXlfcmVnX2luZm8uc2VsZWN0aW9uX3BrLmJ5dGVzLAogICAgLy8gICAgIHZvdGVfZmlyc3Q9a2V5X3JlZ19pbmZvLnZvdGVfZmlyc3QuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZV9sYXN0PWtleV9yZWdfaW5mby52b3RlX2xhc3QuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZV9rZXlfZGlsdXRpb249a2V5X3JlZ19pbmZvLnZvdGVfa2V5X2RpbHV0aW9uLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIHN0YXRlX3Byb29mX2tleT1rZXlfcmVnX2luZm8uc3RhdGVfcHJvb2ZfcGsuYnl0ZXMsCiAgICAvLyAgICAgZmVlPWtleV9yZWdfdHhuX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNwogICAgLy8gdm90ZV9rZXk9a2V5X3JlZ19pbmZvLnZvdGVfcGsuYnl0ZXMsCiAgICBkaWcgMQogICAgZXh0cmFjdCAyNCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzE4CiAgICAvLyBzZWxlY3Rpb25fa2V5PWtleV9yZWdfaW5mby5zZWxlY3Rpb25fcGsuYnl0ZXMsCiAgICBkaWcgMgogICAgZXh0cmFjdCA1NiAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzE5CiAgICAvLyB2b3RlX2ZpcnN0PWtleV9yZWdfaW5mby52b3RlX2ZpcnN0LmFzX3VpbnQ2NCgpLAogICAgZGlnIDMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzIwCiAgICAvLyB2b3RlX2xhc3Q9a2V5X3JlZ19pbmZvLnZvdGVfbGFzdC5hc191aW50NjQoKSwKICAgIGRpZyA0CiAgICBwdXNoaW50IDggLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyMQogICAgLy8gdm90ZV9rZXlfZGlsdXRpb249a2V5X3JlZ19pbmZvLnZvdGVfa2V5X2RpbHV0aW9uLmFzX3VpbnQ2NCgpLAogICAgZGlnIDUKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozMjIKICAgIC8vIHN0YXRlX3Byb29mX2tleT1rZXlfcmVnX2luZm8uc3RhdGVfcHJvb2ZfcGsuYnl0ZXMsCiAgICB1bmNvdmVyIDYKICAgIGV4dHJhY3QgODggNjQKICAgIGl0eG5fZmllbGQgU3RhdGVQcm9vZlBLCiAgICBpdHhuX2ZpZWxkIFZvdGVLZXlEaWx1dGlvbgogICAgaXR4bl9maWVsZCBWb3RlTGFzdAogICAgaXR4bl9maWVsZCBWb3RlRmlyc3QKICAgIGl0eG5fZmllbGQgU2VsZWN0aW9uUEsKICAgIGl0eG5fZmllbGQgVm90ZVBLCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozMTUtMzE2CiAgICAvLyAjIElzc3VlIHRoZSBrZXkgcmVnaXN0cmF0aW9uIHRyYW5zYWN0aW9uCiAgICAvLyBpdHhuLktleVJlZ2lzdHJhdGlvbigKICAgIHB1c2hpbnQgMiAvLyBrZXlyZWcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozMTUtMzI0CiAgICAvLyAjIElzc3VlIHRoZSBrZXkgcmVnaXN0cmF0aW9uIHRyYW5zYWN0aW9uCiAgICAvLyBpdHhuLktleVJlZ2lzdHJhdGlvbigKICAgIC8vICAgICB2b3RlX2tleT1rZXlfcmVnX2luZm8udm90ZV9way5ieXRlcywKICAgIC8vICAgICBzZWxlY3Rpb25fa2V5PWtleV9yZWdfaW5mby5zZWxlY3Rpb25fcGsuYnl0ZXMsCiAgICAvLyAgICAgdm90ZV9maXJzdD1rZXlfcmVnX2luZm8udm90ZV9maXJzdC5hc191aW50NjQoKSwKICAgIC8vICAgICB2b3RlX2xhc3Q9a2V5X3JlZ19pbmZvLnZvdGVfbGFzdC5hc191aW50NjQoKSwKICAgIC8vICAgICB2b3RlX2tleV9kaWx1dGlvbj1rZXlfcmVnX2luZm8udm90ZV9rZXlfZGlsdXRpb24uYXNfdWludDY0KCksCiAgICAvLyAgICAgc3RhdGVfcHJvb2Zfa2V5PWtleV9yZWdfaW5mby5zdGF0ZV9wcm9vZl9way5ieXRlcywKICAgIC8vICAgICBmZWU9a2V5X3JlZ190eG5fZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudXBkYXRlX3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzM3CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzI4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LnVwZGF0ZV92b3Rlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZV92b3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzU2CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzU4CiAgICAvLyBhc3NlcnQgeGdvdl9hZGRyZXNzIGluIHNlbGYudm90ZXJzX2JveCwgZXJyLk5PVF9WT1RFUgogICAgYnl0ZWMgNCAvLyAweDc2CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90IFZvdGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNjAKICAgIC8vIGJveCA9IEJveChCeXRlcywga2V5PUJ5dGVzKGNmZy5DT05UUkFDVF9WT1RFUl9CT1gpKQogICAgYnl0ZWMgNSAvLyAweDczNjM1Zjc2NmY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzYxLTM2MgogICAgLy8gIyBBc3N1bWUgcHJvZ3JhbSBzaXplIGlzIDwgY29uc3QuTUFYX1NUQUNLCiAgICAvLyBhcHByb3ZhbF9wcm9ncmFtID0gYm94LmV4dHJhY3QoMCwgYm94Lmxlbmd0aCkKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBCb3ggZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNjAKICAgIC8vIGJveCA9IEJveChCeXRlcywga2V5PUJ5dGVzKGNmZy5DT05UUkFDVF9WT1RFUl9CT1gpKQogICAgYnl0ZWMgNSAvLyAweDczNjM1Zjc2NmY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzYxLTM2MgogICAgLy8gIyBBc3N1bWUgcHJvZ3JhbSBzaXplIGlzIDwgY29uc3QuTUFYX1NUQUNLCiAgICAvLyBhcHByb3ZhbF9wcm9ncmFtID0gYm94LmV4dHJhY3QoMCwgYm94Lmxlbmd0aCkKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNjQtMzY5CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLnVwZGF0ZSwKICAgIC8vICAgICBhcHBfaWQ9c2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10sCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNjYKICAgIC8vIGFwcF9pZD1zZWxmLnZvdGVyc19ib3hbeGdvdl9hZGRyZXNzXSwKICAgIHN3YXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzY0LTM2OQogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci51cGRhdGUsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYudm90ZXJzX2JveFt4Z292X2FkZHJlc3NdLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWxfcHJvZ3JhbSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgLy8gKQogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzY4CiAgICAvLyBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgYnl0ZWMgOCAvLyAweDBhODEwMTQzCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzY0LTM2OQogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci51cGRhdGUsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYudm90ZXJzX2JveFt4Z292X2FkZHJlc3NdLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWxfcHJvZ3JhbSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgLy8gKQogICAgYnl0ZWMgMTUgLy8gbWV0aG9kICJ1cGRhdGUoKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaW50Y18zIC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudXBkYXRlX3JlcHJlc2VudGF0aXZlW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX3JlcHJlc2VudGF0aXZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzczCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozODgKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozOTEKICAgIC8vIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MgaW4gc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94CiAgICBieXRlYyAxMSAvLyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozOTAtMzkyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MgaW4gc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94CiAgICAvLyApLCBlcnIuTk9UX1JFUFJFU0VOVEFUSVZFCiAgICBhc3NlcnQgLy8gTm90IGEgcmVwcmVzZW50YXRpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5NAogICAgLy8gYm94ID0gQm94KEJ5dGVzLCBrZXk9Qnl0ZXMoY2ZnLkNPTlRSQUNUX1JFUFJFU0VOVEFUSVZFX0JPWCkpCiAgICBieXRlYyAxMiAvLyAweDczNjM1ZjcyNjU3MAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Mzk1LTM5NgogICAgLy8gIyBBc3N1bWUgcHJvZ3JhbSBzaXplIGlzIDwgY29uc3QuTUFYX1NUQUNLCiAgICAvLyBhcHByb3ZhbF9wcm9ncmFtID0gYm94LmV4dHJhY3QoMCwgYm94Lmxlbmd0aCkKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBCb3ggZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozOTQKICAgIC8vIGJveCA9IEJveChCeXRlcywga2V5PUJ5dGVzKGNmZy5DT05UUkFDVF9SRVBSRVNFTlRBVElWRV9CT1gpKQogICAgYnl0ZWMgMTIgLy8gMHg3MzYzNWY3MjY1NzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5NS0zOTYKICAgIC8vICMgQXNzdW1lIHByb2dyYW0gc2l6ZSBpcyA8IGNvbnN0Lk1BWF9TVEFDSwogICAgLy8gYXBwcm92YWxfcHJvZ3JhbSA9IGJveC5leHRyYWN0KDAsIGJveC5sZW5ndGgpCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Mzk4LTQwMwogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9jb250cmFjdC5SZXByZXNlbnRhdGl2ZS51cGRhdGUsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV9hZGRyZXNzXSwKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPWFwcHJvdmFsX3Byb2dyYW0sCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMAogICAgLy8gYXBwX2lkPXNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV9hZGRyZXNzXSwKICAgIHN3YXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Mzk4LTQwMwogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9jb250cmFjdC5SZXByZXNlbnRhdGl2ZS51cGRhdGUsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV9hZGRyZXNzXSwKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPWFwcHJvdmFsX3Byb2dyYW0sCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIC8vICkKICAgIHB1c2hpbnQgNCAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMgogICAgLy8gY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIGJ5dGVjIDggLy8gMHgwYTgxMDE0MwogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbVBhZ2VzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5OC00MDMKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUudXBkYXRlLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLnJlcHJlc2VudGF0aXZlc19ib3hbcmVwcmVzZW50YXRpdmVfYWRkcmVzc10sCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyApCiAgICBieXRlYyAxNSAvLyBtZXRob2QgInVwZGF0ZSgpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzczCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5wcmVwYXJlX3ZvdGVyW3JvdXRpbmddKCkgLT4gdm9pZDoKcHJlcGFyZV92b3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDIyCiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0MjQtNDI1CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBWb3RlciBhcHBsaWNhdGlvbgogICAgLy8gYm94ID0gQm94KEJ5dGVzLCBrZXk9Qnl0ZXMoY2ZnLkNPTlRSQUNUX1ZPVEVSX0JPWCkpCiAgICBieXRlYyA1IC8vIDB4NzM2MzVmNzY2Zjc0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0MjYtNDI3CiAgICAvLyAjIEFzc3VtZSBwcm9ncmFtIHNpemUgaXMgPCBjb25zdC5NQVhfU1RBQ0sKICAgIC8vIGFwcHJvdmFsX3Byb2dyYW0gPSBib3guZXh0cmFjdCgwLCBib3gubGVuZ3RoKQogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIEJveCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyNC00MjUKICAgIC8vICMgQ3JlYXRlIGEgbmV3IFZvdGVyIGFwcGxpY2F0aW9uCiAgICAvLyBib3ggPSBCb3goQnl0ZXMsIGtleT1CeXRlcyhjZmcuQ09OVFJBQ1RfVk9URVJfQk9YKSkKICAgIGJ5dGVjIDUgLy8gMHg3MzYzNWY3NjZmNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyNi00MjcKICAgIC8vICMgQXNzdW1lIHByb2dyYW0gc2l6ZSBpcyA8IGNvbnN0Lk1BWF9TVEFDSwogICAgLy8gYXBwcm92YWxfcHJvZ3JhbSA9IGJveC5leHRyYWN0KDAsIGJveC5sZW5ndGgpCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDI5LTQzOAogICAgLy8gdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci5jcmVhdGUsCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXZvdGVyX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz12b3Rlcl9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGxvY2FsX251bV91aW50PXZvdGVyX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICBsb2NhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0MzcKICAgIC8vIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICBwdXNoaW50IDMgLy8gMwogICAgaXR4bl9maWVsZCBFeHRyYVByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDM2CiAgICAvLyBsb2NhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkxPQ0FMX0JZVEVTLAogICAgcHVzaGludCA4IC8vIDgKICAgIGl0eG5fZmllbGQgTG9jYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzNQogICAgLy8gbG9jYWxfbnVtX3VpbnQ9dm90ZXJfY2ZnLkxPQ0FMX1VJTlRTLAogICAgcHVzaGludCA4IC8vIDgKICAgIGl0eG5fZmllbGQgTG9jYWxOdW1VaW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0MzQKICAgIC8vIGdsb2JhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkdMT0JBTF9CWVRFUywKICAgIGludGNfMiAvLyAzMgogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzMwogICAgLy8gZ2xvYmFsX251bV91aW50PXZvdGVyX2NmZy5HTE9CQUxfVUlOVFMsCiAgICBpbnRjXzIgLy8gMzIKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDMyCiAgICAvLyBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgYnl0ZWMgOCAvLyAweDBhODEwMTQzCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyOS00MzgKICAgIC8vIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIuY3JlYXRlLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWxfcHJvZ3JhbSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgLy8gICAgIGdsb2JhbF9udW1fdWludD12b3Rlcl9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICBsb2NhbF9udW1fdWludD12b3Rlcl9jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgbG9jYWxfbnVtX2J5dGVzPXZvdGVyX2NmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICBleHRyYV9wcm9ncmFtX3BhZ2VzPWNvbnN0Lk1BWF9FWFRSQV9QQUdFU19QRVJfQVBQLAogICAgLy8gKQogICAgYnl0ZWMgMTYgLy8gbWV0aG9kICJjcmVhdGUoKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaW50Y18zIC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0MC00NDQKICAgIC8vICMgRnVuZCB0aGUgY3JlYXRlZCBhcHAgd2l0aCBNQlIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj10eG4uY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDQyCiAgICAvLyByZWNlaXZlcj10eG4uY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0MwogICAgLy8gYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDQwLTQ0MQogICAgLy8gIyBGdW5kIHRoZSBjcmVhdGVkIGFwcCB3aXRoIE1CUgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NDAtNDQ0CiAgICAvLyAjIEZ1bmQgdGhlIGNyZWF0ZWQgYXBwIHdpdGggTUJSCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9dHhuLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NDYKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDQ3CiAgICAvLyBtYnJfZmVlID0gbWJyX2FmdGVyIC0gbWJyX2JlZm9yZQogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDUxCiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGRpZyAxCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NDktNDUyCiAgICAvLyAjIENoZWNrIHBheW1lbnQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDUzCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPT0gbWJyX2ZlZSArIEdsb2JhbC5taW5fYmFsYW5jZSwgZXJyLldST05HX1BBWU1FTlRfQU1PVU5UCiAgICBzd2FwCiAgICBndHhucyBBbW91bnQKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICB1bmNvdmVyIDIKICAgICsKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGF5bWVudCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucmVnaXN0ZXJfdm90ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl92b3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1Ny00NjAKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0gICAgVm90ZXIgICAgLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgZHVwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0ODYKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0ODkKICAgIC8vIGFzc2VydCB4Z292X2FkZHJlc3Mgbm90IGluIHNlbGYudm90ZXJzX2JveCwgZXJyLkFMUkVBRFlfVk9URVIKICAgIGJ5dGVjIDQgLy8gMHg3NgogICAgZGlnIDQKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGEgVm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5MS00OTYKICAgIC8vICMgR2V0IHhnb3ZfYWRkcmVzcyBib3gKICAgIC8vIFt4Z292X2JveCwgZXhpc3RzXSwgdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveCwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0OTUKICAgIC8vIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5MS00OTYKICAgIC8vICMgR2V0IHhnb3ZfYWRkcmVzcyBib3gKICAgIC8vIFt4Z292X2JveCwgZXhpc3RzXSwgdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveCwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyApCiAgICBieXRlYyAxNCAvLyBtZXRob2QgImdldF94Z292X2JveChhZGRyZXNzKSgoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCksYm9vbCkiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDQKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA1NyAvLyA1NwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC50dXBsZTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292Qm94VmFsdWUsYXJjNC5ib29sPgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIHN3YXAKICAgIGV4dHJhY3QgNCA1NgogICAgc3dhcAogICAgaW50YyA0IC8vIDQ0OAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0OTcKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0OTkKICAgIC8vIG1hbmFnZXJfYWRkcmVzcyA9IHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwMAogICAgLy8gaXNfbWFuYWdlciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSA9PSBtYW5hZ2VyX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MDEKICAgIC8vIGlzX3hnb3YgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikgPT0geGdvdl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgNgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwMgogICAgLy8gYXNzZXJ0IGlzX3hnb3Ygb3IgaXNfbWFuYWdlciwgZXJyLlVOQVVUSE9SSVpFRAogICAgfHwKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwNC01MDUKICAgIC8vICMgQ3JlYXRlIGEgbmV3IFZvdGVyIGFwcGxpY2F0aW9uCiAgICAvLyBib3ggPSBCb3goQnl0ZXMsIGtleT1CeXRlcyhjZmcuQ09OVFJBQ1RfVk9URVJfQk9YKSkKICAgIGJ5dGVjIDUgLy8gMHg3MzYzNWY3NjZmNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwNi01MDcKICAgIC8vICMgQXNzdW1lIHByb2dyYW0gc2l6ZSBpcyA8IGNvbnN0Lk1BWF9TVEFDSwogICAgLy8gYXBwcm92YWxfcHJvZ3JhbSA9IGJveC5leHRyYWN0KDAsIGJveC5sZW5ndGgpCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgQm94IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTA0LTUwNQogICAgLy8gIyBDcmVhdGUgYSBuZXcgVm90ZXIgYXBwbGljYXRpb24KICAgIC8vIGJveCA9IEJveChCeXRlcywga2V5PUJ5dGVzKGNmZy5DT05UUkFDVF9WT1RFUl9CT1gpKQogICAgYnl0ZWMgNSAvLyAweDczNjM1Zjc2NmY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTA2LTUwNwogICAgLy8gIyBBc3N1bWUgcHJvZ3JhbSBzaXplIGlzIDwgY29uc3QuTUFYX1NUQUNLCiAgICAvLyBhcHByb3ZhbF9wcm9ncmFtID0gYm94LmV4dHJhY3QoMCwgYm94Lmxlbmd0aCkKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MDktNTE4CiAgICAvLyB0eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLmNyZWF0ZSwKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPWFwcHJvdmFsX3Byb2dyYW0sCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIC8vICAgICBnbG9iYWxfbnVtX3VpbnQ9dm90ZXJfY2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICBnbG9iYWxfbnVtX2J5dGVzPXZvdGVyX2NmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgbG9jYWxfbnVtX3VpbnQ9dm90ZXJfY2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgIGxvY2FsX251bV9ieXRlcz12b3Rlcl9jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgZXh0cmFfcHJvZ3JhbV9wYWdlcz1jb25zdC5NQVhfRVhUUkFfUEFHRVNfUEVSX0FQUCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxNwogICAgLy8gZXh0cmFfcHJvZ3JhbV9wYWdlcz1jb25zdC5NQVhfRVhUUkFfUEFHRVNfUEVSX0FQUCwKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBpdHhuX2ZpZWxkIEV4dHJhUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MTYKICAgIC8vIGxvY2FsX251bV9ieXRlcz12b3Rlcl9jZmcuTE9DQUxfQllURVMsCiAgICBwdXNoaW50IDggLy8gOAogICAgaXR4bl9maWVsZCBMb2NhbE51bUJ5dGVTbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTE1CiAgICAvLyBsb2NhbF9udW1fdWludD12b3Rlcl9jZmcuTE9DQUxfVUlOVFMsCiAgICBwdXNoaW50IDggLy8gOAogICAgaXR4bl9maWVsZCBMb2NhbE51bVVpbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxNAogICAgLy8gZ2xvYmFsX251bV9ieXRlcz12b3Rlcl9jZmcuR0xPQkFMX0JZVEVTLAogICAgaW50Y18yIC8vIDMyCiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bUJ5dGVTbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTEzCiAgICAvLyBnbG9iYWxfbnVtX3VpbnQ9dm90ZXJfY2ZnLkdMT0JBTF9VSU5UUywKICAgIGludGNfMiAvLyAzMgogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1VaW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MTIKICAgIC8vIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICBieXRlYyA4IC8vIDB4MGE4MTAxNDMKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTA5LTUxOAogICAgLy8gdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci5jcmVhdGUsCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXZvdGVyX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz12b3Rlcl9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGxvY2FsX251bV91aW50PXZvdGVyX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICBsb2NhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICAvLyApCiAgICBieXRlYyAxNiAvLyBtZXRob2QgImNyZWF0ZSgpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTIwLTUyNAogICAgLy8gIyBGdW5kIHRoZSBjcmVhdGVkIGFwcCB3aXRoIE1CUgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXR4bi5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1HbG9iYWwubWluX2JhbGFuY2UsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MjIKICAgIC8vIHJlY2VpdmVyPXR4bi5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTIzCiAgICAvLyBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlLAogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MjAtNTIxCiAgICAvLyAjIEZ1bmQgdGhlIGNyZWF0ZWQgYXBwIHdpdGggTUJSCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyMC01MjQKICAgIC8vICMgRnVuZCB0aGUgY3JlYXRlZCBhcHAgd2l0aCBNQlIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj10eG4uY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyOS01MzIKICAgIC8vIHhnb3ZfYWRkcmVzc19ieXRlcywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICB2b3Rlcl9hcHAsCiAgICAvLyAgICAgdm90ZXJfY2ZnLkdTX0tFWV9YR09WX0FERFJFU1MsCiAgICAvLyApCiAgICBkaWcgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTMxCiAgICAvLyB2b3Rlcl9jZmcuR1NfS0VZX1hHT1ZfQUREUkVTUywKICAgIHB1c2hieXRlcyAweDc4Njc2Zjc2NWY2MTY0NjQ3MjY1NzM3MwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTI5LTUzMgogICAgLy8geGdvdl9hZGRyZXNzX2J5dGVzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHZvdGVyX2FwcCwKICAgIC8vICAgICB2b3Rlcl9jZmcuR1NfS0VZX1hHT1ZfQUREUkVTUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzNAogICAgLy8gYXJjNC5BZGRyZXNzKHhnb3ZfYWRkcmVzc19ieXRlcykgPT0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTMzLTUzNQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBhcmM0LkFkZHJlc3MoeGdvdl9hZGRyZXNzX2J5dGVzKSA9PSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICAvLyApLCBlcnIuVk9URVJfQVNTSUdORUQKICAgIGFzc2VydCAvLyBWb3RlciBpcyBhbHJlYWR5IGFzc2lnbmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MzctNTQzCiAgICAvLyAjIEFzc2lnbiBhdmFpbGFibGUgVm90ZXIgdG8gdGhlIHhHb3YKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIuYXNzaWduX3hnb3YsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcHBfaWQ9dm90ZXJfYXBwLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTQxCiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MzctNTQzCiAgICAvLyAjIEFzc2lnbiBhdmFpbGFibGUgVm90ZXIgdG8gdGhlIHhHb3YKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIuYXNzaWduX3hnb3YsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcHBfaWQ9dm90ZXJfYXBwLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4NmU5MzIzMDYgLy8gbWV0aG9kICJhc3NpZ25feGdvdihhZGRyZXNzLGFkZHJlc3Mpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDUKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaW50Y18zIC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0NAogICAgLy8gc2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10gPSB2b3Rlcl9hcHAKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTQ2CiAgICAvLyBtYnJfYWZ0ZXIgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0NwogICAgLy8gbWJyX2ZlZSA9IG1icl9hZnRlciAtIG1icl9iZWZvcmUKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MQogICAgLy8gcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBkaWcgMgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTQ5LTU1MgogICAgLy8gIyBDaGVjayBwYXltZW50CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MwogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IG1icl9mZWUgKyBHbG9iYWwubWluX2JhbGFuY2UsIGVyci5XUk9OR19QQVlNRU5UX0FNT1VOVAogICAgdW5jb3ZlciAyCiAgICBndHhucyBBbW91bnQKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICB1bmNvdmVyIDIKICAgICsKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGF5bWVudCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1Ny00NjAKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0gICAgVm90ZXIgICAgLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmFkZF92b3Rlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFkZF92b3RlczoKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODIKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTgzCiAgICAvLyBhc3NlcnQgeGdvdl9hZGRyZXNzIGluIHNlbGYudm90ZXJzX2JveCwgZXJyLk5PVF9WT1RFUgogICAgYnl0ZWMgNCAvLyAweDc2CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vdCBWb3RlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTg1CiAgICAvLyB2b3Rlcl9hcHAgPSBzZWxmLnZvdGVyc19ib3hbeGdvdl9hZGRyZXNzXQogICAgYm94X2dldAogICAgcG9wCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODcKICAgIC8vIHNlbmRlciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODgKICAgIC8vIGlmIHNlbmRlciA9PSB4Z292X2FkZHJlc3M6CiAgICA9PQogICAgYnogYWRkX3ZvdGVzX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODkKICAgIC8vIHZvdGVfZmVlID0gc2VsZi52b3RlX2ZlZXMudmFsdWUueGdvdi5hc191aW50NjQoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vIDB4NzY2Zjc0NjU1ZjY2NjU2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZV9mZWVzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBidXJ5IDYKCmFkZF92b3Rlc19hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MTEtNjE1CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLmFkZF92b3RlcywKICAgIC8vICAgICBhZGRfdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXZvdGVyX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIHB1c2hieXRlcyAweDI5MjNmM2QxIC8vIG1ldGhvZCAiYWRkX3ZvdGVzKHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAyCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjE3CiAgICAvLyBzZWxmLnZvdGVzX2xlZnQudmFsdWUgKz0gYWRkX3ZvdGVzLmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXNfbGVmdCBleGlzdHMKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGRpZyAxCiAgICArCiAgICBieXRlY18xIC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MTgKICAgIC8vIHNlbGYudXBkYXRlX3RyaWdnZXJfZnVuZCgpCiAgICBjYWxsc3ViIHVwZGF0ZV90cmlnZ2VyX2Z1bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMC02MjEKICAgIC8vICMgQ2hlY2sgcGF5bWVudAogICAgLy8gZmVlID0gdm90ZV9mZWUgKiBhZGRfdm90ZXMuYXNfdWludDY0KCkKICAgIGRpZyA2CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MjMKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDUKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjIyLTYyNAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5XUk9OR19SRUNFSVZFUgogICAgYXNzZXJ0IC8vIFdyb25nIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MjUKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBmZWUsIGVyci5XUk9OR19QQVlNRU5UX0FNT1VOVAogICAgZ3R4bnMgQW1vdW50CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIHBheW1lbnQgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgphZGRfdm90ZXNfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTEKICAgIC8vIHZvdGVfZmVlID0gc2VsZi52b3RlX2ZlZXMudmFsdWUub3RoZXIuYXNfdWludDY0KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDc2NmY3NDY1NWY2NjY1NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfZmVlcyBleGlzdHMKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTMtNTk4CiAgICAvLyAjIEdldCB4Z292X2FkZHJlc3MgYm94CiAgICAvLyBbeGdvdl9ib3gsIGV4aXN0c10sIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5nZXRfeGdvdl9ib3gsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTk3CiAgICAvLyBhcHBfaWQ9c2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwIGV4aXN0cwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTMtNTk4CiAgICAvLyAjIEdldCB4Z292X2FkZHJlc3MgYm94CiAgICAvLyBbeGdvdl9ib3gsIGV4aXN0c10sIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5nZXRfeGdvdl9ib3gsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgLy8gKQogICAgYnl0ZWMgMTQgLy8gbWV0aG9kICJnZXRfeGdvdl9ib3goYWRkcmVzcykoKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpLGJvb2wpIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaW50Y18zIC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNTcgLy8gNTcKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudHVwbGU8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuWEdvdkJveFZhbHVlLGFyYzQuYm9vbD4KICAgIGRpZyAxCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBzd2FwCiAgICBleHRyYWN0IDQgNTYKICAgIHN3YXAKICAgIGludGMgNCAvLyA0NDgKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTk5CiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuTk9UX1hHT1YKICAgIGFzc2VydCAvLyBOb3QgYW4geEdvdgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjAxLTYwNAogICAgLy8gbWFuYWdlcl9hZGRyZXNzX2J5dGVzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHZvdGVyX2FwcCwKICAgIC8vICAgICB2b3Rlcl9jZmcuR1NfS0VZX01BTkFHRVJfQUREUkVTUywKICAgIC8vICkKICAgIGRpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MDMKICAgIC8vIHZvdGVyX2NmZy5HU19LRVlfTUFOQUdFUl9BRERSRVNTLAogICAgYnl0ZWNfMiAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjAxLTYwNAogICAgLy8gbWFuYWdlcl9hZGRyZXNzX2J5dGVzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHZvdGVyX2FwcCwKICAgIC8vICAgICB2b3Rlcl9jZmcuR1NfS0VZX01BTkFHRVJfQUREUkVTUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGR1cAogICAgYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MDUKICAgIC8vIG1hbmFnZXJfYWRkcmVzcyA9IGFyYzQuQWRkcmVzcyhtYW5hZ2VyX2FkZHJlc3NfYnl0ZXMpCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjA4CiAgICAvLyBzZW5kZXIgPT0geGdvdl9ib3gudm90aW5nX2FkZHJlc3Mgb3Igc2VuZGVyID09IG1hbmFnZXJfYWRkcmVzcwogICAgZXh0cmFjdCAwIDMyCiAgICBkaWcgMQogICAgPT0KICAgIGJueiBhZGRfdm90ZXNfYm9vbF90cnVlQDYKICAgIGR1cAogICAgZGlnIDcKICAgID09CiAgICBieiBhZGRfdm90ZXNfYm9vbF9mYWxzZUA3CgphZGRfdm90ZXNfYm9vbF90cnVlQDY6CiAgICBpbnRjXzEgLy8gMQoKYWRkX3ZvdGVzX2Jvb2xfbWVyZ2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwNy02MDkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VuZGVyID09IHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzIG9yIHNlbmRlciA9PSBtYW5hZ2VyX2FkZHJlc3MKICAgIC8vICksIGVyci5VTkFVVEhPUklaRUQKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIGIgYWRkX3ZvdGVzX2FmdGVyX2lmX2Vsc2VAOQoKYWRkX3ZvdGVzX2Jvb2xfZmFsc2VANzoKICAgIGludGNfMCAvLyAwCiAgICBiIGFkZF92b3Rlc19ib29sX21lcmdlQDgKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudHJpZ2dlcl92b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKdHJpZ2dlcl92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjI5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NDcKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjQ4CiAgICAvLyBhc3NlcnQgeGdvdl9hZGRyZXNzIGluIHNlbGYudm90ZXJzX2JveCwgZXJyLk5PVF9WT1RFUgogICAgYnl0ZWMgNCAvLyAweDc2CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3QgVm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1MC02NTQKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIudm90ZV9yZXByZXNlbnRhdGl2ZSwKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBhcHBfaWQ9c2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10sCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NTMKICAgIC8vIGFwcF9pZD1zZWxmLnZvdGVyc19ib3hbeGdvdl9hZGRyZXNzXSwKICAgIGJveF9nZXQKICAgIHBvcAogICAgYnRvaQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NTAtNjU0CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLnZvdGVfcmVwcmVzZW50YXRpdmUsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYudm90ZXJzX2JveFt4Z292X2FkZHJlc3NdLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4NzU3ZTI5ZmMgLy8gbWV0aG9kICJ2b3RlX3JlcHJlc2VudGF0aXZlKHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjU2CiAgICAvLyBzZWxmLnZvdGVzX2xlZnQudmFsdWUgLT0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVzX2xlZnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgYnl0ZWNfMSAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjU3CiAgICAvLyBzZWxmLnVwZGF0ZV90cmlnZ2VyX2Z1bmQoKQogICAgY2FsbHN1YiB1cGRhdGVfdHJpZ2dlcl9mdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NTktNjYzCiAgICAvLyAjIFNlbmQgdHJpZ2dlciBhd2FyZCB0byBzZW5kZXIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1zZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2MQogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2MgogICAgLy8gYW1vdW50PXNlbGYudm90ZV90cmlnZ2VyX2F3YXJkLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg3NjZmNzQ2NTVmNzQ3MjY5Njc2NzY1NzI1ZjYxNzc2MTcyNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjU5LTY2MAogICAgLy8gIyBTZW5kIHRyaWdnZXIgYXdhcmQgdG8gc2VuZGVyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1OS02NjMKICAgIC8vICMgU2VuZCB0cmlnZ2VyIGF3YXJkIHRvIHNlbmRlcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PXNlbGYudm90ZV90cmlnZ2VyX2F3YXJkLnZhbHVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudW5yZWdpc3Rlcl92b3Rlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnVucmVnaXN0ZXJfdm90ZXI6CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjY3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODMKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4NQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODYKICAgIC8vIGFzc2VydCB4Z292X2FkZHJlc3MgaW4gc2VsZi52b3RlcnNfYm94LCBlcnIuTk9UX1ZPVEVSCiAgICBieXRlYyA0IC8vIDB4NzYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3QgVm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4NwogICAgLy8gdm90ZXJfYXBwID0gc2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10KICAgIGJveF9nZXQKICAgIHBvcAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2OTAKICAgIC8vIHZvdGVyX2FwcCwgdm90ZXJfY2ZnLkdTX0tFWV9NQU5BR0VSX0FERFJFU1MKICAgIGJ5dGVjXzIgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4OS02OTEKICAgIC8vIG1hbmFnZXJfYWRkcmVzc19ieXRlcywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICB2b3Rlcl9hcHAsIHZvdGVyX2NmZy5HU19LRVlfTUFOQUdFUl9BRERSRVNTCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2OTQtNjk5CiAgICAvLyAjIEdldCB4Z292X2FkZHJlc3MgYm94CiAgICAvLyBbeGdvdl9ib3gsIGV4aXN0c10sIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5nZXRfeGdvdl9ib3gsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Njk4CiAgICAvLyBhcHBfaWQ9c2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwIGV4aXN0cwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2OTQtNjk5CiAgICAvLyAjIEdldCB4Z292X2FkZHJlc3MgYm94CiAgICAvLyBbeGdvdl9ib3gsIGV4aXN0c10sIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5nZXRfeGdvdl9ib3gsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgLy8gKQogICAgYnl0ZWMgMTQgLy8gbWV0aG9kICJnZXRfeGdvdl9ib3goYWRkcmVzcykoKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpLGJvb2wpIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA1NyAvLyA1NwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC50dXBsZTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292Qm94VmFsdWUsYXJjNC5ib29sPgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIHN3YXAKICAgIGV4dHJhY3QgNCA1NgogICAgc3dhcAogICAgaW50YyA0IC8vIDQ0OAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MDAtNzAyCiAgICAvLyAjIElmIHhHb3YgaGFzIHVuc3Vic2NyaWJlZCBmcm9tIHRoZSB4R292IHByb2dyYW0sIGFueW9uZSBjYW4gdW5yZWdpc3RlciBpdCBmcm9tIERlbGVnYXRpb25SZWdpc3RyeS4KICAgIC8vICMgT3RoZXJ3aXNlLCBvbmx5IHhnb3ZfYWRkcmVzcyBvciBtYW5hZ2VyX2FkZHJlc3MgY2FuIHVucmVnaXN0ZXIgaXQuCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiB1bnJlZ2lzdGVyX3ZvdGVyX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwNAogICAgLy8gVHhuLnNlbmRlciA9PSB4Z292X2FkZHJlc3Mgb3IgVHhuLnNlbmRlciA9PSBtYW5hZ2VyX2FkZHJlc3MKICAgIGRpZyA1CiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYm56IHVucmVnaXN0ZXJfdm90ZXJfYm9vbF90cnVlQDUKICAgIGRpZyAxCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYnogdW5yZWdpc3Rlcl92b3Rlcl9ib29sX2ZhbHNlQDYKCnVucmVnaXN0ZXJfdm90ZXJfYm9vbF90cnVlQDU6CiAgICBpbnRjXzEgLy8gMQoKdW5yZWdpc3Rlcl92b3Rlcl9ib29sX21lcmdlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MDMtNzA1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0geGdvdl9hZGRyZXNzIG9yIFR4bi5zZW5kZXIgPT0gbWFuYWdlcl9hZGRyZXNzCiAgICAvLyApLCBlcnIuVU5BVVRIT1JJWkVECiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTAKICAgIC8vIHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzID09IG1hbmFnZXJfYWRkcmVzcwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIGR1cAogICAgYnVyeSA4CiAgICBkaWcgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMC03MTEKICAgIC8vIHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzID09IG1hbmFnZXJfYWRkcmVzcwogICAgLy8gb3IgeGdvdl9ib3gudm90aW5nX2FkZHJlc3MgPT0geGdvdl9hZGRyZXNzCiAgICBibnogdW5yZWdpc3Rlcl92b3Rlcl9hZnRlcl9pZl9lbHNlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTEKICAgIC8vIG9yIHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzID09IHhnb3ZfYWRkcmVzcwogICAgZGlnIDYKICAgIGRpZyA2CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzEwLTcxMQogICAgLy8geGdvdl9ib3gudm90aW5nX2FkZHJlc3MgPT0gbWFuYWdlcl9hZGRyZXNzCiAgICAvLyBvciB4Z292X2JveC52b3RpbmdfYWRkcmVzcyA9PSB4Z292X2FkZHJlc3MKICAgIGJueiB1bnJlZ2lzdGVyX3ZvdGVyX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMy03MTcKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIueWllbGRfdm90aW5nX3JpZ2h0cywKICAgIC8vICAgICBtYW5hZ2VyX2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPXZvdGVyX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIHB1c2hieXRlcyAweGJhNjBkODU0IC8vIG1ldGhvZCAieWllbGRfdm90aW5nX3JpZ2h0cyhhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKdW5yZWdpc3Rlcl92b3Rlcl9hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzE5LTcyMgogICAgLy8gIyBSZWR1Y2UgcGFpZCB2b3RlcwogICAgLy8gdm90ZXNfbGVmdCwgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVEVTX0xFRlQKICAgIC8vICkKICAgIGRpZyAyCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyMQogICAgLy8gdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVEVTX0xFRlQKICAgIGJ5dGVjXzEgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzE5LTcyMgogICAgLy8gIyBSZWR1Y2UgcGFpZCB2b3RlcwogICAgLy8gdm90ZXNfbGVmdCwgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVEVTX0xFRlQKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyMwogICAgLy8gc2VsZi52b3Rlc19sZWZ0LnZhbHVlIC09IHZvdGVzX2xlZnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3Rlc19sZWZ0IGV4aXN0cwogICAgc3dhcAogICAgLQogICAgYnl0ZWNfMSAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzI0CiAgICAvLyBzZWxmLnVwZGF0ZV90cmlnZ2VyX2Z1bmQoKQogICAgY2FsbHN1YiB1cGRhdGVfdHJpZ2dlcl9mdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MjYtNzI5CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLmRlbGV0ZSwKICAgIC8vICAgICBhcHBfaWQ9dm90ZXJfYXBwLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBieXRlYyAxNyAvLyBtZXRob2QgImRlbGV0ZSgpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzMxLTczMgogICAgLy8gIyBEZWxldGUgVm90ZXIgYm94CiAgICAvLyBkZWwgc2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10KICAgIGRpZyAzCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczNAogICAgLy8gbWJyX2FmdGVyID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MzUKICAgIC8vIG1icl9mZWUgPSBtYnJfYmVmb3JlIC0gbWJyX2FmdGVyCiAgICBkaWcgNQogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzM3LTc0MAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXhnb3ZfYWRkcmVzcy5uYXRpdmUsCiAgICAvLyAgICAgYW1vdW50PW1icl9mZWUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZGlnIDUKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczNwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MzctNzQwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9eGdvdl9hZGRyZXNzLm5hdGl2ZSwKICAgIC8vICAgICBhbW91bnQ9bWJyX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp1bnJlZ2lzdGVyX3ZvdGVyX2Jvb2xfZmFsc2VANjoKICAgIGludGNfMCAvLyAwCiAgICBiIHVucmVnaXN0ZXJfdm90ZXJfYm9vbF9tZXJnZUA3CgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LnJlZ2lzdGVyX3JlcHJlc2VudGF0aXZlW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVnaXN0ZXJfcmVwcmVzZW50YXRpdmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NDQtNzQ3CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLSBSZXByZXNlbnRhdGl2ZSAtLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjcKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2OQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzEKICAgIC8vIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3MwogICAgLy8gcmVwcmVzZW50YXRpdmVfYWRkcmVzcyBub3QgaW4gc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94CiAgICBieXRlYyAxMSAvLyAweDcyCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzcyLTc3NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9hZGRyZXNzIG5vdCBpbiBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3gKICAgIC8vICksIGVyci5BTFJFQURZX1JFUFJFU0VOVEFUSVZFCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBhIHJlcHJlc2VudGF0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzYKICAgIC8vIGJveCA9IEJveChCeXRlcywga2V5PUJ5dGVzKGNmZy5DT05UUkFDVF9SRVBSRVNFTlRBVElWRV9CT1gpKQogICAgYnl0ZWMgMTIgLy8gMHg3MzYzNWY3MjY1NzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3Ny03NzgKICAgIC8vICMgQXNzdW1lIHByb2dyYW0gc2l6ZSBpcyA8IGNvbnN0Lk1BWF9TVEFDSwogICAgLy8gYXBwcm92YWxfcHJvZ3JhbSA9IGJveC5leHRyYWN0KDAsIGJveC5sZW5ndGgpCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgQm94IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Nzc2CiAgICAvLyBib3ggPSBCb3goQnl0ZXMsIGtleT1CeXRlcyhjZmcuQ09OVFJBQ1RfUkVQUkVTRU5UQVRJVkVfQk9YKSkKICAgIGJ5dGVjIDEyIC8vIDB4NzM2MzVmNzI2NTcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzctNzc4CiAgICAvLyAjIEFzc3VtZSBwcm9ncmFtIHNpemUgaXMgPCBjb25zdC5NQVhfU1RBQ0sKICAgIC8vIGFwcHJvdmFsX3Byb2dyYW0gPSBib3guZXh0cmFjdCgwLCBib3gubGVuZ3RoKQogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4MC03OTAKICAgIC8vIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUuY3JlYXRlLAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz1yZXByZXNlbnRhdGl2ZV9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGxvY2FsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICBsb2NhbF9udW1fYnl0ZXM9cmVwcmVzZW50YXRpdmVfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODkKICAgIC8vIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICBwdXNoaW50IDMgLy8gMwogICAgaXR4bl9maWVsZCBFeHRyYVByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Nzg4CiAgICAvLyBsb2NhbF9udW1fYnl0ZXM9cmVwcmVzZW50YXRpdmVfY2ZnLkxPQ0FMX0JZVEVTLAogICAgcHVzaGludCA5IC8vIDkKICAgIGl0eG5fZmllbGQgTG9jYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4NwogICAgLy8gbG9jYWxfbnVtX3VpbnQ9cmVwcmVzZW50YXRpdmVfY2ZnLkxPQ0FMX1VJTlRTLAogICAgcHVzaGludCA3IC8vIDcKICAgIGl0eG5fZmllbGQgTG9jYWxOdW1VaW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODYKICAgIC8vIGdsb2JhbF9udW1fYnl0ZXM9cmVwcmVzZW50YXRpdmVfY2ZnLkdMT0JBTF9CWVRFUywKICAgIGludGNfMiAvLyAzMgogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4NQogICAgLy8gZ2xvYmFsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5HTE9CQUxfVUlOVFMsCiAgICBpbnRjXzIgLy8gMzIKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Nzg0CiAgICAvLyBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgYnl0ZWMgOCAvLyAweDBhODEwMTQzCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4MC03OTAKICAgIC8vIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUuY3JlYXRlLAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz1yZXByZXNlbnRhdGl2ZV9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGxvY2FsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICBsb2NhbF9udW1fYnl0ZXM9cmVwcmVzZW50YXRpdmVfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhjYzY5NGVhYSAvLyBtZXRob2QgImNyZWF0ZShhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGludGNfMyAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3OTItNzk2CiAgICAvLyAjIEZ1bmQgdGhlIGNyZWF0ZWQgYXBwIHdpdGggTUJSCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9dHhuLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5NAogICAgLy8gcmVjZWl2ZXI9dHhuLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICBkdXAKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5NQogICAgLy8gYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzkyLTc5MwogICAgLy8gIyBGdW5kIHRoZSBjcmVhdGVkIGFwcCB3aXRoIE1CUgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3OTItNzk2CiAgICAvLyAjIEZ1bmQgdGhlIGNyZWF0ZWQgYXBwIHdpdGggTUJSCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9dHhuLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDAKICAgIC8vIHNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV9hZGRyZXNzXSA9IEFwcGxpY2F0aW9uKAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODAwLTgwMgogICAgLy8gc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94W3JlcHJlc2VudGF0aXZlX2FkZHJlc3NdID0gQXBwbGljYXRpb24oCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfaWQKICAgIC8vICkKICAgIHN3YXAKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDQKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODA1CiAgICAvLyBtYnJfZmVlID0gbWJyX2FmdGVyIC0gbWJyX2JlZm9yZQogICAgdW5jb3ZlciAyCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDkKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwNy04MTAKICAgIC8vICMgQ2hlY2sgcGF5bWVudAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5XUk9OR19SRUNFSVZFUgogICAgYXNzZXJ0IC8vIFdyb25nIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MTEKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSAoCiAgICB1bmNvdmVyIDIKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODEyCiAgICAvLyBtYnJfZmVlICsgc2VsZi5yZXByZXNlbnRhdGl2ZV9mZWUudmFsdWUgKyBHbG9iYWwubWluX2JhbGFuY2UKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcHJlc2VudGF0aXZlX2ZlZSBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxMS04MTIKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSAoCiAgICAvLyAgICAgbWJyX2ZlZSArIHNlbGYucmVwcmVzZW50YXRpdmVfZmVlLnZhbHVlICsgR2xvYmFsLm1pbl9iYWxhbmNlCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODExLTgxMwogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09ICgKICAgIC8vICAgICBtYnJfZmVlICsgc2VsZi5yZXByZXNlbnRhdGl2ZV9mZWUudmFsdWUgKyBHbG9iYWwubWluX2JhbGFuY2UKICAgIC8vICksIGVyci5XUk9OR19QQVlNRU5UX0FNT1VOVAogICAgYXNzZXJ0IC8vIFdyb25nIHBheW1lbnQgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NDQtNzQ3CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLSBSZXByZXNlbnRhdGl2ZSAtLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS51bnJlZ2lzdGVyX3JlcHJlc2VudGF0aXZlW3JvdXRpbmddKCkgLT4gdm9pZDoKdW5yZWdpc3Rlcl9yZXByZXNlbnRhdGl2ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyOAogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODMwCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMgogICAgLy8gcmVwcmVzZW50YXRpdmUgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMwogICAgLy8gYXNzZXJ0IHJlcHJlc2VudGF0aXZlIGluIHNlbGYucmVwcmVzZW50YXRpdmVzX2JveCwgZXJyLk5PVF9SRVBSRVNFTlRBVElWRQogICAgYnl0ZWMgMTEgLy8gMHg3MgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3QgYSByZXByZXNlbnRhdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODM1LTgzOAogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5kZWxldGUsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV0sCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MzcKICAgIC8vIGFwcF9pZD1zZWxmLnJlcHJlc2VudGF0aXZlc19ib3hbcmVwcmVzZW50YXRpdmVdLAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzNS04MzgKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZGVsZXRlLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLnJlcHJlc2VudGF0aXZlc19ib3hbcmVwcmVzZW50YXRpdmVdLAogICAgLy8gKQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBieXRlYyAxNyAvLyBtZXRob2QgImRlbGV0ZSgpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpbnRjXzMgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODQwLTg0MQogICAgLy8gIyBEZWxldGUgcmVwcmVzZW50YXRpdmUgYm94CiAgICAvLyBkZWwgc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94W3JlcHJlc2VudGF0aXZlXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NDMKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODQ0CiAgICAvLyBtYnJfZmVlID0gbWJyX2JlZm9yZSAtIG1icl9hZnRlcgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NDYtODQ5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVwcmVzZW50YXRpdmUubmF0aXZlLAogICAgLy8gICAgIGFtb3VudD1tYnJfZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0NgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NDYtODQ5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVwcmVzZW50YXRpdmUubmF0aXZlLAogICAgLy8gICAgIGFtb3VudD1tYnJfZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGVyX2FwcF9pZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF92b3Rlcl9hcHBfaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NTMtODU2CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLSBHZXR0ZXIgbWV0aG9kcyAtLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODcxCiAgICAvLyBleGlzdHMgPSB4Z292X2FkZHJlc3MgaW4gc2VsZi52b3RlcnNfYm94CiAgICBieXRlYyA0IC8vIDB4NzYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NzIKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF92b3Rlcl9hcHBfaWRfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3MwogICAgLy8gdmFsID0gc2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10uaWQKICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlcnNfYm94IGVudHJ5IGV4aXN0cwogICAgYnRvaQoKZ2V0X3ZvdGVyX2FwcF9pZF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NTMtODU2CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLSBHZXR0ZXIgbWV0aG9kcyAtLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfdm90ZXJfYXBwX2lkX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODc1CiAgICAvLyB2YWwgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBiIGdldF92b3Rlcl9hcHBfaWRfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODc5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODk0CiAgICAvLyBleGlzdHMgPSByZXByZXNlbnRhdGl2ZV9hZGRyZXNzIGluIHNlbGYucmVwcmVzZW50YXRpdmVzX2JveAogICAgYnl0ZWMgMTEgLy8gMHg3MgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5NQogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODk2CiAgICAvLyB2YWwgPSBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3hbcmVwcmVzZW50YXRpdmVfYWRkcmVzc10uaWQKICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94IGVudHJ5IGV4aXN0cwogICAgYnRvaQoKZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWRfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4OTgKICAgIC8vIHZhbCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGIgZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZF9hZnRlcl9pZl9lbHNlQDQKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuaXNfbWFuYWdlcigpIC0+IHVpbnQ2NDoKaXNfbWFuYWdlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxNQogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUubmF0aXZlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hbmFnZXJfYWRkcmVzcyBleGlzdHMKICAgID09CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudXBkYXRlX3RyaWdnZXJfZnVuZCgpIC0+IHZvaWQ6CnVwZGF0ZV90cmlnZ2VyX2Z1bmQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MTkKICAgIC8vIHNlbGYudHJpZ2dlcl9mdW5kLnZhbHVlID0gc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUgKiBzZWxmLnZvdGVzX2xlZnQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NzY2Zjc0NjU1Zjc0NzI2OTY3Njc2NTcyNWY2MTc3NjE3MjY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZV90cmlnZ2VyX2F3YXJkIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVzX2xlZnQgZXhpc3RzCiAgICAqCiAgICBieXRlYyA5IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjY2NzU2ZTY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [1045, 1317], "errorMessage": "Address length is 32 bytes"}, {"pc": [892], "errorMessage": "Already a Voter"}, {"pc": [1696], "errorMessage": "Already a representative"}, {"pc": [398], "errorMessage": "Insufficient funds"}, {"pc": [633, 1162, 1375, 1468], "errorMessage": "Not Voter"}, {"pc": [694, 1836], "errorMessage": "Not a representative"}, {"pc": [944, 1305], "errorMessage": "Not an xGov"}, {"pc": [65], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [234], "errorMessage": "OnCompletion must be UpdateApplication && can only call when not creating"}, {"pc": [881, 1152, 1365, 1455, 1683, 1824], "errorMessage": "Registry's non-admin methods are paused"}, {"pc": [348], "errorMessage": "Trigger fund is insufficient. Fund the Registry or reduce award."}, {"pc": [373], "errorMessage": "Trigger reward must not be larger than minimum vote fees"}, {"pc": [275, 311, 379, 420, 429, 458, 514, 544, 610, 624, 685, 957, 1335, 1548], "errorMessage": "Unauthorized"}, {"pc": [1049], "errorMessage": "Voter is already assigned"}, {"pc": [9], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [14], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [18], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [22], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [552, 829, 1096, 1237, 1790], "errorMessage": "Wrong Receiver"}, {"pc": [839, 1107, 1241, 1807], "errorMessage": "Wrong payment amount"}, {"pc": [340, 345, 384, 389, 749, 819, 875, 1086, 1449, 1638, 1677, 1779, 1818, 1865], "errorMessage": "account funded"}, {"pc": [801, 1009, 1756], "errorMessage": "application exists"}, {"pc": [935, 1296, 1519], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [637, 698, 753, 961, 1700], "errorMessage": "check Box exists"}, {"pc": [403, 1979], "errorMessage": "check self.manager_address exists"}, {"pc": [879, 1150, 1363, 1453, 1681, 1822], "errorMessage": "check self.paused_registry exists"}, {"pc": [1799], "errorMessage": "check self.representative_fee exists"}, {"pc": [1953], "errorMessage": "check self.representatives_box entry exists"}, {"pc": [335, 395], "errorMessage": "check self.trigger_fund exists"}, {"pc": [353, 1180, 1248], "errorMessage": "check self.vote_fees exists"}, {"pc": [370, 1418, 1986], "errorMessage": "check self.vote_trigger_award exists"}, {"pc": [1908], "errorMessage": "check self.voters_box entry exists"}, {"pc": [1213, 1402, 1603, 1990], "errorMessage": "check self.votes_left exists"}, {"pc": [898, 1259, 1484], "errorMessage": "check self.xgov_registry_app exists"}, {"pc": [499], "errorMessage": "invalid array length header"}, {"pc": [507], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [271, 620, 681, 859, 1135, 1350, 1441, 1891, 1936], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [443, 484], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 6>"}, {"pc": [927, 1288, 1511], "errorMessage": "invalid number of bytes for arc4.tuple<smart_contracts.common.abi_types.XGovBoxValue,arc4.bool>"}, {"pc": [246, 298, 307, 454, 493, 868, 1146, 1359], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [289], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.Fees"}, {"pc": [540], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.KeyRegTxnInfo"}, {"pc": [530, 744, 851, 1126, 1672], "errorMessage": "transaction type is pay"}, {"pc": [365], "errorMessage": "xGov vote fees must not be larger than for others"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"entropy": {"type": "AVMBytes"}}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "desc": "ID of xGov Registry app this Delegation Registry uses.", "name": "xgov_registry_id"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new Delegation Registry.\nThe registry is created as paused.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new DelegationRegistry Manager.", "name": "manager"}], "name": "set_manager", "returns": {"type": "void"}, "desc": "Sets the DelegationRegistry Manager.", "events": [{"args": [{"type": "address", "name": "previous_manager_address"}, {"type": "address", "name": "manager_address"}], "name": "RegistryManagerSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64)", "desc": "Fees to pay for a vote.", "name": "vote_fees", "struct": "Fees"}, {"type": "uint64", "desc": "Fee to become a representative.", "name": "representative_fee"}, {"type": "uint64", "desc": "Fee received as a reward for triggering a vote casting.", "name": "vote_trigger_award"}], "name": "config_delegation_registry", "returns": {"type": "void"}, "desc": "Set the configuration of the Delegation Registry.", "events": [{"args": [{"type": "(uint64,uint64)", "name": "vote_fees", "struct": "Fees"}, {"type": "uint64", "name": "representative_fee"}, {"type": "uint64", "name": "vote_trigger_award"}], "name": "RegistryConfigured"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "withdraw_balance", "returns": {"type": "void"}, "desc": "Withdraw outstanding Algos, excluding MBR and trigger award funds, from the Delegation Registry.", "events": [{"args": [{"type": "address", "name": "manager_address"}, {"type": "uint64", "name": "amount"}], "name": "BalanceWithdrawn"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_registry", "returns": {"type": "void"}, "desc": "Pause the Delegation Registry.", "events": [{"args": [{"type": "address", "name": "manager_address"}, {"type": "bool", "name": "paused"}], "name": "RegistryPauseSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_registry", "returns": {"type": "void"}, "desc": "Resume the Delegation Registry.", "events": [{"args": [{"type": "address", "name": "manager_address"}, {"type": "bool", "name": "paused"}], "name": "RegistryPauseSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[6]", "desc": "Contract name for which to load the approval program.", "name": "contract"}, {"type": "uint64", "desc": "The size of the approval program of a contract.", "name": "size"}], "name": "init_contract", "returns": {"type": "void"}, "desc": "Initialize loading of approval program for a contract.", "events": [{"args": [{"type": "byte[6]", "name": "contract"}, {"type": "uint64", "name": "size"}], "name": "ContractInitialized"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[6]", "desc": "Contract name for which to load the approval program.", "name": "contract"}, {"type": "uint64", "desc": "The offset in the approval program.", "name": "offset"}, {"type": "byte[]", "desc": "The data to load into the approval program.", "name": "data"}], "name": "load_contract", "returns": {"type": "void"}, "desc": "Load the approval program for a contract.", "events": [{"args": [{"type": "byte[6]", "name": "contract"}, {"type": "uint64", "name": "offset"}, {"type": "uint64", "name": "size"}], "name": "ContractLoaded"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to cover costs for the key (de)registration fee.", "name": "payment"}, {"type": "(uint64,uint64,uint64,byte[32],byte[32],byte[64])", "desc": "Key registration information to send.", "name": "key_reg_info", "struct": "KeyRegTxnInfo"}], "name": "key_reg_registry", "returns": {"type": "void"}, "desc": "Issues a key (de)registration transaction for the Delegation Registry.", "events": [{"args": [{"type": "uint64", "name": "fee"}, {"type": "(uint64,uint64,uint64,byte[32],byte[32],byte[64])", "name": "key_reg_info", "struct": "KeyRegTxnInfo"}], "name": "KeyRegistered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_registry", "returns": {"type": "void"}, "desc": "Updates the Delegation Registry contract.", "events": [{"args": [{"type": "address", "name": "manager_address"}, {"type": "uint64", "name": "registry_id"}], "name": "RegistryUpdated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}], "name": "update_voter", "returns": {"type": "void"}, "desc": "Update an existing Voter contract, and sync its cached xGov Registry ID.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterUpdated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the representative.", "name": "representative_address"}], "name": "update_representative", "returns": {"type": "void"}, "desc": "Update an existing representative contract, and sync its cached xGov Registry ID.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeUpdated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to cover the MBR.", "name": "payment"}], "name": "prepare_voter", "returns": {"type": "void"}, "desc": "Creates an unassigned Voter application that can be consumed by any Voter who registers.\nCan be called by anyone.", "events": [{"args": [{"type": "address", "name": "funder_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterPrepared"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to cover the MBR.", "name": "payment"}, {"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "uint64", "desc": "App ID of an unassigned Voter app.", "name": "available_voter_id"}], "name": "register_voter", "returns": {"type": "uint64", "desc": "ID of assigned Voter."}, "desc": "Create a Voter for an xGov at Delegation Registry.", "events": [{"args": [{"type": "address", "name": "funder_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterPrepared"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterRegistered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment for the votes.", "name": "payment"}, {"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "uint64", "desc": "Number of votes to add.", "name": "add_votes"}], "name": "add_votes", "returns": {"type": "void"}, "desc": "Pays for the votes of an xGov.\nCan be called only by xgov_address, voting_address or voter's manager_address. If xGov is calling it, the fee is lower.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "votes"}, {"type": "uint64", "name": "fee"}], "name": "VotesPaid"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "uint64", "desc": "App ID of proposal on which to trigger vote.", "name": "proposal_id"}], "name": "trigger_vote", "returns": {"type": "void"}, "desc": "Trigger vote for xGov on a proposal.\nCan be called by anyone. Calls in a group also mark the Voter as triggered in the bitmap of the proposal, as `trigger_vote_to_ledger` does, so both reject the same duplicates. The bitmap page adds a box reference, which only fits in the shared references of a group.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "trigger_award"}], "name": "VoteTriggered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "uint64", "desc": "App ID of proposal on which to trigger vote.", "name": "proposal_id"}], "name": "trigger_vote_to_ledger", "returns": {"type": "void"}, "desc": "Trigger vote for xGov on a proposal, crediting the trigger award to the trigger\nrewards ledger of the sender instead of paying it. Can be called by anyone who has opened a ledger. The Voter is marked as triggered in the bitmap of the proposal, so duplicate triggers fail before any inner call. The ledger box of the sender and the bitmap page add box references to the call, so it fits only in groups sharing their references.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "trigger_award"}], "name": "VoteTriggered"}, {"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "amount"}], "name": "TriggerRewardsCredited"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of the proposal.", "name": "proposal_id"}, {"type": "uint64", "desc": "Page of the bitmap, i.e. Voter index // `cfg.TRIGGERED_PAGE_BITS`.", "name": "page"}], "name": "delete_triggered_page", "returns": {"type": "void"}, "desc": "Delete a page of the triggered bitmap of a proposal that is no longer voting.\nCan be called by anyone. The MBR of the page is released to the Delegation Registry.", "events": [{"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "page"}], "name": "TriggeredPageDeleted"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment transaction to cover the MBR.", "name": "payment"}], "name": "open_trigger_rewards", "returns": {"type": "void"}, "desc": "Open a trigger rewards ledger for the sender.\nVotes triggered with `trigger_vote_to_ledger` then credit their award to the ledger, saving an inner payment per trigger, and the rewards are claimed at once.", "events": [{"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "mbr"}], "name": "TriggerRewardsOpened"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "claim_trigger_rewards", "returns": {"type": "uint64", "desc": "Amount of claimed rewards."}, "desc": "Claim the trigger rewards credited to the ledger of the sender.\nCan be called also if the Delegation Registry is paused.", "events": [{"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "amount"}], "name": "TriggerRewardsClaimed"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "close_trigger_rewards", "returns": {"type": "void"}, "desc": "Close the trigger rewards ledger of the sender.\nOutstanding rewards are claimed and the MBR of the ledger is refunded. Can be called also if the Delegation Registry is paused.", "events": [{"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "amount"}], "name": "TriggerRewardsClosed"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}], "name": "unregister_voter", "returns": {"type": "void"}, "desc": "Unregister Voter of an xGov from Delegation Registry.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterUnregistered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment to cover representative registration fee and MBR.", "name": "payment"}], "name": "register_representative", "returns": {"type": "uint64", "desc": "ID of created representative."}, "desc": "Create a new representative.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeRegistered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "unregister_representative", "returns": {"type": "void"}, "desc": "Unregister yourself as representative from the Delegation Registry.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeUnregistered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "xGov address.", "name": "xgov_address"}], "name": "get_voter_app_id", "returns": {"type": "(uint64,bool)", "desc": "Voter app ID. bool: `True` if Voter app exists, else `False`."}, "desc": "Get Voter app ID for an xGov.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Representative address.", "name": "representative_address"}], "name": "get_representative_app_id", "returns": {"type": "(uint64,bool)", "desc": "App ID of representative. bool: `True` if Representative app exists, else `False`."}, "desc": "Get the app ID of xGov.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "xGov addresses.", "name": "xgov_addresses"}], "name": "get_voter_app_ids", "returns": {"type": "(uint64,bool)[]", "desc": "Voter app ID of each xGov, in order, and whether the Voter app exists."}, "desc": "Get Voter app IDs for many xGovs.\nEach address needs a box reference, see `cfg.MAX_BULK_GETTER_ADDRESSES`.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "Representative addresses.", "name": "representative_addresses"}], "name": "get_representative_app_ids", "returns": {"type": "(uint64,bool)[]", "desc": "App ID of each representative, in order, and whether the Representative app exists."}, "desc": "Get the app IDs of many representatives.\nEach address needs a box reference, see `cfg.MAX_BULK_GETTER_ADDRESSES`.", "events": [], "readonly": true, "recommendations": {}}], "name": "DelegationRegistry", "state": {"keys": {"box": {"voter_approval_program": {"key": "c2Nfdm90", "keyType": "AVMBytes", "valueType": "AVMBytes"}, "representative_approval_program": {"key": "c2NfcmVw", "keyType": "AVMBytes", "valueType": "AVMBytes"}}, "global": {"manager_address": {"key": "bWFuYWdlcl9hZGRyZXNz", "keyType": "AVMBytes", "valueType": "address"}, "xgov_registry_app": {"key": "eGdvdl9yZWdpc3RyeV9hcHA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_fees": {"key": "dm90ZV9mZWVz", "keyType": "AVMBytes", "valueType": "Fees"}, "representative_fee": {"key": "cmVwcmVzZW50YXRpdmVfZmVl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_trigger_award": {"key": "dm90ZV90cmlnZ2VyX2F3YXJk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused_registry": {"key": "cGF1c2VkX3JlZ2lzdHJ5", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "votes_left": {"key": "dm90ZXNfbGVmdA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "trigger_fund": {"key": "dHJpZ2dlcl9mdW5k", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "trigger_rewards": {"key": "dHJpZ2dlcl9yZXdhcmRz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voters_created": {"key": "dm90ZXJzX2NyZWF0ZWQ=", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"voters_box": {"keyType": "address", "valueType": "uint64", "prefix": "dg=="}, "representatives_box": {"keyType": "address", "valueType": "uint64", "prefix": "cg=="}, "trigger_rewards_box": {"keyType": "address", "valueType": "uint64", "prefix": "dA=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 32, "ints": 32}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Fees": [{"name": "xgov", "type": "uint64"}, {"name": "other", "type": "uint64"}], "KeyRegTxnInfo": [{"name": "vote_first", "type": "uint64"}, {"name": "vote_last", "type": "uint64"}, {"name": "vote_key_dilution", "type": "uint64"}, {"name": "vote_pk", "type": "byte[32]"}, {"name": "selection_pk", "type": "byte[32]"}, {"name": "state_proof_pk", "type": "byte[64]"}]}, "byteCode": {"approval": "CiAFAAEgCMADJhoPbWFuYWdlcl9hZGRyZXNzD3BhdXNlZF9yZWdpc3RyeQQVH3x1EXhnb3ZfcmVnaXN0cnlfYXBwCnZvdGVzX2xlZnQSdm90ZV90cmlnZ2VyX2F3YXJkAXYPdHJpZ2dlcl9yZXdhcmRzDHRyaWdnZXJfZnVuZAEACXZvdGVfZmVlcwZzY192b3QECoEBQwFyBnNjX3JlcAF0EnJlcHJlc2VudGF0aXZlX2ZlZQ52b3RlcnNfY3JlYXRlZAQnYw1lBK8PWr8EoOgYcgTm2hytBJPqOz0EJDeNPAIAAAAxGEAANDE1JBJEMTQkEkQxNxREMTYURCgyA2crImcnECJnJwUiZykiZycEImcnCCJnJwciZycRImeABOKHvlA2GgCOAQDVMRkURDEYQQC+ghoElmfW3gQ9jm+vBLO1hIIEhvfg5gSYNS6GBKOZ6ycEqlWy9ATIuLyOBHmIUdMEnZKoHwQ7VMAfBJKpxRIErzxT6ASUzJ5mBF3HBAYE2alF3QQIJE8HBKtExSUElPSeEgRUIFJZBF8IwUcEsQocAAQTGi3RBMpod7MEV7em1wQT9hesNhoAjhoAMwBUAMEA+QEPASQBXwGgAhkCfQLhAxoEDAVDBXcF0gYmBmoGqgbvB+kIlwjtCQcJIQl5AIAEJA0vZzYaAI4BAA0AMRmBBBIxGBBEQgHnNhoBSRUlEkQoMQBnFytMZykjZycZSRJDNhoBSRUkEkSICdVEIihlRChLAmdMUIAEMiU+g0xQsCNDNhoBSRWBEBJENhoCSRUlEkQ2GgNJFSUSRIgJo0QnCksDZ0sBFycQTGdJFycFTGeICjAiJwhlRDIKcwBEMgpzAUQJDkQiJwplRElXAAhMVwgISwGnRCInBWVEFqdETgJQTFCABIrguUVMULAjQ4gJT0QyCnMARDIKcwFECSInCGVECUlEsSIoZURLAbIISbIHI7IQIrIBs0wWUIAEE24mXExQsCNDiAkXRCkjZyIoZUSAAYBQJxNMULAjQ4gJAUQpImciKGVEJwlQJxNMULAjQzYaAUcCFYEGEkQ2GgJJTgIVJRJEiAjYRL1FAUEAE0kXSwJM00pQgAR+xcNnTFCwI0NJF0sCTLlIQv/pNhoBSRWBBhJENhoCSRUlEkQ2GgNJIlmBAghLARUSRFcCAIgIj0RLARdLA0xLArsVFk4CUExQgARt4z1pTFCwI0MxFiMJSTgQIxJENhoBSRWBmAESRIgIXERLATgHMgoSREw4CLFLAVcYIEsCVzggSwMiW0sEJVtLBYEQW0sGV1hAsj+yDrINsgyyC7IKgQKyEEmyAbMWTFCABBsVGHBMULAjQ4gIDkQiKGVEMggWUIAEOZbtwkxQsCNDNhoBSRUkEkSIB+9EJwZLAVBJvUUBRCcLvUQnCyJPArpMvkgXsYEEshknDLJCTLJASbIYJxSyGoEGshAisgGzsSIrZUQWSwGyGCcVshqyGoEGshAisgGzFlCABMAinKFMULAjQzYaAUkVJBJEiAeLRCcNSwFQSb1FAUQnDr1EJw4iTwK6TL5IF7GBBLIZJwyyQkyyQEmyGCcUshqBBrIQIrIBs7EiK2VEFksBshgnFbIashqBBrIQIrIBsxZQgASDInKzTFCwI0MxFiMJSTgQIxJEMgpzAUSIBygyCnMBRE8CCUsCOAcyChJETwI4CDIBTwIIEkQxAEwWUCcWTFCwI0MxFiMJSTgQIxJENhoBSRUkEkQ2GgJJFSUSREkXMgpzAUQiKWVEFEQnBksEUEm9RQEURLEiK2VEshgnErIaSwSyGoEGshAisgGztD5JVwQASRWBORJESwFXAAQqEkRMVwQ4TCEEU0RXACAxAEsBEjEASwcSEUSIBolLBIAMeGdvdl9hZGRyZXNzZUhJFSQSRDIDEkSxMQBLBbIYgASheelAshpLB7IashpMshqBBrIQIrIBs08DFk8CTL8yCnMBRE8CCUsEOAcyChJETwQ4CDIBTwIIEkQxAEwWUCcWTFCwTEsBUIAEuRQDcUxQsCpMULAjQyJJgABHAjEWIwlJOBAjEkQ2GgFHAhUkEkQ2GgJJTgIVJRJEIillRBREJwZLAVBJvUUBRL5IF0wxAElOAhJBAFsiJwplRCJbRQaxSwGyGIAEKSPz0bIaSwJJshqBBrIQIrIBsyInBGVESwEXTEsBCCcETGeIBjRLBwtLBkk4BzIKEkQ4CEsBEkQWSwVPAlBMUIAEMAicY0xQsCNDIicKZUQlW0UGSwGAEXZvdGluZ19hZGRyZXNzX3RzZUhJRQhBAGoyB0sHgawCCAxBAF5LAYAOdm90aW5nX2FkZHJlc3NlSEkVJBJESTIDE0UJRQlLB0RLAShlSElFCxUkEkRJSwkTQQAQSUsKE0EACUsDiAVeTEUKRElLCRJAAAdJSwoSQQAFI0RC/yIiQv/4SwOIBT5FCUUJQv+3NhoBSRUkEkQ2GgJJFSUSRDIEIw1BAARKiAVuSogF07ExACInBWVEsgiyByOyECKyAbMjQzYaAUkVJBJENhoCSRUlEkQxACcPSwFQSb1FAURLA0sDiAUyTwNPA4gFlEm+RBciJwVlRExLAQgWTwJMvyInB2VECCcHTGeIBPYiJwVlRBZQgAS/YiVvTFCwI0M2GgFHAhUlEkQ2GgJJTgJJFSUSRBeAAWJLAlBMFlBJTgK9RQFEF4AGc3RhdHVzZUEAHkmBGRJBABcjFERLAbxISwNLA1CABPBcUidMULAjQyJC/+YxFiMJSTgQIxJEMgpzAUQxACcPSwFQSb1FARREIha/MgpzAURPAglLAjgHMgoSRE8COAhLARJEFlCABG5hwr9MULAjQzEAJw9LAVBJvUUBREm+SBdJRCIWTwJMv0mIBQGxMQBLAbIIsgcjshAisgGzFkxLAVCABL9GftdMULAqTFCwI0MyCnMBRDEAJw9LAVBJvUUBREm+SBdMvEhJiATBMgpzAURPA0wJsTEATgIISbIITLIHI7IQIrIBsxZQgASqhu5RTFCwI0MiNhoBRwIVJBJEMgpzAUxOAkQiKWVEFEQnBksBUElOAkm9RQFEvkgXSU4CKGVITLEiK2VEshgnErIashqBBrIQIrIBs7Q+SVcEAEkVgTkSREsBVwAEKhJETFcEOEwhBFNBAEBLBTEAEkAACEsBMQASQQCDI0RJVwAgSUUISwISQAAhSwZLBhJAABmxSwKyGIAEumDYVLIaSwGyGoEGshAisgGzSwJJJwRlSCInBGVETAknBExniAMPsYEFshlJshgnF7IagQayECKyAbNLBLxIMgpzAURLBkwJsbIISwZJsgcjshAisgGzTBZQgAQ4N/P7TFCwI0MiQv96MRYjCUk4ECMSRDIKcwFEIillRBREMQAnDUsBUEm9RQEURCcOvUQnDiJPArqxIitlRBaBA7I4gQmyN4EHsjYksjUksjQnDLJCTLJAgATAtkNSshpLArIashqBBrIQIrIBs7Q9sUlyCEQyAbIIsgcjshAisgGzFkxLAb8yCnMBRE8DCUsDOAcyChJETwM4CCInEGVETwIIMgEIEkRMSwFQgAQ0doo1TFCwKkxQsCNDMgpzAUQiKWVEFEQxACcNSwFQSb1FAURJvkgXsYEFshlJshgnF7IagQayECKyAbNMvEgyCnMBRE8DTAmxsghLAbIHI7IQIrIBsxZQgAQ5U5/qTFCwI0M2GgFJFSQSRIgA2UwWJwkiTwNUUCpMULAjQzYaAUkVJBJEiADgTBYnCSJPA1RQKkxQsCNDNhoBRwIiWUlOAiQLgQIITBUSRCcYIklLAwxBADRLA1cCAEsBSU4CJAskWIgAgkwWJwkiTwNUUEsDSU8CUEwiWSMIFlcGAlwARQMjCEUBQv/FKksCULAjQzYaAUcCIllJTgIkC4ECCEwVEkQnGCJJSwMMQQA0SwNXAgBLAUlOAiQLJFiIAEtMFicJIk8DVFBLA0lPAlBMIlkjCBZXBgJcAEUDIwhFAUL/xSpLAlCwI0OKAQInBov/UEm9SU8CSEEADIsAvkQXiwFPA08DiSJC//WKAQInDYv/UEm9SU8CSEEADIsAvkQXiwFPA08DiSJC//UxACIoZUQSiScLvUQnCyJPAroiJxFlRCMIJxFLAWexFiIrZUQWgQOyOCWyNyWyNiSyNSSyNCcMskJPArJAgASUef9jshpMshqyGoEGshAisgGztD2xSXIIRDIBsgiyByOyECKyAbOJigECsSIrZUSyGCcSshqL/7IagQayECKyAbO0PklXBABJFYE5EkRLAVcABCoSRExXBDhMIQRTTFcAIEyJIicFZUQiJwRlRAsiJwdlRAgnCExniYoCACInBov+UL5MF0xEgAVpbmRleGVAAAGJiwGBgEAKgAFii/9QTBZQSYwAvUUBQAAZiwCBgAi5SCInCGVEMgpzAEQyCnMBRAkORIsBgYBAGEklCosASU4DSwEjuk8CJRhKUxREI1S7iYoCACIpZUQURCcGi/5QSb1FAUSxvkgXshiABHV+KfyyGov/shqBBrIQIrIBsyInBGVEIwknBExniP9GIicFZUQWi/6L/1BMUIAEjAH4lUxQsImKAQAiJwdlRIv/CScHTGeI/x2J", "clear": "CoEBQw=="}, "events": [{"args": [{"type": "address", "name": "previous_manager_address"}, {"type": "address", "name": "manager_address"}], "name": "RegistryManagerSet"}, {"args": [{"type": "(uint64,uint64)", "name": "vote_fees", "struct": "Fees"}, {"type": "uint64", "name": "representative_fee"}, {"type": "uint64", "name": "vote_trigger_award"}], "name": "RegistryConfigured"}, {"args": [{"type": "address", "name": "manager_address"}, {"type": "uint64", "name": "amount"}], "name": "BalanceWithdrawn"}, {"args": [{"type": "address", "name": "manager_address"}, {"type": "bool", "name": "paused"}], "name": "RegistryPauseSet"}, {"args": [{"type": "byte[6]", "name": "contract"}, {"type": "uint64", "name": "size"}], "name": "ContractInitialized"}, {"args": [{"type": "byte[6]", "name": "contract"}, {"type": "uint64", "name": "offset"}, {"type": "uint64", "name": "size"}], "name": "ContractLoaded"}, {"args": [{"type": "uint64", "name": "fee"}, {"type": "(uint64,uint64,uint64,byte[32],byte[32],byte[64])", "name": "key_reg_info", "struct": "KeyRegTxnInfo"}], "name": "KeyRegistered"}, {"args": [{"type": "address", "name": "manager_address"}, {"type": "uint64", "name": "registry_id"}], "name": "RegistryUpdated"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterUpdated"}, {"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeUpdated"}, {"args": [{"type": "address", "name": "funder_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterPrepared"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterRegistered"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "votes"}, {"type": "uint64", "name": "fee"}], "name": "VotesPaid"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "trigger_award"}], "name": "VoteTriggered"}, {"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "amount"}], "name": "TriggerRewardsCredited"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "page"}], "name": "TriggeredPageDeleted"}, {"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "mbr"}], "name": "TriggerRewardsOpened"}, {"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "amount"}], "name": "TriggerRewardsClaimed"}, {"args": [{"type": "address", "name": "trigger_address"}, {"type": "uint64", "name": "amount"}], "name": "TriggerRewardsClosed"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voter_id"}], "name": "VoterUnregistered"}, {"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeRegistered"}, {"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeUnregistered"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOCA0NDgKICAgIGJ5dGVjYmxvY2sgMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMgMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkgMHgxNTFmN2M3NSAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAgMHg3NjZmNzQ2NTczNWY2YzY1NjY3NCAweDc2NmY3NDY1NWY3NDcyNjk2NzY3NjU3MjVmNjE3NzYxNzI2NCAweDc2IDB4NzQ3MjY5Njc2NzY1NzI1ZjcyNjU3NzYxNzI2NDczIDB4NzQ3MjY5Njc2NzY1NzI1ZjY2NzU2ZTY0IDB4MDAgMHg3NjZmNzQ2NTVmNjY2NTY1NzMgMHg3MzYzNWY3NjZmNzQgMHgwYTgxMDE0MyAweDcyIDB4NzM2MzVmNzI2NTcwIDB4NzQgMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2NjY1NjUgMHg3NjZmNzQ2NTcyNzM1ZjYzNzI2NTYxNzQ2NTY0IDB4Mjc2MzBkNjUgMHhhZjBmNWFiZiAweGEwZTgxODcyIDB4ZTZkYTFjYWQgMHg5M2VhM2IzZCAweDI0Mzc4ZDNjIDB4MDAwMCBUTVBMX2VudHJvcHkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4LTQ5CiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IGNmZy5HTE9CQUxfQllURVMsIGVyci5XUk9OR19HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTAKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV91aW50ID09IGNmZy5HTE9CQUxfVUlOVFMsIGVyci5XUk9OR19HTE9CQUxfVUlOVFMKICAgIHR4biBHbG9iYWxOdW1VaW50CiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxCiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV9ieXRlX3NsaWNlID09IGNmZy5MT0NBTF9CWVRFUywgZXJyLldST05HX0xPQ0FMX0JZVEVTCiAgICB0eG4gTG9jYWxOdW1CeXRlU2xpY2UKICAgICEKICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBCeXRlcyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MgogICAgLy8gYXNzZXJ0IFR4bi5sb2NhbF9udW1fdWludCA9PSBjZmcuTE9DQUxfVUlOVFMsIGVyci5XUk9OR19MT0NBTF9VSU5UUwogICAgdHhuIExvY2FsTnVtVWludAogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3CiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9NQU5BR0VSX0FERFJFU1MsCiAgICBieXRlY18wIC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NgogICAgLy8gYXJjNC5BZGRyZXNzKCksCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0LTU4CiAgICAvLyAjIEdsb2JhbCBWYXJpYWJsZXMKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyZXNzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfTUFOQUdFUl9BRERSRVNTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYxCiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIGJ5dGVjXzMgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MAogICAgLy8gQXBwbGljYXRpb24oKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1OS02MgogICAgLy8gc2VsZi54Z292X3JlZ2lzdHJ5X2FwcCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEFwcGxpY2F0aW9uKCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfWEdPVl9SRUdJU1RSWV9BUFAsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjkKICAgIC8vIGtleT1jZmcuR1NfS0VZX1JFUFJFU0VOVEFUSVZFX0ZFRSwKICAgIGJ5dGVjIDE2IC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjY2NTY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2OAogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjctNzAKICAgIC8vIHNlbGYucmVwcmVzZW50YXRpdmVfZmVlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfUkVQUkVTRU5UQVRJVkVfRkVFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczCiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9WT1RFX1RSSUdHRVJfQVdBUkQsCiAgICBieXRlYyA1IC8vIDB4NzY2Zjc0NjU1Zjc0NzI2OTY3Njc2NTcyNWY2MTc3NjE3MjY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzEtNzQKICAgIC8vIHNlbGYudm90ZV90cmlnZ2VyX2F3YXJkID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfVk9URV9UUklHR0VSX0FXQVJELAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBzZWxmLnBhdXNlZF9yZWdpc3RyeSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlkpCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBzZWxmLnZvdGVzX2xlZnQgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9URVNfTEVGVCkKICAgIGJ5dGVjIDQgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NwogICAgLy8gc2VsZi50cmlnZ2VyX2Z1bmQgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVFJJR0dFUl9GVU5EKQogICAgYnl0ZWMgOCAvLyAweDc0NzI2OTY3Njc2NTcyNWY2Njc1NmU2NAogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3OAogICAgLy8gc2VsZi50cmlnZ2VyX3Jld2FyZHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVFJJR0dFUl9SRVdBUkRTKQogICAgYnl0ZWMgNyAvLyAweDc0NzI2OTY3Njc2NTcyNWY3MjY1Nzc2MTcyNjQ3MwogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3OQogICAgLy8gc2VsZi52b3RlcnNfY3JlYXRlZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9WT1RFUlNfQ1JFQVRFRCkKICAgIGJ5dGVjIDE3IC8vIDB4NzY2Zjc0NjU3MjczNWY2MzcyNjU2MTc0NjU2NAogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3LTQ2CiAgICAvLyBjbGFzcyBEZWxlZ2F0aW9uUmVnaXN0cnkoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweGUyODdiZTUwIC8vIG1ldGhvZCAidXBkYXRlX3JlZ2lzdHJ5KCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfcmVnaXN0cnlfcm91dGVANAoKbWFpbl9zd2l0Y2hfY2FzZV9uZXh0QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNy00NgogICAgLy8gY2xhc3MgRGVsZWdhdGlvblJlZ2lzdHJ5KAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMCwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9Y2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9Y2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMzQKICAgIHB1c2hieXRlc3MgMHg5NjY3ZDZkZSAweDNkOGU2ZmFmIDB4YjNiNTg0ODIgMHg4NmY3ZTBlNiAweDk4MzUyZTg2IDB4YTM5OWViMjcgMHhhYTU1YjJmNCAweGM4YjhiYzhlIDB4Nzk4ODUxZDMgMHg5ZDkyYTgxZiAweDNiNTRjMDFmIDB4OTJhOWM1MTIgMHhhZjNjNTNlOCAweDk0Y2M5ZTY2IDB4NWRjNzA0MDYgMHhkOWE5NDVkZCAweDA4MjQ0ZjA3IDB4YWI0NGM1MjUgMHg5NGY0OWUxMiAweDU0MjA1MjU5IDB4NWYwOGMxNDcgMHhiMTBhMWMwMCAweDEzMWEyZGQxIDB4Y2E2ODc3YjMgMHg1N2I3YTZkNyAweDEzZjYxN2FjIC8vIG1ldGhvZCAic2V0X21hbmFnZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJjb25maWdfZGVsZWdhdGlvbl9yZWdpc3RyeSgodWludDY0LHVpbnQ2NCksdWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ3aXRoZHJhd19iYWxhbmNlKCl2b2lkIiwgbWV0aG9kICJwYXVzZV9yZWdpc3RyeSgpdm9pZCIsIG1ldGhvZCAicmVzdW1lX3JlZ2lzdHJ5KCl2b2lkIiwgbWV0aG9kICJpbml0X2NvbnRyYWN0KGJ5dGVbNl0sdWludDY0KXZvaWQiLCBtZXRob2QgImxvYWRfY29udHJhY3QoYnl0ZVs2XSx1aW50NjQsYnl0ZVtdKXZvaWQiLCBtZXRob2QgImtleV9yZWdfcmVnaXN0cnkocGF5LCh1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzMyXSxieXRlWzMyXSxieXRlWzY0XSkpdm9pZCIsIG1ldGhvZCAidXBkYXRlX3ZvdGVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAidXBkYXRlX3JlcHJlc2VudGF0aXZlKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAicHJlcGFyZV92b3RlcihwYXkpdm9pZCIsIG1ldGhvZCAicmVnaXN0ZXJfdm90ZXIocGF5LGFkZHJlc3MsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiYWRkX3ZvdGVzKHBheSxhZGRyZXNzLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ0cmlnZ2VyX3ZvdGUoYWRkcmVzcyx1aW50NjQpdm9pZCIsIG1ldGhvZCAidHJpZ2dlcl92b3RlX3RvX2xlZGdlcihhZGRyZXNzLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJkZWxldGVfdHJpZ2dlcmVkX3BhZ2UodWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJvcGVuX3RyaWdnZXJfcmV3YXJkcyhwYXkpdm9pZCIsIG1ldGhvZCAiY2xhaW1fdHJpZ2dlcl9yZXdhcmRzKCl1aW50NjQiLCBtZXRob2QgImNsb3NlX3RyaWdnZXJfcmV3YXJkcygpdm9pZCIsIG1ldGhvZCAidW5yZWdpc3Rlcl92b3RlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJlZ2lzdGVyX3JlcHJlc2VudGF0aXZlKHBheSl1aW50NjQiLCBtZXRob2QgInVucmVnaXN0ZXJfcmVwcmVzZW50YXRpdmUoKXZvaWQiLCBtZXRob2QgImdldF92b3Rlcl9hcHBfaWQoYWRkcmVzcykodWludDY0LGJvb2wpIiwgbWV0aG9kICJnZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkKGFkZHJlc3MpKHVpbnQ2NCxib29sKSIsIG1ldGhvZCAiZ2V0X3ZvdGVyX2FwcF9pZHMoYWRkcmVzc1tdKSh1aW50NjQsYm9vbClbXSIsIG1ldGhvZCAiZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZHMoYWRkcmVzc1tdKSh1aW50NjQsYm9vbClbXSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHNldF9tYW5hZ2VyIGNvbmZpZ19kZWxlZ2F0aW9uX3JlZ2lzdHJ5IHdpdGhkcmF3X2JhbGFuY2UgcGF1c2VfcmVnaXN0cnkgcmVzdW1lX3JlZ2lzdHJ5IGluaXRfY29udHJhY3QgbG9hZF9jb250cmFjdCBrZXlfcmVnX3JlZ2lzdHJ5IHVwZGF0ZV92b3RlciB1cGRhdGVfcmVwcmVzZW50YXRpdmUgcHJlcGFyZV92b3RlciByZWdpc3Rlcl92b3RlciBhZGRfdm90ZXMgdHJpZ2dlcl92b3RlIHRyaWdnZXJfdm90ZV90b19sZWRnZXIgZGVsZXRlX3RyaWdnZXJlZF9wYWdlIG9wZW5fdHJpZ2dlcl9yZXdhcmRzIGNsYWltX3RyaWdnZXJfcmV3YXJkcyBjbG9zZV90cmlnZ2VyX3Jld2FyZHMgdW5yZWdpc3Rlcl92b3RlciByZWdpc3Rlcl9yZXByZXNlbnRhdGl2ZSB1bnJlZ2lzdGVyX3JlcHJlc2VudGF0aXZlIGdldF92b3Rlcl9hcHBfaWQgZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZCBnZXRfdm90ZXJfYXBwX2lkcyBnZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkcwogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDM0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzctNDYKICAgIC8vIGNsYXNzIERlbGVnYXRpb25SZWdpc3RyeSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTAsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgcHVzaGJ5dGVzIDB4MjQwZDJmNjcgLy8gbWV0aG9kICJjcmVhdGUodWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKbWFpbl91cGRhdGVfcmVnaXN0cnlfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgVXBkYXRlQXBwbGljYXRpb24gJiYgY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYiB1cGRhdGVfcmVnaXN0cnkKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAzLTEwNgogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLSBNYW5hZ2VtZW50ICAtLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTgKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICBieXRlY18wIC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE5CiAgICAvLyBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlID0gQXBwbGljYXRpb24oeGdvdl9yZWdpc3RyeV9pZC5hc191aW50NjQoKSkKICAgIGJ0b2kKICAgIGJ5dGVjXzMgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIwCiAgICAvLyBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSA9IFVJbnQ2NCgxKQogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTg2CiAgICAvLyByZXR1cm4gVGVtcGxhdGVWYXJbQnl0ZXNdKCJlbnRyb3B5IikgICMgdHJpY2sgdG8gYWxsb3cgZnJlc2ggZGVwbG95bWVudAogICAgYnl0ZWMgMjUgLy8gVE1QTF9lbnRyb3B5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjEKICAgIC8vIGFzc2VydCBzZWxmLmVudHJvcHkoKSA9PSBUZW1wbGF0ZVZhcltCeXRlc10oImVudHJvcHkiKQogICAgZHVwCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAzLTEwNgogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLSBNYW5hZ2VtZW50ICAtLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuc2V0X21hbmFnZXJbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfbWFuYWdlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTM3CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTM4CiAgICAvLyBwcmV2aW91c19tYW5hZ2VyID0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFuYWdlcl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTM5CiAgICAvLyBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZSA9IG1hbmFnZXIKICAgIGJ5dGVjXzAgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIGRpZyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTQxCiAgICAvLyBhcmM0LmVtaXQoZXYuUmVnaXN0cnlNYW5hZ2VyU2V0KHByZXZpb3VzX21hbmFnZXIsIG1hbmFnZXIpKQogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgzMjI1M2U4MyAvLyBtZXRob2QgIlJlZ2lzdHJ5TWFuYWdlclNldChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuY29uZmlnX2RlbGVnYXRpb25fcmVnaXN0cnlbcm91dGluZ10oKSAtPiB2b2lkOgpjb25maWdfZGVsZWdhdGlvbl9yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5GZWVzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNjYKICAgIC8vIHNlbGYudm90ZV9mZWVzLnZhbHVlID0gdm90ZV9mZWVzLmNvcHkoKQogICAgYnl0ZWMgMTAgLy8gMHg3NjZmNzQ2NTVmNjY2NTY1NzMKICAgIGRpZyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTY3CiAgICAvLyBzZWxmLnJlcHJlc2VudGF0aXZlX2ZlZS52YWx1ZSA9IHJlcHJlc2VudGF0aXZlX2ZlZS5hc191aW50NjQoKQogICAgZGlnIDEKICAgIGJ0b2kKICAgIGJ5dGVjIDE2IC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjY2NTY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTY4CiAgICAvLyBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSA9IHZvdGVfdHJpZ2dlcl9hd2FyZC5hc191aW50NjQoKQogICAgZHVwCiAgICBidG9pCiAgICBieXRlYyA1IC8vIDB4NzY2Zjc0NjU1Zjc0NzI2OTY3Njc2NTcyNWY2MTc3NjE3MjY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTcwLTE3MQogICAgLy8gIyBSZWNhbGN1bGF0ZSBuZWVkZWQgdHJpZ2dlciBmdW5kCiAgICAvLyBzZWxmLnVwZGF0ZV90cmlnZ2VyX2Z1bmQoKQogICAgY2FsbHN1YiB1cGRhdGVfdHJpZ2dlcl9mdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNzUKICAgIC8vIHNlbGYudHJpZ2dlcl9mdW5kLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDc0NzI2OTY3Njc2NTcyNWY2Njc1NmU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyaWdnZXJfZnVuZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NgogICAgLy8gPD0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NwogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3Ni0xNzcKICAgIC8vIDw9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNzUtMTc3CiAgICAvLyBzZWxmLnRyaWdnZXJfZnVuZC52YWx1ZQogICAgLy8gPD0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICAvLyAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxNzMtMTc4CiAgICAvLyAjIFZhbGlkYXRlIGNvbmZpZwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnRyaWdnZXJfZnVuZC52YWx1ZQogICAgLy8gICAgIDw9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gICAgIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLy8gKSwgZXJyLlRSSUdHRVJfRlVORF9JTlNVRkZJQ0lFTlQKICAgIGFzc2VydCAvLyBUcmlnZ2VyIGZ1bmQgaXMgaW5zdWZmaWNpZW50LiBGdW5kIHRoZSBSZWdpc3RyeSBvciByZWR1Y2UgYXdhcmQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxODEKICAgIC8vIHNlbGYudm90ZV9mZWVzLnZhbHVlLnhnb3YgPD0gc2VsZi52b3RlX2ZlZXMudmFsdWUub3RoZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDc2NmY3NDY1NWY2NjY1NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfZmVlcyBleGlzdHMKICAgIGR1cAogICAgZXh0cmFjdCAwIDgKICAgIHN3YXAKICAgIGV4dHJhY3QgOCA4CiAgICBkaWcgMQogICAgYj49CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxODAtMTgyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYudm90ZV9mZWVzLnZhbHVlLnhnb3YgPD0gc2VsZi52b3RlX2ZlZXMudmFsdWUub3RoZXIKICAgIC8vICksIGVyci5JTkNPTlNJU1RFTlRfVk9URV9GRUVTCiAgICBhc3NlcnQgLy8geEdvdiB2b3RlIGZlZXMgbXVzdCBub3QgYmUgbGFyZ2VyIHRoYW4gZm9yIG90aGVycwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTg1CiAgICAvLyBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSA8PSBzZWxmLnZvdGVfZmVlcy52YWx1ZS54Z292CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDc2NmY3NDY1NWY3NDcyNjk2NzY3NjU3MjVmNjE3NzYxNzI2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZCBleGlzdHMKICAgIGl0b2IKICAgIGI+PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTg0LTE4NgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSA8PSBzZWxmLnZvdGVfZmVlcy52YWx1ZS54Z292CiAgICAvLyApLCBlcnIuSU5DT05TSVNURU5UX1RSSUdHRVJfQVdBUkQKICAgIGFzc2VydCAvLyBUcmlnZ2VyIHJld2FyZCBtdXN0IG5vdCBiZSBsYXJnZXIgdGhhbiBtaW5pbXVtIHZvdGUgZmVlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTg5LTE5MQogICAgLy8gZXYuUmVnaXN0cnlDb25maWd1cmVkKAogICAgLy8gICAgIHZvdGVfZmVlcy5jb3B5KCksIHJlcHJlc2VudGF0aXZlX2ZlZSwgdm90ZV90cmlnZ2VyX2F3YXJkCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTg4LTE5MgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlJlZ2lzdHJ5Q29uZmlndXJlZCgKICAgIC8vICAgICAgICAgdm90ZV9mZWVzLmNvcHkoKSwgcmVwcmVzZW50YXRpdmVfZmVlLCB2b3RlX3RyaWdnZXJfYXdhcmQKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4YWUwYjk0NSAvLyBtZXRob2QgIlJlZ2lzdHJ5Q29uZmlndXJlZCgodWludDY0LHVpbnQ2NCksdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS53aXRoZHJhd19iYWxhbmNlW3JvdXRpbmddKCkgLT4gdm9pZDoKd2l0aGRyYXdfYmFsYW5jZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMAogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMQogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMC0yMTEKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyMTIKICAgIC8vIC0gc2VsZi50cmlnZ2VyX2Z1bmQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjY2NzU2ZTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJpZ2dlcl9mdW5kIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjEwLTIxMgogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICAvLyAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIC8vIC0gc2VsZi50cmlnZ2VyX2Z1bmQudmFsdWUKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNQogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsIGVyci5JTlNVRkZJQ0lFTlRfRlVORFMKICAgIGR1cAogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBmdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjE2LTIxOQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlLm5hdGl2ZSwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjE3CiAgICAvLyByZWNlaXZlcj1zZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZS5uYXRpdmUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hbmFnZXJfYWRkcmVzcyBleGlzdHMKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyMTYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjE2LTIxOQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlLm5hdGl2ZSwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMQogICAgLy8gYXJjNC5lbWl0KGV2LkJhbGFuY2VXaXRoZHJhd24oc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUsIGFyYzQuVUludDY0KGFtb3VudCkpKQogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgxMzZlMjY1YyAvLyBtZXRob2QgIkJhbGFuY2VXaXRoZHJhd24oYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucGF1c2VfcmVnaXN0cnlbcm91dGluZ10oKSAtPiB2b2lkOgpwYXVzZV9yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNQogICAgLy8gc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjM5CiAgICAvLyBtYW5hZ2VyX2FkZHJlc3M9c2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hbmFnZXJfYWRkcmVzcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MAogICAgLy8gcGF1c2VkPWFyYzQuQm9vbChib29sKHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlKSksCiAgICBwdXNoYnl0ZXMgMHg4MAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjM4LTI0MQogICAgLy8gZXYuUmVnaXN0cnlQYXVzZVNldCgKICAgIC8vICAgICBtYW5hZ2VyX2FkZHJlc3M9c2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUsCiAgICAvLyAgICAgcGF1c2VkPWFyYzQuQm9vbChib29sKHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlKSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNy0yNDIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5SZWdpc3RyeVBhdXNlU2V0KAogICAgLy8gICAgICAgICBtYW5hZ2VyX2FkZHJlc3M9c2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUsCiAgICAvLyAgICAgICAgIHBhdXNlZD1hcmM0LkJvb2woYm9vbChzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSkpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ5dGVjIDE5IC8vIG1ldGhvZCAiUmVnaXN0cnlQYXVzZVNldChhZGRyZXNzLGJvb2wpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucmVzdW1lX3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVzdW1lX3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjU1CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjU2CiAgICAvLyBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyNjAKICAgIC8vIG1hbmFnZXJfYWRkcmVzcz1zZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFuYWdlcl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjYxCiAgICAvLyBwYXVzZWQ9YXJjNC5Cb29sKGJvb2woc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUpKSwKICAgIGJ5dGVjIDkgLy8gMHgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjU5LTI2MgogICAgLy8gZXYuUmVnaXN0cnlQYXVzZVNldCgKICAgIC8vICAgICBtYW5hZ2VyX2FkZHJlc3M9c2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUsCiAgICAvLyAgICAgcGF1c2VkPWFyYzQuQm9vbChib29sKHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlKSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1OC0yNjMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5SZWdpc3RyeVBhdXNlU2V0KAogICAgLy8gICAgICAgICBtYW5hZ2VyX2FkZHJlc3M9c2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUsCiAgICAvLyAgICAgICAgIHBhdXNlZD1hcmM0LkJvb2woYm9vbChzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSkpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ5dGVjIDE5IC8vIG1ldGhvZCAiUmVnaXN0cnlQYXVzZVNldChhZGRyZXNzLGJvb2wpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuaW5pdF9jb250cmFjdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmluaXRfY29udHJhY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyNjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGludCA2IC8vIDYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDY+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyODQKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyODcKICAgIC8vIGNvbnRlbnRzLCBleGlzdHMgPSBib3gubWF5YmUoKQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyODgKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGluaXRfY29udHJhY3RfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4OQogICAgLy8gYm94LnJlc2l6ZShzaXplLmFzX3VpbnQ2NCgpKQogICAgZHVwCiAgICBidG9pCiAgICBkaWcgMgogICAgc3dhcAogICAgYm94X3Jlc2l6ZQoKaW5pdF9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyOTQKICAgIC8vIGFyYzQuZW1pdChldi5Db250cmFjdEluaXRpYWxpemVkKGNvbnRyYWN0LmNvcHkoKSwgc2l6ZSkpCiAgICBkdXAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDdlYzVjMzY3IC8vIG1ldGhvZCAiQ29udHJhY3RJbml0aWFsaXplZChieXRlWzZdLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MjY3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKaW5pdF9jb250cmFjdF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MS0yOTIKICAgIC8vICMgSW5pdGlhbGl6ZSB0aGUgYXBwcm92YWwgcHJvZ3JhbQogICAgLy8gYm94LmNyZWF0ZShzaXplPXNpemUuYXNfdWludDY0KCkpCiAgICBkdXAKICAgIGJ0b2kKICAgIGRpZyAyCiAgICBzd2FwCiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIGIgaW5pdF9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDQKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkubG9hZF9jb250cmFjdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmxvYWRfY29udHJhY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToyOTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA2IC8vIDYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDY+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzE3CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzIxLTMyMgogICAgLy8gIyBMb2FkIHRoZSBhcHByb3ZhbCBwcm9ncmFtCiAgICAvLyBib3gucmVwbGFjZShzdGFydF9pbmRleD1vZmZzZXQuYXNfdWludDY0KCksIHZhbHVlPWRhdGEpCiAgICBkaWcgMQogICAgYnRvaQogICAgZGlnIDMKICAgIHN3YXAKICAgIGRpZyAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzI0CiAgICAvLyBhcmM0LmVtaXQoZXYuQ29udHJhY3RMb2FkZWQoY29udHJhY3QuY29weSgpLCBvZmZzZXQsIGFyYzQuVUludDY0KGRhdGEubGVuZ3RoKSkpCiAgICBsZW4KICAgIGl0b2IKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg2ZGUzM2Q2OSAvLyBtZXRob2QgIkNvbnRyYWN0TG9hZGVkKGJ5dGVbNl0sdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Mjk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5rZXlfcmVnX3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKa2V5X3JlZ19yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMTUyIC8vIDE1MgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuS2V5UmVnVHhuSW5mbwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzQ1CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzQ5CiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGRpZyAxCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNDctMzUwCiAgICAvLyAjIENoZWNrIGlmIHBheW1lbnQgZm9yIGNvdmVyaW5nIHRoZSBrZXkgcmVnIGZlZSB3YXMgbWFkZSB0byB0aGlzIGNvbnRyYWN0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1MQogICAgLy8ga2V5X3JlZ190eG5fZmVlID0gcGF5bWVudC5hbW91bnQKICAgIHN3YXAKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzUzLTM2MgogICAgLy8gIyBJc3N1ZSB0aGUga2V5IHJlZ2lzdHJhdGlvbiB0cmFuc2FjdGlvbgogICAgLy8gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICAvLyAgICAgdm90ZV9rZXk9a2V5X3JlZ19pbmZvLnZvdGVfcGsuYnl0ZXMsCiAgICAvLyAgICAgc2VsZWN0aW9uX2tleT1rZXlfcmVnX2luZm8uc2VsZWN0aW9uX3BrLmJ5dGVzLAogICAgLy8gICAgIHZvdGVfZmlyc3Q9a2V5X3JlZ19pbmZvLnZvdGVfZmlyc3QuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZV9sYXN0PWtleV9yZWdfaW5mby52b3RlX2xhc3QuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZV9rZXlfZGlsdXRpb249a2V5X3JlZ19pbmZvLnZvdGVfa2V5X2RpbHV0aW9uLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIHN0YXRlX3Byb29mX2tleT1rZXlfcmVnX2luZm8uc3RhdGVfcHJvb2ZfcGsuYnl0ZXMsCiAgICAvLyAgICAgZmVlPWtleV9yZWdfdHhuX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1NQogICAgLy8gdm90ZV9rZXk9a2V5X3JlZ19pbmZvLnZvdGVfcGsuYnl0ZXMsCiAgICBkaWcgMQogICAgZXh0cmFjdCAyNCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzU2CiAgICAvLyBzZWxlY3Rpb25fa2V5PWtleV9yZWdfaW5mby5zZWxlY3Rpb25fcGsuYnl0ZXMsCiAgICBkaWcgMgogICAgZXh0cmFjdCA1NiAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzU3CiAgICAvLyB2b3RlX2ZpcnN0PWtleV9yZWdfaW5mby52b3RlX2ZpcnN0LmFzX3VpbnQ2NCgpLAogICAgZGlnIDMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzU4CiAgICAvLyB2b3RlX2xhc3Q9a2V5X3JlZ19pbmZvLnZvdGVfbGFzdC5hc191aW50NjQoKSwKICAgIGRpZyA0CiAgICBpbnRjXzMgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1OQogICAgLy8gdm90ZV9rZXlfZGlsdXRpb249a2V5X3JlZ19pbmZvLnZvdGVfa2V5X2RpbHV0aW9uLmFzX3VpbnQ2NCgpLAogICAgZGlnIDUKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNjAKICAgIC8vIHN0YXRlX3Byb29mX2tleT1rZXlfcmVnX2luZm8uc3RhdGVfcHJvb2ZfcGsuYnl0ZXMsCiAgICBkaWcgNgogICAgZXh0cmFjdCA4OCA2NAogICAgaXR4bl9maWVsZCBTdGF0ZVByb29mUEsKICAgIGl0eG5fZmllbGQgVm90ZUtleURpbHV0aW9uCiAgICBpdHhuX2ZpZWxkIFZvdGVMYXN0CiAgICBpdHhuX2ZpZWxkIFZvdGVGaXJzdAogICAgaXR4bl9maWVsZCBTZWxlY3Rpb25QSwogICAgaXR4bl9maWVsZCBWb3RlUEsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1My0zNTQKICAgIC8vICMgSXNzdWUgdGhlIGtleSByZWdpc3RyYXRpb24gdHJhbnNhY3Rpb24KICAgIC8vIGl0eG4uS2V5UmVnaXN0cmF0aW9uKAogICAgcHVzaGludCAyIC8vIGtleXJlZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzUzLTM2MgogICAgLy8gIyBJc3N1ZSB0aGUga2V5IHJlZ2lzdHJhdGlvbiB0cmFuc2FjdGlvbgogICAgLy8gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICAvLyAgICAgdm90ZV9rZXk9a2V5X3JlZ19pbmZvLnZvdGVfcGsuYnl0ZXMsCiAgICAvLyAgICAgc2VsZWN0aW9uX2tleT1rZXlfcmVnX2luZm8uc2VsZWN0aW9uX3BrLmJ5dGVzLAogICAgLy8gICAgIHZvdGVfZmlyc3Q9a2V5X3JlZ19pbmZvLnZvdGVfZmlyc3QuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZV9sYXN0PWtleV9yZWdfaW5mby52b3RlX2xhc3QuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZV9rZXlfZGlsdXRpb249a2V5X3JlZ19pbmZvLnZvdGVfa2V5X2RpbHV0aW9uLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIHN0YXRlX3Byb29mX2tleT1rZXlfcmVnX2luZm8uc3RhdGVfcHJvb2ZfcGsuYnl0ZXMsCiAgICAvLyAgICAgZmVlPWtleV9yZWdfdHhuX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozNjQKICAgIC8vIGFyYzQuZW1pdChldi5LZXlSZWdpc3RlcmVkKGFyYzQuVUludDY0KGtleV9yZWdfdHhuX2ZlZSksIGtleV9yZWdfaW5mby5jb3B5KCkpKQogICAgaXRvYgogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgxYjE1MTg3MCAvLyBtZXRob2QgIktleVJlZ2lzdGVyZWQodWludDY0LCh1aW50NjQsdWludDY0LHVpbnQ2NCxieXRlWzMyXSxieXRlWzMyXSxieXRlWzY0XSkpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudXBkYXRlX3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Mzc3CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzgxCiAgICAvLyBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFuYWdlcl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MzgyCiAgICAvLyBhcmM0LlVJbnQ2NChHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4MC0zODMKICAgIC8vIGV2LlJlZ2lzdHJ5VXBkYXRlZCgKICAgIC8vICAgICBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3OS0zODQKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5SZWdpc3RyeVVwZGF0ZWQoCiAgICAvLyAgICAgICAgIHNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9pZC5pZCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4Mzk5NmVkYzIgLy8gbWV0aG9kICJSZWdpc3RyeVVwZGF0ZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS51cGRhdGVfdm90ZXJbcm91dGluZ10oKSAtPiB2b2lkOgp1cGRhdGVfdm90ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozODgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNQogICAgLy8gYXNzZXJ0IHhnb3ZfYWRkcmVzcyBpbiBzZWxmLnZvdGVyc19ib3gsIGVyci5OT1RfVk9URVIKICAgIGJ5dGVjIDYgLy8gMHg3NgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3QgVm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNwogICAgLy8gYm94ID0gQm94KEJ5dGVzLCBrZXk9Qnl0ZXMoY2ZnLkNPTlRSQUNUX1ZPVEVSX0JPWCkpCiAgICBieXRlYyAxMSAvLyAweDczNjM1Zjc2NmY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDA4LTQwOQogICAgLy8gIyBBc3N1bWUgcHJvZ3JhbSBzaXplIGlzIDwgY29uc3QuTUFYX1NUQUNLCiAgICAvLyBhcHByb3ZhbF9wcm9ncmFtID0gYm94LmV4dHJhY3QoMCwgYm94Lmxlbmd0aCkKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBCb3ggZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0MDcKICAgIC8vIGJveCA9IEJveChCeXRlcywga2V5PUJ5dGVzKGNmZy5DT05UUkFDVF9WT1RFUl9CT1gpKQogICAgYnl0ZWMgMTEgLy8gMHg3MzYzNWY3NjZmNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwOC00MDkKICAgIC8vICMgQXNzdW1lIHByb2dyYW0gc2l6ZSBpcyA8IGNvbnN0Lk1BWF9TVEFDSwogICAgLy8gYXBwcm92YWxfcHJvZ3JhbSA9IGJveC5leHRyYWN0KDAsIGJveC5sZW5ndGgpCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDExCiAgICAvLyB2b3Rlcl9hcHAgPSBzZWxmLnZvdGVyc19ib3hbeGdvdl9hZGRyZXNzXQogICAgc3dhcAogICAgYm94X2dldAogICAgcG9wCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0MTItNDE3CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLnVwZGF0ZSwKICAgIC8vICAgICBhcHBfaWQ9dm90ZXJfYXBwLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWxfcHJvZ3JhbSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDE2CiAgICAvLyBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgYnl0ZWMgMTIgLy8gMHgwYTgxMDE0MwogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbVBhZ2VzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDEyLTQxNwogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci51cGRhdGUsCiAgICAvLyAgICAgYXBwX2lkPXZvdGVyX2FwcCwKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPWFwcHJvdmFsX3Byb2dyYW0sCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIC8vICkKICAgIGJ5dGVjIDIwIC8vIG1ldGhvZCAidXBkYXRlKCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0MTgtNDIyCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLnN5bmNfeGdvdl9yZWdpc3RyeSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLmlkKSwKICAgIC8vICAgICBhcHBfaWQ9dm90ZXJfYXBwLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDIwCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLmlkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwIGV4aXN0cwogICAgaXRvYgogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDE4LTQyMgogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci5zeW5jX3hnb3ZfcmVnaXN0cnksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZS5pZCksCiAgICAvLyAgICAgYXBwX2lkPXZvdGVyX2FwcCwKICAgIC8vICkKICAgIGJ5dGVjIDIxIC8vIG1ldGhvZCAic3luY194Z292X3JlZ2lzdHJ5KHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDI0CiAgICAvLyBhcmM0LmVtaXQoZXYuVm90ZXJVcGRhdGVkKHhnb3ZfYWRkcmVzcywgYXJjNC5VSW50NjQodm90ZXJfYXBwLmlkKSkpCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGMwMjI5Y2ExIC8vIG1ldGhvZCAiVm90ZXJVcGRhdGVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTozODgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LnVwZGF0ZV9yZXByZXNlbnRhdGl2ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZV9yZXByZXNlbnRhdGl2ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDQzCiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDQ2CiAgICAvLyByZXByZXNlbnRhdGl2ZV9hZGRyZXNzIGluIHNlbGYucmVwcmVzZW50YXRpdmVzX2JveAogICAgYnl0ZWMgMTMgLy8gMHg3MgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0NS00NDcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfYWRkcmVzcyBpbiBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3gKICAgIC8vICksIGVyci5OT1RfUkVQUkVTRU5UQVRJVkUKICAgIGFzc2VydCAvLyBOb3QgYSByZXByZXNlbnRhdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDQ5CiAgICAvLyBib3ggPSBCb3goQnl0ZXMsIGtleT1CeXRlcyhjZmcuQ09OVFJBQ1RfUkVQUkVTRU5UQVRJVkVfQk9YKSkKICAgIGJ5dGVjIDE0IC8vIDB4NzM2MzVmNzI2NTcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NTAtNDUxCiAgICAvLyAjIEFzc3VtZSBwcm9ncmFtIHNpemUgaXMgPCBjb25zdC5NQVhfU1RBQ0sKICAgIC8vIGFwcHJvdmFsX3Byb2dyYW0gPSBib3guZXh0cmFjdCgwLCBib3gubGVuZ3RoKQogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIEJveCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0OQogICAgLy8gYm94ID0gQm94KEJ5dGVzLCBrZXk9Qnl0ZXMoY2ZnLkNPTlRSQUNUX1JFUFJFU0VOVEFUSVZFX0JPWCkpCiAgICBieXRlYyAxNCAvLyAweDczNjM1ZjcyNjU3MAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDUwLTQ1MQogICAgLy8gIyBBc3N1bWUgcHJvZ3JhbSBzaXplIGlzIDwgY29uc3QuTUFYX1NUQUNLCiAgICAvLyBhcHByb3ZhbF9wcm9ncmFtID0gYm94LmV4dHJhY3QoMCwgYm94Lmxlbmd0aCkKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NTMKICAgIC8vIHJlcHJlc2VudGF0aXZlX2FwcCA9IHNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV9hZGRyZXNzXQogICAgc3dhcAogICAgYm94X2dldAogICAgcG9wCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NTQtNDU5CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2NvbnRyYWN0LlJlcHJlc2VudGF0aXZlLnVwZGF0ZSwKICAgIC8vICAgICBhcHBfaWQ9cmVwcmVzZW50YXRpdmVfYXBwLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWxfcHJvZ3JhbSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDU4CiAgICAvLyBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgYnl0ZWMgMTIgLy8gMHgwYTgxMDE0MwogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbVBhZ2VzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDU0LTQ1OQogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9jb250cmFjdC5SZXByZXNlbnRhdGl2ZS51cGRhdGUsCiAgICAvLyAgICAgYXBwX2lkPXJlcHJlc2VudGF0aXZlX2FwcCwKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPWFwcHJvdmFsX3Byb2dyYW0sCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIC8vICkKICAgIGJ5dGVjIDIwIC8vIG1ldGhvZCAidXBkYXRlKCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NjAtNDY0CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2NvbnRyYWN0LlJlcHJlc2VudGF0aXZlLnN5bmNfeGdvdl9yZWdpc3RyeSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLmlkKSwKICAgIC8vICAgICBhcHBfaWQ9cmVwcmVzZW50YXRpdmVfYXBwLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDYyCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLmlkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwIGV4aXN0cwogICAgaXRvYgogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDYwLTQ2NAogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5zeW5jX3hnb3ZfcmVnaXN0cnksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZS5pZCksCiAgICAvLyAgICAgYXBwX2lkPXJlcHJlc2VudGF0aXZlX2FwcCwKICAgIC8vICkKICAgIGJ5dGVjIDIxIC8vIG1ldGhvZCAic3luY194Z292X3JlZ2lzdHJ5KHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDY4CiAgICAvLyByZXByZXNlbnRhdGl2ZV9hZGRyZXNzLCBhcmM0LlVJbnQ2NChyZXByZXNlbnRhdGl2ZV9hcHAuaWQpCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NjctNDY5CiAgICAvLyBldi5SZXByZXNlbnRhdGl2ZVVwZGF0ZWQoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfYWRkcmVzcywgYXJjNC5VSW50NjQocmVwcmVzZW50YXRpdmVfYXBwLmlkKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NjYtNDcwCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgZXYuUmVwcmVzZW50YXRpdmVVcGRhdGVkKAogICAgLy8gICAgICAgICByZXByZXNlbnRhdGl2ZV9hZGRyZXNzLCBhcmM0LlVJbnQ2NChyZXByZXNlbnRhdGl2ZV9hcHAuaWQpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ODMyMjcyYjMgLy8gbWV0aG9kICJSZXByZXNlbnRhdGl2ZVVwZGF0ZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucHJlcGFyZV92b3Rlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnByZXBhcmVfdm90ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NzQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5MAogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDkyLTQ5MwogICAgLy8gIyBDcmVhdGUgYSBuZXcgVm90ZXIgYXBwbGljYXRpb24KICAgIC8vIHByZXBhcmVkX3ZvdGVyID0gc2VsZi5jcmVhdGVfdm90ZXIoKQogICAgY2FsbHN1YiBjcmVhdGVfdm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NQogICAgLy8gbWJyX2FmdGVyID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo0OTYKICAgIC8vIG1icl9mZWUgPSBtYnJfYWZ0ZXIgLSBtYnJfYmVmb3JlCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwMAogICAgLy8gcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBkaWcgMgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NDk4LTUwMQogICAgLy8gIyBDaGVjayBwYXltZW50CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwMgogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IG1icl9mZWUgKyBHbG9iYWwubWluX2JhbGFuY2UsIGVyci5XUk9OR19QQVlNRU5UX0FNT1VOVAogICAgdW5jb3ZlciAyCiAgICBndHhucyBBbW91bnQKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICB1bmNvdmVyIDIKICAgICsKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGF5bWVudCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwNQogICAgLy8gZXYuVm90ZXJQcmVwYXJlZChhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuVUludDY0KHByZXBhcmVkX3ZvdGVyLmlkKSkKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTA0LTUwNgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlZvdGVyUHJlcGFyZWQoYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChwcmVwYXJlZF92b3Rlci5pZCkpCiAgICAvLyApCiAgICBieXRlYyAyMiAvLyBtZXRob2QgIlZvdGVyUHJlcGFyZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucmVnaXN0ZXJfdm90ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl92b3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMC01MTMKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0gICAgVm90ZXIgICAgLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgZHVwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MzkKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0MQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NDIKICAgIC8vIGFzc2VydCB4Z292X2FkZHJlc3Mgbm90IGluIHNlbGYudm90ZXJzX2JveCwgZXJyLkFMUkVBRFlfVk9URVIKICAgIGJ5dGVjIDYgLy8gMHg3NgogICAgZGlnIDQKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGEgVm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0NC01NDkKICAgIC8vICMgR2V0IHhnb3ZfYWRkcmVzcyBib3gKICAgIC8vIFt4Z292X2JveCwgZXhpc3RzXSwgdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveCwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NDgKICAgIC8vIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0NC01NDkKICAgIC8vICMgR2V0IHhnb3ZfYWRkcmVzcyBib3gKICAgIC8vIFt4Z292X2JveCwgZXhpc3RzXSwgdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveCwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyApCiAgICBieXRlYyAxOCAvLyBtZXRob2QgImdldF94Z292X2JveChhZGRyZXNzKSgoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCksYm9vbCkiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDQKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA1NyAvLyA1NwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC50dXBsZTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292Qm94VmFsdWUsYXJjNC5ib29sPgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIHN3YXAKICAgIGV4dHJhY3QgNCA1NgogICAgc3dhcAogICAgaW50YyA0IC8vIDQ0OAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NTAKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NTIKICAgIC8vIG1hbmFnZXJfYWRkcmVzcyA9IHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MwogICAgLy8gaXNfbWFuYWdlciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSA9PSBtYW5hZ2VyX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTU0CiAgICAvLyBpc194Z292ID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpID09IHhnb3ZfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZGlnIDcKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NTUKICAgIC8vIGFzc2VydCBpc194Z292IG9yIGlzX21hbmFnZXIsIGVyci5VTkFVVEhPUklaRUQKICAgIHx8CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NTctNTU4CiAgICAvLyAjIENyZWF0ZSBhIG5ldyBWb3RlciBhcHBsaWNhdGlvbgogICAgLy8gcHJlcGFyZWRfdm90ZXJfaWQgPSBzZWxmLmNyZWF0ZV92b3RlcigpLmlkCiAgICBjYWxsc3ViIGNyZWF0ZV92b3RlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTYzLTU2NgogICAgLy8geGdvdl9hZGRyZXNzX2J5dGVzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHZvdGVyX2FwcCwKICAgIC8vICAgICB2b3Rlcl9jZmcuR1NfS0VZX1hHT1ZfQUREUkVTUywKICAgIC8vICkKICAgIGRpZyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NjUKICAgIC8vIHZvdGVyX2NmZy5HU19LRVlfWEdPVl9BRERSRVNTLAogICAgcHVzaGJ5dGVzIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NjMtNTY2CiAgICAvLyB4Z292X2FkZHJlc3NfYnl0ZXMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgdm90ZXJfYXBwLAogICAgLy8gICAgIHZvdGVyX2NmZy5HU19LRVlfWEdPVl9BRERSRVNTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTY4CiAgICAvLyBhcmM0LkFkZHJlc3MoeGdvdl9hZGRyZXNzX2J5dGVzKSA9PSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NjctNTY5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyh4Z292X2FkZHJlc3NfYnl0ZXMpID09IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIC8vICksIGVyci5WT1RFUl9BU1NJR05FRAogICAgYXNzZXJ0IC8vIFZvdGVyIGlzIGFscmVhZHkgYXNzaWduZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MS01NzgKICAgIC8vICMgQXNzaWduIGF2YWlsYWJsZSBWb3RlciB0byB0aGUgeEdvdgogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci5hc3NpZ25feGdvdiwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG1hbmFnZXJfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9dm90ZXJfYXBwLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTc1CiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgNQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NzEtNTc4CiAgICAvLyAjIEFzc2lnbiBhdmFpbGFibGUgVm90ZXIgdG8gdGhlIHhHb3YKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIuYXNzaWduX3hnb3YsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBtYW5hZ2VyX2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPXZvdGVyX2FwcCwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGExNzllOTQwIC8vIG1ldGhvZCAiYXNzaWduX3hnb3YoYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3Mpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkaWcgNwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3OQogICAgLy8gc2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10gPSB2b3Rlcl9hcHAKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODEKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTgyCiAgICAvLyBtYnJfZmVlID0gbWJyX2FmdGVyIC0gbWJyX2JlZm9yZQogICAgdW5jb3ZlciAyCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODYKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDQKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4NC01ODcKICAgIC8vICMgQ2hlY2sgcGF5bWVudAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5XUk9OR19SRUNFSVZFUgogICAgYXNzZXJ0IC8vIFdyb25nIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODgKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBtYnJfZmVlICsgR2xvYmFsLm1pbl9iYWxhbmNlLCBlcnIuV1JPTkdfUEFZTUVOVF9BTU9VTlQKICAgIHVuY292ZXIgNAogICAgZ3R4bnMgQW1vdW50CiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgdW5jb3ZlciAyCiAgICArCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIHBheW1lbnQgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTEKICAgIC8vIGV2LlZvdGVyUHJlcGFyZWQoYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChwcmVwYXJlZF92b3Rlcl9pZCkpCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5MC01OTIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5Wb3RlclByZXBhcmVkKGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXJjNC5VSW50NjQocHJlcGFyZWRfdm90ZXJfaWQpKQogICAgLy8gKQogICAgYnl0ZWMgMjIgLy8gbWV0aG9kICJWb3RlclByZXBhcmVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTMKICAgIC8vIGFyYzQuZW1pdChldi5Wb3RlclJlZ2lzdGVyZWQoeGdvdl9hZGRyZXNzLCBhcmM0LlVJbnQ2NCh2b3Rlcl9hcHAuaWQpKSkKICAgIHN3YXAKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGI5MTQwMzcxIC8vIG1ldGhvZCAiVm90ZXJSZWdpc3RlcmVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1MTAtNTEzCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tICAgIFZvdGVyICAgIC0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5hZGRfdm90ZXNbcm91dGluZ10oKSAtPiB2b2lkOgphZGRfdm90ZXM6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NTk3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MjMKICAgIC8vIGFzc2VydCB4Z292X2FkZHJlc3MgaW4gc2VsZi52b3RlcnNfYm94LCBlcnIuTk9UX1ZPVEVSCiAgICBieXRlYyA2IC8vIDB4NzYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90IFZvdGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MjUKICAgIC8vIHZvdGVyX2FwcCA9IHNlbGYudm90ZXJzX2JveFt4Z292X2FkZHJlc3NdCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyNwogICAgLy8gc2VuZGVyID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyOAogICAgLy8gaWYgc2VuZGVyID09IHhnb3ZfYWRkcmVzczoKICAgID09CiAgICBieiBhZGRfdm90ZXNfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyOQogICAgLy8gdm90ZV9mZWUgPSBzZWxmLnZvdGVfZmVlcy52YWx1ZS54Z292LmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gMHg3NjZmNzQ2NTVmNjY2NTY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX2ZlZXMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ1cnkgNgoKYWRkX3ZvdGVzX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NTEtNjU1CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLmFkZF92b3RlcywKICAgIC8vICAgICBhZGRfdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXZvdGVyX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIHB1c2hieXRlcyAweDI5MjNmM2QxIC8vIG1ldGhvZCAiYWRkX3ZvdGVzKHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAyCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjU3CiAgICAvLyBzZWxmLnZvdGVzX2xlZnQudmFsdWUgKz0gYWRkX3ZvdGVzLmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXNfbGVmdCBleGlzdHMKICAgIGRpZyAxCiAgICBidG9pCiAgICBzd2FwCiAgICBkaWcgMQogICAgKwogICAgYnl0ZWMgNCAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjU4CiAgICAvLyBzZWxmLnVwZGF0ZV90cmlnZ2VyX2Z1bmQoKQogICAgY2FsbHN1YiB1cGRhdGVfdHJpZ2dlcl9mdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjAtNjYxCiAgICAvLyAjIENoZWNrIHBheW1lbnQKICAgIC8vIGZlZSA9IHZvdGVfZmVlICogYWRkX3ZvdGVzLmFzX3VpbnQ2NCgpCiAgICBkaWcgNwogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjYzCiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGRpZyA2CiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2Mi02NjQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjY1CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPT0gZmVlLCBlcnIuV1JPTkdfUEFZTUVOVF9BTU9VTlQKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGF5bWVudCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2NwogICAgLy8gYXJjNC5lbWl0KGV2LlZvdGVzUGFpZCh4Z292X2FkZHJlc3MsIGFkZF92b3RlcywgYXJjNC5VSW50NjQoZmVlKSkpCiAgICBpdG9iCiAgICBkaWcgNQogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MzAwODljNjMgLy8gbWV0aG9kICJWb3Rlc1BhaWQoYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgphZGRfdm90ZXNfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2MzEKICAgIC8vIHZvdGVfZmVlID0gc2VsZi52b3RlX2ZlZXMudmFsdWUub3RoZXIuYXNfdWludDY0KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDc2NmY3NDY1NWY2NjY1NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfZmVlcyBleGlzdHMKICAgIGludGNfMyAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjMzLTEyMzUKICAgIC8vIHN5bmNlZF90cywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVElOR19BRERSRVNTX1RTCiAgICAvLyApCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIzNAogICAgLy8gdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVElOR19BRERSRVNTX1RTCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2OTZlNjc1ZjYxNjQ2NDcyNjU3MzczNWY3NDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjMzLTEyMzUKICAgIC8vIHN5bmNlZF90cywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVElOR19BRERSRVNTX1RTCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBkdXAKICAgIGJ1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIzNgogICAgLy8gaWYgc3luY2VkX3RzIGFuZCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8IHN5bmNlZF90cyArIGNmZy5WT1RJTkdfQUREUkVTU19UVEw6CiAgICBieiBhZGRfdm90ZXNfYWZ0ZXJfaWZfZWxzZUAxNQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZGlnIDcKICAgIHB1c2hpbnQgMzAwIC8vIDMwMAogICAgKwogICAgPAogICAgYnogYWRkX3ZvdGVzX2FmdGVyX2lmX2Vsc2VAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzctMTIzOQogICAgLy8gdm90aW5nX2FkZHJlc3NfYnl0ZXMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVElOR19BRERSRVNTCiAgICAvLyApCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIzOAogICAgLy8gdm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX1ZPVElOR19BRERSRVNTCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2OTZlNjc1ZjYxNjQ2NDcyNjU3MzczCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjM3LTEyMzkKICAgIC8vIHZvdGluZ19hZGRyZXNzX2J5dGVzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHZvdGVyX2FwcCwgdm90ZXJfY2ZnLkdTX0tFWV9WT1RJTkdfQUREUkVTUwogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTI0MAogICAgLy8gdm90aW5nX2FkZHJlc3MgPSBhcmM0LkFkZHJlc3Modm90aW5nX2FkZHJlc3NfYnl0ZXMpCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjQxLTEyNDIKICAgIC8vICMgVGhlIHplcm8gYWRkcmVzcyBpcyBjYWNoZWQgZm9yIHhHb3ZzIG5vIGxvbmdlciBpbiB0aGUgeEdvdiBSZWdpc3RyeQogICAgLy8gcmV0dXJuIHZvdGluZ19hZGRyZXNzLCB2b3RpbmdfYWRkcmVzcyAhPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBkdXAKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGJ1cnkgOQogICAgYnVyeSA5CgphZGRfdm90ZXNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGluZ19hZGRyZXNzQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjM0CiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuTk9UX1hHT1YKICAgIGRpZyA3CiAgICBhc3NlcnQgLy8gTm90IGFuIHhHb3YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzNi02MzkKICAgIC8vIG1hbmFnZXJfYWRkcmVzc19ieXRlcywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICB2b3Rlcl9hcHAsCiAgICAvLyAgICAgdm90ZXJfY2ZnLkdTX0tFWV9NQU5BR0VSX0FERFJFU1MsCiAgICAvLyApCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjM4CiAgICAvLyB2b3Rlcl9jZmcuR1NfS0VZX01BTkFHRVJfQUREUkVTUywKICAgIGJ5dGVjXzAgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzNi02MzkKICAgIC8vIG1hbmFnZXJfYWRkcmVzc19ieXRlcywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICB2b3Rlcl9hcHAsCiAgICAvLyAgICAgdm90ZXJfY2ZnLkdTX0tFWV9NQU5BR0VSX0FERFJFU1MsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBkdXAKICAgIGJ1cnkgMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0MAogICAgLy8gbWFuYWdlcl9hZGRyZXNzID0gYXJjNC5BZGRyZXNzKG1hbmFnZXJfYWRkcmVzc19ieXRlcykKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NDIKICAgIC8vIGlmIHNlbmRlciAhPSB2b3RpbmdfYWRkcmVzcyBhbmQgc2VuZGVyICE9IG1hbmFnZXJfYWRkcmVzczoKICAgIGR1cAogICAgZGlnIDkKICAgICE9CiAgICBieiBhZGRfdm90ZXNfYWZ0ZXJfaWZfZWxzZUA2CiAgICBkdXAKICAgIGRpZyAxMAogICAgIT0KICAgIGJ6IGFkZF92b3Rlc19hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0My02NDQKICAgIC8vICMgVGhlIGNhY2hlZCB2b3RpbmcgYWRkcmVzcyBtYXkgcHJlZGF0ZSBpdHMgcm90YXRpb24sIGNoZWNrIHRoZSB4R292IGJveAogICAgLy8gdm90aW5nX2FkZHJlc3MsIGV4aXN0cyA9IHNlbGYucmVhZF92b3RpbmdfYWRkcmVzcyh4Z292X2FkZHJlc3MpCiAgICBkaWcgMwogICAgY2FsbHN1YiByZWFkX3ZvdGluZ19hZGRyZXNzCiAgICBzd2FwCiAgICBidXJ5IDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NDUKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CgphZGRfdm90ZXNfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjQ4CiAgICAvLyBzZW5kZXIgPT0gdm90aW5nX2FkZHJlc3Mgb3Igc2VuZGVyID09IG1hbmFnZXJfYWRkcmVzcwogICAgZHVwCiAgICBkaWcgOQogICAgPT0KICAgIGJueiBhZGRfdm90ZXNfYm9vbF90cnVlQDgKICAgIGR1cAogICAgZGlnIDEwCiAgICA9PQogICAgYnogYWRkX3ZvdGVzX2Jvb2xfZmFsc2VAOQoKYWRkX3ZvdGVzX2Jvb2xfdHJ1ZUA4OgogICAgaW50Y18xIC8vIDEKCmFkZF92b3Rlc19ib29sX21lcmdlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjQ3LTY0OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZW5kZXIgPT0gdm90aW5nX2FkZHJlc3Mgb3Igc2VuZGVyID09IG1hbmFnZXJfYWRkcmVzcwogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgYiBhZGRfdm90ZXNfYWZ0ZXJfaWZfZWxzZUAxMQoKYWRkX3ZvdGVzX2Jvb2xfZmFsc2VAOToKICAgIGludGNfMCAvLyAwCiAgICBiIGFkZF92b3Rlc19ib29sX21lcmdlQDEwCgphZGRfdm90ZXNfYWZ0ZXJfaWZfZWxzZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDQKICAgIC8vIHJldHVybiBzZWxmLnJlYWRfdm90aW5nX2FkZHJlc3MoeGdvdl9hZGRyZXNzKQogICAgZGlnIDMKICAgIGNhbGxzdWIgcmVhZF92b3RpbmdfYWRkcmVzcwogICAgYnVyeSA5CiAgICBidXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMwogICAgLy8gdm90aW5nX2FkZHJlc3MsIGV4aXN0cyA9IHNlbGYuZ2V0X3ZvdGluZ19hZGRyZXNzKHZvdGVyX2FwcCwgeGdvdl9hZGRyZXNzKQogICAgYiBhZGRfdm90ZXNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGluZ19hZGRyZXNzQDE2CgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LnRyaWdnZXJfdm90ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnRyaWdnZXJfdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Njk0CiAgICAvLyBpZiBHbG9iYWwuZ3JvdXBfc2l6ZSA+IDE6CiAgICBnbG9iYWwgR3JvdXBTaXplCiAgICBpbnRjXzEgLy8gMQogICAgPgogICAgYnogdHJpZ2dlcl92b3RlX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6Njk1LTY5NgogICAgLy8gIyBSZWplY3QgZHVwbGljYXRlIHRyaWdnZXJzIGJlZm9yZSBhbnkgaW5uZXIgY2FsbAogICAgLy8gc2VsZi5tYXJrX3RyaWdnZXJlZCh4Z292X2FkZHJlc3MsIHByb3Bvc2FsX2lkKQogICAgZHVwMgogICAgY2FsbHN1YiBtYXJrX3RyaWdnZXJlZAoKdHJpZ2dlcl92b3RlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5OAogICAgLy8gc2VsZi52b3RlX3JlcHJlc2VudGF0aXZlKHhnb3ZfYWRkcmVzcywgcHJvcG9zYWxfaWQpCiAgICBkdXAyCiAgICBjYWxsc3ViIHZvdGVfcmVwcmVzZW50YXRpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwMC03MDQKICAgIC8vICMgU2VuZCB0cmlnZ2VyIGF3YXJkIHRvIHNlbmRlcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PXNlbGYudm90ZV90cmlnZ2VyX2F3YXJkLnZhbHVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzAyCiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzAzCiAgICAvLyBhbW91bnQ9c2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDc2NmY3NDY1NWY3NDcyNjk2NzY3NjU3MjVmNjE3NzYxNzI2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZCBleGlzdHMKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MDAtNzAxCiAgICAvLyAjIFNlbmQgdHJpZ2dlciBhd2FyZCB0byBzZW5kZXIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzAwLTcwNAogICAgLy8gIyBTZW5kIHRyaWdnZXIgYXdhcmQgdG8gc2VuZGVyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9c2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NjcxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS50cmlnZ2VyX3ZvdGVfdG9fbGVkZ2VyW3JvdXRpbmddKCkgLT4gdm9pZDoKdHJpZ2dlcl92b3RlX3RvX2xlZGdlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzM0CiAgICAvLyBzZW5kZXIgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczNQogICAgLy8gYXNzZXJ0IHNlbmRlciBpbiBzZWxmLnRyaWdnZXJfcmV3YXJkc19ib3gsIGVyci5OT19UUklHR0VSX1JFV0FSRFMKICAgIGJ5dGVjIDE1IC8vIDB4NzQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gdHJpZ2dlciByZXdhcmRzIGxlZGdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzM3LTczOAogICAgLy8gIyBSZWplY3QgZHVwbGljYXRlIHRyaWdnZXJzIGJlZm9yZSBhbnkgaW5uZXIgY2FsbAogICAgLy8gc2VsZi5tYXJrX3RyaWdnZXJlZCh4Z292X2FkZHJlc3MsIHByb3Bvc2FsX2lkKQogICAgZGlnIDMKICAgIGRpZyAzCiAgICBjYWxsc3ViIG1hcmtfdHJpZ2dlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NDAKICAgIC8vIHNlbGYudm90ZV9yZXByZXNlbnRhdGl2ZSh4Z292X2FkZHJlc3MsIHByb3Bvc2FsX2lkKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgdm90ZV9yZXByZXNlbnRhdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzQyLTc0MwogICAgLy8gIyBDcmVkaXQgdHJpZ2dlciBhd2FyZCB0byB0aGUgbGVkZ2VyIG9mIHNlbmRlcgogICAgLy8gc2VsZi50cmlnZ2VyX3Jld2FyZHNfYm94W3NlbmRlcl0gKz0gc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJpZ2dlcl9yZXdhcmRzX2JveCBlbnRyeSBleGlzdHMKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vIDB4NzY2Zjc0NjU1Zjc0NzI2OTY3Njc2NTcyNWY2MTc3NjE3MjY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZV90cmlnZ2VyX2F3YXJkIGV4aXN0cwogICAgc3dhcAogICAgZGlnIDEKICAgICsKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzQ0CiAgICAvLyBzZWxmLnRyaWdnZXJfcmV3YXJkcy52YWx1ZSArPSBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg3NDcyNjk2NzY3NjU3MjVmNzI2NTc3NjE3MjY0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50cmlnZ2VyX3Jld2FyZHMgZXhpc3RzCiAgICArCiAgICBieXRlYyA3IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjcyNjU3NzYxNzI2NDczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzQ1CiAgICAvLyBzZWxmLnVwZGF0ZV90cmlnZ2VyX2Z1bmQoKQogICAgY2FsbHN1YiB1cGRhdGVfdHJpZ2dlcl9mdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NDkKICAgIC8vIHNlbmRlciwgYXJjNC5VSW50NjQoc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDc2NmY3NDY1NWY3NDcyNjk2NzY3NjU3MjVmNjE3NzYxNzI2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0OC03NTAKICAgIC8vIGV2LlRyaWdnZXJSZXdhcmRzQ3JlZGl0ZWQoCiAgICAvLyAgICAgc2VuZGVyLCBhcmM0LlVJbnQ2NChzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSkKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzQ3LTc1MQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlRyaWdnZXJSZXdhcmRzQ3JlZGl0ZWQoCiAgICAvLyAgICAgICAgIHNlbmRlciwgYXJjNC5VSW50NjQoc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQudmFsdWUpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4YmY2MjI1NmYgLy8gbWV0aG9kICJUcmlnZ2VyUmV3YXJkc0NyZWRpdGVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3MDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmRlbGV0ZV90cmlnZ2VyZWRfcGFnZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlbGV0ZV90cmlnZ2VyZWRfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc1NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzczCiAgICAvLyBib3ggPSBCb3goQnl0ZXMsIGtleT1zZWxmLmdldF90cmlnZ2VyZWRfcGFnZV9rZXkocHJvcG9zYWxfaWQsIHBhZ2UuYXNfdWludDY0KCkpKQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTI2OQogICAgLy8gcmV0dXJuIGNmZy5UUklHR0VSRURfTUFQX1BSRUZJWCArIHByb3Bvc2FsX2lkLmJ5dGVzICsgb3AuaXRvYihwYWdlKQogICAgcHVzaGJ5dGVzIDB4NjIKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzQKICAgIC8vIGFzc2VydCBib3gsIGVyci5OT19UUklHR0VSRURfUEFHRQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gdHJpZ2dlcmVkIGJpdG1hcCBwYWdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzYKICAgIC8vIHByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvdXRpbHMucHk6MTMKICAgIC8vIHByb3BfY2ZnLkdTX0tFWV9TVEFUVVMsCiAgICBwdXNoYnl0ZXMgMHg3Mzc0NjE3NDc1NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC91dGlscy5weToxMS0xNAogICAgLy8gc3RhdHVzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBwcm9wX2NmZy5HU19LRVlfU1RBVFVTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC91dGlscy5weToxNgogICAgLy8gcmV0dXJuIGV4aXN0cyBhbmQgc3RhdHVzID09IGVubS5TVEFUVVNfVk9USU5HCiAgICBieiBkZWxldGVfdHJpZ2dlcmVkX3BhZ2VfYm9vbF9mYWxzZUA0CiAgICBkdXAKICAgIHB1c2hpbnQgMjUgLy8gMjUKICAgID09CiAgICBieiBkZWxldGVfdHJpZ2dlcmVkX3BhZ2VfYm9vbF9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMQoKZGVsZXRlX3RyaWdnZXJlZF9wYWdlX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3NS03NzcKICAgIC8vIGFzc2VydCBub3QgdXRpbHNfcHJvcC5pc19wcm9wb3NhbF92b3RpbmcoCiAgICAvLyAgICAgcHJvcG9zYWxfaWQuYXNfdWludDY0KCkKICAgIC8vICksIGVyci5QUk9QT1NBTF9WT1RJTkcKICAgICEKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBpcyBpbiB2b3Rpbmcgc3RhZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3OQogICAgLy8gZGVsIGJveC52YWx1ZQogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzgxCiAgICAvLyBhcmM0LmVtaXQoZXYuVHJpZ2dlcmVkUGFnZURlbGV0ZWQocHJvcG9zYWxfaWQsIHBhZ2UpKQogICAgZGlnIDMKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGYwNWM1MjI3IC8vIG1ldGhvZCAiVHJpZ2dlcmVkUGFnZURlbGV0ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6NzU1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZGVsZXRlX3RyaWdnZXJlZF9wYWdlX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIGRlbGV0ZV90cmlnZ2VyZWRfcGFnZV9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkub3Blbl90cmlnZ2VyX3Jld2FyZHNbcm91dGluZ10oKSAtPiB2b2lkOgpvcGVuX3RyaWdnZXJfcmV3YXJkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODAzCiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDUKICAgIC8vIHNlbmRlciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODA2CiAgICAvLyBhc3NlcnQgc2VuZGVyIG5vdCBpbiBzZWxmLnRyaWdnZXJfcmV3YXJkc19ib3gsIGVyci5UUklHR0VSX1JFV0FSRFNfT1BFTkVECiAgICBieXRlYyAxNSAvLyAweDc0CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIFRyaWdnZXIgcmV3YXJkcyBsZWRnZXIgaXMgYWxyZWFkeSBvcGVuZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwNwogICAgLy8gc2VsZi50cmlnZ2VyX3Jld2FyZHNfYm94W3NlbmRlcl0gPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDkKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODEwCiAgICAvLyBtYnJfZmVlID0gbWJyX2FmdGVyIC0gbWJyX2JlZm9yZQogICAgdW5jb3ZlciAyCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MTQKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxMi04MTUKICAgIC8vICMgQ2hlY2sgcGF5bWVudAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5XUk9OR19SRUNFSVZFUgogICAgYXNzZXJ0IC8vIFdyb25nIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4MTYKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBtYnJfZmVlLCBlcnIuV1JPTkdfUEFZTUVOVF9BTU9VTlQKICAgIHVuY292ZXIgMgogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBwYXltZW50IGFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODE4CiAgICAvLyBhcmM0LmVtaXQoZXYuVHJpZ2dlclJld2FyZHNPcGVuZWQoc2VuZGVyLCBhcmM0LlVJbnQ2NChtYnJfZmVlKSkpCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDZlNjFjMmJmIC8vIG1ldGhvZCAiVHJpZ2dlclJld2FyZHNPcGVuZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuY2xhaW1fdHJpZ2dlcl9yZXdhcmRzW3JvdXRpbmddKCkgLT4gdm9pZDoKY2xhaW1fdHJpZ2dlcl9yZXdhcmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODM1CiAgICAvLyBzZW5kZXIgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzNgogICAgLy8gYXNzZXJ0IHNlbmRlciBpbiBzZWxmLnRyaWdnZXJfcmV3YXJkc19ib3gsIGVyci5OT19UUklHR0VSX1JFV0FSRFMKICAgIGJ5dGVjIDE1IC8vIDB4NzQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gdHJpZ2dlciByZXdhcmRzIGxlZGdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODM4CiAgICAvLyBhbW91bnQgPSBzZWxmLnRyaWdnZXJfcmV3YXJkc19ib3hbc2VuZGVyXQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzOQogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsIGVyci5JTlNVRkZJQ0lFTlRfRlVORFMKICAgIGR1cAogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBmdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODQwCiAgICAvLyBzZWxmLnRyaWdnZXJfcmV3YXJkc19ib3hbc2VuZGVyXSA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODQxCiAgICAvLyBzZWxmLnJlbGVhc2VfdHJpZ2dlcl9yZXdhcmRzKGFtb3VudCkKICAgIGR1cAogICAgY2FsbHN1YiByZWxlYXNlX3RyaWdnZXJfcmV3YXJkcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODQzLTg0NgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0NAogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODQzCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0My04NDYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODQ4CiAgICAvLyBhcmM0LmVtaXQoZXYuVHJpZ2dlclJld2FyZHNDbGFpbWVkKHNlbmRlciwgYXJjNC5VSW50NjQoYW1vdW50KSkpCiAgICBpdG9iCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhiZjQ2N2VkNyAvLyBtZXRob2QgIlRyaWdnZXJSZXdhcmRzQ2xhaW1lZChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODIyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5jbG9zZV90cmlnZ2VyX3Jld2FyZHNbcm91dGluZ10oKSAtPiB2b2lkOgpjbG9zZV90cmlnZ2VyX3Jld2FyZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NjIKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2NAogICAgLy8gc2VuZGVyID0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NjUKICAgIC8vIGFzc2VydCBzZW5kZXIgaW4gc2VsZi50cmlnZ2VyX3Jld2FyZHNfYm94LCBlcnIuTk9fVFJJR0dFUl9SRVdBUkRTCiAgICBieXRlYyAxNSAvLyAweDc0CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vIHRyaWdnZXIgcmV3YXJkcyBsZWRnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2NwogICAgLy8gcmV3YXJkcyA9IHNlbGYudHJpZ2dlcl9yZXdhcmRzX2JveFtzZW5kZXJdCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODY4CiAgICAvLyBkZWwgc2VsZi50cmlnZ2VyX3Jld2FyZHNfYm94W3NlbmRlcl0KICAgIHN3YXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODY5CiAgICAvLyBzZWxmLnJlbGVhc2VfdHJpZ2dlcl9yZXdhcmRzKHJld2FyZHMpCiAgICBkdXAKICAgIGNhbGxzdWIgcmVsZWFzZV90cmlnZ2VyX3Jld2FyZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3MQogICAgLy8gbWJyX2FmdGVyID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NzIKICAgIC8vIG1icl9mZWUgPSBtYnJfYmVmb3JlIC0gbWJyX2FmdGVyCiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3NC04NzcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1yZXdhcmRzICsgbWJyX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3NQogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3NgogICAgLy8gYW1vdW50PXJld2FyZHMgKyBtYnJfZmVlLAogICAgY292ZXIgMgogICAgKwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgc3dhcAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODc0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3NC04NzcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1yZXdhcmRzICsgbWJyX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4NzkKICAgIC8vIGFyYzQuZW1pdChldi5UcmlnZ2VyUmV3YXJkc0Nsb3NlZChzZW5kZXIsIGFyYzQuVUludDY0KHJld2FyZHMgKyBtYnJfZmVlKSkpCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGFhODZlZTUxIC8vIG1ldGhvZCAiVHJpZ2dlclJld2FyZHNDbG9zZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudW5yZWdpc3Rlcl92b3Rlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnVucmVnaXN0ZXJfdm90ZXI6CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6ODgzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo4OTkKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwMQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MDIKICAgIC8vIGFzc2VydCB4Z292X2FkZHJlc3MgaW4gc2VsZi52b3RlcnNfYm94LCBlcnIuTk9UX1ZPVEVSCiAgICBieXRlYyA2IC8vIDB4NzYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBOb3QgVm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwMwogICAgLy8gdm90ZXJfYXBwID0gc2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10KICAgIGJveF9nZXQKICAgIHBvcAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MDYKICAgIC8vIHZvdGVyX2FwcCwgdm90ZXJfY2ZnLkdTX0tFWV9NQU5BR0VSX0FERFJFU1MKICAgIGJ5dGVjXzAgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwNS05MDcKICAgIC8vIG1hbmFnZXJfYWRkcmVzc19ieXRlcywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICB2b3Rlcl9hcHAsIHZvdGVyX2NmZy5HU19LRVlfTUFOQUdFUl9BRERSRVNTCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MTAtOTE2CiAgICAvLyAjIEdldCB4Z292X2FkZHJlc3MgYm94LCBub3QgdGhlIGNhY2hlZCB2b3RpbmcgYWRkcmVzczogdGhlIHhHb3YgbWF5IGhhdmUgc2V0CiAgICAvLyAjIGl0IHRvIHRoZSBWb3RlciwgYW5kIGl0IG11c3QgYmUgeWllbGRlZCBiZWZvcmUgdGhlIFZvdGVyIGlzIGRlbGV0ZWQKICAgIC8vIFt4Z292X2JveCwgZXhpc3RzXSwgdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveCwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MTUKICAgIC8vIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxMC05MTYKICAgIC8vICMgR2V0IHhnb3ZfYWRkcmVzcyBib3gsIG5vdCB0aGUgY2FjaGVkIHZvdGluZyBhZGRyZXNzOiB0aGUgeEdvdiBtYXkgaGF2ZSBzZXQKICAgIC8vICMgaXQgdG8gdGhlIFZvdGVyLCBhbmQgaXQgbXVzdCBiZSB5aWVsZGVkIGJlZm9yZSB0aGUgVm90ZXIgaXMgZGVsZXRlZAogICAgLy8gW3hnb3ZfYm94LCBleGlzdHNdLCB0eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkuZ2V0X3hnb3ZfYm94LAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIC8vICkKICAgIGJ5dGVjIDE4IC8vIG1ldGhvZCAiZ2V0X3hnb3ZfYm94KGFkZHJlc3MpKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKSIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNTcgLy8gNTcKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudHVwbGU8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuWEdvdkJveFZhbHVlLGFyYzQuYm9vbD4KICAgIGRpZyAxCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBzd2FwCiAgICBleHRyYWN0IDQgNTYKICAgIHN3YXAKICAgIGludGMgNCAvLyA0NDgKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTE3LTkxOQogICAgLy8gIyBJZiB4R292IGhhcyB1bnN1YnNjcmliZWQgZnJvbSB0aGUgeEdvdiBwcm9ncmFtLCBhbnlvbmUgY2FuIHVucmVnaXN0ZXIgaXQgZnJvbSBEZWxlZ2F0aW9uUmVnaXN0cnkuCiAgICAvLyAjIE90aGVyd2lzZSwgb25seSB4Z292X2FkZHJlc3Mgb3IgbWFuYWdlcl9hZGRyZXNzIGNhbiB1bnJlZ2lzdGVyIGl0LgogICAgLy8gaWYgZXhpc3RzOgogICAgYnogdW5yZWdpc3Rlcl92b3Rlcl9hZnRlcl9pZl9lbHNlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MjEKICAgIC8vIFR4bi5zZW5kZXIgPT0geGdvdl9hZGRyZXNzIG9yIFR4bi5zZW5kZXIgPT0gbWFuYWdlcl9hZGRyZXNzCiAgICBkaWcgNQogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJueiB1bnJlZ2lzdGVyX3ZvdGVyX2Jvb2xfdHJ1ZUA1CiAgICBkaWcgMQogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJ6IHVucmVnaXN0ZXJfdm90ZXJfYm9vbF9mYWxzZUA2Cgp1bnJlZ2lzdGVyX3ZvdGVyX2Jvb2xfdHJ1ZUA1OgogICAgaW50Y18xIC8vIDEKCnVucmVnaXN0ZXJfdm90ZXJfYm9vbF9tZXJnZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTIwLTkyMgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHhnb3ZfYWRkcmVzcyBvciBUeG4uc2VuZGVyID09IG1hbmFnZXJfYWRkcmVzcwogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTI3CiAgICAvLyB4Z292X2JveC52b3RpbmdfYWRkcmVzcyA9PSBtYW5hZ2VyX2FkZHJlc3MKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCiAgICBkdXAKICAgIGJ1cnkgOAogICAgZGlnIDIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MjctOTI4CiAgICAvLyB4Z292X2JveC52b3RpbmdfYWRkcmVzcyA9PSBtYW5hZ2VyX2FkZHJlc3MKICAgIC8vIG9yIHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzID09IHhnb3ZfYWRkcmVzcwogICAgYm56IHVucmVnaXN0ZXJfdm90ZXJfYWZ0ZXJfaWZfZWxzZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTI4CiAgICAvLyBvciB4Z292X2JveC52b3RpbmdfYWRkcmVzcyA9PSB4Z292X2FkZHJlc3MKICAgIGRpZyA2CiAgICBkaWcgNgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkyNy05MjgKICAgIC8vIHhnb3ZfYm94LnZvdGluZ19hZGRyZXNzID09IG1hbmFnZXJfYWRkcmVzcwogICAgLy8gb3IgeGdvdl9ib3gudm90aW5nX2FkZHJlc3MgPT0geGdvdl9hZGRyZXNzCiAgICBibnogdW5yZWdpc3Rlcl92b3Rlcl9hZnRlcl9pZl9lbHNlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MzAtOTM0CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLnlpZWxkX3ZvdGluZ19yaWdodHMsCiAgICAvLyAgICAgbWFuYWdlcl9hZGRyZXNzLAogICAgLy8gICAgIGFwcF9pZD12b3Rlcl9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHhiYTYwZDg1NCAvLyBtZXRob2QgInlpZWxkX3ZvdGluZ19yaWdodHMoYWRkcmVzcyl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCnVucmVnaXN0ZXJfdm90ZXJfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkzNi05MzkKICAgIC8vICMgUmVkdWNlIHBhaWQgdm90ZXMKICAgIC8vIHZvdGVzX2xlZnQsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHZvdGVyX2FwcCwgdm90ZXJfY2ZnLkdTX0tFWV9WT1RFU19MRUZUCiAgICAvLyApCiAgICBkaWcgMgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5MzgKICAgIC8vIHZvdGVyX2FwcCwgdm90ZXJfY2ZnLkdTX0tFWV9WT1RFU19MRUZUCiAgICBieXRlYyA0IC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkzNi05MzkKICAgIC8vICMgUmVkdWNlIHBhaWQgdm90ZXMKICAgIC8vIHZvdGVzX2xlZnQsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHZvdGVyX2FwcCwgdm90ZXJfY2ZnLkdTX0tFWV9WT1RFU19MRUZUCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5NDAKICAgIC8vIHNlbGYudm90ZXNfbGVmdC52YWx1ZSAtPSB2b3Rlc19sZWZ0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXNfbGVmdCBleGlzdHMKICAgIHN3YXAKICAgIC0KICAgIGJ5dGVjIDQgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0MQogICAgLy8gc2VsZi51cGRhdGVfdHJpZ2dlcl9mdW5kKCkKICAgIGNhbGxzdWIgdXBkYXRlX3RyaWdnZXJfZnVuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTQzLTk0NgogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci5kZWxldGUsCiAgICAvLyAgICAgYXBwX2lkPXZvdGVyX2FwcCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGR1cAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBieXRlYyAyMyAvLyBtZXRob2QgImRlbGV0ZSgpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTQ4LTk0OQogICAgLy8gIyBEZWxldGUgVm90ZXIgYm94CiAgICAvLyBkZWwgc2VsZi52b3RlcnNfYm94W3hnb3ZfYWRkcmVzc10KICAgIGRpZyA0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1MQogICAgLy8gbWJyX2FmdGVyID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5NTIKICAgIC8vIG1icl9mZWUgPSBtYnJfYmVmb3JlIC0gbWJyX2FmdGVyCiAgICBkaWcgNgogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTU0LTk1NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXhnb3ZfYWRkcmVzcy5uYXRpdmUsCiAgICAvLyAgICAgYW1vdW50PW1icl9mZWUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZGlnIDYKICAgIGR1cAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTU0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1NC05NTcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj14Z292X2FkZHJlc3MubmF0aXZlLAogICAgLy8gICAgIGFtb3VudD1tYnJfZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1OQogICAgLy8gYXJjNC5lbWl0KGV2LlZvdGVyVW5yZWdpc3RlcmVkKHhnb3ZfYWRkcmVzcywgYXJjNC5VSW50NjQodm90ZXJfYXBwLmlkKSkpCiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDM4MzdmM2ZiIC8vIG1ldGhvZCAiVm90ZXJVbnJlZ2lzdGVyZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnVucmVnaXN0ZXJfdm90ZXJfYm9vbF9mYWxzZUA2OgogICAgaW50Y18wIC8vIDAKICAgIGIgdW5yZWdpc3Rlcl92b3Rlcl9ib29sX21lcmdlQDcKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucmVnaXN0ZXJfcmVwcmVzZW50YXRpdmVbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3Rlcl9yZXByZXNlbnRhdGl2ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2My05NjYKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tIFJlcHJlc2VudGF0aXZlIC0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4NgogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTg4CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5MAogICAgLy8gcmVwcmVzZW50YXRpdmVfYWRkcmVzcyA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTkyCiAgICAvLyByZXByZXNlbnRhdGl2ZV9hZGRyZXNzIG5vdCBpbiBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3gKICAgIGJ5dGVjIDEzIC8vIDB4NzIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5OTEtOTkzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3Mgbm90IGluIHNlbGYucmVwcmVzZW50YXRpdmVzX2JveAogICAgLy8gKSwgZXJyLkFMUkVBRFlfUkVQUkVTRU5UQVRJVkUKICAgIGFzc2VydCAvLyBBbHJlYWR5IGEgcmVwcmVzZW50YXRpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5NQogICAgLy8gYm94ID0gQm94KEJ5dGVzLCBrZXk9Qnl0ZXMoY2ZnLkNPTlRSQUNUX1JFUFJFU0VOVEFUSVZFX0JPWCkpCiAgICBieXRlYyAxNCAvLyAweDczNjM1ZjcyNjU3MAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTk2LTk5NwogICAgLy8gIyBBc3N1bWUgcHJvZ3JhbSBzaXplIGlzIDwgY29uc3QuTUFYX1NUQUNLCiAgICAvLyBhcHByb3ZhbF9wcm9ncmFtID0gYm94LmV4dHJhY3QoMCwgYm94Lmxlbmd0aCkKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBCb3ggZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5OTUKICAgIC8vIGJveCA9IEJveChCeXRlcywga2V5PUJ5dGVzKGNmZy5DT05UUkFDVF9SRVBSRVNFTlRBVElWRV9CT1gpKQogICAgYnl0ZWMgMTQgLy8gMHg3MzYzNWY3MjY1NzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5Ni05OTcKICAgIC8vICMgQXNzdW1lIHByb2dyYW0gc2l6ZSBpcyA8IGNvbnN0Lk1BWF9TVEFDSwogICAgLy8gYXBwcm92YWxfcHJvZ3JhbSA9IGJveC5leHRyYWN0KDAsIGJveC5sZW5ndGgpCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTk5LTEwMTAKICAgIC8vIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUuY3JlYXRlLAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZS5pZCksCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz1yZXByZXNlbnRhdGl2ZV9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGxvY2FsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICBsb2NhbF9udW1fYnl0ZXM9cmVwcmVzZW50YXRpdmVfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDAyCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLmlkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAwOQogICAgLy8gZXh0cmFfcHJvZ3JhbV9wYWdlcz1jb25zdC5NQVhfRVhUUkFfUEFHRVNfUEVSX0FQUCwKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBpdHhuX2ZpZWxkIEV4dHJhUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDA4CiAgICAvLyBsb2NhbF9udW1fYnl0ZXM9cmVwcmVzZW50YXRpdmVfY2ZnLkxPQ0FMX0JZVEVTLAogICAgcHVzaGludCA5IC8vIDkKICAgIGl0eG5fZmllbGQgTG9jYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDcKICAgIC8vIGxvY2FsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5MT0NBTF9VSU5UUywKICAgIHB1c2hpbnQgNyAvLyA3CiAgICBpdHhuX2ZpZWxkIExvY2FsTnVtVWludAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAwNgogICAgLy8gZ2xvYmFsX251bV9ieXRlcz1yZXByZXNlbnRhdGl2ZV9jZmcuR0xPQkFMX0JZVEVTLAogICAgaW50Y18yIC8vIDMyCiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bUJ5dGVTbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAwNQogICAgLy8gZ2xvYmFsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5HTE9CQUxfVUlOVFMsCiAgICBpbnRjXzIgLy8gMzIKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAwNAogICAgLy8gY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIGJ5dGVjIDEyIC8vIDB4MGE4MTAxNDMKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6OTk5LTEwMTAKICAgIC8vIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUuY3JlYXRlLAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZS5pZCksCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT1hcHByb3ZhbF9wcm9ncmFtLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29uc3QuTUlOX1BST0dSQU0sCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz1yZXByZXNlbnRhdGl2ZV9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGxvY2FsX251bV91aW50PXJlcHJlc2VudGF0aXZlX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICBsb2NhbF9udW1fYnl0ZXM9cmVwcmVzZW50YXRpdmVfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9Y29uc3QuTUFYX0VYVFJBX1BBR0VTX1BFUl9BUFAsCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhjMGI2NDM1MiAvLyBtZXRob2QgImNyZWF0ZShhZGRyZXNzLHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDEyLTEwMTYKICAgIC8vICMgRnVuZCB0aGUgY3JlYXRlZCBhcHAgd2l0aCBNQlIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj10eG4uY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAxNAogICAgLy8gcmVjZWl2ZXI9dHhuLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICBkdXAKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTUKICAgIC8vIGFtb3VudD1HbG9iYWwubWluX2JhbGFuY2UsCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTItMTAxMwogICAgLy8gIyBGdW5kIHRoZSBjcmVhdGVkIGFwcCB3aXRoIE1CUgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDEyLTEwMTYKICAgIC8vICMgRnVuZCB0aGUgY3JlYXRlZCBhcHAgd2l0aCBNQlIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj10eG4uY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMjAKICAgIC8vIHNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV9hZGRyZXNzXSA9IEFwcGxpY2F0aW9uKAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAyMC0xMDIyCiAgICAvLyBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3hbcmVwcmVzZW50YXRpdmVfYWRkcmVzc10gPSBBcHBsaWNhdGlvbigKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9pZAogICAgLy8gKQogICAgc3dhcAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMjQKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAyNQogICAgLy8gbWJyX2ZlZSA9IG1icl9hZnRlciAtIG1icl9iZWZvcmUKICAgIHVuY292ZXIgMwogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAyOQogICAgLy8gcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBkaWcgMwogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAyNy0xMDMwCiAgICAvLyAjIENoZWNrIHBheW1lbnQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAzMQogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09ICgKICAgIHVuY292ZXIgMwogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDMyCiAgICAvLyBtYnJfZmVlICsgc2VsZi5yZXByZXNlbnRhdGl2ZV9mZWUudmFsdWUgKyBHbG9iYWwubWluX2JhbGFuY2UKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcHJlc2VudGF0aXZlX2ZlZSBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMzEtMTAzMgogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09ICgKICAgIC8vICAgICBtYnJfZmVlICsgc2VsZi5yZXByZXNlbnRhdGl2ZV9mZWUudmFsdWUgKyBHbG9iYWwubWluX2JhbGFuY2UKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDMxLTEwMzMKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSAoCiAgICAvLyAgICAgbWJyX2ZlZSArIHNlbGYucmVwcmVzZW50YXRpdmVfZmVlLnZhbHVlICsgR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyApLCBlcnIuV1JPTkdfUEFZTUVOVF9BTU9VTlQKICAgIGFzc2VydCAvLyBXcm9uZyBwYXltZW50IGFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTAzNi0xMDM4CiAgICAvLyBldi5SZXByZXNlbnRhdGl2ZVJlZ2lzdGVyZWQoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfYWRkcmVzcywgYXJjNC5VSW50NjQocmVwcmVzZW50YXRpdmVfaWQpCiAgICAvLyApCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDM1LTEwMzkKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5SZXByZXNlbnRhdGl2ZVJlZ2lzdGVyZWQoCiAgICAvLyAgICAgICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MsIGFyYzQuVUludDY0KHJlcHJlc2VudGF0aXZlX2lkKQogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDM0NzY4YTM1IC8vIG1ldGhvZCAiUmVwcmVzZW50YXRpdmVSZWdpc3RlcmVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weTo5NjMtOTY2CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLSBSZXByZXNlbnRhdGl2ZSAtLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS51bnJlZ2lzdGVyX3JlcHJlc2VudGF0aXZlW3JvdXRpbmddKCkgLT4gdm9pZDoKdW5yZWdpc3Rlcl9yZXByZXNlbnRhdGl2ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTQKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTYKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTA1OAogICAgLy8gcmVwcmVzZW50YXRpdmUgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTkKICAgIC8vIGFzc2VydCByZXByZXNlbnRhdGl2ZSBpbiBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3gsIGVyci5OT1RfUkVQUkVTRU5UQVRJVkUKICAgIGJ5dGVjIDEzIC8vIDB4NzIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90IGEgcmVwcmVzZW50YXRpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNjEKICAgIC8vIHJlcHJlc2VudGF0aXZlX2FwcCA9IHNlbGYucmVwcmVzZW50YXRpdmVzX2JveFtyZXByZXNlbnRhdGl2ZV0KICAgIGR1cAogICAgYm94X2dldAogICAgcG9wCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDYyLTEwNjUKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZGVsZXRlLAogICAgLy8gICAgIGFwcF9pZD1yZXByZXNlbnRhdGl2ZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgIGl0eG5fZmllbGQgT25Db21wbGV0aW9uCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgYnl0ZWMgMjMgLy8gbWV0aG9kICJkZWxldGUoKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNjctMTA2OAogICAgLy8gIyBEZWxldGUgcmVwcmVzZW50YXRpdmUgYm94CiAgICAvLyBkZWwgc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94W3JlcHJlc2VudGF0aXZlXQogICAgc3dhcAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDcwCiAgICAvLyBtYnJfYWZ0ZXIgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNzEKICAgIC8vIG1icl9mZWUgPSBtYnJfYmVmb3JlIC0gbWJyX2FmdGVyCiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNzMtMTA3NgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlcHJlc2VudGF0aXZlLm5hdGl2ZSwKICAgIC8vICAgICBhbW91bnQ9bWJyX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTA3MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDczLTEwNzYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1yZXByZXNlbnRhdGl2ZS5uYXRpdmUsCiAgICAvLyAgICAgYW1vdW50PW1icl9mZWUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTA4MAogICAgLy8gcmVwcmVzZW50YXRpdmUsIGFyYzQuVUludDY0KHJlcHJlc2VudGF0aXZlX2FwcC5pZCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNzktMTA4MQogICAgLy8gZXYuUmVwcmVzZW50YXRpdmVVbnJlZ2lzdGVyZWQoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmUsIGFyYzQuVUludDY0KHJlcHJlc2VudGF0aXZlX2FwcC5pZCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTA3OC0xMDgyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgZXYuUmVwcmVzZW50YXRpdmVVbnJlZ2lzdGVyZWQoCiAgICAvLyAgICAgICAgIHJlcHJlc2VudGF0aXZlLCBhcmM0LlVJbnQ2NChyZXByZXNlbnRhdGl2ZV9hcHAuaWQpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4Mzk1MzlmZWEgLy8gbWV0aG9kICJSZXByZXNlbnRhdGl2ZVVucmVnaXN0ZXJlZChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTA0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGVyX2FwcF9pZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF92b3Rlcl9hcHBfaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMDg2LTEwODkKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tIEdldHRlciBtZXRob2RzIC0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBjYWxsc3ViIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5nZXRfdm90ZXJfYXBwX2lkCiAgICBzd2FwCiAgICBpdG9iCiAgICBieXRlYyA5IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTExMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIGNhbGxzdWIgc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWQKICAgIHN3YXAKICAgIGl0b2IKICAgIGJ5dGVjIDkgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGVyX2FwcF9pZHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdm90ZXJfYXBwX2lkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTUxCiAgICAvLyByZXN1bHRzID0gYXJjNC5EeW5hbWljQXJyYXlbdHlwLkFwcElkUmVzdWx0XSgpCiAgICBieXRlYyAyNCAvLyAweDAwMDAKICAgIGludGNfMCAvLyAwCgpnZXRfdm90ZXJfYXBwX2lkc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTUyCiAgICAvLyBmb3IgeGdvdl9hZGRyZXNzIGluIHhnb3ZfYWRkcmVzc2VzOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogZ2V0X3ZvdGVyX2FwcF9pZHNfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE1MwogICAgLy8gYXBwX2lkLCBleGlzdHMgPSBzZWxmLmdldF92b3Rlcl9hcHBfaWQoeGdvdl9hZGRyZXNzKQogICAgY2FsbHN1YiBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGVyX2FwcF9pZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE1NAogICAgLy8gcmVzdWx0cy5hcHBlbmQodHlwLkFwcElkUmVzdWx0KGFyYzQuVUludDY0KGFwcF9pZCksIGFyYzQuQm9vbChleGlzdHMpKSkKICAgIHN3YXAKICAgIGl0b2IKICAgIGJ5dGVjIDkgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0IC8vIG9uIGVycm9yOiBtYXggYXJyYXkgbGVuZ3RoIGV4Y2VlZGVkCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMAogICAgYnVyeSAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGdldF92b3Rlcl9hcHBfaWRzX2Zvcl9oZWFkZXJAMgoKZ2V0X3ZvdGVyX2FwcF9pZHNfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTM1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgZGlnIDIKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTU4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE3NAogICAgLy8gcmVzdWx0cyA9IGFyYzQuRHluYW1pY0FycmF5W3R5cC5BcHBJZFJlc3VsdF0oKQogICAgYnl0ZWMgMjQgLy8gMHgwMDAwCiAgICBpbnRjXzAgLy8gMAoKZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE3NQogICAgLy8gZm9yIHJlcHJlc2VudGF0aXZlX2FkZHJlc3MgaW4gcmVwcmVzZW50YXRpdmVfYWRkcmVzc2VzOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZHNfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE3NgogICAgLy8gYXBwX2lkLCBleGlzdHMgPSBzZWxmLmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWQocmVwcmVzZW50YXRpdmVfYWRkcmVzcykKICAgIGNhbGxzdWIgc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzcKICAgIC8vIHJlc3VsdHMuYXBwZW5kKHR5cC5BcHBJZFJlc3VsdChhcmM0LlVJbnQ2NChhcHBfaWQpLCBhcmM0LkJvb2woZXhpc3RzKSkpCiAgICBzd2FwCiAgICBpdG9iCiAgICBieXRlYyA5IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBkaWcgMwogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdCAvLyBvbiBlcnJvcjogbWF4IGFycmF5IGxlbmd0aCBleGNlZWRlZAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHJlcGxhY2UyIDAKICAgIGJ1cnkgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBnZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkc19mb3JfaGVhZGVyQDIKCmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWRzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE1OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5nZXRfdm90ZXJfYXBwX2lkKHhnb3ZfYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0OgpzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGVyX2FwcF9pZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwODYtMTA5MwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0gR2V0dGVyIG1ldGhvZHMgLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3ZvdGVyX2FwcF9pZCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHhnb3ZfYWRkcmVzczogYXJjNC5BZGRyZXNzLAogICAgLy8gKSAtPiB0dXBsZVtVSW50NjQsIGJvb2xdOgogICAgcHJvdG8gMSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTA0CiAgICAvLyBleGlzdHMgPSB4Z292X2FkZHJlc3MgaW4gc2VsZi52b3RlcnNfYm94CiAgICBieXRlYyA2IC8vIDB4NzYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDUKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5nZXRfdm90ZXJfYXBwX2lkX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTA2CiAgICAvLyB2YWwgPSBzZWxmLnZvdGVyc19ib3hbeGdvdl9hZGRyZXNzXS5pZAogICAgZnJhbWVfZGlnIDAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVyc19ib3ggZW50cnkgZXhpc3RzCiAgICBidG9pCgpzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGVyX2FwcF9pZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTEwCiAgICAvLyByZXR1cm4gdmFsLCBleGlzdHMKICAgIGZyYW1lX2RpZyAxCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgpzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3ZvdGVyX2FwcF9pZF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDgKICAgIC8vIHZhbCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGIgc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF92b3Rlcl9hcHBfaWRfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWQocmVwcmVzZW50YXRpdmVfYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0OgpzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTItMTExNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3JlcHJlc2VudGF0aXZlX2FwcF9pZCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3M6IGFyYzQuQWRkcmVzcywKICAgIC8vICkgLT4gdHVwbGVbVUludDY0LCBib29sXToKICAgIHByb3RvIDEgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTEyNwogICAgLy8gZXhpc3RzID0gcmVwcmVzZW50YXRpdmVfYWRkcmVzcyBpbiBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3gKICAgIGJ5dGVjIDEzIC8vIDB4NzIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMjgKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5nZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTI5CiAgICAvLyB2YWwgPSBzZWxmLnJlcHJlc2VudGF0aXZlc19ib3hbcmVwcmVzZW50YXRpdmVfYWRkcmVzc10uaWQKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXByZXNlbnRhdGl2ZXNfYm94IGVudHJ5IGV4aXN0cwogICAgYnRvaQoKc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTEzMwogICAgLy8gcmV0dXJuIHZhbCwgZXhpc3RzCiAgICBmcmFtZV9kaWcgMQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHJldHN1YgoKc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LmdldF9yZXByZXNlbnRhdGl2ZV9hcHBfaWRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTMxCiAgICAvLyB2YWwgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBiIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5nZXRfcmVwcmVzZW50YXRpdmVfYXBwX2lkX2FmdGVyX2lmX2Vsc2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kZWxlZ2F0aW9uX3JlZ2lzdHJ5LmNvbnRyYWN0LkRlbGVnYXRpb25SZWdpc3RyeS5pc19tYW5hZ2VyKCkgLT4gdWludDY0Ogppc19tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE5NAogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUubmF0aXZlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hbmFnZXJfYWRkcmVzcyBleGlzdHMKICAgID09CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkuY3JlYXRlX3ZvdGVyKCkgLT4gdWludDY0OgpjcmVhdGVfdm90ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTk4CiAgICAvLyBib3ggPSBCb3goQnl0ZXMsIGtleT1CeXRlcyhjZmcuQ09OVFJBQ1RfVk9URVJfQk9YKSkKICAgIGJ5dGVjIDExIC8vIDB4NzM2MzVmNzY2Zjc0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMTk5LTEyMDAKICAgIC8vICMgQXNzdW1lIHByb2dyYW0gc2l6ZSBpcyA8IGNvbnN0Lk1BWF9TVEFDSwogICAgLy8gYXBwcm92YWxfcHJvZ3JhbSA9IGJveC5leHRyYWN0KDAsIGJveC5sZW5ndGgpCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgQm94IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE5OAogICAgLy8gYm94ID0gQm94KEJ5dGVzLCBrZXk9Qnl0ZXMoY2ZnLkNPTlRSQUNUX1ZPVEVSX0JPWCkpCiAgICBieXRlYyAxMSAvLyAweDczNjM1Zjc2NmY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTE5OS0xMjAwCiAgICAvLyAjIEFzc3VtZSBwcm9ncmFtIHNpemUgaXMgPCBjb25zdC5NQVhfU1RBQ0sKICAgIC8vIGFwcHJvdmFsX3Byb2dyYW0gPSBib3guZXh0cmFjdCgwLCBib3gubGVuZ3RoKQogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDIKICAgIC8vIHNlbGYudm90ZXJzX2NyZWF0ZWQudmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE3IC8vIDB4NzY2Zjc0NjU3MjczNWY2MzcyNjU2MTc0NjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVyc19jcmVhdGVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDE3IC8vIDB4NzY2Zjc0NjU3MjczNWY2MzcyNjU2MTc0NjU2NAogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjAzLTEyMTQKICAgIC8vIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIuY3JlYXRlLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYudm90ZXJzX2NyZWF0ZWQudmFsdWUpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUuaWQpLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWxfcHJvZ3JhbSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgLy8gICAgIGdsb2JhbF9udW1fdWludD12b3Rlcl9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICBsb2NhbF9udW1fdWludD12b3Rlcl9jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgbG9jYWxfbnVtX2J5dGVzPXZvdGVyX2NmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICBleHRyYV9wcm9ncmFtX3BhZ2VzPWNvbnN0Lk1BWF9FWFRSQV9QQUdFU19QRVJfQVBQLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIwNQogICAgLy8gYXJjNC5VSW50NjQoc2VsZi52b3RlcnNfY3JlYXRlZC52YWx1ZSksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjA2CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLmlkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIxMwogICAgLy8gZXh0cmFfcHJvZ3JhbV9wYWdlcz1jb25zdC5NQVhfRVhUUkFfUEFHRVNfUEVSX0FQUCwKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBpdHhuX2ZpZWxkIEV4dHJhUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjEyCiAgICAvLyBsb2NhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkxPQ0FMX0JZVEVTLAogICAgaW50Y18zIC8vIDgKICAgIGl0eG5fZmllbGQgTG9jYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTEKICAgIC8vIGxvY2FsX251bV91aW50PXZvdGVyX2NmZy5MT0NBTF9VSU5UUywKICAgIGludGNfMyAvLyA4CiAgICBpdHhuX2ZpZWxkIExvY2FsTnVtVWludAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIxMAogICAgLy8gZ2xvYmFsX251bV9ieXRlcz12b3Rlcl9jZmcuR0xPQkFMX0JZVEVTLAogICAgaW50Y18yIC8vIDMyCiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bUJ5dGVTbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIwOQogICAgLy8gZ2xvYmFsX251bV91aW50PXZvdGVyX2NmZy5HTE9CQUxfVUlOVFMsCiAgICBpbnRjXzIgLy8gMzIKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIwOAogICAgLy8gY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb25zdC5NSU5fUFJPR1JBTSwKICAgIGJ5dGVjIDEyIC8vIDB4MGE4MTAxNDMKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjAzLTEyMTQKICAgIC8vIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgdm90ZXJfY29udHJhY3QuVm90ZXIuY3JlYXRlLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYudm90ZXJzX2NyZWF0ZWQudmFsdWUpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUuaWQpLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWxfcHJvZ3JhbSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbnN0Lk1JTl9QUk9HUkFNLAogICAgLy8gICAgIGdsb2JhbF9udW1fdWludD12b3Rlcl9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9dm90ZXJfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICBsb2NhbF9udW1fdWludD12b3Rlcl9jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgbG9jYWxfbnVtX2J5dGVzPXZvdGVyX2NmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICBleHRyYV9wcm9ncmFtX3BhZ2VzPWNvbnN0Lk1BWF9FWFRSQV9QQUdFU19QRVJfQVBQLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4OTQ3OWZmNjMgLy8gbWV0aG9kICJjcmVhdGUodWludDY0LHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTYtMTIyMAogICAgLy8gIyBGdW5kIHRoZSBjcmVhdGVkIGFwcCB3aXRoIE1CUgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXR4bi5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1HbG9iYWwubWluX2JhbGFuY2UsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjE4CiAgICAvLyByZWNlaXZlcj10eG4uY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIGR1cAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIxOQogICAgLy8gYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIxNi0xMjE3CiAgICAvLyAjIEZ1bmQgdGhlIGNyZWF0ZWQgYXBwIHdpdGggTUJSCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTYtMTIyMAogICAgLy8gIyBGdW5kIHRoZSBjcmVhdGVkIGFwcCB3aXRoIE1CUgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXR4bi5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1HbG9iYWwubWluX2JhbGFuY2UsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTIyMgogICAgLy8gcmV0dXJuIHR4bi5jcmVhdGVkX2FwcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LnJlYWRfdm90aW5nX2FkZHJlc3MoeGdvdl9hZGRyZXNzOiBieXRlcykgLT4gYnl0ZXMsIHVpbnQ2NDoKcmVhZF92b3RpbmdfYWRkcmVzczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDYtMTI0OQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWFkX3ZvdGluZ19hZGRyZXNzKAogICAgLy8gICAgIHNlbGYsIHhnb3ZfYWRkcmVzczogYXJjNC5BZGRyZXNzCiAgICAvLyApIC0+IHR1cGxlW2FyYzQuQWRkcmVzcywgYm9vbF06CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTEtMTI1NgogICAgLy8gIyBHZXQgeGdvdl9hZGRyZXNzIGJveAogICAgLy8gW3hnb3ZfYm94LCBleGlzdHNdLCB0eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkuZ2V0X3hnb3ZfYm94LAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTUKICAgIC8vIGFwcF9pZD1zZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTEtMTI1NgogICAgLy8gIyBHZXQgeGdvdl9hZGRyZXNzIGJveAogICAgLy8gW3hnb3ZfYm94LCBleGlzdHNdLCB0eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkuZ2V0X3hnb3ZfYm94LAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIC8vICkKICAgIGJ5dGVjIDE4IC8vIG1ldGhvZCAiZ2V0X3hnb3ZfYm94KGFkZHJlc3MpKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKSIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA1NyAvLyA1NwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC50dXBsZTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292Qm94VmFsdWUsYXJjNC5ib29sPgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIHN3YXAKICAgIGV4dHJhY3QgNCA1NgogICAgc3dhcAogICAgaW50YyA0IC8vIDQ0OAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjU3CiAgICAvLyByZXR1cm4geGdvdl9ib3gudm90aW5nX2FkZHJlc3MsIGV4aXN0cwogICAgc3dhcAogICAgZXh0cmFjdCAwIDMyCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkudXBkYXRlX3RyaWdnZXJfZnVuZCgpIC0+IHZvaWQ6CnVwZGF0ZV90cmlnZ2VyX2Z1bmQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjYzCiAgICAvLyBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSAqIHNlbGYudm90ZXNfbGVmdC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gMHg3NjZmNzQ2NTVmNzQ3MjY5Njc2NzY1NzI1ZjYxNzc2MTcyNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX3RyaWdnZXJfYXdhcmQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXNfbGVmdCBleGlzdHMKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNjQKICAgIC8vICsgc2VsZi50cmlnZ2VyX3Jld2FyZHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjcyNjU3NzYxNzI2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJpZ2dlcl9yZXdhcmRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTI2My0xMjY0CiAgICAvLyBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSAqIHNlbGYudm90ZXNfbGVmdC52YWx1ZQogICAgLy8gKyBzZWxmLnRyaWdnZXJfcmV3YXJkcy52YWx1ZQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTI2MS0xMjYyCiAgICAvLyAjIEF3YXJkcyBvZiB0aGUgcGFpZCB2b3RlcyBsZWZ0LCBhbmQgdGhlIHJld2FyZHMgY3JlZGl0ZWQgYnV0IG5vdCB5ZXQgY2xhaW1lZAogICAgLy8gc2VsZi50cmlnZ2VyX2Z1bmQudmFsdWUgPSAoCiAgICBieXRlYyA4IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjY2NzU2ZTY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjYxLTEyNjUKICAgIC8vICMgQXdhcmRzIG9mIHRoZSBwYWlkIHZvdGVzIGxlZnQsIGFuZCB0aGUgcmV3YXJkcyBjcmVkaXRlZCBidXQgbm90IHlldCBjbGFpbWVkCiAgICAvLyBzZWxmLnRyaWdnZXJfZnVuZC52YWx1ZSA9ICgKICAgIC8vICAgICBzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSAqIHNlbGYudm90ZXNfbGVmdC52YWx1ZQogICAgLy8gICAgICsgc2VsZi50cmlnZ2VyX3Jld2FyZHMudmFsdWUKICAgIC8vICkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkubWFya190cmlnZ2VyZWQoeGdvdl9hZGRyZXNzOiBieXRlcywgcHJvcG9zYWxfaWQ6IGJ5dGVzKSAtPiB2b2lkOgptYXJrX3RyaWdnZXJlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzEtMTI3NAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBtYXJrX3RyaWdnZXJlZCgKICAgIC8vICAgICBzZWxmLCB4Z292X2FkZHJlc3M6IGFyYzQuQWRkcmVzcywgcHJvcG9zYWxfaWQ6IGFyYzQuVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjgzCiAgICAvLyB2b3Rlcl9hcHAsIGV4aXN0cyA9IHNlbGYudm90ZXJzX2JveC5tYXliZSh4Z292X2FkZHJlc3MpCiAgICBieXRlYyA2IC8vIDB4NzYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjg0CiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuTk9UX1ZPVEVSCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gTm90IFZvdGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjg2CiAgICAvLyBpbmRleCwgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQodm90ZXJfYXBwLCB2b3Rlcl9jZmcuR1NfS0VZX0lOREVYKQogICAgcHVzaGJ5dGVzIDB4Njk2ZTY0NjU3OAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyODcKICAgIC8vIGlmIG5vdCBleGlzdHM6ICAjIFZvdGVycyBjcmVhdGVkIGJlZm9yZSBpbmRleGVzIGFyZSBub3QgdHJhY2tlZAogICAgYm56IG1hcmtfdHJpZ2dlcmVkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTI4OAogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCm1hcmtfdHJpZ2dlcmVkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOTMKICAgIC8vIHByb3Bvc2FsX2lkLCBpbmRleCAvLyBjZmcuVFJJR0dFUkVEX1BBR0VfQklUUwogICAgZnJhbWVfZGlnIDEKICAgIHB1c2hpbnQgODE5MiAvLyA4MTkyCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjY5CiAgICAvLyByZXR1cm4gY2ZnLlRSSUdHRVJFRF9NQVBfUFJFRklYICsgcHJvcG9zYWxfaWQuYnl0ZXMgKyBvcC5pdG9iKHBhZ2UpCiAgICBwdXNoYnl0ZXMgMHg2MgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOTYKICAgIC8vIGlmIG5vdCBib3g6CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBtYXJrX3RyaWdnZXJlZF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOTcKICAgIC8vIGJveC5jcmVhdGUoc2l6ZT1VSW50NjQoY2ZnLlRSSUdHRVJFRF9QQUdFX1NJWkUpKQogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgMTAyNCAvLyAxMDI0CiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOTkKICAgIC8vIHNlbGYudHJpZ2dlcl9mdW5kLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDc0NzI2OTY3Njc2NTcyNWY2Njc1NmU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyaWdnZXJfZnVuZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDAKICAgIC8vIDw9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMzAxCiAgICAvLyAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMwMC0xMzAxCiAgICAvLyA8PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTI5OS0xMzAxCiAgICAvLyBzZWxmLnRyaWdnZXJfZnVuZC52YWx1ZQogICAgLy8gPD0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICAvLyAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMjk4LTEzMDIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi50cmlnZ2VyX2Z1bmQudmFsdWUKICAgIC8vICAgICA8PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vICAgICAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIC8vICksIGVyci5UUklHR0VSX0ZVTkRfSU5TVUZGSUNJRU5UCiAgICBhc3NlcnQgLy8gVHJpZ2dlciBmdW5kIGlzIGluc3VmZmljaWVudC4gRnVuZCB0aGUgUmVnaXN0cnkgb3IgcmVkdWNlIGF3YXJkLgoKbWFya190cmlnZ2VyZWRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMwNAogICAgLy8gYml0ID0gaW5kZXggJSBjZmcuVFJJR0dFUkVEX1BBR0VfQklUUwogICAgZnJhbWVfZGlnIDEKICAgIHB1c2hpbnQgODE5MiAvLyA4MTkyCiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMzA1CiAgICAvLyBmbGFncyA9IGJveC5leHRyYWN0KGJpdCAvLyA4LCAxKQogICAgZHVwCiAgICBpbnRjXzMgLy8gOAogICAgLwogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMwogICAgZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMwNgogICAgLy8gYXNzZXJ0IG5vdCBvcC5nZXRiaXQoZmxhZ3MsIGJpdCAlIDgpLCBlcnIuQUxSRUFEWV9UUklHR0VSRUQKICAgIHVuY292ZXIgMgogICAgaW50Y18zIC8vIDgKICAgICUKICAgIGR1cDIKICAgIGdldGJpdAogICAgIQogICAgYXNzZXJ0IC8vIFZvdGUgd2FzIGFscmVhZHkgdHJpZ2dlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMzA3CiAgICAvLyBib3gucmVwbGFjZShiaXQgLy8gOCwgb3Auc2V0Yml0X2J5dGVzKGZsYWdzLCBiaXQgJSA4LCBUcnVlKSkgICMgbm9xYTogRkJUMDAzCiAgICBpbnRjXzEgLy8gMQogICAgc2V0Yml0CiAgICBib3hfcmVwbGFjZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRlbGVnYXRpb25fcmVnaXN0cnkuY29udHJhY3QuRGVsZWdhdGlvblJlZ2lzdHJ5LnZvdGVfcmVwcmVzZW50YXRpdmUoeGdvdl9hZGRyZXNzOiBieXRlcywgcHJvcG9zYWxfaWQ6IGJ5dGVzKSAtPiB2b2lkOgp2b3RlX3JlcHJlc2VudGF0aXZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMwOS0xMzEyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHZvdGVfcmVwcmVzZW50YXRpdmUoCiAgICAvLyAgICAgc2VsZiwgeGdvdl9hZGRyZXNzOiBhcmM0LkFkZHJlc3MsIHByb3Bvc2FsX2lkOiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMzEzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTQKICAgIC8vIGFzc2VydCB4Z292X2FkZHJlc3MgaW4gc2VsZi52b3RlcnNfYm94LCBlcnIuTk9UX1ZPVEVSCiAgICBieXRlYyA2IC8vIDB4NzYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vdCBWb3RlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMxNi0xMzIwCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHZvdGVyX2NvbnRyYWN0LlZvdGVyLnZvdGVfcmVwcmVzZW50YXRpdmUsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYudm90ZXJzX2JveFt4Z292X2FkZHJlc3NdLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMxOQogICAgLy8gYXBwX2lkPXNlbGYudm90ZXJzX2JveFt4Z292X2FkZHJlc3NdLAogICAgYm94X2dldAogICAgcG9wCiAgICBidG9pCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTYtMTMyMAogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICB2b3Rlcl9jb250cmFjdC5Wb3Rlci52b3RlX3JlcHJlc2VudGF0aXZlLAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLnZvdGVyc19ib3hbeGdvdl9hZGRyZXNzXSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDc1N2UyOWZjIC8vIG1ldGhvZCAidm90ZV9yZXByZXNlbnRhdGl2ZSh1aW50NjQpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMyMgogICAgLy8gc2VsZi52b3Rlc19sZWZ0LnZhbHVlIC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3Rlc19sZWZ0IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjIDQgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMjMKICAgIC8vIHNlbGYudXBkYXRlX3RyaWdnZXJfZnVuZCgpCiAgICBjYWxsc3ViIHVwZGF0ZV90cmlnZ2VyX2Z1bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMjkKICAgIC8vIGFyYzQuVUludDY0KHNlbGYudm90ZV90cmlnZ2VyX2F3YXJkLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vIDB4NzY2Zjc0NjU1Zjc0NzI2OTY3Njc2NTcyNWY2MTc3NjE3MjY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZV90cmlnZ2VyX2F3YXJkIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMyNi0xMzMwCiAgICAvLyBldi5Wb3RlVHJpZ2dlcmVkKAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLnZvdGVfdHJpZ2dlcl9hd2FyZC52YWx1ZSksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kZWxlZ2F0aW9uX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMjUtMTMzMQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlZvdGVUcmlnZ2VyZWQoCiAgICAvLyAgICAgICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYudm90ZV90cmlnZ2VyX2F3YXJkLnZhbHVlKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4YzAxZjg5NSAvLyBtZXRob2QgIlZvdGVUcmlnZ2VyZWQoYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZGVsZWdhdGlvbl9yZWdpc3RyeS5jb250cmFjdC5EZWxlZ2F0aW9uUmVnaXN0cnkucmVsZWFzZV90cmlnZ2VyX3Jld2FyZHMoYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CnJlbGVhc2VfdHJpZ2dlcl9yZXdhcmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMzMy0xMzM0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlbGVhc2VfdHJpZ2dlcl9yZXdhcmRzKHNlbGYsIGFtb3VudDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGVsZWdhdGlvbl9yZWdpc3RyeS9jb250cmFjdC5weToxMzM1CiAgICAvLyBzZWxmLnRyaWdnZXJfcmV3YXJkcy52YWx1ZSAtPSBhbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjcyNjU3NzYxNzI2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJpZ2dlcl9yZXdhcmRzIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBieXRlYyA3IC8vIDB4NzQ3MjY5Njc2NzY1NzI1ZjcyNjU3NzYxNzI2NDczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2RlbGVnYXRpb25fcmVnaXN0cnkvY29udHJhY3QucHk6MTMzNgogICAgLy8gc2VsZi51cGRhdGVfdHJpZ2dlcl9mdW5kKCkKICAgIGNhbGxzdWIgdXBkYXRlX3RyaWdnZXJfZnVuZAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [1204, 1533, 1556], "errorMessage": "Address length is 32 bytes"}, {"pc": [1111], "errorMessage": "Already a Voter"}, {"pc": [2326], "errorMessage": "Already a representative"}, {"pc": [483, 1927], "errorMessage": "Insufficient funds"}, {"pc": [1694, 1921, 1990], "errorMessage": "No trigger rewards ledger"}, {"pc": [1794], "errorMessage": "No triggered bitmap page"}, {"pc": [826, 1354, 2079, 3045, 3155], "errorMessage": "Not Voter"}, {"pc": [926, 2489], "errorMessage": "Not a representative"}, {"pc": [1163, 1544, 1579], "errorMessage": "Not an xGov"}, {"pc": [73], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [291], "errorMessage": "OnCompletion must be UpdateApplication && can only call when not creating"}, {"pc": [1817], "errorMessage": "Proposal is in voting stage"}, {"pc": [1100, 1344, 2066, 2313, 2477, 3145], "errorMessage": "Registry's non-admin methods are paused"}, {"pc": [419, 3106], "errorMessage": "Trigger fund is insufficient. Fund the Registry or reduce award."}, {"pc": [444], "errorMessage": "Trigger reward must not be larger than minimum vote fees"}, {"pc": [1869], "errorMessage": "Trigger rewards ledger is already opened"}, {"pc": [330, 380, 464, 520, 542, 583, 656, 707, 785, 816, 916, 1178, 1595, 2159], "errorMessage": "Unauthorized"}, {"pc": [3132], "errorMessage": "Vote was already triggered"}, {"pc": [1208], "errorMessage": "Voter is already assigned"}, {"pc": [9], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [14], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [18], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [22], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [715, 1038, 1263, 1433, 1888, 2430], "errorMessage": "Wrong Receiver"}, {"pc": [1049, 1274, 1439, 1896, 2447], "errorMessage": "Wrong payment amount"}, {"pc": [411, 416, 469, 474, 1019, 1027, 1094, 1252, 1856, 1877, 1978, 2006, 2060, 2255, 2307, 2419, 2471, 2521, 3098, 3103], "errorMessage": "account funded"}, {"pc": [2396, 2935], "errorMessage": "application exists"}, {"pc": [1154, 2130, 2995], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [830, 930, 2330, 2858], "errorMessage": "check Box exists"}, {"pc": [334, 488, 527, 549, 789, 2852], "errorMessage": "check self.manager_address exists"}, {"pc": [1098, 1342, 2064, 2311, 2475, 3143], "errorMessage": "check self.paused_registry exists"}, {"pc": [2439], "errorMessage": "check self.representative_fee exists"}, {"pc": [2834], "errorMessage": "check self.representatives_box entry exists"}, {"pc": [406, 480, 3093], "errorMessage": "check self.trigger_fund exists"}, {"pc": [1731, 3025, 3226], "errorMessage": "check self.trigger_rewards exists"}, {"pc": [1711], "errorMessage": "check self.trigger_rewards_box entry exists"}, {"pc": [424, 1372, 1463], "errorMessage": "check self.vote_fees exists"}, {"pc": [441, 1653, 1717, 1744, 3014, 3200], "errorMessage": "check self.vote_trigger_award exists"}, {"pc": [2801], "errorMessage": "check self.voters_box entry exists"}, {"pc": [2869], "errorMessage": "check self.voters_created exists"}, {"pc": [1407, 2217, 3019, 3186], "errorMessage": "check self.votes_left exists"}, {"pc": [872, 972, 1116, 2094, 2341, 2882, 2957], "errorMessage": "check self.xgov_registry_app exists"}, {"pc": [2647, 2735], "errorMessage": "index access is out of bounds"}, {"pc": [641, 2611, 2699], "errorMessage": "invalid array length header"}, {"pc": [2623, 2711], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [649], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [326, 812, 912, 1079, 1328, 1622, 1674, 2052, 2560, 2586], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [569, 627], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 6>"}, {"pc": [1146, 2122, 2987], "errorMessage": "invalid number of bytes for arc4.tuple<smart_contracts.common.abi_types.XGovBoxValue,arc4.bool>"}, {"pc": [302, 368, 376, 579, 635, 1087, 1338, 1630, 1682, 1766, 1777], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [360], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.Fees"}, {"pc": [703], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.KeyRegTxnInfo"}, {"pc": [2665, 2753], "errorMessage": "max array length exceeded"}, {"pc": [693, 1014, 1071, 1319, 1851, 2302], "errorMessage": "transaction type is pay"}, {"pc": [436], "errorMessage": "xGov vote fees must not be larger than for others"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"entropy": {"type": "AVMBytes"}}}"""
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+# Declared only: parsed on first use of `APP_SPEC`, not at import
+APP_SPEC: algokit_utils.Arc56Contract
+
+def __getattr__(name: str) -> algokit_utils.Arc56Contract:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -191,6 +202,35 @@ class TriggerVoteArgs:
     def abi_method_signature(self) -> str:
         return "trigger_vote(address,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TriggerVoteToLedgerArgs:
+    """Dataclass for trigger_vote_to_ledger arguments"""
+    xgov_address: str
+    proposal_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "trigger_vote_to_ledger(address,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DeleteTriggeredPageArgs:
+    """Dataclass for delete_triggered_page arguments"""
+    proposal_id: int
+    page: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "delete_triggered_page(uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class OpenTriggerRewardsArgs:
+    """Dataclass for open_trigger_rewards arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "open_trigger_rewards(pay)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class UnregisterVoterArgs:
     """Dataclass for unregister_voter arguments"""
@@ -227,6 +267,24 @@ class GetRepresentativeAppIdArgs:
     def abi_method_signature(self) -> str:
         return "get_representative_app_id(address)(uint64,bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetVoterAppIdsArgs:
+    """Dataclass for get_voter_app_ids arguments"""
+    xgov_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_voter_app_ids(address[])(uint64,bool)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetRepresentativeAppIdsArgs:
+    """Dataclass for get_representative_app_ids arguments"""
+    representative_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_representative_app_ids(address[])(uint64,bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateArgs:
     """Dataclass for create arguments"""
@@ -439,6 +497,67 @@ class DelegationRegistryParams:
             "args": method_args,
         }))
 
+    def trigger_vote_to_ledger(
+        self,
+        args: tuple[str, int] | TriggerVoteToLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "trigger_vote_to_ledger(address,uint64)void",
+            "args": method_args,
+        }))
+
+    def delete_triggered_page(
+        self,
+        args: tuple[int, int] | DeleteTriggeredPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "delete_triggered_page(uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def open_trigger_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenTriggerRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_trigger_rewards(pay)void",
+            "args": method_args,
+        }))
+
+    def claim_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_trigger_rewards()uint64",
+        }))
+
+    def close_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_trigger_rewards()void",
+        }))
+
     def unregister_voter(
         self,
         args: tuple[str] | UnregisterVoterArgs,
@@ -502,6 +621,32 @@ class DelegationRegistryParams:
             "args": method_args,
         }))
 
+    def get_voter_app_ids(
+        self,
+        args: tuple[list[str]] | GetVoterAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voter_app_ids(address[])(uint64,bool)[]",
+            "args": method_args,
+        }))
+
+    def get_representative_app_ids(
+        self,
+        args: tuple[list[str]] | GetRepresentativeAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_representative_app_ids(address[])(uint64,bool)[]",
+            "args": method_args,
+        }))
+
     def create(
         self,
         args: tuple[int] | CreateArgs,
@@ -728,6 +873,67 @@ class DelegationRegistryCreateTransactionParams:
             "args": method_args,
         }))
 
+    def trigger_vote_to_ledger(
+        self,
+        args: tuple[str, int] | TriggerVoteToLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "trigger_vote_to_ledger(address,uint64)void",
+            "args": method_args,
+        }))
+
+    def delete_triggered_page(
+        self,
+        args: tuple[int, int] | DeleteTriggeredPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "delete_triggered_page(uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def open_trigger_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenTriggerRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_trigger_rewards(pay)void",
+            "args": method_args,
+        }))
+
+    def claim_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_trigger_rewards()uint64",
+        }))
+
+    def close_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_trigger_rewards()void",
+        }))
+
     def unregister_voter(
         self,
         args: tuple[str] | UnregisterVoterArgs,
@@ -791,6 +997,32 @@ class DelegationRegistryCreateTransactionParams:
             "args": method_args,
         }))
 
+    def get_voter_app_ids(
+        self,
+        args: tuple[list[str]] | GetVoterAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voter_app_ids(address[])(uint64,bool)[]",
+            "args": method_args,
+        }))
+
+    def get_representative_app_ids(
+        self,
+        args: tuple[list[str]] | GetRepresentativeAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_representative_app_ids(address[])(uint64,bool)[]",
+            "args": method_args,
+        }))
+
     def create(
         self,
         args: tuple[int] | CreateArgs,
@@ -1062,6 +1294,82 @@ class DelegationRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def trigger_vote_to_ledger(
+        self,
+        args: tuple[str, int] | TriggerVoteToLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "trigger_vote_to_ledger(address,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def delete_triggered_page(
+        self,
+        args: tuple[int, int] | DeleteTriggeredPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "delete_triggered_page(uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def open_trigger_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenTriggerRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_trigger_rewards(pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def claim_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_trigger_rewards()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def close_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_trigger_rewards()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def unregister_voter(
         self,
         args: tuple[str] | UnregisterVoterArgs,
@@ -1140,6 +1448,38 @@ class DelegationRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, bool]], parsed_response)
 
+    def get_voter_app_ids(
+        self,
+        args: tuple[list[str]] | GetVoterAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voter_app_ids(address[])(uint64,bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, bool]]], parsed_response)
+
+    def get_representative_app_ids(
+        self,
+        args: tuple[list[str]] | GetRepresentativeAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_representative_app_ids(address[])(uint64,bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, bool]]], parsed_response)
+
     def create(
         self,
         args: tuple[int] | CreateArgs,
@@ -1177,6 +1517,8 @@ class GlobalStateValue(typing.TypedDict):
     paused_registry: int
     votes_left: int
     trigger_fund: int
+    trigger_rewards: int
+    voters_created: int
 
 class BoxStateValue(typing.TypedDict):
     """Shape of box state key values"""
@@ -1292,6 +1634,22 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def trigger_rewards(self) -> int:
+        """Get the current value of the trigger_rewards key in global_state state"""
+        value = self.app_client.state.global_state.get_value("trigger_rewards")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def voters_created(self) -> int:
+        """Get the current value of the voters_created key in global_state state"""
+        value = self.app_client.state.global_state.get_value("voters_created")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _BoxState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -1349,6 +1707,15 @@ class _BoxState:
             None
         )
 
+    @property
+    def trigger_rewards_box(self) -> "_MapState[str, int]":
+        """Get values from the trigger_rewards_box map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "trigger_rewards_box",
+            None
+        )
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -1421,7 +1788,7 @@ class DelegationRegistryClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -1454,7 +1821,7 @@ class DelegationRegistryClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1476,7 +1843,7 @@ class DelegationRegistryClient:
     ) -> "DelegationRegistryClient":
         return DelegationRegistryClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -1612,6 +1979,36 @@ class DelegationRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["trigger_vote_to_ledger(address,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["delete_triggered_page(uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["open_trigger_rewards(pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_trigger_rewards()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["close_trigger_rewards()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["unregister_voter(address)void"],
@@ -1642,6 +2039,18 @@ class DelegationRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[int, bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_voter_app_ids(address[])(uint64,bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, bool]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_representative_app_ids(address[])(uint64,bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, bool]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["create(uint64)void"],
@@ -1664,7 +2073,7 @@ class DelegationRegistryClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | tuple[int, bool]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | list[tuple[int, bool]] | tuple[int, bool]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1741,7 +2150,7 @@ class DelegationRegistryFactory(algokit_utils.TypedAppFactoryProtocol[Delegation
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -2146,6 +2555,104 @@ class DelegationRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def trigger_vote_to_ledger(
+        self,
+        args: tuple[str, int] | TriggerVoteToLedgerArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the trigger_vote_to_ledger(address,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "trigger_vote_to_ledger(address,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def delete_triggered_page(
+        self,
+        args: tuple[int, int] | DeleteTriggeredPageArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the delete_triggered_page(uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "delete_triggered_page(uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def open_trigger_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenTriggerRewardsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the open_trigger_rewards(pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "open_trigger_rewards(pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim_trigger_rewards(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_trigger_rewards()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_trigger_rewards()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def close_trigger_rewards(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_trigger_rewards()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "close_trigger_rewards()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def unregister_voter(
         self,
         args: tuple[str] | UnregisterVoterArgs,
@@ -2245,6 +2752,46 @@ class DelegationRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_voter_app_ids(
+        self,
+        args: tuple[list[str]] | GetVoterAppIdsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_voter_app_ids(address[])(uint64,bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_voter_app_ids(address[])(uint64,bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_representative_app_ids(
+        self,
+        args: tuple[list[str]] | GetRepresentativeAppIdsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_representative_app_ids(address[])(uint64,bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_representative_app_ids(address[])(uint64,bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create(
         self,
         args: tuple[int] | CreateArgs,
@@ -2713,6 +3260,99 @@ class DelegationRegistryComposer:
         )
         return self
 
+    def trigger_vote_to_ledger(
+        self,
+        args: tuple[str, int] | TriggerVoteToLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "DelegationRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.trigger_vote_to_ledger(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "trigger_vote_to_ledger(address,uint64)void", v
+            )
+        )
+        return self
+
+    def delete_triggered_page(
+        self,
+        args: tuple[int, int] | DeleteTriggeredPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "DelegationRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.delete_triggered_page(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "delete_triggered_page(uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def open_trigger_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenTriggerRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "DelegationRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.open_trigger_rewards(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "open_trigger_rewards(pay)void", v
+            )
+        )
+        return self
+
+    def claim_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "DelegationRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_trigger_rewards(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_trigger_rewards()uint64", v
+            )
+        )
+        return self
+
+    def close_trigger_rewards(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "DelegationRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.close_trigger_rewards(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "close_trigger_rewards()void", v
+            )
+        )
+        return self
+
     def unregister_voter(
         self,
         args: tuple[str] | UnregisterVoterArgs,
@@ -2807,6 +3447,44 @@ class DelegationRegistryComposer:
         )
         return self
 
+    def get_voter_app_ids(
+        self,
+        args: tuple[list[str]] | GetVoterAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "DelegationRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_voter_app_ids(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_voter_app_ids(address[])(uint64,bool)[]", v
+            )
+        )
+        return self
+
+    def get_representative_app_ids(
+        self,
+        args: tuple[list[str]] | GetRepresentativeAppIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "DelegationRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_representative_app_ids(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_representative_app_ids(address[])(uint64,bool)[]", v
+            )
+        )
+        return self
+
     def create(
         self,
         args: tuple[int] | CreateArgs,
@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -19,8 +20,18 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "status"}], "name": "set_status", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "vote_open_ts"}], "name": "set_vote_open_ts", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voting_duration"}], "name": "set_voting_duration", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "voter"}, {"type": "uint64", "name": "approvals"}, {"type": "uint64", "name": "rejections"}], "name": "vote", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}, {"type": "uint64", "desc": "The voter's votes", "name": "votes"}], "name": "set_voter_box", "returns": {"type": "void"}, "desc": "Set the Voter box for the given address.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}], "name": "del_voter_box", "returns": {"type": "void"}, "desc": "Delete the Voter box for the given address.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}], "name": "get_voter_box", "returns": {"type": "(uint64,bool)", "desc": "The voter's votes bool: `True` if voter's box exists, else `False`"}, "desc": "Returns the Voter box for the given address.", "events": [], "readonly": true, "recommendations": {}}], "name": "ProposalMock", "state": {"keys": {"box": {}, "global": {"registry_app_id": {"key": "cmVnaXN0cnlfYXBwX2lk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_open_ts": {"key": "dm90ZV9vcGVuaW5nX3RpbWVzdGFtcA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration": {"key": "dm90aW5nX2R1cmF0aW9u", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"voters": {"keyType": "address", "valueType": "uint64", "prefix": "Vg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAEAQAIICYFAVYPcmVnaXN0cnlfYXBwX2lkBnN0YXR1cxZ2b3RlX29wZW5pbmdfdGltZXN0YW1wD3ZvdGluZ19kdXJhdGlvbjEYQAANKSNnKiNnKyNnJwQjZzEZFEQxGEEAOYIHBBOUzDwErlrBDwS09PmpBLuOHWgE8w/7ugRdh0c2BCRhX5A2GgCOBwAVACMAMQBAAFcAcQCAAIAETFxhujYaAI4BAAEAKTINZyJDNhoBSRUkEkQXKkxnIkM2GgFJFSQSRBcrTGciQzYaAUkVJBJEFycETGciQzYaARUlEkQ2GgIVJBJENhoDFSQSRCJDNhoBSRUlEkQ2GgJJFSQSRBcoTwJQTBa/IkM2GgFJFSUSRChMULxIIkM2GgFJFSUSRChMUEm9SU8CSEEAGUsBvkQXFoABACNLA1RQgAQVH3x1TFCwIkMjQv/o", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgOCAzMgogICAgYnl0ZWNibG9jayAiViIgMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQgMHg3Mzc0NjE3NDc1NzMgMHg3NjZmNzQ2NTVmNmY3MDY1NmU2OTZlNjc1Zjc0Njk2ZDY1NzM3NDYxNmQ3MCAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MjEKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfUkVHSVNUUllfQVBQX0lELAogICAgYnl0ZWNfMSAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MjAKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjE5LTIyCiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcF9pZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfUkVHSVNUUllfQVBQX0lELAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1NUQVRVUywKICAgIGJ5dGVjXzIgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjI0CiAgICAvLyBVSW50NjQoZW5tLlNUQVRVU19FTVBUWSksCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MjMtMjYKICAgIC8vIHNlbGYuc3RhdHVzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KGVubS5TVEFUVVNfRU1QVFkpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfU1RBVFVTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjI5CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVEVfT1BFTl9UUywKICAgIGJ5dGVjXzMgLy8gMHg3NjZmNzQ2NTVmNmY3MDY1NmU2OTZlNjc1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MjgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjI3LTMwCiAgICAvLyBzZWxmLnZvdGVfb3Blbl90cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfVk9URV9PUEVOX1RTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTiwKICAgIGJ5dGVjIDQgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTozMS0zNAogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb24gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTiwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBjbGFzcyBQcm9wb3NhbE1vY2soQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTMKICAgIHB1c2hieXRlc3MgMHgxMzk0Y2MzYyAweGFlNWFjMTBmIDB4YjRmNGY5YTkgMHhiYjhlMWQ2OCAweGYzMGZmYmJhIDB4NWQ4NzQ3MzYgMHgyNDYxNWY5MCAvLyBtZXRob2QgInNldF9zdGF0dXModWludDY0KXZvaWQiLCBtZXRob2QgInNldF92b3RlX29wZW5fdHModWludDY0KXZvaWQiLCBtZXRob2QgInNldF92b3RpbmdfZHVyYXRpb24odWludDY0KXZvaWQiLCBtZXRob2QgInZvdGUoYWRkcmVzcyx1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgInNldF92b3Rlcl9ib3goYWRkcmVzcyx1aW50NjQpdm9pZCIsIG1ldGhvZCAiZGVsX3ZvdGVyX2JveChhZGRyZXNzKXZvaWQiLCBtZXRob2QgImdldF92b3Rlcl9ib3goYWRkcmVzcykodWludDY0LGJvb2wpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggc2V0X3N0YXR1cyBzZXRfdm90ZV9vcGVuX3RzIHNldF92b3RpbmdfZHVyYXRpb24gdm90ZSBzZXRfdm90ZXJfYm94IGRlbF92b3Rlcl9ib3ggZ2V0X3ZvdGVyX2JveAogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTcKICAgIC8vIGNsYXNzIFByb3Bvc2FsTW9jayhBUkM0Q29udHJhY3QsIGF2bV92ZXJzaW9uPTEwKToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWxfbW9jay5jb250cmFjdC5Qcm9wb3NhbE1vY2suY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6NDcKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlID0gR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZAogICAgYnl0ZWNfMSAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsX21vY2suY29udHJhY3QuUHJvcG9zYWxNb2NrLnNldF9zdGF0dXNbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfc3RhdHVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6NDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo1MQogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBzdGF0dXMKICAgIGJ5dGVjXzIgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWxfbW9jay5jb250cmFjdC5Qcm9wb3NhbE1vY2suc2V0X3ZvdGVfb3Blbl90c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF92b3RlX29wZW5fdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo1MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBzZWxmLnZvdGVfb3Blbl90cy52YWx1ZSA9IHZvdGVfb3Blbl90cwogICAgYnl0ZWNfMyAvLyAweDc2NmY3NDY1NWY2ZjcwNjU2ZTY5NmU2NzVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6NTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsX21vY2suY29udHJhY3QuUHJvcG9zYWxNb2NrLnNldF92b3RpbmdfZHVyYXRpb25bcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdm90aW5nX2R1cmF0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo1OQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb24udmFsdWUgPSB2b3RpbmdfZHVyYXRpb24KICAgIGJ5dGVjIDQgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWxfbW9jay5jb250cmFjdC5Qcm9wb3NhbE1vY2sudm90ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo2MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbF9tb2NrLmNvbnRyYWN0LlByb3Bvc2FsTW9jay5zZXRfdm90ZXJfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3ZvdGVyX2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo4MwogICAgLy8gc2VsZi52b3RlcnNbdm90ZXJfYWRkcmVzcy5uYXRpdmVdID0gdm90ZXMuYXNfdWludDY0KCkKICAgIGJ0b2kKICAgIGJ5dGVjXzAgLy8gIlYiCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6NzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsX21vY2suY29udHJhY3QuUHJvcG9zYWxNb2NrLmRlbF92b3Rlcl9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpkZWxfdm90ZXJfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6ODcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBkZWwgc2VsZi52b3RlcnNbdm90ZXJfYWRkcmVzcy5uYXRpdmVdCiAgICBieXRlY18wIC8vICJWIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbF9tb2NrLmNvbnRyYWN0LlByb3Bvc2FsTW9jay5nZXRfdm90ZXJfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGVyX2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjExNAogICAgLy8gZXhpc3RzID0gdm90ZXJfYWRkcmVzcy5uYXRpdmUgaW4gc2VsZi52b3RlcnMKICAgIGJ5dGVjXzAgLy8gIlYiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTE1CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBnZXRfdm90ZXJfYm94X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weToxMTYKICAgIC8vIHZvdGVzID0gc2VsZi52b3RlcnNbdm90ZXJfYWRkcmVzcy5uYXRpdmVdCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXJzIGVudHJ5IGV4aXN0cwogICAgYnRvaQoKZ2V0X3ZvdGVyX2JveF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weToxMjAKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NCh2b3RlcyksIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTAyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHB1c2hieXRlcyAweDAwCiAgICBpbnRjXzEgLy8gMAogICAgZGlnIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCmdldF92b3Rlcl9ib3hfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weToxMTgKICAgIC8vIHZvdGVzID0gVUludDY0KDApCiAgICBpbnRjXzEgLy8gMAogICAgYiBnZXRfdm90ZXJfYm94X2FmdGVyX2lmX2Vsc2VANAo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [94], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [307], "errorMessage": "check self.voters entry exists"}, {"pc": [226, 250, 276, 291], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [184, 198, 212, 233, 240, 258], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "status"}], "name": "set_status", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "vote_open_ts"}], "name": "set_vote_open_ts", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voting_duration"}], "name": "set_voting_duration", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter"}, {"type": "uint64", "desc": "The approval votes", "name": "approvals"}, {"type": "uint64", "desc": "The rejection votes", "name": "rejections"}], "name": "vote", "returns": {"type": "void"}, "desc": "Cast the votes of a Voter. As the xGov Proposal does, the voter box is deleted once\nthe Voter has voted.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}, {"type": "uint64", "desc": "The voter's votes", "name": "votes"}], "name": "set_voter_box", "returns": {"type": "void"}, "desc": "Set the Voter box for the given address.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "desc": "The Voter addresses and their votes", "name": "voter_boxes"}], "name": "set_voter_boxes", "returns": {"type": "void"}, "desc": "Set the Voter boxes for the given addresses, to seed many Voters at once.\nThe number of entries per call is bound by the box references of the group.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}], "name": "del_voter_box", "returns": {"type": "void"}, "desc": "Delete the Voter box for the given address.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}], "name": "get_voter_box", "returns": {"type": "(uint64,bool)", "desc": "The voter's votes bool: `True` if voter's box exists, else `False`"}, "desc": "Returns the Voter box for the given address.", "events": [], "readonly": true, "recommendations": {}}], "name": "ProposalMock", "state": {"keys": {"box": {}, "global": {"registry_app_id": {"key": "cmVnaXN0cnlfYXBwX2lk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_open_ts": {"key": "dm90ZV9vcGVuaW5nX3RpbWVzdGFtcA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration": {"key": "dm90aW5nX2R1cmF0aW9u", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"voters": {"keyType": "address", "valueType": "uint64", "prefix": "Vg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAEAQAIICYFAVYPcmVnaXN0cnlfYXBwX2lkBnN0YXR1cxZ2b3RlX29wZW5pbmdfdGltZXN0YW1wD3ZvdGluZ19kdXJhdGlvbjEYQAANKSNnKiNnKyNnJwQjZzEZFEQxGEEAQIIIBBOUzDwErlrBDwS09PmpBLuOHWgE8w/7ugT9iW9IBF2HRzYEJGFfkDYaAI4IABUAIwAxAEAAXQB3ALkAyACABExcYbo2GgCOAQABACkyDWciQzYaAUkVJBJEFypMZyJDNhoBSRUkEkQXK0xnIkM2GgFJFSQSRBcnBExnIkM2GgFJFSUSRDYaAhUkEkQ2GgMVJBJEKExQvEgiQzYaAUkVJRJENhoCSRUkEkQXKE8CUEwWvyJDNhoBRwIjWUlOAoEoC4ECCEwVEkQjSUsCDEEAJEsCVwIASwFJTgKBKAuBKFhJVyAITFcAIChMUEy/IghFAUL/1SJDNhoBSRUlEkQoTFC8SCJDNhoBSRUlEkQoTFBJvUlPAkhBABlLAb5EFxaAAQAjSwNUUIAEFR98dUxQsCJDI0L/6A==", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgOCAzMgogICAgYnl0ZWNibG9jayAiViIgMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQgMHg3Mzc0NjE3NDc1NzMgMHg3NjZmNzQ2NTVmNmY3MDY1NmU2OTZlNjc1Zjc0Njk2ZDY1NzM3NDYxNmQ3MCAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MjMKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfUkVHSVNUUllfQVBQX0lELAogICAgYnl0ZWNfMSAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MjIKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjIxLTI0CiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcF9pZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfUkVHSVNUUllfQVBQX0lELAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjI3CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1NUQVRVUywKICAgIGJ5dGVjXzIgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBVSW50NjQoZW5tLlNUQVRVU19FTVBUWSksCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MjUtMjgKICAgIC8vIHNlbGYuc3RhdHVzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KGVubS5TVEFUVVNfRU1QVFkpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfU1RBVFVTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjMxCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVEVfT1BFTl9UUywKICAgIGJ5dGVjXzMgLy8gMHg3NjZmNzQ2NTVmNmY3MDY1NmU2OTZlNjc1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MzAKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjI5LTMyCiAgICAvLyBzZWxmLnZvdGVfb3Blbl90cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfVk9URV9PUEVOX1RTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjM1CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTiwKICAgIGJ5dGVjIDQgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTozMy0zNgogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb24gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTiwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjE5CiAgICAvLyBjbGFzcyBQcm9wb3NhbE1vY2soQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTQKICAgIHB1c2hieXRlc3MgMHgxMzk0Y2MzYyAweGFlNWFjMTBmIDB4YjRmNGY5YTkgMHhiYjhlMWQ2OCAweGYzMGZmYmJhIDB4ZmQ4OTZmNDggMHg1ZDg3NDczNiAweDI0NjE1ZjkwIC8vIG1ldGhvZCAic2V0X3N0YXR1cyh1aW50NjQpdm9pZCIsIG1ldGhvZCAic2V0X3ZvdGVfb3Blbl90cyh1aW50NjQpdm9pZCIsIG1ldGhvZCAic2V0X3ZvdGluZ19kdXJhdGlvbih1aW50NjQpdm9pZCIsIG1ldGhvZCAidm90ZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAic2V0X3ZvdGVyX2JveChhZGRyZXNzLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzZXRfdm90ZXJfYm94ZXMoKGFkZHJlc3MsdWludDY0KVtdKXZvaWQiLCBtZXRob2QgImRlbF92b3Rlcl9ib3goYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJnZXRfdm90ZXJfYm94KGFkZHJlc3MpKHVpbnQ2NCxib29sKSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHNldF9zdGF0dXMgc2V0X3ZvdGVfb3Blbl90cyBzZXRfdm90aW5nX2R1cmF0aW9uIHZvdGUgc2V0X3ZvdGVyX2JveCBzZXRfdm90ZXJfYm94ZXMgZGVsX3ZvdGVyX2JveCBnZXRfdm90ZXJfYm94CiAgICBlcnIKCm1haW5fY3JlYXRlX05vT3BAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weToxOQogICAgLy8gY2xhc3MgUHJvcG9zYWxNb2NrKEFSQzRDb250cmFjdCwgYXZtX3ZlcnNpb249MTApOgogICAgcHVzaGJ5dGVzIDB4NGM1YzYxYmEgLy8gbWV0aG9kICJjcmVhdGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbF9tb2NrLmNvbnRyYWN0LlByb3Bvc2FsTW9jay5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo0OQogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUgPSBHbG9iYWwuY2FsbGVyX2FwcGxpY2F0aW9uX2lkCiAgICBieXRlY18xIC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBnbG9iYWwgQ2FsbGVyQXBwbGljYXRpb25JRAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWxfbW9jay5jb250cmFjdC5Qcm9wb3NhbE1vY2suc2V0X3N0YXR1c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9zdGF0dXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9IHN0YXR1cwogICAgYnl0ZWNfMiAvLyAweDczNzQ2MTc0NzU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbF9tb2NrLmNvbnRyYWN0LlByb3Bvc2FsTW9jay5zZXRfdm90ZV9vcGVuX3RzW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3ZvdGVfb3Blbl90czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6NTcKICAgIC8vIHNlbGYudm90ZV9vcGVuX3RzLnZhbHVlID0gdm90ZV9vcGVuX3RzCiAgICBieXRlY18zIC8vIDB4NzY2Zjc0NjU1ZjZmNzA2NTZlNjk2ZTY3NWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo1NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWxfbW9jay5jb250cmFjdC5Qcm9wb3NhbE1vY2suc2V0X3ZvdGluZ19kdXJhdGlvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF92b3RpbmdfZHVyYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo1OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjYxCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbi52YWx1ZSA9IHZvdGluZ19kdXJhdGlvbgogICAgYnl0ZWMgNCAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjU5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbF9tb2NrLmNvbnRyYWN0LlByb3Bvc2FsTW9jay52b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBkZWwgc2VsZi52b3RlcnNbdm90ZXIubmF0aXZlXQogICAgYnl0ZWNfMCAvLyAiViIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo2MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWxfbW9jay5jb250cmFjdC5Qcm9wb3NhbE1vY2suc2V0X3ZvdGVyX2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF92b3Rlcl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weTo4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6OTYKICAgIC8vIHNlbGYudm90ZXJzW3ZvdGVyX2FkZHJlc3MubmF0aXZlXSA9IHZvdGVzLmFzX3VpbnQ2NCgpCiAgICBidG9pCiAgICBieXRlY18wIC8vICJWIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjgzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbF9tb2NrLmNvbnRyYWN0LlByb3Bvc2FsTW9jay5zZXRfdm90ZXJfYm94ZXNbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdm90ZXJfYm94ZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weToxMDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5Wb3RlckJveEVudHJ5PgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTEyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXJfYm94ZXMubGVuZ3RoKToKICAgIGludGNfMSAvLyAwCgpzZXRfdm90ZXJfYm94ZXNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTEyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXJfYm94ZXMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IHNldF92b3Rlcl9ib3hlc19hZnRlcl9mb3JANQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTEzLTExNAogICAgLy8gZW50cnkgPSB2b3Rlcl9ib3hlc1tpXS5jb3B5KCkKICAgIC8vIHNlbGYudm90ZXJzW2VudHJ5LnZvdGVyX2FkZHJlc3MubmF0aXZlXSA9IGVudHJ5LnZvdGVzLmFzX3VpbnQ2NCgpCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDMyIDgKICAgIHN3YXAKICAgIGV4dHJhY3QgMCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTE0CiAgICAvLyBzZWxmLnZvdGVyc1tlbnRyeS52b3Rlcl9hZGRyZXNzLm5hdGl2ZV0gPSBlbnRyeS52b3Rlcy5hc191aW50NjQoKQogICAgYnl0ZWNfMCAvLyAiViIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTEyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXJfYm94ZXMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgc2V0X3ZvdGVyX2JveGVzX2Zvcl9oZWFkZXJAMgoKc2V0X3ZvdGVyX2JveGVzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTAwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbF9tb2NrLmNvbnRyYWN0LlByb3Bvc2FsTW9jay5kZWxfdm90ZXJfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZGVsX3ZvdGVyX2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjExOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTI5CiAgICAvLyBkZWwgc2VsZi52b3RlcnNbdm90ZXJfYWRkcmVzcy5uYXRpdmVdCiAgICBieXRlY18wIC8vICJWIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjExOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWxfbW9jay5jb250cmFjdC5Qcm9wb3NhbE1vY2suZ2V0X3ZvdGVyX2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF92b3Rlcl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weToxMzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWxfbW9jay9jb250cmFjdC5weToxNDUKICAgIC8vIGV4aXN0cyA9IHZvdGVyX2FkZHJlc3MubmF0aXZlIGluIHNlbGYudm90ZXJzCiAgICBieXRlY18wIC8vICJWIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3ZvdGVyX2JveF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTQ3CiAgICAvLyB2b3RlcyA9IHNlbGYudm90ZXJzW3ZvdGVyX2FkZHJlc3MubmF0aXZlXQogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVycyBlbnRyeSBleGlzdHMKICAgIGJ0b2kKCmdldF92b3Rlcl9ib3hfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTUxCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQodm90ZXMpLCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbF9tb2NrL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18xIC8vIDAKICAgIGRpZyAzCiAgICBzZXRiaXQKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgpnZXRfdm90ZXJfYm94X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsX21vY2svY29udHJhY3QucHk6MTQ5CiAgICAvLyB2b3RlcyA9IFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGIgZ2V0X3ZvdGVyX2JveF9hZnRlcl9pZl9lbHNlQDQK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [94], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [386], "errorMessage": "check self.voters entry exists"}, {"pc": [325], "errorMessage": "index access is out of bounds"}, {"pc": [288], "errorMessage": "invalid array length header"}, {"pc": [301], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.VoterBoxEntry>"}, {"pc": [234, 263, 355, 370], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [191, 205, 219, 241, 248, 271], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+# Declared only: parsed on first use of `APP_SPEC`, not at import
+APP_SPEC: algokit_utils.Arc56Contract
+
+def __getattr__(name: str) -> algokit_utils.Arc56Contract:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -112,6 +123,15 @@ class SetVoterBoxArgs:
     def abi_method_signature(self) -> str:
         return "set_voter_box(address,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetVoterBoxesArgs:
+    """Dataclass for set_voter_boxes arguments"""
+    voter_boxes: list[tuple[str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_voter_boxes((address,uint64)[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class DelVoterBoxArgs:
     """Dataclass for del_voter_box arguments"""
@@ -200,6 +220,19 @@ class ProposalMockParams:
             "args": method_args,
         }))
 
+    def set_voter_boxes(
+        self,
+        args: tuple[list[tuple[str, int]]] | SetVoterBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_voter_boxes((address,uint64)[])void",
+            "args": method_args,
+        }))
+
     def del_voter_box(
         self,
         args: tuple[str] | DelVoterBoxArgs,
@@ -317,6 +350,19 @@ class ProposalMockCreateTransactionParams:
             "args": method_args,
         }))
 
+    def set_voter_boxes(
+        self,
+        args: tuple[list[tuple[str, int]]] | SetVoterBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_voter_boxes((address,uint64)[])void",
+            "args": method_args,
+        }))
+
     def del_voter_box(
         self,
         args: tuple[str] | DelVoterBoxArgs,
@@ -449,6 +495,22 @@ class ProposalMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def set_voter_boxes(
+        self,
+        args: tuple[list[tuple[str, int]]] | SetVoterBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_voter_boxes((address,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def del_voter_box(
         self,
         args: tuple[str] | DelVoterBoxArgs,
@@ -692,7 +754,7 @@ class ProposalMockClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -725,7 +787,7 @@ class ProposalMockClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -747,7 +809,7 @@ class ProposalMockClient:
     ) -> "ProposalMockClient":
         return ProposalMockClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -829,6 +891,12 @@ class ProposalMockClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_voter_boxes((address,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["del_voter_box(address)void"],
@@ -913,7 +981,7 @@ class ProposalMockFactory(algokit_utils.TypedAppFactoryProtocol[ProposalMockMeth
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1141,6 +1209,26 @@ class ProposalMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def set_voter_boxes(
+        self,
+        args: tuple[list[tuple[str, int]]] | SetVoterBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_voter_boxes((address,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_voter_boxes((address,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def del_voter_box(
         self,
         args: tuple[str] | DelVoterBoxArgs,
@@ -1428,6 +1516,24 @@ class ProposalMockComposer:
         )
         return self
 
+    def set_voter_boxes(
+        self,
+        args: tuple[list[tuple[str, int]]] | SetVoterBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_voter_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_voter_boxes((address,uint64)[])void", v
+            )
+        )
+        return self
+
     def del_voter_box(
         self,
         args: tuple[str] | DelVoterBoxArgs,
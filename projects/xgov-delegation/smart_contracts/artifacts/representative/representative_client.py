@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -19,8 +20,18 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "address", "desc": "Address of the representative.", "name": "representative_address"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new representative.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "desc": "Update the contract.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause", "returns": {"type": "void"}, "desc": "Pause the representation.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume", "returns": {"type": "void"}, "desc": "Resume the representation.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment to cover MBR.", "name": "payment"}, {"type": "uint64", "desc": "App ID of proposal to vote on.", "name": "proposal_id"}, {"type": "(uint64,uint64)", "desc": "Representative's vote for the proposal.", "name": "vote", "struct": "Vote"}], "name": "publish_vote", "returns": {"type": "void"}, "desc": "Publish representative's vote.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of proposal which vote to delete.", "name": "proposal_id"}], "name": "delete_vote", "returns": {"type": "void"}, "desc": "Delete a representative's vote.\nCannot delete vote during voting stage of a proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete", "returns": {"type": "void"}, "desc": "Delete the representative.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of the proposal.", "name": "proposal_id"}], "name": "get_vote_box", "returns": {"type": "((uint64,uint64),bool)", "desc": "Representative's vote. bool: `True` if representative's vote exists, else `False`."}, "desc": "Get the representative's vote on a proposal.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of the proposal.", "name": "proposal_id"}], "name": "get_vote", "returns": {"type": "((uint64,uint64),bool)", "desc": "Representative's vote. bool: True if representative's vote exists and representative isn't paused."}, "desc": "Get the representative's vote on a proposal.", "events": [], "readonly": true, "recommendations": {}}], "name": "Representative", "state": {"keys": {"box": {}, "global": {"representative_address": {"key": "cmVwcmVzZW50YXRpdmVfYWRkcmVzcw==", "keyType": "AVMBytes", "valueType": "address"}, "registry_app": {"key": "cmVnaXN0cnlfYXBw", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused": {"key": "cGF1c2Vk", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"proposals_vote_box": {"keyType": "uint64", "valueType": "Vote", "prefix": "cHY="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 32, "ints": 32}, "local": {"bytes": 9, "ints": 7}}}, "structs": {"Vote": [{"name": "approval", "type": "uint64"}, {"name": "rejection", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAAEIIMCEPSYFBnBhdXNlZBZyZXByZXNlbnRhdGl2ZV9hZGRyZXNzDHJlZ2lzdHJ5X2FwcAJwdgQVH3x1MRhAACAxNSUSRDE0JRJEMTeBCRJEMTaBBxJEKTIDZyoiZygiZ4ICBKDoGHIEJDeNPDYaAI4CAFUASTEZFEQxGEEAMoIGBAF4+UsEJC1YqwQ8NiaUBLscfqUEY+bM1gRuqB6xNhoAjgYARgBPAFgA2gFOAWgAgATMaU6qNhoAjgEAGQAxGYEFEjEYEERCARAxGYEEEjEYEERCABc2GgFJFSUSRDINRCoyDWcpTGcoImcjQzEAMgkSRCNDiAF+RCgjZyNDiAF1RCgiZyNDMRYjCUk4ECMSRDYaAUkVJBJENhoCSRWBEBJEMgpzAUSIAUxETwIXSXIHRCIqZUSAEXhnb3ZfcmVnaXN0cnlfYXBwZUhyCEQSRCIoZUQURBYrTFBJvUUBFERLAiJbIQQOREsCJFshBA5ETwK/MgpzAURMCUsBOAcyChJETDgIEkQjQzYaAUkVJBJEMgpzAUxOAkSIANpEF0mABnN0YXR1c2VBACtJgRkSQQAkIxRESwEWK0xQvEgyCnMBREsDTAmxMgmyB7III7IQIrIBsyNDIkL/2TEAMgkSRDIKcwFEMgESRLEyCUmyCSKyCLIHI7IQIrIBsyNDNhoBSRUkEkSIADuAAQAiTwJUUCcETFCwI0M2GgFJFSQSRIgAIUEAGiIoZURAABMjgAEAIk8CVEsBTFAnBExQsCNDIkL/6ooBAov/FxYrTFBJvUlPAkhBAAuLAL5EiwFPA08DiYAQAAAAAAAAAAAAAAAAAAAAAEL/5DEAIillRBKJ", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAxMDAwMDAwCiAgICBieXRlY2Jsb2NrIDB4NzA2MTc1NzM2NTY0IDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjE2NDY0NzI2NTczNzMgMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAgMHg3MDc2IDB4MTUxZjdjNzUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo0MC00MQogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fYnl0ZV9zbGljZSA9PSBjZmcuR0xPQkFMX0JZVEVTLCBlcnIuV1JPTkdfR0xPQkFMX0JZVEVTCiAgICB0eG4gR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo0MgogICAgLy8gYXNzZXJ0IFR4bi5nbG9iYWxfbnVtX3VpbnQgPT0gY2ZnLkdMT0JBTF9VSU5UUywgZXJyLldST05HX0dMT0JBTF9VSU5UUwogICAgdHhuIEdsb2JhbE51bVVpbnQKICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV9ieXRlX3NsaWNlID09IGNmZy5MT0NBTF9CWVRFUywgZXJyLldST05HX0xPQ0FMX0JZVEVTCiAgICB0eG4gTG9jYWxOdW1CeXRlU2xpY2UKICAgIHB1c2hpbnQgOSAvLyA5CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo0NAogICAgLy8gYXNzZXJ0IFR4bi5sb2NhbF9udW1fdWludCA9PSBjZmcuTE9DQUxfVUlOVFMsIGVyci5XUk9OR19MT0NBTF9VSU5UUwogICAgdHhuIExvY2FsTnVtVWludAogICAgcHVzaGludCA3IC8vIDcKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9SRVBSRVNFTlRBVElWRV9BRERSRVNTLAogICAgYnl0ZWNfMSAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNjQ2NDcyNjU3MzczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NDgKICAgIC8vIEFjY291bnQoKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQ2LTUwCiAgICAvLyAjIEdsb2JhbCBWYXJpYWJsZXMKICAgIC8vIHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEFjY291bnQoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9SRVBSRVNFTlRBVElWRV9BRERSRVNTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo1MwogICAgLy8ga2V5PWNmZy5HU19LRVlfUkVHSVNUUllfQVBQLAogICAgYnl0ZWNfMiAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBBcHBsaWNhdGlvbigpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo1MS01NAogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbigpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1JFR0lTVFJZX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NTgKICAgIC8vIGtleT1jZmcuR1NfS0VZX1BBVVNFRCwKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo1NwogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjU2LTU5CiAgICAvLyBzZWxmLnBhdXNlZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1BBVVNFRCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyOS0zOAogICAgLy8gY2xhc3MgUmVwcmVzZW50YXRpdmUoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlc3MgMHhhMGU4MTg3MiAweDI0Mzc4ZDNjIC8vIG1ldGhvZCAidXBkYXRlKCl2b2lkIiwgbWV0aG9kICJkZWxldGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3VwZGF0ZV9yb3V0ZUA0IG1haW5fZGVsZXRlX3JvdXRlQDUKCm1haW5fc3dpdGNoX2Nhc2VfbmV4dEA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI5LTM4CiAgICAvLyBjbGFzcyBSZXByZXNlbnRhdGl2ZSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTAsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDE1CiAgICBwdXNoYnl0ZXNzIDB4MDE3OGY5NGIgMHgyNDJkNThhYiAweDNjMzYyNjk0IDB4YmIxYzdlYTUgMHg2M2U2Y2NkNiAweDZlYTgxZWIxIC8vIG1ldGhvZCAicGF1c2UoKXZvaWQiLCBtZXRob2QgInJlc3VtZSgpdm9pZCIsIG1ldGhvZCAicHVibGlzaF92b3RlKHBheSx1aW50NjQsKHVpbnQ2NCx1aW50NjQpKXZvaWQiLCBtZXRob2QgImRlbGV0ZV92b3RlKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfdm90ZV9ib3godWludDY0KSgodWludDY0LHVpbnQ2NCksYm9vbCkiLCBtZXRob2QgImdldF92b3RlKHVpbnQ2NCkoKHVpbnQ2NCx1aW50NjQpLGJvb2wpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggcGF1c2UgcmVzdW1lIHB1Ymxpc2hfdm90ZSBkZWxldGVfdm90ZSBnZXRfdm90ZV9ib3ggZ2V0X3ZvdGUKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyOS0zOAogICAgLy8gY2xhc3MgUmVwcmVzZW50YXRpdmUoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweGNjNjk0ZWFhIC8vIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3Mpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgptYWluX2RlbGV0ZV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJEZWxldGVBcHBsaWNhdGlvbiIsKSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIERlbGV0ZUFwcGxpY2F0aW9uICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGIgZGVsZXRlCgptYWluX3VwZGF0ZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDQgLy8gVXBkYXRlQXBwbGljYXRpb24KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBVcGRhdGVBcHBsaWNhdGlvbiAmJiBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBiIHVwZGF0ZQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6ODQKICAgIC8vIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgIT0gMAogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo4My04NQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwuY2FsbGVyX2FwcGxpY2F0aW9uX2lkICE9IDAKICAgIC8vICksIGVyci5VTkFVVEhPUklaRUQgICMgT25seSBjYWxsYWJsZSBieSBhbm90aGVyIGNvbnRyYWN0CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6ODcKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlID0gQXBwbGljYXRpb24oR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCkKICAgIGJ5dGVjXzIgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGdsb2JhbCBDYWxsZXJBcHBsaWNhdGlvbklECiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MudmFsdWUgPSByZXByZXNlbnRhdGl2ZV9hZGRyZXNzLm5hdGl2ZQogICAgYnl0ZWNfMSAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNjQ2NDcyNjU3MzczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBzZWxmLnBhdXNlZC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAweDcwNjE3NTczNjU2NAogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS51cGRhdGVbcm91dGluZ10oKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzA0CiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTAzCiAgICAvLyBhc3NlcnQgc2VsZi5pc19jcmVhdG9yKCksIGVyci5OT1RfQ1JFQVRPUgogICAgYXNzZXJ0IC8vIFNlbmRlciBpcyBub3QgYXBwIGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo5NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5wYXVzZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnBhdXNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjExNQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVwcmVzZW50YXRpdmUoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZXByZXNlbnRhdGl2ZQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjExNgogICAgLy8gc2VsZi5wYXVzZWQudmFsdWUgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUucmVzdW1lW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVzdW1lOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEyOAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVwcmVzZW50YXRpdmUoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZXByZXNlbnRhdGl2ZQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gc2VsZi5wYXVzZWQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUucHVibGlzaF92b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKcHVibGlzaF92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNTkKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNjEKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlcHJlc2VudGF0aXZlKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVwcmVzZW50YXRpdmUKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMjAKICAgIC8vIHByb3Bvc2FsX2NyZWF0b3IgPSBBcHBsaWNhdGlvbihwcm9wb3NhbF9pZC5hc191aW50NjQoKSkuY3JlYXRvcgogICAgdW5jb3ZlciAyCiAgICBidG9pCiAgICBkdXAKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcENyZWF0b3IKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMTMKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzE0CiAgICAvLyByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIHB1c2hieXRlcyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMTItMzE1CiAgICAvLyB4Z292X3JlZ2lzdHJ5X2lkLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIC8vICAgICByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMjIKICAgIC8vIHhnb3ZfcmVnaXN0cnlfYWRkcmVzcyA9IEFwcGxpY2F0aW9uKHhnb3ZfcmVnaXN0cnlfaWQpLmFkZHJlc3MKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMjMKICAgIC8vIHJldHVybiBwcm9wb3NhbF9jcmVhdG9yID09IHhnb3ZfcmVnaXN0cnlfYWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2VydCBzZWxmLmlzX3ZhbGlkX3Byb3Bvc2FsKHByb3Bvc2FsX2lkKSwgZXJyLklOVkFMSURfUFJPUE9TQUwKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBpcyBub3QgcGFydCBvZiB4R292IFJlZ2lzdHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTY1CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkLnZhbHVlLCBlcnIuUEFVU0VECiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3NTczNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBDb250cmFjdCBpcyBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNjgKICAgIC8vIGFzc2VydCBwcm9wb3NhbF9hcHAgbm90IGluIHNlbGYucHJvcG9zYWxzX3ZvdGVfYm94LCBlcnIuVk9URV9BTFJFQURZX1BVQkxJU0hFRAogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDcwNzYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBSZXByZXNlbnRhdGl2ZSB2b3RlIHdhcyBhbHJlYWR5IHB1Ymxpc2hlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gYXNzZXJ0IHZvdGUuYXBwcm92YWwuYXNfdWludDY0KCkgPD0gY29uc3QuUFBNLCBlcnIuVk9URV9OT1RfUFBNCiAgICBkaWcgMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjIDQgLy8gMTAwMDAwMAogICAgPD0KICAgIGFzc2VydCAvLyBWb3RlIG5vdCBpbiBQUE0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNzEKICAgIC8vIGFzc2VydCB2b3RlLnJlamVjdGlvbi5hc191aW50NjQoKSA8PSBjb25zdC5QUE0sIGVyci5WT1RFX05PVF9QUE0KICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGludGMgNCAvLyAxMDAwMDAwCiAgICA8PQogICAgYXNzZXJ0IC8vIFZvdGUgbm90IGluIFBQTQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gc2VsZi5wcm9wb3NhbHNfdm90ZV9ib3hbcHJvcG9zYWxfYXBwXSA9IHZvdGUuY29weSgpCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNzUKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gbWJyX2ZlZSA9IG1icl9hZnRlciAtIG1icl9iZWZvcmUKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxODAKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNzgtMTgxCiAgICAvLyAjIENoZWNrIHBheW1lbnQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IG1icl9mZWUsIGVyci5XUk9OR19QQVlNRU5UX0FNT1VOVAogICAgc3dhcAogICAgZ3R4bnMgQW1vdW50CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIHBheW1lbnQgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5kZWxldGVfdm90ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlbGV0ZV92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMDIKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMDQKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlcHJlc2VudGF0aXZlKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVwcmVzZW50YXRpdmUKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMDcKICAgIC8vIHByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpCiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC91dGlscy5weToxMwogICAgLy8gcHJvcF9jZmcuR1NfS0VZX1NUQVRVUywKICAgIHB1c2hieXRlcyAweDczNzQ2MTc0NzU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL3V0aWxzLnB5OjExLTE0CiAgICAvLyBzdGF0dXMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIHByb3BfY2ZnLkdTX0tFWV9TVEFUVVMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL3V0aWxzLnB5OjE2CiAgICAvLyByZXR1cm4gZXhpc3RzIGFuZCBzdGF0dXMgPT0gZW5tLlNUQVRVU19WT1RJTkcKICAgIGJ6IGRlbGV0ZV92b3RlX2Jvb2xfZmFsc2VANAogICAgZHVwCiAgICBwdXNoaW50IDI1IC8vIDI1CiAgICA9PQogICAgYnogZGVsZXRlX3ZvdGVfYm9vbF9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMQoKZGVsZXRlX3ZvdGVfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjIwNi0yMDgKICAgIC8vIGFzc2VydCBub3QgdXRpbHNfcHJvcC5pc19wcm9wb3NhbF92b3RpbmcoCiAgICAvLyAgICAgcHJvcG9zYWxfaWQuYXNfdWludDY0KCkKICAgIC8vICksIGVyci5QUk9QT1NBTF9WT1RJTkcKICAgICEKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBpcyBpbiB2b3Rpbmcgc3RhZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTEKICAgIC8vIGRlbCBzZWxmLnByb3Bvc2Fsc192b3RlX2JveFtwcm9wb3NhbF9hcHBdCiAgICBkaWcgMQogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDcwNzYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjEzCiAgICAvLyBtYnJfYWZ0ZXIgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTUtMjE2CiAgICAvLyAjIFNlbmQgZnJlZWQgTUJSIHRvIGNyZWF0b3IKICAgIC8vIG1icl9mcmVlZCA9IG1icl9iZWZvcmUgLSBtYnJfYWZ0ZXIKICAgIGRpZyAzCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjE3LTIyMAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PW1icl9mcmVlZCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTgKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjE3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTctMjIwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9bWJyX2ZyZWVkLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxODYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpkZWxldGVfdm90ZV9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBkZWxldGVfdm90ZV9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZGVsZXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZGVsZXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjMwNAogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjIzNgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY3JlYXRvcigpLCBlcnIuTk9UX0NSRUFUT1IKICAgIGFzc2VydCAvLyBTZW5kZXIgaXMgbm90IGFwcCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjM5CiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlID09IEdsb2JhbC5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMzgtMjQwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgPT0gR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyApLCBlcnIuVU5ERUxFVEVEX0JPWEVTCiAgICBhc3NlcnQgLy8gTm90IGFsbCBib3hlcyBkZWxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjQyLTI0NgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PVVJbnQ2NCgwKSwKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNDMKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNDUKICAgIC8vIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNDQKICAgIC8vIGFtb3VudD1VSW50NjQoMCksCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNDIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI0Mi0yNDYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQoMCksCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJEZWxldGVBcHBsaWNhdGlvbiIsKSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGVfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI1MC0yNTMKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tIEdldHRlciBtZXRob2RzIC0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgY2FsbHN1YiBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94CiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI5MwogICAgLy8gW3ZhbCwgZXhpc3RzXSA9IHNlbGYuZ2V0X3ZvdGVfYm94KHByb3Bvc2FsX2lkKQogICAgY2FsbHN1YiBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6Mjk1CiAgICAvLyBpc192YWxpZCA9IGV4aXN0cyBhbmQgc2VsZi5wYXVzZWQudmFsdWUgPT0gVUludDY0KDApCiAgICBieiBnZXRfdm90ZV9ib29sX2ZhbHNlQDQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkIGV4aXN0cwogICAgYm56IGdldF92b3RlX2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCmdldF92b3RlX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgcHVzaGJ5dGVzIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgZGlnIDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWMgNCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X3ZvdGVfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgZ2V0X3ZvdGVfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlX2JveChwcm9wb3NhbF9pZDogYnl0ZXMpIC0+IGJ5dGVzLCB1aW50NjQ6CnNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5nZXRfdm90ZV9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjUwLTI1NwogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0gR2V0dGVyIG1ldGhvZHMgLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3ZvdGVfYm94KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQ6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiB0dXBsZVt0eXAuVm90ZSwgYm9vbF06CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNjgKICAgIC8vIHByb3Bvc2FsX2FwcCA9IEFwcGxpY2F0aW9uKHByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpKQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjcwCiAgICAvLyBleGlzdHMgPSBwcm9wb3NhbF9hcHAgaW4gc2VsZi5wcm9wb3NhbHNfdm90ZV9ib3gKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHg3MDc2CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gaWYgZXhpc3RzOgogICAgYnogc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlX2JveF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI3MgogICAgLy8gdmFsID0gc2VsZi5wcm9wb3NhbHNfdm90ZV9ib3hbcHJvcG9zYWxfYXBwXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHNfdm90ZV9ib3ggZW50cnkgZXhpc3RzCgpzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNzYKICAgIC8vIHJldHVybiB2YWwuY29weSgpLCBleGlzdHMKICAgIGZyYW1lX2RpZyAxCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgpzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94X2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gdmFsID0gdHlwLlZvdGUoYXBwcm92YWw9YXJjNC5VSW50NjQoMCksIHJlamVjdGlvbj1hcmM0LlVJbnQ2NCgwKSkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBiIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5nZXRfdm90ZV9ib3hfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmlzX3JlcHJlc2VudGF0aXZlKCkgLT4gdWludDY0Ogppc19yZXByZXNlbnRhdGl2ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMDgKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MgZXhpc3RzCiAgICA9PQogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [345], "errorMessage": "Contract is paused"}, {"pc": [492], "errorMessage": "Not all boxes deleted"}, {"pc": [202], "errorMessage": "OnCompletion must be DeleteApplication && can only call when not creating"}, {"pc": [124], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [214], "errorMessage": "OnCompletion must be UpdateApplication && can only call when not creating"}, {"pc": [440], "errorMessage": "Proposal is in voting stage"}, {"pc": [339], "errorMessage": "Proposal is not part of xGov Registry"}, {"pc": [355], "errorMessage": "Representative vote was already published"}, {"pc": [246, 483], "errorMessage": "Sender is not app creator"}, {"pc": [228, 252, 261, 302, 416], "errorMessage": "Unauthorized"}, {"pc": [363, 371], "errorMessage": "Vote not in PPM"}, {"pc": [72], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [77], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [83], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [89], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [389], "errorMessage": "Wrong Receiver"}, {"pc": [394], "errorMessage": "Wrong payment amount"}, {"pc": [298, 379, 412, 453, 488], "errorMessage": "account funded"}, {"pc": [309, 337], "errorMessage": "application exists"}, {"pc": [343, 556], "errorMessage": "check self.paused exists"}, {"pc": [605], "errorMessage": "check self.proposals_vote_box entry exists"}, {"pc": [313], "errorMessage": "check self.registry_app exists"}, {"pc": [639], "errorMessage": "check self.representative_address exists"}, {"pc": [225], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [284, 404, 520, 546], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [293], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.Vote"}, {"pc": [276], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "address", "desc": "Address of the representative.", "name": "representative_address"}, {"type": "uint64", "desc": "ID of the xGov Registry app of the Delegation Registry.", "name": "xgov_registry_id"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new representative.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "desc": "Update the contract.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the xGov Registry app.", "name": "xgov_registry_id"}], "name": "sync_xgov_registry", "returns": {"type": "void"}, "desc": "Set the cached ID of the xGov Registry used by the Delegation Registry.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "xgov_registry_id"}], "name": "RepresentativeXGovRegistrySynced"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause", "returns": {"type": "void"}, "desc": "Pause the representation.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "bool", "name": "paused"}], "name": "RepresentativePauseSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume", "returns": {"type": "void"}, "desc": "Resume the representation.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "bool", "name": "paused"}], "name": "RepresentativePauseSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Payment to cover MBR.", "name": "payment"}, {"type": "uint64", "desc": "App ID of proposal to vote on.", "name": "proposal_id"}, {"type": "(uint64,uint64)", "desc": "Representative's vote for the proposal.", "name": "vote", "struct": "Vote"}], "name": "publish_vote", "returns": {"type": "void"}, "desc": "Publish representative's vote.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "(uint64,uint64)", "name": "vote", "struct": "Vote"}], "name": "VotePublished"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of proposal which vote to delete.", "name": "proposal_id"}], "name": "delete_vote", "returns": {"type": "void"}, "desc": "Delete a representative's vote.\nCannot delete vote during voting stage of a proposal.", "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "proposal_id"}], "name": "VoteDeleted"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete", "returns": {"type": "void"}, "desc": "Delete the representative.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of the proposal.", "name": "proposal_id"}], "name": "get_vote_box", "returns": {"type": "((uint64,uint64),bool)", "desc": "Representative's vote. bool: `True` if representative's vote exists, else `False`."}, "desc": "Get the representative's vote on a proposal.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of the proposal.", "name": "proposal_id"}], "name": "get_vote", "returns": {"type": "((uint64,uint64),bool)", "desc": "Representative's vote. bool: True if representative's vote exists and representative isn't paused."}, "desc": "Get the representative's vote on a proposal.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "desc": "App IDs of the proposals.", "name": "proposal_ids"}], "name": "get_votes", "returns": {"type": "((uint64,uint64),bool)[]", "desc": "Representative's vote on each proposal, in order, and whether it exists and representative isn't paused."}, "desc": "Get the representative's votes on many proposals.\nEach proposal needs a box reference, see `cfg.MAX_BULK_GETTER_PROPOSALS`.", "events": [], "readonly": true, "recommendations": {}}], "name": "Representative", "state": {"keys": {"box": {}, "global": {"representative_address": {"key": "cmVwcmVzZW50YXRpdmVfYWRkcmVzcw==", "keyType": "AVMBytes", "valueType": "address"}, "registry_app": {"key": "cmVnaXN0cnlfYXBw", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "xgov_registry_app": {"key": "eGdvdl9yZWdpc3RyeV9hcHA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused": {"key": "cGF1c2Vk", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"proposals_vote_box": {"keyType": "uint64", "valueType": "Vote", "prefix": "cHY="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 32, "ints": 32}, "local": {"bytes": 9, "ints": 7}}}, "structs": {"Vote": [{"name": "approval", "type": "uint64"}, {"name": "rejection", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAAEIIMCEPSYIFnJlcHJlc2VudGF0aXZlX2FkZHJlc3MGcGF1c2VkEXhnb3ZfcmVnaXN0cnlfYXBwAQAMcmVnaXN0cnlfYXBwAnB2BBUffHUELvsi0jEYQAAkMTUlEkQxNCUSRDE3gQkSRDE2gQcSRCgyA2cnBCJnKiJnKSJnggIEoOgYcgQkN408NhoAjgIAYwBXMRkURDEYQQBAgggE5tocrQQBePlLBCQtWKsEPDYmlAS7HH6lBGPmzNYEbqgesQSWijjVNhoAjggAUwB3AI0AoQE5Ab8B1wHvAIAEwLZDUjYaAI4BABkAMRmBBRIxGBBEQgGBMRmBBBIxGBBEQgAkNhoBSRUlEkQ2GgJJFSQSRDINRCcEMg1nFypMZyhMZykiZyNDMQAyCRJEI0M2GgFJFSQSRDEAMgkSREkXKkxnIihlRExQgARoUJPaTFCwI0OIAh5EKSNnIihlRIABgFAnB0xQsCNDiAIIRCkiZyIoZUQrUCcHTFCwI0MxFiMJSTgQIxJENhoBRwIVJBJENhoCSU4CFYEQEkQyCnMBTE4CRIgBzkQXSXIHRCIqZUEAWElyCERLAhJEIillRBRESwIWJwVMUEm9RQEUREsFSSJbIQQOREkkWyEEDkRMSwG/MgpzAURLBQlLCEk4BzIKEkQ4CBJEIihlREsHUExQgAQnDJjVTFCwI0MiJwRlRCplSEL/njYaAUcCFSQSRDIKcwFMTgJEiAFLRBdJgAZzdGF0dXNlQQA8SYEZEkEANSMUREsBFicFTFC8SDIKcwFESwNMCbEyCbIHsggjshAisgGzIihlREsEUIAECErpjUxQsCNDIkL/yDEAMgkSRDIKcwFEMgESRLEyCUmyCSKyCLIHI7IQIrIBsyNDNhoBSRUkEkSIAH0rIk8CVFAnBkxQsCNDNhoBSRUkEkSIAJkrIk8CVFAnBkxQsCNDNhoBRwIiWUlOAiQLgQIITBUSRIACAAAiSUsDDEEAMUsDVwIASwFJTgIkCyRYiABcKyJPAlRQSwNJTwJQTCJZIwgWVwYCXABFAyMIRQFC/8gnBksCULAjQ4oBAov/FxYnBUxQSb1JTwJIQQALiwC+RIsBTwNPA4mAEAAAAAAAAAAAAAAAAAAAAABC/+SKAQKL/4j/xEEADiIpZURAAAcjiwBMTwKJIkL/9jEAIihlRBKJ", "clear": "CoEBQw=="}, "events": [{"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "xgov_registry_id"}], "name": "RepresentativeXGovRegistrySynced"}, {"args": [{"type": "address", "name": "representative_address"}, {"type": "bool", "name": "paused"}], "name": "RepresentativePauseSet"}, {"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "(uint64,uint64)", "name": "vote", "struct": "Vote"}], "name": "VotePublished"}, {"args": [{"type": "address", "name": "representative_address"}, {"type": "uint64", "name": "proposal_id"}], "name": "VoteDeleted"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAxMDAwMDAwCiAgICBieXRlY2Jsb2NrIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjE2NDY0NzI2NTczNzMgMHg3MDYxNzU3MzY1NjQgMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwIDB4MDAgMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAgMHg3MDc2IDB4MTUxZjdjNzUgMHgyZWZiMjJkMgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQxLTQyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IGNmZy5HTE9CQUxfQllURVMsIGVyci5XUk9OR19HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fdWludCA9PSBjZmcuR0xPQkFMX1VJTlRTLCBlcnIuV1JPTkdfR0xPQkFMX1VJTlRTCiAgICB0eG4gR2xvYmFsTnVtVWludAogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NDQKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgcHVzaGludCA5IC8vIDkKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV91aW50ID09IGNmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICBwdXNoaW50IDcgLy8gNwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NTAKICAgIC8vIGtleT1jZmcuR1NfS0VZX1JFUFJFU0VOVEFUSVZFX0FERFJFU1MsCiAgICBieXRlY18wIC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo0OQogICAgLy8gQWNjb3VudCgpLAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NDctNTEKICAgIC8vICMgR2xvYmFsIFZhcmlhYmxlcwogICAgLy8gc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgQWNjb3VudCgpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1JFUFJFU0VOVEFUSVZFX0FERFJFU1MsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9SRUdJU1RSWV9BUFAsCiAgICBieXRlYyA0IC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NTMKICAgIC8vIEFwcGxpY2F0aW9uKCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjUyLTU1CiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEFwcGxpY2F0aW9uKCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfUkVHSVNUUllfQVBQLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo1OAogICAgLy8ga2V5PWNmZy5HU19LRVlfWEdPVl9SRUdJU1RSWV9BUFAsCiAgICBieXRlY18yIC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBBcHBsaWNhdGlvbigpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo1Ni01OQogICAgLy8gc2VsZi54Z292X3JlZ2lzdHJ5X2FwcCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEFwcGxpY2F0aW9uKCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfWEdPVl9SRUdJU1RSWV9BUFAsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjYzCiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9QQVVTRUQsCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NjIKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo2MS02NAogICAgLy8gc2VsZi5wYXVzZWQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9QQVVTRUQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzAtMzkKICAgIC8vIGNsYXNzIFJlcHJlc2VudGF0aXZlKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMCwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9Y2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9Y2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICBwdXNoYnl0ZXNzIDB4YTBlODE4NzIgMHgyNDM3OGQzYyAvLyBtZXRob2QgInVwZGF0ZSgpdm9pZCIsIG1ldGhvZCAiZGVsZXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfcm91dGVANCBtYWluX2RlbGV0ZV9yb3V0ZUA1CgptYWluX3N3aXRjaF9jYXNlX25leHRANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMC0zOQogICAgLy8gY2xhc3MgUmVwcmVzZW50YXRpdmUoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxNwogICAgcHVzaGJ5dGVzcyAweGU2ZGExY2FkIDB4MDE3OGY5NGIgMHgyNDJkNThhYiAweDNjMzYyNjk0IDB4YmIxYzdlYTUgMHg2M2U2Y2NkNiAweDZlYTgxZWIxIDB4OTY4YTM4ZDUgLy8gbWV0aG9kICJzeW5jX3hnb3ZfcmVnaXN0cnkodWludDY0KXZvaWQiLCBtZXRob2QgInBhdXNlKCl2b2lkIiwgbWV0aG9kICJyZXN1bWUoKXZvaWQiLCBtZXRob2QgInB1Ymxpc2hfdm90ZShwYXksdWludDY0LCh1aW50NjQsdWludDY0KSl2b2lkIiwgbWV0aG9kICJkZWxldGVfdm90ZSh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZ2V0X3ZvdGVfYm94KHVpbnQ2NCkoKHVpbnQ2NCx1aW50NjQpLGJvb2wpIiwgbWV0aG9kICJnZXRfdm90ZSh1aW50NjQpKCh1aW50NjQsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3ZvdGVzKHVpbnQ2NFtdKSgodWludDY0LHVpbnQ2NCksYm9vbClbXSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHN5bmNfeGdvdl9yZWdpc3RyeSBwYXVzZSByZXN1bWUgcHVibGlzaF92b3RlIGRlbGV0ZV92b3RlIGdldF92b3RlX2JveCBnZXRfdm90ZSBnZXRfdm90ZXMKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMC0zOQogICAgLy8gY2xhc3MgUmVwcmVzZW50YXRpdmUoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweGMwYjY0MzUyIC8vIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3MsdWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKbWFpbl9kZWxldGVfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPSgiRGVsZXRlQXBwbGljYXRpb24iLCkpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBEZWxldGVBcHBsaWNhdGlvbiAmJiBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBiIGRlbGV0ZQoKbWFpbl91cGRhdGVfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxMDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNCAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIFVwZGF0ZUFwcGxpY2F0aW9uICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGIgdXBkYXRlCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo3MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo5MQogICAgLy8gR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCAhPSAwCiAgICBnbG9iYWwgQ2FsbGVyQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjkwLTkyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgIT0gMAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRCAgIyBPbmx5IGNhbGxhYmxlIGJ5IGFub3RoZXIgY29udHJhY3QKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo5NAogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUgPSBBcHBsaWNhdGlvbihHbG9iYWwuY2FsbGVyX2FwcGxpY2F0aW9uX2lkKQogICAgYnl0ZWMgNCAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6OTUKICAgIC8vIHNlbGYueGdvdl9yZWdpc3RyeV9hcHAudmFsdWUgPSBBcHBsaWNhdGlvbih4Z292X3JlZ2lzdHJ5X2lkLmFzX3VpbnQ2NCgpKQogICAgYnRvaQogICAgYnl0ZWNfMiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6OTYKICAgIC8vIHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSA9IHJlcHJlc2VudGF0aXZlX2FkZHJlc3MubmF0aXZlCiAgICBieXRlY18wIC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjE2NDY0NzI2NTczNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6OTgKICAgIC8vIHNlbGYucGF1c2VkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo3MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLnVwZGF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozODgKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxMTEKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5zeW5jX3hnb3ZfcmVnaXN0cnlbcm91dGluZ10oKSAtPiB2b2lkOgpzeW5jX3hnb3ZfcmVnaXN0cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTE1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjM4OAogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY3JlYXRvcigpLCBlcnIuTk9UX0NSRUFUT1IKICAgIGFzc2VydCAvLyBTZW5kZXIgaXMgbm90IGFwcCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTMyCiAgICAvLyBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlID0gQXBwbGljYXRpb24oeGdvdl9yZWdpc3RyeV9pZC5hc191aW50NjQoKSkKICAgIGR1cAogICAgYnRvaQogICAgYnl0ZWNfMiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTM2CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzLnZhbHVlKSwgeGdvdl9yZWdpc3RyeV9pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTM1LTEzNwogICAgLy8gZXYuUmVwcmVzZW50YXRpdmVYR292UmVnaXN0cnlTeW5jZWQoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSksIHhnb3ZfcmVnaXN0cnlfaWQKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjEzNC0xMzgKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5SZXByZXNlbnRhdGl2ZVhHb3ZSZWdpc3RyeVN5bmNlZCgKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSksIHhnb3ZfcmVnaXN0cnlfaWQKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg2ODUwOTNkYSAvLyBtZXRob2QgIlJlcHJlc2VudGF0aXZlWEdvdlJlZ2lzdHJ5U3luY2VkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTE1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5wYXVzZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnBhdXNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVwcmVzZW50YXRpdmUoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZXByZXNlbnRhdGl2ZQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi5wYXVzZWQudmFsdWUgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gcmVwcmVzZW50YXRpdmVfYWRkcmVzcz1hcmM0LkFkZHJlc3Moc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE1NgogICAgLy8gcGF1c2VkPWFyYzQuQm9vbChib29sKHNlbGYucGF1c2VkLnZhbHVlKSksCiAgICBwdXNoYnl0ZXMgMHg4MAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE1NC0xNTcKICAgIC8vIGV2LlJlcHJlc2VudGF0aXZlUGF1c2VTZXQoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfYWRkcmVzcz1hcmM0LkFkZHJlc3Moc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICBwYXVzZWQ9YXJjNC5Cb29sKGJvb2woc2VsZi5wYXVzZWQudmFsdWUpKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE1My0xNTgKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5SZXByZXNlbnRhdGl2ZVBhdXNlU2V0KAogICAgLy8gICAgICAgICByZXByZXNlbnRhdGl2ZV9hZGRyZXNzPWFyYzQuQWRkcmVzcyhzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgICAgICBwYXVzZWQ9YXJjNC5Cb29sKGJvb2woc2VsZi5wYXVzZWQudmFsdWUpKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBieXRlYyA3IC8vIG1ldGhvZCAiUmVwcmVzZW50YXRpdmVQYXVzZVNldChhZGRyZXNzLGJvb2wpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLnJlc3VtZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlc3VtZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNzAKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlcHJlc2VudGF0aXZlKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVwcmVzZW50YXRpdmUKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNzEKICAgIC8vIHNlbGYucGF1c2VkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNzUKICAgIC8vIHJlcHJlc2VudGF0aXZlX2FkZHJlc3M9YXJjNC5BZGRyZXNzKHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToxNzYKICAgIC8vIHBhdXNlZD1hcmM0LkJvb2woYm9vbChzZWxmLnBhdXNlZC52YWx1ZSkpLAogICAgYnl0ZWNfMyAvLyAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTc0LTE3NwogICAgLy8gZXYuUmVwcmVzZW50YXRpdmVQYXVzZVNldCgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9hZGRyZXNzPWFyYzQuQWRkcmVzcyhzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgIHBhdXNlZD1hcmM0LkJvb2woYm9vbChzZWxmLnBhdXNlZC52YWx1ZSkpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTczLTE3OAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlJlcHJlc2VudGF0aXZlUGF1c2VTZXQoCiAgICAvLyAgICAgICAgIHJlcHJlc2VudGF0aXZlX2FkZHJlc3M9YXJjNC5BZGRyZXNzKHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgICAgIHBhdXNlZD1hcmM0LkJvb2woYm9vbChzZWxmLnBhdXNlZC52YWx1ZSkpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ5dGVjIDcgLy8gbWV0aG9kICJSZXByZXNlbnRhdGl2ZVBhdXNlU2V0KGFkZHJlc3MsYm9vbCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUucHVibGlzaF92b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKcHVibGlzaF92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMDgKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTAKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlcHJlc2VudGF0aXZlKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVwcmVzZW50YXRpdmUKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo0MDkKICAgIC8vIHByb3Bvc2FsX2NyZWF0b3IgPSBBcHBsaWNhdGlvbihwcm9wb3NhbF9pZC5hc191aW50NjQoKSkuY3JlYXRvcgogICAgYnRvaQogICAgZHVwCiAgICBhcHBfcGFyYW1zX2dldCBBcHBDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6Mzk2CiAgICAvLyB4Z292X3JlZ2lzdHJ5X2FwcCwgZXhpc3RzID0gc2VsZi54Z292X3JlZ2lzdHJ5X2FwcC5tYXliZSgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6Mzk3CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBwdWJsaXNoX3ZvdGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICBkdXAKCnB1Ymxpc2hfdm90ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5nZXRfeGdvdl9yZWdpc3RyeV9pZEA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQxMQogICAgLy8geGdvdl9yZWdpc3RyeV9hZGRyZXNzID0gQXBwbGljYXRpb24oeGdvdl9yZWdpc3RyeV9pZCkuYWRkcmVzcwogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjQxMgogICAgLy8gcmV0dXJuIHByb3Bvc2FsX2NyZWF0b3IgPT0geGdvdl9yZWdpc3RyeV9hZGRyZXNzCiAgICBkaWcgMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTIKICAgIC8vIGFzc2VydCBzZWxmLmlzX3ZhbGlkX3Byb3Bvc2FsKHByb3Bvc2FsX2lkKSwgZXJyLklOVkFMSURfUFJPUE9TQUwKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBpcyBub3QgcGFydCBvZiB4R292IFJlZ2lzdHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjE0CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkLnZhbHVlLCBlcnIuUEFVU0VECiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBDb250cmFjdCBpcyBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTcKICAgIC8vIGFzc2VydCBwcm9wb3NhbF9hcHAgbm90IGluIHNlbGYucHJvcG9zYWxzX3ZvdGVfYm94LCBlcnIuVk9URV9BTFJFQURZX1BVQkxJU0hFRAogICAgZGlnIDIKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHg3MDc2CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gUmVwcmVzZW50YXRpdmUgdm90ZSB3YXMgYWxyZWFkeSBwdWJsaXNoZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMTkKICAgIC8vIGFzc2VydCB2b3RlLmFwcHJvdmFsLmFzX3VpbnQ2NCgpIDw9IGNvbnN0LlBQTSwgZXJyLlZPVEVfTk9UX1BQTQogICAgZGlnIDUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjIDQgLy8gMTAwMDAwMAogICAgPD0KICAgIGFzc2VydCAvLyBWb3RlIG5vdCBpbiBQUE0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMjAKICAgIC8vIGFzc2VydCB2b3RlLnJlamVjdGlvbi5hc191aW50NjQoKSA8PSBjb25zdC5QUE0sIGVyci5WT1RFX05PVF9QUE0KICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjIDQgLy8gMTAwMDAwMAogICAgPD0KICAgIGFzc2VydCAvLyBWb3RlIG5vdCBpbiBQUE0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMjIKICAgIC8vIHNlbGYucHJvcG9zYWxzX3ZvdGVfYm94W3Byb3Bvc2FsX2FwcF0gPSB2b3RlLmNvcHkoKQogICAgc3dhcAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMjQKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gbWJyX2ZlZSA9IG1icl9hZnRlciAtIG1icl9iZWZvcmUKICAgIGRpZyA1CiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjI5CiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGRpZyA4CiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMjctMjMwCiAgICAvLyAjIENoZWNrIHBheW1lbnQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjIzMQogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IG1icl9mZWUsIGVyci5XUk9OR19QQVlNRU5UX0FNT1VOVAogICAgZ3R4bnMgQW1vdW50CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIHBheW1lbnQgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjM1CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjIzNC0yMzgKICAgIC8vIGV2LlZvdGVQdWJsaXNoZWQoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgdm90ZS5jb3B5KCksCiAgICAvLyApCiAgICBkaWcgNwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyMzMtMjM5CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgZXYuVm90ZVB1Ymxpc2hlZCgKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgICAgICB2b3RlLmNvcHkoKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgyNzBjOThkNSAvLyBtZXRob2QgIlZvdGVQdWJsaXNoZWQoYWRkcmVzcyx1aW50NjQsKHVpbnQ2NCx1aW50NjQpKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MTgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKcHVibGlzaF92b3RlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTo0MDIKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NDAzCiAgICAvLyByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIGJ5dGVjXzIgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NDAwLTQwNAogICAgLy8gIyBBcHBzIG5vdCB5ZXQgc3luY2VkIHJlYWQgaXQgZnJvbSB0aGUgRGVsZWdhdGlvbiBSZWdpc3RyeQogICAgLy8geGdvdl9yZWdpc3RyeV9pZCwgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyAgICAgcmVnX2NmZy5HU19LRVlfWEdPVl9SRUdJU1RSWV9BUFAsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6NDEwCiAgICAvLyB4Z292X3JlZ2lzdHJ5X2lkID0gc2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpCiAgICBiIHB1Ymxpc2hfdm90ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5nZXRfeGdvdl9yZWdpc3RyeV9pZEA0CgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmRlbGV0ZV92b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKZGVsZXRlX3ZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI1OQogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVwcmVzZW50YXRpdmUoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZXByZXNlbnRhdGl2ZQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI2NAogICAgLy8gcHJvcG9zYWxfaWQuYXNfdWludDY0KCkKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL3V0aWxzLnB5OjEzCiAgICAvLyBwcm9wX2NmZy5HU19LRVlfU1RBVFVTLAogICAgcHVzaGJ5dGVzIDB4NzM3NDYxNzQ3NTczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvdXRpbHMucHk6MTEtMTQKICAgIC8vIHN0YXR1cywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgcHJvcF9jZmcuR1NfS0VZX1NUQVRVUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvdXRpbHMucHk6MTYKICAgIC8vIHJldHVybiBleGlzdHMgYW5kIHN0YXR1cyA9PSBlbm0uU1RBVFVTX1ZPVElORwogICAgYnogZGVsZXRlX3ZvdGVfYm9vbF9mYWxzZUA0CiAgICBkdXAKICAgIHB1c2hpbnQgMjUgLy8gMjUKICAgID09CiAgICBieiBkZWxldGVfdm90ZV9ib29sX2ZhbHNlQDQKICAgIGludGNfMSAvLyAxCgpkZWxldGVfdm90ZV9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MjYzLTI2NQogICAgLy8gYXNzZXJ0IG5vdCB1dGlsc19wcm9wLmlzX3Byb3Bvc2FsX3ZvdGluZygKICAgIC8vICAgICBwcm9wb3NhbF9pZC5hc191aW50NjQoKQogICAgLy8gKSwgZXJyLlBST1BPU0FMX1ZPVElORwogICAgIQogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIGlzIGluIHZvdGluZyBzdGFnZQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI2OAogICAgLy8gZGVsIHNlbGYucHJvcG9zYWxzX3ZvdGVfYm94W3Byb3Bvc2FsX2FwcF0KICAgIGRpZyAxCiAgICBpdG9iCiAgICBieXRlYyA1IC8vIDB4NzA3NgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNzAKICAgIC8vIG1icl9hZnRlciA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI3Mi0yNzMKICAgIC8vICMgU2VuZCBmcmVlZCBNQlIgdG8gY3JlYXRvcgogICAgLy8gbWJyX2ZyZWVkID0gbWJyX2JlZm9yZSAtIG1icl9hZnRlcgogICAgZGlnIDMKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNzQtMjc3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9bWJyX2ZyZWVkLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNzQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI3NC0yNzcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1tYnJfZnJlZWQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI4MAogICAgLy8gZXYuVm90ZURlbGV0ZWQoYXJjNC5BZGRyZXNzKHNlbGYucmVwcmVzZW50YXRpdmVfYWRkcmVzcy52YWx1ZSksIHByb3Bvc2FsX2lkKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MgZXhpc3RzCiAgICBkaWcgNAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6Mjc5LTI4MQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlZvdGVEZWxldGVkKGFyYzQuQWRkcmVzcyhzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MudmFsdWUpLCBwcm9wb3NhbF9pZCkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDA4NGFlOThkIC8vIG1ldGhvZCAiVm90ZURlbGV0ZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyNDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpkZWxldGVfdm90ZV9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBkZWxldGVfdm90ZV9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZGVsZXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZGVsZXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjM4OAogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI5NwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY3JlYXRvcigpLCBlcnIuTk9UX0NSRUFUT1IKICAgIGFzc2VydCAvLyBTZW5kZXIgaXMgbm90IGFwcCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzAwCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlID09IEdsb2JhbC5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weToyOTktMzAxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgPT0gR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyApLCBlcnIuVU5ERUxFVEVEX0JPWEVTCiAgICBhc3NlcnQgLy8gTm90IGFsbCBib3hlcyBkZWxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzAzLTMwNwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PVVJbnQ2NCgwKSwKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMDQKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMDYKICAgIC8vIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMDUKICAgIC8vIGFtb3VudD1VSW50NjQoMCksCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMDMKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjMwMy0zMDcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQoMCksCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjI4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJEZWxldGVBcHBsaWNhdGlvbiIsKSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGVfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjMxMS0zMTQKICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tIEdldHRlciBtZXRob2RzIC0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgY2FsbHN1YiBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94CiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGNhbGxzdWIgc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3Rlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF92b3RlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozNjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDY0PgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjM3NgogICAgLy8gcmVzdWx0cyA9IGFyYzQuRHluYW1pY0FycmF5W3R5cC5Wb3RlUmVzdWx0XSgpCiAgICBwdXNoYnl0ZXMgMHgwMDAwCiAgICBpbnRjXzAgLy8gMAoKZ2V0X3ZvdGVzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozNzcKICAgIC8vIGZvciBwcm9wb3NhbF9pZCBpbiBwcm9wb3NhbF9pZHM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBnZXRfdm90ZXNfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozNzgKICAgIC8vIFt2YWwsIGlzX3ZhbGlkXSA9IHNlbGYuZ2V0X3ZvdGUocHJvcG9zYWxfaWQpCiAgICBjYWxsc3ViIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5nZXRfdm90ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjM3OQogICAgLy8gcmVzdWx0cy5hcHBlbmQodHlwLlZvdGVSZXN1bHQodmFsLmNvcHkoKSwgYXJjNC5Cb29sKGlzX3ZhbGlkKSkpCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBkaWcgMwogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdCAvLyBvbiBlcnJvcjogbWF4IGFycmF5IGxlbmd0aCBleGNlZWRlZAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHJlcGxhY2UyIDAKICAgIGJ1cnkgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBnZXRfdm90ZXNfZm9yX2hlYWRlckAyCgpnZXRfdm90ZXNfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgZGlnIDIKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlX2JveChwcm9wb3NhbF9pZDogYnl0ZXMpIC0+IGJ5dGVzLCB1aW50NjQ6CnNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5nZXRfdm90ZV9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzExLTMxOAogICAgLy8gIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0gR2V0dGVyIG1ldGhvZHMgLS0tLS0tLS0tCiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3ZvdGVfYm94KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQ6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiB0dXBsZVt0eXAuVm90ZSwgYm9vbF06CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMjkKICAgIC8vIHByb3Bvc2FsX2FwcCA9IEFwcGxpY2F0aW9uKHByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpKQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzMxCiAgICAvLyBleGlzdHMgPSBwcm9wb3NhbF9hcHAgaW4gc2VsZi5wcm9wb3NhbHNfdm90ZV9ib3gKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHg3MDc2CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjMzMgogICAgLy8gaWYgZXhpc3RzOgogICAgYnogc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlX2JveF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjMzMwogICAgLy8gdmFsID0gc2VsZi5wcm9wb3NhbHNfdm90ZV9ib3hbcHJvcG9zYWxfYXBwXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbHNfdm90ZV9ib3ggZW50cnkgZXhpc3RzCgpzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozMzcKICAgIC8vIHJldHVybiB2YWwuY29weSgpLCBleGlzdHMKICAgIGZyYW1lX2RpZyAxCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgpzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94X2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjMzNQogICAgLy8gdmFsID0gdHlwLlZvdGUoYXBwcm92YWw9YXJjNC5VSW50NjQoMCksIHJlamVjdGlvbj1hcmM0LlVJbnQ2NCgwKSkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBiIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5nZXRfdm90ZV9ib3hfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlKHByb3Bvc2FsX2lkOiBieXRlcykgLT4gYnl0ZXMsIHVpbnQ2NDoKc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3JlcHJlc2VudGF0aXZlL2NvbnRyYWN0LnB5OjMzOS0zNDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF92b3RlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQ6IGFyYzQuVUludDY0LAogICAgLy8gKSAtPiB0dXBsZVt0eXAuVm90ZSwgYm9vbF06CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozNTQKICAgIC8vIFt2YWwsIGV4aXN0c10gPSBzZWxmLmdldF92b3RlX2JveChwcm9wb3NhbF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm94CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzU2CiAgICAvLyBpc192YWxpZCA9IGV4aXN0cyBhbmQgc2VsZi5wYXVzZWQudmFsdWUgPT0gVUludDY0KDApCiAgICBieiBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZCBleGlzdHMKICAgIGJueiBzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQoKc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9yZXByZXNlbnRhdGl2ZS9jb250cmFjdC5weTozNTgKICAgIC8vIHJldHVybiB2YWwuY29weSgpLCBpc192YWxpZAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgcmV0c3ViCgpzbWFydF9jb250cmFjdHMucmVwcmVzZW50YXRpdmUuY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGVfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgc21hcnRfY29udHJhY3RzLnJlcHJlc2VudGF0aXZlLmNvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5yZXByZXNlbnRhdGl2ZS5jb250cmFjdC5SZXByZXNlbnRhdGl2ZS5pc19yZXByZXNlbnRhdGl2ZSgpIC0+IHVpbnQ2NDoKaXNfcmVwcmVzZW50YXRpdmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcmVwcmVzZW50YXRpdmUvY29udHJhY3QucHk6MzkyCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBzZWxmLnJlcHJlc2VudGF0aXZlX2FkZHJlc3MudmFsdWUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXByZXNlbnRhdGl2ZV9hZGRyZXNzIGV4aXN0cwogICAgPT0KICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [449], "errorMessage": "Contract is paused"}, {"pc": [648], "errorMessage": "Not all boxes deleted"}, {"pc": [245], "errorMessage": "OnCompletion must be DeleteApplication && can only call when not creating"}, {"pc": [153], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [257], "errorMessage": "OnCompletion must be UpdateApplication && can only call when not creating"}, {"pc": [579], "errorMessage": "Proposal is in voting stage"}, {"pc": [443], "errorMessage": "Proposal is not part of xGov Registry"}, {"pc": [462], "errorMessage": "Representative vote was already published"}, {"pc": [302, 318, 639], "errorMessage": "Sender is not app creator"}, {"pc": [279, 344, 366, 424, 555], "errorMessage": "Unauthorized"}, {"pc": [471, 478], "errorMessage": "Vote not in PPM"}, {"pc": [97], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [102], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [108], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [114], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [499], "errorMessage": "Wrong Receiver"}, {"pc": [503], "errorMessage": "Wrong payment amount"}, {"pc": [420, 487, 551, 593, 644], "errorMessage": "account funded"}, {"pc": [429, 439], "errorMessage": "application exists"}, {"pc": [447, 871], "errorMessage": "check self.paused exists"}, {"pc": [828], "errorMessage": "check self.proposals_vote_box entry exists"}, {"pc": [528], "errorMessage": "check self.registry_app exists"}, {"pc": [327, 351, 373, 507, 615, 891], "errorMessage": "check self.representative_address exists"}, {"pc": [761], "errorMessage": "index access is out of bounds"}, {"pc": [723], "errorMessage": "invalid array length header"}, {"pc": [735], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint64>"}, {"pc": [268], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [276, 312, 401, 543, 676, 700], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [412], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.Vote"}, {"pc": [776], "errorMessage": "max array length exceeded"}, {"pc": [392], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+# Declared only: parsed on first use of `APP_SPEC`, not at import
+APP_SPEC: algokit_utils.Arc56Contract
+
+def __getattr__(name: str) -> algokit_utils.Arc56Contract:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -71,6 +82,15 @@ class Vote:
     rejection: int
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SyncXgovRegistryArgs:
+    """Dataclass for sync_xgov_registry arguments"""
+    xgov_registry_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "sync_xgov_registry(uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class PublishVoteArgs:
     """Dataclass for publish_vote arguments"""
@@ -109,14 +129,24 @@ class GetVoteArgs:
     def abi_method_signature(self) -> str:
         return "get_vote(uint64)((uint64,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetVotesArgs:
+    """Dataclass for get_votes arguments"""
+    proposal_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_votes(uint64[])((uint64,uint64),bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateArgs:
     """Dataclass for create arguments"""
     representative_address: str
+    xgov_registry_id: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "create(address)void"
+        return "create(address,uint64)void"
 
 
 class _RepresentativeUpdate:
@@ -165,6 +195,19 @@ class RepresentativeParams:
     def delete(self) -> "_RepresentativeDelete":
         return _RepresentativeDelete(self.app_client)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_xgov_registry(uint64)void",
+            "args": method_args,
+        }))
+
     def pause(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -239,16 +282,29 @@ class RepresentativeParams:
             "args": method_args,
         }))
 
+    def get_votes(
+        self,
+        args: tuple[list[int]] | GetVotesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_votes(uint64[])((uint64,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def create(
         self,
-        args: tuple[str] | CreateArgs,
+        args: tuple[str, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create(address)void",
+            "method": "create(address,uint64)void",
             "args": method_args,
         }))
 
@@ -309,6 +365,19 @@ class RepresentativeCreateTransactionParams:
     def delete(self) -> "_RepresentativeDeleteTransaction":
         return _RepresentativeDeleteTransaction(self.app_client)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_xgov_registry(uint64)void",
+            "args": method_args,
+        }))
+
     def pause(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -383,16 +452,29 @@ class RepresentativeCreateTransactionParams:
             "args": method_args,
         }))
 
+    def get_votes(
+        self,
+        args: tuple[list[int]] | GetVotesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_votes(uint64[])((uint64,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def create(
         self,
-        args: tuple[str] | CreateArgs,
+        args: tuple[str, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create(address)void",
+            "method": "create(address,uint64)void",
             "args": method_args,
         }))
 
@@ -459,6 +541,22 @@ class RepresentativeSend:
     def delete(self) -> "_RepresentativeDeleteSend":
         return _RepresentativeDeleteSend(self.app_client)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_xgov_registry(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def pause(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -551,9 +649,25 @@ class RepresentativeSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[int, int], bool]], parsed_response)
 
+    def get_votes(
+        self,
+        args: tuple[list[int]] | GetVotesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[int, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_votes(uint64[])((uint64,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[int, int], bool]]], parsed_response)
+
     def create(
         self,
-        args: tuple[str] | CreateArgs,
+        args: tuple[str, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -561,7 +675,7 @@ class RepresentativeSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create(address)void",
+            "method": "create(address,uint64)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -582,6 +696,7 @@ class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     representative_address: str
     registry_app: int
+    xgov_registry_app: int
     paused: int
 
 class RepresentativeState:
@@ -643,6 +758,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def xgov_registry_app(self) -> int:
+        """Get the current value of the xgov_registry_app key in global_state state"""
+        value = self.app_client.state.global_state.get_value("xgov_registry_app")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
     @property
     def paused(self) -> int:
         """Get the current value of the paused key in global_state state"""
@@ -757,7 +880,7 @@ class RepresentativeClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -790,7 +913,7 @@ class RepresentativeClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -812,7 +935,7 @@ class RepresentativeClient:
     ) -> "RepresentativeClient":
         return RepresentativeClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -863,6 +986,12 @@ class RepresentativeClient:
     def new_group(self) -> "RepresentativeComposer":
         return RepresentativeComposer(self)
 
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["sync_xgov_registry(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -902,7 +1031,13 @@ class RepresentativeClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create(address)void"],
+        method: typing.Literal["get_votes(uint64[])((uint64,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[int, int], bool]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create(address,uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
@@ -928,7 +1063,7 @@ class RepresentativeClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | tuple[tuple[int, int], bool]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | list[tuple[tuple[int, int], bool]] | tuple[tuple[int, int], bool]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1026,7 +1161,7 @@ class RepresentativeFactory(algokit_utils.TypedAppFactoryProtocol[Representative
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1154,6 +1289,26 @@ class RepresentativeFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the sync_xgov_registry(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "sync_xgov_registry(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def pause(
         self,
         *,
@@ -1272,20 +1427,40 @@ class RepresentativeFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_votes(
+        self,
+        args: tuple[list[int]] | GetVotesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_votes(uint64[])((uint64,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_votes(uint64[])((uint64,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create(
         self,
-        args: tuple[str] | CreateArgs,
+        args: tuple[str, int] | CreateArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create(address)void ABI method"""
+        """Creates a new instance using the create(address,uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create(address)void",
+                "method": "create(address,uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1424,19 +1599,19 @@ class RepresentativeFactorySendCreate:
 
     def create(
         self,
-        args: tuple[str] | CreateArgs,
+        args: tuple[str, int] | CreateArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[RepresentativeClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
-            """Creates and sends a transaction using the create(address)void ABI method"""
+            """Creates and sends a transaction using the create(address,uint64)void ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
                     **dataclasses.asdict(params),
-                    "method": "create(address)void",
+                    "method": "create(address,uint64)void",
                     "args": _parse_abi_args(args),
                     }
                 ),
@@ -1522,6 +1697,24 @@ class RepresentativeComposer:
     def delete(self) -> "_RepresentativeDeleteComposer":
         return _RepresentativeDeleteComposer(self)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "RepresentativeComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.sync_xgov_registry(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "sync_xgov_registry(uint64)void", v
+            )
+        )
+        return self
+
     def pause(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1628,9 +1821,27 @@ class RepresentativeComposer:
         )
         return self
 
+    def get_votes(
+        self,
+        args: tuple[list[int]] | GetVotesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "RepresentativeComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_votes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_votes(uint64[])((uint64,uint64),bool)[]", v
+            )
+        )
+        return self
+
     def create(
         self,
-        args: tuple[str] | CreateArgs,
+        args: tuple[str, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "RepresentativeComposer":
         self._composer.add_app_call_method_call(
@@ -1641,7 +1852,7 @@ class RepresentativeComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create(address)void", v
+                "create(address,uint64)void", v
             )
         )
         return self
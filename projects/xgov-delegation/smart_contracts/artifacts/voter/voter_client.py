@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -19,8 +20,18 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Create a new Voter.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "desc": "Update the contract.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "address", "desc": "Address of the new manager.", "name": "manager_address"}], "name": "assign_xgov", "returns": {"type": "void"}, "desc": "Assign the contract to an xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new manager.", "name": "manager_address"}], "name": "set_manager", "returns": {"type": "void"}, "desc": "Set a new manager.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the new representative.", "name": "representative_id"}], "name": "set_representative", "returns": {"type": "void"}, "desc": "Set a new representative.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The new time window in seconds before proposal voting period ends that representative can cast the vote. Set to 0 to not have any delay.", "name": "window_ts"}], "name": "set_window", "returns": {"type": "void"}, "desc": "Set a new window when vote can be cast as representative.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of proposal to vote on.", "name": "proposal_id"}], "name": "vote_representative", "returns": {"type": "void"}, "desc": "Vote on a proposal according to vote of representative if time is within window.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of proposal to vote on.", "name": "proposal_id"}, {"type": "(uint64,uint64)", "desc": "xGov's vote for the proposal. Expressed in number of approvals and rejections.", "name": "vote", "struct": "VoteRaw"}], "name": "vote_direct", "returns": {"type": "void"}, "desc": "Vote directly on a proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The voting account address to delegate voting power to.", "name": "voting_address"}], "name": "yield_voting_rights", "returns": {"type": "void"}, "desc": "Yield voting rights to another account.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Number of approved votes to add.", "name": "add_votes"}], "name": "add_votes", "returns": {"type": "void"}, "desc": "Increase votes left.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete", "returns": {"type": "void"}, "desc": "Delete the Voter.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}], "name": "Voter", "state": {"keys": {"box": {}, "global": {"xgov_address": {"key": "eGdvdl9hZGRyZXNz", "keyType": "AVMBytes", "valueType": "address"}, "registry_app": {"key": "cmVnaXN0cnlfYXBw", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "representative_app": {"key": "cmVwcmVzZW50YXRpdmVfYXBw", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "window_ts": {"key": "d2luZG93X3Rz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "votes_left": {"key": "dm90ZXNfbGVmdA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "manager_address": {"key": "bWFuYWdlcl9hZGRyZXNz", "keyType": "AVMBytes", "valueType": "address"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 32, "ints": 32}, "local": {"bytes": 8, "ints": 8}}}, "structs": {"VoteRaw": [{"name": "approvals", "type": "uint64"}, {"name": "rejections", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAAEIIMCEPSYJDHhnb3ZfYWRkcmVzcwxyZWdpc3RyeV9hcHAKdm90ZXNfbGVmdAl3aW5kb3dfdHMPbWFuYWdlcl9hZGRyZXNzEnJlcHJlc2VudGF0aXZlX2FwcBF4Z292X3JlZ2lzdHJ5X2FwcAQVH3x1BBWPjdYxGEAAKjE1JRJEMTQlEkQxNyQSRDE2JBJEKDIDZykiZycFImcrImcqImcnBDIDZ4ICBKDoGHIEJDeNPDYaAI4CAGMAVzEZFEQxGEEAQIIIBG6TIwYElmfW3gRB67AWBMs470QEdX4p/AQU407qBLpg2FQEKSPz0TYaAI4IAEsAawB9AJgAqgHFAhQCVgCABExcYbo2GgCOAQAZADEZgQUSMRgQREICVTEZgQQSMRgQREIAHDINRCkyDWcoMgNnJwQyA2cnBSJnKyJnKiJnI0MxADIJEkQjQzYaAUkVJRJENhoCSRUlEkQxADIJEkQoTwJnJwRMZyNDNhoBSRUlEkSIAhREJwRMZyNDNhoBSRUkEkSIAgJEFycFSwFncgdEMgkSRCNDNhoBSRUkEkSIAedEFytMZyNDNhoBRwIVJBJEMQAyCRJEiAHnRCIqZURJRCMJKkxnIitlREEAPkkXSYAWdm90ZV9vcGVuaW5nX3RpbWVzdGFtcGVITIAPdm90aW5nX2R1cmF0aW9uZUgIMgciK2VETwJMCQ1EIicFZURJcgdFAUSxshiABG6oHrGyGkcCshqBBrIQIrIBs7Q+SVcEAEkVgRESREsBVwAEJwcSRExXBBBMgYABU0SxIihlREsCF7IYgAQkYV+QshpJshqBBrIQIrIBs7Q+SVcEAEkVgQkSREsBVwAEJwcSRIFAU0SBBFtLAiJbSwELIQQKTwMkW08CCyEECrFMFkwWIillRCcGZUiyGCcIshpPA7IaTwKyGkyyGrIagQayECKyAbMjQzYaAUkVJBJENhoCSRWBEBJEiACxREsBiADERLEiKGVESwFXAAhPAlcICCIpZUQnBmVIshgnCLIaTwOyGk8CshpMshqyGoEGshAisgGzI0M2GgFJFSUSRIgAa0AACDEAMgkSQQAoI0SxIihlRCIpZUQnBmVIshiABA2ieIWyGrIaSbIagQayECKyAbMjQyJC/9U2GgFJFSQSRDEAMgkSRCIqZURMFwgqTGcjQzEAMgkSRLEyCUmyCSKyCLIHI7IQIrIBsyNDMQAiKGVEEkAACzEAIicEZUQSQQACI4kiiYoBAYv/F3IHRCIpZUQnBmVIcghEEok=", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAxMDAwMDAwCiAgICBieXRlY2Jsb2NrIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQgMHg3NzY5NmU2NDZmNzc1Zjc0NzMgMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMgMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTcwNzAgMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwIDB4MTUxZjdjNzUgMHgxNThmOGRkNgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQxLTQyCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IGNmZy5HTE9CQUxfQllURVMsIGVyci5XUk9OR19HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fdWludCA9PSBjZmcuR0xPQkFMX1VJTlRTLCBlcnIuV1JPTkdfR0xPQkFMX1VJTlRTCiAgICB0eG4gR2xvYmFsTnVtVWludAogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDQKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV91aW50ID09IGNmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTAKICAgIC8vIGtleT1jZmcuR1NfS0VZX1hHT1ZfQUREUkVTUywKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo0OQogICAgLy8gQWNjb3VudCgpLAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDctNTEKICAgIC8vICMgR2xvYmFsIFZhcmlhYmxlcwogICAgLy8gc2VsZi54Z292X2FkZHJlc3MgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBY2NvdW50KCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfWEdPVl9BRERSRVNTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NAogICAgLy8ga2V5PWNmZy5HU19LRVlfUkVHSVNUUllfQVBQLAogICAgYnl0ZWNfMSAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBBcHBsaWNhdGlvbigpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1Mi01NQogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbigpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1JFR0lTVFJZX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTgKICAgIC8vIGtleT1jZmcuR1NfS0VZX1JFUFJFU0VOVEFUSVZFX0FQUCwKICAgIGJ5dGVjIDUgLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTcwNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NwogICAgLy8gQXBwbGljYXRpb24oKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTYtNTkKICAgIC8vIHNlbGYucmVwcmVzZW50YXRpdmVfYXBwID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgQXBwbGljYXRpb24oKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9SRVBSRVNFTlRBVElWRV9BUFAsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9XSU5ET1dfVFMsCiAgICBieXRlY18zIC8vIDB4Nzc2OTZlNjQ2Zjc3NWY3NDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NjEKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MC02MwogICAgLy8gc2VsZi53aW5kb3dfdHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9XSU5ET1dfVFMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjY2CiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9WT1RFU19MRUZULAogICAgYnl0ZWNfMiAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NjUKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2NC02NwogICAgLy8gc2VsZi52b3Rlc19sZWZ0ID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfVk9URVNfTEVGVCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NzAKICAgIC8vIGtleT1jZmcuR1NfS0VZX01BTkFHRVJfQUREUkVTUywKICAgIGJ5dGVjIDQgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2OQogICAgLy8gQWNjb3VudCgpLAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NjgtNzEKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyZXNzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgQWNjb3VudCgpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX01BTkFHRVJfQUREUkVTUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMC0zOQogICAgLy8gY2xhc3MgVm90ZXIoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlc3MgMHhhMGU4MTg3MiAweDI0Mzc4ZDNjIC8vIG1ldGhvZCAidXBkYXRlKCl2b2lkIiwgbWV0aG9kICJkZWxldGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3VwZGF0ZV9yb3V0ZUA0IG1haW5fZGVsZXRlX3JvdXRlQDUKCm1haW5fc3dpdGNoX2Nhc2VfbmV4dEA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMwLTM5CiAgICAvLyBjbGFzcyBWb3RlcigKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTAsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDE3CiAgICBwdXNoYnl0ZXNzIDB4NmU5MzIzMDYgMHg5NjY3ZDZkZSAweDQxZWJiMDE2IDB4Y2IzOGVmNDQgMHg3NTdlMjlmYyAweDE0ZTM0ZWVhIDB4YmE2MGQ4NTQgMHgyOTIzZjNkMSAvLyBtZXRob2QgImFzc2lnbl94Z292KGFkZHJlc3MsYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJzZXRfbWFuYWdlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF9yZXByZXNlbnRhdGl2ZSh1aW50NjQpdm9pZCIsIG1ldGhvZCAic2V0X3dpbmRvdyh1aW50NjQpdm9pZCIsIG1ldGhvZCAidm90ZV9yZXByZXNlbnRhdGl2ZSh1aW50NjQpdm9pZCIsIG1ldGhvZCAidm90ZV9kaXJlY3QodWludDY0LCh1aW50NjQsdWludDY0KSl2b2lkIiwgbWV0aG9kICJ5aWVsZF92b3RpbmdfcmlnaHRzKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiYWRkX3ZvdGVzKHVpbnQ2NCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggYXNzaWduX3hnb3Ygc2V0X21hbmFnZXIgc2V0X3JlcHJlc2VudGF0aXZlIHNldF93aW5kb3cgdm90ZV9yZXByZXNlbnRhdGl2ZSB2b3RlX2RpcmVjdCB5aWVsZF92b3RpbmdfcmlnaHRzIGFkZF92b3RlcwogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMwLTM5CiAgICAvLyBjbGFzcyBWb3RlcigKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTAsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgcHVzaGJ5dGVzIDB4NGM1YzYxYmEgLy8gbWV0aG9kICJjcmVhdGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKbWFpbl9kZWxldGVfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPSgiRGVsZXRlQXBwbGljYXRpb24iLCkpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBEZWxldGVBcHBsaWNhdGlvbiAmJiBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBiIGRlbGV0ZQoKbWFpbl91cGRhdGVfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo5OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgVXBkYXRlQXBwbGljYXRpb24gJiYgY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYiB1cGRhdGUKCgovLyBzbWFydF9jb250cmFjdHMudm90ZXIuY29udHJhY3QuVm90ZXIuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBHbG9iYWwuY2FsbGVyX2FwcGxpY2F0aW9uX2lkICE9IDAKICAgIGdsb2JhbCBDYWxsZXJBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6ODQtODYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCAhPSAwCiAgICAvLyApLCBlcnIuVU5BVVRIT1JJWkVEICAjIE9ubHkgY2FsbGFibGUgYnkgYW5vdGhlciBjb250cmFjdAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSA9IEFwcGxpY2F0aW9uKEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQpCiAgICBieXRlY18xIC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICBnbG9iYWwgQ2FsbGVyQXBwbGljYXRpb25JRAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo5MAogICAgLy8gc2VsZi54Z292X2FkZHJlc3MudmFsdWUgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6OTEKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlID0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgYnl0ZWMgNCAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBzZWxmLnJlcHJlc2VudGF0aXZlX2FwcC52YWx1ZSA9IEFwcGxpY2F0aW9uKCkKICAgIGJ5dGVjIDUgLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTcwNzAKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjkzCiAgICAvLyBzZWxmLndpbmRvd190cy52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMyAvLyAweDc3Njk2ZTY0NmY3NzVmNzQ3MwogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6OTQKICAgIC8vIHNlbGYudm90ZXNfbGVmdC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo3MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnVwZGF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNzcKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMDcKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmFzc2lnbl94Z292W3JvdXRpbmddKCkgLT4gdm9pZDoKYXNzaWduX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTExCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNzcKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMjcKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gc2VsZi54Z292X2FkZHJlc3MudmFsdWUgPSB4Z292X2FkZHJlc3MubmF0aXZlCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICB1bmNvdmVyIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTMwCiAgICAvLyBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZSA9IG1hbmFnZXJfYWRkcmVzcy5uYXRpdmUKICAgIGJ5dGVjIDQgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTExCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5zZXRfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEzNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9vcl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9vcl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZSA9IG1hbmFnZXJfYWRkcmVzcy5uYXRpdmUKICAgIGJ5dGVjIDQgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTM0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5zZXRfcmVwcmVzZW50YXRpdmVbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfcmVwcmVzZW50YXRpdmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9vcl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9vcl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTcxCiAgICAvLyBzZWxmLnJlcHJlc2VudGF0aXZlX2FwcC52YWx1ZSA9IEFwcGxpY2F0aW9uKHJlcHJlc2VudGF0aXZlX2lkLmFzX3VpbnQ2NCgpKQogICAgYnRvaQogICAgYnl0ZWMgNSAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNzA3MAogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzczCiAgICAvLyBhc3NlcnQgYXBwLmNyZWF0b3IgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgZXJyLlVOUkVMQVRFRF9BUFAKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcENyZWF0b3IKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBBcHAgd2FzIG5vdCBjcmVhdGVkIGJ5IHJlZ2lzdHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5zZXRfd2luZG93W3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3dpbmRvdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxNzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTkyCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X29yX21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxOTQKICAgIC8vIHNlbGYud2luZG93X3RzLnZhbHVlID0gd2luZG93X3RzLmFzX3VpbnQ2NCgpCiAgICBidG9pCiAgICBieXRlY18zIC8vIDB4Nzc2OTZlNjQ2Zjc3NWY3NDczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90ZXIuY29udHJhY3QuVm90ZXIudm90ZV9yZXByZXNlbnRhdGl2ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGVfcmVwcmVzZW50YXRpdmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM3NwogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjIyMAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY3JlYXRvcigpLCBlcnIuTk9UX0NSRUFUT1IKICAgIGFzc2VydCAvLyBTZW5kZXIgaXMgbm90IGFwcCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjIxCiAgICAvLyBhc3NlcnQgc2VsZi5pc192YWxpZF9wcm9wb3NhbChwcm9wb3NhbF9pZCksIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBjYWxsc3ViIGlzX3ZhbGlkX3Byb3Bvc2FsCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgaXMgbm90IHBhcnQgb2YgeEdvdiBSZWdpc3RyeQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjIyMwogICAgLy8gYXNzZXJ0IHNlbGYudm90ZXNfbGVmdC52YWx1ZSA+IDAsIGVyci5OT19WT1RFU19MRUZUCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXNfbGVmdCBleGlzdHMKICAgIGR1cAogICAgYXNzZXJ0IC8vIE5vIHBhaWQgdm90ZXMgbGVmdCB0byBjYXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjI0CiAgICAvLyBzZWxmLnZvdGVzX2xlZnQudmFsdWUgLT0gMQogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzIgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyMjYtMjI3CiAgICAvLyAjIENoZWNrIGlmIGFsbG93ZWQgdG8gdm90ZSBhY2NvcmRpbmcgdG8gcmVwcmVzZW50YXRpdmUKICAgIC8vIGlmIHNlbGYud2luZG93X3RzLnZhbHVlOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gMHg3NzY5NmU2NDZmNzc1Zjc0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53aW5kb3dfdHMgZXhpc3RzCiAgICBieiB2b3RlX3JlcHJlc2VudGF0aXZlX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjIyOQogICAgLy8gcHJvcG9zYWxfaWQuYXNfdWludDY0KCkKICAgIGR1cAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL3V0aWxzLnB5OjIyLTI1CiAgICAvLyB2b3RlX29wZW5fdHMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIHByb3BfY2ZnLkdTX0tFWV9WT1RFX09QRU5fVFMsCiAgICAvLyApCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC91dGlscy5weToyNAogICAgLy8gcHJvcF9jZmcuR1NfS0VZX1ZPVEVfT1BFTl9UUywKICAgIHB1c2hieXRlcyAweDc2NmY3NDY1NWY2ZjcwNjU2ZTY5NmU2NzVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvdXRpbHMucHk6MjItMjUKICAgIC8vIHZvdGVfb3Blbl90cywgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgcHJvcF9jZmcuR1NfS0VZX1ZPVEVfT1BFTl9UUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC91dGlscy5weToyOQogICAgLy8gcHJvcF9jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTiwKICAgIHB1c2hieXRlcyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL3V0aWxzLnB5OjI3LTMwCiAgICAvLyB2b3RpbmdfZHVyYXRpb24sIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIHByb3BfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT04sCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvdXRpbHMucHk6MzIKICAgIC8vIHJldHVybiB2b3RlX29wZW5fdHMgKyB2b3RpbmdfZHVyYXRpb24KICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyMzIKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gdm90ZV9jbG9zZV90cyAtIHNlbGYud2luZG93X3RzLnZhbHVlCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDc3Njk2ZTY0NmY3NzVmNzQ3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndpbmRvd190cyBleGlzdHMKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgLQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjIzMS0yMzMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiB2b3RlX2Nsb3NlX3RzIC0gc2VsZi53aW5kb3dfdHMudmFsdWUKICAgIC8vICksIGVyci5UT09fU09PTl9UT19WT1RFCiAgICBhc3NlcnQgLy8gVG9vIHNvb24gdG8gdm90ZQoKdm90ZV9yZXByZXNlbnRhdGl2ZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjM1LTIzNgogICAgLy8gIyBHZXQgdm90ZSBmcm9tIHJlcHJlc2VudGF0aXZlCiAgICAvLyBjcmVhdG9yLCBleGlzdHMgPSBvcC5BcHBQYXJhbXNHZXQuYXBwX2NyZWF0b3Ioc2VsZi5yZXByZXNlbnRhdGl2ZV9hcHAudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcHJlc2VudGF0aXZlX2FwcCBleGlzdHMKICAgIGR1cAogICAgYXBwX3BhcmFtc19nZXQgQXBwQ3JlYXRvcgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjM3CiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuUkVQUkVTRU5UQVRJVkVfTk9ORVhJU1RFTlQKICAgIGFzc2VydCAvLyBSZXByZXNlbnRhdGl2ZSBpcyBub25leGlzdGVudAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjIzOS0yNDMKICAgIC8vIFt2b3RlLCBpc192YWxpZF0sIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfY29udHJhY3QuUmVwcmVzZW50YXRpdmUuZ2V0X3ZvdGUsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYucmVwcmVzZW50YXRpdmVfYXBwLnZhbHVlLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHg2ZWE4MWViMSAvLyBtZXRob2QgImdldF92b3RlKHVpbnQ2NCkoKHVpbnQ2NCx1aW50NjQpLGJvb2wpIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGR1cG4gMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDE3IC8vIDE3CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnR1cGxlPHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlZvdGUsYXJjNC5ib29sPgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlYyA3IC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIHN3YXAKICAgIGV4dHJhY3QgNCAxNgogICAgc3dhcAogICAgcHVzaGludCAxMjggLy8gMTI4CiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyNDQKICAgIC8vIGFzc2VydCBpc192YWxpZCwgZXJyLlZPVEVfSU5WQUxJRAogICAgYXNzZXJ0IC8vIFJlcHJlc2VudGF0aXZlIHZvdGUgaXMgaW52YWxpZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI0Ni0yNTEKICAgIC8vICMgR2V0IHZvdGVyJ3MgYm94CiAgICAvLyBbdm90ZXMsIGV4aXN0c10sIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVByb3Bvc2FsLmdldF92b3Rlcl9ib3gsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQuYXNfdWludDY0KCksCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjQ5CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2FkZHJlc3MgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjUwCiAgICAvLyBhcHBfaWQ9cHJvcG9zYWxfaWQuYXNfdWludDY0KCksCiAgICBkaWcgMgogICAgYnRvaQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjQ2LTI1MQogICAgLy8gIyBHZXQgdm90ZXIncyBib3gKICAgIC8vIFt2b3RlcywgZXhpc3RzXSwgdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJUHJvcG9zYWwuZ2V0X3ZvdGVyX2JveCwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZC5hc191aW50NjQoKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDI0NjE1ZjkwIC8vIG1ldGhvZCAiZ2V0X3ZvdGVyX2JveChhZGRyZXNzKSh1aW50NjQsYm9vbCkiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOSAvLyA5CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnR1cGxlPGFyYzQudWludDY0LGFyYzQuYm9vbD4KICAgIGRpZyAxCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWMgNyAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyNTIKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5OT19WT1RFUwogICAgYXNzZXJ0IC8vIHhHb3YgZG9lcyBub3QgaGF2ZSBhbnkgdm90ZXMKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjU0LTI1NQogICAgLy8gIyBDYWxjdWxhdGUgdm90ZXMKICAgIC8vIGFwcHJvdmFscyA9ICh2b3Rlcy5hc191aW50NjQoKSAqIHZvdGUuYXBwcm92YWwuYXNfdWludDY0KCkpIC8vIGNvbnN0LlBQTQogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAxCiAgICAqCiAgICBpbnRjIDQgLy8gMTAwMDAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gcmVqZWN0aW9ucyA9ICh2b3Rlcy5hc191aW50NjQoKSAqIHZvdGUucmVqZWN0aW9uLmFzX3VpbnQ2NCgpKSAvLyBjb25zdC5QUE0KICAgIHVuY292ZXIgMwogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICB1bmNvdmVyIDIKICAgICoKICAgIGludGMgNCAvLyAxMDAwMDAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjU4LTI2NgogICAgLy8gIyBWb3RlCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbCwKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgIGFwcHJvdmFscywKICAgIC8vICAgICByZWplY3Rpb25zLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLmdldF94Z292X3JlZ2lzdHJ5X2lkKCksCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjYzCiAgICAvLyBhcHByb3ZhbHMsCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjY0CiAgICAvLyByZWplY3Rpb25zLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozOTAKICAgIC8vIHJlZ19jZmcuR1NfS0VZX1hHT1ZfUkVHSVNUUllfQVBQLAogICAgYnl0ZWMgNiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODgtMzkxCiAgICAvLyB4Z292X3JlZ2lzdHJ5X2lkLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIC8vICAgICByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI1OC0yNjYKICAgIC8vICMgVm90ZQogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJWEdvdlJlZ2lzdHJ5LnZvdGVfcHJvcG9zYWwsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICBhcHByb3ZhbHMsCiAgICAvLyAgICAgcmVqZWN0aW9ucywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgLy8gKQogICAgYnl0ZWMgOCAvLyBtZXRob2QgInZvdGVfcHJvcG9zYWwodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxOTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnZvdGVfZGlyZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZV9kaXJlY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlZvdGVSYXcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyODgKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfb3JfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfb3JfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI4OQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfdmFsaWRfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgZGlnIDEKICAgIGNhbGxzdWIgaXNfdmFsaWRfcHJvcG9zYWwKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBpcyBub3QgcGFydCBvZiB4R292IFJlZ2lzdHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjkxLTI5OQogICAgLy8gIyBWb3RlCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbCwKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgIHZvdGUuYXBwcm92YWxzLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIHZvdGUucmVqZWN0aW9ucy5hc191aW50NjQoKSwKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI5NgogICAgLy8gdm90ZS5hcHByb3ZhbHMuYXNfdWludDY0KCksCiAgICBkaWcgMQogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyOTcKICAgIC8vIHZvdGUucmVqZWN0aW9ucy5hc191aW50NjQoKSwKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCA4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODkKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzkwCiAgICAvLyByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIGJ5dGVjIDYgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzg4LTM5MQogICAgLy8geGdvdl9yZWdpc3RyeV9pZCwgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyAgICAgcmVnX2NmZy5HU19LRVlfWEdPVl9SRUdJU1RSWV9BUFAsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyOTEtMjk5CiAgICAvLyAjIFZvdGUKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS52b3RlX3Byb3Bvc2FsLAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgdm90ZS5hcHByb3ZhbHMuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZS5yZWplY3Rpb25zLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLmdldF94Z292X3JlZ2lzdHJ5X2lkKCksCiAgICAvLyApCiAgICBieXRlYyA4IC8vIG1ldGhvZCAidm90ZV9wcm9wb3NhbCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0KXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90ZXIuY29udHJhY3QuVm90ZXIueWllbGRfdm90aW5nX3JpZ2h0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnlpZWxkX3ZvdGluZ19yaWdodHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzE3CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSBvciBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X29yX21hbmFnZXIKICAgIGJueiB5aWVsZF92b3RpbmdfcmlnaHRzX2Jvb2xfdHJ1ZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzc3CiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzE3CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSBvciBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYnogeWllbGRfdm90aW5nX3JpZ2h0c19ib29sX2ZhbHNlQDQKCnlpZWxkX3ZvdGluZ19yaWdodHNfYm9vbF90cnVlQDM6CiAgICBpbnRjXzEgLy8gMQoKeWllbGRfdm90aW5nX3JpZ2h0c19ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzE3CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSBvciBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMxOS0zMjQKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5zZXRfdm90aW5nX2FjY291bnQsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICB2b3RpbmdfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMyMQogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozOTAKICAgIC8vIHJlZ19jZmcuR1NfS0VZX1hHT1ZfUkVHSVNUUllfQVBQLAogICAgYnl0ZWMgNiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODgtMzkxCiAgICAvLyB4Z292X3JlZ2lzdHJ5X2lkLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5X2FwcC52YWx1ZSwKICAgIC8vICAgICByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMxOS0zMjQKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5zZXRfdm90aW5nX2FjY291bnQsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICB2b3RpbmdfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MGRhMjc4ODUgLy8gbWV0aG9kICJzZXRfdm90aW5nX2FjY291bnQoYWRkcmVzcyxhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGR1cAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKeWllbGRfdm90aW5nX3JpZ2h0c19ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiB5aWVsZF92b3RpbmdfcmlnaHRzX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5hZGRfdm90ZXNbcm91dGluZ10oKSAtPiB2b2lkOgphZGRfdm90ZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzI4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM3NwogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY3JlYXRvcigpLCBlcnIuTk9UX0NSRUFUT1IKICAgIGFzc2VydCAvLyBTZW5kZXIgaXMgbm90IGFwcCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzQ1CiAgICAvLyBzZWxmLnZvdGVzX2xlZnQudmFsdWUgKz0gYWRkX3ZvdGVzLmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAweDc2NmY3NDY1NzM1ZjZjNjU2Njc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXNfbGVmdCBleGlzdHMKICAgIHN3YXAKICAgIGJ0b2kKICAgICsKICAgIGJ5dGVjXzIgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmRlbGV0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlbGV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNzcKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNTgKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM2MC0zNjQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQoMCksCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzYxCiAgICAvLyByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzYzCiAgICAvLyBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGR1cAogICAgaXR4bl9maWVsZCBDbG9zZVJlbWFpbmRlclRvCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzYyCiAgICAvLyBhbW91bnQ9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzYwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNjAtMzY0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9VUludDY0KDApLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPSgiRGVsZXRlQXBwbGljYXRpb24iLCkpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmlzX3hnb3Zfb3JfbWFuYWdlcigpIC0+IHVpbnQ2NDoKaXNfeGdvdl9vcl9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM4MgogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2FkZHJlc3MgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM4Mi0zODMKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi54Z292X2FkZHJlc3MudmFsdWUKICAgIC8vIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUKICAgIGJueiBpc194Z292X29yX21hbmFnZXJfYm9vbF90cnVlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODMKICAgIC8vIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFuYWdlcl9hZGRyZXNzIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODItMzgzCiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlCiAgICAvLyBvciBUeG4uc2VuZGVyID09IHNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlCiAgICBieiBpc194Z292X29yX21hbmFnZXJfYm9vbF9mYWxzZUAzCgppc194Z292X29yX21hbmFnZXJfYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM4MS0zODQKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZQogICAgLy8gICAgIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUKICAgIC8vICkKICAgIHJldHN1YgoKaXNfeGdvdl9vcl9tYW5hZ2VyX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzgxLTM4NAogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlCiAgICAvLyAgICAgb3IgVHhuLnNlbmRlciA9PSBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmlzX3ZhbGlkX3Byb3Bvc2FsKHByb3Bvc2FsX2lkOiBieXRlcykgLT4gdWludDY0Ogppc192YWxpZF9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozOTQtMzk1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGlzX3ZhbGlkX3Byb3Bvc2FsKHNlbGYsIHByb3Bvc2FsX2lkOiBhcmM0LlVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM5NgogICAgLy8gcHJvcG9zYWxfY3JlYXRvciA9IEFwcGxpY2F0aW9uKHByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpKS5jcmVhdG9yCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcENyZWF0b3IKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODkKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzkwCiAgICAvLyByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIGJ5dGVjIDYgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzg4LTM5MQogICAgLy8geGdvdl9yZWdpc3RyeV9pZCwgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyAgICAgcmVnX2NmZy5HU19LRVlfWEdPVl9SRUdJU1RSWV9BUFAsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzk4CiAgICAvLyB4Z292X3JlZ2lzdHJ5X2FkZHJlc3MgPSBBcHBsaWNhdGlvbih4Z292X3JlZ2lzdHJ5X2lkKS5hZGRyZXNzCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzk5CiAgICAvLyByZXR1cm4gcHJvcG9zYWxfY3JlYXRvciA9PSB4Z292X3JlZ2lzdHJ5X2FkZHJlc3MKICAgID09CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [411], "errorMessage": "App was not created by registry"}, {"pc": [456], "errorMessage": "No paid votes left to cast"}, {"pc": [285], "errorMessage": "OnCompletion must be DeleteApplication && can only call when not creating"}, {"pc": [193], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [297], "errorMessage": "OnCompletion must be UpdateApplication && can only call when not creating"}, {"pc": [450, 741], "errorMessage": "Proposal is not part of xGov Registry"}, {"pc": [541], "errorMessage": "Representative is nonexistent"}, {"pc": [595], "errorMessage": "Representative vote is invalid"}, {"pc": [334, 358, 446, 873, 891], "errorMessage": "Sender is not app creator"}, {"pc": [530], "errorMessage": "Too soon to vote"}, {"pc": [303, 380, 398, 425, 735, 817], "errorMessage": "Unauthorized"}, {"pc": [131], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [136], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [141], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [146], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [407, 945, 956], "errorMessage": "application exists"}, {"pc": [585, 645], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [928], "errorMessage": "check self.manager_address exists"}, {"pc": [681, 760, 826, 949], "errorMessage": "check self.registry_app exists"}, {"pc": [535], "errorMessage": "check self.representative_app exists"}, {"pc": [454, 877], "errorMessage": "check self.votes_left exists"}, {"pc": [465, 524], "errorMessage": "check self.window_ts exists"}, {"pc": [600, 746, 822, 917], "errorMessage": "check self.xgov_address exists"}, {"pc": [344, 352, 376, 801], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [636], "errorMessage": "invalid number of bytes for arc4.tuple<arc4.uint64,arc4.bool>"}, {"pc": [576], "errorMessage": "invalid number of bytes for arc4.tuple<smart_contracts.common.abi_types.Vote,arc4.bool>"}, {"pc": [394, 421, 440, 722, 867], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [731], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.VoteRaw"}, {"pc": [649], "errorMessage": "xGov does not have any votes"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "desc": "Sequence number of the Voter in the Delegation Registry.", "name": "index"}, {"type": "uint64", "desc": "ID of the xGov Registry app of the Delegation Registry.", "name": "xgov_registry_id"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new Voter.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update", "returns": {"type": "void"}, "desc": "Update the contract.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the xGov Registry app.", "name": "xgov_registry_id"}], "name": "sync_xgov_registry", "returns": {"type": "void"}, "desc": "Set the cached ID of the xGov Registry used by the Delegation Registry.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "xgov_registry_id"}], "name": "VoterXGovRegistrySynced"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the xGov.", "name": "xgov_address"}, {"type": "address", "desc": "Address of the new manager.", "name": "manager_address"}, {"type": "address", "desc": "Voting address of the xGov in the xGov Registry.", "name": "voting_address"}], "name": "assign_xgov", "returns": {"type": "void"}, "desc": "Assign the contract to an xGov.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "manager_address"}], "name": "XGovAssigned"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new manager.", "name": "manager_address"}], "name": "set_manager", "returns": {"type": "void"}, "desc": "Set a new manager.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "manager_address"}], "name": "VoterManagerSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the new representative.", "name": "representative_id"}], "name": "set_representative", "returns": {"type": "void"}, "desc": "Set a new representative.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "desc": "The application IDs of the backup representatives, in order of preference.", "name": "representative_ids"}], "name": "set_backup_representatives", "returns": {"type": "void"}, "desc": "Set the representatives whose vote is cast, in order, if the representative has no\nvalid vote. Set to an empty list to not have any backup.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64[]", "name": "representative_ids"}], "name": "BackupRepresentativesSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The new time window in seconds before proposal voting period ends that representative can cast the vote. Set to 0 to not have any delay.", "name": "window_ts"}], "name": "set_window", "returns": {"type": "void"}, "desc": "Set a new window when vote can be cast as representative.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "window_ts"}], "name": "WindowSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of proposal to vote on.", "name": "proposal_id"}], "name": "vote_representative", "returns": {"type": "void"}, "desc": "Vote on a proposal according to vote of representative if time is within window.\nIf the representative has no valid vote, the vote of the first backup representative with one is cast instead. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "representative_id"}, {"type": "uint64", "name": "approvals"}, {"type": "uint64", "name": "rejections"}, {"type": "uint64", "name": "votes_left"}], "name": "VotedByRepresentative"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "App ID of proposal to vote on.", "name": "proposal_id"}, {"type": "(uint64,uint64)", "desc": "xGov's vote for the proposal. Expressed in number of approvals and rejections.", "name": "vote", "struct": "VoteRaw"}], "name": "vote_direct", "returns": {"type": "void"}, "desc": "Vote directly on a proposal.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "approvals"}, {"type": "uint64", "name": "rejections"}], "name": "VotedDirectly"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The voting account address to delegate voting power to.", "name": "voting_address"}], "name": "yield_voting_rights", "returns": {"type": "void"}, "desc": "Yield voting rights to another account.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "voting_address"}], "name": "VotingRightsYielded"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "sync_voting_address", "returns": {"type": "void"}, "desc": "Refresh the cached voting address of the xGov from the xGov Registry.\nThe Delegation Registry reads it instead of the xGov box while it is fresh. The zero address is cached if the xGov is no longer in the xGov Registry.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "voting_address"}], "name": "VotingAddressSynced"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Number of approved votes to add.", "name": "add_votes"}], "name": "add_votes", "returns": {"type": "void"}, "desc": "Increase votes left.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "votes"}, {"type": "uint64", "name": "votes_left"}], "name": "VotesAdded"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete", "returns": {"type": "void"}, "desc": "Delete the Voter.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}], "name": "Voter", "state": {"keys": {"box": {}, "global": {"xgov_address": {"key": "eGdvdl9hZGRyZXNz", "keyType": "AVMBytes", "valueType": "address"}, "registry_app": {"key": "cmVnaXN0cnlfYXBw", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "xgov_registry_app": {"key": "eGdvdl9yZWdpc3RyeV9hcHA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "representative_app": {"key": "cmVwcmVzZW50YXRpdmVfYXBw", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "backup_representatives": {"key": "YmFja3VwX3JlcHJlc2VudGF0aXZlcw==", "keyType": "AVMBytes", "valueType": "uint64[]"}, "window_ts": {"key": "d2luZG93X3Rz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "votes_left": {"key": "dm90ZXNfbGVmdA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "manager_address": {"key": "bWFuYWdlcl9hZGRyZXNz", "keyType": "AVMBytes", "valueType": "address"}, "index": {"key": "aW5kZXg=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_address": {"key": "dm90aW5nX2FkZHJlc3M=", "keyType": "AVMBytes", "valueType": "address"}, "voting_address_ts": {"key": "dm90aW5nX2FkZHJlc3NfdHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 32, "ints": 32}, "local": {"bytes": 8, "ints": 8}}}, "structs": {"VoteRaw": [{"name": "approvals", "type": "uint64"}, {"name": "rejections", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAAEIIMCEPSYODHhnb3ZfYWRkcmVzcwp2b3Rlc19sZWZ0EXhnb3ZfcmVnaXN0cnlfYXBwFmJhY2t1cF9yZXByZXNlbnRhdGl2ZXMJd2luZG93X3RzD21hbmFnZXJfYWRkcmVzcw52b3RpbmdfYWRkcmVzcxF2b3RpbmdfYWRkcmVzc190cxJyZXByZXNlbnRhdGl2ZV9hcHAMcmVnaXN0cnlfYXBwAgAABBUffHUFaW5kZXgEFY+N1jEYQABAMTUlEkQxNCUSRDE3JBJEMTYkEkQoMgNnJwkiZyoiZycIImcrJwpnJwQiZykiZycFMgNnJwwiZycGMgNnJwciZ4ICBKDoGHIEJDeNPDYaAI4CAHgAbDEZFEQxGEEAVYILBObaHK0EoXnpQASWZ9beBEHrsBYEP/u8IATLOO9EBHV+KfwEFONO6gS6YNhUBBhEqfsEKSPz0TYaAI4LAHMAlwDTAPUBHAF1AZgDHgN/A9YENwCABJR5/2M2GgCOAQAZADEZgQUSMRgQREIETTEZgQQSMRgQREIARDYaAUkVJBJENhoCSRUkEkQyDUQnCTINZxcqTGcoMgNnJwUyA2cnCCJnKycKZycEImcpImcXJwxMZycGMgNnJwciZyNDMQAyCRJEI0M2GgFJFSQSRDEAMgkSREkXKkxnIihlRExQgATrj+mvTFCwI0M2GgFJFSUSRDYaAkkVJRJENhoDSRUlEkQxADIJEkQoSwNnJwVLAmcnBkxnJwcyB2dQgAR9TwcpTFCwI0M2GgFJFSUSRIgDsUQnBUsBZyIoZURMUIAEjtNsoUxQsCNDNhoBSRUkEkSIA49ESRcnCEsBZ4gDdyIoZURMUIAEBMfvuExQsCNDNhoBRwIiWUlOAkkkC4ECCE8CFRJEiANbRIEDDkQiSUsCDEEAF0sCVwIASwFJTgIkC1uIAzEjCEUBQv/iK0sDSU4CZyIoZUSAAgAiUExQgASPZJEzTFCwI0M2GgFJFSQSRIgDD0RJFycETGciKGVETFCABPVTwFBMULAjQyJHAoAARwQ2GgFHAhUkEkQxADIJEkSIA2ZEIillRElEIwkpTGciJwRlREEAP0kXSYAWdm90ZV9vcGVuaW5nX3RpbWVzdGFtcGVITIAPdm90aW5nX2R1cmF0aW9uZUgIMgciJwRlRE8CTAkNRCInCGVMRQNEIitlRQFBAQMiK2VERQhLByJZSUUHQAAHSwFyB0UBREqIApBFBUUHIkUDSwJLBgxBACxLB1cCAEUJSwIkC0UFSwNAABpLCEsFW0lFA0sBiAJiRQVFB0sCIwhFA0L/zEsFQQCiSwNEsSIoZURLAUlOAheyGIAEJGFfkLIaSbIagQayECKyAbO0PklXBABJFYEJEkRLAVcABCcLEkSBQFNEgQRbSwlJTgIiW0sBCyEECk8CJFtPAgshBAqxTBZMFogB27IYJw2yGksDshpPArIaSwGyGkmyGoEGshAisgGzIihlREsFFiIpZUQWTwJPBVBPAlBPA1BPAlBMUIAE5wOw70xQsCNDSwNEQv9bJwpFCEL+/DYaAUkVJBJENhoCSRWBEBJEiAFdREsBiAHfRLEiKGVESwFXAAhPAlcICIgBXbIYJw2yGksDshpPArIaSwGyGkmyGoEGshAisgGzIihlRE8DUE8CUExQgATp1XwKTFCwI0M2GgFJFSUSRIgBBUAACDEAMgkSQQA9I0SxIihlRIgBCbIYgAQNoniFshqyGkcCshqBBrIQIrIBsycGSwFnJwcyB2ciKGVETFCABAQ38hxMULAjQyJC/8CxIihlRIgAyrIYgAQnYw1lshqyGoEGshAisgGztD5JVwQASRWBORJESwFXAAQnCxJETFcEOEyBwANTQQAfSVcAICcGSwFnJwcyB2ciKGVETFCABJoEpJpMULAjQzIDQv/gNhoBSRUkEkQxADIJEkQiKWVESwEXCClLAWciKGVETBZMTwJQTFCABMVwxthMULAjQzEAMgkSRLEyCUmyCSKyCLIHI7IQIrIBsyNDigEAi/9yB0QyCRJEiTEAIihlRBJAAAsxACInBWVEEkEAAiOJIomKAAEiKmVBAASLAEyJIicJZUQqZUhMiYoCAov+cgdFAUAAFIAQAAAAAAAAAAAAAAAAAAAAACKJsYv+shiABG6oHrGyGov/shqBBrIQIrIBs7Q+SVcEAEkVgRESREsBVwAEJwsSRExXBBBMgYABU4mKAQGL/xdyB0SI/4VyCEQSiQ==", "clear": "CoEBQw=="}, "events": [{"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "xgov_registry_id"}], "name": "VoterXGovRegistrySynced"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "manager_address"}], "name": "XGovAssigned"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "manager_address"}], "name": "VoterManagerSet"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "representative_id"}], "name": "RepresentativeSet"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64[]", "name": "representative_ids"}], "name": "BackupRepresentativesSet"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "window_ts"}], "name": "WindowSet"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "representative_id"}, {"type": "uint64", "name": "approvals"}, {"type": "uint64", "name": "rejections"}, {"type": "uint64", "name": "votes_left"}], "name": "VotedByRepresentative"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "approvals"}, {"type": "uint64", "name": "rejections"}], "name": "VotedDirectly"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "voting_address"}], "name": "VotingRightsYielded"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "voting_address"}], "name": "VotingAddressSynced"}, {"args": [{"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "votes"}, {"type": "uint64", "name": "votes_left"}], "name": "VotesAdded"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAxMDAwMDAwCiAgICBieXRlY2Jsb2NrIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQgMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwIDB4NjI2MTYzNmI3NTcwNWY3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NzMgMHg3NzY5NmU2NDZmNzc1Zjc0NzMgMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMgMHg3NjZmNzQ2OTZlNjc1ZjYxNjQ2NDcyNjU3MzczIDB4NzY2Zjc0Njk2ZTY3NWY2MTY0NjQ3MjY1NzM3MzVmNzQ3MyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNzA3MCAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MCAweDAwMDAgMHgxNTFmN2M3NSAweDY5NmU2NDY1NzggMHgxNThmOGRkNgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQyLTQzCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IGNmZy5HTE9CQUxfQllURVMsIGVyci5XUk9OR19HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fdWludCA9PSBjZmcuR0xPQkFMX1VJTlRTLCBlcnIuV1JPTkdfR0xPQkFMX1VJTlRTCiAgICB0eG4gR2xvYmFsTnVtVWludAogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDUKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV91aW50ID09IGNmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTEKICAgIC8vIGtleT1jZmcuR1NfS0VZX1hHT1ZfQUREUkVTUywKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1MAogICAgLy8gQWNjb3VudCgpLAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDgtNTIKICAgIC8vICMgR2xvYmFsIFZhcmlhYmxlcwogICAgLy8gc2VsZi54Z292X2FkZHJlc3MgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBY2NvdW50KCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfWEdPVl9BRERSRVNTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NQogICAgLy8ga2V5PWNmZy5HU19LRVlfUkVHSVNUUllfQVBQLAogICAgYnl0ZWMgOSAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBBcHBsaWNhdGlvbigpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1My01NgogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHAgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbigpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1JFR0lTVFJZX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTkKICAgIC8vIGtleT1jZmcuR1NfS0VZX1hHT1ZfUkVHSVNUUllfQVBQLAogICAgYnl0ZWNfMiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1OAogICAgLy8gQXBwbGljYXRpb24oKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTctNjAKICAgIC8vIHNlbGYueGdvdl9yZWdpc3RyeV9hcHAgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbigpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1hHT1ZfUkVHSVNUUllfQVBQLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MwogICAgLy8ga2V5PWNmZy5HU19LRVlfUkVQUkVTRU5UQVRJVkVfQVBQLAogICAgYnl0ZWMgOCAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNzA3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBBcHBsaWNhdGlvbigpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MS02NAogICAgLy8gc2VsZi5yZXByZXNlbnRhdGl2ZV9hcHAgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbigpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1JFUFJFU0VOVEFUSVZFX0FQUCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NjcKICAgIC8vIGtleT1jZmcuR1NfS0VZX0JBQ0tVUF9SRVBSRVNFTlRBVElWRVMsCiAgICBieXRlY18zIC8vIDB4NjI2MTYzNmI3NTcwNWY3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2NgogICAgLy8gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCksCiAgICBieXRlYyAxMCAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2NS02OAogICAgLy8gc2VsZi5iYWNrdXBfcmVwcmVzZW50YXRpdmVzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfQkFDS1VQX1JFUFJFU0VOVEFUSVZFUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NzEKICAgIC8vIGtleT1jZmcuR1NfS0VZX1dJTkRPV19UUywKICAgIGJ5dGVjIDQgLy8gMHg3NzY5NmU2NDZmNzc1Zjc0NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo3MAogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjY5LTcyCiAgICAvLyBzZWxmLndpbmRvd190cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1dJTkRPV19UUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NzUKICAgIC8vIGtleT1jZmcuR1NfS0VZX1ZPVEVTX0xFRlQsCiAgICBieXRlY18xIC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo3NAogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjczLTc2CiAgICAvLyBzZWxmLnZvdGVzX2xlZnQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9WT1RFU19MRUZULAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo3OQogICAgLy8ga2V5PWNmZy5HU19LRVlfTUFOQUdFUl9BRERSRVNTLAogICAgYnl0ZWMgNSAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBBY2NvdW50KCksCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo3Ny04MAogICAgLy8gc2VsZi5tYW5hZ2VyX2FkZHJlc3MgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBY2NvdW50KCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfTUFOQUdFUl9BRERSRVNTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo4MwogICAgLy8ga2V5PWNmZy5HU19LRVlfSU5ERVgsCiAgICBieXRlYyAxMiAvLyAweDY5NmU2NDY1NzgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo4MgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjgxLTg0CiAgICAvLyBzZWxmLmluZGV4ID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PWNmZy5HU19LRVlfSU5ERVgsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBrZXk9Y2ZnLkdTX0tFWV9WT1RJTkdfQUREUkVTUywKICAgIGJ5dGVjIDYgLy8gMHg3NjZmNzQ2OTZlNjc1ZjYxNjQ2NDcyNjU3MzczCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6ODYKICAgIC8vIEFjY291bnQoKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5Ojg1LTg4CiAgICAvLyBzZWxmLnZvdGluZ19hZGRyZXNzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgQWNjb3VudCgpLAogICAgLy8gICAgIGtleT1jZmcuR1NfS0VZX1ZPVElOR19BRERSRVNTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo5MQogICAgLy8ga2V5PWNmZy5HU19LRVlfVk9USU5HX0FERFJFU1NfVFMsCiAgICBieXRlYyA3IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2MTY0NjQ3MjY1NzM3MzVmNzQ3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6ODktOTIKICAgIC8vIHNlbGYudm90aW5nX2FkZHJlc3NfdHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y2ZnLkdTX0tFWV9WT1RJTkdfQUREUkVTU19UUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMS00MAogICAgLy8gY2xhc3MgVm90ZXIoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlc3MgMHhhMGU4MTg3MiAweDI0Mzc4ZDNjIC8vIG1ldGhvZCAidXBkYXRlKCl2b2lkIiwgbWV0aG9kICJkZWxldGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3VwZGF0ZV9yb3V0ZUA0IG1haW5fZGVsZXRlX3JvdXRlQDUKCm1haW5fc3dpdGNoX2Nhc2VfbmV4dEA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMxLTQwCiAgICAvLyBjbGFzcyBWb3RlcigKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTAsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDIwCiAgICBwdXNoYnl0ZXNzIDB4ZTZkYTFjYWQgMHhhMTc5ZTk0MCAweDk2NjdkNmRlIDB4NDFlYmIwMTYgMHgzZmZiYmMyMCAweGNiMzhlZjQ0IDB4NzU3ZTI5ZmMgMHgxNGUzNGVlYSAweGJhNjBkODU0IDB4MTg0NGE5ZmIgMHgyOTIzZjNkMSAvLyBtZXRob2QgInN5bmNfeGdvdl9yZWdpc3RyeSh1aW50NjQpdm9pZCIsIG1ldGhvZCAiYXNzaWduX3hnb3YoYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X21hbmFnZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJzZXRfcmVwcmVzZW50YXRpdmUodWludDY0KXZvaWQiLCBtZXRob2QgInNldF9iYWNrdXBfcmVwcmVzZW50YXRpdmVzKHVpbnQ2NFtdKXZvaWQiLCBtZXRob2QgInNldF93aW5kb3codWludDY0KXZvaWQiLCBtZXRob2QgInZvdGVfcmVwcmVzZW50YXRpdmUodWludDY0KXZvaWQiLCBtZXRob2QgInZvdGVfZGlyZWN0KHVpbnQ2NCwodWludDY0LHVpbnQ2NCkpdm9pZCIsIG1ldGhvZCAieWllbGRfdm90aW5nX3JpZ2h0cyhhZGRyZXNzKXZvaWQiLCBtZXRob2QgInN5bmNfdm90aW5nX2FkZHJlc3MoKXZvaWQiLCBtZXRob2QgImFkZF92b3Rlcyh1aW50NjQpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHN5bmNfeGdvdl9yZWdpc3RyeSBhc3NpZ25feGdvdiBzZXRfbWFuYWdlciBzZXRfcmVwcmVzZW50YXRpdmUgc2V0X2JhY2t1cF9yZXByZXNlbnRhdGl2ZXMgc2V0X3dpbmRvdyB2b3RlX3JlcHJlc2VudGF0aXZlIHZvdGVfZGlyZWN0IHlpZWxkX3ZvdGluZ19yaWdodHMgc3luY192b3RpbmdfYWRkcmVzcyBhZGRfdm90ZXMKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMS00MAogICAgLy8gY2xhc3MgVm90ZXIoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTEwLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweDk0NzlmZjYzIC8vIG1ldGhvZCAiY3JlYXRlKHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgptYWluX2RlbGV0ZV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjUzMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJEZWxldGVBcHBsaWNhdGlvbiIsKSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIERlbGV0ZUFwcGxpY2F0aW9uICYmIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGIgZGVsZXRlCgptYWluX3VwZGF0ZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgVXBkYXRlQXBwbGljYXRpb24gJiYgY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgYiB1cGRhdGUKCgovLyBzbWFydF9jb250cmFjdHMudm90ZXIuY29udHJhY3QuVm90ZXIuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMTIKICAgIC8vIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgIT0gMAogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMTEtMTEzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgIT0gMAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRCAgIyBPbmx5IGNhbGxhYmxlIGJ5IGFub3RoZXIgY29udHJhY3QKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMTUKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlID0gQXBwbGljYXRpb24oR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCkKICAgIGJ5dGVjIDkgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGdsb2JhbCBDYWxsZXJBcHBsaWNhdGlvbklECiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjExNgogICAgLy8gc2VsZi54Z292X3JlZ2lzdHJ5X2FwcC52YWx1ZSA9IEFwcGxpY2F0aW9uKHhnb3ZfcmVnaXN0cnlfaWQuYXNfdWludDY0KCkpCiAgICBidG9pCiAgICBieXRlY18yIC8vIDB4Nzg2NzZmNzY1ZjcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMTgKICAgIC8vIHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlID0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgYnl0ZWNfMCAvLyAweDc4Njc2Zjc2NWY2MTY0NjQ3MjY1NzM3MwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjExOQogICAgLy8gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlYyA1IC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTIwCiAgICAvLyBzZWxmLnJlcHJlc2VudGF0aXZlX2FwcC52YWx1ZSA9IEFwcGxpY2F0aW9uKCkKICAgIGJ5dGVjIDggLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTcwNzAKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gc2VsZi5iYWNrdXBfcmVwcmVzZW50YXRpdmVzLnZhbHVlID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCkKICAgIGJ5dGVjXzMgLy8gMHg2MjYxNjM2Yjc1NzA1ZjcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU3MwogICAgYnl0ZWMgMTAgLy8gMHgwMDAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gc2VsZi53aW5kb3dfdHMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gMHg3NzY5NmU2NDZmNzc1Zjc0NzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gc2VsZi52b3Rlc19sZWZ0LnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18xIC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEyNAogICAgLy8gc2VsZi5pbmRleC52YWx1ZSA9IGluZGV4LmFzX3VpbnQ2NCgpCiAgICBidG9pCiAgICBieXRlYyAxMiAvLyAweDY5NmU2NDY1NzgKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTI1CiAgICAvLyBzZWxmLnZvdGluZ19hZGRyZXNzLnZhbHVlID0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgYnl0ZWMgNiAvLyAweDc2NmY3NDY5NmU2NzVmNjE2NDY0NzI2NTczNzMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMjYKICAgIC8vIHNlbGYudm90aW5nX2FkZHJlc3NfdHMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDcgLy8gMHg3NjZmNzQ2OTZlNjc1ZjYxNjQ2NDcyNjU3MzczNWY3NDczCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo5NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnVwZGF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NjEKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxMzkKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5zeW5jX3hnb3ZfcmVnaXN0cnlbcm91dGluZ10oKSAtPiB2b2lkOgpzeW5jX3hnb3ZfcmVnaXN0cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU2MQogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjE1OAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY3JlYXRvcigpLCBlcnIuTk9UX0NSRUFUT1IKICAgIGFzc2VydCAvLyBTZW5kZXIgaXMgbm90IGFwcCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTYwCiAgICAvLyBzZWxmLnhnb3ZfcmVnaXN0cnlfYXBwLnZhbHVlID0gQXBwbGljYXRpb24oeGdvdl9yZWdpc3RyeV9pZC5hc191aW50NjQoKSkKICAgIGR1cAogICAgYnRvaQogICAgYnl0ZWNfMiAvLyAweDc4Njc2Zjc2NWY3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTY0CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCB4Z292X3JlZ2lzdHJ5X2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDc4Njc2Zjc2NWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfYWRkcmVzcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxNjMtMTY1CiAgICAvLyBldi5Wb3RlclhHb3ZSZWdpc3RyeVN5bmNlZCgKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCB4Z292X3JlZ2lzdHJ5X2lkCiAgICAvLyApCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxNjItMTY2CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgZXYuVm90ZXJYR292UmVnaXN0cnlTeW5jZWQoCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksIHhnb3ZfcmVnaXN0cnlfaWQKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhlYjhmZTlhZiAvLyBtZXRob2QgIlZvdGVyWEdvdlJlZ2lzdHJ5U3luY2VkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5hc3NpZ25feGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2lnbl94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NjEKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxODgKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gc2VsZi54Z292X2FkZHJlc3MudmFsdWUgPSB4Z292X2FkZHJlc3MubmF0aXZlCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxOTEKICAgIC8vIHNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlID0gbWFuYWdlcl9hZGRyZXNzLm5hdGl2ZQogICAgYnl0ZWMgNSAvLyAweDZkNjE2ZTYxNjc2NTcyNWY2MTY0NjQ3MjY1NzM3MwogICAgZGlnIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NjA3CiAgICAvLyBzZWxmLnZvdGluZ19hZGRyZXNzLnZhbHVlID0gdm90aW5nX2FkZHJlc3MubmF0aXZlCiAgICBieXRlYyA2IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2MTY0NjQ3MjY1NzM3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MDgKICAgIC8vIHNlbGYudm90aW5nX2FkZHJlc3NfdHMudmFsdWUgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgYnl0ZWMgNyAvLyAweDc2NmY3NDY5NmU2NzVmNjE2NDY0NzI2NTczNzM1Zjc0NzMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTk0CiAgICAvLyBhcmM0LmVtaXQoZXYuWEdvdkFzc2lnbmVkKHhnb3ZfYWRkcmVzcywgbWFuYWdlcl9hZGRyZXNzKSkKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4N2Q0ZjA3MjkgLy8gbWV0aG9kICJYR292QXNzaWduZWQoYWRkcmVzcyxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MTcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5zZXRfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjE5OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9vcl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9vcl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjE0CiAgICAvLyBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZSA9IG1hbmFnZXJfYWRkcmVzcy5uYXRpdmUKICAgIGJ5dGVjIDUgLy8gMHg2ZDYxNmU2MTY3NjU3MjVmNjE2NDY0NzI2NTczNzMKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gZXYuVm90ZXJNYW5hZ2VyU2V0KGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksIG1hbmFnZXJfYWRkcmVzcykKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjE2LTIxOAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlZvdGVyTWFuYWdlclNldChhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCBtYW5hZ2VyX2FkZHJlc3MpCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4ZWQzNmNhMSAvLyBtZXRob2QgIlZvdGVyTWFuYWdlclNldChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToxOTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnNldF9yZXByZXNlbnRhdGl2ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9yZXByZXNlbnRhdGl2ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyMjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjM3CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X29yX21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyMzkKICAgIC8vIHNlbGYucmVwcmVzZW50YXRpdmVfYXBwLnZhbHVlID0gQXBwbGljYXRpb24ocmVwcmVzZW50YXRpdmVfaWQuYXNfdWludDY0KCkpCiAgICBkdXAKICAgIGJ0b2kKICAgIGJ5dGVjIDggLy8gMHg3MjY1NzA3MjY1NzM2NTZlNzQ2MTc0Njk3NjY1NWY2MTcwNzAKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI0MQogICAgLy8gc2VsZi52ZXJpZnlfbmV3X2FwcChzZWxmLnJlcHJlc2VudGF0aXZlX2FwcC52YWx1ZSkKICAgIGNhbGxzdWIgdmVyaWZ5X25ld19hcHAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyNDUKICAgIC8vIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksIHJlcHJlc2VudGF0aXZlX2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDc4Njc2Zjc2NWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfYWRkcmVzcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyNDQtMjQ2CiAgICAvLyBldi5SZXByZXNlbnRhdGl2ZVNldCgKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCByZXByZXNlbnRhdGl2ZV9pZAogICAgLy8gKQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjQzLTI0NwogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlJlcHJlc2VudGF0aXZlU2V0KAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCByZXByZXNlbnRhdGl2ZV9pZAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDA0YzdlZmI4IC8vIG1ldGhvZCAiUmVwcmVzZW50YXRpdmVTZXQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyMjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnNldF9iYWNrdXBfcmVwcmVzZW50YXRpdmVzW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X2JhY2t1cF9yZXByZXNlbnRhdGl2ZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MjUxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ2ND4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyNjkKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfb3JfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfb3JfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gcmVwcmVzZW50YXRpdmVfaWRzLmxlbmd0aCA8PSBjZmcuTUFYX0JBQ0tVUF9SRVBSRVNFTlRBVElWRVMKICAgIHB1c2hpbnQgMyAvLyAzCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI3MC0yNzIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcmVwcmVzZW50YXRpdmVfaWRzLmxlbmd0aCA8PSBjZmcuTUFYX0JBQ0tVUF9SRVBSRVNFTlRBVElWRVMKICAgIC8vICksIGVyci5UT09fTUFOWV9CQUNLVVBfUkVQUkVTRU5UQVRJVkVTCiAgICBhc3NlcnQgLy8gVG9vIG1hbnkgYmFja3VwIHJlcHJlc2VudGF0aXZlcwogICAgaW50Y18wIC8vIDAKCnNldF9iYWNrdXBfcmVwcmVzZW50YXRpdmVzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyNzQKICAgIC8vIGZvciByZXByZXNlbnRhdGl2ZV9pZCBpbiByZXByZXNlbnRhdGl2ZV9pZHM6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiBzZXRfYmFja3VwX3JlcHJlc2VudGF0aXZlc19hZnRlcl9mb3JANQogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gc2VsZi52ZXJpZnlfbmV3X2FwcChBcHBsaWNhdGlvbihyZXByZXNlbnRhdGl2ZV9pZC5hc191aW50NjQoKSkpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgY2FsbHN1YiB2ZXJpZnlfbmV3X2FwcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBzZXRfYmFja3VwX3JlcHJlc2VudGF0aXZlc19mb3JfaGVhZGVyQDIKCnNldF9iYWNrdXBfcmVwcmVzZW50YXRpdmVzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI3NwogICAgLy8gc2VsZi5iYWNrdXBfcmVwcmVzZW50YXRpdmVzLnZhbHVlID0gcmVwcmVzZW50YXRpdmVfaWRzLmNvcHkoKQogICAgYnl0ZWNfMyAvLyAweDYyNjE2MzZiNzU3MDVmNzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTczCiAgICBkaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI4MQogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwgcmVwcmVzZW50YXRpdmVfaWRzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDc4Njc2Zjc2NWY2MTY0NjQ3MjY1NzM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfYWRkcmVzcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyODAtMjgyCiAgICAvLyBldi5CYWNrdXBSZXByZXNlbnRhdGl2ZXNTZXQoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwgcmVwcmVzZW50YXRpdmVfaWRzCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDIyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI3OS0yODMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5CYWNrdXBSZXByZXNlbnRhdGl2ZXNTZXQoCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksIHJlcHJlc2VudGF0aXZlX2lkcwogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDhmNjQ5MTMzIC8vIG1ldGhvZCAiQmFja3VwUmVwcmVzZW50YXRpdmVzU2V0KGFkZHJlc3MsdWludDY0W10pIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weToyNTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnNldF93aW5kb3dbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfd2luZG93OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMDIKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfb3JfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfb3JfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMwNAogICAgLy8gc2VsZi53aW5kb3dfdHMudmFsdWUgPSB3aW5kb3dfdHMuYXNfdWludDY0KCkKICAgIGR1cAogICAgYnRvaQogICAgYnl0ZWMgNCAvLyAweDc3Njk2ZTY0NmY3NzVmNzQ3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMDYKICAgIC8vIGFyYzQuZW1pdChldi5XaW5kb3dTZXQoYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwgd2luZG93X3RzKSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhmNTUzYzA1MCAvLyBtZXRob2QgIldpbmRvd1NldChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90ZXIuY29udHJhY3QuVm90ZXIudm90ZV9yZXByZXNlbnRhdGl2ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGVfcmVwcmVzZW50YXRpdmU6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiAyCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gNAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMxMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NjEKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMzYKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjMzNwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfdmFsaWRfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgY2FsbHN1YiBpc192YWxpZF9wcm9wb3NhbAogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIGlzIG5vdCBwYXJ0IG9mIHhHb3YgUmVnaXN0cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozMzkKICAgIC8vIGFzc2VydCBzZWxmLnZvdGVzX2xlZnQudmFsdWUgPiAwLCBlcnIuTk9fVk9URVNfTEVGVAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVzX2xlZnQgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBObyBwYWlkIHZvdGVzIGxlZnQgdG8gY2FzdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM0MAogICAgLy8gc2VsZi52b3Rlc19sZWZ0LnZhbHVlIC09IDEKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlY18xIC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzQyLTM0MwogICAgLy8gIyBDaGVjayBpZiBhbGxvd2VkIHRvIHZvdGUgYWNjb3JkaW5nIHRvIHJlcHJlc2VudGF0aXZlCiAgICAvLyBpZiBzZWxmLndpbmRvd190cy52YWx1ZToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4Nzc2OTZlNjQ2Zjc3NWY3NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud2luZG93X3RzIGV4aXN0cwogICAgYnogdm90ZV9yZXByZXNlbnRhdGl2ZV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNDUKICAgIC8vIHByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpCiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC91dGlscy5weToyMi0yNQogICAgLy8gdm90ZV9vcGVuX3RzLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBwcm9wX2NmZy5HU19LRVlfVk9URV9PUEVOX1RTLAogICAgLy8gKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvdXRpbHMucHk6MjQKICAgIC8vIHByb3BfY2ZnLkdTX0tFWV9WT1RFX09QRU5fVFMsCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2NTVmNmY3MDY1NmU2OTZlNjc1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL3V0aWxzLnB5OjIyLTI1CiAgICAvLyB2b3RlX29wZW5fdHMsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIHByb3BfY2ZnLkdTX0tFWV9WT1RFX09QRU5fVFMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvdXRpbHMucHk6MjkKICAgIC8vIHByb3BfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT04sCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC91dGlscy5weToyNy0zMAogICAgLy8gdm90aW5nX2R1cmF0aW9uLCBleGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBwcm9wX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL3V0aWxzLnB5OjMyCiAgICAvLyByZXR1cm4gdm90ZV9vcGVuX3RzICsgdm90aW5nX2R1cmF0aW9uCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzQ4CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+IHZvdGVfY2xvc2VfdHMgLSBzZWxmLndpbmRvd190cy52YWx1ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg3NzY5NmU2NDZmNzc1Zjc0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53aW5kb3dfdHMgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC0KICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNDctMzQ5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gdm90ZV9jbG9zZV90cyAtIHNlbGYud2luZG93X3RzLnZhbHVlCiAgICAvLyApLCBlcnIuVE9PX1NPT05fVE9fVk9URQogICAgYXNzZXJ0IC8vIFRvbyBzb29uIHRvIHZvdGUKCnZvdGVfcmVwcmVzZW50YXRpdmVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM1MS0zNTIKICAgIC8vICMgR2V0IHZvdGUgZnJvbSByZXByZXNlbnRhdGl2ZSwgZWxzZSBmcm9tIHRoZSBmaXJzdCBiYWNrdXAgd2l0aCBhIHZhbGlkIHZvdGUKICAgIC8vIHJlcHJlc2VudGF0aXZlX2FwcCA9IHNlbGYucmVwcmVzZW50YXRpdmVfYXBwLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDcyNjU3MDcyNjU3MzY1NmU3NDYxNzQ2OTc2NjU1ZjYxNzA3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGJ1cnkgMwogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVwcmVzZW50YXRpdmVfYXBwIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU4NS01ODYKICAgIC8vICMgVm90ZXJzIHVwZGF0ZWQgZnJvbSBiZWZvcmUgdGhlIGJhY2t1cHMgaGF2ZSBub25lCiAgICAvLyBpZiBzZWxmLmJhY2t1cF9yZXByZXNlbnRhdGl2ZXM6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDYyNjE2MzZiNzU3MDVmNzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYnVyeSAxCiAgICBieiB2b3RlX3JlcHJlc2VudGF0aXZlX2FmdGVyX2lmX2Vsc2VAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1ODcKICAgIC8vIHJldHVybiBzZWxmLmJhY2t1cF9yZXByZXNlbnRhdGl2ZXMudmFsdWUuY29weSgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDYyNjE2MzZiNzU3MDVmNzI2NTcwNzI2NTczNjU2ZTc0NjE3NDY5NzY2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmFja3VwX3JlcHJlc2VudGF0aXZlcyBleGlzdHMKICAgIGJ1cnkgOAoKdm90ZV9yZXByZXNlbnRhdGl2ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy52b3Rlci5jb250cmFjdC5Wb3Rlci5nZXRfYmFja3VwX3JlcHJlc2VudGF0aXZlc0AxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNTQKICAgIC8vIGlmIG5vdCBiYWNrdXBfcmVwcmVzZW50YXRpdmVzLmxlbmd0aDoKICAgIGRpZyA3CiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBidXJ5IDcKICAgIGJueiB2b3RlX3JlcHJlc2VudGF0aXZlX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM1NQogICAgLy8gY3JlYXRvciwgZXhpc3RzID0gb3AuQXBwUGFyYW1zR2V0LmFwcF9jcmVhdG9yKHJlcHJlc2VudGF0aXZlX2FwcCkKICAgIGRpZyAxCiAgICBhcHBfcGFyYW1zX2dldCBBcHBDcmVhdG9yCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNTYKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5SRVBSRVNFTlRBVElWRV9OT05FWElTVEVOVAogICAgYXNzZXJ0IC8vIFJlcHJlc2VudGF0aXZlIGlzIG5vbmV4aXN0ZW50Cgp2b3RlX3JlcHJlc2VudGF0aXZlX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNTgKICAgIC8vIHZvdGUsIGlzX3ZhbGlkID0gc2VsZi5nZXRfcmVwcmVzZW50YXRpdmVfdm90ZShyZXByZXNlbnRhdGl2ZV9hcHAsIHByb3Bvc2FsX2lkKQogICAgZHVwMgogICAgY2FsbHN1YiBnZXRfcmVwcmVzZW50YXRpdmVfdm90ZQogICAgYnVyeSA1CiAgICBidXJ5IDcKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDMKCnZvdGVfcmVwcmVzZW50YXRpdmVfZm9yX2hlYWRlckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM1OQogICAgLy8gZm9yIHJlcHJlc2VudGF0aXZlX2lkIGluIGJhY2t1cF9yZXByZXNlbnRhdGl2ZXM6CiAgICBkaWcgMgogICAgZGlnIDYKICAgIDwKICAgIGJ6IHZvdGVfcmVwcmVzZW50YXRpdmVfYWZ0ZXJfZm9yQDExCiAgICBkaWcgNwogICAgZXh0cmFjdCAyIDAKICAgIGJ1cnkgOQogICAgZGlnIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNjAKICAgIC8vIGlmIGlzX3ZhbGlkOgogICAgZGlnIDMKICAgIGJueiB2b3RlX3JlcHJlc2VudGF0aXZlX2FmdGVyX2ZvckAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM2MgogICAgLy8gcmVwcmVzZW50YXRpdmVfYXBwID0gQXBwbGljYXRpb24ocmVwcmVzZW50YXRpdmVfaWQuYXNfdWludDY0KCkpCiAgICBkaWcgOAogICAgZGlnIDUKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM2My0zNjUKICAgIC8vIHZvdGUsIGlzX3ZhbGlkID0gc2VsZi5nZXRfcmVwcmVzZW50YXRpdmVfdm90ZSgKICAgIC8vICAgICByZXByZXNlbnRhdGl2ZV9hcHAsIHByb3Bvc2FsX2lkCiAgICAvLyApCiAgICBkaWcgMQogICAgY2FsbHN1YiBnZXRfcmVwcmVzZW50YXRpdmVfdm90ZQogICAgYnVyeSA1CiAgICBidXJ5IDcKICAgIGRpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAzCiAgICBiIHZvdGVfcmVwcmVzZW50YXRpdmVfZm9yX2hlYWRlckA2Cgp2b3RlX3JlcHJlc2VudGF0aXZlX2FmdGVyX2ZvckAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNjcKICAgIC8vIGlmIGJhY2t1cF9yZXByZXNlbnRhdGl2ZXMubGVuZ3RoOgogICAgZGlnIDUKICAgIGJ6IHZvdGVfcmVwcmVzZW50YXRpdmVfZWxzZV9ib2R5QDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzY4CiAgICAvLyBhc3NlcnQgaXNfdmFsaWQsIGVyci5DT1VMRF9OT1RfVk9URQogICAgZGlnIDMKICAgIGFzc2VydCAvLyBDb3VsZCBub3Qgdm90ZSBhcyBuZWl0aGVyIHByaW1hcnkgbm9yIGJhY2t1cCByZXByZXNlbnRhdGl2ZQoKdm90ZV9yZXByZXNlbnRhdGl2ZV9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM3Mi0zNzcKICAgIC8vICMgR2V0IHZvdGVyJ3MgYm94CiAgICAvLyBbdm90ZXMsIGV4aXN0c10sIHR4biA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVByb3Bvc2FsLmdldF92b3Rlcl9ib3gsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQuYXNfdWludDY0KCksCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzc1CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2FkZHJlc3MgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzc2CiAgICAvLyBhcHBfaWQ9cHJvcG9zYWxfaWQuYXNfdWludDY0KCksCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidG9pCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNzItMzc3CiAgICAvLyAjIEdldCB2b3RlcidzIGJveAogICAgLy8gW3ZvdGVzLCBleGlzdHNdLCB0eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElQcm9wb3NhbC5nZXRfdm90ZXJfYm94LAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MjQ2MTVmOTAgLy8gbWV0aG9kICJnZXRfdm90ZXJfYm94KGFkZHJlc3MpKHVpbnQ2NCxib29sKSIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA5IC8vIDkKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudHVwbGU8YXJjNC51aW50NjQsYXJjNC5ib29sPgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlYyAxMSAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozNzgKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5OT19WT1RFUwogICAgYXNzZXJ0IC8vIHhHb3YgZG9lcyBub3QgaGF2ZSBhbnkgdm90ZXMKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzgwLTM4MQogICAgLy8gIyBDYWxjdWxhdGUgdm90ZXMKICAgIC8vIGFwcHJvdmFscyA9ICh2b3Rlcy5hc191aW50NjQoKSAqIHZvdGUuYXBwcm92YWwuYXNfdWludDY0KCkpIC8vIGNvbnN0LlBQTQogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgICoKICAgIGludGMgNCAvLyAxMDAwMDAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzgyCiAgICAvLyByZWplY3Rpb25zID0gKHZvdGVzLmFzX3VpbnQ2NCgpICogdm90ZS5yZWplY3Rpb24uYXNfdWludDY0KCkpIC8vIGNvbnN0LlBQTQogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgMgogICAgKgogICAgaW50YyA0IC8vIDEwMDAwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODQtMzkyCiAgICAvLyAjIFZvdGUKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS52b3RlX3Byb3Bvc2FsLAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgYXBwcm92YWxzLAogICAgLy8gICAgIHJlamVjdGlvbnMsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYuZ2V0X3hnb3ZfcmVnaXN0cnlfaWQoKSwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozODkKICAgIC8vIGFwcHJvdmFscywKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozOTAKICAgIC8vIHJlamVjdGlvbnMsCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzkxCiAgICAvLyBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgY2FsbHN1YiBnZXRfeGdvdl9yZWdpc3RyeV9pZAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzg0LTM5MgogICAgLy8gIyBWb3RlCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbCwKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgIGFwcHJvdmFscywKICAgIC8vICAgICByZWplY3Rpb25zLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLmdldF94Z292X3JlZ2lzdHJ5X2lkKCksCiAgICAvLyApCiAgICBieXRlYyAxMyAvLyBtZXRob2QgInZvdGVfcHJvcG9zYWwodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM5NgogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM5OAogICAgLy8gYXJjNC5VSW50NjQocmVwcmVzZW50YXRpdmVfYXBwLmlkKSwKICAgIGRpZyA1CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDAxCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnZvdGVzX2xlZnQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVzX2xlZnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6Mzk1LTQwMgogICAgLy8gZXYuVm90ZWRCeVJlcHJlc2VudGF0aXZlKAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsCiAgICAvLyAgICAgYXJjNC5VSW50NjQocmVwcmVzZW50YXRpdmVfYXBwLmlkKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChhcHByb3ZhbHMpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHJlamVjdGlvbnMpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYudm90ZXNfbGVmdC52YWx1ZSksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTozOTQtNDAzCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgZXYuVm90ZWRCeVJlcHJlc2VudGF0aXZlKAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocmVwcmVzZW50YXRpdmVfYXBwLmlkKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoYXBwcm92YWxzKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocmVqZWN0aW9ucyksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYudm90ZXNfbGVmdC52YWx1ZSksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZTcwM2IwZWYgLy8gbWV0aG9kICJWb3RlZEJ5UmVwcmVzZW50YXRpdmUoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzEwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdm90ZV9yZXByZXNlbnRhdGl2ZV9lbHNlX2JvZHlAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6MzcwCiAgICAvLyBhc3NlcnQgaXNfdmFsaWQsIGVyci5WT1RFX0lOVkFMSUQKICAgIGRpZyAzCiAgICBhc3NlcnQgLy8gUmVwcmVzZW50YXRpdmUgdm90ZSBpcyBpbnZhbGlkCiAgICBiIHZvdGVfcmVwcmVzZW50YXRpdmVfYWZ0ZXJfaWZfZWxzZUAxNAoKdm90ZV9yZXByZXNlbnRhdGl2ZV9hZnRlcl9pZl9lbHNlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU4OAogICAgLy8gcmV0dXJuIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSgpCiAgICBieXRlYyAxMCAvLyAweDAwMDAKICAgIGJ1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjM1MwogICAgLy8gYmFja3VwX3JlcHJlc2VudGF0aXZlcyA9IHNlbGYuZ2V0X2JhY2t1cF9yZXByZXNlbnRhdGl2ZXMoKQogICAgYiB2b3RlX3JlcHJlc2VudGF0aXZlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmdldF9iYWNrdXBfcmVwcmVzZW50YXRpdmVzQDE4CgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnZvdGVfZGlyZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZV9kaXJlY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlZvdGVSYXcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo0MjUKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfb3JfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfb3JfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQyNgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfdmFsaWRfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgZGlnIDEKICAgIGNhbGxzdWIgaXNfdmFsaWRfcHJvcG9zYWwKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBpcyBub3QgcGFydCBvZiB4R292IFJlZ2lzdHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDI4LTQzNgogICAgLy8gIyBWb3RlCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbCwKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgIHZvdGUuYXBwcm92YWxzLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIHZvdGUucmVqZWN0aW9ucy5hc191aW50NjQoKSwKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQzMgogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQzMwogICAgLy8gdm90ZS5hcHByb3ZhbHMuYXNfdWludDY0KCksCiAgICBkaWcgMQogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo0MzQKICAgIC8vIHZvdGUucmVqZWN0aW9ucy5hc191aW50NjQoKSwKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCA4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo0MzUKICAgIC8vIGFwcF9pZD1zZWxmLmdldF94Z292X3JlZ2lzdHJ5X2lkKCksCiAgICBjYWxsc3ViIGdldF94Z292X3JlZ2lzdHJ5X2lkCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo0MjgtNDM2CiAgICAvLyAjIFZvdGUKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS52b3RlX3Byb3Bvc2FsLAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgdm90ZS5hcHByb3ZhbHMuYXNfdWludDY0KCksCiAgICAvLyAgICAgdm90ZS5yZWplY3Rpb25zLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLmdldF94Z292X3JlZ2lzdHJ5X2lkKCksCiAgICAvLyApCiAgICBieXRlYyAxMyAvLyBtZXRob2QgInZvdGVfcHJvcG9zYWwodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQzOS00NDQKICAgIC8vIGV2LlZvdGVkRGlyZWN0bHkoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICB2b3RlLmFwcHJvdmFscywKICAgIC8vICAgICB2b3RlLnJlamVjdGlvbnMsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQzOC00NDUKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5Wb3RlZERpcmVjdGx5KAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgICAgICBwcm9wb3NhbF9pZCwKICAgIC8vICAgICAgICAgdm90ZS5hcHByb3ZhbHMsCiAgICAvLyAgICAgICAgIHZvdGUucmVqZWN0aW9ucywKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhlOWQ1N2MwYSAvLyBtZXRob2QgIlZvdGVkRGlyZWN0bHkoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudm90ZXIuY29udHJhY3QuVm90ZXIueWllbGRfdm90aW5nX3JpZ2h0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnlpZWxkX3ZvdGluZ19yaWdodHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDQ5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDYzCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSBvciBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X29yX21hbmFnZXIKICAgIGJueiB5aWVsZF92b3RpbmdfcmlnaHRzX2Jvb2xfdHJ1ZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTYxCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDYzCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSBvciBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYnogeWllbGRfdm90aW5nX3JpZ2h0c19ib29sX2ZhbHNlQDQKCnlpZWxkX3ZvdGluZ19yaWdodHNfYm9vbF90cnVlQDM6CiAgICBpbnRjXzEgLy8gMQoKeWllbGRfdm90aW5nX3JpZ2h0c19ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDYzCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X29yX21hbmFnZXIoKSBvciBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ2NS00NzAKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5zZXRfdm90aW5nX2FjY291bnQsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICB2b3RpbmdfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ2NwogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ2OQogICAgLy8gYXBwX2lkPXNlbGYuZ2V0X3hnb3ZfcmVnaXN0cnlfaWQoKSwKICAgIGNhbGxzdWIgZ2V0X3hnb3ZfcmVnaXN0cnlfaWQKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ2NS00NzAKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgSVhHb3ZSZWdpc3RyeS5zZXRfdm90aW5nX2FjY291bnQsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICB2b3RpbmdfYWRkcmVzcywKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MGRhMjc4ODUgLy8gbWV0aG9kICJzZXRfdm90aW5nX2FjY291bnQoYWRkcmVzcyxhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGR1cG4gMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NjA3CiAgICAvLyBzZWxmLnZvdGluZ19hZGRyZXNzLnZhbHVlID0gdm90aW5nX2FkZHJlc3MubmF0aXZlCiAgICBieXRlYyA2IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2MTY0NjQ3MjY1NzM3MwogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NjA4CiAgICAvLyBzZWxmLnZvdGluZ19hZGRyZXNzX3RzLnZhbHVlID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDcgLy8gMHg3NjZmNzQ2OTZlNjc1ZjYxNjQ2NDcyNjU3MzczNWY3NDczCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwgdm90aW5nX2FkZHJlc3MKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4Nzg2NzZmNzY1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9hZGRyZXNzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ3NC00NzYKICAgIC8vIGV2LlZvdGluZ1JpZ2h0c1lpZWxkZWQoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwgdm90aW5nX2FkZHJlc3MKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ3My00NzcKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBldi5Wb3RpbmdSaWdodHNZaWVsZGVkKAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCB2b3RpbmdfYWRkcmVzcwogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDA0MzdmMjFjIC8vIG1ldGhvZCAiVm90aW5nUmlnaHRzWWllbGRlZChhZGRyZXNzLGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo0NDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp5aWVsZF92b3RpbmdfcmlnaHRzX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIHlpZWxkX3ZvdGluZ19yaWdodHNfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnN5bmNfdm90aW5nX2FkZHJlc3Nbcm91dGluZ10oKSAtPiB2b2lkOgpzeW5jX3ZvdGluZ19hZGRyZXNzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ4OC00OTIKICAgIC8vIFt4Z292X2JveCwgZXhpc3RzXSwgdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBJWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveCwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgLy8gICAgIGFwcF9pZD1zZWxmLmdldF94Z292X3JlZ2lzdHJ5X2lkKCksCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDkwCiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2FkZHJlc3MgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDkxCiAgICAvLyBhcHBfaWQ9c2VsZi5nZXRfeGdvdl9yZWdpc3RyeV9pZCgpLAogICAgY2FsbHN1YiBnZXRfeGdvdl9yZWdpc3RyeV9pZAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDg4LTQ5MgogICAgLy8gW3hnb3ZfYm94LCBleGlzdHNdLCB0eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIElYR292UmVnaXN0cnkuZ2V0X3hnb3ZfYm94LAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksCiAgICAvLyAgICAgYXBwX2lkPXNlbGYuZ2V0X3hnb3ZfcmVnaXN0cnlfaWQoKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDI3NjMwZDY1IC8vIG1ldGhvZCAiZ2V0X3hnb3ZfYm94KGFkZHJlc3MpKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKSIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNTcgLy8gNTcKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudHVwbGU8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuWEdvdkJveFZhbHVlLGFyYzQuYm9vbD4KICAgIGRpZyAxCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWMgMTEgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgc3dhcAogICAgZXh0cmFjdCA0IDU2CiAgICBzd2FwCiAgICBwdXNoaW50IDQ0OCAvLyA0NDgKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ5MwogICAgLy8gdm90aW5nX2FkZHJlc3MgPSB4Z292X2JveC52b3RpbmdfYWRkcmVzcyBpZiBleGlzdHMgZWxzZSBhcmM0LkFkZHJlc3MoKQogICAgYnogc3luY192b3RpbmdfYWRkcmVzc190ZXJuYXJ5X2ZhbHNlQDQKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCgpzeW5jX3ZvdGluZ19hZGRyZXNzX3Rlcm5hcnlfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MDcKICAgIC8vIHNlbGYudm90aW5nX2FkZHJlc3MudmFsdWUgPSB2b3RpbmdfYWRkcmVzcy5uYXRpdmUKICAgIGJ5dGVjIDYgLy8gMHg3NjZmNzQ2OTZlNjc1ZjYxNjQ2NDcyNjU3MzczCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MDgKICAgIC8vIHNlbGYudm90aW5nX2FkZHJlc3NfdHMudmFsdWUgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgYnl0ZWMgNyAvLyAweDc2NmY3NDY5NmU2NzVmNjE2NDY0NzI2NTczNzM1Zjc0NzMKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDk4CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCB2b3RpbmdfYWRkcmVzcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2FkZHJlc3MgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDk3LTQ5OQogICAgLy8gZXYuVm90aW5nQWRkcmVzc1N5bmNlZCgKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLCB2b3RpbmdfYWRkcmVzcwogICAgLy8gKQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NDk2LTUwMAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIGV2LlZvdGluZ0FkZHJlc3NTeW5jZWQoCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZSksIHZvdGluZ19hZGRyZXNzCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4OWEwNGE0OWEgLy8gbWV0aG9kICJWb3RpbmdBZGRyZXNzU3luY2VkKGFkZHJlc3MsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnN5bmNfdm90aW5nX2FkZHJlc3NfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjQ5MwogICAgLy8gdm90aW5nX2FkZHJlc3MgPSB4Z292X2JveC52b3RpbmdfYWRkcmVzcyBpZiBleGlzdHMgZWxzZSBhcmM0LkFkZHJlc3MoKQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBiIHN5bmNfdm90aW5nX2FkZHJlc3NfdGVybmFyeV9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmFkZF92b3Rlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFkZF92b3RlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1MDQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTYxCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTE5CiAgICAvLyBhc3NlcnQgc2VsZi5pc19jcmVhdG9yKCksIGVyci5OT1RfQ1JFQVRPUgogICAgYXNzZXJ0IC8vIFNlbmRlciBpcyBub3QgYXBwIGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1MjEKICAgIC8vIHNlbGYudm90ZXNfbGVmdC52YWx1ZSArPSBhZGRfdm90ZXMuYXNfdWludDY0KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzY2Zjc0NjU3MzVmNmM2NTY2NzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3Rlc19sZWZ0IGV4aXN0cwogICAgZGlnIDEKICAgIGJ0b2kKICAgICsKICAgIGJ5dGVjXzEgLy8gMHg3NjZmNzQ2NTczNWY2YzY1NjY3NAogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTI1CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi54Z292X2FkZHJlc3MudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2FkZHJlc3MgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTI3CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnZvdGVzX2xlZnQudmFsdWUpLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjUyNC01MjgKICAgIC8vIGV2LlZvdGVzQWRkZWQoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICBhZGRfdm90ZXMsCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi52b3Rlc19sZWZ0LnZhbHVlKSwKICAgIC8vICkKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1MjMtNTI5CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgZXYuVm90ZXNBZGRlZCgKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlKSwKICAgIC8vICAgICAgICAgYWRkX3ZvdGVzLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzZWxmLnZvdGVzX2xlZnQudmFsdWUpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGM1NzBjNmQ4IC8vIG1ldGhvZCAiVm90ZXNBZGRlZChhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1MDQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmRlbGV0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlbGV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NjEKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NDIKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NyZWF0b3IoKSwgZXJyLk5PVF9DUkVBVE9SCiAgICBhc3NlcnQgLy8gU2VuZGVyIGlzIG5vdCBhcHAgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU0NC01NDgKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQoMCksCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTQ1CiAgICAvLyByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTQ3CiAgICAvLyBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGR1cAogICAgaXR4bl9maWVsZCBDbG9zZVJlbWFpbmRlclRvCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTQ2CiAgICAvLyBhbW91bnQ9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTQ0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NDQtNTQ4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9VUludDY0KDApLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1MzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPSgiRGVsZXRlQXBwbGljYXRpb24iLCkpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLnZlcmlmeV9uZXdfYXBwKGFwcDogdWludDY0KSAtPiB2b2lkOgp2ZXJpZnlfbmV3X2FwcDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NTItNTU2CiAgICAvLyAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgLy8gIyAtLS0tLS0tLS0tIFN1YnJvdXRpbmVzIC0tLS0tLS0tLS0KICAgIC8vICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHZlcmlmeV9uZXdfYXBwKHNlbGYsIGFwcDogQXBwbGljYXRpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NTcKICAgIC8vIGFzc2VydCBhcHAuY3JlYXRvciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCBlcnIuVU5SRUxBVEVEX0FQUAogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfcGFyYW1zX2dldCBBcHBDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gQXBwIHdhcyBub3QgY3JlYXRlZCBieSByZWdpc3RyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmlzX3hnb3Zfb3JfbWFuYWdlcigpIC0+IHVpbnQ2NDoKaXNfeGdvdl9vcl9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU2NgogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3ODY3NmY3NjVmNjE2NDY0NzI2NTczNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2FkZHJlc3MgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU2Ni01NjcKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi54Z292X2FkZHJlc3MudmFsdWUKICAgIC8vIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUKICAgIGJueiBpc194Z292X29yX21hbmFnZXJfYm9vbF90cnVlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NjcKICAgIC8vIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vIDB4NmQ2MTZlNjE2NzY1NzI1ZjYxNjQ2NDcyNjU3MzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFuYWdlcl9hZGRyZXNzIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NjYtNTY3CiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlCiAgICAvLyBvciBUeG4uc2VuZGVyID09IHNlbGYubWFuYWdlcl9hZGRyZXNzLnZhbHVlCiAgICBieiBpc194Z292X29yX21hbmFnZXJfYm9vbF9mYWxzZUAzCgppc194Z292X29yX21hbmFnZXJfYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU2NS01NjgKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYWRkcmVzcy52YWx1ZQogICAgLy8gICAgIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyX2FkZHJlc3MudmFsdWUKICAgIC8vICkKICAgIHJldHN1YgoKaXNfeGdvdl9vcl9tYW5hZ2VyX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTY1LTU2OAogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9hZGRyZXNzLnZhbHVlCiAgICAvLyAgICAgb3IgVHhuLnNlbmRlciA9PSBzZWxmLm1hbmFnZXJfYWRkcmVzcy52YWx1ZQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmdldF94Z292X3JlZ2lzdHJ5X2lkKCkgLT4gdWludDY0OgpnZXRfeGdvdl9yZWdpc3RyeV9pZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NzAtNTcxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF94Z292X3JlZ2lzdHJ5X2lkKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU3MgogICAgLy8geGdvdl9yZWdpc3RyeV9hcHAsIGV4aXN0cyA9IHNlbGYueGdvdl9yZWdpc3RyeV9hcHAubWF5YmUoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU3MwogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3hnb3ZfcmVnaXN0cnlfaWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTc0CiAgICAvLyByZXR1cm4geGdvdl9yZWdpc3RyeV9hcHAuaWQKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF94Z292X3JlZ2lzdHJ5X2lkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1NzgKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHAgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTc5CiAgICAvLyByZWdfY2ZnLkdTX0tFWV9YR09WX1JFR0lTVFJZX0FQUCwKICAgIGJ5dGVjXzIgLy8gMHg3ODY3NmY3NjVmNzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTc2LTU4MAogICAgLy8gIyBBcHBzIG5vdCB5ZXQgc3luY2VkIHJlYWQgaXQgZnJvbSB0aGUgRGVsZWdhdGlvbiBSZWdpc3RyeQogICAgLy8geGdvdl9yZWdpc3RyeV9pZCwgZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgc2VsZi5yZWdpc3RyeV9hcHAudmFsdWUsCiAgICAvLyAgICAgcmVnX2NmZy5HU19LRVlfWEdPVl9SRUdJU1RSWV9BUFAsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTgxCiAgICAvLyByZXR1cm4geGdvdl9yZWdpc3RyeV9pZAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmdldF9yZXByZXNlbnRhdGl2ZV92b3RlKHJlcHJlc2VudGF0aXZlX2FwcDogdWludDY0LCBwcm9wb3NhbF9pZDogYnl0ZXMpIC0+IGJ5dGVzLCB1aW50NjQ6CmdldF9yZXByZXNlbnRhdGl2ZV92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU5MC01OTMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X3JlcHJlc2VudGF0aXZlX3ZvdGUoCiAgICAvLyAgICAgc2VsZiwgcmVwcmVzZW50YXRpdmVfYXBwOiBBcHBsaWNhdGlvbiwgcHJvcG9zYWxfaWQ6IGFyYzQuVUludDY0CiAgICAvLyApIC0+IHR1cGxlW3R5cC5Wb3RlLCBib29sXToKICAgIHByb3RvIDIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU5NAogICAgLy8gY3JlYXRvciwgZXhpc3RzID0gb3AuQXBwUGFyYW1zR2V0LmFwcF9jcmVhdG9yKHJlcHJlc2VudGF0aXZlX2FwcCkKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX3BhcmFtc19nZXQgQXBwQ3JlYXRvcgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdm90ZXIvY29udHJhY3QucHk6NTk1CiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IGdldF9yZXByZXNlbnRhdGl2ZV92b3RlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjU5NgogICAgLy8gcmV0dXJuIHR5cC5Wb3RlKGFwcHJvdmFsPWFyYzQuVUludDY0KDApLCByZWplY3Rpb249YXJjNC5VSW50NjQoMCkpLCBGYWxzZQogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGludGNfMCAvLyAwCiAgICByZXRzdWIKCmdldF9yZXByZXNlbnRhdGl2ZV92b3RlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo1OTgtNjAyCiAgICAvLyBbdm90ZSwgaXNfdmFsaWRdLCB0eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHJlcHJlc2VudGF0aXZlX2NvbnRyYWN0LlJlcHJlc2VudGF0aXZlLmdldF92b3RlLAogICAgLy8gICAgIHByb3Bvc2FsX2lkLAogICAgLy8gICAgIGFwcF9pZD1yZXByZXNlbnRhdGl2ZV9hcHAsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgcHVzaGJ5dGVzIDB4NmVhODFlYjEgLy8gbWV0aG9kICJnZXRfdm90ZSh1aW50NjQpKCh1aW50NjQsdWludDY0KSxib29sKSIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAxNyAvLyAxNwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC50dXBsZTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5Wb3RlLGFyYzQuYm9vbD4KICAgIGRpZyAxCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWMgMTEgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgc3dhcAogICAgZXh0cmFjdCA0IDE2CiAgICBzd2FwCiAgICBwdXNoaW50IDEyOCAvLyAxMjgKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjYwMwogICAgLy8gcmV0dXJuIHZvdGUuY29weSgpLCBpc192YWxpZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnZvdGVyLmNvbnRyYWN0LlZvdGVyLmlzX3ZhbGlkX3Byb3Bvc2FsKHByb3Bvc2FsX2lkOiBieXRlcykgLT4gdWludDY0Ogppc192YWxpZF9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MTAtNjExCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGlzX3ZhbGlkX3Byb3Bvc2FsKHNlbGYsIHByb3Bvc2FsX2lkOiBhcmM0LlVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ZvdGVyL2NvbnRyYWN0LnB5OjYxMgogICAgLy8gcHJvcG9zYWxfY3JlYXRvciA9IEFwcGxpY2F0aW9uKHByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpKS5jcmVhdG9yCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcENyZWF0b3IKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MTMKICAgIC8vIHhnb3ZfcmVnaXN0cnlfaWQgPSBzZWxmLmdldF94Z292X3JlZ2lzdHJ5X2lkKCkKICAgIGNhbGxzdWIgZ2V0X3hnb3ZfcmVnaXN0cnlfaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MTQKICAgIC8vIHhnb3ZfcmVnaXN0cnlfYWRkcmVzcyA9IEFwcGxpY2F0aW9uKHhnb3ZfcmVnaXN0cnlfaWQpLmFkZHJlc3MKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy92b3Rlci9jb250cmFjdC5weTo2MTUKICAgIC8vIHJldHVybiBwcm9wb3NhbF9jcmVhdG9yID09IHhnb3ZfcmVnaXN0cnlfYWRkcmVzcwogICAgPT0KICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1535], "errorMessage": "App was not created by registry"}, {"pc": [995], "errorMessage": "Could not vote as neither primary nor backup representative"}, {"pc": [809], "errorMessage": "No paid votes left to cast"}, {"pc": [393], "errorMessage": "OnCompletion must be DeleteApplication && can only call when not creating"}, {"pc": [280], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [405], "errorMessage": "OnCompletion must be UpdateApplication && can only call when not creating"}, {"pc": [803, 1194], "errorMessage": "Proposal is not part of xGov Registry"}, {"pc": [924], "errorMessage": "Representative is nonexistent"}, {"pc": [1157], "errorMessage": "Representative vote is invalid"}, {"pc": [482, 498, 550, 799, 1462, 1503], "errorMessage": "Sender is not app creator"}, {"pc": [682], "errorMessage": "Too many backup representatives"}, {"pc": [885], "errorMessage": "Too soon to vote"}, {"pc": [427, 592, 626, 678, 754, 1188, 1288], "errorMessage": "Unauthorized"}, {"pc": [196], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [201], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [206], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [211], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [1531, 1681, 1687], "errorMessage": "application exists"}, {"pc": [1048, 1400, 1662], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [905], "errorMessage": "check self.backup_representatives exists"}, {"pc": [1553], "errorMessage": "check self.manager_address exists"}, {"pc": [1579], "errorMessage": "check self.registry_app exists"}, {"pc": [893], "errorMessage": "check self.representative_app exists"}, {"pc": [807, 1126, 1466], "errorMessage": "check self.votes_left exists"}, {"pc": [819, 879], "errorMessage": "check self.window_ts exists"}, {"pc": [507, 601, 640, 724, 764, 1000, 1119, 1199, 1245, 1293, 1334, 1356, 1430, 1478, 1542], "errorMessage": "check self.xgov_address exists"}, {"pc": [660, 911], "errorMessage": "invalid array length header"}, {"pc": [674], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint64>"}, {"pc": [528, 536, 544, 588, 1272], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [1039], "errorMessage": "invalid number of bytes for arc4.tuple<arc4.uint64,arc4.bool>"}, {"pc": [1653], "errorMessage": "invalid number of bytes for arc4.tuple<smart_contracts.common.abi_types.Vote,arc4.bool>"}, {"pc": [1391], "errorMessage": "invalid number of bytes for arc4.tuple<smart_contracts.common.abi_types.XGovBoxValue,arc4.bool>"}, {"pc": [416, 424, 492, 622, 750, 793, 1175, 1456], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [1184], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.VoteRaw"}, {"pc": [1052], "errorMessage": "xGov does not have any votes"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+# Declared only: parsed on first use of `APP_SPEC`, not at import
+APP_SPEC: algokit_utils.Arc56Contract
+
+def __getattr__(name: str) -> algokit_utils.Arc56Contract:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -71,15 +82,25 @@ class VoteRaw:
     rejections: int
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SyncXgovRegistryArgs:
+    """Dataclass for sync_xgov_registry arguments"""
+    xgov_registry_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "sync_xgov_registry(uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class AssignXgovArgs:
     """Dataclass for assign_xgov arguments"""
     xgov_address: str
     manager_address: str
+    voting_address: str
 
     @property
     def abi_method_signature(self) -> str:
-        return "assign_xgov(address,address)void"
+        return "assign_xgov(address,address,address)void"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class SetManagerArgs:
@@ -99,6 +120,15 @@ class SetRepresentativeArgs:
     def abi_method_signature(self) -> str:
         return "set_representative(uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetBackupRepresentativesArgs:
+    """Dataclass for set_backup_representatives arguments"""
+    representative_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_backup_representatives(uint64[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class SetWindowArgs:
     """Dataclass for set_window arguments"""
@@ -145,6 +175,16 @@ class AddVotesArgs:
     def abi_method_signature(self) -> str:
         return "add_votes(uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateArgs:
+    """Dataclass for create arguments"""
+    index: int
+    xgov_registry_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create(uint64,uint64)void"
+
 
 class _VoterUpdate:
     def __init__(self, app_client: algokit_utils.AppClient):
@@ -192,16 +232,29 @@ class VoterParams:
     def delete(self) -> "_VoterDelete":
         return _VoterDelete(self.app_client)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_xgov_registry(uint64)void",
+            "args": method_args,
+        }))
+
     def assign_xgov(
         self,
-        args: tuple[str, str] | AssignXgovArgs,
+        args: tuple[str, str, str] | AssignXgovArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "assign_xgov(address,address)void",
+            "method": "assign_xgov(address,address,address)void",
             "args": method_args,
         }))
 
@@ -231,6 +284,19 @@ class VoterParams:
             "args": method_args,
         }))
 
+    def set_backup_representatives(
+        self,
+        args: tuple[list[int]] | SetBackupRepresentativesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_backup_representatives(uint64[])void",
+            "args": method_args,
+        }))
+
     def set_window(
         self,
         args: tuple[int] | SetWindowArgs,
@@ -283,6 +349,17 @@ class VoterParams:
             "args": method_args,
         }))
 
+    def sync_voting_address(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_voting_address()void",
+        }))
+
     def add_votes(
         self,
         args: tuple[int] | AddVotesArgs,
@@ -298,13 +375,15 @@ class VoterParams:
 
     def create(
         self,
+        args: tuple[int, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create()void",
+            "method": "create(uint64,uint64)void",
+            "args": method_args,
         }))
 
     def clear_state(
@@ -364,16 +443,29 @@ class VoterCreateTransactionParams:
     def delete(self) -> "_VoterDeleteTransaction":
         return _VoterDeleteTransaction(self.app_client)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_xgov_registry(uint64)void",
+            "args": method_args,
+        }))
+
     def assign_xgov(
         self,
-        args: tuple[str, str] | AssignXgovArgs,
+        args: tuple[str, str, str] | AssignXgovArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "assign_xgov(address,address)void",
+            "method": "assign_xgov(address,address,address)void",
             "args": method_args,
         }))
 
@@ -403,6 +495,19 @@ class VoterCreateTransactionParams:
             "args": method_args,
         }))
 
+    def set_backup_representatives(
+        self,
+        args: tuple[list[int]] | SetBackupRepresentativesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_backup_representatives(uint64[])void",
+            "args": method_args,
+        }))
+
     def set_window(
         self,
         args: tuple[int] | SetWindowArgs,
@@ -455,6 +560,17 @@ class VoterCreateTransactionParams:
             "args": method_args,
         }))
 
+    def sync_voting_address(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_voting_address()void",
+        }))
+
     def add_votes(
         self,
         args: tuple[int] | AddVotesArgs,
@@ -470,13 +586,15 @@ class VoterCreateTransactionParams:
 
     def create(
         self,
+        args: tuple[int, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create()void",
+            "method": "create(uint64,uint64)void",
+            "args": method_args,
         }))
 
     def clear_state(
@@ -542,9 +660,25 @@ class VoterSend:
     def delete(self) -> "_VoterDeleteSend":
         return _VoterDeleteSend(self.app_client)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_xgov_registry(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def assign_xgov(
         self,
-        args: tuple[str, str] | AssignXgovArgs,
+        args: tuple[str, str, str] | AssignXgovArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -552,7 +686,7 @@ class VoterSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "assign_xgov(address,address)void",
+            "method": "assign_xgov(address,address,address)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -590,6 +724,22 @@ class VoterSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def set_backup_representatives(
+        self,
+        args: tuple[list[int]] | SetBackupRepresentativesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_backup_representatives(uint64[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def set_window(
         self,
         args: tuple[int] | SetWindowArgs,
@@ -654,6 +804,20 @@ class VoterSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def sync_voting_address(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "sync_voting_address()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def add_votes(
         self,
         args: tuple[int] | AddVotesArgs,
@@ -672,14 +836,16 @@ class VoterSend:
 
     def create(
         self,
+        args: tuple[int, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create()void",
+            "method": "create(uint64,uint64)void",
+            "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
@@ -699,10 +865,15 @@ class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     xgov_address: str
     registry_app: int
+    xgov_registry_app: int
     representative_app: int
+    backup_representatives: list[int]
     window_ts: int
     votes_left: int
     manager_address: str
+    index: int
+    voting_address: str
+    voting_address_ts: int
 
 class VoterState:
     """Methods to access state for the current Voter app"""
@@ -756,6 +927,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def xgov_registry_app(self) -> int:
+        """Get the current value of the xgov_registry_app key in global_state state"""
+        value = self.app_client.state.global_state.get_value("xgov_registry_app")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
     @property
     def representative_app(self) -> int:
         """Get the current value of the representative_app key in global_state state"""
@@ -764,6 +943,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def backup_representatives(self) -> list[int]:
+        """Get the current value of the backup_representatives key in global_state state"""
+        value = self.app_client.state.global_state.get_value("backup_representatives")
+        if isinstance(value, dict) and "uint64[]" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["uint64[]"], value)  # type: ignore
+        return typing.cast(list[int], value)
+
     @property
     def window_ts(self) -> int:
         """Get the current value of the window_ts key in global_state state"""
@@ -788,6 +975,30 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
         return typing.cast(str, value)
 
+    @property
+    def index(self) -> int:
+        """Get the current value of the index key in global_state state"""
+        value = self.app_client.state.global_state.get_value("index")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def voting_address(self) -> str:
+        """Get the current value of the voting_address key in global_state state"""
+        value = self.app_client.state.global_state.get_value("voting_address")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def voting_address_ts(self) -> int:
+        """Get the current value of the voting_address_ts key in global_state state"""
+        value = self.app_client.state.global_state.get_value("voting_address_ts")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class VoterClient:
     """Client for interacting with Voter smart contract"""
 
@@ -825,7 +1036,7 @@ class VoterClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -858,7 +1069,7 @@ class VoterClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -880,7 +1091,7 @@ class VoterClient:
     ) -> "VoterClient":
         return VoterClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -934,7 +1145,13 @@ class VoterClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["assign_xgov(address,address)void"],
+        method: typing.Literal["sync_xgov_registry(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["assign_xgov(address,address,address)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
@@ -950,6 +1167,12 @@ class VoterClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_backup_representatives(uint64[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["set_window(uint64)void"],
@@ -974,6 +1197,12 @@ class VoterClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["sync_voting_address()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["add_votes(uint64)void"],
@@ -982,7 +1211,7 @@ class VoterClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create()void"],
+        method: typing.Literal["create(uint64,uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
@@ -1030,7 +1259,7 @@ class VoterClient:
 @dataclasses.dataclass(frozen=True)
 class VoterMethodCallCreateParams(
     algokit_utils.AppClientCreateSchema, algokit_utils.BaseAppClientMethodCallParams[
-        typing.Any,
+        CreateArgs,
         str | None,
     ]
 ):
@@ -1106,7 +1335,7 @@ class VoterFactory(algokit_utils.TypedAppFactoryProtocol[VoterMethodCallCreatePa
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1234,20 +1463,40 @@ class VoterFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the sync_xgov_registry(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "sync_xgov_registry(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def assign_xgov(
         self,
-        args: tuple[str, str] | AssignXgovArgs,
+        args: tuple[str, str, str] | AssignXgovArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the assign_xgov(address,address)void ABI method"""
+        """Creates a new instance using the assign_xgov(address,address,address)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "assign_xgov(address,address)void",
+                "method": "assign_xgov(address,address,address)void",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1294,6 +1543,26 @@ class VoterFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def set_backup_representatives(
+        self,
+        args: tuple[list[int]] | SetBackupRepresentativesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_backup_representatives(uint64[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_backup_representatives(uint64[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def set_window(
         self,
         args: tuple[int] | SetWindowArgs,
@@ -1374,6 +1643,25 @@ class VoterFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def sync_voting_address(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the sync_voting_address()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "sync_voting_address()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def add_votes(
         self,
         args: tuple[int] | AddVotesArgs,
@@ -1396,18 +1684,19 @@ class VoterFactoryCreateParams:
 
     def create(
         self,
+        args: tuple[int, int] | CreateArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create()void ABI method"""
+        """Creates a new instance using the create(uint64,uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create()void",
-                "args": None,
+                "method": "create(uint64,uint64)void",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
@@ -1545,19 +1834,20 @@ class VoterFactorySendCreate:
 
     def create(
         self,
+        args: tuple[int, int] | CreateArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[VoterClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
-            """Creates and sends a transaction using the create()void ABI method"""
+            """Creates and sends a transaction using the create(uint64,uint64)void ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
                     **dataclasses.asdict(params),
-                    "method": "create()void",
-                    "args": None,
+                    "method": "create(uint64,uint64)void",
+                    "args": _parse_abi_args(args),
                     }
                 ),
                 send_params=send_params,
@@ -1642,9 +1932,27 @@ class VoterComposer:
     def delete(self) -> "_VoterDeleteComposer":
         return _VoterDeleteComposer(self)
 
+    def sync_xgov_registry(
+        self,
+        args: tuple[int] | SyncXgovRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VoterComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.sync_xgov_registry(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "sync_xgov_registry(uint64)void", v
+            )
+        )
+        return self
+
     def assign_xgov(
         self,
-        args: tuple[str, str] | AssignXgovArgs,
+        args: tuple[str, str, str] | AssignXgovArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "VoterComposer":
         self._composer.add_app_call_method_call(
@@ -1655,7 +1963,7 @@ class VoterComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "assign_xgov(address,address)void", v
+                "assign_xgov(address,address,address)void", v
             )
         )
         return self
@@ -1696,6 +2004,24 @@ class VoterComposer:
         )
         return self
 
+    def set_backup_representatives(
+        self,
+        args: tuple[list[int]] | SetBackupRepresentativesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VoterComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_backup_representatives(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_backup_representatives(uint64[])void", v
+            )
+        )
+        return self
+
     def set_window(
         self,
         args: tuple[int] | SetWindowArgs,
@@ -1768,6 +2094,23 @@ class VoterComposer:
         )
         return self
 
+    def sync_voting_address(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "VoterComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.sync_voting_address(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "sync_voting_address()void", v
+            )
+        )
+        return self
+
     def add_votes(
         self,
         args: tuple[int] | AddVotesArgs,
@@ -1788,17 +2131,18 @@ class VoterComposer:
 
     def create(
         self,
+        args: tuple[int, int] | CreateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "VoterComposer":
         self._composer.add_app_call_method_call(
             self.client.params.create(
-                
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create()void", v
+                "create(uint64,uint64)void", v
             )
         )
         return self
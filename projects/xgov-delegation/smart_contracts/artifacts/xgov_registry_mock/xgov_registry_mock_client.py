@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -19,8 +20,18 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "create_proposal", "returns": {"type": "uint64", "desc": "The ID of the created proposal."}, "desc": "Create an empty proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app being voted on", "name": "proposal_id"}, {"type": "address", "desc": "(arc4.Address): The address of the xGov being voted on behalf of", "name": "xgov_address"}, {"type": "uint64", "desc": "(arc4.UInt64): The number of approvals votes allocated", "name": "approval_votes"}, {"type": "uint64", "desc": "(arc4.UInt64): The number of rejections votes allocated", "name": "rejection_votes"}], "name": "vote_proposal", "returns": {"type": "void"}, "desc": "Vote on a proposal", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The xGov address delegating voting power", "name": "xgov_address"}, {"type": "address", "desc": "The voting account address to delegate voting power to", "name": "voting_address"}], "name": "set_voting_account", "returns": {"type": "void"}, "desc": "Sets the Voting Address for the xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}], "name": "get_xgov_box", "returns": {"type": "((address,uint64,uint64,uint64),bool)", "desc": "The xGov box value bool: `True` if xGov box exists, else `False`"}, "desc": "Returns the xGov box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov.", "name": "xgov_address"}, {"type": "(address,uint64,uint64,uint64)", "desc": "The xgov box content.", "name": "xgov_box", "struct": "XGovBoxValue"}], "name": "set_xgov_box", "returns": {"type": "void"}, "desc": "Sets the xGov box for the given address.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov.", "name": "xgov_address"}], "name": "del_xgov_box", "returns": {"type": "void"}, "desc": "Deletes the xGov box for the given address.", "events": [], "readonly": false, "recommendations": {}}], "name": "XgovRegistryMock", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"xgov_box": {"keyType": "address", "valueType": "XGovBoxValue", "prefix": "eA=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"XGovBoxValue": [{"name": "voting_address", "type": "address"}, {"name": "voted_proposals", "type": "uint64"}, {"name": "last_vote_timestamp", "type": "uint64"}, {"name": "subscription_round", "type": "uint64"}]}, "byteCode": {"approval": "CiAEASAACCYCAXgEFR98dTEbQQA5MRkURDEYRIIGBKHNdiEEFY+N1gQNoniFBCdjDWUEuPrN8wSlkXZxNhoAjgYACwGVAdYB8AJTAmwAMRkUMRgUEEQiQ7GBBLI0gAQKgQFDskKAzQIKIAQBAAggJgUBVg9yZWdpc3RyeV9hcHBfaWQGc3RhdHVzFnZvdGVfb3BlbmluZ190aW1lc3RhbXAPdm90aW5nX2R1cmF0aW9uMRhAAA0pI2cqI2crI2cnBCNnMRkURDEYQQA5ggcEE5TMPASuWsEPBLT0+akEu44daATzD/u6BF2HRzYEJGFfkDYaAI4HABUAIwAxAEAAVwBxAIAAgARMXGG6NhoAjgEAAQApMg1nIkM2GgFJFSQSRBcqTGciQzYaAUkVJBJEFytMZyJDNhoBSRUkEkQXJwRMZyJDNhoBFSUSRDYaAhUkEkQ2GgMVJBJEIkM2GgFJFSUSRDYaAkkVJBJEFyhPAlBMFr8iQzYaAUkVJRJEKExQvEgiQzYaAUkVJRJEKExQSb1JTwJIQQAZSwG+RBcWgAEAI0sDVFCABBUffHVMULAiQyNC/+iyQIAETFxhurIagQayECSyAbO0PbFJcghEMgGyCLIHIrIQJLIBsxYpTFCwIkM2GgFJFSUSRDYaAkkVIxJENhoDSRUlEkQ2GgRJFSUSRLFPAxeyGIAEu44daLIaTwKyGkyyGrIagQayECSyAbMiQzYaAUkVIxJENhoCSRUjEkQoTwJQJE8CuyJDNhoBSRUjEkQoTFBJvUlPAkhBABJLAb5EgAEAJEsDVFApTFCwIkOAOAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQv+1NhoBSRUjEkQ2GgJJFYE4EkQoTwJQTL8iQzYaAUkVIxJEKExQvEgiQw==", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDMyIDAgOAogICAgYnl0ZWNibG9jayAweDc4IDB4MTUxZjdjNzUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTkKICAgIC8vIGNsYXNzIFhnb3ZSZWdpc3RyeU1vY2soQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxNQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHhhMWNkNzYyMSAweDE1OGY4ZGQ2IDB4MGRhMjc4ODUgMHgyNzYzMGQ2NSAweGI4ZmFjZGYzIDB4YTU5MTc2NzEgLy8gbWV0aG9kICJjcmVhdGVfcHJvcG9zYWwoKXVpbnQ2NCIsIG1ldGhvZCAidm90ZV9wcm9wb3NhbCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgInNldF92b3RpbmdfYWNjb3VudChhZGRyZXNzLGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiZ2V0X3hnb3ZfYm94KGFkZHJlc3MpKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKSIsIG1ldGhvZCAic2V0X3hnb3ZfYm94KGFkZHJlc3MsKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpKXZvaWQiLCBtZXRob2QgImRlbF94Z292X2JveChhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGVfcHJvcG9zYWwgdm90ZV9wcm9wb3NhbCBzZXRfdm90aW5nX2FjY291bnQgZ2V0X3hnb3ZfYm94IHNldF94Z292X2JveCBkZWxfeGdvdl9ib3gKICAgIGVycgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxNToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AgJiYgY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmNyZWF0ZV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZV9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzgtNDAKICAgIC8vIHJlcyA9IGFyYzQuYXJjNF9jcmVhdGUoCiAgICAvLyAgICAgUHJvcG9zYWxNb2NrLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA0IC8vIDQKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgcHVzaGJ5dGVzIGJhc2U2NChDb0VCUXc9PSkKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgcHVzaGJ5dGVzIGJhc2U2NChDaUFFQVFBSUlDWUZBVllQY21WbmFYTjBjbmxmWVhCd1gybGtCbk4wWVhSMWN4WjJiM1JsWDI5d1pXNXBibWRmZEdsdFpYTjBZVzF3RDNadmRHbHVaMTlrZFhKaGRHbHZiakVZUUFBTktTTm5LaU5uS3lObkp3UWpaekVaRkVReEdFRUFPWUlIQkJPVXpEd0VybHJCRHdTMDlQbXBCTHVPSFdnRTh3Lzd1Z1JkaDBjMkJDUmhYNUEyR2dDT0J3QVZBQ01BTVFCQUFGY0FjUUNBQUlBRVRGeGh1allhQUk0QkFBRUFLVElOWnlKRE5ob0JTUlVrRWtRWEtreG5Ja00yR2dGSkZTUVNSQmNyVEdjaVF6WWFBVWtWSkJKRUZ5Y0VUR2NpUXpZYUFSVWxFa1EyR2dJVkpCSkVOaG9ERlNRU1JDSkROaG9CU1JVbEVrUTJHZ0pKRlNRU1JCY29Ud0pRVEJhL0lrTTJHZ0ZKRlNVU1JDaE1VTHhJSWtNMkdnRkpGU1VTUkNoTVVFbTlTVThDU0VFQUdVc0J2a1FYRm9BQkFDTkxBMVJRZ0FRVkgzeDFURkN3SWtNalF2L28pCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBQcm9wb3NhbE1vY2ssCiAgICBwdXNoYnl0ZXMgMHg0YzVjNjFiYSAvLyBtZXRob2QgImNyZWF0ZSgpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM4LTQwCiAgICAvLyByZXMgPSBhcmM0LmFyYzRfY3JlYXRlKAogICAgLy8gICAgIFByb3Bvc2FsTW9jaywKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzIgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyLTQ1CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVzLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDMKICAgIC8vIHJlY2VpdmVyPXJlcy5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgZHVwCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlLAogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzIgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDItNDUKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1yZXMuY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgp2b3RlX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2Ni03MgogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBQcm9wb3NhbE1vY2sudm90ZSwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXMsCiAgICAvLyAgICAgcmVqZWN0aW9uX3ZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZC5hc191aW50NjQoKSwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzEKICAgIC8vIGFwcF9pZD1wcm9wb3NhbF9pZC5hc191aW50NjQoKSwKICAgIHVuY292ZXIgMwogICAgYnRvaQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjY2LTcyCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIFByb3Bvc2FsTW9jay52b3RlLAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBhcHByb3ZhbF92b3RlcywKICAgIC8vICAgICByZWplY3Rpb25fdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLmFzX3VpbnQ2NCgpLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4YmI4ZTFkNjggLy8gbWV0aG9kICJ2b3RlKGFkZHJlc3MsdWludDY0LHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMiAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF92b3RpbmdfYWNjb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF92b3RpbmdfYWNjb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo4NQogICAgLy8gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3MubmF0aXZlXS52b3RpbmdfYWRkcmVzcyA9IHZvdGluZ19hZGRyZXNzCiAgICBieXRlY18wIC8vIDB4NzgKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBpbnRjXzIgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZ2V0X3hnb3ZfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3hnb3ZfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo4OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTAxCiAgICAvLyBleGlzdHMgPSB4Z292X2FkZHJlc3MubmF0aXZlIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzAgLy8gMHg3OAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTAyCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBnZXRfeGdvdl9ib3hfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTAzCiAgICAvLyB2YWwgPSBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzcy5uYXRpdmVdLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfYm94IGVudHJ5IGV4aXN0cwoKZ2V0X3hnb3ZfYm94X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6ODkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgcHVzaGJ5dGVzIDB4MDAKICAgIGludGNfMiAvLyAwCiAgICBkaWcgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCmdldF94Z292X2JveF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTA1LTExMAogICAgLy8gdmFsID0gdHlwLlhHb3ZCb3hWYWx1ZSgKICAgIC8vICAgICB2b3RpbmdfYWRkcmVzcz1hcmM0LkFkZHJlc3MoKSwKICAgIC8vICAgICB2b3RlZF9wcm9wb3NhbHM9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbGFzdF92b3RlX3RpbWVzdGFtcD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBzdWJzY3JpcHRpb25fcm91bmQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgYmFzZTMyKEFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIGIgZ2V0X3hnb3ZfYm94X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5zZXRfeGdvdl9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlhHb3ZCb3hWYWx1ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMjcKICAgIC8vIHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzLm5hdGl2ZV0gPSB4Z292X2JveC5jb3B5KCkKICAgIGJ5dGVjXzAgLy8gMHg3OAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTE0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5kZWxfeGdvdl9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpkZWxfeGdvdl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNDIKICAgIC8vIGRlbCBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzcy5uYXRpdmVdCiAgICBieXRlY18wIC8vIDB4NzgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [24], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [85], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [461], "errorMessage": "application exists"}, {"pc": [596], "errorMessage": "check self.xgov_box entry exists"}, {"pc": [497, 554, 562, 580, 679, 704], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [489, 505, 513], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [688], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.XGovBoxValue"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "create_proposal", "returns": {"type": "uint64", "desc": "The ID of the created proposal."}, "desc": "Create an empty proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app being voted on", "name": "proposal_id"}, {"type": "address", "desc": "(arc4.Address): The address of the xGov being voted on behalf of", "name": "xgov_address"}, {"type": "uint64", "desc": "(arc4.UInt64): The number of approvals votes allocated", "name": "approval_votes"}, {"type": "uint64", "desc": "(arc4.UInt64): The number of rejections votes allocated", "name": "rejection_votes"}], "name": "vote_proposal", "returns": {"type": "void"}, "desc": "Vote on a proposal", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The xGov address delegating voting power", "name": "xgov_address"}, {"type": "address", "desc": "The voting account address to delegate voting power to", "name": "voting_address"}], "name": "set_voting_account", "returns": {"type": "void"}, "desc": "Sets the Voting Address for the xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}], "name": "get_xgov_box", "returns": {"type": "((address,uint64,uint64,uint64),bool)", "desc": "The xGov box value bool: `True` if xGov box exists, else `False`"}, "desc": "Returns the xGov box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov.", "name": "xgov_address"}, {"type": "(address,uint64,uint64,uint64)", "desc": "The xgov box content.", "name": "xgov_box", "struct": "XGovBoxValue"}], "name": "set_xgov_box", "returns": {"type": "void"}, "desc": "Sets the xGov box for the given address.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,(address,uint64,uint64,uint64))[]", "desc": "The xGov addresses and their box contents.", "name": "xgov_boxes"}], "name": "set_xgov_boxes", "returns": {"type": "void"}, "desc": "Sets the xGov boxes for the given addresses, to seed many xGovs at once.\nThe number of entries per call is bound by the box references of the group.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov.", "name": "xgov_address"}], "name": "del_xgov_box", "returns": {"type": "void"}, "desc": "Deletes the xGov box for the given address.", "events": [], "readonly": false, "recommendations": {}}], "name": "XgovRegistryMock", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"xgov_box": {"keyType": "address", "valueType": "XGovBoxValue", "prefix": "eA=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"XGovBoxValue": [{"name": "voting_address", "type": "address"}, {"name": "voted_proposals", "type": "uint64"}, {"name": "last_vote_timestamp", "type": "uint64"}, {"name": "subscription_round", "type": "uint64"}]}, "byteCode": {"approval": "CiAEAQAgCCYCAXgEFR98dTEbQQBAMRkURDEYRIIHBKHNdiEEFY+N1gQNoniFBCdjDWUEuPrN8wR3d0y+BKWRdnE2GgCOBwALAd4CHwI5ApwCtQL3ADEZFDEYFBBEIkOxgQSyNIAECoEBQ7JCgJYDCiAEAQAIICYFAVYPcmVnaXN0cnlfYXBwX2lkBnN0YXR1cxZ2b3RlX29wZW5pbmdfdGltZXN0YW1wD3ZvdGluZ19kdXJhdGlvbjEYQAANKSNnKiNnKyNnJwQjZzEZFEQxGEEAQIIIBBOUzDwErlrBDwS09PmpBLuOHWgE8w/7ugT9iW9IBF2HRzYEJGFfkDYaAI4IABUAIwAxAEAAVwBxALMAwgCABExcYbo2GgCOAQABACkyDWciQzYaAUkVJBJEFypMZyJDNhoBSRUkEkQXK0xnIkM2GgFJFSQSRBcnBExnIkM2GgEVJRJENhoCFSQSRDYaAxUkEkQiQzYaAUkVJRJENhoCSRUkEkQXKE8CUEwWvyJDNhoBRwIjWUlOAoEoC4ECCEwVEkQjSUsCDEEAJEsCVwIASwFJTgKBKAuBKFhJVyAITFcAIChMUEy/IghFAUL/1SJDNhoBSRUlEkQoTFC8SCJDNhoBSRUlEkQoTFBJvUlPAkhBABlLAb5EFxaAAQAjSwNUUIAEFR98dUxQsCJDI0L/6LJAgARMXGG6shqBBrIQI7IBs7Q9sUlyCEQyAbIIsgcishAjsgGzFilMULAiQzYaAUkVJRJENhoCSRUkEkQ2GgNJFSUSRDYaBEkVJRJEsU8DF7IYgAS7jh1oshpPArIaTLIashqBBrIQI7IBsyJDNhoBSRUkEkQ2GgJJFSQSRChPAlAjTwK7IkM2GgFJFSQSRChMUEm9SU8CSEEAEksBvkSAAQAjSwNUUClMULAiQ4A4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABC/7U2GgFJFSQSRDYaAkkVgTgSRChPAlBMvyJDNhoBRwIjWUlOAoFYC4ECCEwVEkQjSUsCDEEAJEsCVwIASwFJTgKBWAuBWFhJVyA4TFcAIChMUEy/IghFAUL/1SJDNhoBSRUkEkQoTFC8SCJD", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMzIgOAogICAgYnl0ZWNibG9jayAweDc4IDB4MTUxZjdjNzUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIFhnb3ZSZWdpc3RyeU1vY2soQVJDNENvbnRyYWN0LCBhdm1fdmVyc2lvbj0xMCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxNgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHhhMWNkNzYyMSAweDE1OGY4ZGQ2IDB4MGRhMjc4ODUgMHgyNzYzMGQ2NSAweGI4ZmFjZGYzIDB4Nzc3NzRjYmUgMHhhNTkxNzY3MSAvLyBtZXRob2QgImNyZWF0ZV9wcm9wb3NhbCgpdWludDY0IiwgbWV0aG9kICJ2b3RlX3Byb3Bvc2FsKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAic2V0X3ZvdGluZ19hY2NvdW50KGFkZHJlc3MsYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJnZXRfeGdvdl9ib3goYWRkcmVzcykoKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpLGJvb2wpIiwgbWV0aG9kICJzZXRfeGdvdl9ib3goYWRkcmVzcywoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCkpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfYm94ZXMoKGFkZHJlc3MsKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpKVtdKXZvaWQiLCBtZXRob2QgImRlbF94Z292X2JveChhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGVfcHJvcG9zYWwgdm90ZV9wcm9wb3NhbCBzZXRfdm90aW5nX2FjY291bnQgZ2V0X3hnb3ZfYm94IHNldF94Z292X2JveCBzZXRfeGdvdl9ib3hlcyBkZWxfeGdvdl9ib3gKICAgIGVycgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxNjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AgJiYgY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmNyZWF0ZV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZV9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzktNDEKICAgIC8vIHJlcyA9IGFyYzQuYXJjNF9jcmVhdGUoCiAgICAvLyAgICAgUHJvcG9zYWxNb2NrLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA0IC8vIDQKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgcHVzaGJ5dGVzIGJhc2U2NChDb0VCUXc9PSkKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgcHVzaGJ5dGVzIGJhc2U2NChDaUFFQVFBSUlDWUZBVllQY21WbmFYTjBjbmxmWVhCd1gybGtCbk4wWVhSMWN4WjJiM1JsWDI5d1pXNXBibWRmZEdsdFpYTjBZVzF3RDNadmRHbHVaMTlrZFhKaGRHbHZiakVZUUFBTktTTm5LaU5uS3lObkp3UWpaekVaRkVReEdFRUFRSUlJQkJPVXpEd0VybHJCRHdTMDlQbXBCTHVPSFdnRTh3Lzd1Z1Q5aVc5SUJGMkhSellFSkdGZmtEWWFBSTRJQUJVQUl3QXhBRUFBVndCeEFMTUF3Z0NBQkV4Y1libzJHZ0NPQVFBQkFDa3lEV2NpUXpZYUFVa1ZKQkpFRnlwTVp5SkROaG9CU1JVa0VrUVhLMHhuSWtNMkdnRkpGU1FTUkJjbkJFeG5Ja00yR2dFVkpSSkVOaG9DRlNRU1JEWWFBeFVrRWtRaVF6WWFBVWtWSlJKRU5ob0NTUlVrRWtRWEtFOENVRXdXdnlKRE5ob0JSd0lqV1VsT0FvRW9DNEVDQ0V3VkVrUWpTVXNDREVFQUpFc0NWd0lBU3dGSlRnS0JLQXVCS0ZoSlZ5QUlURmNBSUNoTVVFeS9JZ2hGQVVMLzFTSkROaG9CU1JVbEVrUW9URkM4U0NKRE5ob0JTUlVsRWtRb1RGQkp2VWxQQWtoQkFCbExBYjVFRnhhQUFRQWpTd05VVUlBRUZSOThkVXhRc0NKREkwTC82QT09KQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MAogICAgLy8gUHJvcG9zYWxNb2NrLAogICAgcHVzaGJ5dGVzIDB4NGM1YzYxYmEgLy8gbWV0aG9kICJjcmVhdGUoKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOS00MQogICAgLy8gcmVzID0gYXJjNC5hcmM0X2NyZWF0ZSgKICAgIC8vICAgICBQcm9wb3NhbE1vY2ssCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0My00NgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlcy5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1HbG9iYWwubWluX2JhbGFuY2UsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyByZWNlaXZlcj1yZXMuY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIGR1cAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NQogICAgLy8gYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18wIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQzLTQ2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVzLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PUdsb2JhbC5taW5fYmFsYW5jZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZV9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjctNzMKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWxNb2NrLnZvdGUsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcHJvdmFsX3ZvdGVzLAogICAgLy8gICAgIHJlamVjdGlvbl92b3RlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQuYXNfdWludDY0KCksCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBhcHBfaWQ9cHJvcG9zYWxfaWQuYXNfdWludDY0KCksCiAgICB1bmNvdmVyIDMKICAgIGJ0b2kKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2Ny03MwogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBQcm9wb3NhbE1vY2sudm90ZSwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXMsCiAgICAvLyAgICAgcmVqZWN0aW9uX3ZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZC5hc191aW50NjQoKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGJiOGUxZDY4IC8vIG1ldGhvZCAidm90ZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5zZXRfdm90aW5nX2FjY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdm90aW5nX2FjY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6ODYKICAgIC8vIHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzLm5hdGl2ZV0udm90aW5nX2FkZHJlc3MgPSB2b3RpbmdfYWRkcmVzcwogICAgYnl0ZWNfMCAvLyAweDc4CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmdldF94Z292X2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF94Z292X2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gZXhpc3RzID0geGdvdl9hZGRyZXNzLm5hdGl2ZSBpbiBzZWxmLnhnb3ZfYm94CiAgICBieXRlY18wIC8vIDB4NzgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3hnb3ZfYm94X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEwNAogICAgLy8gdmFsID0gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3MubmF0aXZlXS5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2JveCBlbnRyeSBleGlzdHMKCmdldF94Z292X2JveF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHB1c2hieXRlcyAweDAwCiAgICBpbnRjXzEgLy8gMAogICAgZGlnIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgpnZXRfeGdvdl9ib3hfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEwNi0xMTEKICAgIC8vIHZhbCA9IHR5cC5YR292Qm94VmFsdWUoCiAgICAvLyAgICAgdm90aW5nX2FkZHJlc3M9YXJjNC5BZGRyZXNzKCksCiAgICAvLyAgICAgdm90ZWRfcHJvcG9zYWxzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGxhc3Rfdm90ZV90aW1lc3RhbXA9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgc3Vic2NyaXB0aW9uX3JvdW5kPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICBiIGdldF94Z292X2JveF9hZnRlcl9pZl9lbHNlQDQKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3hnb3ZfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3hnb3ZfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292Qm94VmFsdWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTI4CiAgICAvLyBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzcy5uYXRpdmVdID0geGdvdl9ib3guY29weSgpCiAgICBieXRlY18wIC8vIDB4NzgKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3hnb3ZfYm94ZXNbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9ib3hlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTMyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDg4IC8vIDg4CiAgICAqCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuWEdvdkJveEVudHJ5PgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNDQKICAgIC8vIGZvciBpIGluIHVyYW5nZSh4Z292X2JveGVzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMAoKc2V0X3hnb3ZfYm94ZXNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNDQKICAgIC8vIGZvciBpIGluIHVyYW5nZSh4Z292X2JveGVzLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiBzZXRfeGdvdl9ib3hlc19hZnRlcl9mb3JANQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNDUtMTQ2CiAgICAvLyBlbnRyeSA9IHhnb3ZfYm94ZXNbaV0uY29weSgpCiAgICAvLyBzZWxmLnhnb3ZfYm94W2VudHJ5Lnhnb3ZfYWRkcmVzcy5uYXRpdmVdID0gZW50cnkueGdvdl9ib3guY29weSgpCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgODggLy8gODgKICAgICoKICAgIHB1c2hpbnQgODggLy8gODgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDMyIDU2CiAgICBzd2FwCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTQ2CiAgICAvLyBzZWxmLnhnb3ZfYm94W2VudHJ5Lnhnb3ZfYWRkcmVzcy5uYXRpdmVdID0gZW50cnkueGdvdl9ib3guY29weSgpCiAgICBieXRlY18wIC8vIDB4NzgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNDQKICAgIC8vIGZvciBpIGluIHVyYW5nZSh4Z292X2JveGVzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHNldF94Z292X2JveGVzX2Zvcl9oZWFkZXJAMgoKc2V0X3hnb3ZfYm94ZXNfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZGVsX3hnb3ZfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZGVsX3hnb3ZfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTYxCiAgICAvLyBkZWwgc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3MubmF0aXZlXQogICAgYnl0ZWNfMCAvLyAweDc4CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [24], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [92], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [541], "errorMessage": "application exists"}, {"pc": [676], "errorMessage": "check self.xgov_box entry exists"}, {"pc": [820], "errorMessage": "index access is out of bounds"}, {"pc": [783], "errorMessage": "invalid array length header"}, {"pc": [796], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.XGovBoxEntry>"}, {"pc": [577, 634, 642, 660, 759, 850], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [569, 585, 593], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [768], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.XGovBoxValue"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+# Declared only: parsed on first use of `APP_SPEC`, not at import
+APP_SPEC: algokit_utils.Arc56Contract
+
+def __getattr__(name: str) -> algokit_utils.Arc56Contract:
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -114,6 +125,15 @@ class SetXgovBoxArgs:
     def abi_method_signature(self) -> str:
         return "set_xgov_box(address,(address,uint64,uint64,uint64))void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetXgovBoxesArgs:
+    """Dataclass for set_xgov_boxes arguments"""
+    xgov_boxes: list[tuple[str, tuple[str, int, int, int]]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class DelXgovBoxArgs:
     """Dataclass for del_xgov_box arguments"""
@@ -191,6 +211,19 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def set_xgov_boxes(
+        self,
+        args: tuple[list[tuple[str, tuple[str, int, int, int]]]] | SetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void",
+            "args": method_args,
+        }))
+
     def del_xgov_box(
         self,
         args: tuple[str] | DelXgovBoxArgs,
@@ -282,6 +315,19 @@ class XgovRegistryMockCreateTransactionParams:
             "args": method_args,
         }))
 
+    def set_xgov_boxes(
+        self,
+        args: tuple[list[tuple[str, tuple[str, int, int, int]]]] | SetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void",
+            "args": method_args,
+        }))
+
     def del_xgov_box(
         self,
         args: tuple[str] | DelXgovBoxArgs,
@@ -388,6 +434,22 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def set_xgov_boxes(
+        self,
+        args: tuple[list[tuple[str, tuple[str, int, int, int]]]] | SetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def del_xgov_box(
         self,
         args: tuple[str] | DelXgovBoxArgs,
@@ -534,7 +596,7 @@ class XgovRegistryMockClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -567,7 +629,7 @@ class XgovRegistryMockClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -589,7 +651,7 @@ class XgovRegistryMockClient:
     ) -> "XgovRegistryMockClient":
         return XgovRegistryMockClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -671,6 +733,12 @@ class XgovRegistryMockClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["del_xgov_box(address)void"],
@@ -730,7 +798,7 @@ class XgovRegistryMockFactory(algokit_utils.TypedAppFactoryProtocol[XgovRegistry
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -957,6 +1025,26 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def set_xgov_boxes(
+        self,
+        args: tuple[list[tuple[str, tuple[str, int, int, int]]]] | SetXgovBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def del_xgov_box(
         self,
         args: tuple[str] | DelXgovBoxArgs,
@@ -1167,6 +1255,24 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def set_xgov_boxes(
+        self,
+        args: tuple[list[tuple[str, tuple[str, int, int, int]]]] | SetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_xgov_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_xgov_boxes((address,(address,uint64,uint64,uint64))[])void", v
+            )
+        )
+        return self
+
     def del_xgov_box(
         self,
         args: tuple[str] | DelXgovBoxArgs,
@@ -27,6 +27,26 @@ class XGovBoxValue(arc4.Struct):
     subscription_round: arc4.UInt64
 
 
+class XGovBoxEntry(arc4.Struct):
+    xgov_address: arc4.Address
+    xgov_box: XGovBoxValue
+
+
+class VoterBoxEntry(arc4.Struct):
+    voter_address: arc4.Address
+    votes: arc4.UInt64
+
+
+class AppIdResult(arc4.Struct):
+    app_id: arc4.UInt64
+    exists: arc4.Bool
+
+
+class VoteResult(arc4.Struct):
+    vote: Vote
+    is_valid: arc4.Bool
+
+
 ContractName: t.TypeAlias = arc4.StaticArray[arc4.Byte, t.Literal[6]]
 """
 ContractName : arc4.StaticArray[arc4.Byte, t.Literal[3]]
@@ -0,0 +1,80 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+from algokit_utils import Arc56Contract
+from algosdk.abi import ABIType
+from algosdk.encoding import checksum
+
+EVENT_SELECTOR_LENGTH: Final[int] = 4
+
+
+@dataclass(frozen=True)
+class EventType:
+    name: str
+    arg_names: tuple[str, ...]
+    abi_type: ABIType
+
+    @property
+    def signature(self) -> str:
+        return self.name + str(self.abi_type)
+
+    @property
+    def selector(self) -> bytes:
+        return get_event_selector(self.signature)
+
+
+@dataclass(frozen=True)
+class Event:
+    name: str
+    args: dict[str, object]
+
+
+def get_event_selector(signature: str) -> bytes:
+    """Return the ARC-28 selector of an event signature, e.g. `ManagerSet(address)`."""
+    selector: bytes = checksum(signature.encode())[:EVENT_SELECTOR_LENGTH]  # type: ignore[misc]
+    return selector
+
+
+class EventDecoder:
+    """
+    Decoder of the ARC-28 events declared in ARC-56 app specs.
+
+    Events are matched by selector, so logs of apps whose spec is not given, or logs that
+    are not events (e.g. ABI return values), are ignored.
+    """
+
+    def __init__(self, app_specs: Iterable[Arc56Contract]) -> None:
+        self.event_types: dict[bytes, EventType] = {}
+        for app_spec in app_specs:
+            for event in app_spec.events or []:
+                arg_types = ",".join(arg.type for arg in event.args)
+                event_type = EventType(
+                    name=event.name,
+                    arg_names=tuple(arg.name or "" for arg in event.args),
+                    abi_type=ABIType.from_string(f"({arg_types})"),
+                )
+                self.event_types[event_type.selector] = event_type
+
+    def decode(self, log: bytes) -> Event | None:
+        """
+        Decode a log into an event.
+
+        Args:
+            log (bytes): Log of an app call
+
+        Returns:
+            Event | None: Decoded event, `None` if the log is not a known event
+        """
+        event_type = self.event_types.get(log[:EVENT_SELECTOR_LENGTH])
+        if event_type is None:
+            return None
+        values: list[object] = event_type.abi_type.decode(log[EVENT_SELECTOR_LENGTH:])
+        return Event(
+            name=event_type.name,
+            args=dict(zip(event_type.arg_names, values, strict=True)),
+        )
+
+    def decode_logs(self, logs: Iterable[bytes]) -> list[Event]:
+        events = (self.decode(log) for log in logs)
+        return [event for event in events if event is not None]
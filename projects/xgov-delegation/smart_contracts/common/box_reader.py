@@ -0,0 +1,190 @@
+"""
+Bulk reader of the box maps of an app.
+
+The generated clients read a map (`state.box.<map>.get_map()`) one box per algod request,
+each on a new connection. This reader lists the box names once, fetches the values
+concurrently over keep-alive connections, one per worker thread, and decodes them batch
+by batch as a stream, so at most `batch_size` values are held in memory at once.
+"""
+
+import base64
+import http.client
+import json
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Final, cast
+from urllib.parse import quote, urlsplit
+
+from algokit_utils import AlgorandClient, Arc56Contract
+from algokit_utils.applications.abi import get_abi_decoded_value
+from algosdk.abi import ABIType
+from algosdk.constants import algod_auth_header
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+BATCH_SIZE: Final[int] = 1024
+CONCURRENCY: Final[int] = 16
+
+
+class AlgodConnectionPool:
+    """Keep-alive HTTP connections to algod, one per thread."""
+
+    def __init__(self, algod_client: AlgodClient, timeout: int = 30) -> None:
+        url = urlsplit(algod_client.algod_address)
+        self.https = url.scheme == "https"
+        self.host = url.hostname or "localhost"
+        self.port = url.port
+        self.base_path = url.path.rstrip("/")
+        self.timeout = timeout
+        self.headers: dict[str, str] = {
+            "User-Agent": "py-algorand-sdk",
+            **(algod_client.headers or {}),
+            algod_auth_header: algod_client.algod_token,
+        }
+        self.local = threading.local()
+
+    def get_connection(self) -> http.client.HTTPConnection:
+        connection = cast(
+            http.client.HTTPConnection | None, getattr(self.local, "connection", None)
+        )
+        if connection is None:
+            connection_class = (
+                http.client.HTTPSConnection
+                if self.https
+                else http.client.HTTPConnection
+            )
+            connection = connection_class(self.host, self.port, timeout=self.timeout)
+            self.local.connection = connection
+        return connection
+
+    def get(self, path: str) -> tuple[int, bytes]:
+        """
+        Send a GET request to algod on the connection of the thread.
+
+        Args:
+            path (str): Path and query of the request, e.g. `/v2/status`
+
+        Returns:
+            tuple[int, bytes]: HTTP status and body of the response
+        """
+        connection = self.get_connection()
+        try:
+            connection.request("GET", self.base_path + path, headers=self.headers)
+            response = connection.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Reconnect once, e.g. if algod closed an idle connection
+            connection.close()
+            connection.request("GET", self.base_path + path, headers=self.headers)
+            response = connection.getresponse()
+        return response.status, response.read()
+
+    def get_box_value(self, app_id: int, name: bytes) -> bytes | None:
+        """
+        Value of a box, `None` if it does not exist (anymore).
+
+        Raises:
+            AlgodHTTPError: If algod responds with another error
+        """
+        query = quote("b64:" + base64.b64encode(name).decode())
+        status, body = self.get(f"/v2/applications/{app_id}/box?name={query}")
+        if status == HTTPStatus.NOT_FOUND:
+            return None
+        if status != HTTPStatus.OK:
+            raise AlgodHTTPError(body.decode(errors="replace"), status)
+        data: dict[str, str] = json.loads(body)
+        return base64.b64decode(data["value"])
+
+
+@dataclass(frozen=True)
+class BoxMapType:
+    prefix: bytes
+    decode_key: Callable[[bytes], object]
+    decode_value: Callable[[bytes], object]
+
+    @classmethod
+    def from_spec(cls, app_spec: Arc56Contract, map_name: str) -> "BoxMapType":
+        """
+        Type of a box map declared in an ARC-56 app spec.
+
+        Keys and values are decoded as `get_map` of the generated clients does, structs as
+        dicts by field name.
+
+        Args:
+            app_spec (Arc56Contract): App spec, e.g. `APP_SPEC` of a generated client
+            map_name (str): Name of the box map, e.g. `voters_box`
+
+        Returns:
+            BoxMapType: Prefix and decoders of the keys and values of the map
+        """
+        storage_map = app_spec.state.maps.box[map_name]
+        structs = app_spec.structs
+
+        def decoder(type_str: str) -> Callable[[bytes], object]:
+            if type_str in structs:
+                return lambda raw: get_abi_decoded_value(raw, type_str, structs)
+            # Parse the ABI type once for all the boxes of the map
+            abi_type = ABIType.from_string(type_str)
+            return lambda raw: cast(object, abi_type.decode(raw))
+
+        return cls(
+            prefix=base64.b64decode(storage_map.prefix or ""),
+            decode_key=decoder(storage_map.key_type),
+            decode_value=decoder(storage_map.value_type),
+        )
+
+
+def iter_box_map(
+    algorand_client: AlgorandClient,
+    app_id: int,
+    box_map: BoxMapType,
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = CONCURRENCY,
+) -> Iterator[tuple[object, object]]:
+    """
+    Stream the entries of a box map of an app.
+
+    Args:
+        algorand_client (AlgorandClient): Algorand client
+        app_id (int): App ID
+        box_map (BoxMapType): Type of the box map
+        batch_size (int): Number of boxes fetched and decoded at once
+        concurrency (int): Maximum number of requests in flight
+
+    Yields:
+        tuple[object, object]: Decoded key and value of each box of the map
+    """
+    names = [
+        box.name_raw
+        for box in algorand_client.app.get_box_names(app_id)
+        if box.name_raw.startswith(box_map.prefix)
+    ]
+    pool = AlgodConnectionPool(algorand_client.client.algod)
+
+    def get_value(name: bytes) -> bytes | None:
+        return pool.get_box_value(app_id, name)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i in range(0, len(names), batch_size):
+            batch = names[i : i + batch_size]
+            values = list(executor.map(get_value, batch))
+            for name, value in zip(batch, values, strict=True):
+                if value is not None:  # deleted since listed
+                    yield (
+                        box_map.decode_key(name[len(box_map.prefix) :]),
+                        box_map.decode_value(value),
+                    )
+
+
+def get_box_map(
+    algorand_client: AlgorandClient,
+    app_id: int,
+    app_spec: Arc56Contract,
+    map_name: str,
+    concurrency: int = CONCURRENCY,
+) -> dict[object, object]:
+    """Read a whole box map of an app, as `state.box.<map_name>.get_map()`."""
+    box_map = BoxMapType.from_spec(app_spec, map_name)
+    return dict(iter_box_map(algorand_client, app_id, box_map, concurrency=concurrency))
@@ -36,6 +36,7 @@ MAX_MBR_PER_BOX: Final[int] = (
 BYTES_PER_APP_PAGE: Final[int] = 2048  # 2 KiB in bytes
 
 MAX_APP_TOTAL_ARG_LEN: Final[int] = 2048
+MAX_TXN_REFERENCES: Final[int] = 8  # accounts, apps, assets and boxes of an app call
 METHOD_SELECTOR_LENGTH: Final[int] = 4
 UINT64_LENGTH: Final[int] = 8
 DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD: Final[int] = 2
@@ -0,0 +1,173 @@
+import heapq
+from collections import Counter
+from collections.abc import Mapping
+from typing import Final
+
+from algokit_utils import AlgorandClient
+from algokit_utils.models.state import BoxIdentifier
+from algosdk.encoding import encode_address
+
+from smart_contracts.common.fleet import FleetTable
+from smart_contracts.proposal import config as prop_cfg
+
+VOTER_BOX_KEY_PREFIX: Final[bytes] = prop_cfg.VOTER_BOX_KEY_PREFIX.encode()
+
+
+def get_weight(entry: tuple[int, int]) -> int:
+    return entry[1]
+
+
+def get_voter_box_names(
+    algorand_client: AlgorandClient, proposal_id: int
+) -> dict[str, bytes]:
+    """
+    List the voter boxes of a Proposal.
+
+    Args:
+        algorand_client (AlgorandClient): Algorand client
+        proposal_id (int): App ID of the Proposal
+
+    Returns:
+        dict[str, bytes]: Voter box names by xGov address
+    """
+    box_names: dict[str, bytes] = {}
+    for box in algorand_client.app.get_box_names(proposal_id):
+        if box.name_raw.startswith(VOTER_BOX_KEY_PREFIX):
+            xgov_address: str = encode_address(
+                box.name_raw[len(VOTER_BOX_KEY_PREFIX) :]
+            )
+            box_names[xgov_address] = box.name_raw
+    return box_names
+
+
+def get_proposal_votes(
+    algorand_client: AlgorandClient, proposal_id: int
+) -> dict[str, int]:
+    """
+    Read the votes of the xGovs on a Proposal from its voter boxes.
+
+    Args:
+        algorand_client (AlgorandClient): Algorand client
+        proposal_id (int): App ID of the Proposal
+
+    Returns:
+        dict[str, int]: Votes by xGov address
+    """
+    box_names = get_voter_box_names(algorand_client, proposal_id)
+    box_identifiers: list[BoxIdentifier] = list(box_names.values())
+    values = algorand_client.app.get_box_values(proposal_id, box_identifiers)
+    return {
+        xgov_address: int.from_bytes(value[:8])
+        for xgov_address, value in zip(box_names, values, strict=True)
+    }
+
+
+class DelegationIndex:
+    """
+    Voters delegating to each Representative, with the votes they weigh on each Proposal.
+
+    The index is updated incrementally as Voters change Representative or as the votes
+    of their xGovs on a Proposal change, so the weight behind a Representative is always
+    at hand to prioritize the votes to publish or trigger.
+    """
+
+    def __init__(self) -> None:
+        self.representative_of: dict[int, int] = {}  # by Voter app
+        self.voters_of: dict[int, set[int]] = {}  # by Representative app
+        self.votes: dict[int, dict[int, int]] = {}  # by Proposal, by Voter app
+        self.weights: dict[int, Counter[int]] = {}  # by Proposal, by Representative app
+
+    @classmethod
+    def from_fleet(
+        cls,
+        fleet: FleetTable,
+        proposal_votes: Mapping[int, Mapping[str, int]],
+    ) -> "DelegationIndex":
+        """
+        Index the delegations of a fleet.
+
+        Args:
+            fleet (FleetTable): Voters of the Delegation Registry
+            proposal_votes (Mapping[int, Mapping[str, int]]): Votes by xGov address, by Proposal
+
+        Returns:
+            DelegationIndex: Index of the delegating Voters
+        """
+        index = cls()
+        voter_ids: dict[str, int] = {}
+        for row in range(len(fleet)):
+            voter_id = fleet.voter_ids[row]
+            voter_ids[fleet.addresses[fleet.xgov_address[row]]] = voter_id
+            index.set_representative(voter_id, fleet.representative_app[row])
+        for proposal_id, votes in proposal_votes.items():
+            for xgov_address, xgov_votes in votes.items():
+                voter_id_of_xgov = voter_ids.get(xgov_address)
+                if voter_id_of_xgov is not None:
+                    index.set_votes(proposal_id, voter_id_of_xgov, xgov_votes)
+        return index
+
+    def set_representative(self, voter_id: int, representative_id: int) -> None:
+        """Move a Voter to a Representative, 0 for none."""
+        if self.representative_of.get(voter_id) == representative_id:
+            return
+
+        self._detach(voter_id)
+        self.representative_of[voter_id] = representative_id
+        if representative_id:
+            self.voters_of.setdefault(representative_id, set()).add(voter_id)
+            for proposal_id, votes in self.votes.items():
+                if voter_id in votes:
+                    self.weights[proposal_id][representative_id] += votes[voter_id]
+
+    def set_votes(self, proposal_id: int, voter_id: int, votes: int) -> None:
+        """Set the votes of the xGov of a Voter on a Proposal."""
+        proposal_votes = self.votes.setdefault(proposal_id, {})
+        weights = self.weights.setdefault(proposal_id, Counter())
+        delta = votes - proposal_votes.get(voter_id, 0)
+        proposal_votes[voter_id] = votes
+
+        representative_id = self.representative_of.get(voter_id, 0)
+        if representative_id:
+            weights[representative_id] += delta
+
+    def remove_voter(self, voter_id: int) -> None:
+        self._detach(voter_id)
+        self.representative_of.pop(voter_id, None)
+        for votes in self.votes.values():
+            votes.pop(voter_id, None)
+
+    def remove_proposal(self, proposal_id: int) -> None:
+        self.votes.pop(proposal_id, None)
+        self.weights.pop(proposal_id, None)
+
+    def get_weight(self, proposal_id: int, representative_id: int) -> int:
+        return self.weights.get(proposal_id, Counter())[representative_id]
+
+    def top(self, proposal_id: int, n: int) -> list[tuple[int, int]]:
+        """
+        Representatives with the most votes delegated to them on a Proposal.
+
+        Args:
+            proposal_id (int): App ID of the Proposal
+            n (int): Number of Representatives
+
+        Returns:
+            list[tuple[int, int]]: Representative app IDs and their weight, heaviest first
+        """
+        weights = self.weights.get(proposal_id, Counter())
+        return heapq.nlargest(
+            n,
+            ((rep_id, weight) for rep_id, weight in weights.items() if weight > 0),
+            key=get_weight,
+        )
+
+    def _detach(self, voter_id: int) -> None:
+        representative_id = self.representative_of.get(voter_id, 0)
+        if not representative_id:
+            return
+        self.voters_of[representative_id].discard(voter_id)
+        if not self.voters_of[representative_id]:
+            del self.voters_of[representative_id]
+        for proposal_id, votes in self.votes.items():
+            if voter_id in votes:
+                self.weights[proposal_id][representative_id] -= votes[voter_id]
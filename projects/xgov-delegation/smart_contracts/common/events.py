@@ -0,0 +1,223 @@
+"""
+ARC-28 events logged by the Delegation Registry, Voter and Representative contracts.
+
+Each event is emitted with `arc4.emit` by the app whose state it changes and carries the
+address the app is registered for (xGov, representative or manager), so the state of the
+delegation can be rebuilt by following the logs of the Delegation Registry and of the apps
+it creates, without reading their state. App IDs are logged as `uint64`.
+"""
+
+from algopy import arc4
+
+from smart_contracts.common import abi_types as typ
+
+# ---------------------------------
+# ------ Delegation Registry ------
+# ---------------------------------
+
+
+class RegistryManagerSet(arc4.Struct):
+    previous_manager_address: arc4.Address
+    manager_address: arc4.Address
+
+
+class RegistryConfigured(arc4.Struct):
+    vote_fees: typ.Fees
+    representative_fee: arc4.UInt64
+    vote_trigger_award: arc4.UInt64
+
+
+class RegistryPauseSet(arc4.Struct):
+    manager_address: arc4.Address
+    paused: arc4.Bool
+
+
+class RegistryUpdated(arc4.Struct):
+    manager_address: arc4.Address
+    registry_id: arc4.UInt64
+
+
+class BalanceWithdrawn(arc4.Struct):
+    manager_address: arc4.Address
+    amount: arc4.UInt64
+
+
+class ContractInitialized(arc4.Struct):
+    contract: typ.ContractName
+    size: arc4.UInt64
+
+
+class ContractLoaded(arc4.Struct):
+    contract: typ.ContractName
+    offset: arc4.UInt64
+    size: arc4.UInt64
+
+
+class KeyRegistered(arc4.Struct):
+    fee: arc4.UInt64
+    key_reg_info: typ.KeyRegTxnInfo
+
+
+class VoterPrepared(arc4.Struct):
+    funder_address: arc4.Address
+    voter_id: arc4.UInt64
+
+
+class VoterRegistered(arc4.Struct):
+    xgov_address: arc4.Address
+    voter_id: arc4.UInt64
+
+
+class VoterUpdated(arc4.Struct):
+    xgov_address: arc4.Address
+    voter_id: arc4.UInt64
+
+
+class VoterUnregistered(arc4.Struct):
+    xgov_address: arc4.Address
+    voter_id: arc4.UInt64
+
+
+class VotesPaid(arc4.Struct):
+    xgov_address: arc4.Address
+    votes: arc4.UInt64
+    fee: arc4.UInt64
+
+
+class VoteTriggered(arc4.Struct):
+    xgov_address: arc4.Address
+    proposal_id: arc4.UInt64
+    trigger_award: arc4.UInt64
+
+
+class TriggerRewardsOpened(arc4.Struct):
+    trigger_address: arc4.Address
+    mbr: arc4.UInt64
+
+
+class TriggerRewardsCredited(arc4.Struct):
+    trigger_address: arc4.Address
+    amount: arc4.UInt64
+
+
+class TriggerRewardsClaimed(arc4.Struct):
+    trigger_address: arc4.Address
+    amount: arc4.UInt64
+
+
+class TriggerRewardsClosed(arc4.Struct):
+    trigger_address: arc4.Address
+    amount: arc4.UInt64  # claimed rewards and refunded MBR
+
+
+class TriggeredPageDeleted(arc4.Struct):
+    proposal_id: arc4.UInt64
+    page: arc4.UInt64
+
+
+class RepresentativeRegistered(arc4.Struct):
+    representative_address: arc4.Address
+    representative_id: arc4.UInt64
+
+
+class RepresentativeUpdated(arc4.Struct):
+    representative_address: arc4.Address
+    representative_id: arc4.UInt64
+
+
+class RepresentativeUnregistered(arc4.Struct):
+    representative_address: arc4.Address
+    representative_id: arc4.UInt64
+
+
+# ---------------------------------
+# ------------ Voter --------------
+# ---------------------------------
+
+
+class XGovAssigned(arc4.Struct):
+    xgov_address: arc4.Address
+    manager_address: arc4.Address
+
+
+class VoterManagerSet(arc4.Struct):
+    xgov_address: arc4.Address
+    manager_address: arc4.Address
+
+
+class RepresentativeSet(arc4.Struct):
+    xgov_address: arc4.Address
+    representative_id: arc4.UInt64
+
+
+class BackupRepresentativesSet(arc4.Struct):
+    xgov_address: arc4.Address
+    representative_ids: arc4.DynamicArray[arc4.UInt64]
+
+
+class WindowSet(arc4.Struct):
+    xgov_address: arc4.Address
+    window_ts: arc4.UInt64
+
+
+class VotesAdded(arc4.Struct):
+    xgov_address: arc4.Address
+    votes: arc4.UInt64
+    votes_left: arc4.UInt64
+
+
+class VotedByRepresentative(arc4.Struct):
+    xgov_address: arc4.Address
+    proposal_id: arc4.UInt64
+    representative_id: arc4.UInt64
+    approvals: arc4.UInt64
+    rejections: arc4.UInt64
+    votes_left: arc4.UInt64
+
+
+class VotedDirectly(arc4.Struct):
+    xgov_address: arc4.Address
+    proposal_id: arc4.UInt64
+    approvals: arc4.UInt64
+    rejections: arc4.UInt64
+
+
+class VotingRightsYielded(arc4.Struct):
+    xgov_address: arc4.Address
+    voting_address: arc4.Address
+
+
+class VotingAddressSynced(arc4.Struct):
+    xgov_address: arc4.Address
+    voting_address: arc4.Address
+
+
+class VoterXGovRegistrySynced(arc4.Struct):
+    xgov_address: arc4.Address
+    xgov_registry_id: arc4.UInt64
+
+
+# ---------------------------------
+# -------- Representative ---------
+# ---------------------------------
+
+
+class RepresentativePauseSet(arc4.Struct):
+    representative_address: arc4.Address
+    paused: arc4.Bool
+
+
+class RepresentativeXGovRegistrySynced(arc4.Struct):
+    representative_address: arc4.Address
+    xgov_registry_id: arc4.UInt64
+
+
+class VotePublished(arc4.Struct):
+    representative_address: arc4.Address
+    proposal_id: arc4.UInt64
+    vote: typ.Vote
+
+
+class VoteDeleted(arc4.Struct):
+    representative_address: arc4.Address
+    proposal_id: arc4.UInt64
@@ -0,0 +1,239 @@
+"""
+Fast builder of the high-volume Delegation Registry calls.
+
+The typed client converts the arguments, looks the method up and sets up a composer for
+each call. Here the method selectors and the encoding of each argument are computed once
+from the ARC-56 app spec, so bots can build thousands of `trigger_vote` and `add_votes`
+transactions, ready to sign, in a tight loop.
+"""
+
+import copy
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Final, cast
+
+from algokit_utils import Arc56Contract
+from algosdk import transaction
+from algosdk.abi import ABIType, is_abi_transaction_type
+from algosdk.encoding import decode_address
+from algosdk.logic import get_application_address
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    APP_SPEC,
+)
+from smart_contracts.common.constants import MIN_FEE
+from smart_contracts.common.resources import AppCallResources, get_registry_voter_box
+
+# Inner transactions of each call, covered by the fee of the outer transaction
+TRIGGER_VOTE_INNER_TXNS: Final[int] = 6  # plus one per backup Representative tried
+TRIGGER_VOTE_TO_LEDGER_INNER_TXNS: Final[int] = TRIGGER_VOTE_INNER_TXNS - 1  # no award
+ADD_VOTES_INNER_TXNS: Final[int] = 2
+
+ArgEncoder = Callable[[object], bytes]
+
+
+def encode_address(value: object) -> bytes:
+    address: bytes = decode_address(value)
+    return address
+
+
+def encode_uint64(value: object) -> bytes:
+    return cast(int, value).to_bytes(8)
+
+
+def get_arg_encoder(type_str: str) -> ArgEncoder:
+    """Encoder of an ABI argument, with a fast path for the static types of the calls."""
+    if type_str == "address":
+        return encode_address
+    if type_str == "uint64":
+        return encode_uint64
+    abi_type = ABIType.from_string(type_str)
+
+    def encode(value: object) -> bytes:
+        encoded: bytes = abi_type.encode(value)
+        return encoded
+
+    return encode
+
+
+@dataclass(frozen=True)
+class MethodEncoder:
+    selector: bytes
+    arg_encoders: tuple[ArgEncoder, ...]  # of the non-transaction arguments
+
+    @classmethod
+    def from_spec(cls, app_spec: Arc56Contract, name: str) -> "MethodEncoder":
+        method = app_spec.get_arc56_method(name).to_abi_method()
+        return cls(
+            selector=method.get_selector(),
+            arg_encoders=tuple(
+                get_arg_encoder(str(arg.type))
+                for arg in method.args
+                if not is_abi_transaction_type(arg.type)
+            ),
+        )
+
+    def encode(self, *args: object) -> list[bytes]:
+        """App arguments of a call: the selector, then each argument encoded."""
+        return [self.selector] + [
+            encode(arg) for encode, arg in zip(self.arg_encoders, args, strict=True)
+        ]
+
+
+class RegistryCallBuilder:
+    """
+    Builder of `trigger_vote` and `add_votes` calls of a Delegation Registry.
+
+    Transactions share the suggested params given at construction: build a new builder,
+    or set `suggested_params`, when they expire. Each call references the box of the
+    Voter in the Delegation Registry, and the other resources its inner calls touch
+    (Voter, Representative, xGov Registry, Proposal) are given with `resources`.
+    Calls crediting the trigger rewards ledger of the sender (`to_ledger`) need also its
+    box, usually shared once by their group.
+    """
+
+    def __init__(
+        self,
+        app_id: int,
+        sender: str,
+        suggested_params: transaction.SuggestedParams,
+        app_spec: Arc56Contract | None = None,
+    ) -> None:
+        app_spec = app_spec or APP_SPEC
+        self.app_id = app_id
+        self.sender = sender
+        self.suggested_params = suggested_params
+        self.trigger_vote_encoder = MethodEncoder.from_spec(app_spec, "trigger_vote")
+        self.trigger_vote_to_ledger_encoder = MethodEncoder.from_spec(
+            app_spec, "trigger_vote_to_ledger"
+        )
+        self.add_votes_encoder = MethodEncoder.from_spec(app_spec, "add_votes")
+
+    def get_params(self, inner_txns: int) -> transaction.SuggestedParams:
+        params = copy.copy(self.suggested_params)
+        min_fee = cast(int | None, params.min_fee) or MIN_FEE
+        params.fee = (1 + inner_txns) * max(min_fee, MIN_FEE)
+        params.flat_fee = True
+        return params
+
+    def build_call(
+        self,
+        app_args: list[bytes],
+        xgov_address: str,
+        fee_params: transaction.SuggestedParams,
+        resources: AppCallResources | None,
+    ) -> transaction.ApplicationCallTxn:
+        resources = resources or AppCallResources()
+        voter_box = (0, get_registry_voter_box(xgov_address))
+        boxes: list[tuple[int, bytes]] = [voter_box, *resources.boxes]
+        accounts: list[str] = list(resources.accounts)
+        foreign_apps: list[int] = list(resources.foreign_apps)
+        return transaction.ApplicationCallTxn(
+            sender=self.sender,
+            sp=fee_params,
+            index=self.app_id,
+            on_complete=transaction.OnComplete.NoOpOC,
+            app_args=app_args,
+            accounts=accounts or None,
+            foreign_apps=foreign_apps or None,
+            boxes=boxes,
+        )
+
+    def trigger_vote(
+        self,
+        xgov_address: str,
+        proposal_id: int,
+        resources: AppCallResources | None = None,
+        *,
+        to_ledger: bool = False,
+        backups_tried: int = 0,
+    ) -> transaction.ApplicationCallTxn:
+        encoder, inner_txns = self.get_trigger_vote_method(to_ledger=to_ledger)
+        return self.build_call(
+            encoder.encode(xgov_address, proposal_id),
+            xgov_address,
+            self.get_params(inner_txns + backups_tried),
+            resources,
+        )
+
+    def get_trigger_vote_method(self, *, to_ledger: bool) -> tuple[MethodEncoder, int]:
+        if to_ledger:
+            return (
+                self.trigger_vote_to_ledger_encoder,
+                TRIGGER_VOTE_TO_LEDGER_INNER_TXNS,
+            )
+        return self.trigger_vote_encoder, TRIGGER_VOTE_INNER_TXNS
+
+    def trigger_votes(
+        self,
+        triggers: Sequence[tuple[str, int]],
+        resources: Callable[[str, int], AppCallResources] | None = None,
+        *,
+        to_ledger: bool = False,
+        backups_tried: Callable[[str, int], int] | None = None,
+    ) -> list[transaction.ApplicationCallTxn]:
+        """
+        Build the `trigger_vote` calls of many (xGov address, Proposal ID) pairs.
+
+        Args:
+            triggers (Sequence[tuple[str, int]]): xGov address and Proposal ID of each call
+            resources (Callable[[str, int], AppCallResources] | None): Resources of a call
+            to_ledger (bool): Credit the awards to the trigger rewards ledger of the sender
+            backups_tried (Callable[[str, int], int] | None): Backup Representatives read
+                by a call, each paid an inner call (default: none)
+
+        Returns:
+            list[transaction.ApplicationCallTxn]: Transactions, in order, not grouped
+        """
+        encoder, inner_txns = self.get_trigger_vote_method(to_ledger=to_ledger)
+        params = [self.get_params(inner_txns)]  # by backups tried
+        encode = encoder.encode
+        txns: list[transaction.ApplicationCallTxn] = []
+        for xgov_address, proposal_id in triggers:
+            backups = backups_tried(xgov_address, proposal_id) if backups_tried else 0
+            while len(params) <= backups:
+                params.append(self.get_params(inner_txns + len(params)))
+            txns.append(
+                self.build_call(
+                    encode(xgov_address, proposal_id),
+                    xgov_address,
+                    params[backups],
+                    resources(xgov_address, proposal_id) if resources else None,
+                )
+            )
+        return txns
+
+    def add_votes(
+        self,
+        xgov_address: str,
+        votes: int,
+        amount: int,
+        resources: AppCallResources | None = None,
+    ) -> list[transaction.Transaction]:
+        """
+        Build the payment and the `add_votes` call of an xGov, as a group.
+
+        Args:
+            xgov_address (str): Address of the xGov
+            votes (int): Number of votes to add
+            amount (int): Payment for the votes, in microAlgos
+            resources (AppCallResources | None): Resources of the call
+
+        Returns:
+            list[transaction.Transaction]: Payment and app call, with their group ID
+        """
+        payment = transaction.PaymentTxn(
+            sender=self.sender,
+            sp=self.get_params(0),
+            receiver=get_application_address(self.app_id),
+            amt=amount,
+        )
+        call = self.build_call(
+            self.add_votes_encoder.encode(xgov_address, votes),
+            xgov_address,
+            self.get_params(ADD_VOTES_INNER_TXNS),
+            resources,
+        )
+        txns: list[transaction.Transaction] = [payment, call]
+        group: list[transaction.Transaction] = transaction.assign_group_id(txns)
+        return group
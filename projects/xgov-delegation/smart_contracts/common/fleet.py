@@ -0,0 +1,219 @@
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from typing import Final, TypeVar, cast
+
+import numpy as np
+from algokit_utils import AlgorandClient
+from algosdk.constants import ZERO_ADDRESS
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+)
+from smart_contracts.common.helpers import (
+    Representative,
+    Voter,
+    iter_contracts,
+)
+
+UINT64: Final[str] = "Q"
+ADDRESS_INDEX: Final[str] = "I"  # index of an interned address, 0 for the zero address
+
+
+Scalar = TypeVar("Scalar", np.uint64, np.uint32, np.uint8)
+type UInt64Vector = np.ndarray[tuple[int], np.dtype[np.uint64]]
+type Mask = np.ndarray[tuple[int], np.dtype[np.bool]]
+
+
+def as_numpy(
+    column: array[int], dtype: type[Scalar]
+) -> np.ndarray[tuple[int], np.dtype[Scalar]]:
+    """
+    Zero-copy NumPy view of a column. The view must not outlive the aggregate using it:
+    the column cannot grow while it is exported.
+    """
+    return np.frombuffer(column, dtype=dtype)
+
+
+def count_by(keys: UInt64Vector, weights: UInt64Vector | None = None) -> Counter[int]:
+    """Count the rows of each distinct key, or sum their weights."""
+    unique_keys, rows = cast(
+        tuple[UInt64Vector, np.ndarray[tuple[int], np.dtype[np.intp]]],
+        np.unique(keys, return_inverse=True),
+    )
+    # Weighted sums are float64, exact while the sum of a key stays below 2^53
+    counts = cast(
+        np.ndarray[tuple[int], np.dtype[np.float64]],
+        np.bincount(rows, weights=weights),
+    )
+    return Counter(
+        dict(zip(unique_keys.tolist(), counts.astype(np.uint64).tolist(), strict=True))
+    )
+
+
+class FleetTable:
+    """
+    Columnar table of the Voters and Representatives of a Delegation Registry.
+
+    Each field is stored in a typed array, one row per app, and addresses are interned
+    into a shared list, so a fleet of 100k Voters costs a few MB and no Python object
+    per Voter, besides the xGov lookup of `find_voter`. Aggregates are vectorized with
+    NumPy over zero-copy views of the columns.
+    """
+
+    def __init__(self) -> None:
+        self.addresses: list[str] = []
+        self.address_index: dict[str, int] = {}
+        self.voter_rows: dict[int, int] = {}  # xGov address index -> Voter row
+
+        # Voters
+        self.voter_ids: array[int] = array(UINT64)
+        self.xgov_address: array[int] = array(ADDRESS_INDEX)
+        self.manager_address: array[int] = array(ADDRESS_INDEX)
+        self.representative_app: array[int] = array(UINT64)
+        self.window_ts: array[int] = array(UINT64)
+        self.votes_left: array[int] = array(UINT64)
+        self.voter_index: array[int] = array(UINT64)
+        # Few Voters have backups, so they are kept apart, by Voter app
+        self.backup_representatives: dict[int, tuple[int, ...]] = {}
+
+        # Representatives
+        self.representative_ids: array[int] = array(UINT64)
+        self.representative_address: array[int] = array(ADDRESS_INDEX)
+        self.paused: array[int] = array("B")
+
+        self.intern(ZERO_ADDRESS)  # index 0
+
+    @classmethod
+    def from_contracts(
+        cls, contracts: Iterable[Representative | Voter]
+    ) -> "FleetTable":
+        table = cls()
+        for contract in contracts:
+            if isinstance(contract, Voter):
+                table.add_voter(contract)
+            else:
+                table.add_representative(contract)
+        return table
+
+    @classmethod
+    def from_registry(
+        cls,
+        algorand_client: AlgorandClient,
+        delegation_registry_client: DelegationRegistryClient,
+    ) -> "FleetTable":
+        """Build the table of the apps created by a Delegation Registry, one app at a time."""
+        return cls.from_contracts(
+            iter_contracts(algorand_client, delegation_registry_client)
+        )
+
+    def intern(self, address: str) -> int:
+        index = self.address_index.get(address)
+        if index is None:
+            index = self.address_index[address] = len(self.addresses)
+            self.addresses.append(address)
+        return index
+
+    def add_voter(self, voter: Voter) -> None:
+        xgov_address = self.intern(voter.xgov_address)
+        if xgov_address:
+            self.voter_rows.setdefault(xgov_address, len(self.voter_ids))
+        self.voter_ids.append(voter.id)
+        self.xgov_address.append(xgov_address)
+        self.manager_address.append(self.intern(voter.manager_address))
+        self.representative_app.append(voter.representative_app)
+        self.window_ts.append(voter.window_ts)
+        self.votes_left.append(voter.votes_left)
+        self.voter_index.append(voter.index)
+        if voter.backup_representatives:
+            self.backup_representatives[voter.id] = voter.backup_representatives
+
+    def add_representative(self, representative: Representative) -> None:
+        self.representative_ids.append(representative.id)
+        self.representative_address.append(
+            self.intern(representative.representative_address)
+        )
+        self.paused.append(representative.paused)
+
+    def __len__(self) -> int:
+        return len(self.voter_ids)
+
+    def get_voter(self, row: int, registry_app: int = 0) -> Voter:
+        return Voter(
+            id=self.voter_ids[row],
+            xgov_address=self.addresses[self.xgov_address[row]],
+            registry_app=registry_app,
+            representative_app=self.representative_app[row],
+            window_ts=self.window_ts[row],
+            votes_left=self.votes_left[row],
+            manager_address=self.addresses[self.manager_address[row]],
+            index=self.voter_index[row],
+            backup_representatives=self.backup_representatives.get(
+                self.voter_ids[row], ()
+            ),
+        )
+
+    def find_voter(self, xgov_address: str) -> int | None:
+        """Return the row of the Voter of an xGov, if any."""
+        index = self.address_index.get(xgov_address)
+        if index is None:
+            return None
+        return self.voter_rows.get(index)
+
+    def total_votes_left(self) -> int:
+        return int(cast(np.uint64, as_numpy(self.votes_left, np.uint64).sum()))
+
+    def unassigned_voters(self) -> list[int]:
+        """IDs of the Voters not yet assigned to an xGov, i.e. available for registration."""
+        unassigned = cast(Mask, as_numpy(self.xgov_address, np.uint32) == 0)
+        voter_ids = cast(UInt64Vector, as_numpy(self.voter_ids, np.uint64)[unassigned])
+        return voter_ids.tolist()
+
+    def delegation_fan_in(self) -> Counter[int]:
+        """Number of Voters delegating to each Representative app (0 for none)."""
+        return count_by(as_numpy(self.representative_app, np.uint64))
+
+    def votes_left_by_representative(self) -> Counter[int]:
+        """Paid votes left of the Voters delegating to each Representative app."""
+        return count_by(
+            as_numpy(self.representative_app, np.uint64),
+            as_numpy(self.votes_left, np.uint64),
+        )
+
+    def window_distribution(self, bin_width: int) -> Counter[int]:
+        """
+        Histogram of the voting windows of the Voters.
+
+        Args:
+            bin_width (int): Width of a bin in seconds
+
+        Returns:
+            Counter[int]: Number of Voters by bin, keyed by the lower bound of the bin
+        """
+        window_ts = as_numpy(self.window_ts, np.uint64)
+        offsets = cast(UInt64Vector, window_ts % np.uint64(bin_width))
+        return count_by(cast(UInt64Vector, window_ts - offsets))
+
+    def active_representatives(self) -> list[int]:
+        active = cast(Mask, as_numpy(self.paused, np.uint8) == 0)
+        representative_ids = cast(
+            UInt64Vector, as_numpy(self.representative_ids, np.uint64)[active]
+        )
+        return representative_ids.tolist()
+
+    def nbytes(self) -> int:
+        """Memory used by the columns, excluding the interned addresses, the row index
+        and the backup Representatives."""
+        columns = (
+            self.voter_ids,
+            self.xgov_address,
+            self.manager_address,
+            self.representative_app,
+            self.window_ts,
+            self.votes_left,
+            self.voter_index,
+            self.representative_ids,
+            self.representative_address,
+            self.paused,
+        )
+        return sum(column.itemsize * len(column) for column in columns)
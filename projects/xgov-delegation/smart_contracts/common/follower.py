@@ -0,0 +1,171 @@
+"""
+Follower of the blocks of a Delegation Registry.
+
+Reads the blocks from algod round by round, decodes the ARC-28 events logged by the
+Delegation Registry and the Voters and Representatives it created, and applies them to a
+local SQLite replica, so bots and dashboards can query the delegation state locally.
+"""
+
+import argparse
+import base64
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Final, cast
+
+from algokit_utils import AlgorandClient
+from algosdk.v2client.algod import AlgodClient
+from dotenv import load_dotenv
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    APP_SPEC as DELEGATION_REGISTRY_SPEC,
+)
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+)
+from smart_contracts.artifacts.representative.representative_client import (
+    APP_SPEC as REPRESENTATIVE_SPEC,
+)
+from smart_contracts.artifacts.voter.voter_client import APP_SPEC as VOTER_SPEC
+from smart_contracts.common.arc28 import Event, EventDecoder
+from smart_contracts.common.fleet import FleetTable
+from smart_contracts.common.replica import DelegationReplica
+
+logger = logging.getLogger(__name__)
+
+EVENT_DECODER: Final[EventDecoder] = EventDecoder(
+    [DELEGATION_REGISTRY_SPEC, VOTER_SPEC, REPRESENTATIVE_SPEC]
+)
+
+# A transaction in a block, with its apply data, as returned by algod in JSON
+SignedTxnInBlock = dict[str, object]
+
+
+def iter_app_logs(stxn: SignedTxnInBlock) -> Iterator[tuple[int, bytes]]:
+    """
+    Walk the logs of an app call of a block and of its inner transactions.
+
+    The logs of the inner transactions are yielded before the ones of the transaction
+    issuing them: the contracts emit their events after their inner calls.
+
+    Args:
+        stxn (SignedTxnInBlock): Transaction of a block (or inner transaction)
+
+    Yields:
+        tuple[int, bytes]: ID of the app and log
+    """
+    txn = cast(dict[str, object], stxn["txn"])
+    eval_delta = cast(dict[str, object], stxn.get("dt", {}))
+    for inner_stxn in cast(list[SignedTxnInBlock], eval_delta.get("itx", [])):
+        yield from iter_app_logs(inner_stxn)
+
+    if txn.get("type") != "appl":
+        return
+    # Creations have no app ID in the transaction, it is in the apply data
+    app_id = cast(int, txn.get("apid") or stxn.get("apid", 0))
+    for log in cast(list[str], eval_delta.get("lg", [])):
+        yield app_id, base64.b64decode(log)
+
+
+def get_block_txns(
+    algod_client: AlgodClient, round_number: int
+) -> list[SignedTxnInBlock]:
+    block_info = cast(
+        dict[str, dict[str, object]], algod_client.block_info(round_number)
+    )
+    return cast(list[SignedTxnInBlock], block_info["block"].get("txns", []))
+
+
+class DelegationFollower:
+    """Apply the events of a Delegation Registry to a replica, one round at a time."""
+
+    def __init__(self, algod_client: AlgodClient, replica: DelegationReplica) -> None:
+        self.algod_client = algod_client
+        self.replica = replica
+
+    def get_events(self, round_number: int) -> list[tuple[int, Event]]:
+        """Events of the Voter, Representative and Delegation Registry contracts in a round."""
+        events = []
+        for stxn in get_block_txns(self.algod_client, round_number):
+            for app_id, log in iter_app_logs(stxn):
+                event = EVENT_DECODER.decode(log)
+                if event is not None:
+                    events.append((app_id, event))
+        return events
+
+    def sync_round(self, round_number: int) -> None:
+        self.replica.apply_round(round_number, self.get_events(round_number))
+
+    def sync(self, until_round: int) -> int:
+        """
+        Apply the rounds after the high-water mark of the replica, up to a round.
+
+        Args:
+            until_round (int): Last round to apply
+
+        Returns:
+            int: Number of rounds applied
+        """
+        start_round = self.replica.round + 1
+        for round_number in range(start_round, until_round + 1):
+            self.sync_round(round_number)
+        return max(until_round + 1 - start_round, 0)
+
+    def follow(self) -> None:
+        """Apply new rounds as algod commits them, forever."""
+        while True:
+            status = cast(
+                dict[str, int], self.algod_client.status_after_block(self.replica.round)
+            )
+            last_round = status["last-round"]
+            applied = self.sync(last_round)
+            logger.info("Applied %d rounds, up to round %d", applied, last_round)
+
+
+def bootstrap(
+    algorand_client: AlgorandClient, replica: DelegationReplica, registry_id: int
+) -> None:
+    """Seed an empty replica with the current Voters and Representatives of the registry."""
+    round_number = cast(dict[str, int], algorand_client.client.algod.status())[
+        "last-round"
+    ]
+    delegation_registry_client = algorand_client.client.get_typed_app_client_by_id(
+        typed_client=DelegationRegistryClient, app_id=registry_id
+    )
+    fleet = FleetTable.from_registry(algorand_client, delegation_registry_client)
+    replica.load_fleet(fleet, round_number)
+    logger.info("Loaded %d Voters at round %d", len(fleet), round_number)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--registry-id", type=int, required=True)
+    parser.add_argument("--database", type=Path, default=Path("delegation.sqlite"))
+    parser.add_argument(
+        "--start-round",
+        type=int,
+        default=None,
+        help="Round to follow from on an empty replica, e.g. the creation round of the "
+        "registry (default: snapshot the current state of the registry)",
+    )
+    args = parser.parse_args()
+    registry_id = cast(int, args.registry_id)
+    start_round = cast(int | None, args.start_round)
+    if start_round is not None and start_round < 1:
+        parser.error("--start-round must be at least 1")
+
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv()
+    algorand_client = AlgorandClient.from_environment()
+    replica = DelegationReplica(cast(Path, args.database), registry_id)
+    if not replica.round:
+        if start_round is None:
+            bootstrap(algorand_client, replica, registry_id)
+        elif start_round > 1:  # an empty replica already follows from round 1
+            replica.apply_round(start_round - 1, [])
+
+    DelegationFollower(algorand_client.client.algod, replica).follow()
+
+
+if __name__ == "__main__":
+    main()
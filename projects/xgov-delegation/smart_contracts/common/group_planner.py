@@ -0,0 +1,315 @@
+"""
+Planner of the groups of `trigger_vote` calls.
+
+Since AVM 9 the apps, accounts and boxes referenced by any transaction of a group are
+available to all its app calls, inner ones included. A group is then limited by its
+shared reference slots (8 per call), not by each call: triggers of xGovs delegating to
+the same Representative share its app and `pv` vote box, and triggers on the same
+Proposal share its app, as all share the xGov Registry. The planner packs the triggers
+sorted by Proposal and Representative, so each group needs as few slots as possible,
+and lays the references out over the calls of the group.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from algosdk import transaction
+from algosdk.constants import TX_GROUP_LIMIT
+
+from smart_contracts.common import constants as const
+from smart_contracts.common.fast_builder import RegistryCallBuilder
+from smart_contracts.common.resources import (
+    AppCallResources,
+    ResourceResolver,
+    get_trigger_rewards_box,
+)
+
+# Slots of each call left for the shared references, after the Voter box of its xGov
+# in the Delegation Registry, always referenced by the call itself
+SHARED_SLOTS_PER_CALL = const.MAX_TXN_REFERENCES - 1
+
+
+@dataclass
+class CallLayout:
+    foreign_apps: list[int] = field(default_factory=list)
+    accounts: list[str] = field(default_factory=list)
+    boxes: list[tuple[int, bytes]] = field(default_factory=list)
+
+    @property
+    def free_slots(self) -> int:
+        used = len(self.foreign_apps) + len(self.accounts) + len(self.boxes)
+        return SHARED_SLOTS_PER_CALL - used
+
+    def to_resources(self) -> AppCallResources:
+        return AppCallResources(
+            foreign_apps=tuple(self.foreign_apps),
+            accounts=tuple(self.accounts),
+            boxes=tuple(self.boxes),
+        )
+
+
+def layout_references(
+    resources: Sequence[AppCallResources], calls: int
+) -> list[AppCallResources] | None:
+    """
+    Lay the references of the triggers of a group out over its calls.
+
+    Each reference is set once in the group. A box is set in a call that also references
+    its app, so apps with many boxes are repeated in each call holding some of them.
+    References are placed first-fit, the apps with the most boxes first.
+
+    Args:
+        resources (Sequence[AppCallResources]): Resources of each trigger of the group
+        calls (int): Number of calls of the group
+
+    Returns:
+        list[AppCallResources] | None: Resources of each call, `None` if they do not fit
+    """
+    # Boxes of each app, in order of first reference
+    apps: dict[int, dict[bytes, None]] = {}
+    accounts: dict[str, None] = {}
+    for trigger in resources:
+        for app_id in trigger.foreign_apps:
+            apps.setdefault(app_id, {})
+        for app_id, name in trigger.boxes:
+            apps.setdefault(app_id, {})[name] = None
+        for account in trigger.accounts:
+            accounts[account] = None
+
+    layouts = [CallLayout() for _ in range(calls)]
+
+    def first_fit(slots: int) -> CallLayout | None:
+        return next((layout for layout in layouts if layout.free_slots >= slots), None)
+
+    def get_boxes(app_id: int) -> int:
+        return len(apps[app_id])
+
+    # Apps with the most boxes first, then the bare apps fill the slots left
+    for app_id in sorted(apps, key=get_boxes, reverse=True):
+        pending = list(apps[app_id])
+        if app_id == 0:
+            # Boxes of the Delegation Registry, the called app
+            for name in pending:
+                registry_layout = first_fit(1)
+                if registry_layout is None:
+                    return None
+                registry_layout.boxes.append((0, name))
+            continue
+        layout = first_fit(2 if pending else 1)
+        if layout is None:
+            return None
+        layout.foreign_apps.append(app_id)
+        while pending:
+            if layout.free_slots == 0:
+                # Repeat the app in a call with room for it and a box
+                layout = first_fit(2)
+                if layout is None:
+                    return None
+                layout.foreign_apps.append(app_id)
+            layout.boxes.append((app_id, pending.pop(0)))
+    for account in accounts:
+        layout = first_fit(1)
+        if layout is None:
+            return None
+        layout.accounts.append(account)
+    return [layout.to_resources() for layout in layouts]
+
+
+@dataclass(frozen=True)
+class TriggerGroup:
+    triggers: tuple[tuple[str, int], ...]  # (xGov address, Proposal ID) of each call
+    resources: tuple[AppCallResources, ...]  # of each call
+    to_ledger: bool = False  # credit the awards to the trigger rewards ledger
+    backups_tried: tuple[int, ...] = ()  # of each call, each paid an inner call
+
+    @property
+    def slots_used(self) -> int:
+        # Voter box of each call, then the shared references
+        return len(self.triggers) + sum(
+            len(r.foreign_apps) + len(r.accounts) + len(r.boxes) for r in self.resources
+        )
+
+    def build(self, builder: RegistryCallBuilder) -> list[transaction.Transaction]:
+        """Build the calls of the group, with their group ID."""
+        backups_tried = self.backups_tried or (0,) * len(self.triggers)
+        txns: list[transaction.Transaction] = [
+            builder.trigger_vote(
+                xgov_address,
+                proposal_id,
+                resources,
+                to_ledger=self.to_ledger,
+                backups_tried=backups,
+            )
+            for (xgov_address, proposal_id), resources, backups in zip(
+                self.triggers, self.resources, backups_tried, strict=True
+            )
+        ]
+        group: list[transaction.Transaction] = transaction.assign_group_id(txns)
+        return group
+
+
+@dataclass(frozen=True)
+class PackingReport:
+    triggers: int
+    groups: int
+    slots_used: int
+    references: int  # of the triggers, each counted on its own
+    max_group_size: int
+    skipped: int = 0  # triggers with more references than their calls hold
+
+    @property
+    def triggers_per_group(self) -> float:
+        return self.triggers / self.groups if self.groups else 0.0
+
+    @property
+    def efficiency(self) -> float:
+        """Share of the transaction slots of the groups filled with triggers."""
+        if not self.groups:
+            return 0.0
+        return self.triggers / (self.groups * self.max_group_size)
+
+    @property
+    def references_shared(self) -> int:
+        return self.references - self.slots_used
+
+    def summary(self) -> str:
+        summary = (
+            f"{self.triggers} triggers in {self.groups} groups "
+            f"({self.triggers_per_group:.1f} per group, {self.efficiency:.0%} full), "
+            f"{self.slots_used} reference slots for {self.references} references"
+        )
+        if self.skipped:
+            summary += f", {self.skipped} triggers skipped"
+        return summary
+
+
+class GroupPlanner:
+    """
+    Packer of `trigger_vote` calls into groups, by their resources.
+
+    The calls of groups of several triggers mark their Voters in the triggered bitmaps
+    of the Proposals, and reference each page once. With a trigger rewards ledger, they
+    credit their awards to it instead of each paying an inner payment, and each group
+    references the ledger box once. A group of a single trigger has no slot left for
+    them, and pays the award without marking its Voter.
+
+    Args:
+        resolver (ResourceResolver): Resolver of the resources of each trigger
+        max_group_size (int): Maximum number of calls of a group
+        ledger_address (str | None): Sender of the calls, with a trigger rewards ledger
+    """
+
+    def __init__(
+        self,
+        resolver: ResourceResolver,
+        max_group_size: int = TX_GROUP_LIMIT,
+        ledger_address: str | None = None,
+    ) -> None:
+        self.resolver = resolver
+        self.max_group_size = max_group_size
+        self.ledger = (
+            AppCallResources(boxes=((0, get_trigger_rewards_box(ledger_address)),))
+            if ledger_address
+            else None
+        )
+        self.report = PackingReport(
+            triggers=0,
+            groups=0,
+            slots_used=0,
+            references=0,
+            max_group_size=max_group_size,
+        )
+        self.skipped: list[tuple[str, int]] = []
+
+    def get_sort_key(self, trigger: tuple[str, int]) -> tuple[int, int, str]:
+        xgov_address, proposal_id = trigger
+        voter_id = self.resolver.get_voter_id(xgov_address)
+        representative_id = self.resolver.representative_of.get(voter_id, 0)
+        return proposal_id, representative_id, xgov_address
+
+    def layout(
+        self, triggers: Sequence[tuple[str, int]]
+    ) -> tuple[list[AppCallResources], bool] | None:
+        """Resources of each call of a group, and whether it credits the ledger."""
+        if self.ledger is not None:
+            resources = [self.resolver.trigger_vote_to_ledger(*t) for t in triggers]
+            layout = layout_references([*resources, self.ledger], len(triggers))
+            if layout is not None:
+                return layout, True
+            if len(triggers) > 1:
+                return None
+        grouped = len(triggers) > 1
+        resources = [self.resolver.trigger_vote(*t, grouped=grouped) for t in triggers]
+        layout = layout_references(resources, len(triggers))
+        return (layout, False) if layout is not None else None
+
+    def plan(self, triggers: Sequence[tuple[str, int]]) -> list[TriggerGroup]:
+        """
+        Pack triggers into as few groups as their references allow.
+
+        Triggers are sorted by Proposal and Representative, then each group takes the
+        next triggers while their references fit in its calls. A trigger with more
+        references than a lone call holds (e.g. trying many backup Representatives)
+        opens a group only if the next trigger fits with it, else it is skipped and
+        listed in `skipped`.
+
+        Args:
+            triggers (Sequence[tuple[str, int]]): xGov address and Proposal ID of each call
+
+        Returns:
+            list[TriggerGroup]: Groups, with the resources of each call
+        """
+        groups: list[TriggerGroup] = []
+        pending: list[tuple[str, int]] = []
+        # Layout of the pending triggers, `None` for a lone trigger that does not fit
+        layout: tuple[list[AppCallResources], bool] | None = None
+        references = 0
+        self.skipped = []
+
+        def close() -> None:
+            if layout is None:
+                self.skipped.extend(pending)
+            else:
+                resources, to_ledger = layout
+                backups_tried = tuple(
+                    self.resolver.get_backups_tried(*t) for t in pending
+                )
+                groups.append(
+                    TriggerGroup(
+                        tuple(pending), tuple(resources), to_ledger, backups_tried
+                    )
+                )
+            pending.clear()
+
+        for trigger in sorted(set(triggers), key=self.get_sort_key):
+            candidate = (
+                self.layout([*pending, trigger])
+                if len(pending) < self.max_group_size
+                else None
+            )
+            if candidate is None and pending:
+                close()
+                candidate = self.layout([trigger])
+            pending.append(trigger)
+            layout = candidate
+        if pending:
+            close()
+
+        for group in groups:
+            for trigger in group.triggers:
+                resources = self.resolver.trigger_vote(*trigger)
+                references += 1 + (
+                    len(resources.foreign_apps)
+                    + len(resources.accounts)
+                    + len(resources.boxes)
+                )
+
+        self.report = PackingReport(
+            triggers=sum(len(group.triggers) for group in groups),
+            groups=len(groups),
+            slots_used=sum(group.slots_used for group in groups),
+            references=references,
+            max_group_size=self.max_group_size,
+            skipped=len(self.skipped),
+        )
+        return groups
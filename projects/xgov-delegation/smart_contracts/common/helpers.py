@@ -1,13 +1,24 @@
 import random
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Final
+from itertools import chain
+from typing import Final, TypeVar, cast
 
 from algokit_utils import AlgorandClient, AppManager
-from algosdk.constants import ZERO_ADDRESS
+from algosdk.constants import TX_GROUP_LIMIT, ZERO_ADDRESS
 from algosdk.encoding import encode_address
 
 from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
     DelegationRegistryClient,
+    DelegationRegistryComposer,
+    GetRepresentativeAppIdsArgs,
+    GetVoterAppIdsArgs,
+)
+from smart_contracts.artifacts.representative.representative_client import (
+    GetVotesArgs,
+    RepresentativeClient,
+    Vote,
 )
 from smart_contracts.common.constants import (
     ACCOUNT_MBR,
@@ -23,9 +34,12 @@ from smart_contracts.common.constants import (
     SC_BOX_NAME_LEN,
     UINT64_LENGTH,
 )
+from smart_contracts.delegation_registry import config as reg_cfg
 from smart_contracts.representative import config as rep_cfg
 from smart_contracts.voter import config as voter_cfg
 
+T = TypeVar("T")
+
 
 def load_sc_data_size_per_transaction() -> int:
     return (
@@ -40,6 +54,7 @@ def load_sc_data_size_per_transaction() -> int:
 REPRESENTATIVE_BOX_SIZE: Final[int] = 1 + 32 + 8
 VOTER_BOX_SIZE: Final[int] = 1 + 32 + 8
 PROPOSALS_VOTE_BOX_SIZE: Final[int] = 2 + 8 + 2 * 8
+TRIGGER_REWARDS_BOX_SIZE: Final[int] = 1 + 32 + 8
 
 
 def get_box_mbr(size: int, *, name: bytes | None = None) -> int:
@@ -82,6 +97,16 @@ def get_vote_mbr() -> int:
     return get_box_mbr(size=PROPOSALS_VOTE_BOX_SIZE)
 
 
+def get_trigger_rewards_mbr() -> int:
+    return get_box_mbr(size=TRIGGER_REWARDS_BOX_SIZE)
+
+
+def decode_uint64_array(raw: bytes) -> tuple[int, ...]:
+    """Decode an ARC-4 `uint64[]`: a uint16 length, then the items."""
+    length = int.from_bytes(raw[:2])
+    return tuple(int.from_bytes(raw[2 + 8 * i : 10 + 8 * i]) for i in range(length))
+
+
 @dataclass(slots=True)
 class Representative:
     id: int
@@ -99,6 +124,8 @@ class Voter:
     window_ts: int
     votes_left: int
     manager_address: str
+    index: int = 0  # 0 for Voters created before indexes
+    backup_representatives: tuple[int, ...] = ()  # in order of preference
 
 
 @dataclass(slots=True)
@@ -107,17 +134,14 @@ class Contracts:
     voters: list[Voter]
 
 
-def get_contracts(
+def iter_contracts(
     algorand_client: AlgorandClient,
     delegation_registry_client: DelegationRegistryClient,
-) -> Contracts:
+) -> Iterator[Representative | Voter]:
     account_info = algorand_client.client.algod.account_info(
         delegation_registry_client.app_address
     )
 
-    representatives: list[Representative] = []
-    voters: list[Voter] = []
-
     apps = account_info["created-apps"]  # type: ignore
 
     for app in apps:  # type: ignore
@@ -126,7 +150,7 @@ def get_contracts(
         num_uint_loc = app["params"]["local-state-schema"]["num-uint"]  # type: ignore
 
         if num_uint_loc == rep_cfg.LOCAL_UINTS:  # type: ignore
-            representative = Representative(
+            yield Representative(
                 id=app_id,
                 representative_address=encode_address(
                     gs_raw["representative_address"].value_raw
@@ -134,10 +158,9 @@ def get_contracts(
                 registry_app=gs_raw["registry_app"].value,  # type: ignore
                 paused=gs_raw["paused"].value,  # type: ignore
             )
-            representatives.append(representative)
 
         elif num_uint_loc == voter_cfg.LOCAL_UINTS:  # type: ignore
-            voter = Voter(
+            yield Voter(
                 id=app_id,
                 xgov_address=encode_address(gs_raw["xgov_address"].value_raw),  # type: ignore
                 registry_app=gs_raw["registry_app"].value,  # type: ignore
@@ -145,8 +168,27 @@ def get_contracts(
                 window_ts=gs_raw["window_ts"].value,  # type: ignore
                 votes_left=gs_raw["votes_left"].value,  # type: ignore
                 manager_address=encode_address(gs_raw["manager_address"].value_raw),  # type: ignore
+                index=gs_raw["index"].value if "index" in gs_raw else 0,  # type: ignore
+                backup_representatives=(
+                    decode_uint64_array(gs_raw["backup_representatives"].value_raw)  # type: ignore
+                    if "backup_representatives" in gs_raw
+                    else ()
+                ),
             )
-            voters.append(voter)
+
+
+def get_contracts(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> Contracts:
+    representatives: list[Representative] = []
+    voters: list[Voter] = []
+
+    for contract in iter_contracts(algorand_client, delegation_registry_client):
+        if isinstance(contract, Representative):
+            representatives.append(contract)
+        else:
+            voters.append(contract)
 
     return Contracts(representatives=representatives, voters=voters)
 
@@ -166,3 +208,154 @@ def get_available_voter(
     available_voter = random.choice(available_voters) if available_voters else None
 
     return available_voter
+
+
+def split(items: Sequence[T], size: int) -> list[list[T]]:
+    """Split items into lists of at most `size` items, in order."""
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+AddAppIdsCall = Callable[[DelegationRegistryComposer, list[str]], object]
+
+
+def add_get_voter_app_ids(
+    composer: DelegationRegistryComposer, addresses: list[str]
+) -> object:
+    return composer.get_voter_app_ids(args=GetVoterAppIdsArgs(xgov_addresses=addresses))
+
+
+def add_get_representative_app_ids(
+    composer: DelegationRegistryComposer, addresses: list[str]
+) -> object:
+    return composer.get_representative_app_ids(
+        args=GetRepresentativeAppIdsArgs(representative_addresses=addresses)
+    )
+
+
+def get_app_ids(
+    delegation_registry_client: DelegationRegistryClient,
+    addresses: Sequence[str],
+    add_call: AddAppIdsCall,
+    concurrency: int = 8,
+) -> dict[str, int]:
+    """
+    Resolve addresses with a bulk getter of the Delegation Registry.
+
+    Addresses are split into calls of `MAX_BULK_GETTER_ADDRESSES`, one box reference per
+    address, and calls into groups of `TX_GROUP_LIMIT`. Each group is one simulate
+    request, and the requests are sent concurrently.
+
+    Args:
+        delegation_registry_client (DelegationRegistryClient): Delegation Registry client
+        addresses (Sequence[str]): Addresses to resolve
+        add_call (AddAppIdsCall): Adds a bulk getter call to a group
+        concurrency (int): Maximum number of simulate requests in flight
+
+    Returns:
+        dict[str, int]: App ID by address, 0 if the address has no app
+    """
+    chunks = split(addresses, reg_cfg.MAX_BULK_GETTER_ADDRESSES)
+    groups = split(chunks, TX_GROUP_LIMIT)
+
+    def simulate(group: list[list[str]]) -> list[int]:
+        composer = delegation_registry_client.new_group()
+        for chunk in group:
+            add_call(composer, chunk)
+        result = composer.simulate(allow_unnamed_resources=True, skip_signatures=True)
+        app_ids: list[int] = []
+        for abi_return in result.returns:
+            values = cast(list[tuple[int, bool]], abi_return.value)
+            app_ids.extend(app_id for app_id, _ in values)
+        return app_ids
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        app_ids = chain.from_iterable(executor.map(simulate, groups))
+        return dict(zip(addresses, app_ids, strict=True))
+
+
+def get_voter_app_ids(
+    delegation_registry_client: DelegationRegistryClient,
+    xgov_addresses: Sequence[str],
+    concurrency: int = 8,
+) -> dict[str, int]:
+    """Voter app ID of each xGov, 0 if not registered. See `get_app_ids`."""
+    return get_app_ids(
+        delegation_registry_client, xgov_addresses, add_get_voter_app_ids, concurrency
+    )
+
+
+def get_representative_app_ids(
+    delegation_registry_client: DelegationRegistryClient,
+    representative_addresses: Sequence[str],
+    concurrency: int = 8,
+) -> dict[str, int]:
+    """App ID of each representative, 0 if not registered. See `get_app_ids`."""
+    return get_app_ids(
+        delegation_registry_client,
+        representative_addresses,
+        add_get_representative_app_ids,
+        concurrency,
+    )
+
+
+def get_representative_votes(
+    algorand_client: AlgorandClient,
+    representative_ids: Sequence[int],
+    proposal_ids: Sequence[int],
+    concurrency: int = 8,
+) -> dict[int, dict[int, tuple[Vote, bool]]]:
+    """
+    Read the votes of many representatives on many proposals with `get_votes`.
+
+    Proposals are split into calls of `MAX_BULK_GETTER_PROPOSALS`, one box reference
+    per proposal, and calls into groups of `TX_GROUP_LIMIT`. Each group, for each
+    representative, is one simulate request, and the requests are sent concurrently.
+
+    Args:
+        algorand_client (AlgorandClient): Algorand client
+        representative_ids (Sequence[int]): App IDs of the Representatives
+        proposal_ids (Sequence[int]): App IDs of the Proposals
+        concurrency (int): Maximum number of simulate requests in flight
+
+    Returns:
+        dict[int, dict[int, tuple[Vote, bool]]]: Vote on each Proposal, and whether it
+            is valid, by Representative app ID
+    """
+    groups = split(
+        split(proposal_ids, rep_cfg.MAX_BULK_GETTER_PROPOSALS), TX_GROUP_LIMIT
+    )
+
+    def simulate(
+        representative_id: int, group: list[list[int]]
+    ) -> list[tuple[Vote, bool]]:
+        representative_client = algorand_client.client.get_typed_app_client_by_id(
+            typed_client=RepresentativeClient, app_id=representative_id
+        )
+        composer = representative_client.new_group()
+        for chunk in group:
+            composer.get_votes(args=GetVotesArgs(proposal_ids=chunk))
+        result = composer.simulate(allow_unnamed_resources=True, skip_signatures=True)
+        votes: list[tuple[Vote, bool]] = []
+        for abi_return in result.returns:
+            values = cast(list[tuple[tuple[int, int], bool]], abi_return.value)
+            votes.extend(
+                (Vote(approval=approval, rejection=rejection), is_valid)
+                for (approval, rejection), is_valid in values
+            )
+        return votes
+
+    tasks = [
+        (representative_id, group)
+        for representative_id in representative_ids
+        for group in groups
+    ]
+    representative_votes: dict[int, dict[int, tuple[Vote, bool]]] = {
+        representative_id: {} for representative_id in representative_ids
+    }
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = executor.map(lambda task: simulate(*task), tasks)
+        for (representative_id, group), votes in zip(tasks, results, strict=True):
+            representative_votes[representative_id].update(
+                zip(chain.from_iterable(group), votes, strict=True)
+            )
+    return representative_votes
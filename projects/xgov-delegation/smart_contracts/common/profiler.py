@@ -0,0 +1,300 @@
+import base64
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, cast
+
+from algokit_utils import AlgorandClient
+from algosdk.encoding import checksum
+
+ARTIFACTS_PATH: Final[Path] = Path(__file__).parent.parent / "artifacts"
+SMART_CONTRACTS_PATH: Final[Path] = ARTIFACTS_PATH.parent
+
+UNMAPPED: Final[str] = "<unmapped>"
+
+# Opcodes not costing 1 (AVM v10). Variable cost opcodes are counted at their base cost.
+OPCODE_COSTS: Final[dict[str, int]] = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "sumhash512": 150,
+    "mimc": 10,
+    "bn256_add": 125,
+    "bn256_scalar_mul": 1700,
+    "bn256_pairing": 8700,
+    "ec_add": 125,
+    "ec_scalar_mul": 1700,
+    "ec_pairing_check": 8000,
+    "ec_multi_scalar_mul": 3600,
+    "ec_subgroup_check": 1850,
+    "ec_map_to": 1950,
+    "b+": 10,
+    "b-": 10,
+    "b/": 20,
+    "b*": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "sqrt": 4,
+    "expw": 10,
+    "divmodw": 20,
+}
+
+
+APPROVAL_PROGRAM_TRACE: Final[str] = "approval-program-trace"
+APPROVAL_PROGRAM_HASH: Final[str] = "approval-program-hash"
+INNER_TRACE: Final[str] = "inner-trace"
+APP_BUDGET_CONSUMED: Final[str] = "app-budget-consumed"
+
+
+@dataclass(slots=True, frozen=True)
+class SourceLocation:
+    source: str  # path relative to `smart_contracts`
+    line: int  # 1-based
+
+
+@dataclass(slots=True)
+class ProgramMap:
+    """Source locations, subroutines and opcodes of a compiled program, indexed by pc."""
+
+    name: str
+    locations: dict[int, SourceLocation]
+    subroutines: dict[int, str]
+    ops: dict[int, str]
+
+
+@dataclass(slots=True)
+class LineCost:
+    location: SourceLocation
+    cost: int = 0
+    hits: int = 0
+
+
+def get_line_cost(line: LineCost) -> int:
+    return line.cost
+
+
+@dataclass(slots=True)
+class Profile:
+    total: int = 0
+    budget_consumed: int | None = None  # as measured by simulate
+    lines: dict[SourceLocation, LineCost] = field(default_factory=dict)
+    subroutines: dict[str, int] = field(default_factory=dict)
+    unknown_programs: set[str] = field(default_factory=set)
+
+    def add(self, program: ProgramMap, pc: int) -> None:
+        cost = OPCODE_COSTS.get(program.ops.get(pc, "").split(" ")[0], 1)
+        location = program.locations.get(pc, SourceLocation(UNMAPPED, 0))
+        line = self.lines.setdefault(location, LineCost(location))
+        line.cost += cost
+        line.hits += 1
+        subroutine = f"{program.name}::{program.subroutines.get(pc, UNMAPPED)}"
+        self.subroutines[subroutine] = self.subroutines.get(subroutine, 0) + cost
+        self.total += cost
+
+    def hot_spots(self, top: int | None = None) -> list[LineCost]:
+        return sorted(self.lines.values(), key=get_line_cost, reverse=True)[:top]
+
+    def report(self, top: int = 20) -> str:
+        """
+        Format the `top` most expensive source lines and the cost per subroutine.
+
+        Args:
+            top (int): Number of source lines to report
+
+        Returns:
+            str: Human-readable hot-spot report
+        """
+        rows = [f"Total opcode cost: {self.total}", ""]
+        if self.budget_consumed is not None and self.budget_consumed != self.total:
+            rows[-1:-1] = [
+                f"Simulate consumed {self.budget_consumed}: "
+                f"`OPCODE_COSTS` is missing {self.budget_consumed - self.total}"
+            ]
+        rows.append(f"{'cost':>6} {'%':>6} {'hits':>6}  location")
+        for line in self.hot_spots(top):
+            share = 100 * line.cost / self.total if self.total else 0
+            rows.append(
+                f"{line.cost:>6} {share:>6.1f} {line.hits:>6}  "
+                f"{line.location.source}:{line.location.line}"
+                f"  {read_source_line(line.location)}"
+            )
+        rows += ["", f"{'cost':>6}  subroutine"]
+        for name in sorted(
+            self.subroutines, key=self.subroutines.__getitem__, reverse=True
+        ):
+            cost = self.subroutines[name]
+            rows.append(f"{cost:>6}  {name}")
+        if self.unknown_programs:
+            rows += [
+                "",
+                "Unprofiled program hashes: " + ", ".join(self.unknown_programs),
+            ]
+        return "\n".join(rows)
+
+
+_B64_CHARS: Final[str] = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+)
+
+
+def decode_vlq(segment: str) -> list[int]:
+    values: list[int] = []
+    shift = value = 0
+    for char in segment:
+        digit = _B64_CHARS.index(char)
+        value += (digit & 0x1F) << shift
+        if digit & 0x20:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        shift = value = 0
+    return values
+
+
+def read_source_line(location: SourceLocation) -> str:
+    if location.source == UNMAPPED:
+        return ""
+    lines = (SMART_CONTRACTS_PATH / location.source).read_text().splitlines()
+    return lines[location.line - 1].strip() if location.line <= len(lines) else ""
+
+
+def load_program_map(path: Path) -> ProgramMap:
+    """
+    Decode a `*.puya.map` source map, emitted next to the TEAL by the build.
+
+    Mappings hold one segment per pc. An empty segment continues the previous
+    source location, as for the `itxn_field` ops of an inner transaction.
+
+    Args:
+        path (Path): Path to the `.puya.map` file
+
+    Returns:
+        ProgramMap: Source location, subroutine and opcode of each pc
+    """
+    raw = cast(dict[str, object], json.loads(path.read_text()))
+    sources = [
+        (path.parent / source).resolve().relative_to(SMART_CONTRACTS_PATH.resolve())
+        for source in cast(list[str], raw["sources"])
+    ]
+    pc_events = cast(dict[str, dict[str, object]], raw["pc_events"])
+
+    locations: dict[int, SourceLocation] = {}
+    source_index = line = 0
+    location: SourceLocation | None = None
+    for pc, segment in enumerate(cast(str, raw["mappings"]).split(";")):
+        if segment:
+            fields = decode_vlq(segment.split(",")[0])
+            if len(fields) >= 4:
+                source_index += fields[1]
+                line += fields[2]
+                location = SourceLocation(
+                    source=sources[source_index].as_posix(), line=line + 1
+                )
+        if location is not None:
+            locations[pc] = location
+
+    subroutines: dict[int, str] = {}
+    ops: dict[int, str] = {}
+    subroutine = UNMAPPED
+    for pc in sorted(int(pc) for pc in pc_events):
+        event = pc_events[str(pc)]
+        if "subroutine" in event:
+            subroutine = cast(str, event["subroutine"])
+        subroutines[pc] = subroutine
+        if "op" in event:
+            ops[pc] = cast(str, event["op"])
+
+    return ProgramMap(
+        name=path.name.split(".")[0],
+        locations=locations,
+        subroutines=subroutines,
+        ops=ops,
+    )
+
+
+def get_program_hash(program: bytes) -> str:
+    return base64.b64encode(cast(bytes, checksum(program))).decode()
+
+
+class Profiler:
+    """
+    Attribute the opcode cost of simulate execution traces to contract source lines.
+
+    Programs are matched to their source maps by the hash of their bytecode, so
+    the apps of every contract involved in a group (including inner app calls and
+    apps created by inner transactions) must be registered with `add_app`.
+    """
+
+    def __init__(self, algorand_client: AlgorandClient) -> None:
+        self.algorand_client = algorand_client
+        self.programs: dict[str, ProgramMap] = {}
+
+    def add_program(self, program: bytes, source_map: Path) -> None:
+        self.programs[get_program_hash(program)] = load_program_map(source_map)
+
+    def add_app(self, app_id: int, contract_name: str) -> None:
+        """
+        Register the approval program of a deployed app.
+
+        Args:
+            app_id (int): Application ID
+            contract_name (str): Contract class name, as in `<contract_name>.approval.puya.map`
+        """
+        source_map = next(ARTIFACTS_PATH.glob(f"*/{contract_name}.approval.puya.map"))
+        program = self.algorand_client.app.get_by_id(app_id).approval_program
+        self.add_program(program, source_map)
+
+    def profile(self, simulate_response: dict[str, object]) -> Profile:
+        """
+        Profile the approval programs executed in a simulate response.
+        The group must be simulated with `exec_trace_config=SimulateTraceConfig(enable=True)`.
+
+        Args:
+            simulate_response (dict[str, object]): Raw simulate response
+
+        Returns:
+            Profile: Opcode cost per source line and per subroutine. Per-op costs
+                are not part of the trace, so they come from `OPCODE_COSTS`; the total
+                consumed by simulate is kept in `budget_consumed` to catch drift.
+        """
+        profile = Profile()
+        groups = cast(list[dict[str, object]], simulate_response["txn-groups"])
+        profile.budget_consumed = cast(int | None, groups[0].get(APP_BUDGET_CONSUMED))
+        for txn_result in cast(list[dict[str, object]], groups[0]["txn-results"]):
+            exec_trace = cast(dict[str, object], txn_result.get("exec-trace", {}))
+            for program_hash, pcs in self._walk(exec_trace):
+                program = self.programs.get(program_hash)
+                if program is None:
+                    profile.unknown_programs.add(program_hash)
+                    profile.total += len(pcs)
+                    continue
+                for pc in pcs:
+                    profile.add(program, pc)
+        return profile
+
+    def _walk(self, exec_trace: dict[str, object]) -> Iterator[tuple[str, list[int]]]:
+        if APPROVAL_PROGRAM_TRACE in exec_trace:
+            yield (
+                cast(str, exec_trace[APPROVAL_PROGRAM_HASH]),
+                [
+                    cast(int, unit["pc"])
+                    for unit in cast(
+                        list[dict[str, object]], exec_trace[APPROVAL_PROGRAM_TRACE]
+                    )
+                ],
+            )
+        for inner in cast(list[dict[str, object]], exec_trace.get(INNER_TRACE, [])):
+            yield from self._walk(inner)
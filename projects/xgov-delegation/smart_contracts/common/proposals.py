@@ -0,0 +1,289 @@
+"""
+Discovery of the Proposals of an xGov Registry.
+
+Lists the apps created by the xGov Registry address, decodes their global state with the
+keys of `proposal/config.py`, and caches them by status. Refreshes are throttled by
+round, and listeners are notified when a Proposal enters or leaves the voting stage, so
+bots know when to publish and trigger votes without polling each Proposal by hand.
+"""
+
+import argparse
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final, Literal, cast
+
+from algokit_utils import AlgorandClient, AppManager
+from algosdk.encoding import encode_address
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+from dotenv import load_dotenv
+
+from smart_contracts.proposal import config as prop_cfg
+from smart_contracts.proposal import enums as enm
+
+logger = logging.getLogger(__name__)
+
+FieldKind = Literal["uint", "address", "string"]
+
+# Field of `Proposal` -> global state key and kind of its value
+PROPOSAL_SCHEMA: Final[dict[str, tuple[bytes, FieldKind]]] = {
+    "proposer": (prop_cfg.GS_KEY_PROPOSER, "address"),
+    "title": (prop_cfg.GS_KEY_TITLE, "string"),
+    "registry_app_id": (prop_cfg.GS_KEY_REGISTRY_APP_ID, "uint"),
+    "metadata_uploaded": (prop_cfg.GS_KEY_METADATA_UPLOADED, "uint"),
+    "open_ts": (prop_cfg.GS_KEY_OPEN_TS, "uint"),
+    "submission_ts": (prop_cfg.GS_KEY_SUBMISSION_TS, "uint"),
+    "vote_open_ts": (prop_cfg.GS_KEY_VOTE_OPEN_TS, "uint"),
+    "status": (prop_cfg.GS_KEY_STATUS, "uint"),
+    "finalized": (prop_cfg.GS_KEY_FINALIZED, "uint"),
+    "funding_category": (prop_cfg.GS_KEY_FUNDING_CATEGORY, "uint"),
+    "focus": (prop_cfg.GS_KEY_FOCUS, "uint"),
+    "funding_type": (prop_cfg.GS_KEY_FUNDING_TYPE, "uint"),
+    "requested_amount": (prop_cfg.GS_KEY_REQUESTED_AMOUNT, "uint"),
+    "locked_amount": (prop_cfg.GS_KEY_LOCKED_AMOUNT, "uint"),
+    "quorum_threshold": (prop_cfg.GS_KEY_QUORUM_THRESHOLD, "uint"),
+    "weighted_quorum_threshold": (prop_cfg.GS_KEY_WEIGHTED_QUORUM_THRESHOLD, "uint"),
+    "discussion_duration": (prop_cfg.GS_KEY_DISCUSSION_DURATION, "uint"),
+    "voting_duration": (prop_cfg.GS_KEY_VOTING_DURATION, "uint"),
+    "assigned_members": (prop_cfg.GS_KEY_ASSIGNED_MEMBERS, "uint"),
+    "assigned_votes": (prop_cfg.GS_KEY_ASSIGNED_VOTES, "uint"),
+    "voted_members": (prop_cfg.GS_KEY_VOTED_MEMBERS, "uint"),
+    "approvals": (prop_cfg.GS_KEY_APPROVALS, "uint"),
+    "rejections": (prop_cfg.GS_KEY_REJECTIONS, "uint"),
+    "nulls": (prop_cfg.GS_KEY_NULLS, "uint"),
+}
+
+# Raw global state of an app, as returned by algod
+GlobalStateRaw = list[dict[str, object]]
+
+
+@dataclass(frozen=True, slots=True)
+class Proposal:
+    id: int
+    proposer: str
+    title: str
+    registry_app_id: int
+    metadata_uploaded: int
+    open_ts: int
+    submission_ts: int
+    vote_open_ts: int
+    status: int
+    finalized: int
+    funding_category: int
+    focus: int
+    funding_type: int
+    requested_amount: int
+    locked_amount: int
+    quorum_threshold: int
+    weighted_quorum_threshold: int
+    discussion_duration: int
+    voting_duration: int
+    assigned_members: int
+    assigned_votes: int
+    voted_members: int
+    approvals: int
+    rejections: int
+    nulls: int
+
+    @property
+    def is_voting(self) -> bool:
+        return self.status == enm.STATUS_VOTING
+
+    @property
+    def vote_close_ts(self) -> int:
+        """Timestamp the voting session expires at, as `utils.get_proposal_vote_close_ts`."""
+        return self.vote_open_ts + self.voting_duration
+
+
+@dataclass(frozen=True, slots=True)
+class ProposalEvent:
+    proposal: Proposal
+    # `True` if the Proposal entered the voting stage, `False` if it left it
+    voting: bool
+
+
+def get_vote_close_ts(proposal: Proposal) -> int:
+    return proposal.vote_close_ts
+
+
+ProposalListener = Callable[[ProposalEvent], None]
+
+
+def decode_proposal(app_id: int, global_state: GlobalStateRaw) -> Proposal | None:
+    """
+    Decode the global state of a Proposal with `PROPOSAL_SCHEMA`.
+
+    Args:
+        app_id (int): App ID of the Proposal
+        global_state (GlobalStateRaw): Raw global state of the app
+
+    Returns:
+        Proposal | None: Decoded Proposal, `None` if the app is not a Proposal
+    """
+    state = AppManager.decode_app_state(global_state)
+    values: dict[str, object] = {"id": app_id}
+    for name, (key, kind) in PROPOSAL_SCHEMA.items():
+        app_state = state.get(key.decode())
+        if app_state is None:
+            return None
+        if kind == "uint":
+            values[name] = app_state.value
+        elif kind == "address":
+            address: str = encode_address(app_state.value_raw)
+            values[name] = address
+        else:
+            values[name] = (app_state.value_raw or b"").decode(errors="replace")
+    return Proposal(**values)  # type: ignore[arg-type]
+
+
+class ProposalDiscovery:
+    """
+    Cache of the Proposals created by an xGov Registry, by status.
+
+    Call `refresh` (or `follow`) to update the cache. Apps are listed with one algod
+    request, at most once every `refresh_rounds` rounds.
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        xgov_registry_id: int,
+        refresh_rounds: int = 1,
+    ) -> None:
+        self.algod_client = algod_client
+        self.xgov_registry_id = xgov_registry_id
+        self.xgov_registry_address: str = get_application_address(xgov_registry_id)
+        self.refresh_rounds = refresh_rounds
+
+        self.round = 0
+        self.proposals: dict[int, Proposal] = {}
+        self.by_status: dict[int, set[int]] = {}
+        self.listeners: list[ProposalListener] = []
+
+    def subscribe(self, listener: ProposalListener) -> None:
+        self.listeners.append(listener)
+
+    def get_by_status(self, status: int) -> list[Proposal]:
+        return [
+            self.proposals[app_id] for app_id in sorted(self.by_status.get(status, ()))
+        ]
+
+    def get_voting(self) -> list[Proposal]:
+        """Proposals in the voting stage, closing first."""
+        return sorted(
+            self.get_by_status(enm.STATUS_VOTING),
+            key=get_vote_close_ts,
+        )
+
+    def refresh(self, round_number: int | None = None) -> bool:
+        """
+        List the Proposals of the xGov Registry, unless the cache is recent enough.
+
+        Args:
+            round_number (int | None): Current round, to skip the request if the cache is
+                less than `refresh_rounds` old (default: always refresh)
+
+        Returns:
+            bool: `True` if the cache was refreshed
+        """
+        if (
+            round_number is not None
+            and self.round
+            and round_number - self.round < self.refresh_rounds
+        ):
+            return False
+
+        account_info = cast(
+            dict[str, object],
+            self.algod_client.account_info(self.xgov_registry_address),
+        )
+        self.update(
+            cast(int, account_info["round"]),
+            cast(list[dict[str, object]], account_info.get("created-apps", [])),
+        )
+        return True
+
+    def update(self, round_number: int, created_apps: list[dict[str, object]]) -> None:
+        """
+        Replace the cache with the apps created by the xGov Registry at a round.
+
+        Args:
+            round_number (int): Round of the list of apps
+            created_apps (list[dict[str, object]]): Apps created by the xGov Registry
+                address, as in the algod account information
+        """
+        proposals: dict[int, Proposal] = {}
+        for app in created_apps:
+            app_id = cast(int, app["id"])
+            params = cast(dict[str, object], app["params"])
+            proposal = decode_proposal(
+                app_id, cast(GlobalStateRaw, params.get("global-state", []))
+            )
+            if (
+                proposal is not None
+                and proposal.registry_app_id == self.xgov_registry_id
+            ):
+                proposals[app_id] = proposal
+
+        previous, self.proposals = self.proposals, proposals
+        self.round = round_number
+        self.by_status = {}
+        for proposal in proposals.values():
+            self.by_status.setdefault(proposal.status, set()).add(proposal.id)
+
+        # Deleted Proposals leave the voting stage with their last known state
+        for app_id in sorted(previous.keys() | proposals.keys()):
+            was_voting = app_id in previous and previous[app_id].is_voting
+            is_voting = app_id in proposals and proposals[app_id].is_voting
+            if was_voting != is_voting:
+                proposal = proposals.get(app_id) or previous[app_id]
+                self.notify(ProposalEvent(proposal=proposal, voting=is_voting))
+
+    def notify(self, event: ProposalEvent) -> None:
+        for listener in self.listeners:
+            listener(event)
+
+    def follow(self) -> None:
+        """Refresh the cache as algod commits new rounds, forever."""
+        round_number = cast(dict[str, int], self.algod_client.status())["last-round"]
+        while True:
+            self.refresh(round_number)
+            status = cast(
+                dict[str, int], self.algod_client.status_after_block(round_number)
+            )
+            round_number = status["last-round"]
+
+
+def log_event(event: ProposalEvent) -> None:
+    proposal = event.proposal
+    if event.voting:
+        logger.info(
+            "Proposal %d is voting until %d", proposal.id, proposal.vote_close_ts
+        )
+    else:
+        logger.info(
+            "Proposal %d left voting with status %d", proposal.id, proposal.status
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--xgov-registry-id", type=int, required=True)
+    parser.add_argument("--refresh-rounds", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv()
+    algorand_client = AlgorandClient.from_environment()
+    discovery = ProposalDiscovery(
+        algorand_client.client.algod,
+        cast(int, args.xgov_registry_id),
+        cast(int, args.refresh_rounds),
+    )
+    discovery.subscribe(log_event)
+    discovery.follow()
+
+
+if __name__ == "__main__":
+    main()
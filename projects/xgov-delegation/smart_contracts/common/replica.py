@@ -0,0 +1,520 @@
+import sqlite3
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Final, cast
+
+from algosdk.constants import ZERO_ADDRESS
+
+from smart_contracts.common.arc28 import Event
+from smart_contracts.common.fleet import FleetTable
+
+SCHEMA: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS registry (
+    key TEXT PRIMARY KEY,
+    value NOT NULL
+);
+CREATE TABLE IF NOT EXISTS voters (
+    voter_id INTEGER PRIMARY KEY,
+    xgov_address TEXT UNIQUE,
+    manager_address TEXT,
+    representative_id INTEGER NOT NULL DEFAULT 0,
+    window_ts INTEGER NOT NULL DEFAULT 0,
+    votes_left INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS backup_representatives (
+    voter_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    representative_id INTEGER NOT NULL,
+    PRIMARY KEY (voter_id, position)
+);
+CREATE TABLE IF NOT EXISTS representatives (
+    representative_id INTEGER PRIMARY KEY,
+    representative_address TEXT NOT NULL UNIQUE,
+    paused INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS representative_votes (
+    representative_id INTEGER NOT NULL,
+    proposal_id INTEGER NOT NULL,
+    approval INTEGER NOT NULL,
+    rejection INTEGER NOT NULL,
+    PRIMARY KEY (representative_id, proposal_id)
+);
+CREATE TABLE IF NOT EXISTS xgov_votes (
+    proposal_id INTEGER NOT NULL,
+    xgov_address TEXT NOT NULL,
+    approvals INTEGER NOT NULL,
+    rejections INTEGER NOT NULL,
+    PRIMARY KEY (proposal_id, xgov_address)
+);
+CREATE TABLE IF NOT EXISTS trigger_rewards (
+    trigger_address TEXT PRIMARY KEY,
+    amount INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS voters_by_representative ON voters (representative_id);
+"""
+
+META_ROUND: Final[str] = "round"
+META_REGISTRY_ID: Final[str] = "registry_id"
+
+Handler = Callable[[int, dict[str, object]], None]
+
+
+def get_int(args: dict[str, object], name: str) -> int:
+    value = args[name]
+    assert isinstance(value, int), f"{name} is not an integer"
+    return value
+
+
+def get_str(args: dict[str, object], name: str) -> str:
+    value = args[name]
+    assert isinstance(value, str), f"{name} is not a string"
+    return value
+
+
+def get_ints(args: dict[str, object], name: str) -> list[int]:
+    value = args[name]
+    assert isinstance(value, list), f"{name} is not a tuple"
+    return [int(item) for item in cast(list[int], value)]
+
+
+class DelegationReplica:
+    """
+    Local SQLite replica of the state of a Delegation Registry, its Voters and Representatives.
+
+    The replica is built by applying the ARC-28 events of the contracts round by round. The
+    events of a round and the round itself (the high-water mark) are committed in the same
+    SQLite transaction, so a follower that crashes resumes from the round after the last one
+    fully applied.
+    """
+
+    def __init__(self, path: Path | str, registry_id: int) -> None:
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            self.connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                (META_REGISTRY_ID, registry_id),
+            )
+        stored_registry_id = self._get_meta(META_REGISTRY_ID)
+        assert (
+            stored_registry_id == registry_id
+        ), f"Replica of registry {stored_registry_id}, not {registry_id}"
+        self.registry_id = registry_id
+
+        self.handlers: dict[str, Handler] = {
+            # Delegation Registry
+            "RegistryManagerSet": self.on_registry_manager_set,
+            "RegistryConfigured": self.on_registry_configured,
+            "RegistryPauseSet": self.on_registry_pause_set,
+            "VoterPrepared": self.on_voter_prepared,
+            "VoterRegistered": self.on_voter_registered,
+            "VoterUnregistered": self.on_voter_unregistered,
+            "VotesPaid": self.on_votes_paid,
+            "VoteTriggered": self.on_vote_triggered,
+            "RepresentativeRegistered": self.on_representative_registered,
+            "RepresentativeUnregistered": self.on_representative_unregistered,
+            "TriggerRewardsOpened": self.on_trigger_rewards_opened,
+            "TriggerRewardsCredited": self.on_trigger_rewards_credited,
+            "TriggerRewardsClaimed": self.on_trigger_rewards_claimed,
+            "TriggerRewardsClosed": self.on_trigger_rewards_closed,
+            # Voter
+            "XGovAssigned": self.on_xgov_assigned,
+            "VoterManagerSet": self.on_voter_manager_set,
+            "RepresentativeSet": self.on_representative_set,
+            "BackupRepresentativesSet": self.on_backup_representatives_set,
+            "WindowSet": self.on_window_set,
+            "VotesAdded": self.on_votes_added,
+            "VotedByRepresentative": self.on_voted_by_representative,
+            "VotedDirectly": self.on_voted_directly,
+            # Representative
+            "RepresentativePauseSet": self.on_representative_pause_set,
+            "VotePublished": self.on_vote_published,
+            "VoteDeleted": self.on_vote_deleted,
+        }
+
+    def close(self) -> None:
+        self.connection.close()
+
+    # ---------------------------------
+    # ------------ Rounds -------------
+    # ---------------------------------
+    @property
+    def round(self) -> int:
+        """Last round applied to the replica, 0 if none."""
+        return self._get_meta(META_ROUND) or 0
+
+    def apply_round(
+        self, round_number: int, events: Iterable[tuple[int, Event]]
+    ) -> None:
+        """
+        Apply the events of a round and advance the high-water mark, atomically.
+
+        Args:
+            round_number (int): Round of the events, after the last round applied
+            events (Iterable[tuple[int, Event]]): Events and the app that emitted them, in order
+        """
+        assert round_number > self.round, f"Round {round_number} already applied"
+        with self.connection:
+            for app_id, event in events:
+                self.apply(app_id, event)
+            self._set_meta(META_ROUND, round_number)
+
+    def apply(self, app_id: int, event: Event) -> None:
+        """
+        Apply an event, ignoring the ones that change no replicated state.
+
+        Events of apps other than the Delegation Registry and the Voters and
+        Representatives it created are ignored. These apps become tracked as soon as the
+        registry event creating them is applied.
+        """
+        handler = self.handlers.get(event.name)
+        if handler is not None and self.is_tracked(app_id):
+            handler(app_id, event.args)
+
+    def load_fleet(self, fleet: FleetTable, round_number: int) -> None:
+        """
+        Seed the replica with a snapshot of the Voters and Representatives at a round.
+
+        Registries deployed before the contracts emitted events can only be followed from
+        a snapshot. Published votes of the Representatives are not part of a fleet.
+        """
+        with self.connection:
+            for row in range(len(fleet)):
+                voter = fleet.get_voter(row)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO voters VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        voter.id,
+                        (
+                            voter.xgov_address
+                            if voter.xgov_address != ZERO_ADDRESS
+                            else None
+                        ),
+                        voter.manager_address,
+                        voter.representative_app,
+                        voter.window_ts,
+                        voter.votes_left,
+                    ),
+                )
+                self._set_backup_representatives(voter.id, voter.backup_representatives)
+            for representative_id, address_index, paused in zip(
+                fleet.representative_ids,
+                fleet.representative_address,
+                fleet.paused,
+                strict=True,
+            ):
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO representatives VALUES (?, ?, ?)",
+                    (representative_id, fleet.addresses[address_index], paused),
+                )
+            self._set_registry_value("votes_left", fleet.total_votes_left())
+            self._set_meta(META_ROUND, round_number)
+
+    # ---------------------------------
+    # ------------ Queries ------------
+    # ---------------------------------
+    def is_tracked(self, app_id: int) -> bool:
+        """Whether the app is the Delegation Registry or one of its Voters or Representatives."""
+        if app_id == self.registry_id:
+            return True
+        return (
+            self._fetch_int(
+                "SELECT 1 FROM voters WHERE voter_id = ? "
+                "UNION ALL SELECT 1 FROM representatives WHERE representative_id = ?",
+                (app_id, app_id),
+            )
+            is not None
+        )
+
+    def get_voter_app_id(self, xgov_address: str) -> int | None:
+        return self._fetch_int(
+            "SELECT voter_id FROM voters WHERE xgov_address = ?", (xgov_address,)
+        )
+
+    def get_representative_app_id(self, representative_address: str) -> int | None:
+        return self._fetch_int(
+            "SELECT representative_id FROM representatives "
+            "WHERE representative_address = ?",
+            (representative_address,),
+        )
+
+    def get_unassigned_voters(self) -> list[int]:
+        rows = cast(
+            list[tuple[int]],
+            self.connection.execute(
+                "SELECT voter_id FROM voters WHERE xgov_address IS NULL "
+                "ORDER BY voter_id"
+            ).fetchall(),
+        )
+        return [voter_id for (voter_id,) in rows]
+
+    def get_backup_representatives(self, voter_id: int) -> list[int]:
+        rows = cast(
+            list[tuple[int]],
+            self.connection.execute(
+                "SELECT representative_id FROM backup_representatives "
+                "WHERE voter_id = ? ORDER BY position",
+                (voter_id,),
+            ).fetchall(),
+        )
+        return [representative_id for (representative_id,) in rows]
+
+    def get_trigger_rewards(self, trigger_address: str) -> int | None:
+        """Rewards credited to the ledger of a trigger address, `None` if not opened."""
+        return self._fetch_int(
+            "SELECT amount FROM trigger_rewards WHERE trigger_address = ?",
+            (trigger_address,),
+        )
+
+    def get_registry_value(self, key: str) -> object:
+        row = cast(
+            tuple[object] | None,
+            self.connection.execute(
+                "SELECT value FROM registry WHERE key = ?", (key,)
+            ).fetchone(),
+        )
+        return row[0] if row is not None else None
+
+    def get_vote(self, representative_id: int, proposal_id: int) -> tuple[int, int]:
+        """Published vote (approval, rejection) in PPM of a Representative on a Proposal."""
+        row = cast(
+            tuple[int, int] | None,
+            self.connection.execute(
+                "SELECT approval, rejection FROM representative_votes "
+                "WHERE representative_id = ? AND proposal_id = ?",
+                (representative_id, proposal_id),
+            ).fetchone(),
+        )
+        assert row is not None, "Vote not published"
+        return row
+
+    def has_voted(self, proposal_id: int, xgov_address: str) -> bool:
+        return (
+            self._fetch_int(
+                "SELECT 1 FROM xgov_votes WHERE proposal_id = ? AND xgov_address = ?",
+                (proposal_id, xgov_address),
+            )
+            is not None
+        )
+
+    # ---------------------------------
+    # ----- Delegation Registry -------
+    # ---------------------------------
+    def on_registry_manager_set(self, app_id: int, args: dict[str, object]) -> None:
+        self._set_registry_value("manager_address", get_str(args, "manager_address"))
+
+    def on_registry_configured(self, app_id: int, args: dict[str, object]) -> None:
+        fee_xgov, fee_other = get_ints(args, "vote_fees")
+        self._set_registry_value("vote_fee_xgov", fee_xgov)
+        self._set_registry_value("vote_fee_other", fee_other)
+        self._set_registry_value(
+            "representative_fee", get_int(args, "representative_fee")
+        )
+        self._set_registry_value(
+            "vote_trigger_award", get_int(args, "vote_trigger_award")
+        )
+
+    def on_registry_pause_set(self, app_id: int, args: dict[str, object]) -> None:
+        self._set_registry_value("paused", int(bool(args["paused"])))
+
+    def on_voter_prepared(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "INSERT OR IGNORE INTO voters (voter_id) VALUES (?)",
+            (get_int(args, "voter_id"),),
+        )
+
+    def on_voter_registered(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "UPDATE voters SET xgov_address = ? WHERE voter_id = ?",
+            (get_str(args, "xgov_address"), get_int(args, "voter_id")),
+        )
+
+    def on_voter_unregistered(self, app_id: int, args: dict[str, object]) -> None:
+        voter_id = get_int(args, "voter_id")
+        votes_left = self._fetch_int(
+            "SELECT votes_left FROM voters WHERE voter_id = ?", (voter_id,)
+        )
+        self._add_registry_votes_left(-(votes_left or 0))
+        self.connection.execute("DELETE FROM voters WHERE voter_id = ?", (voter_id,))
+        self.connection.execute(
+            "DELETE FROM backup_representatives WHERE voter_id = ?", (voter_id,)
+        )
+
+    def on_votes_paid(self, app_id: int, args: dict[str, object]) -> None:
+        self._add_registry_votes_left(get_int(args, "votes"))
+
+    def on_vote_triggered(self, app_id: int, args: dict[str, object]) -> None:
+        self._add_registry_votes_left(-1)
+
+    def on_representative_registered(
+        self, app_id: int, args: dict[str, object]
+    ) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO representatives "
+            "(representative_id, representative_address) VALUES (?, ?)",
+            (
+                get_int(args, "representative_id"),
+                get_str(args, "representative_address"),
+            ),
+        )
+
+    def on_representative_unregistered(
+        self, app_id: int, args: dict[str, object]
+    ) -> None:
+        representative_id = get_int(args, "representative_id")
+        self.connection.execute(
+            "DELETE FROM representatives WHERE representative_id = ?",
+            (representative_id,),
+        )
+        self.connection.execute(
+            "DELETE FROM representative_votes WHERE representative_id = ?",
+            (representative_id,),
+        )
+
+    def on_trigger_rewards_opened(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO trigger_rewards VALUES (?, 0)",
+            (get_str(args, "trigger_address"),),
+        )
+
+    def on_trigger_rewards_credited(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "UPDATE trigger_rewards SET amount = amount + ? WHERE trigger_address = ?",
+            (get_int(args, "amount"), get_str(args, "trigger_address")),
+        )
+
+    def on_trigger_rewards_claimed(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "UPDATE trigger_rewards SET amount = 0 WHERE trigger_address = ?",
+            (get_str(args, "trigger_address"),),
+        )
+
+    def on_trigger_rewards_closed(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "DELETE FROM trigger_rewards WHERE trigger_address = ?",
+            (get_str(args, "trigger_address"),),
+        )
+
+    # ---------------------------------
+    # ------------ Voter --------------
+    # ---------------------------------
+    def on_xgov_assigned(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "UPDATE voters SET xgov_address = ?, manager_address = ? WHERE voter_id = ?",
+            (
+                get_str(args, "xgov_address"),
+                get_str(args, "manager_address"),
+                app_id,
+            ),
+        )
+
+    def on_voter_manager_set(self, app_id: int, args: dict[str, object]) -> None:
+        self._update_voter(app_id, "manager_address", get_str(args, "manager_address"))
+
+    def on_representative_set(self, app_id: int, args: dict[str, object]) -> None:
+        self._update_voter(
+            app_id, "representative_id", get_int(args, "representative_id")
+        )
+
+    def on_backup_representatives_set(
+        self, app_id: int, args: dict[str, object]
+    ) -> None:
+        self._set_backup_representatives(app_id, get_ints(args, "representative_ids"))
+
+    def on_window_set(self, app_id: int, args: dict[str, object]) -> None:
+        self._update_voter(app_id, "window_ts", get_int(args, "window_ts"))
+
+    def on_votes_added(self, app_id: int, args: dict[str, object]) -> None:
+        self._update_voter(app_id, "votes_left", get_int(args, "votes_left"))
+
+    def on_voted_by_representative(self, app_id: int, args: dict[str, object]) -> None:
+        self._update_voter(app_id, "votes_left", get_int(args, "votes_left"))
+        self.on_voted_directly(app_id, args)
+
+    def on_voted_directly(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO xgov_votes VALUES (?, ?, ?, ?)",
+            (
+                get_int(args, "proposal_id"),
+                get_str(args, "xgov_address"),
+                get_int(args, "approvals"),
+                get_int(args, "rejections"),
+            ),
+        )
+
+    # ---------------------------------
+    # -------- Representative ---------
+    # ---------------------------------
+    def on_representative_pause_set(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "UPDATE representatives SET paused = ? WHERE representative_id = ?",
+            (int(bool(args["paused"])), app_id),
+        )
+
+    def on_vote_published(self, app_id: int, args: dict[str, object]) -> None:
+        approval, rejection = get_ints(args, "vote")
+        self.connection.execute(
+            "INSERT OR REPLACE INTO representative_votes VALUES (?, ?, ?, ?)",
+            (app_id, get_int(args, "proposal_id"), approval, rejection),
+        )
+
+    def on_vote_deleted(self, app_id: int, args: dict[str, object]) -> None:
+        self.connection.execute(
+            "DELETE FROM representative_votes "
+            "WHERE representative_id = ? AND proposal_id = ?",
+            (app_id, get_int(args, "proposal_id")),
+        )
+
+    # ---------------------------------
+    # ------------ Helpers ------------
+    # ---------------------------------
+    def _fetch_int(self, query: str, params: tuple[object, ...]) -> int | None:
+        row = cast(tuple[int] | None, self.connection.execute(query, params).fetchone())
+        return row[0] if row is not None else None
+
+    def _get_meta(self, key: str) -> int | None:
+        return self._fetch_int("SELECT value FROM meta WHERE key = ?", (key,))
+
+    def _set_meta(self, key: str, value: int) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _set_registry_value(self, key: str, value: int | str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO registry (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _add_registry_votes_left(self, votes: int) -> None:
+        self.connection.execute(
+            "INSERT INTO registry (key, value) VALUES ('votes_left', ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = value + excluded.value",
+            (votes,),
+        )
+
+    def _set_backup_representatives(
+        self, voter_id: int, representative_ids: Iterable[int]
+    ) -> None:
+        self.connection.execute(
+            "DELETE FROM backup_representatives WHERE voter_id = ?", (voter_id,)
+        )
+        self.connection.executemany(
+            "INSERT INTO backup_representatives VALUES (?, ?, ?)",
+            [
+                (voter_id, position, representative_id)
+                for position, representative_id in enumerate(representative_ids)
+            ],
+        )
+
+    def _update_voter(self, voter_id: int, column: str, value: int | str) -> None:
+        # Column names come from the handlers, never from the events
+        self.connection.execute(
+            f"UPDATE voters SET {column} = ? WHERE voter_id = ?",
+            (value, voter_id),
+        )
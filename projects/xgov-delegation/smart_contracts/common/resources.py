@@ -0,0 +1,254 @@
+"""
+Deterministic resolver of the resources referenced by the Delegation Registry calls.
+
+The apps, boxes and accounts each method touches follow fixed patterns: the `v`/`r` boxes
+of the Delegation Registry, the Voter of the xGov, its Representative and its `pv` vote
+box, the Proposal and its `V` voter box, and the xGov Registry and its `x` xGov box.
+They are computed locally from a cached fleet, so calls skip the simulate round trip of
+`populate_app_call_resources`.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Final
+
+from algokit_utils import BoxReference, CommonAppCallParams
+from algosdk.encoding import decode_address
+
+from smart_contracts.common.fleet import FleetTable
+from smart_contracts.delegation_registry import config as reg_cfg
+from smart_contracts.proposal import config as prop_cfg
+from smart_contracts.representative import config as rep_cfg
+from smart_contracts.xgov_registry import config as xgov_cfg
+
+PROPOSAL_VOTER_BOX_PREFIX: Final[bytes] = prop_cfg.VOTER_BOX_KEY_PREFIX.encode()
+
+
+@dataclass(frozen=True)
+class AppCallResources:
+    foreign_apps: tuple[int, ...] = ()
+    accounts: tuple[str, ...] = ()
+    boxes: tuple[tuple[int, bytes], ...] = ()  # (app ID, 0 for the called app, name)
+
+
+def get_registry_voter_box(xgov_address: str) -> bytes:
+    return reg_cfg.VOTERS_MAP_PREFIX + decode_address(xgov_address)  # type: ignore[no-any-return, misc]
+
+
+def get_trigger_rewards_box(trigger_address: str) -> bytes:
+    return reg_cfg.TRIGGER_REWARDS_MAP_PREFIX + decode_address(trigger_address)  # type: ignore[no-any-return, misc]
+
+
+def get_triggered_page_box(proposal_id: int, voter_index: int) -> bytes:
+    page = voter_index // reg_cfg.TRIGGERED_PAGE_BITS
+    return reg_cfg.TRIGGERED_MAP_PREFIX + proposal_id.to_bytes(8) + page.to_bytes(8)
+
+
+def get_representative_vote_box(proposal_id: int) -> bytes:
+    return rep_cfg.PROPOSALS_VOTE_MAP_PREFIX + proposal_id.to_bytes(8)
+
+
+def get_proposal_voter_box(xgov_address: str) -> bytes:
+    return PROPOSAL_VOTER_BOX_PREFIX + decode_address(xgov_address)  # type: ignore[no-any-return, misc]
+
+
+def get_xgov_box(xgov_address: str) -> bytes:
+    return xgov_cfg.XGOV_BOX_MAP_PREFIX + decode_address(xgov_address)  # type: ignore[no-any-return, misc]
+
+
+def with_resources(
+    registry_id: int, resources: AppCallResources, params: CommonAppCallParams
+) -> CommonAppCallParams:
+    """
+    Set the resources of a call of the typed client, to send it without populating them.
+
+    Args:
+        registry_id (int): App ID of the called app, for the boxes with app ID 0
+        resources (AppCallResources): Resources of the call
+        params (CommonAppCallParams): Params of the call
+
+    Returns:
+        CommonAppCallParams: Params with the app, account and box references
+    """
+    return dataclasses.replace(
+        params,
+        app_references=list(resources.foreign_apps),
+        account_references=list(resources.accounts),
+        box_references=[
+            BoxReference(app_id=app_id or registry_id, name=name)
+            for app_id, name in resources.boxes
+        ],
+    )
+
+
+class ResourceResolver:
+    """
+    Resources of the calls of a Delegation Registry, from a cache of its Voters.
+
+    Keep the cache current with `set_voter`, `set_representative`,
+    `set_backup_representatives` and `set_vote_published` (e.g. from the events of the
+    follower). Calls of xGovs missing from the cache cannot be resolved.
+    """
+
+    def __init__(self, registry_id: int, xgov_registry_id: int) -> None:
+        self.registry_id = registry_id
+        self.xgov_registry_id = xgov_registry_id
+        self.voter_ids: dict[str, int] = {}  # by xGov address
+        self.representative_of: dict[int, int] = {}  # by Voter app
+        self.backups_of: dict[int, tuple[int, ...]] = {}  # by Voter app, in order
+        self.published: set[tuple[int, int]] = set()  # (Representative, Proposal)
+        self.voter_index: dict[int, int] = {}  # by Voter app, if any
+
+    @classmethod
+    def from_fleet(
+        cls, fleet: FleetTable, registry_id: int, xgov_registry_id: int
+    ) -> "ResourceResolver":
+        resolver = cls(registry_id, xgov_registry_id)
+        for row in range(len(fleet)):
+            resolver.set_voter(
+                fleet.addresses[fleet.xgov_address[row]], fleet.voter_ids[row]
+            )
+            resolver.set_representative(
+                fleet.voter_ids[row], fleet.representative_app[row]
+            )
+            if fleet.voter_index[row]:
+                resolver.voter_index[fleet.voter_ids[row]] = fleet.voter_index[row]
+        for voter_id, representative_ids in fleet.backup_representatives.items():
+            resolver.set_backup_representatives(voter_id, representative_ids)
+        return resolver
+
+    def set_voter(self, xgov_address: str, voter_id: int) -> None:
+        self.voter_ids[xgov_address] = voter_id
+
+    def set_representative(self, voter_id: int, representative_id: int) -> None:
+        self.representative_of[voter_id] = representative_id
+
+    def set_backup_representatives(
+        self, voter_id: int, representative_ids: tuple[int, ...]
+    ) -> None:
+        self.backups_of[voter_id] = representative_ids
+
+    def set_vote_published(
+        self, representative_id: int, proposal_id: int, *, published: bool = True
+    ) -> None:
+        if published:
+            self.published.add((representative_id, proposal_id))
+        else:
+            self.published.discard((representative_id, proposal_id))
+
+    def get_representatives_tried(self, voter_id: int, proposal_id: int) -> list[int]:
+        """
+        Representatives whose vote `trigger_vote` reads: the one of the Voter, then its
+        backups until one known to have published a vote on the Proposal.
+        """
+        tried: list[int] = []
+        representative_id = self.representative_of.get(voter_id, 0)
+        for candidate in (representative_id, *self.backups_of.get(voter_id, ())):
+            if not candidate:
+                continue
+            tried.append(candidate)
+            if (candidate, proposal_id) in self.published:
+                break
+        return tried
+
+    def get_backups_tried(self, xgov_address: str, proposal_id: int) -> int:
+        """Backups whose vote `trigger_vote` reads, an inner call each."""
+        tried = self.get_representatives_tried(
+            self.get_voter_id(xgov_address), proposal_id
+        )
+        return max(len(tried) - 1, 0)
+
+    def get_voter_id(self, xgov_address: str) -> int:
+        voter_id = self.voter_ids.get(xgov_address)
+        assert voter_id is not None, f"No Voter cached for xGov {xgov_address}"
+        return voter_id
+
+    def trigger_vote(
+        self, xgov_address: str, proposal_id: int, *, grouped: bool = False
+    ) -> AppCallResources:
+        """
+        Resources of `trigger_vote`, besides the Voter box of the Delegation Registry.
+
+        The Voter gets the vote of its Representative (`pv` box), else of its backups in
+        order, the votes of the xGov on the Proposal (`V` box) and votes through the xGov
+        Registry (`x` box). Calls in a group (`grouped`) also mark the Voter in the page
+        of the triggered bitmap of the Proposal with its index, if it has one.
+        """
+        voter_id = self.get_voter_id(xgov_address)
+        # Without any, the call fails, without a vote to read
+        representatives = self.get_representatives_tried(voter_id, proposal_id)
+        voter_index = self.voter_index.get(voter_id)
+        page_boxes = (
+            ((0, get_triggered_page_box(proposal_id, voter_index)),)
+            if grouped and voter_index is not None
+            else ()
+        )
+        return AppCallResources(
+            foreign_apps=(
+                *representatives,
+                voter_id,
+                proposal_id,
+                self.xgov_registry_id,
+            ),
+            boxes=(
+                *(
+                    (representative_id, get_representative_vote_box(proposal_id))
+                    for representative_id in representatives
+                ),
+                (proposal_id, get_proposal_voter_box(xgov_address)),
+                (self.xgov_registry_id, get_xgov_box(xgov_address)),
+                *page_boxes,
+            ),
+        )
+
+    def trigger_vote_to_ledger(
+        self, xgov_address: str, proposal_id: int
+    ) -> AppCallResources:
+        """
+        Resources of `trigger_vote_to_ledger`, besides the Voter box of the Delegation
+        Registry and the ledger box of the sender.
+
+        The Voter is always marked in the triggered bitmap, as the call is always
+        grouped: the ledger box leaves no slot for the page box in a lone call.
+        """
+        return self.trigger_vote(xgov_address, proposal_id, grouped=True)
+
+    def add_votes(self, xgov_address: str, sender: str) -> AppCallResources:
+        """
+        Resources of `add_votes`, besides the Voter box of the Delegation Registry.
+
+        Senders other than the xGov are checked against the voting address cached in its
+        Voter, or against its `x` box in the xGov Registry once stale or if they differ.
+        """
+        voter_id = self.get_voter_id(xgov_address)
+        if sender == xgov_address:
+            return AppCallResources(foreign_apps=(voter_id,))
+        return AppCallResources(
+            foreign_apps=(voter_id, self.xgov_registry_id),
+            boxes=((self.xgov_registry_id, get_xgov_box(xgov_address)),),
+        )
+
+    def publish_vote(
+        self, representative_id: int, proposal_id: int
+    ) -> AppCallResources:
+        """
+        Resources of `publish_vote` of a Representative.
+
+        The Proposal is checked to be created by the xGov Registry cached in the
+        Representative.
+        """
+        return AppCallResources(
+            foreign_apps=(proposal_id, self.xgov_registry_id),
+            boxes=((representative_id, get_representative_vote_box(proposal_id)),),
+        )
+
+    def get_trigger_vote_params(
+        self, xgov_address: str, proposal_id: int, params: CommonAppCallParams
+    ) -> CommonAppCallParams:
+        """Params of `trigger_vote` of the typed client, with all its resources."""
+        resources = self.trigger_vote(xgov_address, proposal_id)
+        resources = dataclasses.replace(
+            resources,
+            boxes=((0, get_registry_voter_box(xgov_address)), *resources.boxes),
+        )
+        return with_resources(self.registry_id, resources, params)
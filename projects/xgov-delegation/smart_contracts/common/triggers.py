@@ -0,0 +1,99 @@
+"""
+Filter of the `trigger_vote` calls bound to fail.
+
+An xGov can be triggered on a Proposal only while it holds a voter box there. The xGovs
+without one are tracked in a bitmap per Proposal, loaded from the voter boxes and
+updated as votes are cast, so bots drop their triggers before paying any fee.
+"""
+
+from collections.abc import Iterable, Sequence
+
+from algokit_utils import AlgorandClient
+
+from smart_contracts.common.delegation_index import get_voter_box_names
+
+
+def get_proposal_voters(algorand_client: AlgorandClient, proposal_id: int) -> set[str]:
+    """
+    List the xGovs that can still vote on a Proposal, from its voter boxes.
+
+    A Proposal holds a voter box for each xGov assigned to it, and deletes it when the xGov
+    votes, so only the box names are read.
+
+    Args:
+        algorand_client (AlgorandClient): Algorand client
+        proposal_id (int): App ID of the Proposal
+
+    Returns:
+        set[str]: Addresses of the xGovs with a voter box
+    """
+    return set(get_voter_box_names(algorand_client, proposal_id))
+
+
+class VotedBitmap:
+    """
+    xGovs that can no longer vote on each Proposal, one bit per xGov.
+
+    A trigger of an xGov without a voter box on the Proposal (because it voted directly,
+    was already triggered or was never assigned) fails deep in the inner calls, after all
+    the inner fees are paid, so such (xGov, Proposal) pairs are dropped before building
+    the groups. Bits are set when the voter boxes of a Proposal are loaded, and as votes
+    are cast.
+    """
+
+    def __init__(self, xgov_addresses: Sequence[str]) -> None:
+        self.xgov_index: dict[str, int] = {
+            address: i for i, address in enumerate(xgov_addresses)
+        }
+        self.size = (len(xgov_addresses) + 7) // 8
+        self.voted: dict[int, bytearray] = {}  # by Proposal
+
+    def set_voters(self, proposal_id: int, voters: Iterable[str]) -> None:
+        """Mark all xGovs as voted on a Proposal, except the ones with a voter box."""
+        bitmap = bytearray(b"\xff" * self.size)
+        for address in voters:
+            i = self.xgov_index.get(address)
+            if i is not None:
+                bitmap[i >> 3] &= ~(1 << (i & 7))
+        self.voted[proposal_id] = bitmap
+
+    def load(self, algorand_client: AlgorandClient, proposal_id: int) -> None:
+        self.set_voters(proposal_id, get_proposal_voters(algorand_client, proposal_id))
+
+    def mark_voted(self, proposal_id: int, xgov_address: str) -> None:
+        i = self.xgov_index.get(xgov_address)
+        bitmap = self.voted.get(proposal_id)
+        if i is not None and bitmap is not None:
+            bitmap[i >> 3] |= 1 << (i & 7)
+
+    def has_voted(self, proposal_id: int, xgov_address: str) -> bool:
+        """Whether an xGov can no longer vote on a Proposal, `False` if unknown."""
+        i = self.xgov_index.get(xgov_address)
+        bitmap = self.voted.get(proposal_id)
+        if i is None or bitmap is None:
+            return False
+        return bool(bitmap[i >> 3] & (1 << (i & 7)))
+
+    def filter(
+        self,
+        pairs: Iterable[tuple[str, int]],
+        algorand_client: AlgorandClient | None = None,
+    ) -> list[tuple[str, int]]:
+        """
+        Drop the (xGov address, Proposal ID) pairs whose xGov already voted.
+
+        Args:
+            pairs (Iterable[tuple[str, int]]): Triggers to send
+            algorand_client (AlgorandClient | None): Client to load the voter boxes of the
+                Proposals not loaded yet (default: keep their pairs)
+
+        Returns:
+            list[tuple[str, int]]: Triggers that can still succeed, in order
+        """
+        triggers: list[tuple[str, int]] = []
+        for xgov_address, proposal_id in pairs:
+            if algorand_client is not None and proposal_id not in self.voted:
+                self.load(algorand_client, proposal_id)
+            if not self.has_voted(proposal_id, xgov_address):
+                triggers.append((xgov_address, proposal_id))
+        return triggers
@@ -1,5 +1,7 @@
 from typing import Final
 
+from smart_contracts.common import constants as const
+
 # State Schema
 GLOBAL_BYTES: Final[int] = 32
 GLOBAL_UINTS: Final[int] = 32
@@ -15,17 +17,39 @@ GS_KEY_VOTE_TRIGGER_AWARD: Final[bytes] = b"vote_trigger_award"
 GS_KEY_PAUSED_REGISTRY: Final[bytes] = b"paused_registry"
 GS_KEY_VOTES_LEFT: Final[bytes] = b"votes_left"
 GS_KEY_TRIGGER_FUND: Final[bytes] = b"trigger_fund"
+GS_KEY_TRIGGER_REWARDS: Final[bytes] = b"trigger_rewards"
+GS_KEY_VOTERS_CREATED: Final[bytes] = b"voters_created"
 
 # Box keys
 VOTERS_MAP_PREFIX: Final[bytes] = b"v"
 REPRESENTATIVE_MAP_PREFIX: Final[bytes] = b"r"
+TRIGGER_REWARDS_MAP_PREFIX: Final[bytes] = b"t"
+TRIGGERED_MAP_PREFIX: Final[bytes] = b"b"  # + Proposal ID + page, both uint64
 CONTRACT_VOTER_BOX: Final[bytes] = b"sc_vot"
 CONTRACT_REPRESENTATIVE_BOX: Final[bytes] = b"sc_rep"
 
+# Getters
+# A box reference per address, as voters and representatives boxes are smaller than 1 KiB
+MAX_BULK_GETTER_ADDRESSES: Final[int] = const.MAX_TXN_REFERENCES
+
+# Triggered bitmaps
+# A bit per Voter index, in pages of the size read by a box reference
+TRIGGERED_PAGE_SIZE: Final[int] = 1024
+TRIGGERED_PAGE_BITS: Final[int] = 8 * TRIGGERED_PAGE_SIZE
+
 # Parameters
 ALGO_TO_MICROALGO = 10**6
 WEEKS_TO_SECONDS = 7 * 24 * 3_600
 
+## Durations
+# Voting addresses cached in the Voters are trusted for this long after their sync.
+# Senders other than the cached address always get the xGov box read, so a new voting
+# address works at once, but a rotated or revoked one keeps authorizing `add_votes` until
+# the cache expires. It can only pay for votes of the xGov, at the higher fee of others,
+# so a few minutes bound that window while a sync still spares the xGov Registry call of
+# the `add_votes` batched right after it.
+VOTING_ADDRESS_TTL: Final[int] = 5 * 60  # 5 minutes in seconds
+
 ## Amounts
 FEE_VOTE_XGOV: Final[int] = 1 * ALGO_TO_MICROALGO  # 1 ALGO
 FEE_VOTE_OTHER: Final[int] = 10 * ALGO_TO_MICROALGO  # 10 ALGO
@@ -23,6 +23,8 @@ from algopy import (
 import smart_contracts.errors.std_errors as err
 from smart_contracts.common import abi_types as typ
 from smart_contracts.common import constants as const
+from smart_contracts.common import events as ev
+from smart_contracts.proposal import utils as utils_prop
 from smart_contracts.representative import config as representative_cfg
 from smart_contracts.representative import contract as representative_contract
 from smart_contracts.voter import config as voter_cfg
@@ -73,6 +75,8 @@ class DelegationRegistry(
         self.paused_registry = GlobalState(UInt64(), key=cfg.GS_KEY_PAUSED_REGISTRY)
         self.votes_left = GlobalState(UInt64(), key=cfg.GS_KEY_VOTES_LEFT)
         self.trigger_fund = GlobalState(UInt64(), key=cfg.GS_KEY_TRIGGER_FUND)
+        self.trigger_rewards = GlobalState(UInt64(), key=cfg.GS_KEY_TRIGGER_REWARDS)
+        self.voters_created = GlobalState(UInt64(), key=cfg.GS_KEY_VOTERS_CREATED)
 
         # Boxes
         self.voters_box = BoxMap(
@@ -85,6 +89,11 @@ class DelegationRegistry(
             Application,
             key_prefix=cfg.REPRESENTATIVE_MAP_PREFIX,
         )
+        self.trigger_rewards_box = BoxMap(
+            arc4.Address,
+            UInt64,
+            key_prefix=cfg.TRIGGER_REWARDS_MAP_PREFIX,
+        )
 
         self.voter_approval_program = Box(Bytes, key=cfg.CONTRACT_VOTER_BOX)
         self.representative_approval_program = Box(
@@ -126,8 +135,11 @@ class DelegationRegistry(
         """
 
         assert self.is_manager(), err.UNAUTHORIZED
+        previous_manager = self.manager_address.value
         self.manager_address.value = manager
 
+        arc4.emit(ev.RegistryManagerSet(previous_manager, manager))
+
     @arc4.abimethod()
     def config_delegation_registry(
         self,
@@ -173,6 +185,12 @@ class DelegationRegistry(
             self.vote_trigger_award.value <= self.vote_fees.value.xgov
         ), err.INCONSISTENT_TRIGGER_AWARD
 
+        arc4.emit(
+            ev.RegistryConfigured(
+                vote_fees.copy(), representative_fee, vote_trigger_award
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -200,6 +218,8 @@ class DelegationRegistry(
             amount=amount,
         ).submit()
 
+        arc4.emit(ev.BalanceWithdrawn(self.manager_address.value, arc4.UInt64(amount)))
+
         return
 
     @arc4.abimethod()
@@ -214,6 +234,13 @@ class DelegationRegistry(
         assert self.is_manager(), err.UNAUTHORIZED
         self.paused_registry.value = UInt64(1)
 
+        arc4.emit(
+            ev.RegistryPauseSet(
+                manager_address=self.manager_address.value,
+                paused=arc4.Bool(bool(self.paused_registry.value)),
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -228,6 +255,13 @@ class DelegationRegistry(
         assert self.is_manager(), err.UNAUTHORIZED
         self.paused_registry.value = UInt64(0)
 
+        arc4.emit(
+            ev.RegistryPauseSet(
+                manager_address=self.manager_address.value,
+                paused=arc4.Bool(bool(self.paused_registry.value)),
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -257,6 +291,8 @@ class DelegationRegistry(
             # Initialize the approval program
             box.create(size=size.as_uint64())
 
+        arc4.emit(ev.ContractInitialized(contract.copy(), size))
+
         return
 
     @arc4.abimethod()
@@ -285,6 +321,8 @@ class DelegationRegistry(
         # Load the approval program
         box.replace(start_index=offset.as_uint64(), value=data)
 
+        arc4.emit(ev.ContractLoaded(contract.copy(), offset, arc4.UInt64(data.length)))
+
         return
 
     @arc4.abimethod()
@@ -323,6 +361,8 @@ class DelegationRegistry(
             fee=key_reg_txn_fee,
         ).submit()
 
+        arc4.emit(ev.KeyRegistered(arc4.UInt64(key_reg_txn_fee), key_reg_info.copy()))
+
         return
 
     @arc4.abimethod(allow_actions=["UpdateApplication"])
@@ -336,6 +376,13 @@ class DelegationRegistry(
 
         assert self.is_manager(), err.UNAUTHORIZED
 
+        arc4.emit(
+            ev.RegistryUpdated(
+                self.manager_address.value,
+                arc4.UInt64(Global.current_application_id.id),
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -344,7 +391,7 @@ class DelegationRegistry(
         xgov_address: arc4.Address,
     ) -> None:
         """
-        Update an existing Voter contract.
+        Update an existing Voter contract, and sync its cached xGov Registry ID.
 
         Args:
             xgov_address (arc4.Address): Address of the xGov.
@@ -361,12 +408,20 @@ class DelegationRegistry(
         # Assume program size is < const.MAX_STACK
         approval_program = box.extract(0, box.length)
 
+        voter_app = self.voters_box[xgov_address]
         arc4.abi_call(
             voter_contract.Voter.update,
-            app_id=self.voters_box[xgov_address],
+            app_id=voter_app,
             approval_program=approval_program,
             clear_state_program=const.MIN_PROGRAM,
         )
+        arc4.abi_call(
+            voter_contract.Voter.sync_xgov_registry,
+            arc4.UInt64(self.xgov_registry_app.value.id),
+            app_id=voter_app,
+        )
+
+        arc4.emit(ev.VoterUpdated(xgov_address, arc4.UInt64(voter_app.id)))
 
         return
 
@@ -376,7 +431,7 @@ class DelegationRegistry(
         representative_address: arc4.Address,
     ) -> None:
         """
-        Update an existing representative contract.
+        Update an existing representative contract, and sync its cached xGov Registry ID.
 
         Args:
             representative_address (arc4.Address): Address of the representative.
@@ -395,12 +450,24 @@ class DelegationRegistry(
         # Assume program size is < const.MAX_STACK
         approval_program = box.extract(0, box.length)
 
+        representative_app = self.representatives_box[representative_address]
         arc4.abi_call(
             representative_contract.Representative.update,
-            app_id=self.representatives_box[representative_address],
+            app_id=representative_app,
             approval_program=approval_program,
             clear_state_program=const.MIN_PROGRAM,
         )
+        arc4.abi_call(
+            representative_contract.Representative.sync_xgov_registry,
+            arc4.UInt64(self.xgov_registry_app.value.id),
+            app_id=representative_app,
+        )
+
+        arc4.emit(
+            ev.RepresentativeUpdated(
+                representative_address, arc4.UInt64(representative_app.id)
+            )
+        )
 
         return
 
@@ -423,26 +490,7 @@ class DelegationRegistry(
         mbr_before = Global.current_application_address.min_balance
 
         # Create a new Voter application
-        box = Box(Bytes, key=Bytes(cfg.CONTRACT_VOTER_BOX))
-        # Assume program size is < const.MAX_STACK
-        approval_program = box.extract(0, box.length)
-
-        txn = arc4.abi_call(
-            voter_contract.Voter.create,
-            approval_program=approval_program,
-            clear_state_program=const.MIN_PROGRAM,
-            global_num_uint=voter_cfg.GLOBAL_UINTS,
-            global_num_bytes=voter_cfg.GLOBAL_BYTES,
-            local_num_uint=voter_cfg.LOCAL_UINTS,
-            local_num_bytes=voter_cfg.LOCAL_BYTES,
-            extra_program_pages=const.MAX_EXTRA_PAGES_PER_APP,
-        )
-
-        # Fund the created app with MBR
-        itxn.Payment(
-            receiver=txn.created_app.address,
-            amount=Global.min_balance,
-        ).submit()
+        prepared_voter = self.create_voter()
 
         mbr_after = Global.current_application_address.min_balance
         mbr_fee = mbr_after - mbr_before
@@ -453,6 +501,10 @@ class DelegationRegistry(
         ), err.WRONG_RECEIVER
         assert payment.amount == mbr_fee + Global.min_balance, err.WRONG_PAYMENT_AMOUNT
 
+        arc4.emit(
+            ev.VoterPrepared(arc4.Address(Txn.sender), arc4.UInt64(prepared_voter.id))
+        )
+
         return
 
     # ---------------------------------
@@ -503,26 +555,7 @@ class DelegationRegistry(
         assert is_xgov or is_manager, err.UNAUTHORIZED
 
         # Create a new Voter application
-        box = Box(Bytes, key=Bytes(cfg.CONTRACT_VOTER_BOX))
-        # Assume program size is < const.MAX_STACK
-        approval_program = box.extract(0, box.length)
-
-        txn = arc4.abi_call(
-            voter_contract.Voter.create,
-            approval_program=approval_program,
-            clear_state_program=const.MIN_PROGRAM,
-            global_num_uint=voter_cfg.GLOBAL_UINTS,
-            global_num_bytes=voter_cfg.GLOBAL_BYTES,
-            local_num_uint=voter_cfg.LOCAL_UINTS,
-            local_num_bytes=voter_cfg.LOCAL_BYTES,
-            extra_program_pages=const.MAX_EXTRA_PAGES_PER_APP,
-        )
-
-        # Fund the created app with MBR
-        itxn.Payment(
-            receiver=txn.created_app.address,
-            amount=Global.min_balance,
-        ).submit()
+        prepared_voter_id = self.create_voter().id
 
         # Check if selected Voter is unassigned
         voter_app = Application(available_voter_id)
@@ -540,6 +573,7 @@ class DelegationRegistry(
             voter_contract.Voter.assign_xgov,
             xgov_address,
             arc4.Address(Txn.sender),
+            manager_address,
             app_id=voter_app,
         )
         self.voters_box[xgov_address] = voter_app
@@ -553,6 +587,11 @@ class DelegationRegistry(
         ), err.WRONG_RECEIVER
         assert payment.amount == mbr_fee + Global.min_balance, err.WRONG_PAYMENT_AMOUNT
 
+        arc4.emit(
+            ev.VoterPrepared(arc4.Address(Txn.sender), arc4.UInt64(prepared_voter_id))
+        )
+        arc4.emit(ev.VoterRegistered(xgov_address, arc4.UInt64(voter_app.id)))
+
         return voter_app.id
 
     @arc4.abimethod()
@@ -591,12 +630,7 @@ class DelegationRegistry(
         else:
             vote_fee = self.vote_fees.value.other.as_uint64()
 
-            # Get xgov_address box
-            [xgov_box, exists], txn = arc4.abi_call(
-                IXGovRegistry.get_xgov_box,
-                xgov_address,
-                app_id=self.xgov_registry_app.value,
-            )
+            voting_address, exists = self.get_voting_address(voter_app, xgov_address)
             assert exists, err.NOT_XGOV
 
             manager_address_bytes, exists = op.AppGlobal.get_ex_bytes(
@@ -605,8 +639,13 @@ class DelegationRegistry(
             )
             manager_address = arc4.Address(manager_address_bytes)
 
+            if sender != voting_address and sender != manager_address:
+                # The cached voting address may predate its rotation, check the xGov box
+                voting_address, exists = self.read_voting_address(xgov_address)
+                assert exists, err.NOT_XGOV
+
             assert (
-                sender == xgov_box.voting_address or sender == manager_address
+                sender == voting_address or sender == manager_address
             ), err.UNAUTHORIZED
 
         arc4.abi_call(
@@ -625,6 +664,8 @@ class DelegationRegistry(
         ), err.WRONG_RECEIVER
         assert payment.amount == fee, err.WRONG_PAYMENT_AMOUNT
 
+        arc4.emit(ev.VotesPaid(xgov_address, add_votes, arc4.UInt64(fee)))
+
         return
 
     @arc4.abimethod()
@@ -636,6 +677,9 @@ class DelegationRegistry(
         """
         Trigger vote for xGov on a proposal.
         Can be called by anyone.
+        Calls in a group also mark the Voter as triggered in the bitmap of the proposal,
+        as `trigger_vote_to_ledger` does, so both reject the same duplicates. The bitmap
+        page adds a box reference, which only fits in the shared references of a group.
 
         Args:
             xgov_address (arc4.Address): Address of the xGov.
@@ -644,18 +688,14 @@ class DelegationRegistry(
         Raises:
             err.PAUSED_REGISTRY: If the Delegation Registry is paused.
             err.NOT_VOTER: If xGov has not registered a Voter.
+            err.ALREADY_TRIGGERED: If grouped and the vote of the Voter was already triggered.
+            err.TRIGGER_FUND_INSUFFICIENT: If the MBR of a new bitmap page is not covered.
         """
-        assert not self.paused_registry.value, err.PAUSED_REGISTRY
-        assert xgov_address in self.voters_box, err.NOT_VOTER
+        if Global.group_size > 1:
+            # Reject duplicate triggers before any inner call
+            self.mark_triggered(xgov_address, proposal_id)
 
-        arc4.abi_call(
-            voter_contract.Voter.vote_representative,
-            proposal_id,
-            app_id=self.voters_box[xgov_address],
-        )
-
-        self.votes_left.value -= 1
-        self.update_trigger_fund()
+        self.vote_representative(xgov_address, proposal_id)
 
         # Send trigger award to sender
         itxn.Payment(
@@ -665,6 +705,181 @@ class DelegationRegistry(
 
         return
 
+    @arc4.abimethod()
+    def trigger_vote_to_ledger(
+        self,
+        xgov_address: arc4.Address,
+        proposal_id: arc4.UInt64,
+    ) -> None:
+        """
+        Trigger vote for xGov on a proposal, crediting the trigger award to the trigger
+        rewards ledger of the sender instead of paying it.
+        Can be called by anyone who has opened a ledger.
+        The Voter is marked as triggered in the bitmap of the proposal, so duplicate
+        triggers fail before any inner call.
+        The ledger box of the sender and the bitmap page add box references to the call,
+        so it fits only in groups sharing their references.
+
+        Args:
+            xgov_address (arc4.Address): Address of the xGov.
+            proposal_id (arc4.UInt64): App ID of proposal on which to trigger vote.
+
+        Raises:
+            err.PAUSED_REGISTRY: If the Delegation Registry is paused.
+            err.NOT_VOTER: If xGov has not registered a Voter.
+            err.NO_TRIGGER_REWARDS: If the sender has not opened a ledger.
+            err.ALREADY_TRIGGERED: If the vote of the Voter was already triggered.
+            err.TRIGGER_FUND_INSUFFICIENT: If the MBR of a new bitmap page is not covered.
+        """
+        sender = arc4.Address(Txn.sender)
+        assert sender in self.trigger_rewards_box, err.NO_TRIGGER_REWARDS
+
+        # Reject duplicate triggers before any inner call
+        self.mark_triggered(xgov_address, proposal_id)
+
+        self.vote_representative(xgov_address, proposal_id)
+
+        # Credit trigger award to the ledger of sender
+        self.trigger_rewards_box[sender] += self.vote_trigger_award.value
+        self.trigger_rewards.value += self.vote_trigger_award.value
+        self.update_trigger_fund()
+
+        arc4.emit(
+            ev.TriggerRewardsCredited(
+                sender, arc4.UInt64(self.vote_trigger_award.value)
+            )
+        )
+
+        return
+
+    @arc4.abimethod()
+    def delete_triggered_page(
+        self,
+        proposal_id: arc4.UInt64,
+        page: arc4.UInt64,
+    ) -> None:
+        """
+        Delete a page of the triggered bitmap of a proposal that is no longer voting.
+        Can be called by anyone. The MBR of the page is released to the Delegation Registry.
+
+        Args:
+            proposal_id (arc4.UInt64): App ID of the proposal.
+            page (arc4.UInt64): Page of the bitmap, i.e. Voter index // `cfg.TRIGGERED_PAGE_BITS`.
+
+        Raises:
+            err.NO_TRIGGERED_PAGE: If the page does not exist.
+            err.PROPOSAL_VOTING: If the proposal is still voting.
+        """
+        box = Box(Bytes, key=self.get_triggered_page_key(proposal_id, page.as_uint64()))
+        assert box, err.NO_TRIGGERED_PAGE
+        assert not utils_prop.is_proposal_voting(
+            proposal_id.as_uint64()
+        ), err.PROPOSAL_VOTING
+
+        del box.value
+
+        arc4.emit(ev.TriggeredPageDeleted(proposal_id, page))
+
+        return
+
+    @arc4.abimethod()
+    def open_trigger_rewards(
+        self,
+        payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """
+        Open a trigger rewards ledger for the sender.
+        Votes triggered with `trigger_vote_to_ledger` then credit their award to the ledger,
+        saving an inner payment per trigger, and the rewards are claimed at once.
+
+        Args:
+            payment (gtxn.PaymentTransaction): Payment transaction to cover the MBR.
+
+        Raises:
+            err.TRIGGER_REWARDS_OPENED: If the sender has already opened a ledger.
+            err.WRONG_RECEIVER: If payment receiver is not this contract.
+            err.WRONG_PAYMENT_AMOUNT: If payment amount doesn't cover MBR.
+        """
+        mbr_before = Global.current_application_address.min_balance
+
+        sender = arc4.Address(Txn.sender)
+        assert sender not in self.trigger_rewards_box, err.TRIGGER_REWARDS_OPENED
+        self.trigger_rewards_box[sender] = UInt64(0)
+
+        mbr_after = Global.current_application_address.min_balance
+        mbr_fee = mbr_after - mbr_before
+
+        # Check payment
+        assert (
+            payment.receiver == Global.current_application_address
+        ), err.WRONG_RECEIVER
+        assert payment.amount == mbr_fee, err.WRONG_PAYMENT_AMOUNT
+
+        arc4.emit(ev.TriggerRewardsOpened(sender, arc4.UInt64(mbr_fee)))
+
+        return
+
+    @arc4.abimethod()
+    def claim_trigger_rewards(self) -> UInt64:
+        """
+        Claim the trigger rewards credited to the ledger of the sender.
+        Can be called also if the Delegation Registry is paused.
+
+        Returns:
+            UInt64: Amount of claimed rewards.
+
+        Raises:
+            err.NO_TRIGGER_REWARDS: If the sender has not opened a ledger.
+            err.INSUFFICIENT_FUNDS: If there are no rewards to claim.
+        """
+        sender = arc4.Address(Txn.sender)
+        assert sender in self.trigger_rewards_box, err.NO_TRIGGER_REWARDS
+
+        amount = self.trigger_rewards_box[sender]
+        assert amount > 0, err.INSUFFICIENT_FUNDS
+        self.trigger_rewards_box[sender] = UInt64(0)
+        self.release_trigger_rewards(amount)
+
+        itxn.Payment(
+            receiver=Txn.sender,
+            amount=amount,
+        ).submit()
+
+        arc4.emit(ev.TriggerRewardsClaimed(sender, arc4.UInt64(amount)))
+
+        return amount
+
+    @arc4.abimethod()
+    def close_trigger_rewards(self) -> None:
+        """
+        Close the trigger rewards ledger of the sender.
+        Outstanding rewards are claimed and the MBR of the ledger is refunded.
+        Can be called also if the Delegation Registry is paused.
+
+        Raises:
+            err.NO_TRIGGER_REWARDS: If the sender has not opened a ledger.
+        """
+        mbr_before = Global.current_application_address.min_balance
+
+        sender = arc4.Address(Txn.sender)
+        assert sender in self.trigger_rewards_box, err.NO_TRIGGER_REWARDS
+
+        rewards = self.trigger_rewards_box[sender]
+        del self.trigger_rewards_box[sender]
+        self.release_trigger_rewards(rewards)
+
+        mbr_after = Global.current_application_address.min_balance
+        mbr_fee = mbr_before - mbr_after
+
+        itxn.Payment(
+            receiver=Txn.sender,
+            amount=rewards + mbr_fee,
+        ).submit()
+
+        arc4.emit(ev.TriggerRewardsClosed(sender, arc4.UInt64(rewards + mbr_fee)))
+
+        return
+
     @arc4.abimethod()
     def unregister_voter(
         self,
@@ -692,7 +907,8 @@ class DelegationRegistry(
         )
         manager_address = arc4.Address.from_bytes(manager_address_bytes)
 
-        # Get xgov_address box
+        # Get xgov_address box, not the cached voting address: the xGov may have set
+        # it to the Voter, and it must be yielded before the Voter is deleted
         [xgov_box, exists], txn = arc4.abi_call(
             IXGovRegistry.get_xgov_box,
             xgov_address,
@@ -740,6 +956,8 @@ class DelegationRegistry(
             amount=mbr_fee,
         ).submit()
 
+        arc4.emit(ev.VoterUnregistered(xgov_address, arc4.UInt64(voter_app.id)))
+
         return
 
     # ---------------------------------
@@ -781,6 +999,7 @@ class DelegationRegistry(
         txn = arc4.abi_call(
             representative_contract.Representative.create,
             representative_address,
+            arc4.UInt64(self.xgov_registry_app.value.id),
             approval_program=approval_program,
             clear_state_program=const.MIN_PROGRAM,
             global_num_uint=representative_cfg.GLOBAL_UINTS,
@@ -813,6 +1032,12 @@ class DelegationRegistry(
             mbr_fee + self.representative_fee.value + Global.min_balance
         ), err.WRONG_PAYMENT_AMOUNT
 
+        arc4.emit(
+            ev.RepresentativeRegistered(
+                representative_address, arc4.UInt64(representative_id)
+            )
+        )
+
         return representative_id
 
     @arc4.abimethod()
@@ -833,9 +1058,10 @@ class DelegationRegistry(
         representative = arc4.Address(Txn.sender)
         assert representative in self.representatives_box, err.NOT_REPRESENTATIVE
 
+        representative_app = self.representatives_box[representative]
         arc4.abi_call(
             representative_contract.Representative.delete,
-            app_id=self.representatives_box[representative],
+            app_id=representative_app,
         )
 
         # Delete representative box
@@ -849,6 +1075,12 @@ class DelegationRegistry(
             amount=mbr_fee,
         ).submit()
 
+        arc4.emit(
+            ev.RepresentativeUnregistered(
+                representative, arc4.UInt64(representative_app.id)
+            )
+        )
+
         return
 
     # ---------------------------------
@@ -900,6 +1132,52 @@ class DelegationRegistry(
 
         return val, exists
 
+    @arc4.abimethod(readonly=True)
+    def get_voter_app_ids(
+        self,
+        xgov_addresses: arc4.DynamicArray[arc4.Address],
+    ) -> arc4.DynamicArray[typ.AppIdResult]:
+        """
+        Get Voter app IDs for many xGovs.
+        Each address needs a box reference, see `cfg.MAX_BULK_GETTER_ADDRESSES`.
+
+        Args:
+            xgov_addresses (arc4.DynamicArray[arc4.Address]): xGov addresses.
+
+        Returns:
+            arc4.DynamicArray[typ.AppIdResult]: Voter app ID of each xGov, in order,
+                and whether the Voter app exists.
+        """
+        results = arc4.DynamicArray[typ.AppIdResult]()
+        for xgov_address in xgov_addresses:
+            app_id, exists = self.get_voter_app_id(xgov_address)
+            results.append(typ.AppIdResult(arc4.UInt64(app_id), arc4.Bool(exists)))
+
+        return results
+
+    @arc4.abimethod(readonly=True)
+    def get_representative_app_ids(
+        self,
+        representative_addresses: arc4.DynamicArray[arc4.Address],
+    ) -> arc4.DynamicArray[typ.AppIdResult]:
+        """
+        Get the app IDs of many representatives.
+        Each address needs a box reference, see `cfg.MAX_BULK_GETTER_ADDRESSES`.
+
+        Args:
+            representative_addresses (arc4.DynamicArray[arc4.Address]): Representative addresses.
+
+        Returns:
+            arc4.DynamicArray[typ.AppIdResult]: App ID of each representative, in order,
+                and whether the Representative app exists.
+        """
+        results = arc4.DynamicArray[typ.AppIdResult]()
+        for representative_address in representative_addresses:
+            app_id, exists = self.get_representative_app_id(representative_address)
+            results.append(typ.AppIdResult(arc4.UInt64(app_id), arc4.Bool(exists)))
+
+        return results
+
     # ---------------------------------
     # ---------- Subroutines ----------
     # ---------------------------------
@@ -915,6 +1193,144 @@ class DelegationRegistry(
     def is_manager(self) -> bool:
         return Txn.sender == self.manager_address.value.native
 
+    @subroutine
+    def create_voter(self) -> Application:
+        box = Box(Bytes, key=Bytes(cfg.CONTRACT_VOTER_BOX))
+        # Assume program size is < const.MAX_STACK
+        approval_program = box.extract(0, box.length)
+
+        self.voters_created.value += 1
+        txn = arc4.abi_call(
+            voter_contract.Voter.create,
+            arc4.UInt64(self.voters_created.value),
+            arc4.UInt64(self.xgov_registry_app.value.id),
+            approval_program=approval_program,
+            clear_state_program=const.MIN_PROGRAM,
+            global_num_uint=voter_cfg.GLOBAL_UINTS,
+            global_num_bytes=voter_cfg.GLOBAL_BYTES,
+            local_num_uint=voter_cfg.LOCAL_UINTS,
+            local_num_bytes=voter_cfg.LOCAL_BYTES,
+            extra_program_pages=const.MAX_EXTRA_PAGES_PER_APP,
+        )
+
+        # Fund the created app with MBR
+        itxn.Payment(
+            receiver=txn.created_app.address,
+            amount=Global.min_balance,
+        ).submit()
+
+        return txn.created_app
+
+    @subroutine
+    def get_voting_address(
+        self, voter_app: Application, xgov_address: arc4.Address
+    ) -> tuple[arc4.Address, bool]:
+        """
+        Voting address of an xGov, and whether it is in the xGov Registry.
+
+        The copy cached in the Voter is used while fresh, the xGov box otherwise.
+        """
+        synced_ts, exists = op.AppGlobal.get_ex_uint64(
+            voter_app, voter_cfg.GS_KEY_VOTING_ADDRESS_TS
+        )
+        if synced_ts and Global.latest_timestamp < synced_ts + cfg.VOTING_ADDRESS_TTL:
+            voting_address_bytes, exists = op.AppGlobal.get_ex_bytes(
+                voter_app, voter_cfg.GS_KEY_VOTING_ADDRESS
+            )
+            voting_address = arc4.Address(voting_address_bytes)
+            # The zero address is cached for xGovs no longer in the xGov Registry
+            return voting_address, voting_address != Global.zero_address
+
+        return self.read_voting_address(xgov_address)
+
+    @subroutine
+    def read_voting_address(
+        self, xgov_address: arc4.Address
+    ) -> tuple[arc4.Address, bool]:
+        """Voting address of an xGov in its xGov box, and whether the box exists."""
+        # Get xgov_address box
+        [xgov_box, exists], txn = arc4.abi_call(
+            IXGovRegistry.get_xgov_box,
+            xgov_address,
+            app_id=self.xgov_registry_app.value,
+        )
+        return xgov_box.voting_address, exists
+
     @subroutine
     def update_trigger_fund(self) -> None:
-        self.trigger_fund.value = self.vote_trigger_award.value * self.votes_left.value
+        # Awards of the paid votes left, and the rewards credited but not yet claimed
+        self.trigger_fund.value = (
+            self.vote_trigger_award.value * self.votes_left.value
+            + self.trigger_rewards.value
+        )
+
+    @subroutine
+    def get_triggered_page_key(self, proposal_id: arc4.UInt64, page: UInt64) -> Bytes:
+        return cfg.TRIGGERED_MAP_PREFIX + proposal_id.bytes + op.itob(page)
+
+    @subroutine
+    def mark_triggered(
+        self, xgov_address: arc4.Address, proposal_id: arc4.UInt64
+    ) -> None:
+        """
+        Set the bit of the Voter of an xGov in the triggered bitmap of a proposal.
+
+        The MBR of a new page is deliberately paid by the Delegation Registry, out of the
+        balance not held for the trigger fund, rather than by the trigger: it exceeds the
+        trigger award, and is recovered with `delete_triggered_page` once the proposal
+        is no longer voting.
+        """
+        voter_app, exists = self.voters_box.maybe(xgov_address)
+        assert exists, err.NOT_VOTER
+
+        index, exists = op.AppGlobal.get_ex_uint64(voter_app, voter_cfg.GS_KEY_INDEX)
+        if not exists:  # Voters created before indexes are not tracked
+            return
+
+        box = Box(
+            Bytes,
+            key=self.get_triggered_page_key(
+                proposal_id, index // cfg.TRIGGERED_PAGE_BITS
+            ),
+        )
+        if not box:
+            box.create(size=UInt64(cfg.TRIGGERED_PAGE_SIZE))
+            assert (
+                self.trigger_fund.value
+                <= Global.current_application_address.balance
+                - Global.current_application_address.min_balance
+            ), err.TRIGGER_FUND_INSUFFICIENT
+
+        bit = index % cfg.TRIGGERED_PAGE_BITS
+        flags = box.extract(bit // 8, 1)
+        assert not op.getbit(flags, bit % 8), err.ALREADY_TRIGGERED
+        box.replace(bit // 8, op.setbit_bytes(flags, bit % 8, True))  # noqa: FBT003
+
+    @subroutine
+    def vote_representative(
+        self, xgov_address: arc4.Address, proposal_id: arc4.UInt64
+    ) -> None:
+        assert not self.paused_registry.value, err.PAUSED_REGISTRY
+        assert xgov_address in self.voters_box, err.NOT_VOTER
+
+        arc4.abi_call(
+            voter_contract.Voter.vote_representative,
+            proposal_id,
+            app_id=self.voters_box[xgov_address],
+        )
+
+        self.votes_left.value -= 1
+        self.update_trigger_fund()
+
+        arc4.emit(
+            ev.VoteTriggered(
+                xgov_address,
+                proposal_id,
+                arc4.UInt64(self.vote_trigger_award.value),
+            )
+        )
+
+    @subroutine
+    def release_trigger_rewards(self, amount: UInt64) -> None:
+        self.trigger_rewards.value -= amount
+        self.update_trigger_fund()
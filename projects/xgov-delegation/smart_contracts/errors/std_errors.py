@@ -39,6 +39,7 @@ VOTER_PREPARED = "Voter already prepared"
 
 REPRESENTATIVE_NONEXISTENT = "Representative is nonexistent"
 VOTE_INVALID = "Representative vote is invalid"
+TOO_MANY_BACKUP_REPRESENTATIVES = "Too many backup representatives"
 NO_VOTES = "xGov does not have any votes"
 VOTE_NOT_PPM = "Vote not in PPM"
 
@@ -47,6 +48,11 @@ INCONSISTENT_VOTE_FEES = "xGov vote fees must not be larger than for others"
 
 INCONSISTENT_TRIGGER_AWARD = "Trigger reward must not be larger than minimum vote fees"
 
+TRIGGER_REWARDS_OPENED = "Trigger rewards ledger is already opened"
+NO_TRIGGER_REWARDS = "No trigger rewards ledger"
+ALREADY_TRIGGERED = "Vote was already triggered"
+NO_TRIGGERED_PAGE = "No triggered bitmap page"
+
 TRIGGER_FUND_INSUFFICIENT = (
     "Trigger fund is insufficient. Fund the Registry or reduce award."
 )
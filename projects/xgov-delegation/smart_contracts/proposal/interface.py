@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
 from algopy import (
     ARC4Contract,
@@ -8,7 +8,6 @@ from algopy import (
 
 class IProposal(
     ARC4Contract,
-    ABC,
 ):
     @abstractmethod
     @arc4.abimethod(readonly=True)
@@ -8,8 +8,10 @@ from algopy import (
     GlobalState,
     UInt64,
     arc4,
+    urange,
 )
 
+from ..common import abi_types as typ
 from ..proposal import config as prop_cfg
 from ..proposal import enums as enm
 
@@ -65,6 +67,17 @@ class ProposalMock(ARC4Contract, avm_version=10):
         approvals: arc4.UInt64,
         rejections: arc4.UInt64,
     ) -> None:
+        """
+        Cast the votes of a Voter. As the xGov Proposal does, the voter box is deleted once
+        the Voter has voted.
+
+        Args:
+            voter (arc4.Address): The address of the Voter
+            approvals (arc4.UInt64): The approval votes
+            rejections (arc4.UInt64): The rejection votes
+        """
+        del self.voters[voter.native]
+
         return
 
     @arc4.abimethod()
@@ -84,6 +97,24 @@ class ProposalMock(ARC4Contract, avm_version=10):
 
         return
 
+    @arc4.abimethod()
+    def set_voter_boxes(
+        self,
+        voter_boxes: arc4.DynamicArray[typ.VoterBoxEntry],
+    ) -> None:
+        """
+        Set the Voter boxes for the given addresses, to seed many Voters at once.
+        The number of entries per call is bound by the box references of the group.
+
+        Args:
+            voter_boxes (arc4.DynamicArray[typ.VoterBoxEntry]): The Voter addresses and their votes
+        """
+        for i in urange(voter_boxes.length):
+            entry = voter_boxes[i].copy()
+            self.voters[entry.voter_address.native] = entry.votes.as_uint64()
+
+        return
+
     @arc4.abimethod()
     def del_voter_box(
         self,
@@ -1,5 +1,7 @@
 from typing import Final
 
+from smart_contracts.common import constants as const
+
 # State Schema
 GLOBAL_BYTES: Final[int] = 32
 GLOBAL_UINTS: Final[int] = 32
@@ -9,7 +11,12 @@ LOCAL_UINTS: Final[int] = 7
 # Global state keys
 GS_KEY_REPRESENTATIVE_ADDRESS: Final[bytes] = b"representative_address"
 GS_KEY_REGISTRY_APP: Final[bytes] = b"registry_app"
+GS_KEY_XGOV_REGISTRY_APP: Final[bytes] = b"xgov_registry_app"
 GS_KEY_PAUSED: Final[bytes] = b"paused"
 
 # Box keys
 PROPOSALS_VOTE_MAP_PREFIX: Final[bytes] = b"pv"
+
+# Getters
+# A box reference per proposal, as votes boxes are smaller than 1 KiB
+MAX_BULK_GETTER_PROPOSALS: Final[int] = const.MAX_TXN_REFERENCES
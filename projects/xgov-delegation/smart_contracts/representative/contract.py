@@ -20,6 +20,7 @@ from algopy import (
 import smart_contracts.errors.std_errors as err
 from smart_contracts.common import abi_types as typ
 from smart_contracts.common import constants as const
+from smart_contracts.common import events as ev
 from smart_contracts.delegation_registry import config as reg_cfg
 from smart_contracts.proposal import utils as utils_prop
 
@@ -52,6 +53,10 @@ class Representative(
             Application(),
             key=cfg.GS_KEY_REGISTRY_APP,
         )
+        self.xgov_registry_app = GlobalState(
+            Application(),
+            key=cfg.GS_KEY_XGOV_REGISTRY_APP,
+        )
 
         self.paused = GlobalState(
             UInt64(),
@@ -69,6 +74,7 @@ class Representative(
     def create(
         self,
         representative_address: arc4.Address,
+        xgov_registry_id: arc4.UInt64,
     ) -> None:
         """
         Create a new representative.
@@ -76,6 +82,7 @@ class Representative(
 
         Args:
             representative_address (arc4.Address): Address of the representative.
+            xgov_registry_id (arc4.UInt64): ID of the xGov Registry app of the Delegation Registry.
 
         Raises:
             err.UNAUTHORIZED: If the sender is not the Delegation Registry.
@@ -85,6 +92,7 @@ class Representative(
         ), err.UNAUTHORIZED  # Only callable by another contract
 
         self.registry_app.value = Application(Global.caller_application_id)
+        self.xgov_registry_app.value = Application(xgov_registry_id.as_uint64())
         self.representative_address.value = representative_address.native
 
         self.paused.value = UInt64(0)
@@ -104,6 +112,33 @@ class Representative(
 
         return
 
+    @arc4.abimethod()
+    def sync_xgov_registry(
+        self,
+        xgov_registry_id: arc4.UInt64,
+    ) -> None:
+        """
+        Set the cached ID of the xGov Registry used by the Delegation Registry.
+        MUST BE CALLED BY THE REGISTRY CONTRACT.
+
+        Args:
+            xgov_registry_id (arc4.UInt64): ID of the xGov Registry app.
+
+        Raises:
+            err.NOT_CREATOR: If the sender is not the Delegation Registry.
+        """
+        assert self.is_creator(), err.NOT_CREATOR
+
+        self.xgov_registry_app.value = Application(xgov_registry_id.as_uint64())
+
+        arc4.emit(
+            ev.RepresentativeXGovRegistrySynced(
+                arc4.Address(self.representative_address.value), xgov_registry_id
+            )
+        )
+
+        return
+
     @arc4.abimethod()
     def pause(self) -> None:
         """
@@ -115,6 +150,13 @@ class Representative(
         assert self.is_representative(), err.UNAUTHORIZED
         self.paused.value = UInt64(1)
 
+        arc4.emit(
+            ev.RepresentativePauseSet(
+                representative_address=arc4.Address(self.representative_address.value),
+                paused=arc4.Bool(bool(self.paused.value)),
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -128,6 +170,13 @@ class Representative(
         assert self.is_representative(), err.UNAUTHORIZED
         self.paused.value = UInt64(0)
 
+        arc4.emit(
+            ev.RepresentativePauseSet(
+                representative_address=arc4.Address(self.representative_address.value),
+                paused=arc4.Bool(bool(self.paused.value)),
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -181,6 +230,14 @@ class Representative(
         ), err.WRONG_RECEIVER
         assert payment.amount == mbr_fee, err.WRONG_PAYMENT_AMOUNT
 
+        arc4.emit(
+            ev.VotePublished(
+                arc4.Address(self.representative_address.value),
+                proposal_id,
+                vote.copy(),
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -219,6 +276,10 @@ class Representative(
             amount=mbr_freed,
         ).submit()
 
+        arc4.emit(
+            ev.VoteDeleted(arc4.Address(self.representative_address.value), proposal_id)
+        )
+
         return
 
     @arc4.abimethod(allow_actions=("DeleteApplication",))
@@ -296,6 +357,29 @@ class Representative(
 
         return val.copy(), is_valid
 
+    @arc4.abimethod(readonly=True)
+    def get_votes(
+        self,
+        proposal_ids: arc4.DynamicArray[arc4.UInt64],
+    ) -> arc4.DynamicArray[typ.VoteResult]:
+        """
+        Get the representative's votes on many proposals.
+        Each proposal needs a box reference, see `cfg.MAX_BULK_GETTER_PROPOSALS`.
+
+        Args:
+            proposal_ids (arc4.DynamicArray[arc4.UInt64]): App IDs of the proposals.
+
+        Returns:
+            arc4.DynamicArray[typ.VoteResult]: Representative's vote on each proposal,
+                in order, and whether it exists and representative isn't paused.
+        """
+        results = arc4.DynamicArray[typ.VoteResult]()
+        for proposal_id in proposal_ids:
+            [val, is_valid] = self.get_vote(proposal_id)
+            results.append(typ.VoteResult(val.copy(), arc4.Bool(is_valid)))
+
+        return results
+
     # ---------------------------------
     # ---------- Subroutines ----------
     # ---------------------------------
@@ -309,6 +393,11 @@ class Representative(
 
     @subroutine
     def get_xgov_registry_id(self) -> UInt64:
+        xgov_registry_app, exists = self.xgov_registry_app.maybe()
+        if exists:
+            return xgov_registry_app.id
+
+        # Apps not yet synced read it from the Delegation Registry
         xgov_registry_id, exists = op.AppGlobal.get_ex_uint64(
             self.registry_app.value,
             reg_cfg.GS_KEY_XGOV_REGISTRY_APP,
@@ -10,10 +10,19 @@ LOCAL_UINTS: Final[int] = 8
 GS_KEY_XGOV_ADDRESS: Final[bytes] = b"xgov_address"
 GS_KEY_MANAGER_ADDRESS: Final[bytes] = b"manager_address"
 GS_KEY_REGISTRY_APP: Final[bytes] = b"registry_app"
+GS_KEY_XGOV_REGISTRY_APP: Final[bytes] = b"xgov_registry_app"
 GS_KEY_REPRESENTATIVE_APP: Final[bytes] = b"representative_app"
+GS_KEY_BACKUP_REPRESENTATIVES: Final[bytes] = b"backup_representatives"
 GS_KEY_WINDOW_TS: Final[bytes] = b"window_ts"
 GS_KEY_VOTES_LEFT: Final[bytes] = b"votes_left"
+GS_KEY_INDEX: Final[bytes] = b"index"
+GS_KEY_VOTING_ADDRESS: Final[bytes] = b"voting_address"
+GS_KEY_VOTING_ADDRESS_TS: Final[bytes] = b"voting_address_ts"
 
 # Parameters
 ## Amounts
 DEFAULT_WINDOW_TS = 2 * 24 * 3_600  # 2 days in seconds
+
+## Backup representatives
+# Each one tried costs an inner call, and its app and vote box as references
+MAX_BACKUP_REPRESENTATIVES: Final[int] = 3
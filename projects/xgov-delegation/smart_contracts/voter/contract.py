@@ -18,6 +18,7 @@ from algopy import (
 import smart_contracts.errors.std_errors as err
 from smart_contracts.common import abi_types as typ
 from smart_contracts.common import constants as const
+from smart_contracts.common import events as ev
 from smart_contracts.delegation_registry import config as reg_cfg
 from smart_contracts.proposal import utils as utils_prop
 from smart_contracts.proposal.interface import IProposal
@@ -53,10 +54,18 @@ class Voter(
             Application(),
             key=cfg.GS_KEY_REGISTRY_APP,
         )
+        self.xgov_registry_app = GlobalState(
+            Application(),
+            key=cfg.GS_KEY_XGOV_REGISTRY_APP,
+        )
         self.representative_app = GlobalState(
             Application(),
             key=cfg.GS_KEY_REPRESENTATIVE_APP,
         )
+        self.backup_representatives = GlobalState(
+            arc4.DynamicArray[arc4.UInt64](),
+            key=cfg.GS_KEY_BACKUP_REPRESENTATIVES,
+        )
         self.window_ts = GlobalState(
             UInt64(),
             key=cfg.GS_KEY_WINDOW_TS,
@@ -69,15 +78,33 @@ class Voter(
             Account(),
             key=cfg.GS_KEY_MANAGER_ADDRESS,
         )
+        self.index = GlobalState(
+            UInt64(),
+            key=cfg.GS_KEY_INDEX,
+        )
+        self.voting_address = GlobalState(
+            Account(),
+            key=cfg.GS_KEY_VOTING_ADDRESS,
+        )
+        self.voting_address_ts = GlobalState(
+            UInt64(),
+            key=cfg.GS_KEY_VOTING_ADDRESS_TS,
+        )
 
     @arc4.abimethod(create="require")
     def create(
         self,
+        index: arc4.UInt64,
+        xgov_registry_id: arc4.UInt64,
     ) -> None:
         """
         Create a new Voter.
         MUST BE CALLED BY THE REGISTRY CONTRACT.
 
+        Args:
+            index (arc4.UInt64): Sequence number of the Voter in the Delegation Registry.
+            xgov_registry_id (arc4.UInt64): ID of the xGov Registry app of the Delegation Registry.
+
         Raises:
             err.UNAUTHORIZED: If the sender is not the Delegation Registry.
         """
@@ -86,12 +113,17 @@ class Voter(
         ), err.UNAUTHORIZED  # Only callable by another contract
 
         self.registry_app.value = Application(Global.caller_application_id)
+        self.xgov_registry_app.value = Application(xgov_registry_id.as_uint64())
 
         self.xgov_address.value = Global.zero_address
         self.manager_address.value = Global.zero_address
         self.representative_app.value = Application()
+        self.backup_representatives.value = arc4.DynamicArray[arc4.UInt64]()
         self.window_ts.value = UInt64(0)
         self.votes_left.value = UInt64(0)
+        self.index.value = index.as_uint64()
+        self.voting_address.value = Global.zero_address
+        self.voting_address_ts.value = UInt64(0)
 
         return
 
@@ -108,11 +140,39 @@ class Voter(
 
         return
 
+    @arc4.abimethod()
+    def sync_xgov_registry(
+        self,
+        xgov_registry_id: arc4.UInt64,
+    ) -> None:
+        """
+        Set the cached ID of the xGov Registry used by the Delegation Registry.
+        MUST BE CALLED BY THE REGISTRY CONTRACT.
+
+        Args:
+            xgov_registry_id (arc4.UInt64): ID of the xGov Registry app.
+
+        Raises:
+            err.NOT_CREATOR: If the sender is not the Delegation Registry.
+        """
+        assert self.is_creator(), err.NOT_CREATOR
+
+        self.xgov_registry_app.value = Application(xgov_registry_id.as_uint64())
+
+        arc4.emit(
+            ev.VoterXGovRegistrySynced(
+                arc4.Address(self.xgov_address.value), xgov_registry_id
+            )
+        )
+
+        return
+
     @arc4.abimethod()
     def assign_xgov(
         self,
         xgov_address: arc4.Address,
         manager_address: arc4.Address,
+        voting_address: arc4.Address,
     ) -> None:
         """
         Assign the contract to an xGov.
@@ -120,6 +180,7 @@ class Voter(
         Args:
             xgov_address (arc4.Address): Address of the xGov.
             manager_address (arc4.Address): Address of the new manager.
+            voting_address (arc4.Address): Voting address of the xGov in the xGov Registry.
 
         Raises:
             err.NOT_CREATOR: If the sender is not the Delegation Registry.
@@ -128,6 +189,9 @@ class Voter(
 
         self.xgov_address.value = xgov_address.native
         self.manager_address.value = manager_address.native
+        self.set_voting_address(voting_address)
+
+        arc4.emit(ev.XGovAssigned(xgov_address, manager_address))
 
         return
 
@@ -149,6 +213,10 @@ class Voter(
 
         self.manager_address.value = manager_address.native
 
+        arc4.emit(
+            ev.VoterManagerSet(arc4.Address(self.xgov_address.value), manager_address)
+        )
+
         return
 
     @arc4.abimethod()
@@ -172,6 +240,48 @@ class Voter(
 
         self.verify_new_app(self.representative_app.value)
 
+        arc4.emit(
+            ev.RepresentativeSet(
+                arc4.Address(self.xgov_address.value), representative_id
+            )
+        )
+
+        return
+
+    @arc4.abimethod()
+    def set_backup_representatives(
+        self,
+        representative_ids: arc4.DynamicArray[arc4.UInt64],
+    ) -> None:
+        """
+        Set the representatives whose vote is cast, in order, if the representative has no
+        valid vote. Set to an empty list to not have any backup.
+
+        Args:
+            representative_ids (arc4.DynamicArray[arc4.UInt64]): The application IDs of the
+                backup representatives, in order of preference.
+
+        Raises:
+            err.UNAUTHORIZED: If the sender is not the xGov or its manager.
+            err.TOO_MANY_BACKUP_REPRESENTATIVES: If more than the maximum backup representatives are given.
+            err.UNRELATED_APP: If a representative app was not created by the Delegation Registry.
+        """
+        assert self.is_xgov_or_manager(), err.UNAUTHORIZED
+        assert (
+            representative_ids.length <= cfg.MAX_BACKUP_REPRESENTATIVES
+        ), err.TOO_MANY_BACKUP_REPRESENTATIVES
+
+        for representative_id in representative_ids:
+            self.verify_new_app(Application(representative_id.as_uint64()))
+
+        self.backup_representatives.value = representative_ids.copy()
+
+        arc4.emit(
+            ev.BackupRepresentativesSet(
+                arc4.Address(self.xgov_address.value), representative_ids
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -193,6 +303,8 @@ class Voter(
 
         self.window_ts.value = window_ts.as_uint64()
 
+        arc4.emit(ev.WindowSet(arc4.Address(self.xgov_address.value), window_ts))
+
         return
 
     @arc4.abimethod()
@@ -202,6 +314,8 @@ class Voter(
     ) -> None:
         """
         Vote on a proposal according to vote of representative if time is within window.
+        If the representative has no valid vote, the vote of the first backup representative
+        with one is cast instead.
         MUST BE CALLED BY THE REGISTRY CONTRACT.
 
         Args:
@@ -213,8 +327,10 @@ class Voter(
                 which is defined at the Delegation Registry.
             err.NO_VOTES_LEFT: If no paid votes left.
             err.TOO_SOON_TO_VOTE: If time is not yet within set window before proposal voting ends.
-            err.REPRESENTATIVE_NONEXISTENT: If representative has unregistered.
-            err.VOTE_INVALID: If representative did not submit a vote or has paused its activity.
+            err.REPRESENTATIVE_NONEXISTENT: If representative has unregistered, without backups.
+            err.VOTE_INVALID: If representative did not submit a vote or has paused its activity,
+                without backups.
+            err.COULD_NOT_VOTE: If neither representative nor any backup has a valid vote.
             err.NO_VOTES: If xGov does not have any votes to cast on this proposal.
         """
         assert self.is_creator(), err.NOT_CREATOR
@@ -232,16 +348,26 @@ class Voter(
                 Global.latest_timestamp > vote_close_ts - self.window_ts.value
             ), err.TOO_SOON_TO_VOTE
 
-        # Get vote from representative
-        creator, exists = op.AppParamsGet.app_creator(self.representative_app.value)
-        assert exists, err.REPRESENTATIVE_NONEXISTENT
+        # Get vote from representative, else from the first backup with a valid vote
+        representative_app = self.representative_app.value
+        backup_representatives = self.get_backup_representatives()
+        if not backup_representatives.length:
+            creator, exists = op.AppParamsGet.app_creator(representative_app)
+            assert exists, err.REPRESENTATIVE_NONEXISTENT
+
+        vote, is_valid = self.get_representative_vote(representative_app, proposal_id)
+        for representative_id in backup_representatives:
+            if is_valid:
+                break
+            representative_app = Application(representative_id.as_uint64())
+            vote, is_valid = self.get_representative_vote(
+                representative_app, proposal_id
+            )
 
-        [vote, is_valid], txn = arc4.abi_call(
-            representative_contract.Representative.get_vote,
-            proposal_id,
-            app_id=self.representative_app.value,
-        )
-        assert is_valid, err.VOTE_INVALID
+        if backup_representatives.length:
+            assert is_valid, err.COULD_NOT_VOTE
+        else:
+            assert is_valid, err.VOTE_INVALID
 
         # Get voter's box
         [votes, exists], txn = arc4.abi_call(
@@ -265,6 +391,17 @@ class Voter(
             app_id=self.get_xgov_registry_id(),
         )
 
+        arc4.emit(
+            ev.VotedByRepresentative(
+                arc4.Address(self.xgov_address.value),
+                proposal_id,
+                arc4.UInt64(representative_app.id),
+                arc4.UInt64(approvals),
+                arc4.UInt64(rejections),
+                arc4.UInt64(self.votes_left.value),
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -298,6 +435,15 @@ class Voter(
             app_id=self.get_xgov_registry_id(),
         )
 
+        arc4.emit(
+            ev.VotedDirectly(
+                arc4.Address(self.xgov_address.value),
+                proposal_id,
+                vote.approvals,
+                vote.rejections,
+            )
+        )
+
         return
 
     @arc4.abimethod()
@@ -322,6 +468,36 @@ class Voter(
             voting_address,
             app_id=self.get_xgov_registry_id(),
         )
+        self.set_voting_address(voting_address)
+
+        arc4.emit(
+            ev.VotingRightsYielded(
+                arc4.Address(self.xgov_address.value), voting_address
+            )
+        )
+
+        return
+
+    @arc4.abimethod()
+    def sync_voting_address(self) -> None:
+        """
+        Refresh the cached voting address of the xGov from the xGov Registry.
+        The Delegation Registry reads it instead of the xGov box while it is fresh.
+        The zero address is cached if the xGov is no longer in the xGov Registry.
+        """
+        [xgov_box, exists], txn = arc4.abi_call(
+            IXGovRegistry.get_xgov_box,
+            arc4.Address(self.xgov_address.value),
+            app_id=self.get_xgov_registry_id(),
+        )
+        voting_address = xgov_box.voting_address if exists else arc4.Address()
+        self.set_voting_address(voting_address)
+
+        arc4.emit(
+            ev.VotingAddressSynced(
+                arc4.Address(self.xgov_address.value), voting_address
+            )
+        )
 
         return
 
@@ -344,6 +520,14 @@ class Voter(
 
         self.votes_left.value += add_votes.as_uint64()
 
+        arc4.emit(
+            ev.VotesAdded(
+                arc4.Address(self.xgov_address.value),
+                add_votes,
+                arc4.UInt64(self.votes_left.value),
+            )
+        )
+
         return
 
     @arc4.abimethod(allow_actions=("DeleteApplication",))
@@ -385,12 +569,44 @@ class Voter(
 
     @subroutine
     def get_xgov_registry_id(self) -> UInt64:
+        xgov_registry_app, exists = self.xgov_registry_app.maybe()
+        if exists:
+            return xgov_registry_app.id
+
+        # Apps not yet synced read it from the Delegation Registry
         xgov_registry_id, exists = op.AppGlobal.get_ex_uint64(
             self.registry_app.value,
             reg_cfg.GS_KEY_XGOV_REGISTRY_APP,
         )
         return xgov_registry_id
 
+    @subroutine
+    def get_backup_representatives(self) -> arc4.DynamicArray[arc4.UInt64]:
+        # Voters updated from before the backups have none
+        if self.backup_representatives:
+            return self.backup_representatives.value.copy()
+        return arc4.DynamicArray[arc4.UInt64]()
+
+    @subroutine
+    def get_representative_vote(
+        self, representative_app: Application, proposal_id: arc4.UInt64
+    ) -> tuple[typ.Vote, bool]:
+        creator, exists = op.AppParamsGet.app_creator(representative_app)
+        if not exists:
+            return typ.Vote(approval=arc4.UInt64(0), rejection=arc4.UInt64(0)), False
+
+        [vote, is_valid], txn = arc4.abi_call(
+            representative_contract.Representative.get_vote,
+            proposal_id,
+            app_id=representative_app,
+        )
+        return vote.copy(), is_valid
+
+    @subroutine
+    def set_voting_address(self, voting_address: arc4.Address) -> None:
+        self.voting_address.value = voting_address.native
+        self.voting_address_ts.value = Global.latest_timestamp
+
     @subroutine
     def is_valid_proposal(self, proposal_id: arc4.UInt64) -> bool:
         proposal_creator = Application(proposal_id.as_uint64()).creator
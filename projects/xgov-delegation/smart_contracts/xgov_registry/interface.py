@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
 from algopy import (
     ARC4Contract,
@@ -10,7 +10,6 @@ import smart_contracts.common.abi_types as typ
 
 class IXGovRegistry(
     ARC4Contract,
-    ABC,
 ):
     @abstractmethod
     @arc4.abimethod(readonly=True)
@@ -8,6 +8,7 @@ from algopy import (
     UInt64,
     arc4,
     itxn,
+    urange,
 )
 
 from smart_contracts.proposal_mock.contract import ProposalMock
@@ -128,6 +129,24 @@ class XgovRegistryMock(ARC4Contract, avm_version=10):
 
         return
 
+    @arc4.abimethod()
+    def set_xgov_boxes(
+        self,
+        xgov_boxes: arc4.DynamicArray[typ.XGovBoxEntry],
+    ) -> None:
+        """
+        Sets the xGov boxes for the given addresses, to seed many xGovs at once.
+        The number of entries per call is bound by the box references of the group.
+
+        Args:
+            xgov_boxes (arc4.DynamicArray[typ.XGovBoxEntry]): The xGov addresses and their box contents.
+        """
+        for i in urange(xgov_boxes.length):
+            entry = xgov_boxes[i].copy()
+            self.xgov_box[entry.xgov_address.native] = entry.xgov_box.copy()
+
+        return
+
     @arc4.abimethod()
     def del_xgov_box(
         self,
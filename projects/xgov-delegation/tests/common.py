@@ -1,9 +1,53 @@
 from typing import Final
 
-from algokit_utils import AlgoAmount
+from algokit_utils import AlgoAmount, AlgorandClient, PaymentParams, SigningAccount
+from algosdk.constants import TX_GROUP_LIMIT
 
 INITIAL_FUNDS: Final[AlgoAmount] = AlgoAmount(algo=1_000)
 DEFAULT_VOTING_DURATION: Final[int] = 1
 
 DEFAULT_PROPOSAL_STATUS: Final[int] = 1
 DEFAULT_PROPOSAL_VOTE_OPEN_TS: Final[int] = 1
+
+
+class AccountPool:
+    """
+    Random accounts funded by the dispenser in grouped payments and handed out one at a time.
+
+    Each pytest-xdist worker holds its own pool, so workers share nothing but the dispenser
+    and fund up to a full group of accounts with a single transaction group.
+    """
+
+    def __init__(
+        self,
+        algorand_client: AlgorandClient,
+        *,
+        funds: AlgoAmount = INITIAL_FUNDS,
+        size: int = TX_GROUP_LIMIT,
+    ) -> None:
+        self.algorand_client = algorand_client
+        self.funds = funds
+        self.size = min(size, TX_GROUP_LIMIT)
+        self.accounts: list[SigningAccount] = []
+
+    def take(self) -> SigningAccount:
+        if not self.accounts:
+            self.refill()
+        return self.accounts.pop()
+
+    def refill(self) -> None:
+        dispenser = self.algorand_client.account.dispenser_from_environment()
+        accounts = [self.algorand_client.account.random() for _ in range(self.size)]
+
+        group = self.algorand_client.new_group()
+        for account in accounts:
+            group.add_payment(
+                PaymentParams(
+                    sender=dispenser.address,
+                    receiver=account.address,
+                    amount=self.funds,
+                )
+            )
+        group.send()
+
+        self.accounts.extend(accounts)
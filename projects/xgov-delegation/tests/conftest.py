@@ -4,9 +4,7 @@ import pytest
 from algokit_utils import AlgorandClient, SigningAccount
 from dotenv import load_dotenv
 
-from tests.common import (
-    INITIAL_FUNDS,
-)
+from tests.common import AccountPool
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -31,30 +29,21 @@ def reset_blockchain_timestamp(algorand_client: AlgorandClient):
 
 
 @pytest.fixture(scope="session")
-def deployer(algorand_client: AlgorandClient) -> SigningAccount:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def account_pool(algorand_client: AlgorandClient) -> AccountPool:
+    # Session scoped, i.e. one pool per pytest-xdist worker
+    return AccountPool(algorand_client)
 
 
 @pytest.fixture(scope="session")
-def voting_account(algorand_client: AlgorandClient) -> SigningAccount:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def deployer(account_pool: AccountPool) -> SigningAccount:
+    return account_pool.take()
 
 
 @pytest.fixture(scope="session")
-def no_role_account(algorand_client: AlgorandClient) -> SigningAccount:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
-    return account
+def voting_account(account_pool: AccountPool) -> SigningAccount:
+    return account_pool.take()
+
+
+@pytest.fixture(scope="session")
+def no_role_account(account_pool: AccountPool) -> SigningAccount:
+    return account_pool.take()
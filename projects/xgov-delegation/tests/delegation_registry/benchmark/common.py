@@ -0,0 +1,122 @@
+import json
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Final, Protocol
+
+from algokit_utils import AlgorandClient, SendAtomicTransactionComposerResults
+
+BASELINE_PATH: Final[Path] = Path(__file__).parent / "baseline.json"
+
+# Allowed relative increase of any metric over its baseline before a test fails
+REGRESSION_THRESHOLD: Final[float] = float(
+    os.environ.get("BENCHMARK_THRESHOLD", "0.05")
+)
+
+# Set to `true` to (re)write the baseline with the measured values instead of comparing
+UPDATE_BASELINE: Final[bool] = (
+    os.environ.get("BENCHMARK_UPDATE_BASELINE", "false").lower() == "true"
+)
+
+
+class Composer(Protocol):
+    def simulate(
+        self, *, allow_unnamed_resources: bool | None = None
+    ) -> SendAtomicTransactionComposerResults: ...
+
+    def send(self) -> SendAtomicTransactionComposerResults: ...
+
+
+@dataclass(slots=True)
+class Measurement:
+    opcode_cost: int  # opcode budget consumed by the whole group, incl. inner calls
+    inner_txns: int  # number of inner transactions issued, incl. nested ones
+    fees: int  # sum of fees of the outer transactions, in microAlgos
+    mbr_delta: int  # change of MBR of the observed accounts, in microAlgos
+
+
+def count_inner_txns(txn_result: dict[str, Any]) -> int:
+    inner_txns = txn_result.get("inner-txns", [])
+    return len(inner_txns) + sum(count_inner_txns(inner) for inner in inner_txns)
+
+
+def get_min_balance(algorand_client: AlgorandClient, addresses: list[str]) -> int:
+    return sum(
+        algorand_client.account.get_information(address).min_balance.micro_algo
+        for address in addresses
+    )
+
+
+def measure(
+    algorand_client: AlgorandClient,
+    build: Callable[[], Composer],
+    *,
+    accounts: list[str],
+) -> Measurement:
+    """
+    Simulate a freshly built group to get its opcode cost, inner transactions and fees,
+    then send another freshly built copy of it to get the MBR delta of `accounts`.
+    """
+    simulated = build().simulate(allow_unnamed_resources=True)
+    assert simulated.simulate_response is not None
+    group = simulated.simulate_response["txn-groups"][0]
+
+    opcode_cost = group.get("app-budget-consumed", 0)
+    inner_txns = sum(
+        count_inner_txns(txn["txn-result"]) for txn in group["txn-results"]
+    )
+    fees = sum(txn.raw.fee for txn in simulated.transactions)
+
+    mbr_before = get_min_balance(algorand_client, accounts)
+    build().send()
+    mbr_after = get_min_balance(algorand_client, accounts)
+
+    return Measurement(
+        opcode_cost=opcode_cost,
+        inner_txns=inner_txns,
+        fees=fees,
+        mbr_delta=mbr_after - mbr_before,
+    )
+
+
+def load_baseline() -> dict[str, dict[str, int]]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def save_baseline(name: str, measurement: Measurement) -> None:
+    baseline = load_baseline()
+    baseline[name] = asdict(measurement)
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def assert_no_regression(name: str, measurement: Measurement) -> None:
+    """
+    Compare a measurement against the baseline entry `name` (`<Contract>.<method>`).
+    Fails if the entry or any of its metrics is missing, or if any metric grew by more
+    than the regression threshold.
+    """
+    if UPDATE_BASELINE:
+        save_baseline(name, measurement)
+        return
+
+    expected = load_baseline().get(name)
+    assert (
+        expected is not None
+    ), f"No baseline for {name}, run with BENCHMARK_UPDATE_BASELINE=true to record it"
+
+    measured = asdict(measurement)
+    missing = [metric for metric in measured if metric not in expected]
+    assert not missing, (
+        f"No baseline of {', '.join(missing)} for {name}, "
+        "run with BENCHMARK_UPDATE_BASELINE=true to record it"
+    )
+
+    regressions = [
+        f"{metric}: {value} > {expected[metric]}"
+        for metric, value in measured.items()
+        if value > expected[metric] + abs(expected[metric]) * REGRESSION_THRESHOLD
+    ]
+    assert not regressions, f"{name} regressed: " + ", ".join(regressions)
@@ -0,0 +1,746 @@
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AppClientCompilationParams,
+    CommonAppCallParams,
+    PaymentParams,
+    SigningAccount,
+)
+from artifacts.proposal_mock.proposal_mock_client import (
+    ProposalMockClient,
+    SetStatusArgs,
+)
+from artifacts.representative.representative_client import RepresentativeClient
+from artifacts.voter.voter_client import VoterClient
+from artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    XgovRegistryMockClient,
+)
+from common.helpers import (
+    get_sc_representative_mbr,
+    get_sc_voter_mbr,
+    get_sc_voter_unassigned_mbr,
+    load_sc_data_size_per_transaction,
+)
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    AddVotesArgs,
+    ConfigDelegationRegistryArgs,
+    CreateArgs,
+    DelegationRegistryClient,
+    DelegationRegistryComposer,
+    DelegationRegistryFactory,
+    DelegationRegistryFactoryCreateParams,
+    DeleteTriggeredPageArgs,
+    Fees,
+    GetRepresentativeAppIdArgs,
+    GetRepresentativeAppIdsArgs,
+    GetVoterAppIdArgs,
+    GetVoterAppIdsArgs,
+    InitContractArgs,
+    KeyRegRegistryArgs,
+    KeyRegTxnInfo,
+    LoadContractArgs,
+    OpenTriggerRewardsArgs,
+    PrepareVoterArgs,
+    RegisterRepresentativeArgs,
+    RegisterVoterArgs,
+    SetManagerArgs,
+    TriggerVoteArgs,
+    TriggerVoteToLedgerArgs,
+    UnregisterVoterArgs,
+    UpdateRepresentativeArgs,
+    UpdateVoterArgs,
+)
+from smart_contracts.common import constants as const
+from smart_contracts.common.helpers import (
+    get_available_voter,
+    get_trigger_rewards_mbr,
+)
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.proposal import enums as prop_cfg
+from tests.delegation_registry.benchmark.common import assert_no_regression, measure
+from tests.delegation_registry.common import open_trigger_rewards
+
+CONTRACT = "DelegationRegistry"
+
+
+def test_create(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+) -> None:
+    factory = algorand_client.client.get_typed_app_factory(
+        typed_factory=DelegationRegistryFactory,
+        default_sender=deployer.address,
+        compilation_params=AppClientCompilationParams(
+            deploy_time_params={"entropy": b""}
+        ),
+    )
+
+    measurement = measure(
+        algorand_client,
+        lambda: algorand_client.new_group().add_app_create_method_call(
+            DelegationRegistryFactoryCreateParams(factory.app_factory).create(
+                args=CreateArgs(xgov_registry_id=xgov_registry_mock_client.app_id),
+                compilation_params=AppClientCompilationParams(
+                    deploy_time_params={"entropy": b""}
+                ),
+            )
+        ),
+        accounts=[deployer.address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.create", measurement)
+
+
+def test_set_manager(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().set_manager(
+            args=SetManagerArgs(manager=deployer.address),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.set_manager", measurement)
+
+
+def test_config_delegation_registry(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().config_delegation_registry(
+            args=ConfigDelegationRegistryArgs(
+                vote_fees=Fees(
+                    xgov=regcfg.FEE_VOTE_XGOV,
+                    other=regcfg.FEE_VOTE_OTHER,
+                ),
+                representative_fee=regcfg.FEE_REPRESENTATIVE,
+                vote_trigger_award=regcfg.VOTE_TRIGGER_AWARD,
+            )
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.config_delegation_registry", measurement)
+
+
+def test_withdraw_balance(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+    voter: VoterClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().withdraw_balance(
+            params=CommonAppCallParams(
+                extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.withdraw_balance", measurement)
+
+
+def test_pause_registry(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().pause_registry(),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.pause_registry", measurement)
+
+
+def test_resume_registry(
+    algorand_client: AlgorandClient,
+    delegation_registry_client_paused: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client_paused.new_group().resume_registry(),
+        accounts=[delegation_registry_client_paused.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.resume_registry", measurement)
+
+
+def test_init_contract(
+    algorand_client: AlgorandClient,
+    delegation_registry_client_uninitialized: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client_uninitialized.new_group().init_contract(
+            args=InitContractArgs(
+                contract=regcfg.CONTRACT_VOTER_BOX,
+                size=load_sc_data_size_per_transaction(),
+            ),
+        ),
+        accounts=[delegation_registry_client_uninitialized.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.init_contract", measurement)
+
+
+def test_load_contract(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    data_size_per_transaction = load_sc_data_size_per_transaction()
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().load_contract(
+            args=LoadContractArgs(
+                contract=regcfg.CONTRACT_VOTER_BOX,
+                offset=0,
+                data=delegation_registry_client.state.box.voter_approval_program[
+                    :data_size_per_transaction
+                ],
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.load_contract", measurement)
+
+
+def test_key_reg_registry(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().key_reg_registry(
+            args=KeyRegRegistryArgs(
+                payment=algorand_client.create_transaction.payment(
+                    PaymentParams(
+                        sender=deployer.address,
+                        receiver=delegation_registry_client.app_address,
+                        amount=AlgoAmount(micro_algo=const.INCENTIVE_ELIGIBLE_FEE),
+                    )
+                ),
+                key_reg_info=KeyRegTxnInfo(
+                    vote_first=1,
+                    vote_last=1_000_000,
+                    vote_key_dilution=1_000,
+                    vote_pk=bytes([0xAA] * 32),
+                    selection_pk=bytes([0xBB] * 32),
+                    state_proof_pk=bytes([0xCC] * 64),
+                ),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.key_reg_registry", measurement)
+
+
+def test_update_registry(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().update.update_registry(
+            compilation_params=AppClientCompilationParams(
+                deploy_time_params={"entropy": b""}
+            )
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.update_registry", measurement)
+
+
+def test_update_voter(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().update_voter(
+            args=UpdateVoterArgs(xgov_address=voter.state.global_state.xgov_address),
+            params=CommonAppCallParams(
+                extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address, voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.update_voter", measurement)
+
+
+def test_update_representative(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    representative_address = representative.state.global_state.representative_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().update_representative(
+            args=UpdateRepresentativeArgs(
+                representative_address=representative_address
+            ),
+            params=CommonAppCallParams(
+                extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address, representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.update_representative", measurement)
+
+
+def test_prepare_voter(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().prepare_voter(
+            args=PrepareVoterArgs(
+                payment=algorand_client.create_transaction.payment(
+                    PaymentParams(
+                        sender=deployer.address,
+                        receiver=delegation_registry_client.app_address,
+                        amount=AlgoAmount(micro_algo=get_sc_voter_unassigned_mbr()),
+                    )
+                )
+            ),
+            params=CommonAppCallParams(
+                extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.prepare_voter", measurement)
+
+
+def test_register_voter(
+    algorand_client: AlgorandClient,
+    xgov: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    available_voter = get_available_voter(
+        algorand_client=algorand_client,
+        delegation_registry_client=delegation_registry_client,
+    )
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().register_voter(
+            args=RegisterVoterArgs(
+                payment=algorand_client.create_transaction.payment(
+                    PaymentParams(
+                        sender=xgov.address,
+                        receiver=delegation_registry_client.app_address,
+                        amount=AlgoAmount(micro_algo=get_sc_voter_mbr()),
+                    )
+                ),
+                xgov_address=xgov.address,
+                available_voter_id=available_voter.id,
+            ),
+            params=CommonAppCallParams(
+                sender=xgov.address,
+                extra_fee=AlgoAmount(micro_algo=4 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.register_voter", measurement)
+
+
+def test_add_votes(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+    pay_amount = delegation_registry_client.state.global_state.vote_fees.xgov
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().add_votes(
+            args=AddVotesArgs(
+                payment=algorand_client.create_transaction.payment(
+                    PaymentParams(
+                        sender=xgov_address,
+                        receiver=delegation_registry_client.app_address,
+                        amount=AlgoAmount(micro_algo=pay_amount),
+                    )
+                ),
+                xgov_address=xgov_address,
+                add_votes=1,
+            ),
+            params=CommonAppCallParams(
+                sender=xgov_address,
+                extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address, voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.add_votes", measurement)
+
+
+def test_trigger_vote(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+    proposal_voter: ProposalMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().trigger_vote(
+            args=TriggerVoteArgs(
+                xgov_address=xgov_address,
+                proposal_id=proposal_voter.app_id,
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address,
+                extra_fee=AlgoAmount(micro_algo=6 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address, voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.trigger_vote", measurement)
+
+
+def new_trigger_vote_to_ledger_group(
+    delegation_registry_client: DelegationRegistryClient,
+    xgov_address: str,
+    proposal_id: int,
+    sender: SigningAccount,
+) -> DelegationRegistryComposer:
+    # The ledger box and the bitmap page do not fit in the references of the trigger
+    # alone: a second call of the group shares its slots
+    return (
+        delegation_registry_client.new_group()
+        .trigger_vote_to_ledger(
+            args=TriggerVoteToLedgerArgs(
+                xgov_address=xgov_address,
+                proposal_id=proposal_id,
+            ),
+            params=CommonAppCallParams(
+                sender=sender.address,
+                extra_fee=AlgoAmount(micro_algo=5 * const.MIN_FEE),
+            ),
+        )
+        .get_voter_app_id(
+            args=GetVoterAppIdArgs(xgov_address=xgov_address),
+            params=CommonAppCallParams(sender=sender.address),
+        )
+    )
+
+
+def test_trigger_vote_to_ledger(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+    proposal_voter: ProposalMockClient,
+    trigger_account: SigningAccount,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+    open_trigger_rewards(delegation_registry_client, trigger_account)
+
+    measurement = measure(
+        algorand_client,
+        lambda: new_trigger_vote_to_ledger_group(
+            delegation_registry_client,
+            xgov_address,
+            proposal_voter.app_id,
+            trigger_account,
+        ),
+        accounts=[delegation_registry_client.app_address, voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.trigger_vote_to_ledger", measurement)
+
+
+def test_delete_triggered_page(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+    proposal_voter: ProposalMockClient,
+    trigger_account: SigningAccount,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+    open_trigger_rewards(delegation_registry_client, trigger_account)
+    new_trigger_vote_to_ledger_group(
+        delegation_registry_client,
+        xgov_address,
+        proposal_voter.app_id,
+        trigger_account,
+    ).send()
+    proposal_voter.send.set_status(args=SetStatusArgs(status=prop_cfg.STATUS_APPROVED))
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().delete_triggered_page(
+            args=DeleteTriggeredPageArgs(
+                proposal_id=proposal_voter.app_id,
+                page=voter.state.global_state.index // regcfg.TRIGGERED_PAGE_BITS,
+            ),
+            params=CommonAppCallParams(sender=trigger_account.address),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.delete_triggered_page", measurement)
+
+
+def test_open_trigger_rewards(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+    trigger_account: SigningAccount,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().open_trigger_rewards(
+            args=OpenTriggerRewardsArgs(
+                payment=algorand_client.create_transaction.payment(
+                    PaymentParams(
+                        sender=trigger_account.address,
+                        receiver=delegation_registry_client.app_address,
+                        amount=AlgoAmount(micro_algo=get_trigger_rewards_mbr()),
+                    )
+                ),
+            ),
+            params=CommonAppCallParams(sender=trigger_account.address),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.open_trigger_rewards", measurement)
+
+
+def test_claim_trigger_rewards(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+    proposal_voter: ProposalMockClient,
+    trigger_account: SigningAccount,
+) -> None:
+    open_trigger_rewards(delegation_registry_client, trigger_account)
+    new_trigger_vote_to_ledger_group(
+        delegation_registry_client,
+        voter.state.global_state.xgov_address,
+        proposal_voter.app_id,
+        trigger_account,
+    ).send()
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().claim_trigger_rewards(
+            params=CommonAppCallParams(
+                sender=trigger_account.address,
+                extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.claim_trigger_rewards", measurement)
+
+
+def test_close_trigger_rewards(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+    trigger_account: SigningAccount,
+) -> None:
+    open_trigger_rewards(delegation_registry_client, trigger_account)
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().close_trigger_rewards(
+            params=CommonAppCallParams(
+                sender=trigger_account.address,
+                extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.close_trigger_rewards", measurement)
+
+
+def test_unregister_voter(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().unregister_voter(
+            args=UnregisterVoterArgs(xgov_address=xgov_address),
+            params=CommonAppCallParams(
+                sender=xgov_address,
+                extra_fee=AlgoAmount(micro_algo=6 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.unregister_voter", measurement)
+
+
+def test_register_representative(
+    algorand_client: AlgorandClient,
+    no_role_account: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    pay_amount = (
+        get_sc_representative_mbr()
+        + delegation_registry_client.state.global_state.representative_fee
+    )
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().register_representative(
+            args=RegisterRepresentativeArgs(
+                payment=algorand_client.create_transaction.payment(
+                    PaymentParams(
+                        sender=no_role_account.address,
+                        receiver=delegation_registry_client.app_address,
+                        amount=AlgoAmount(micro_algo=pay_amount),
+                    )
+                ),
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address,
+                extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.register_representative", measurement)
+
+
+def test_unregister_representative(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    representative_address = representative.state.global_state.representative_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().unregister_representative(
+            params=CommonAppCallParams(
+                sender=representative_address,
+                extra_fee=AlgoAmount(micro_algo=3 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.unregister_representative", measurement)
+
+
+def test_get_voter_app_id(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().get_voter_app_id(
+            args=GetVoterAppIdArgs(xgov_address=xgov_address)
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.get_voter_app_id", measurement)
+
+
+def test_get_representative_app_id(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    representative_address = representative.state.global_state.representative_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().get_representative_app_id(
+            args=GetRepresentativeAppIdArgs(
+                representative_address=representative_address
+            )
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.get_representative_app_id", measurement)
+
+
+def test_get_voter_app_ids(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+    no_role_account: SigningAccount,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().get_voter_app_ids(
+            args=GetVoterAppIdsArgs(
+                xgov_addresses=[xgov_address, no_role_account.address]
+            )
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.get_voter_app_ids", measurement)
+
+
+def test_get_representative_app_ids(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    delegation_registry_client: DelegationRegistryClient,
+    no_role_account: SigningAccount,
+) -> None:
+    representative_address = representative.state.global_state.representative_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: delegation_registry_client.new_group().get_representative_app_ids(
+            args=GetRepresentativeAppIdsArgs(
+                representative_addresses=[
+                    representative_address,
+                    no_role_account.address,
+                ]
+            )
+        ),
+        accounts=[delegation_registry_client.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.get_representative_app_ids", measurement)
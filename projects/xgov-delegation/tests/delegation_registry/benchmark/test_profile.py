@@ -0,0 +1,77 @@
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    SigningAccount,
+)
+from algosdk.v2client.models import SimulateTraceConfig
+from artifacts.proposal_mock.proposal_mock_client import ProposalMockClient
+from artifacts.representative.representative_client import RepresentativeClient
+from artifacts.voter.voter_client import VoterClient
+from artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    XgovRegistryMockClient,
+)
+from common.profiler import (
+    ARTIFACTS_PATH,
+    SMART_CONTRACTS_PATH,
+    Profiler,
+    load_program_map,
+)
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+    TriggerVoteArgs,
+)
+from smart_contracts.common import constants as const
+
+
+def test_program_maps_resolve_to_sources() -> None:
+    for path in ARTIFACTS_PATH.glob("*/*.approval.puya.map"):
+        program_map = load_program_map(path)
+
+        assert program_map.locations
+        assert program_map.ops
+        for location in set(program_map.locations.values()):
+            assert (SMART_CONTRACTS_PATH / location.source).is_file()
+
+
+def test_profile_trigger_vote(
+    algorand_client: AlgorandClient,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    delegation_registry_client: DelegationRegistryClient,
+    voter: VoterClient,
+    representative: RepresentativeClient,
+    proposal_voter: ProposalMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    profiler = Profiler(algorand_client)
+    profiler.add_app(delegation_registry_client.app_id, "DelegationRegistry")
+    profiler.add_app(voter.app_id, "Voter")
+    profiler.add_app(representative.app_id, "Representative")
+    profiler.add_app(proposal_voter.app_id, "ProposalMock")
+    profiler.add_app(xgov_registry_mock_client.app_id, "XgovRegistryMock")
+
+    simulated = (
+        delegation_registry_client.new_group()
+        .trigger_vote(
+            args=TriggerVoteArgs(
+                xgov_address=voter.state.global_state.xgov_address,
+                proposal_id=proposal_voter.app_id,
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address,
+                extra_fee=AlgoAmount(micro_algo=6 * const.MIN_FEE),
+            ),
+        )
+        .simulate(
+            allow_unnamed_resources=True,
+            exec_trace_config=SimulateTraceConfig(enable=True),
+        )
+    )
+    assert simulated.simulate_response is not None
+
+    profile = profiler.profile(simulated.simulate_response)
+    print(profile.report())  # run with `-s` to see the hot spots
+
+    assert not profile.unknown_programs
+    assert profile.total == profile.budget_consumed
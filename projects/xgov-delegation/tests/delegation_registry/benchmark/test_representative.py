@@ -0,0 +1,166 @@
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    PaymentParams,
+    SigningAccount,
+)
+from artifacts.proposal_mock.proposal_mock_client import ProposalMockClient
+from artifacts.representative.representative_client import (
+    DeleteVoteArgs,
+    GetVoteArgs,
+    GetVoteBoxArgs,
+    GetVotesArgs,
+    PublishVoteArgs,
+    RepresentativeClient,
+    Vote,
+)
+from common.helpers import get_vote_mbr
+
+from smart_contracts.common import constants as const
+from tests.delegation_registry.benchmark.common import assert_no_regression, measure
+
+# Methods callable only by the Delegation Registry (create, update, sync_xgov_registry and delete)
+# are benchmarked through the registry methods that call them, e.g. sync_xgov_registry
+# through update_representative.
+CONTRACT = "Representative"
+
+
+def test_pause(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+) -> None:
+    sender = representative.state.global_state.representative_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: representative.new_group().pause(
+            params=CommonAppCallParams(sender=sender),
+        ),
+        accounts=[representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.pause", measurement)
+
+
+def test_resume(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+) -> None:
+    sender = representative.state.global_state.representative_address
+    representative.send.pause(params=CommonAppCallParams(sender=sender))
+
+    measurement = measure(
+        algorand_client,
+        lambda: representative.new_group().resume(
+            params=CommonAppCallParams(sender=sender),
+        ),
+        accounts=[representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.resume", measurement)
+
+
+def test_publish_vote(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    proposal_mock_client: ProposalMockClient,
+) -> None:
+    sender = representative.state.global_state.representative_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: representative.new_group().publish_vote(
+            args=PublishVoteArgs(
+                payment=algorand_client.create_transaction.payment(
+                    PaymentParams(
+                        sender=sender,
+                        receiver=representative.app_address,
+                        amount=AlgoAmount(micro_algo=get_vote_mbr()),
+                    )
+                ),
+                proposal_id=proposal_mock_client.app_id,
+                vote=Vote(approval=const.PPM, rejection=0),
+            ),
+            params=CommonAppCallParams(sender=sender),
+        ),
+        accounts=[representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.publish_vote", measurement)
+
+
+def test_delete_vote(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    proposal_voter: ProposalMockClient,
+) -> None:
+    sender = representative.state.global_state.representative_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: representative.new_group().delete_vote(
+            args=DeleteVoteArgs(proposal_id=proposal_voter.app_id),
+            params=CommonAppCallParams(
+                sender=sender,
+                extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            ),
+        ),
+        accounts=[representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.delete_vote", measurement)
+
+
+def test_get_vote_box(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    proposal_voter: ProposalMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: representative.new_group().get_vote_box(
+            args=GetVoteBoxArgs(proposal_id=proposal_voter.app_id),
+            params=CommonAppCallParams(sender=no_role_account.address),
+        ),
+        accounts=[representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.get_vote_box", measurement)
+
+
+def test_get_vote(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    proposal_voter: ProposalMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: representative.new_group().get_vote(
+            args=GetVoteArgs(proposal_id=proposal_voter.app_id),
+            params=CommonAppCallParams(sender=no_role_account.address),
+        ),
+        accounts=[representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.get_vote", measurement)
+
+
+def test_get_votes(
+    algorand_client: AlgorandClient,
+    representative: RepresentativeClient,
+    proposal_voter: ProposalMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: representative.new_group().get_votes(
+            args=GetVotesArgs(proposal_ids=[proposal_voter.app_id]),
+            params=CommonAppCallParams(sender=no_role_account.address),
+        ),
+        accounts=[representative.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.get_votes", measurement)
@@ -0,0 +1,179 @@
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    SigningAccount,
+)
+from artifacts.proposal_mock.proposal_mock_client import (
+    ProposalMockClient,
+    SetVoterBoxArgs,
+)
+from artifacts.representative.representative_client import RepresentativeClient
+from artifacts.voter.voter_client import (
+    SetBackupRepresentativesArgs,
+    SetManagerArgs,
+    SetRepresentativeArgs,
+    SetWindowArgs,
+    VoteDirectArgs,
+    VoteRaw,
+    VoterClient,
+    YieldVotingRightsArgs,
+)
+
+from smart_contracts.common import constants as const
+from smart_contracts.voter import config as voter_cfg
+from tests.delegation_registry.benchmark.common import assert_no_regression, measure
+
+# Methods callable only by the Delegation Registry (create, update, sync_xgov_registry, assign_xgov,
+# vote_representative, add_votes and delete) are benchmarked through the registry methods that
+# call them, e.g. sync_xgov_registry through update_voter.
+CONTRACT = "Voter"
+
+
+def test_set_manager(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    no_role_account: SigningAccount,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: voter.new_group().set_manager(
+            args=SetManagerArgs(manager_address=no_role_account.address),
+            params=CommonAppCallParams(sender=xgov_address),
+        ),
+        accounts=[voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.set_manager", measurement)
+
+
+def test_set_representative(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    representative: RepresentativeClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: voter.new_group().set_representative(
+            args=SetRepresentativeArgs(representative_id=representative.app_id),
+            params=CommonAppCallParams(sender=xgov_address),
+        ),
+        accounts=[voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.set_representative", measurement)
+
+
+def test_set_backup_representatives(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    representative: RepresentativeClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: voter.new_group().set_backup_representatives(
+            args=SetBackupRepresentativesArgs(
+                representative_ids=[representative.app_id]
+            ),
+            params=CommonAppCallParams(sender=xgov_address),
+        ),
+        accounts=[voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.set_backup_representatives", measurement)
+
+
+def test_set_window(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: voter.new_group().set_window(
+            args=SetWindowArgs(window_ts=voter_cfg.DEFAULT_WINDOW_TS),
+            params=CommonAppCallParams(sender=xgov_address),
+        ),
+        accounts=[voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.set_window", measurement)
+
+
+def test_vote_direct(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    proposal_mock_client: ProposalMockClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+    votes = 42
+    proposal_mock_client.send.set_voter_box(
+        args=SetVoterBoxArgs(
+            voter_address=xgov_address,
+            votes=votes,
+        )
+    )
+
+    measurement = measure(
+        algorand_client,
+        lambda: voter.new_group().vote_direct(
+            args=VoteDirectArgs(
+                proposal_id=proposal_mock_client.app_id,
+                vote=VoteRaw(approvals=votes, rejections=0),
+            ),
+            params=CommonAppCallParams(
+                sender=xgov_address,
+                extra_fee=AlgoAmount(micro_algo=3 * const.MIN_FEE),
+            ),
+        ),
+        accounts=[voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.vote_direct", measurement)
+
+
+def test_yield_voting_rights(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+
+    measurement = measure(
+        algorand_client,
+        lambda: voter.new_group().yield_voting_rights(
+            args=YieldVotingRightsArgs(voting_address=xgov_address),
+            params=CommonAppCallParams(
+                sender=xgov_address,
+                extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            ),
+        ),
+        accounts=[voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.yield_voting_rights", measurement)
+
+
+def test_sync_voting_address(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    no_role_account: SigningAccount,
+) -> None:
+    measurement = measure(
+        algorand_client,
+        lambda: voter.new_group().sync_voting_address(
+            params=CommonAppCallParams(
+                sender=no_role_account.address,
+                extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            ),
+        ),
+        accounts=[voter.app_address],
+    )
+
+    assert_no_regression(f"{CONTRACT}.sync_voting_address", measurement)
@@ -1,6 +1,39 @@
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AppClientCompilationParams,
+    CommonAppCallParams,
+    PaymentParams,
+    SigningAccount,
+)
+
 from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    ConfigDelegationRegistryArgs,
+    CreateArgs,
     DelegationRegistryClient,
+    DelegationRegistryFactory,
+    Fees,
+    InitContractArgs,
+    LoadContractArgs,
+    OpenTriggerRewardsArgs,
+    PrepareVoterArgs,
+    SetManagerArgs,
+)
+from smart_contracts.artifacts.representative.representative_client import (
+    RepresentativeFactory,
+)
+from smart_contracts.artifacts.voter.voter_client import VoterFactory
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    XgovRegistryMockClient,
+)
+from smart_contracts.common import constants as const
+from smart_contracts.common.helpers import (
+    get_sc_voter_unassigned_mbr,
+    get_trigger_rewards_mbr,
+    load_sc_data_size_per_transaction,
 )
+from smart_contracts.delegation_registry import config as regcfg
+from tests.common import INITIAL_FUNDS
 
 
 def assert_registry_config(
@@ -24,3 +57,200 @@ def assert_registry_config(
     assert global_state.paused_registry == paused_registry
     assert global_state.votes_left == votes_left
     assert global_state.trigger_fund == trigger_fund
+
+
+def load_approval_program(
+    delegation_registry_client: DelegationRegistryClient,
+    contract: bytes,
+    approval_program: bytes,
+) -> None:
+    """
+    Store the approval program of a contract in the Delegation Registry, in chunks fitting
+    the app args of a transaction.
+
+    Args:
+        delegation_registry_client (DelegationRegistryClient): Delegation Registry client
+        contract (bytes): Box name of the contract, e.g. `regcfg.CONTRACT_VOTER_BOX`
+        approval_program (bytes): Compiled approval program
+    """
+    delegation_registry_client.send.init_contract(
+        args=InitContractArgs(
+            contract=contract,
+            size=len(approval_program),
+        ),
+    )
+
+    data_size_per_transaction = load_sc_data_size_per_transaction()
+    bulks = 1 + len(approval_program) // data_size_per_transaction
+    for i in range(bulks):
+        chunk = approval_program[
+            i * data_size_per_transaction : (i + 1) * data_size_per_transaction
+        ]
+        delegation_registry_client.send.load_contract(
+            args=LoadContractArgs(
+                contract=contract,
+                offset=i * data_size_per_transaction,
+                data=chunk,
+            ),
+        )
+
+
+def reset_delegation_registry(
+    algorand_client: AlgorandClient,
+    delegation_registry_client: DelegationRegistryClient,
+    manager: SigningAccount,
+) -> None:
+    """
+    Restore the manager, configuration and activity of a Delegation Registry shared
+    among tests. Voters, representatives and votes are not reset: tests sharing the
+    registry are isolated by using fresh accounts and proposals.
+
+    Args:
+        algorand_client (AlgorandClient): Algorand client holding the signers of the accounts
+        delegation_registry_client (DelegationRegistryClient): Shared Delegation Registry client
+        manager (SigningAccount): Manager of the Delegation Registry
+    """
+    global_state = delegation_registry_client.state.global_state
+
+    if global_state.manager_address != manager.address:
+        delegation_registry_client.send.set_manager(
+            args=SetManagerArgs(manager=manager.address),
+            params=CommonAppCallParams(sender=global_state.manager_address),
+        )
+
+    if (
+        global_state.vote_fees.xgov != regcfg.FEE_VOTE_XGOV
+        or global_state.vote_fees.other != regcfg.FEE_VOTE_OTHER
+        or global_state.representative_fee != regcfg.FEE_REPRESENTATIVE
+        or global_state.vote_trigger_award != regcfg.VOTE_TRIGGER_AWARD
+    ):
+        # The trigger fund of the restored configuration must be covered
+        algorand_client.account.ensure_funded_from_environment(
+            account_to_fund=delegation_registry_client.app_address,
+            min_spending_balance=INITIAL_FUNDS,
+        )
+        delegation_registry_client.send.config_delegation_registry(
+            args=ConfigDelegationRegistryArgs(
+                vote_fees=Fees(
+                    xgov=regcfg.FEE_VOTE_XGOV,
+                    other=regcfg.FEE_VOTE_OTHER,
+                ),
+                representative_fee=regcfg.FEE_REPRESENTATIVE,
+                vote_trigger_award=regcfg.VOTE_TRIGGER_AWARD,
+            ),
+            params=CommonAppCallParams(sender=manager.address),
+        )
+
+    if global_state.paused_registry:
+        delegation_registry_client.send.resume_registry(
+            params=CommonAppCallParams(sender=manager.address),
+        )
+
+
+def deploy_delegation_registry(
+    algorand_client: AlgorandClient,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    deployer: SigningAccount,
+) -> DelegationRegistryClient:
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=deployer,
+        min_spending_balance=INITIAL_FUNDS,
+    )
+
+    factory = algorand_client.client.get_typed_app_factory(
+        typed_factory=DelegationRegistryFactory,
+        default_sender=deployer.address,
+        compilation_params=AppClientCompilationParams(
+            deploy_time_params={"entropy": b""}
+        ),
+    )
+    client, _ = factory.send.create.create(
+        args=CreateArgs(xgov_registry_id=xgov_registry_mock_client.app_id)
+    )
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=client.app_address,
+        min_spending_balance=INITIAL_FUNDS,
+    )
+
+    return client
+
+
+def initialize_delegation_registry(
+    algorand_client: AlgorandClient,
+    client: DelegationRegistryClient,
+    deployer: SigningAccount,
+) -> None:
+    client.send.config_delegation_registry(
+        args=ConfigDelegationRegistryArgs(
+            vote_fees=Fees(
+                xgov=regcfg.FEE_VOTE_XGOV,
+                other=regcfg.FEE_VOTE_OTHER,
+            ),
+            representative_fee=regcfg.FEE_REPRESENTATIVE,
+            vote_trigger_award=regcfg.VOTE_TRIGGER_AWARD,
+        )
+    )
+
+    # Load Representative SC
+    representative_factory = algorand_client.client.get_typed_app_factory(
+        typed_factory=RepresentativeFactory,
+    )
+    load_approval_program(
+        client,
+        regcfg.CONTRACT_REPRESENTATIVE_BOX,
+        representative_factory.app_factory.compile().approval_program,
+    )
+
+    # Load Voter SC
+    voter_factory = algorand_client.client.get_typed_app_factory(
+        typed_factory=VoterFactory,
+    )
+    load_approval_program(
+        client,
+        regcfg.CONTRACT_VOTER_BOX,
+        voter_factory.app_factory.compile().approval_program,
+    )
+
+    # Prepare first voter
+    prepare_voter(algorand_client, client, deployer)
+
+    # Resume registry
+    client.send.resume_registry()
+
+
+def prepare_voter(
+    algorand_client: AlgorandClient,
+    client: DelegationRegistryClient,
+    sender: SigningAccount,
+) -> None:
+    pay_txn = algorand_client.create_transaction.payment(
+        PaymentParams(
+            sender=sender.address,
+            receiver=client.app_address,
+            amount=AlgoAmount(micro_algo=get_sc_voter_unassigned_mbr()),
+        )
+    )
+    client.send.prepare_voter(
+        args=PrepareVoterArgs(payment=pay_txn),
+        params=CommonAppCallParams(
+            sender=sender.address,
+            extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+        ),
+    )
+
+
+def open_trigger_rewards(
+    client: DelegationRegistryClient,
+    sender: SigningAccount,
+) -> None:
+    pay_txn = client.algorand.create_transaction.payment(
+        PaymentParams(
+            sender=sender.address,
+            receiver=client.app_address,
+            amount=AlgoAmount(micro_algo=get_trigger_rewards_mbr()),
+        )
+    )
+    client.send.open_trigger_rewards(
+        args=OpenTriggerRewardsArgs(payment=pay_txn),
+        params=CommonAppCallParams(sender=sender.address),
+    )
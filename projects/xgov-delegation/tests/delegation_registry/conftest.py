@@ -1,8 +1,9 @@
+from collections.abc import Iterator
+
 import pytest
 from algokit_utils import (
     AlgoAmount,
     AlgorandClient,
-    AppClientCompilationParams,
     CommonAppCallParams,
     PaymentParams,
     SigningAccount,
@@ -11,21 +12,12 @@ from algokit_utils.config import config
 from common.helpers import (
     get_sc_representative_mbr,
     get_sc_voter_mbr,
-    get_sc_voter_unassigned_mbr,
     get_vote_mbr,
-    load_sc_data_size_per_transaction,
 )
 
 from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
     AddVotesArgs,
-    ConfigDelegationRegistryArgs,
-    CreateArgs,
     DelegationRegistryClient,
-    DelegationRegistryFactory,
-    Fees,
-    InitContractArgs,
-    LoadContractArgs,
-    PrepareVoterArgs,
     RegisterRepresentativeArgs,
     RegisterVoterArgs,
 )
@@ -39,14 +31,12 @@ from smart_contracts.artifacts.proposal_mock.proposal_mock_client import (
 from smart_contracts.artifacts.representative.representative_client import (
     PublishVoteArgs,
     RepresentativeClient,
-    RepresentativeFactory,
     Vote,
 )
 from smart_contracts.artifacts.voter.voter_client import (
     SetRepresentativeArgs,
     SetWindowArgs,
     VoterClient,
-    VoterFactory,
 )
 from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
     SetVotingAccountArgs,
@@ -57,13 +47,19 @@ from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client impo
 )
 from smart_contracts.common import constants as const
 from smart_contracts.common.helpers import get_available_voter
-from smart_contracts.delegation_registry import config as regcfg
 from smart_contracts.voter import config as voter_cfg
 from tests.common import (
     DEFAULT_PROPOSAL_STATUS,
     DEFAULT_PROPOSAL_VOTE_OPEN_TS,
     DEFAULT_VOTING_DURATION,
     INITIAL_FUNDS,
+    AccountPool,
+)
+from tests.delegation_registry.common import (
+    deploy_delegation_registry,
+    initialize_delegation_registry,
+    prepare_voter,
+    reset_delegation_registry,
 )
 
 
@@ -132,123 +128,52 @@ def delegation_registry_client_uninitialized(
     xgov_registry_mock_client: XgovRegistryMockClient,
     deployer: SigningAccount,
 ) -> DelegationRegistryClient:
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=deployer,
-        min_spending_balance=INITIAL_FUNDS,
+    return deploy_delegation_registry(
+        algorand_client, xgov_registry_mock_client, deployer
     )
 
-    factory = algorand_client.client.get_typed_app_factory(
-        typed_factory=DelegationRegistryFactory,
-        default_sender=deployer.address,
-        compilation_params=AppClientCompilationParams(
-            deploy_time_params={"entropy": b""}
-        ),
-    )
-    client, _ = factory.send.create.create(
-        args=CreateArgs(xgov_registry_id=xgov_registry_mock_client.app_id)
-    )
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=client.app_address,
-        min_spending_balance=INITIAL_FUNDS,
+
+@pytest.fixture(scope="session")
+def delegation_registry_client_snapshot(
+    algorand_client: AlgorandClient,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    deployer: SigningAccount,
+) -> DelegationRegistryClient:
+    # Session scoped, i.e. deployed and loaded once per pytest-xdist worker
+    client = deploy_delegation_registry(
+        algorand_client, xgov_registry_mock_client, deployer
     )
+    initialize_delegation_registry(algorand_client, client, deployer)
 
     return client
 
 
 @pytest.fixture(scope="function")
 def delegation_registry_client(
+    request: pytest.FixtureRequest,
     algorand_client: AlgorandClient,
-    delegation_registry_client_uninitialized: DelegationRegistryClient,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    delegation_registry_client_snapshot: DelegationRegistryClient,
     deployer: SigningAccount,
-) -> DelegationRegistryClient:
-    client = delegation_registry_client_uninitialized
-
-    client.send.config_delegation_registry(
-        args=ConfigDelegationRegistryArgs(
-            vote_fees=Fees(
-                xgov=regcfg.FEE_VOTE_XGOV,
-                other=regcfg.FEE_VOTE_OTHER,
-            ),
-            representative_fee=regcfg.FEE_REPRESENTATIVE,
-            vote_trigger_award=regcfg.VOTE_TRIGGER_AWARD,
+) -> Iterator[DelegationRegistryClient]:
+    if request.node.get_closest_marker("fresh_registry"):
+        # Tests replacing the loaded programs or relying on the exact registry balance
+        client = deploy_delegation_registry(
+            algorand_client, xgov_registry_mock_client, deployer
         )
-    )
+        initialize_delegation_registry(algorand_client, client, deployer)
+        yield client
+        return
 
-    # Load Representative SC
-    representative_factory = algorand_client.client.get_typed_app_factory(
-        typed_factory=RepresentativeFactory,
-    )
+    client = delegation_registry_client_snapshot
 
-    compiled_sc = representative_factory.app_factory.compile()
+    # Previous tests may have consumed the unassigned Voters
+    if get_available_voter(algorand_client, client) is None:
+        prepare_voter(algorand_client, client, deployer)
 
-    delegation_registry_client_uninitialized.send.init_contract(
-        args=InitContractArgs(
-            contract=regcfg.CONTRACT_REPRESENTATIVE_BOX,
-            size=len(compiled_sc.approval_program),
-        ),
-    )
+    yield client
 
-    data_size_per_transaction = load_sc_data_size_per_transaction()
-    bulks = 1 + len(compiled_sc.approval_program) // data_size_per_transaction
-    for i in range(bulks):
-        chunk = compiled_sc.approval_program[
-            i * data_size_per_transaction : (i + 1) * data_size_per_transaction
-        ]
-        delegation_registry_client_uninitialized.send.load_contract(
-            args=LoadContractArgs(
-                contract=regcfg.CONTRACT_REPRESENTATIVE_BOX,
-                offset=i * data_size_per_transaction,
-                data=chunk,
-            ),
-        )
-
-    # Load Voter SC
-    voter_factory = algorand_client.client.get_typed_app_factory(
-        typed_factory=VoterFactory,
-    )
-
-    compiled_sc = voter_factory.app_factory.compile()
-
-    delegation_registry_client_uninitialized.send.init_contract(
-        args=InitContractArgs(
-            contract=regcfg.CONTRACT_VOTER_BOX,
-            size=len(compiled_sc.approval_program),
-        ),
-    )
-
-    data_size_per_transaction = load_sc_data_size_per_transaction()
-    bulks = 1 + len(compiled_sc.approval_program) // data_size_per_transaction
-    for i in range(bulks):
-        chunk = compiled_sc.approval_program[
-            i * data_size_per_transaction : (i + 1) * data_size_per_transaction
-        ]
-        delegation_registry_client_uninitialized.send.load_contract(
-            args=LoadContractArgs(
-                contract=regcfg.CONTRACT_VOTER_BOX,
-                offset=i * data_size_per_transaction,
-                data=chunk,
-            ),
-        )
-
-    # Prepare first voter
-    pay_txn = algorand_client.create_transaction.payment(
-        PaymentParams(
-            sender=deployer.address,
-            receiver=client.app_address,
-            amount=AlgoAmount(micro_algo=get_sc_voter_unassigned_mbr()),
-        )
-    )
-    client.send.prepare_voter(
-        args=PrepareVoterArgs(payment=pay_txn),
-        params=CommonAppCallParams(
-            extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
-        ),
-    )
-
-    # Resume registry
-    client.send.resume_registry()
-
-    return client
+    reset_delegation_registry(algorand_client, client, deployer)
 
 
 @pytest.fixture(scope="function")
@@ -268,12 +193,9 @@ def delegation_registry_client_paused(
 def xgov(
     algorand_client: AlgorandClient,
     xgov_registry_mock_client: XgovRegistryMockClient,
+    account_pool: AccountPool,
 ) -> SigningAccount:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
 
     xgov_registry_mock_client.send.set_xgov_box(
         args=SetXgovBoxArgs(
@@ -295,12 +217,9 @@ def xgov_delegated(
     algorand_client: AlgorandClient,
     voting_account: SigningAccount,
     xgov_registry_mock_client: XgovRegistryMockClient,
+    account_pool: AccountPool,
 ) -> SigningAccount:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
 
     xgov_registry_mock_client.send.set_xgov_box(
         args=SetXgovBoxArgs(
@@ -317,6 +236,13 @@ def xgov_delegated(
     return account
 
 
+@pytest.fixture(scope="function")
+def trigger_account(account_pool: AccountPool) -> SigningAccount:
+    # Trigger rewards ledgers outlive the tests on the shared registry, so each test
+    # opens its ledger for an account of its own
+    return account_pool.take()
+
+
 @pytest.fixture(scope="function")
 def voter(
     algorand_client: AlgorandClient,
@@ -420,12 +346,9 @@ def voter(
 def representative(
     algorand_client: AlgorandClient,
     delegation_registry_client: DelegationRegistryClient,
+    account_pool: AccountPool,
 ) -> RepresentativeClient:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
     representative_address = account.address
 
     pay_amount = (
@@ -0,0 +1,83 @@
+from algokit_utils import AlgorandClient, CommonAppCallParams, SigningAccount
+from artifacts.proposal_mock.proposal_mock_client import ProposalMockClient
+from artifacts.representative.representative_client import (
+    GetVotesArgs,
+    RepresentativeClient,
+    Vote,
+)
+
+from smart_contracts.common.helpers import get_representative_votes
+
+
+def test_get_votes_success(
+    representative_vote: RepresentativeClient,
+    proposal_mock_client: ProposalMockClient,
+    proposal_fake_client: ProposalMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    result = representative_vote.send.get_votes(
+        args=GetVotesArgs(
+            proposal_ids=[proposal_mock_client.app_id, proposal_fake_client.app_id]
+        ),
+        params=CommonAppCallParams(
+            sender=no_role_account.address,
+        ),
+    )
+
+    state_vote = representative_vote.state.box.proposals_vote_box.get_value(
+        proposal_mock_client.app_id
+    )
+
+    assert result.abi_return == [
+        [[state_vote.approval, state_vote.rejection], True],
+        [[0, 0], False],
+    ]
+
+
+def test_get_votes_paused_success(
+    representative_vote: RepresentativeClient,
+    proposal_mock_client: ProposalMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    representative_vote.send.pause(
+        params=CommonAppCallParams(
+            sender=representative_vote.state.global_state.representative_address,
+        ),
+    )
+
+    result = representative_vote.send.get_votes(
+        args=GetVotesArgs(proposal_ids=[proposal_mock_client.app_id]),
+        params=CommonAppCallParams(
+            sender=no_role_account.address,
+        ),
+    )
+    [[_, valid]] = result.abi_return
+
+    assert not valid
+
+
+def test_get_representative_votes_helper_success(
+    algorand_client: AlgorandClient,
+    representative_vote: RepresentativeClient,
+    proposal_mock_client: ProposalMockClient,
+    proposal_fake_client: ProposalMockClient,
+) -> None:
+    # More proposals than fit in one call
+    proposal_ids = [proposal_fake_client.app_id] * 10 + [proposal_mock_client.app_id]
+
+    votes = get_representative_votes(
+        algorand_client, [representative_vote.app_id], proposal_ids
+    )
+
+    state_vote = representative_vote.state.box.proposals_vote_box.get_value(
+        proposal_mock_client.app_id
+    )
+    assert votes == {
+        representative_vote.app_id: {
+            proposal_fake_client.app_id: (Vote(approval=0, rejection=0), False),
+            proposal_mock_client.app_id: (
+                Vote(approval=state_vote.approval, rejection=state_vote.rejection),
+                True,
+            ),
+        }
+    }
@@ -0,0 +1,40 @@
+from algokit_utils import AlgorandClient
+from artifacts.voter.voter_client import VoterClient
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    APP_SPEC,
+    DelegationRegistryClient,
+)
+from smart_contracts.common.box_reader import BoxMapType, get_box_map, iter_box_map
+
+
+def test_get_box_map_success(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    voters = get_box_map(
+        algorand_client, delegation_registry_client.app_id, APP_SPEC, "voters_box"
+    )
+
+    assert voters == delegation_registry_client.state.box.voters_box.get_map()
+    assert voters[voter.state.global_state.xgov_address] == voter.app_id
+
+
+def test_iter_box_map_batches_success(
+    algorand_client: AlgorandClient,
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    box_map = BoxMapType.from_spec(APP_SPEC, "voters_box")
+    voters = list(
+        iter_box_map(
+            algorand_client,
+            delegation_registry_client.app_id,
+            box_map,
+            batch_size=1,
+            concurrency=2,
+        )
+    )
+
+    assert dict(voters) == delegation_registry_client.state.box.voters_box.get_map()
@@ -0,0 +1,40 @@
+from algokit_utils import SigningAccount
+from artifacts.representative.representative_client import RepresentativeClient
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+    GetRepresentativeAppIdsArgs,
+)
+from smart_contracts.common.helpers import get_representative_app_ids
+
+
+def test_get_representative_app_ids_success(
+    representative: RepresentativeClient,
+    no_role_account: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    representative_address = representative.state.global_state.representative_address
+    result = delegation_registry_client.send.get_representative_app_ids(
+        args=GetRepresentativeAppIdsArgs(
+            representative_addresses=[representative_address, no_role_account.address]
+        )
+    )
+
+    assert result.abi_return == [(representative.app_id, True), (0, False)]
+
+
+def test_get_representative_app_ids_helper_success(
+    representative: RepresentativeClient,
+    no_role_account: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    representative_address = representative.state.global_state.representative_address
+    # More addresses than fit in one call
+    addresses = [no_role_account.address] * 10 + [representative_address]
+
+    app_ids = get_representative_app_ids(delegation_registry_client, addresses)
+
+    assert app_ids == {
+        no_role_account.address: 0,
+        representative_address: representative.app_id,
+    }
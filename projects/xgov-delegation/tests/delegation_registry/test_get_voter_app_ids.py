@@ -0,0 +1,45 @@
+from algokit_utils import SigningAccount
+from artifacts.voter.voter_client import VoterClient
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+    GetVoterAppIdsArgs,
+)
+from smart_contracts.common.helpers import get_voter_app_ids
+
+
+def test_get_voter_app_ids_success(
+    voter: VoterClient,
+    no_role_account: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+    result = delegation_registry_client.send.get_voter_app_ids(
+        args=GetVoterAppIdsArgs(xgov_addresses=[xgov_address, no_role_account.address])
+    )
+
+    assert result.abi_return == [(voter.app_id, True), (0, False)]
+
+
+def test_get_voter_app_ids_empty_success(
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    result = delegation_registry_client.send.get_voter_app_ids(
+        args=GetVoterAppIdsArgs(xgov_addresses=[])
+    )
+
+    assert result.abi_return == []
+
+
+def test_get_voter_app_ids_helper_success(
+    voter: VoterClient,
+    no_role_account: SigningAccount,
+    delegation_registry_client: DelegationRegistryClient,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+    # More addresses than fit in one call
+    addresses = [no_role_account.address] * 10 + [xgov_address]
+
+    app_ids = get_voter_app_ids(delegation_registry_client, addresses)
+
+    assert app_ids == {no_role_account.address: 0, xgov_address: voter.app_id}
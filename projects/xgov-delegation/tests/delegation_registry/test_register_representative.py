@@ -15,18 +15,15 @@ from smart_contracts.artifacts.delegation_registry.delegation_registry_client im
 )
 from smart_contracts.common import constants as const
 from smart_contracts.errors import std_errors as err
-from tests.common import INITIAL_FUNDS
+from tests.common import AccountPool
 
 
 def test_register_representative_success(
     algorand_client: AlgorandClient,
     delegation_registry_client: DelegationRegistryClient,
+    account_pool: AccountPool,
 ) -> None:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
     representative_address = account.address
 
     pay_amount = (
@@ -78,12 +75,9 @@ def test_register_representative_success(
 def test_register_representative_paused_register(
     algorand_client: AlgorandClient,
     delegation_registry_client_paused: DelegationRegistryClient,
+    account_pool: AccountPool,
 ) -> None:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
     representative_address = account.address
 
     pay_amount = (
@@ -144,12 +138,9 @@ def test_register_representative_already_representative(
 def test_register_representative_wrong_receiver(
     algorand_client: AlgorandClient,
     delegation_registry_client: DelegationRegistryClient,
+    account_pool: AccountPool,
 ) -> None:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
     representative_address = account.address
 
     pay_amount = (
@@ -179,12 +170,9 @@ def test_register_representative_wrong_receiver(
 def test_register_representative_wrong_amount(
     algorand_client: AlgorandClient,
     delegation_registry_client: DelegationRegistryClient,
+    account_pool: AccountPool,
 ) -> None:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
     representative_address = account.address
 
     pay_amount = (
@@ -22,7 +22,7 @@ from smart_contracts.artifacts.delegation_registry.delegation_registry_client im
 from smart_contracts.common import constants as const
 from smart_contracts.common.helpers import get_available_voter
 from smart_contracts.errors import std_errors as err
-from tests.common import INITIAL_FUNDS
+from tests.common import AccountPool
 
 
 @pytest.mark.parametrize("account_role", ["xgov", "voting"])
@@ -91,12 +91,9 @@ def test_register_voter_already_assigned(
     delegation_registry_client: DelegationRegistryClient,
     xgov_registry_mock_client: XgovRegistryMockClient,
     voter: VoterClient,
+    account_pool: AccountPool,
 ) -> None:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
 
     xgov_registry_mock_client.send.set_xgov_box(
         args=SetXgovBoxArgs(
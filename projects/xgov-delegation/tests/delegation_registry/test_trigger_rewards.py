@@ -0,0 +1,131 @@
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+from artifacts.proposal_mock.proposal_mock_client import ProposalMockClient
+from artifacts.voter.voter_client import VoterClient
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+    GetVoterAppIdArgs,
+    TriggerVoteToLedgerArgs,
+)
+from smart_contracts.common import constants as const
+from smart_contracts.errors import std_errors as err
+from tests.delegation_registry.common import open_trigger_rewards
+
+
+def test_trigger_vote_to_ledger_and_claim(
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+    proposal_voter: ProposalMockClient,
+    trigger_account: SigningAccount,
+) -> None:
+    open_trigger_rewards(delegation_registry_client, trigger_account)
+    start_trigger_fund = delegation_registry_client.state.global_state.trigger_fund
+    award = delegation_registry_client.state.global_state.vote_trigger_award
+    xgov_address = voter.state.global_state.xgov_address
+
+    # The ledger box does not fit in the references of the trigger alone: a second call
+    # of the group shares its slots
+    delegation_registry_client.new_group().trigger_vote_to_ledger(
+        args=TriggerVoteToLedgerArgs(
+            xgov_address=xgov_address,
+            proposal_id=proposal_voter.app_id,
+        ),
+        params=CommonAppCallParams(
+            sender=trigger_account.address,
+            extra_fee=AlgoAmount(micro_algo=5 * const.MIN_FEE),
+        ),
+    ).get_voter_app_id(
+        args=GetVoterAppIdArgs(xgov_address=xgov_address),
+        params=CommonAppCallParams(sender=trigger_account.address),
+    ).send()
+
+    assert (
+        delegation_registry_client.state.box.trigger_rewards_box.get_value(
+            trigger_account.address
+        )
+        == award
+    )
+    assert delegation_registry_client.state.global_state.trigger_rewards == award
+    assert (
+        delegation_registry_client.state.global_state.trigger_fund == start_trigger_fund
+    )
+
+    start_balance = delegation_registry_client.algorand.account.get_information(
+        trigger_account.address
+    ).amount
+    result = delegation_registry_client.send.claim_trigger_rewards(
+        params=CommonAppCallParams(
+            sender=trigger_account.address,
+            extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+        ),
+    )
+    end_balance = delegation_registry_client.algorand.account.get_information(
+        trigger_account.address
+    ).amount
+
+    assert result.abi_return == award
+    assert (
+        end_balance.micro_algo == start_balance.micro_algo + award - 2 * const.MIN_FEE
+    )
+    assert delegation_registry_client.state.global_state.trigger_rewards == 0
+    assert (
+        delegation_registry_client.state.global_state.trigger_fund
+        == start_trigger_fund - award
+    )
+
+
+def test_close_trigger_rewards(
+    delegation_registry_client: DelegationRegistryClient,
+    trigger_account: SigningAccount,
+) -> None:
+    open_trigger_rewards(delegation_registry_client, trigger_account)
+
+    with pytest.raises(LogicError, match=err.TRIGGER_REWARDS_OPENED):
+        open_trigger_rewards(delegation_registry_client, trigger_account)
+
+    delegation_registry_client.send.close_trigger_rewards(
+        params=CommonAppCallParams(
+            sender=trigger_account.address,
+            extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+        ),
+    )
+
+    with pytest.raises(LogicError, match=err.NO_TRIGGER_REWARDS):
+        delegation_registry_client.send.claim_trigger_rewards(
+            params=CommonAppCallParams(sender=trigger_account.address),
+        )
+
+
+def test_trigger_vote_to_ledger_duplicate(
+    voter: VoterClient,
+    delegation_registry_client: DelegationRegistryClient,
+    proposal_voter: ProposalMockClient,
+    trigger_account: SigningAccount,
+) -> None:
+    open_trigger_rewards(delegation_registry_client, trigger_account)
+    xgov_address = voter.state.global_state.xgov_address
+
+    def send_trigger() -> None:
+        delegation_registry_client.new_group().trigger_vote_to_ledger(
+            args=TriggerVoteToLedgerArgs(
+                xgov_address=xgov_address,
+                proposal_id=proposal_voter.app_id,
+            ),
+            params=CommonAppCallParams(
+                sender=trigger_account.address,
+                extra_fee=AlgoAmount(micro_algo=5 * const.MIN_FEE),
+            ),
+        ).get_voter_app_id(
+            args=GetVoterAppIdArgs(xgov_address=xgov_address),
+            params=CommonAppCallParams(sender=trigger_account.address),
+        ).send()
+
+    send_trigger()
+    with pytest.raises(LogicError, match=err.ALREADY_TRIGGERED):
+        send_trigger()
@@ -23,6 +23,7 @@ from smart_contracts.delegation_registry import config as regcfg
 from smart_contracts.errors import std_errors as err
 
 
+@pytest.mark.fresh_registry
 def test_update_representative_success(
     algorand_client: AlgorandClient,
     representative: RepresentativeClient,
@@ -62,13 +63,17 @@ def test_update_representative_success(
             representative_address=representative.state.global_state.representative_address
         ),
         params=CommonAppCallParams(
-            extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
         ),
     )
 
     updated = algorand_client.app.get_by_id(representative.app_id)
 
     assert updated.approval_program == approval_program
+    assert (
+        representative.state.global_state.xgov_registry_app
+        == delegation_registry_client.state.global_state.xgov_registry_app
+    )
 
 
 def test_update_representative_not_manager(
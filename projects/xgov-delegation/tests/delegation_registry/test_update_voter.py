@@ -20,6 +20,7 @@ from smart_contracts.delegation_registry import config as regcfg
 from smart_contracts.errors import std_errors as err
 
 
+@pytest.mark.fresh_registry
 def test_update_voter_success(
     algorand_client: AlgorandClient,
     voter: VoterClient,
@@ -57,13 +58,17 @@ def test_update_voter_success(
     delegation_registry_client.send.update_voter(
         args=UpdateVoterArgs(xgov_address=voter.state.global_state.xgov_address),
         params=CommonAppCallParams(
-            extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+            extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
         ),
     )
 
     updated = algorand_client.app.get_by_id(voter.app_id)
 
     assert updated.approval_program == approval_program
+    assert (
+        voter.state.global_state.xgov_registry_app
+        == delegation_registry_client.state.global_state.xgov_registry_app
+    )
 
 
 def test_update_voter_not_manager(
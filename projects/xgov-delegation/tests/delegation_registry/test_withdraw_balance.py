@@ -62,6 +62,7 @@ def test_withdraw_balance_not_manager(
         )
 
 
+@pytest.mark.fresh_registry
 def test_withdraw_balance_insufficient_funds(
     delegation_registry_client: DelegationRegistryClient,
     voter: VoterClient,
@@ -15,19 +15,16 @@ from smart_contracts.artifacts.representative.representative_client import (
     RepresentativeClient,
 )
 from smart_contracts.common import constants as const
-from tests.common import INITIAL_FUNDS
+from tests.common import AccountPool
 
 
 @pytest.fixture(scope="function")
 def representative2(
     algorand_client: AlgorandClient,
     delegation_registry_client: DelegationRegistryClient,
+    account_pool: AccountPool,
 ) -> RepresentativeClient:
-    account = algorand_client.account.random()
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=account.address,
-        min_spending_balance=INITIAL_FUNDS,
-    )
+    account = account_pool.take()
     representative_address = account.address
 
     pay_amount = (
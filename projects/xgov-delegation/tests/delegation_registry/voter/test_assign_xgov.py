@@ -20,6 +20,7 @@ def test_assign_xgov_not_creator(
             args=AssignXgovArgs(
                 xgov_address=sender,
                 manager_address=sender,
+                voting_address=sender,
             ),
             params=CommonAppCallParams(
                 sender=sender,
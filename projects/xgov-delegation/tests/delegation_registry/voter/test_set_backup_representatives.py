@@ -0,0 +1,90 @@
+import pytest
+from algokit_utils import (
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+from artifacts.representative.representative_client import RepresentativeClient
+from artifacts.voter.voter_client import (
+    SetBackupRepresentativesArgs,
+    VoterClient,
+)
+from artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    XgovRegistryMockClient,
+)
+
+from smart_contracts.errors import std_errors as err
+from smart_contracts.voter import config as voter_cfg
+
+
+@pytest.mark.parametrize(
+    "role",
+    ["xgov", "manager"],
+)
+def test_set_backup_representatives_success(
+    voter: VoterClient,
+    representative: RepresentativeClient,
+    representative2: RepresentativeClient,
+    role: str,
+) -> None:
+    representative_ids = [representative2.app_id, representative.app_id]
+    if role == "xgov":
+        sender = voter.state.global_state.xgov_address
+    else:
+        sender = voter.state.global_state.manager_address
+
+    voter.send.set_backup_representatives(
+        args=SetBackupRepresentativesArgs(representative_ids=representative_ids),
+        params=CommonAppCallParams(
+            sender=sender,
+        ),
+    )
+
+    assert voter.state.global_state.backup_representatives == representative_ids
+
+
+def test_set_backup_representatives_unauthorized(
+    voter: VoterClient,
+    representative2: RepresentativeClient,
+    no_role_account: SigningAccount,
+) -> None:
+    with pytest.raises(LogicError, match=err.UNAUTHORIZED):
+        voter.send.set_backup_representatives(
+            args=SetBackupRepresentativesArgs(
+                representative_ids=[representative2.app_id]
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address,
+            ),
+        )
+
+
+def test_set_backup_representatives_too_many(
+    voter: VoterClient,
+    representative2: RepresentativeClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.TOO_MANY_BACKUP_REPRESENTATIVES):
+        voter.send.set_backup_representatives(
+            args=SetBackupRepresentativesArgs(
+                representative_ids=[representative2.app_id]
+                * (voter_cfg.MAX_BACKUP_REPRESENTATIVES + 1)
+            ),
+            params=CommonAppCallParams(
+                sender=voter.state.global_state.xgov_address,
+            ),
+        )
+
+
+def test_set_backup_representatives_unrelated_app(
+    voter: VoterClient,
+    xgov_registry_fake_client: XgovRegistryMockClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.UNRELATED_APP):
+        voter.send.set_backup_representatives(
+            args=SetBackupRepresentativesArgs(
+                representative_ids=[xgov_registry_fake_client.app_id]
+            ),
+            params=CommonAppCallParams(
+                sender=voter.state.global_state.xgov_address,
+            ),
+        )
@@ -0,0 +1,56 @@
+from algokit_utils import (
+    AlgoAmount,
+    CommonAppCallParams,
+    SigningAccount,
+)
+from algosdk.constants import ZERO_ADDRESS
+from artifacts.voter.voter_client import VoterClient
+from artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    DelXgovBoxArgs,
+    SetVotingAccountArgs,
+    XgovRegistryMockClient,
+)
+
+from smart_contracts.common import constants as const
+
+
+def test_sync_voting_address_success(
+    voter: VoterClient,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    xgov_address = voter.state.global_state.xgov_address
+    xgov_registry_mock_client.send.set_voting_account(
+        args=SetVotingAccountArgs(
+            xgov_address=xgov_address,
+            voting_address=no_role_account.address,
+        ),
+    )
+
+    voter.send.sync_voting_address(
+        params=CommonAppCallParams(
+            sender=no_role_account.address,
+            extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+        ),
+    )
+
+    assert voter.state.global_state.voting_address == no_role_account.address
+
+
+def test_sync_voting_address_not_xgov(
+    voter: VoterClient,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    no_role_account: SigningAccount,
+) -> None:
+    xgov_registry_mock_client.send.del_xgov_box(
+        args=DelXgovBoxArgs(xgov_address=voter.state.global_state.xgov_address),
+    )
+
+    voter.send.sync_voting_address(
+        params=CommonAppCallParams(
+            sender=no_role_account.address,
+            extra_fee=AlgoAmount(micro_algo=const.MIN_FEE),
+        ),
+    )
+
+    assert voter.state.global_state.voting_address == ZERO_ADDRESS
@@ -49,6 +49,7 @@ def test_yield_voting_rights_success(
         ).voting_address
         == new_voting_address
     )
+    assert voter.state.global_state.voting_address == new_voting_address
 
 
 def test_yield_voting_rights_unauthorized(
@@ -0,0 +1,390 @@
+"""
+Networks the throughput benchmark runs on: LocalNet, through the typed clients, and the
+`algorand-python-testing` emulator, calling the Python contracts directly.
+"""
+
+import random
+from typing import Final, Protocol
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+)
+from algopy import Account, Bytes, Global, UInt64, arc4
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    AddVotesArgs,
+    DelegationRegistryClient,
+    TriggerVoteArgs,
+)
+from smart_contracts.artifacts.representative.representative_client import (
+    PublishVoteArgs,
+    RepresentativeClient,
+    Vote,
+)
+from smart_contracts.common import abi_types as typ
+from smart_contracts.common import constants as const
+from smart_contracts.common.helpers import get_vote_mbr
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.proposal_mock.contract import ProposalMock
+from smart_contracts.representative.contract import Representative
+from smart_contracts.voter.contract import Voter
+from smart_contracts.xgov_registry_mock.contract import XgovRegistryMock
+from tests.common import (
+    DEFAULT_PROPOSAL_STATUS,
+    DEFAULT_PROPOSAL_VOTE_OPEN_TS,
+    DEFAULT_VOTING_DURATION,
+    INITIAL_FUNDS,
+)
+from tests.load.scenario import (
+    BOXES_PER_CALL,
+    POPULATE,
+    ScenarioConfig,
+    ScenarioGenerator,
+    chunked,
+)
+from tests.offline.common import (
+    deploy_delegation_registry,
+    initialize_delegation_registry,
+)
+from tests.offline.emulator import (
+    get_contract,
+    get_contracts,
+    get_last_contract,
+    pay,
+)
+
+ADD_VOTES: Final[str] = "add_votes"
+PUBLISH_VOTE: Final[str] = "publish_vote"
+TRIGGER_VOTE: Final[str] = "trigger_vote"
+
+# Extra fees of an operation covering its inner transactions, in MIN_FEE
+EXTRA_FEES: Final[dict[str, int]] = {
+    ADD_VOTES: 2,
+    PUBLISH_VOTE: 0,
+    TRIGGER_VOTE: 6,
+}
+
+# Outer transactions of an operation: an app call, grouped with a payment if any
+OUTER_TXNS: Final[dict[str, int]] = {
+    ADD_VOTES: 2,
+    PUBLISH_VOTE: 2,
+    TRIGGER_VOTE: 1,
+}
+
+
+def get_operation_fees(operation: str) -> int:
+    return (OUTER_TXNS[operation] + EXTRA_FEES[operation]) * const.MIN_FEE
+
+
+def get_fees(result: SendAtomicTransactionComposerResults) -> int:
+    return sum(txn.raw.fee for txn in result.transactions)
+
+
+class Backend(Protocol):
+    """
+    Network the benchmark runs on. Operations take the indexes of the xGovs,
+    Representatives and Proposals of the seeded fleet, return the fees paid in
+    microAlgos and raise on failure.
+    """
+
+    name: str
+    concurrency: int
+
+    def setup(self) -> None: ...
+
+    def add_votes(self, xgov: int, votes: int) -> int: ...
+
+    def publish_vote(self, representative: int, proposal: int) -> int: ...
+
+    def trigger_vote(self, xgov: int, proposal: int) -> int: ...
+
+
+class LocalnetBackend:
+    """Seed the fleet with the scenario generator and send the operations to LocalNet."""
+
+    name = "localnet"
+
+    def __init__(
+        self, algorand_client: AlgorandClient, scenario_config: ScenarioConfig
+    ) -> None:
+        self.algorand_client = algorand_client
+        self.config = scenario_config
+        self.concurrency = scenario_config.concurrency
+        self.generator = ScenarioGenerator(algorand_client, scenario_config)
+        self.rng = random.Random(scenario_config.seed)
+        self.triggerer = self.generator.account("triggerer", 0)
+
+    def setup(self) -> None:
+        scenario = self.generator.generate()
+        self.delegation_registry = (
+            self.algorand_client.client.get_typed_app_client_by_id(
+                typed_client=DelegationRegistryClient,
+                app_id=scenario.delegation_registry_app,
+            )
+        )
+        self.representatives = [
+            self.algorand_client.client.get_typed_app_client_by_id(
+                typed_client=RepresentativeClient,
+                app_id=scenario.representatives[account.address],
+                default_sender=account.address,
+            )
+            for account in self.generator.representatives
+        ]
+
+        votes = self.config.xgovs * self.config.proposals
+        self.generator.fund(
+            [self.generator.operator.address],
+            votes * regcfg.FEE_VOTE_OTHER
+            + self.config.xgovs * get_operation_fees(ADD_VOTES),
+        )
+        self.generator.fund(
+            [self.triggerer.address],
+            votes * get_operation_fees(TRIGGER_VOTE) + int(INITIAL_FUNDS.micro_algo),
+        )
+
+    def add_votes(self, xgov: int, votes: int) -> int:
+        operator = self.generator.operator.address
+        result = (
+            self.delegation_registry.new_group()
+            .add_votes(
+                args=AddVotesArgs(
+                    payment=self.algorand_client.create_transaction.payment(
+                        PaymentParams(
+                            sender=operator,
+                            receiver=self.delegation_registry.app_address,
+                            amount=AlgoAmount(micro_algo=votes * regcfg.FEE_VOTE_OTHER),
+                        )
+                    ),
+                    xgov_address=self.generator.xgovs[xgov].address,
+                    add_votes=votes,
+                ),
+                params=CommonAppCallParams(
+                    sender=operator,
+                    extra_fee=AlgoAmount(
+                        micro_algo=EXTRA_FEES[ADD_VOTES] * const.MIN_FEE
+                    ),
+                ),
+            )
+            .send(POPULATE)
+        )
+        return get_fees(result)
+
+    def publish_vote(self, representative: int, proposal: int) -> int:
+        client = self.representatives[representative]
+        sender = self.generator.representatives[representative].address
+        approval = self.rng.randint(0, const.PPM)
+        result = (
+            client.new_group()
+            .publish_vote(
+                args=PublishVoteArgs(
+                    payment=self.algorand_client.create_transaction.payment(
+                        PaymentParams(
+                            sender=sender,
+                            receiver=client.app_address,
+                            amount=AlgoAmount(micro_algo=get_vote_mbr()),
+                        )
+                    ),
+                    proposal_id=self.generator.scenario.proposals[proposal],
+                    vote=Vote(approval=approval, rejection=const.PPM - approval),
+                ),
+                params=CommonAppCallParams(sender=sender),
+            )
+            .send(POPULATE)
+        )
+        return get_fees(result)
+
+    def trigger_vote(self, xgov: int, proposal: int) -> int:
+        result = (
+            self.delegation_registry.new_group()
+            .trigger_vote(
+                args=TriggerVoteArgs(
+                    xgov_address=self.generator.xgovs[xgov].address,
+                    proposal_id=self.generator.scenario.proposals[proposal],
+                ),
+                params=CommonAppCallParams(
+                    sender=self.triggerer.address,
+                    extra_fee=AlgoAmount(
+                        micro_algo=EXTRA_FEES[TRIGGER_VOTE] * const.MIN_FEE
+                    ),
+                ),
+            )
+            .send(POPULATE)
+        )
+        return get_fees(result)
+
+
+class EmulatorBackend:
+    """
+    Seed the fleet through the mocks and call the contracts in the emulator.
+    The emulator context is not thread safe: operations run one at a time.
+    The latency is the execution time of the Python contracts, and the fees are the
+    ones the transactions would pay on the AVM.
+    """
+
+    name = "emulator"
+    concurrency = 1
+
+    def __init__(
+        self, context: AlgopyTestContext, scenario_config: ScenarioConfig
+    ) -> None:
+        self.context = context
+        self.config = scenario_config
+        self.rng = random.Random(scenario_config.seed)
+
+    def setup(self) -> None:
+        context = self.context
+        context.set_template_var("entropy", Bytes(b""))
+
+        self.operator = context.any.account()
+        self.triggerer = context.any.account()
+        self.xgovs = [context.any.account() for _ in range(self.config.xgovs)]
+        self.xgov_registry_mock = XgovRegistryMock()
+        self.delegation_registry = deploy_delegation_registry(
+            context, self.xgov_registry_mock
+        )
+        initialize_delegation_registry(
+            context, self.delegation_registry, context.default_sender
+        )
+
+        for entries in chunked(self.xgovs, BOXES_PER_CALL):
+            self.xgov_registry_mock.set_xgov_boxes(
+                arc4.DynamicArray(
+                    *(
+                        typ.XGovBoxEntry(
+                            xgov_address=arc4.Address(xgov),
+                            xgov_box=typ.XGovBoxValue(
+                                voting_address=arc4.Address(self.operator),
+                                voted_proposals=arc4.UInt64(0),
+                                last_vote_timestamp=arc4.UInt64(0),
+                                subscription_round=arc4.UInt64(0),
+                            ),
+                        )
+                        for xgov in entries
+                    )
+                )
+            )
+
+        self.proposals = [self.create_proposal() for _ in range(self.config.proposals)]
+        self.representatives = [
+            self.register_representative(context.any.account())
+            for _ in range(self.config.representatives)
+        ]
+
+        (available_voter,) = get_contracts(context, Voter)
+        for i, xgov in enumerate(self.xgovs):
+            voter = self.register_voter(xgov, available_voter)
+            # Each registration creates the next unassigned Voter
+            available_voter = get_last_contract(context)
+            with context.txn.create_group(
+                active_txn_overrides={"sender": self.operator}
+            ):
+                voter.set_representative(
+                    arc4.UInt64(
+                        self.representatives[i % len(self.representatives)][
+                            1
+                        ].__app_id__
+                    )
+                )
+
+    def create_proposal(self) -> ProposalMock:
+        proposal = get_contract(self.xgov_registry_mock.create_proposal())
+        assert isinstance(proposal, ProposalMock)
+        proposal.set_status(UInt64(DEFAULT_PROPOSAL_STATUS))
+        proposal.set_voting_duration(UInt64(DEFAULT_VOTING_DURATION))
+        proposal.set_vote_open_ts(UInt64(DEFAULT_PROPOSAL_VOTE_OPEN_TS))
+        for entries in chunked(self.xgovs, BOXES_PER_CALL):
+            proposal.set_voter_boxes(
+                arc4.DynamicArray(
+                    *(
+                        typ.VoterBoxEntry(
+                            voter_address=arc4.Address(xgov),
+                            votes=arc4.UInt64(
+                                self.rng.randint(1, self.config.max_votes)
+                            ),
+                        )
+                        for xgov in entries
+                    )
+                )
+            )
+        return proposal
+
+    def register_representative(
+        self, account: Account
+    ) -> tuple[Account, Representative]:
+        with self.context.txn.create_group(active_txn_overrides={"sender": account}):
+            representative_id = self.delegation_registry.register_representative(
+                pay(
+                    self.context,
+                    account,
+                    self.delegation_registry,
+                    Global.min_balance + regcfg.FEE_REPRESENTATIVE,
+                ),
+            )
+        representative = get_contract(representative_id)
+        assert isinstance(representative, Representative)
+        return account, representative
+
+    def register_voter(self, xgov: Account, available_voter: Voter) -> Voter:
+        with self.context.txn.create_group(
+            active_txn_overrides={"sender": self.operator}
+        ):
+            voter_id = self.delegation_registry.register_voter(
+                pay(
+                    self.context,
+                    self.operator,
+                    self.delegation_registry,
+                    Global.min_balance,
+                ),
+                arc4.Address(xgov),
+                UInt64(available_voter.__app_id__),
+            )
+        voter = get_contract(voter_id)
+        assert isinstance(voter, Voter)
+        return voter
+
+    def add_votes(self, xgov: int, votes: int) -> int:
+        registry = self.delegation_registry
+        with self.context.txn.create_group(
+            active_txn_overrides={"sender": self.operator}
+        ):
+            registry.add_votes(
+                pay(
+                    self.context,
+                    self.operator,
+                    registry,
+                    votes * regcfg.FEE_VOTE_OTHER,
+                ),
+                arc4.Address(self.xgovs[xgov]),
+                arc4.UInt64(votes),
+            )
+        return get_operation_fees(ADD_VOTES)
+
+    def publish_vote(self, representative: int, proposal: int) -> int:
+        account, contract = self.representatives[representative]
+        approval = self.rng.randint(0, const.PPM)
+        with self.context.txn.create_group(active_txn_overrides={"sender": account}):
+            # The emulator does not track the MBR of boxes
+            contract.publish_vote(
+                pay(self.context, account, contract, 0),
+                arc4.UInt64(self.proposals[proposal].__app_id__),
+                typ.Vote(
+                    approval=arc4.UInt64(approval),
+                    rejection=arc4.UInt64(const.PPM - approval),
+                ),
+            )
+        return get_operation_fees(PUBLISH_VOTE)
+
+    def trigger_vote(self, xgov: int, proposal: int) -> int:
+        with self.context.txn.create_group(
+            active_txn_overrides={"sender": self.triggerer}
+        ):
+            self.delegation_registry.trigger_vote(
+                arc4.Address(self.xgovs[xgov]),
+                arc4.UInt64(self.proposals[proposal].__app_id__),
+            )
+        return get_operation_fees(TRIGGER_VOTE)
@@ -0,0 +1,122 @@
+"""
+Benchmark of the construction of `trigger_vote` transactions.
+
+Builds the same calls through the typed client (`create_transaction.trigger_vote`) and
+through the fast builder (`RegistryCallBuilder.trigger_votes`), without any network
+request, and reports the transactions built per second by each path, e.g.
+`python -m tests.load.build_benchmark --calls 10000`.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams
+from algosdk import transaction
+from algosdk.account import generate_account
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+    TriggerVoteArgs,
+)
+from smart_contracts.common import constants as const
+from smart_contracts.common.fast_builder import (
+    TRIGGER_VOTE_INNER_TXNS,
+    RegistryCallBuilder,
+)
+
+REGISTRY_ID: Final[int] = 1_000
+SUGGESTED_PARAMS: Final[transaction.SuggestedParams] = transaction.SuggestedParams(
+    fee=const.MIN_FEE,
+    first=1,
+    last=1_001,
+    gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+    gen="sandnet-v1",
+    flat_fee=True,
+    min_fee=const.MIN_FEE,
+)
+
+
+@dataclass(frozen=True)
+class BuildReport:
+    calls: int
+    typed_client_seconds: float
+    fast_builder_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.typed_client_seconds / self.fast_builder_seconds
+
+    def summary(self) -> str:
+        return (
+            f"{self.calls} trigger_vote calls: "
+            f"typed client {self.calls / self.typed_client_seconds:,.0f} txn/s, "
+            f"fast builder {self.calls / self.fast_builder_seconds:,.0f} txn/s "
+            f"(x{self.speedup:.1f})"
+        )
+
+
+def get_triggers(calls: int) -> list[tuple[str, int]]:
+    xgovs = [generate_account()[1] for _ in range(min(calls, 100))]
+    return [(xgovs[i % len(xgovs)], 2_000 + i // len(xgovs)) for i in range(calls)]
+
+
+def build_with_typed_client(
+    sender: str, triggers: list[tuple[str, int]]
+) -> list[transaction.Transaction]:
+    algorand_client = AlgorandClient.default_localnet()
+    algorand_client.set_suggested_params_cache(SUGGESTED_PARAMS)
+    client = DelegationRegistryClient(
+        app_id=REGISTRY_ID, algorand=algorand_client, default_sender=sender
+    )
+    params = CommonAppCallParams(
+        extra_fee=AlgoAmount(micro_algo=TRIGGER_VOTE_INNER_TXNS * const.MIN_FEE)
+    )
+    return [
+        client.create_transaction.trigger_vote(
+            args=TriggerVoteArgs(xgov_address=xgov_address, proposal_id=proposal_id),
+            params=params,
+        ).transactions[0]
+        for xgov_address, proposal_id in triggers
+    ]
+
+
+def build_with_fast_builder(
+    sender: str, triggers: list[tuple[str, int]]
+) -> list[transaction.ApplicationCallTxn]:
+    builder = RegistryCallBuilder(REGISTRY_ID, sender, SUGGESTED_PARAMS)
+    return builder.trigger_votes(triggers)
+
+
+def time_build(build: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    build()
+    return time.perf_counter() - start
+
+
+def run_build_benchmark(calls: int) -> BuildReport:
+    sender = generate_account()[1]
+    triggers = get_triggers(calls)
+    return BuildReport(
+        calls=calls,
+        typed_client_seconds=time_build(
+            lambda: build_with_typed_client(sender, triggers)
+        ),
+        fast_builder_seconds=time_build(
+            lambda: build_with_fast_builder(sender, triggers)
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(run_build_benchmark(args.calls).summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,646 @@
+"""
+Seeded load scenarios for the Delegation Registry on LocalNet.
+
+A scenario is a fleet of xGovs, Representatives and Proposals, deployed with the
+xGov Registry and Proposal mocks. xGov and Proposal voter boxes are written in bulk
+with `set_xgov_boxes` and `set_voter_boxes`, and the independent transaction groups
+of every step are submitted concurrently.
+
+The accounts are derived from the seed, so a scenario is reproducible on a fresh
+LocalNet, e.g. `python -m tests.load.scenario --seed 7 --output scenario.json`.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Final, TypeVar
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    BoxReference,
+    CommonAppCallParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+    SendParams,
+    SigningAccount,
+)
+from algokit_utils.config import config
+from algosdk.constants import TX_GROUP_LIMIT
+from algosdk.encoding import decode_address
+from dotenv import load_dotenv
+from nacl.signing import SigningKey
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+    RegisterRepresentativeArgs,
+    RegisterVoterArgs,
+)
+from smart_contracts.artifacts.proposal_mock.proposal_mock_client import (
+    ProposalMockClient,
+    SetStatusArgs,
+    SetVoteOpenTsArgs,
+    SetVoterBoxesArgs,
+    SetVotingDurationArgs,
+)
+from smart_contracts.artifacts.representative.representative_client import (
+    PublishVoteArgs,
+    RepresentativeClient,
+    Vote,
+)
+from smart_contracts.artifacts.voter.voter_client import (
+    SetRepresentativeArgs,
+    VoterClient,
+)
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    SetXgovBoxesArgs,
+    XgovRegistryMockClient,
+    XgovRegistryMockFactory,
+)
+from smart_contracts.common import constants as const
+from smart_contracts.common.fleet import FleetTable
+from smart_contracts.common.helpers import (
+    get_box_mbr,
+    get_sc_representative_mbr,
+    get_sc_voter_mbr,
+    get_vote_mbr,
+)
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.proposal import config as prop_cfg
+from smart_contracts.xgov_registry import config as xgov_cfg
+from tests.common import (
+    DEFAULT_PROPOSAL_STATUS,
+    DEFAULT_PROPOSAL_VOTE_OPEN_TS,
+    DEFAULT_VOTING_DURATION,
+    INITIAL_FUNDS,
+)
+from tests.delegation_registry.common import (
+    deploy_delegation_registry,
+    initialize_delegation_registry,
+    prepare_voter,
+)
+
+T = TypeVar("T")
+
+# A box reference grants the I/O budget of one box, and a transaction holds up to
+# 8 foreign references: bulk seeding calls write up to 8 boxes each
+BOXES_PER_CALL: Final[int] = 8
+
+XGOV_BOX_SIZE: Final[int] = 32 + 3 * 8
+PROPOSAL_VOTER_BOX_SIZE: Final[int] = 8
+
+XGOV_BOX_MBR: Final[int] = get_box_mbr(
+    XGOV_BOX_SIZE, name=xgov_cfg.XGOV_BOX_MAP_PREFIX + bytes(32)
+)
+PROPOSAL_VOTER_BOX_MBR: Final[int] = get_box_mbr(
+    PROPOSAL_VOTER_BOX_SIZE, name=prop_cfg.VOTER_BOX_KEY_PREFIX.encode() + bytes(32)
+)
+
+NO_POPULATE: Final[SendParams] = SendParams(populate_app_call_resources=False)
+POPULATE: Final[SendParams] = SendParams(populate_app_call_resources=True)
+
+
+@dataclass(slots=True, frozen=True)
+class ScenarioConfig:
+    seed: int = 0
+    xgovs: int = 10_000
+    representatives: int = 300
+    proposals: int = 50
+    max_votes: int = 1_000  # xGov votes per proposal, drawn in [1, max_votes]
+    concurrency: int = 8  # transaction groups in flight
+    publish_votes: bool = True  # Representatives vote on every Proposal
+
+
+@dataclass(slots=True)
+class Scenario:
+    """Deployed fleet of a scenario, keyed by address and app ID."""
+
+    config: ScenarioConfig
+    xgov_registry_app: int = 0
+    delegation_registry_app: int = 0
+    operator: str = ""  # voting address of the xGovs and manager of their Voters
+    proposals: list[int] = field(default_factory=list)
+    representatives: dict[str, int] = field(default_factory=dict)
+    # Voter and Representative apps by xGov address
+    voters: dict[str, int] = field(default_factory=dict)
+    delegations: dict[str, int] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+
+def derive_account(seed: int, role: str, index: int) -> SigningAccount:
+    """
+    Derive a deterministic account, so that a scenario can be replayed from its seed.
+
+    Args:
+        seed (int): Scenario seed
+        role (str): Account role, e.g. `xgov` or `representative`
+        index (int): Index of the account within its role
+
+    Returns:
+        SigningAccount: Account with an ed25519 key derived from the arguments
+    """
+    key = hashlib.sha512(f"{seed}:{role}:{index}".encode()).digest()[:32]
+    public_key = bytes(SigningKey(key).verify_key)
+    return SigningAccount(private_key=base64.b64encode(key + public_key).decode())
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def send_concurrently(
+    groups: Iterable[Callable[[], T]],
+    concurrency: int,
+) -> list[T]:
+    """
+    Build and send independent transaction groups from a pool of threads.
+
+    Args:
+        groups (Iterable[Callable[[], T]]): Callables building and sending one group each
+        concurrency (int): Maximum number of groups in flight
+
+    Returns:
+        list[T]: Results of the callables, in order. The first failure is raised.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(lambda send: send(), groups))
+
+
+def get_created_app(confirmation: object) -> int:
+    """Return the ID of the first app created by the inner transactions of a confirmation."""
+    inner_txns = confirmation["inner-txns"]  # type: ignore[index]
+    return next(
+        inner["application-index"]
+        for inner in inner_txns
+        if "application-index" in inner
+    )
+
+
+class ScenarioGenerator:
+    """Deploy and seed the fleet of a scenario on LocalNet."""
+
+    def __init__(
+        self,
+        algorand_client: AlgorandClient,
+        scenario_config: ScenarioConfig,
+    ) -> None:
+        self.algorand_client = algorand_client
+        self.config = scenario_config
+        self.rng = random.Random(scenario_config.seed)
+        self.dispenser = algorand_client.account.dispenser_from_environment()
+        self.deployer = self.account("deployer", 0)
+        self.operator = self.account("operator", 0)
+        self.xgovs = [self.account("xgov", i) for i in range(scenario_config.xgovs)]
+        self.representatives = [
+            self.account("representative", i)
+            for i in range(scenario_config.representatives)
+        ]
+        self.scenario = Scenario(config=scenario_config, operator=self.operator.address)
+
+    def account(self, role: str, index: int) -> SigningAccount:
+        account = derive_account(self.config.seed, role, index)
+        self.algorand_client.account.set_signer_from_account(account)
+        return account
+
+    def send(self, groups: Iterable[Callable[[], T]]) -> list[T]:
+        return send_concurrently(groups, self.config.concurrency)
+
+    def generate(self) -> Scenario:
+        self.fund_accounts()
+        xgov_registry_mock = self.deploy_xgov_registry_mock()
+        delegation_registry = deploy_delegation_registry(
+            self.algorand_client, xgov_registry_mock, self.deployer
+        )
+        initialize_delegation_registry(
+            self.algorand_client, delegation_registry, self.deployer
+        )
+        self.scenario.xgov_registry_app = xgov_registry_mock.app_id
+        self.scenario.delegation_registry_app = delegation_registry.app_id
+
+        self.seed_xgovs(xgov_registry_mock)
+        proposals = self.create_proposals(xgov_registry_mock)
+        representatives = self.register_representatives(delegation_registry)
+        if self.config.publish_votes:
+            self.publish_votes(representatives, proposals)
+        self.register_voters(delegation_registry)
+        self.delegate()
+
+        return self.scenario
+
+    def fund(self, receivers: Sequence[str], amount: int) -> None:
+        def send_group(group: Sequence[str]) -> Callable[[], object]:
+            def send() -> object:
+                composer = self.algorand_client.new_group()
+                for receiver in group:
+                    composer.add_payment(
+                        PaymentParams(
+                            sender=self.dispenser.address,
+                            receiver=receiver,
+                            amount=AlgoAmount(micro_algo=amount),
+                        )
+                    )
+                return composer.send()
+
+            return send
+
+        self.send(send_group(group) for group in chunked(receivers, TX_GROUP_LIMIT))
+
+    def fund_accounts(self) -> None:
+        fees = 10 * const.MIN_FEE
+        self.fund(
+            [self.deployer.address],
+            int(INITIAL_FUNDS.micro_algo)
+            + self.config.proposals * (8 * fees + const.ACCOUNT_MBR),
+        )
+        self.fund(
+            [self.operator.address],
+            self.config.xgovs * (get_sc_voter_mbr() + 2 * fees)
+            + int(INITIAL_FUNDS.micro_algo),
+        )
+        self.fund(
+            [representative.address for representative in self.representatives],
+            get_sc_representative_mbr()
+            + regcfg.FEE_REPRESENTATIVE
+            + self.config.proposals * (get_vote_mbr() + fees)
+            + int(INITIAL_FUNDS.micro_algo),
+        )
+
+    def deploy_xgov_registry_mock(self) -> XgovRegistryMockClient:
+        factory = self.algorand_client.client.get_typed_app_factory(
+            typed_factory=XgovRegistryMockFactory,
+            default_sender=self.deployer.address,
+        )
+        client, _ = factory.send.create.bare()  # type: ignore
+        self.fund(
+            [client.app_address],
+            self.config.xgovs * XGOV_BOX_MBR
+            + self.config.proposals * const.ACCOUNT_MBR
+            + int(INITIAL_FUNDS.micro_algo),
+        )
+        return client
+
+    def seed_xgovs(self, xgov_registry_mock: XgovRegistryMockClient) -> None:
+        """Write the xGov boxes, with the operator as voting address of every xGov."""
+
+        def send_group(group: Sequence[SigningAccount]) -> Callable[[], object]:
+            def send() -> object:
+                composer = xgov_registry_mock.new_group()
+                for entries in chunked(group, BOXES_PER_CALL):
+                    composer.set_xgov_boxes(
+                        args=SetXgovBoxesArgs(
+                            xgov_boxes=[
+                                (xgov.address, (self.operator.address, 0, 0, 0))
+                                for xgov in entries
+                            ]
+                        ),
+                        params=CommonAppCallParams(
+                            box_references=[
+                                BoxReference(
+                                    app_id=0,
+                                    name=xgov_cfg.XGOV_BOX_MAP_PREFIX
+                                    + decode_address(xgov.address),
+                                )
+                                for xgov in entries
+                            ],
+                        ),
+                    )
+                return composer.send(NO_POPULATE)
+
+            return send
+
+        self.send(
+            send_group(group)
+            for group in chunked(self.xgovs, TX_GROUP_LIMIT * BOXES_PER_CALL)
+        )
+
+    def create_proposals(
+        self, xgov_registry_mock: XgovRegistryMockClient
+    ) -> list[ProposalMockClient]:
+        """Create the Proposals, open for voting, with votes for every xGov."""
+        proposal_ids: list[int] = []
+        for group in chunked(range(self.config.proposals), TX_GROUP_LIMIT):
+            composer = xgov_registry_mock.new_group()
+            for _ in group:
+                composer.create_proposal(
+                    params=CommonAppCallParams(
+                        extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+                    ),
+                )
+            result = composer.send(POPULATE)
+            proposal_ids += [abi_return.value for abi_return in result.returns]
+
+        proposals = [
+            self.algorand_client.client.get_typed_app_client_by_id(
+                typed_client=ProposalMockClient,
+                app_id=proposal_id,
+                default_sender=self.deployer.address,
+            )
+            for proposal_id in proposal_ids
+        ]
+        self.scenario.proposals = proposal_ids
+        self.fund(
+            [proposal.app_address for proposal in proposals],
+            self.config.xgovs * PROPOSAL_VOTER_BOX_MBR,
+        )
+
+        for proposal in proposals:
+            (
+                proposal.new_group()
+                .set_status(args=SetStatusArgs(status=DEFAULT_PROPOSAL_STATUS))
+                .set_voting_duration(
+                    args=SetVotingDurationArgs(voting_duration=DEFAULT_VOTING_DURATION)
+                )
+                .set_vote_open_ts(
+                    args=SetVoteOpenTsArgs(vote_open_ts=DEFAULT_PROPOSAL_VOTE_OPEN_TS)
+                )
+                .send()
+            )
+
+        def send_group(
+            proposal: ProposalMockClient, group: Sequence[SigningAccount]
+        ) -> Callable[[], object]:
+            votes = [self.rng.randint(1, self.config.max_votes) for _ in group]
+
+            def send() -> object:
+                composer = proposal.new_group()
+                for start in range(0, len(group), BOXES_PER_CALL):
+                    entries = group[start : start + BOXES_PER_CALL]
+                    composer.set_voter_boxes(
+                        args=SetVoterBoxesArgs(
+                            voter_boxes=[
+                                (xgov.address, vote)
+                                for xgov, vote in zip(
+                                    entries, votes[start : start + BOXES_PER_CALL]
+                                )
+                            ]
+                        ),
+                        params=CommonAppCallParams(
+                            box_references=[
+                                BoxReference(
+                                    app_id=0,
+                                    name=prop_cfg.VOTER_BOX_KEY_PREFIX.encode()
+                                    + decode_address(xgov.address),
+                                )
+                                for xgov in entries
+                            ],
+                        ),
+                    )
+                return composer.send(NO_POPULATE)
+
+            return send
+
+        self.send(
+            [
+                send_group(proposal, group)
+                for proposal in proposals
+                for group in chunked(self.xgovs, TX_GROUP_LIMIT * BOXES_PER_CALL)
+            ]
+        )
+
+        return proposals
+
+    def register_representatives(
+        self, delegation_registry: DelegationRegistryClient
+    ) -> list[RepresentativeClient]:
+        pay_amount = get_sc_representative_mbr() + regcfg.FEE_REPRESENTATIVE
+
+        def send_group(
+            group: Sequence[SigningAccount],
+        ) -> Callable[[], SendAtomicTransactionComposerResults]:
+            def send() -> SendAtomicTransactionComposerResults:
+                composer = delegation_registry.new_group()
+                for representative in group:
+                    composer.register_representative(
+                        args=RegisterRepresentativeArgs(
+                            payment=self.algorand_client.create_transaction.payment(
+                                PaymentParams(
+                                    sender=representative.address,
+                                    receiver=delegation_registry.app_address,
+                                    amount=AlgoAmount(micro_algo=pay_amount),
+                                )
+                            ),
+                        ),
+                        params=CommonAppCallParams(
+                            sender=representative.address,
+                            extra_fee=AlgoAmount(micro_algo=2 * const.MIN_FEE),
+                        ),
+                    )
+                return composer.send(POPULATE)
+
+            return send
+
+        # A payment and an app call per Representative
+        results = self.send(
+            send_group(group)
+            for group in chunked(self.representatives, TX_GROUP_LIMIT // 2)
+        )
+        representative_ids = [
+            abi_return.value for result in results for abi_return in result.returns
+        ]
+        self.scenario.representatives = {
+            representative.address: representative_id
+            for representative, representative_id in zip(
+                self.representatives, representative_ids
+            )
+        }
+
+        return [
+            self.algorand_client.client.get_typed_app_client_by_id(
+                typed_client=RepresentativeClient,
+                app_id=representative_id,
+                default_sender=representative.address,
+            )
+            for representative, representative_id in zip(
+                self.representatives, representative_ids
+            )
+        ]
+
+    def publish_votes(
+        self,
+        representatives: Sequence[RepresentativeClient],
+        proposals: Sequence[ProposalMockClient],
+    ) -> None:
+        """Publish a vote of every Representative on every Proposal."""
+
+        def send_group(
+            representative: RepresentativeClient,
+            sender: str,
+            group: Sequence[ProposalMockClient],
+        ) -> Callable[[], object]:
+            approvals = [self.rng.randint(0, const.PPM) for _ in group]
+
+            def send() -> object:
+                composer = representative.new_group()
+                for proposal, approval in zip(group, approvals):
+                    composer.publish_vote(
+                        args=PublishVoteArgs(
+                            payment=self.algorand_client.create_transaction.payment(
+                                PaymentParams(
+                                    sender=sender,
+                                    receiver=representative.app_address,
+                                    amount=AlgoAmount(micro_algo=get_vote_mbr()),
+                                )
+                            ),
+                            proposal_id=proposal.app_id,
+                            vote=Vote(
+                                approval=approval, rejection=const.PPM - approval
+                            ),
+                        ),
+                        params=CommonAppCallParams(sender=sender),
+                    )
+                return composer.send(POPULATE)
+
+            return send
+
+        self.send(
+            [
+                send_group(representative, account.address, group)
+                for representative, account in zip(
+                    representatives, self.representatives
+                )
+                for group in chunked(proposals, TX_GROUP_LIMIT // 2)
+            ]
+        )
+
+    def register_voters(self, delegation_registry: DelegationRegistryClient) -> None:
+        """
+        Register a Voter for every xGov, signed by the operator as voting address.
+
+        Each registration assigns an unassigned Voter and creates the next one, so
+        registrations run in waves as wide as the unassigned Voters: every wave
+        assigns the Voters created by the previous one.
+        """
+        unassigned = FleetTable.from_registry(
+            self.algorand_client, delegation_registry
+        ).unassigned_voters()
+        for _ in range(self.config.concurrency - len(unassigned)):
+            prepare_voter(self.algorand_client, delegation_registry, self.operator)
+        unassigned = FleetTable.from_registry(
+            self.algorand_client, delegation_registry
+        ).unassigned_voters()
+
+        def send_group(
+            xgov: SigningAccount, available_voter_id: int
+        ) -> Callable[[], SendAtomicTransactionComposerResults]:
+            def send() -> SendAtomicTransactionComposerResults:
+                return (
+                    delegation_registry.new_group()
+                    .register_voter(
+                        args=RegisterVoterArgs(
+                            payment=self.algorand_client.create_transaction.payment(
+                                PaymentParams(
+                                    sender=self.operator.address,
+                                    receiver=delegation_registry.app_address,
+                                    amount=AlgoAmount(micro_algo=get_sc_voter_mbr()),
+                                )
+                            ),
+                            xgov_address=xgov.address,
+                            available_voter_id=available_voter_id,
+                        ),
+                        params=CommonAppCallParams(
+                            sender=self.operator.address,
+                            extra_fee=AlgoAmount(micro_algo=4 * const.MIN_FEE),
+                        ),
+                    )
+                    .send(POPULATE)
+                )
+
+            return send
+
+        for wave in chunked(self.xgovs, len(unassigned)):
+            results = self.send(
+                send_group(xgov, voter_id) for xgov, voter_id in zip(wave, unassigned)
+            )
+            for xgov, result in zip(wave, results):
+                self.scenario.voters[xgov.address] = result.returns[-1].value
+            unassigned = [
+                get_created_app(result.confirmations[-1]) for result in results
+            ]
+
+    def delegate(self) -> None:
+        """Set a Representative for every Voter, as their manager."""
+        representative_ids = list(self.scenario.representatives.values())
+        self.scenario.delegations = {
+            xgov.address: representative_ids[i % len(representative_ids)]
+            for i, xgov in enumerate(self.xgovs)
+        }
+
+        def send_group(group: Sequence[SigningAccount]) -> Callable[[], object]:
+            def send() -> object:
+                composer = self.algorand_client.new_group()
+                for xgov in group:
+                    voter = self.algorand_client.client.get_typed_app_client_by_id(
+                        typed_client=VoterClient,
+                        app_id=self.scenario.voters[xgov.address],
+                        default_sender=self.operator.address,
+                    )
+                    composer.add_app_call_method_call(
+                        voter.params.set_representative(
+                            args=SetRepresentativeArgs(
+                                representative_id=self.scenario.delegations[
+                                    xgov.address
+                                ]
+                            ),
+                        )
+                    )
+                return composer.send(POPULATE)
+
+            return send
+
+        self.send(send_group(group) for group in chunked(self.xgovs, TX_GROUP_LIMIT))
+
+
+def add_scenario_arguments(
+    parser: argparse.ArgumentParser, defaults: ScenarioConfig
+) -> None:
+    for name, spec in ScenarioConfig.__dataclass_fields__.items():
+        flag = f"--{name.replace('_', '-')}"
+        if spec.type is bool:
+            parser.add_argument(
+                flag,
+                action=argparse.BooleanOptionalAction,
+                default=getattr(defaults, name),
+            )
+        else:
+            parser.add_argument(flag, type=spec.type, default=getattr(defaults, name))
+
+
+def get_scenario_config(args: argparse.Namespace) -> ScenarioConfig:
+    return ScenarioConfig(
+        **{name: getattr(args, name) for name in ScenarioConfig.__dataclass_fields__}
+    )
+
+
+def get_localnet_client() -> AlgorandClient:
+    load_dotenv(Path(__file__).parent.parent.parent / ".env.localnet")
+    config.configure(debug=False, populate_app_call_resources=True)
+    return AlgorandClient.default_localnet()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_scenario_arguments(parser, ScenarioConfig())
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    scenario = ScenarioGenerator(
+        get_localnet_client(), get_scenario_config(args)
+    ).generate()
+
+    if args.output is None:
+        print(scenario.to_json())
+    else:
+        args.output.write_text(scenario.to_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import pytest
+from algokit_utils import AlgorandClient
+from algokit_utils.config import config
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    DelegationRegistryClient,
+)
+from smart_contracts.artifacts.proposal_mock.proposal_mock_client import (
+    ProposalMockClient,
+)
+from smart_contracts.artifacts.voter.voter_client import VoterClient
+from tests.load.scenario import (
+    BOXES_PER_CALL,
+    Scenario,
+    ScenarioConfig,
+    ScenarioGenerator,
+    derive_account,
+)
+
+SCENARIO_CONFIG = ScenarioConfig(
+    seed=1,
+    xgovs=3 * BOXES_PER_CALL + 1,
+    representatives=3,
+    proposals=2,
+    concurrency=4,
+)
+
+
+@pytest.fixture(scope="module")
+def scenario(algorand_client: AlgorandClient) -> Scenario:
+    config.configure(
+        debug=False,
+        populate_app_call_resources=True,
+    )
+    return ScenarioGenerator(algorand_client, SCENARIO_CONFIG).generate()
+
+
+def test_derive_account_is_deterministic() -> None:
+    account = derive_account(0, "xgov", 0)
+
+    assert derive_account(0, "xgov", 0).address == account.address
+    assert derive_account(1, "xgov", 0).address != account.address
+    assert derive_account(0, "representative", 0).address != account.address
+
+
+def test_scenario(algorand_client: AlgorandClient, scenario: Scenario) -> None:
+    assert len(scenario.proposals) == SCENARIO_CONFIG.proposals
+    assert len(scenario.representatives) == SCENARIO_CONFIG.representatives
+    assert len(scenario.voters) == SCENARIO_CONFIG.xgovs
+    assert len(set(scenario.voters.values())) == SCENARIO_CONFIG.xgovs
+
+    delegation_registry = algorand_client.client.get_typed_app_client_by_id(
+        typed_client=DelegationRegistryClient,
+        app_id=scenario.delegation_registry_app,
+    )
+    voters_box = delegation_registry.state.box.voters_box.get_map()
+    for xgov_address, voter_id in scenario.voters.items():
+        assert voters_box[xgov_address] == voter_id
+
+        voter = algorand_client.client.get_typed_app_client_by_id(
+            typed_client=VoterClient, app_id=voter_id
+        )
+        global_state = voter.state.global_state
+        assert global_state.xgov_address == xgov_address
+        assert global_state.manager_address == scenario.operator
+        assert global_state.representative_app == scenario.delegations[xgov_address]
+
+    for proposal_id in scenario.proposals:
+        proposal = algorand_client.client.get_typed_app_client_by_id(
+            typed_client=ProposalMockClient, app_id=proposal_id
+        )
+        assert set(proposal.state.box.voters.get_map()) == set(scenario.voters)
@@ -0,0 +1,41 @@
+from algokit_utils import AlgorandClient
+from algokit_utils.config import config
+
+from tests.load.backends import (
+    ADD_VOTES,
+    TRIGGER_VOTE,
+    LocalnetBackend,
+    get_operation_fees,
+)
+from tests.load.scenario import ScenarioConfig
+from tests.load.throughput import run_benchmark
+
+SCENARIO_CONFIG = ScenarioConfig(
+    seed=2,
+    xgovs=8,
+    representatives=2,
+    proposals=2,
+    concurrency=4,
+    publish_votes=False,
+)
+
+
+def test_run_benchmark(algorand_client: AlgorandClient) -> None:
+    config.configure(
+        debug=False,
+        populate_app_call_resources=True,
+    )
+
+    report = run_benchmark(
+        LocalnetBackend(algorand_client, SCENARIO_CONFIG), SCENARIO_CONFIG
+    )
+
+    assert all(not operation.failures for operation in report.operations)
+    assert (
+        report.get(TRIGGER_VOTE).successes
+        == SCENARIO_CONFIG.xgovs * SCENARIO_CONFIG.proposals
+    )
+    assert report.get(ADD_VOTES).fees == SCENARIO_CONFIG.xgovs * get_operation_fees(
+        ADD_VOTES
+    )
+    assert report.votes_per_second > 0
@@ -0,0 +1,286 @@
+"""
+Throughput benchmark of the delegation voting pipeline.
+
+Seeds a fleet through the mocks, then drives the pipeline phase by phase:
+the xGov managers pay for the votes (`add_votes`), the Representatives publish
+their votes (`publish_vote`) and a triggerer casts the delegated votes of every
+xGov on every Proposal (`trigger_vote`). Each phase reports its latency
+percentiles, throughput, fees and failures, classified by contract error.
+
+Runs on LocalNet or on the `algorand-python-testing` emulator, e.g.
+`python -m tests.load.throughput --backend emulator --xgovs 1000 --output results.json`.
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final
+
+from algopy_testing import algopy_testing_context
+
+from smart_contracts.common import constants as const
+from smart_contracts.errors import std_errors as err
+from tests.load.backends import (
+    ADD_VOTES,
+    PUBLISH_VOTE,
+    TRIGGER_VOTE,
+    Backend,
+    EmulatorBackend,
+    LocalnetBackend,
+)
+from tests.load.scenario import (
+    ScenarioConfig,
+    add_scenario_arguments,
+    get_localnet_client,
+    get_scenario_config,
+)
+from tests.offline.emulator import inner_app_calls
+
+PERCENTILES: Final[tuple[int, ...]] = (50, 90, 99)
+
+# Contract error messages by error name, to classify failures
+ERRORS: Final[dict[str, str]] = {
+    message: name
+    for name, message in vars(err).items()
+    if name.isupper() and isinstance(message, str)
+}
+
+DEFAULT_SCENARIO: Final[ScenarioConfig] = ScenarioConfig(
+    xgovs=1_000,
+    representatives=30,
+    proposals=5,
+    publish_votes=False,  # driven by the benchmark
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Sample:
+    latency: float  # seconds
+    fees: int  # microAlgos
+    failure: str | None = None
+
+
+def classify_failure(error: Exception) -> str:
+    """Name the contract error raised by an operation, else the exception type."""
+    message = str(error)
+    matched = max((known for known in ERRORS if known in message), key=len, default="")
+    return ERRORS.get(matched, type(error).__name__)
+
+
+def percentile(values: Sequence[float], q: int) -> float:
+    """Nearest-rank percentile of `values`, 0 if empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-q * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+@dataclass(slots=True)
+class OperationReport:
+    operation: str
+    calls: int = 0
+    successes: int = 0
+    duration: float = 0.0  # wall clock seconds of the phase
+    throughput: float = 0.0  # successful calls per second
+    latency: dict[str, float] = field(default_factory=dict)  # seconds, by percentile
+    fees: int = 0  # microAlgos paid by the successful calls
+    failures: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(
+        cls, operation: str, samples: Sequence[Sample], duration: float
+    ) -> "OperationReport":
+        succeeded = [sample for sample in samples if sample.failure is None]
+        latencies = [sample.latency for sample in succeeded]
+        return cls(
+            operation=operation,
+            calls=len(samples),
+            successes=len(succeeded),
+            duration=duration,
+            throughput=len(succeeded) / duration if duration else 0.0,
+            latency={
+                **{f"p{q}": percentile(latencies, q) for q in PERCENTILES},
+                "max": max(latencies, default=0.0),
+            },
+            fees=sum(sample.fees for sample in succeeded),
+            failures=dict(
+                Counter(sample.failure for sample in samples if sample.failure)
+            ),
+        )
+
+
+@dataclass(slots=True)
+class ThroughputReport:
+    backend: str
+    timestamp: str
+    scenario: ScenarioConfig
+    operations: list[OperationReport] = field(default_factory=list)
+
+    def get(self, operation: str) -> OperationReport:
+        return next(
+            report for report in self.operations if report.operation == operation
+        )
+
+    @property
+    def votes_per_second(self) -> float:
+        return self.get(TRIGGER_VOTE).throughput
+
+    @property
+    def fees_per_vote(self) -> float:
+        """Fees paid to buy and trigger the votes, per delegated vote cast."""
+        votes = self.get(TRIGGER_VOTE).successes
+        fees = self.get(ADD_VOTES).fees + self.get(TRIGGER_VOTE).fees
+        return fees / votes if votes else 0.0
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                **asdict(self),
+                "votes_per_second": self.votes_per_second,
+                "fees_per_vote": self.fees_per_vote,
+            },
+            indent=2,
+        )
+
+    def summary(self) -> str:
+        rows = [
+            f"{'operation':<14} {'calls':>7} {'ok':>7} {'ops/s':>8} "
+            f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}  failures"
+        ]
+        for report in self.operations:
+            rows.append(
+                f"{report.operation:<14} {report.calls:>7} {report.successes:>7} "
+                f"{report.throughput:>8.1f} "
+                + " ".join(
+                    f"{1000 * report.latency[f'p{q}']:>8.1f}" for q in PERCENTILES
+                )
+                + f"  {report.failures or '-'}"
+            )
+        rows += [
+            "",
+            f"Votes per second: {self.votes_per_second:.1f}",
+            f"Fees per vote: {self.fees_per_vote / const.MIN_FEE:.2f} x MIN_FEE",
+        ]
+        return "\n".join(rows)
+
+
+def run_phase(
+    operation: str,
+    calls: Sequence[Callable[[], int]],
+    concurrency: int,
+) -> OperationReport:
+    """
+    Run the calls of a phase, `concurrency` at a time, and measure each of them.
+
+    Args:
+        operation (str): Name of the operation
+        calls (Sequence[Callable[[], int]]): Operations returning their fees
+        concurrency (int): Maximum number of calls in flight
+
+    Returns:
+        OperationReport: Latency, throughput, fees and failures of the phase
+    """
+
+    def measure(call: Callable[[], int]) -> Sample:
+        start = time.perf_counter()
+        try:
+            fees = call()
+        except Exception as error:
+            return Sample(time.perf_counter() - start, 0, classify_failure(error))
+        return Sample(time.perf_counter() - start, fees)
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(measure, calls))
+    else:
+        samples = [measure(call) for call in calls]
+    return OperationReport.from_samples(operation, samples, time.perf_counter() - start)
+
+
+def run_benchmark(
+    backend: Backend, scenario_config: ScenarioConfig
+) -> ThroughputReport:
+    """
+    Seed the fleet on the backend and drive the voting pipeline through it.
+
+    Every xGov buys a vote per Proposal, every Representative votes on every
+    Proposal, then the votes of all xGovs are triggered, Proposal by Proposal.
+
+    Args:
+        backend (Backend): Network to run on
+        scenario_config (ScenarioConfig): Size of the fleet
+
+    Returns:
+        ThroughputReport: Report of each phase
+    """
+    backend.setup()
+    xgovs = range(scenario_config.xgovs)
+    representatives = range(scenario_config.representatives)
+    proposals = range(scenario_config.proposals)
+
+    def add_votes(xgov: int) -> Callable[[], int]:
+        return lambda: backend.add_votes(xgov, len(proposals))
+
+    def publish_vote(representative: int, proposal: int) -> Callable[[], int]:
+        return lambda: backend.publish_vote(representative, proposal)
+
+    def trigger_vote(xgov: int, proposal: int) -> Callable[[], int]:
+        return lambda: backend.trigger_vote(xgov, proposal)
+
+    report = ThroughputReport(
+        backend=backend.name,
+        timestamp=datetime.now(UTC).isoformat(timespec="seconds"),
+        scenario=scenario_config,
+    )
+    report.operations = [
+        run_phase(ADD_VOTES, [add_votes(xgov) for xgov in xgovs], backend.concurrency),
+        run_phase(
+            PUBLISH_VOTE,
+            [publish_vote(r, p) for r in representatives for p in proposals],
+            backend.concurrency,
+        ),
+        run_phase(
+            TRIGGER_VOTE,
+            [trigger_vote(x, p) for p in proposals for x in xgovs],
+            backend.concurrency,
+        ),
+    ]
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--backend", choices=("localnet", "emulator"), default="localnet"
+    )
+    add_scenario_arguments(parser, DEFAULT_SCENARIO)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+    # The benchmark drives the publication of votes itself
+    scenario_config = replace(get_scenario_config(args), publish_votes=False)
+
+    if args.backend == "emulator":
+        with algopy_testing_context() as context, inner_app_calls(context):
+            report = run_benchmark(
+                EmulatorBackend(context, scenario_config), scenario_config
+            )
+    else:
+        report = run_benchmark(
+            LocalnetBackend(get_localnet_client(), scenario_config), scenario_config
+        )
+
+    print(report.summary())
+    if args.output is not None:
+        args.output.write_text(report.to_json())
+
+
+if __name__ == "__main__":
+    main()
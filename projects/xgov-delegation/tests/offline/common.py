@@ -0,0 +1,61 @@
+from typing import Final
+
+from algopy import Account, Bytes, Global, UInt64, arc4
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.common import abi_types as typ
+from smart_contracts.common import constants as const
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.delegation_registry.contract import DelegationRegistry
+from smart_contracts.xgov_registry_mock.contract import XgovRegistryMock
+from tests.offline.emulator import get_app, pay
+
+# The emulator runs the Python contracts, so any approval program can be loaded
+EMULATED_PROGRAM: Final[Bytes] = Bytes(const.MIN_PROGRAM)
+
+
+def deploy_delegation_registry(
+    context: AlgopyTestContext,
+    xgov_registry_mock: XgovRegistryMock,
+) -> DelegationRegistry:
+    with context.txn.create_group(
+        active_txn_overrides={
+            "global_num_uint": UInt64(regcfg.GLOBAL_UINTS),
+            "global_num_bytes": UInt64(regcfg.GLOBAL_BYTES),
+            "local_num_uint": UInt64(regcfg.LOCAL_UINTS),
+            "local_num_bytes": UInt64(regcfg.LOCAL_BYTES),
+        }
+    ):
+        registry = DelegationRegistry()
+        registry.create(arc4.UInt64(xgov_registry_mock.__app_id__))
+
+    context.ledger.update_account(
+        get_app(registry).address, balance=UInt64(const.MAX_MBR_PER_APP)
+    )
+
+    return registry
+
+
+def initialize_delegation_registry(
+    context: AlgopyTestContext,
+    registry: DelegationRegistry,
+    deployer: Account,
+) -> None:
+    registry.config_delegation_registry(
+        typ.Fees(
+            xgov=arc4.UInt64(regcfg.FEE_VOTE_XGOV),
+            other=arc4.UInt64(regcfg.FEE_VOTE_OTHER),
+        ),
+        arc4.UInt64(regcfg.FEE_REPRESENTATIVE),
+        arc4.UInt64(regcfg.VOTE_TRIGGER_AWARD),
+    )
+
+    for contract in (regcfg.CONTRACT_REPRESENTATIVE_BOX, regcfg.CONTRACT_VOTER_BOX):
+        name = typ.ContractName.from_bytes(contract)
+        registry.init_contract(name, arc4.UInt64(EMULATED_PROGRAM.length))
+        registry.load_contract(name, arc4.UInt64(0), EMULATED_PROGRAM)
+
+    # Prepare first voter
+    registry.prepare_voter(pay(context, deployer, registry, Global.min_balance))
+
+    registry.resume_registry()
@@ -0,0 +1,202 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Bytes, Global, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.common import abi_types as typ
+from smart_contracts.common import constants as const
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.delegation_registry.contract import DelegationRegistry
+from smart_contracts.proposal_mock.contract import ProposalMock
+from smart_contracts.representative.contract import Representative
+from smart_contracts.voter.contract import Voter
+from smart_contracts.xgov_registry_mock.contract import XgovRegistryMock
+from tests.common import (
+    DEFAULT_PROPOSAL_STATUS,
+    DEFAULT_PROPOSAL_VOTE_OPEN_TS,
+    DEFAULT_VOTING_DURATION,
+)
+from tests.offline.common import (
+    deploy_delegation_registry,
+    initialize_delegation_registry,
+)
+from tests.offline.emulator import (
+    get_contract,
+    get_contracts,
+    inner_app_calls,
+    pay,
+)
+
+VOTES = 42
+
+
+@pytest.fixture(autouse=True, scope="function")
+def reset_blockchain_timestamp() -> None:
+    """Offline tests have no LocalNet timestamp to reset"""
+
+
+@pytest.fixture(scope="function")
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx, inner_app_calls(ctx):
+        ctx.set_template_var("entropy", Bytes(b""))
+        yield ctx
+
+
+@pytest.fixture(scope="function")
+def deployer(context: AlgopyTestContext) -> Account:
+    return context.default_sender
+
+
+@pytest.fixture(scope="function")
+def no_role_account(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def xgov_registry_mock(context: AlgopyTestContext) -> XgovRegistryMock:
+    return XgovRegistryMock()
+
+
+@pytest.fixture(scope="function")
+def proposal_mock(
+    context: AlgopyTestContext,
+    xgov_registry_mock: XgovRegistryMock,
+) -> ProposalMock:
+    proposal = get_contract(xgov_registry_mock.create_proposal())
+    assert isinstance(proposal, ProposalMock)
+
+    proposal.set_status(UInt64(DEFAULT_PROPOSAL_STATUS))
+    proposal.set_voting_duration(UInt64(DEFAULT_VOTING_DURATION))
+    proposal.set_vote_open_ts(UInt64(DEFAULT_PROPOSAL_VOTE_OPEN_TS))
+
+    return proposal
+
+
+@pytest.fixture(scope="function")
+def delegation_registry_uninitialized(
+    context: AlgopyTestContext,
+    xgov_registry_mock: XgovRegistryMock,
+) -> DelegationRegistry:
+    return deploy_delegation_registry(context, xgov_registry_mock)
+
+
+@pytest.fixture(scope="function")
+def delegation_registry(
+    context: AlgopyTestContext,
+    delegation_registry_uninitialized: DelegationRegistry,
+    deployer: Account,
+) -> DelegationRegistry:
+    registry = delegation_registry_uninitialized
+    initialize_delegation_registry(context, registry, deployer)
+    return registry
+
+
+@pytest.fixture(scope="function")
+def xgov(
+    context: AlgopyTestContext,
+    xgov_registry_mock: XgovRegistryMock,
+) -> Account:
+    account = context.any.account()
+    xgov_registry_mock.set_xgov_box(
+        arc4.Address(account),
+        typ.XGovBoxValue(
+            voting_address=arc4.Address(account),
+            voted_proposals=arc4.UInt64(0),
+            last_vote_timestamp=arc4.UInt64(0),
+            subscription_round=arc4.UInt64(0),
+        ),
+    )
+    return account
+
+
+@pytest.fixture(scope="function")
+def available_voter(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+) -> Voter:
+    (voter,) = get_contracts(context, Voter)
+    return voter
+
+
+@pytest.fixture(scope="function")
+def voter(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    available_voter: Voter,
+    xgov: Account,
+) -> Voter:
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter_id = delegation_registry.register_voter(
+            pay(context, xgov, delegation_registry, Global.min_balance),
+            arc4.Address(xgov),
+            UInt64(available_voter.__app_id__),
+        )
+
+    voter = get_contract(voter_id)
+    assert isinstance(voter, Voter)
+    return voter
+
+
+@pytest.fixture(scope="function")
+def representative_account(context: AlgopyTestContext) -> Account:
+    return context.any.account()
+
+
+@pytest.fixture(scope="function")
+def representative(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    representative_account: Account,
+) -> Representative:
+    with context.txn.create_group(
+        active_txn_overrides={"sender": representative_account}
+    ):
+        representative_id = delegation_registry.register_representative(
+            pay(
+                context,
+                representative_account,
+                delegation_registry,
+                Global.min_balance + regcfg.FEE_REPRESENTATIVE,
+            ),
+        )
+
+    representative = get_contract(representative_id)
+    assert isinstance(representative, Representative)
+    return representative
+
+
+@pytest.fixture(scope="function")
+def proposal_voter(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    proposal_mock: ProposalMock,
+    xgov: Account,
+    voter: Voter,
+    representative: Representative,
+    representative_account: Account,
+) -> ProposalMock:
+    proposal_id = arc4.UInt64(proposal_mock.__app_id__)
+    proposal_mock.set_voter_box(arc4.Address(xgov), arc4.UInt64(VOTES))
+
+    with context.txn.create_group(
+        active_txn_overrides={"sender": representative_account}
+    ):
+        # The emulator does not track the MBR of boxes
+        representative.publish_vote(
+            pay(context, representative_account, representative, 0),
+            proposal_id,
+            typ.Vote(approval=arc4.UInt64(const.PPM), rejection=arc4.UInt64(0)),
+        )
+
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.set_representative(arc4.UInt64(representative.__app_id__))
+
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        delegation_registry.add_votes(
+            pay(context, xgov, delegation_registry, regcfg.FEE_VOTE_XGOV),
+            arc4.Address(xgov),
+            arc4.UInt64(1),
+        )
+
+    return proposal_mock
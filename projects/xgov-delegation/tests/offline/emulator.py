@@ -0,0 +1,228 @@
+"""
+Inner app calls for the `algorand-python-testing` emulator.
+
+The emulator executes one contract per transaction: `arc4.abi_call` and `arc4.arc4_create`
+are left unimplemented. `inner_app_calls` routes them to the contract instances living in
+the emulated ledger, so DelegationRegistry, Voter, Representative and the mocks can call
+each other as they do on the AVM: the callee runs in its own transaction group, with the
+caller application as sender and as `Global.caller_application_id`.
+The private state of the library is reached only through `tests.offline.internals`.
+"""
+
+import contextlib
+import inspect
+import sys
+import typing
+from collections.abc import Callable, Iterator
+
+from algopy import (
+    Account,
+    Application,
+    ARC4Contract,
+    OnCompleteAction,
+    UInt64,
+    gtxn,
+    itxn,
+)
+from algopy_testing import AlgopyTestContext
+
+from tests.offline import internals
+
+C = typing.TypeVar("C", bound=ARC4Contract)
+
+Method = Callable[..., typing.Any] | type[ARC4Contract] | str
+
+# `arc4.abi_call` schema arguments, named as the transaction fields they set
+SCHEMA_FIELDS: typing.Final[tuple[str, ...]] = (
+    "global_num_uint",
+    "global_num_bytes",
+    "local_num_uint",
+    "local_num_bytes",
+    "extra_program_pages",
+)
+
+
+def get_contract(app: Application | UInt64 | int) -> ARC4Contract:
+    """Return the contract instance deployed as `app` in the emulated ledger."""
+    app_id = int(app.id if isinstance(app, Application) else app)
+    contract = internals.get_app_contract(app_id)
+    assert isinstance(contract, ARC4Contract), f"No contract deployed as app {app_id}"
+    return contract
+
+
+def get_contracts(context: AlgopyTestContext, contract_type: type[C]) -> list[C]:
+    """Return the contracts of type `contract_type` deployed in the emulated ledger, by app ID."""
+    contracts = (
+        internals.get_app_contract(app_id)
+        for app_id in sorted(internals.get_app_ids(context))
+    )
+    return [contract for contract in contracts if isinstance(contract, contract_type)]
+
+
+def get_last_contract(context: AlgopyTestContext) -> ARC4Contract:
+    """Return the contract deployed last in the emulated ledger, e.g. by an inner call."""
+    return get_contract(internals.get_app_ids(context)[-1])
+
+
+def get_app_logs(context: AlgopyTestContext) -> list[tuple[int, bytes]]:
+    """Return the logs of the emulated app calls and their app IDs, in the order their groups completed."""
+    return [
+        (int(txn.fields["app_id"].id), log)
+        for group in internals.get_completed_groups(context)
+        for txn in group
+        if isinstance(txn, gtxn.ApplicationCallTransaction)
+        for log in txn.fields.get("logs", ())
+    ]
+
+
+def get_app(contract: ARC4Contract) -> Application:
+    return Application(contract.__app_id__)  # type: ignore[attr-defined]
+
+
+def pay(
+    context: AlgopyTestContext,
+    sender: Account,
+    receiver: ARC4Contract,
+    amount: UInt64 | int,
+) -> gtxn.PaymentTransaction:
+    """Build a payment to the account of a contract, to be grouped with an app call."""
+    return context.any.txn.payment(
+        sender=sender,
+        receiver=get_app(receiver).address,
+        amount=UInt64(int(amount)),
+    )
+
+
+def _is_create_method(fn: Callable[..., typing.Any]) -> bool:
+    try:
+        return internals.get_arc4_metadata(fn).create in ("require", "allow")
+    except (AttributeError, ValueError):
+        return False
+
+
+def _resolve_method(method: Method, app_id: int) -> tuple[type[ARC4Contract], str]:
+    if isinstance(method, type):
+        # `arc4_create(Contract)` calls the create method of the contract
+        name = next(
+            name
+            for name, fn in inspect.getmembers(method, inspect.isfunction)
+            if _is_create_method(fn)
+        )
+        return method, name
+    if isinstance(method, str):
+        return type(get_contract(app_id)), method.split("(")[0]
+    if app_id:
+        # Interfaces (e.g. IProposal) resolve to the contract deployed as the app
+        return type(get_contract(app_id)), method.__name__
+    owner = getattr(sys.modules[method.__module__], method.__qualname__.split(".")[0])
+    return owner, method.__name__
+
+
+def _coerce(value: object, annotation: object) -> object:
+    """Convert between native and ARC-4 values, as the ABI encoding does on the AVM."""
+    if not isinstance(annotation, type) or isinstance(value, annotation):
+        return value
+    if issubclass(annotation, Application):
+        return Application(int(typing.cast(UInt64, value)))
+    if issubclass(annotation, internals.ABIEncoded):
+        return annotation(value)  # type: ignore[call-arg]
+    return getattr(value, "native", value)
+
+
+def _copy(value: object) -> object:
+    if isinstance(value, tuple):
+        return tuple(_copy(item) for item in value)
+    copy = getattr(value, "copy", None)
+    return copy() if callable(copy) else value
+
+
+@contextlib.contextmanager
+def _inner_group(
+    context: AlgopyTestContext, overrides: dict[str, object]
+) -> Iterator[None]:
+    caller = internals.get_active_app()
+    global_fields = internals.get_global_fields(context)
+    outer_caller_id = global_fields.get("caller_application_id")
+
+    context.ledger.patch_global_fields(caller_application_id=caller.id)
+    try:
+        with internals.suspend_active_group(context), context.txn.create_group(
+            active_txn_overrides={"sender": caller.address, **overrides}  # type: ignore[typeddict-item]
+        ):
+            yield
+    finally:
+        if outer_caller_id is None:
+            global_fields.pop("caller_application_id", None)
+        else:
+            global_fields["caller_application_id"] = outer_caller_id
+
+
+def app_call(
+    context: AlgopyTestContext,
+    method: Method,
+    /,
+    *args: object,
+    app_id: Application | UInt64 | int = 0,
+    on_completion: OnCompleteAction | None = None,
+    **kwargs: object,
+) -> object:
+    """
+    Execute an inner app call issued by the active contract.
+
+    Args:
+        context (AlgopyTestContext): The emulator context
+        method (Method): ABI method, signature or contract class (for `arc4_create`)
+        *args (object): ABI arguments of the method
+        app_id (Application | UInt64 | int): Called app, 0 to create a new one
+        on_completion (OnCompleteAction | None): On completion action of the call
+        **kwargs (object): Other `arc4.abi_call` fields, schema ones are applied on creation
+
+    Returns:
+        object: The inner transaction, preceded by the ABI return value if not void
+    """
+    app_id = int(app_id.id if isinstance(app_id, Application) else app_id)
+    owner, name = _resolve_method(method, app_id)
+    fn = inspect.unwrap(getattr(owner, name))
+    hints = typing.get_type_hints(fn)
+    parameters = list(inspect.signature(fn).parameters)[1:]
+    call_args = [
+        _coerce(arg, hints.get(parameter)) for arg, parameter in zip(args, parameters)
+    ]
+
+    overrides: dict[str, object] = {
+        field: UInt64(int(typing.cast(int, kwargs[field])))
+        for field in SCHEMA_FIELDS
+        if field in kwargs
+    }
+    if on_completion is not None:
+        overrides["on_completion"] = on_completion
+    if app_id:
+        overrides["app_id"] = Application(app_id)
+
+    with _inner_group(context, overrides):
+        contract = get_contract(app_id) if app_id else owner()
+        value = getattr(contract, name)(*call_args)
+    callee = get_app(contract)
+
+    if internals.get_arc4_metadata(fn).allow_actions == [
+        OnCompleteAction.DeleteApplication
+    ]:
+        internals.delete_app(context, int(callee.id))
+
+    txn = itxn.ApplicationCall(app_id=Application(app_id)).submit()
+    if not app_id:
+        txn.fields["created_app"] = callee
+    return txn if value is None else (_copy(value), txn)
+
+
+@contextlib.contextmanager
+def inner_app_calls(context: AlgopyTestContext) -> Iterator[None]:
+    """Route `arc4.abi_call` and `arc4.arc4_create` to the contracts deployed in `context`."""
+
+    def dispatch(
+        self: object, method: Method, /, *args: object, **kwargs: object
+    ) -> object:
+        return app_call(context, method, *args, **kwargs)
+
+    with internals.patch_abi_call(dispatch):
+        yield
@@ -0,0 +1,92 @@
+"""
+Private internals of `algorand-python-testing` used by the emulator.
+
+The library exposes neither the apps of the emulated ledger, nor the completed transaction
+groups, nor a hook for `arc4.abi_call`, so the emulator reaches into its private state.
+Every such access lives here, and the module refuses to load with any other version of
+the library than the one it was written against.
+"""
+
+import contextlib
+import importlib.metadata
+import typing
+from collections.abc import Callable, Iterator
+
+SUPPORTED_VERSION: typing.Final[str] = "1.1.0"
+
+_version = importlib.metadata.version("algorand-python-testing")
+if _version != SUPPORTED_VERSION:
+    raise ImportError(
+        f"tests/offline relies on internals of algorand-python-testing {SUPPORTED_VERSION}, "
+        f"found {_version}: check tests/offline/internals.py against it before upgrading"
+    )
+
+import pytest  # noqa: E402
+from _algopy_testing.arc4 import _ABIEncoded as ABIEncoded  # noqa: E402
+from _algopy_testing.context_helpers import lazy_context  # noqa: E402
+from _algopy_testing.decorators.arc4 import get_arc4_metadata  # noqa: E402
+from algopy import Application, arc4, gtxn  # noqa: E402
+from algopy_testing import AlgopyTestContext  # noqa: E402
+
+__all__ = [
+    "SUPPORTED_VERSION",
+    "ABIEncoded",
+    "delete_app",
+    "get_active_app",
+    "get_app_contract",
+    "get_app_ids",
+    "get_arc4_metadata",
+    "get_completed_groups",
+    "get_global_fields",
+    "patch_abi_call",
+    "suspend_active_group",
+]
+
+
+def get_app_contract(app_id: int) -> object:
+    """Return the contract instance deployed as `app_id`, if any."""
+    return lazy_context.get_app_data(app_id).contract
+
+
+def get_app_ids(context: AlgopyTestContext) -> list[int]:
+    """Return the IDs of the apps of the emulated ledger, in the order they were deployed."""
+    return list(context.ledger._app_data)
+
+
+def get_active_app() -> Application:
+    return lazy_context.active_app
+
+
+def delete_app(context: AlgopyTestContext, app_id: int) -> None:
+    del context.ledger._app_data[app_id]
+
+
+def get_completed_groups(
+    context: AlgopyTestContext,
+) -> list[list[gtxn.TransactionBase]]:
+    """Return the transactions of the completed groups, in the order they completed."""
+    return [list(group.txns) for group in context.txn._groups]
+
+
+def get_global_fields(context: AlgopyTestContext) -> dict[str, object]:
+    """Return the mutable global fields of the emulated ledger."""
+    return typing.cast(dict[str, object], context.ledger._global_fields)
+
+
+@contextlib.contextmanager
+def suspend_active_group(context: AlgopyTestContext) -> Iterator[None]:
+    """Suspend the active transaction group, so that an inner call opens its own group."""
+    outer_group = context.txn._active_group
+    context.txn._active_group = None
+    try:
+        yield
+    finally:
+        context.txn._active_group = outer_group
+
+
+@contextlib.contextmanager
+def patch_abi_call(dispatch: Callable[..., object]) -> Iterator[None]:
+    """Route every `arc4.abi_call` and `arc4.arc4_create` to `dispatch`."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(type(arc4.abi_call), "__call__", dispatch)
+        yield
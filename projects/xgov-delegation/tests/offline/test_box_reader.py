@@ -0,0 +1,30 @@
+from algosdk.abi import ABIType
+from algosdk.encoding import decode_address
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    APP_SPEC as DELEGATION_REGISTRY_SPEC,
+)
+from smart_contracts.artifacts.representative.representative_client import (
+    APP_SPEC as REPRESENTATIVE_SPEC,
+)
+from smart_contracts.common.box_reader import BoxMapType
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.representative import config as repcfg
+from tests.offline.test_fleet import XGOVS
+
+
+def test_box_map_type_address_key() -> None:
+    box_map = BoxMapType.from_spec(DELEGATION_REGISTRY_SPEC, "voters_box")
+
+    assert box_map.prefix == regcfg.VOTERS_MAP_PREFIX
+    assert box_map.decode_key(decode_address(XGOVS[0])) == XGOVS[0]
+    assert box_map.decode_value((1234).to_bytes(8)) == 1234
+
+
+def test_box_map_type_struct_value() -> None:
+    box_map = BoxMapType.from_spec(REPRESENTATIVE_SPEC, "proposals_vote_box")
+    vote = ABIType.from_string("(uint64,uint64)").encode([600_000, 400_000])
+
+    assert box_map.prefix == repcfg.PROPOSALS_VOTE_MAP_PREFIX
+    assert box_map.decode_key((2000).to_bytes(8)) == 2000
+    assert box_map.decode_value(vote) == {"approval": 600_000, "rejection": 400_000}
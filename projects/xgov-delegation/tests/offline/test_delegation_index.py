@@ -0,0 +1,64 @@
+from smart_contracts.common.delegation_index import DelegationIndex
+from smart_contracts.common.fleet import FleetTable
+from tests.offline.test_fleet import XGOVS, make_voter
+
+PROPOSAL = 2000
+
+
+def make_index() -> DelegationIndex:
+    fleet = FleetTable.from_contracts(
+        [
+            make_voter(11, XGOVS[0], 1),
+            make_voter(12, XGOVS[1], 1),
+            make_voter(13, XGOVS[2], 2),
+            make_voter(14, XGOVS[3], 0),
+        ]
+    )
+    return DelegationIndex.from_fleet(
+        fleet,
+        {PROPOSAL: {XGOVS[0]: 10, XGOVS[1]: 20, XGOVS[2]: 25, XGOVS[3]: 40}},
+    )
+
+
+def test_from_fleet() -> None:
+    index = make_index()
+
+    assert index.voters_of == {1: {11, 12}, 2: {13}}
+    assert index.get_weight(PROPOSAL, 1) == 30
+    assert index.get_weight(PROPOSAL, 2) == 25
+    assert index.get_weight(PROPOSAL, 0) == 0
+    assert index.top(PROPOSAL, 1) == [(1, 30)]
+
+
+def test_incremental_updates() -> None:
+    index = make_index()
+
+    index.set_representative(12, 2)
+    assert index.voters_of == {1: {11}, 2: {12, 13}}
+    assert index.top(PROPOSAL, 2) == [(2, 45), (1, 10)]
+
+    index.set_representative(14, 1)
+    index.set_votes(PROPOSAL, 11, 0)
+    assert index.top(PROPOSAL, 2) == [(2, 45), (1, 40)]
+
+    index.remove_voter(13)
+    assert index.top(PROPOSAL, 2) == [(1, 40), (2, 20)]
+
+    index.set_representative(14, 0)
+    assert index.voters_of == {1: {11}, 2: {12}}
+    assert index.top(PROPOSAL, 2) == [(2, 20)]
+
+    index.remove_proposal(PROPOSAL)
+    assert index.top(PROPOSAL, 2) == []
+
+
+def test_weights_match_rebuild() -> None:
+    index = make_index()
+    index.set_representative(11, 2)
+    index.set_votes(PROPOSAL + 1, 13, 7)
+    index.set_representative(13, 1)
+
+    assert index.get_weight(PROPOSAL, 1) == 20 + 25
+    assert index.get_weight(PROPOSAL, 2) == 10
+    assert index.get_weight(PROPOSAL + 1, 1) == 7
+    assert index.get_weight(PROPOSAL + 1, 2) == 0
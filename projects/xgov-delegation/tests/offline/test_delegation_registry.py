@@ -0,0 +1,707 @@
+import pytest
+from algopy import Account, Global, TransactionType, UInt64, arc4
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.common import constants as const
+from smart_contracts.common.follower import EVENT_DECODER
+from smart_contracts.common.resources import (
+    get_proposal_voter_box,
+    get_triggered_page_box,
+)
+from smart_contracts.common.triggers import VotedBitmap
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.delegation_registry.contract import DelegationRegistry
+from smart_contracts.errors import std_errors as err
+from smart_contracts.proposal import enums as enm
+from smart_contracts.proposal_mock.contract import ProposalMock
+from smart_contracts.representative.contract import Representative
+from smart_contracts.voter import config as voter_cfg
+from smart_contracts.voter.contract import Voter
+from smart_contracts.xgov_registry_mock.contract import XgovRegistryMock
+from tests.offline.emulator import (
+    get_app,
+    get_app_logs,
+    get_contract,
+    get_contracts,
+    pay,
+)
+
+
+def test_prepare_voter(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    available_voter: Voter,
+    no_role_account: Account,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.prepare_voter(
+            pay(context, no_role_account, delegation_registry, Global.min_balance)
+        )
+
+    voters = get_contracts(context, Voter)
+    assert len(voters) == 2
+    assert voters[0] is available_voter
+    for voter in voters:
+        assert voter.registry_app.value == get_app(delegation_registry)
+        assert voter.xgov_registry_app.value == (
+            delegation_registry.xgov_registry_app.value
+        )
+        assert voter.xgov_address.value == Global.zero_address
+
+
+def test_register_voter_success(
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    xgov: Account,
+) -> None:
+    assert voter.xgov_address.value == xgov
+    assert voter.manager_address.value == xgov
+    assert delegation_registry.voters_box[arc4.Address(xgov)] == get_app(voter)
+    assert delegation_registry.get_voter_app_id(arc4.Address(xgov)) == (
+        voter.__app_id__,
+        True,
+    )
+
+
+def test_get_voter_app_ids(
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    results = delegation_registry.get_voter_app_ids(
+        arc4.DynamicArray(arc4.Address(xgov), arc4.Address(no_role_account))
+    )
+
+    assert results.length == 2
+    assert results[0].app_id == voter.__app_id__
+    assert results[0].exists
+    assert results[1].app_id == 0
+    assert not results[1].exists
+
+
+def test_register_voter_not_xgov(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    available_voter: Voter,
+    no_role_account: Account,
+) -> None:
+    with (
+        pytest.raises(AssertionError, match=err.NOT_XGOV),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.register_voter(
+            pay(context, no_role_account, delegation_registry, Global.min_balance),
+            arc4.Address(no_role_account),
+            UInt64(available_voter.__app_id__),
+        )
+
+
+def test_register_voter_unauthorized(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    available_voter: Voter,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    with (
+        pytest.raises(AssertionError, match=err.UNAUTHORIZED),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.register_voter(
+            pay(context, no_role_account, delegation_registry, Global.min_balance),
+            arc4.Address(xgov),
+            UInt64(available_voter.__app_id__),
+        )
+
+
+def test_register_voter_already_voter(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    xgov: Account,
+) -> None:
+    with (
+        pytest.raises(AssertionError, match=err.ALREADY_VOTER),
+        context.txn.create_group(active_txn_overrides={"sender": xgov}),
+    ):
+        delegation_registry.register_voter(
+            pay(context, xgov, delegation_registry, Global.min_balance),
+            arc4.Address(xgov),
+            UInt64(voter.__app_id__),
+        )
+
+
+def test_register_representative_success(
+    delegation_registry: DelegationRegistry,
+    representative: Representative,
+    representative_account: Account,
+) -> None:
+    assert representative.representative_address.value == representative_account
+    assert delegation_registry.representatives_box[
+        arc4.Address(representative_account)
+    ] == get_app(representative)
+
+
+def test_sync_xgov_registry(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    representative: Representative,
+) -> None:
+    xgov_registry_app = delegation_registry.xgov_registry_app.value
+    assert representative.xgov_registry_app.value == xgov_registry_app
+    assert voter.get_xgov_registry_id() == xgov_registry_app.id
+
+    del voter.xgov_registry_app.value  # as a Voter created before the cache
+    assert voter.get_xgov_registry_id() == xgov_registry_app.id
+
+    with context.txn.create_group(
+        active_txn_overrides={"sender": get_app(delegation_registry).address}
+    ):
+        voter.sync_xgov_registry(arc4.UInt64(xgov_registry_app.id))
+    assert voter.xgov_registry_app.value == xgov_registry_app
+
+
+def test_sync_xgov_registry_not_creator(
+    voter: Voter,
+    representative: Representative,
+) -> None:
+    with pytest.raises(AssertionError, match=err.NOT_CREATOR):
+        voter.sync_xgov_registry(arc4.UInt64(1))
+    with pytest.raises(AssertionError, match=err.NOT_CREATOR):
+        representative.sync_xgov_registry(arc4.UInt64(1))
+
+
+def test_register_representative_wrong_amount(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    no_role_account: Account,
+) -> None:
+    with (
+        pytest.raises(AssertionError, match=err.WRONG_PAYMENT_AMOUNT),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.register_representative(
+            pay(context, no_role_account, delegation_registry, Global.min_balance),
+        )
+
+
+def test_get_votes(
+    representative: Representative,
+    proposal_voter: ProposalMock,
+) -> None:
+    results = representative.get_votes(
+        arc4.DynamicArray(
+            arc4.UInt64(proposal_voter.__app_id__),
+            arc4.UInt64(proposal_voter.__app_id__ + 1),
+        )
+    )
+
+    assert results.length == 2
+    assert results[0].vote.approval == const.PPM
+    assert results[0].is_valid
+    assert results[1].vote.approval == 0
+    assert not results[1].is_valid
+
+
+def test_add_votes_success(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    xgov: Account,
+) -> None:
+    votes = 3
+    start_votes_left = delegation_registry.votes_left.value
+
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        delegation_registry.add_votes(
+            pay(context, xgov, delegation_registry, votes * regcfg.FEE_VOTE_XGOV),
+            arc4.Address(xgov),
+            arc4.UInt64(votes),
+        )
+
+    assert voter.votes_left.value == votes
+    assert delegation_registry.votes_left.value == start_votes_left + votes
+
+
+def test_add_votes_paused_registry(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    xgov: Account,
+) -> None:
+    delegation_registry.pause_registry()
+
+    with (
+        pytest.raises(AssertionError, match=err.PAUSED_REGISTRY),
+        context.txn.create_group(active_txn_overrides={"sender": xgov}),
+    ):
+        delegation_registry.add_votes(
+            pay(context, xgov, delegation_registry, regcfg.FEE_VOTE_XGOV),
+            arc4.Address(xgov),
+            arc4.UInt64(1),
+        )
+
+
+def test_add_votes_cached_voting_address(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    xgov_registry_mock: XgovRegistryMock,
+    voter: Voter,
+    xgov: Account,
+) -> None:
+    assert voter.voting_address.value == xgov
+    assert voter.voting_address_ts.value > 0
+
+    old_voting_account = context.any.account()
+    new_voting_account = context.any.account()
+
+    def add_votes(sender: Account) -> None:
+        with context.txn.create_group(active_txn_overrides={"sender": sender}):
+            delegation_registry.add_votes(
+                pay(context, sender, delegation_registry, regcfg.FEE_VOTE_OTHER),
+                arc4.Address(xgov),
+                arc4.UInt64(1),
+            )
+
+    xgov_registry_mock.set_voting_account(
+        arc4.Address(xgov), arc4.Address(old_voting_account)
+    )
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.sync_voting_address()
+    assert voter.voting_address.value == old_voting_account
+    add_votes(old_voting_account)
+    assert voter.votes_left.value == 1
+
+    # A new voting address does not match the cache, the xGov box is read
+    xgov_registry_mock.set_voting_account(
+        arc4.Address(xgov), arc4.Address(new_voting_account)
+    )
+    add_votes(new_voting_account)
+    assert voter.votes_left.value == 2
+
+    # The rotated voting address is trusted only while the cache is fresh
+    add_votes(old_voting_account)
+    assert voter.votes_left.value == 3
+    voter.voting_address_ts.value -= regcfg.VOTING_ADDRESS_TTL
+    with pytest.raises(AssertionError, match=err.UNAUTHORIZED):
+        add_votes(old_voting_account)
+    add_votes(new_voting_account)
+    assert voter.votes_left.value == 4
+
+
+def test_sync_voting_address_not_xgov(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    xgov_registry_mock: XgovRegistryMock,
+    voter: Voter,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    xgov_registry_mock.del_xgov_box(arc4.Address(xgov))
+    voter.sync_voting_address()
+    assert voter.voting_address.value == Global.zero_address
+
+    with (
+        pytest.raises(AssertionError, match=err.NOT_XGOV),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.add_votes(
+            pay(context, no_role_account, delegation_registry, regcfg.FEE_VOTE_OTHER),
+            arc4.Address(xgov),
+            arc4.UInt64(1),
+        )
+
+
+def test_trigger_vote_success(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    start_votes_left = delegation_registry.votes_left.value
+    start_trigger_fund = delegation_registry.trigger_fund.value
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+    assert delegation_registry.votes_left.value == start_votes_left - 1
+    assert (
+        delegation_registry.trigger_fund.value
+        == start_trigger_fund - regcfg.VOTE_TRIGGER_AWARD
+    )
+    assert voter.votes_left.value == 0
+
+    # Registry -> Voter -> (Representative, Proposal, xGov Registry -> Proposal)
+    award = context.txn.last_group.last_itxn.payment
+    assert award.receiver == no_role_account
+    assert award.amount == regcfg.VOTE_TRIGGER_AWARD
+
+
+def test_trigger_vote_drops_voted_pair(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    proposal_id = proposal_voter.__app_id__
+    pairs = [(xgov.public_key, proposal_id)]
+    voter_box = get_proposal_voter_box(xgov.public_key)
+
+    def load_bitmap() -> VotedBitmap:
+        bitmap = VotedBitmap([xgov.public_key])
+        voters = (
+            [xgov.public_key]
+            if context.ledger.box_exists(proposal_voter, voter_box)
+            else []
+        )
+        bitmap.set_voters(proposal_id, voters)
+        return bitmap
+
+    assert load_bitmap().filter(pairs) == pairs
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote(arc4.Address(xgov), arc4.UInt64(proposal_id))
+
+    # The Proposal deleted the voter box, so the next group drops the pair
+    assert not context.ledger.box_exists(proposal_voter, voter_box)
+    assert load_bitmap().filter(pairs) == []
+
+
+def register_representative(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+) -> Representative:
+    account = context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": account}):
+        representative_id = delegation_registry.register_representative(
+            pay(
+                context,
+                account,
+                delegation_registry,
+                Global.min_balance + regcfg.FEE_REPRESENTATIVE,
+            ),
+        )
+    representative = get_contract(representative_id)
+    assert isinstance(representative, Representative)
+    return representative
+
+
+def test_trigger_vote_backup_representative(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    representative: Representative,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    # Neither the representative nor the first backup published a vote
+    silent = [register_representative(context, delegation_registry) for _ in range(2)]
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.set_representative(arc4.UInt64(silent[0].__app_id__))
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.set_backup_representatives(
+            arc4.DynamicArray(
+                arc4.UInt64(silent[1].__app_id__),
+                arc4.UInt64(representative.__app_id__),
+            )
+        )
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+    assert voter.votes_left.value == 0
+    (voted,) = [
+        event
+        for _, log in get_app_logs(context)
+        if (event := EVENT_DECODER.decode(log)) is not None
+        and event.name == "VotedByRepresentative"
+    ]
+    assert voted.args["representative_id"] == representative.__app_id__
+
+
+def test_trigger_vote_no_backup_vote(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    silent = [register_representative(context, delegation_registry) for _ in range(2)]
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.set_representative(arc4.UInt64(silent[0].__app_id__))
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.set_backup_representatives(
+            arc4.DynamicArray(arc4.UInt64(silent[1].__app_id__))
+        )
+
+    with (
+        pytest.raises(AssertionError, match=err.COULD_NOT_VOTE),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.trigger_vote(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+
+def test_set_backup_representatives_too_many(
+    context: AlgopyTestContext,
+    voter: Voter,
+    representative: Representative,
+    xgov: Account,
+) -> None:
+    representative_id = arc4.UInt64(representative.__app_id__)
+    with (
+        pytest.raises(AssertionError, match=err.TOO_MANY_BACKUP_REPRESENTATIVES),
+        context.txn.create_group(active_txn_overrides={"sender": xgov}),
+    ):
+        voter.set_backup_representatives(
+            arc4.DynamicArray(
+                *[representative_id] * (voter_cfg.MAX_BACKUP_REPRESENTATIVES + 1)
+            )
+        )
+
+
+def test_trigger_vote_no_votes_left(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+    with (
+        pytest.raises(AssertionError, match=err.NO_VOTES_LEFT),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.trigger_vote(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+
+def test_trigger_vote_vote_invalid(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    representative: Representative,
+    representative_account: Account,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    with context.txn.create_group(
+        active_txn_overrides={"sender": representative_account}
+    ):
+        representative.pause()
+
+    with (
+        pytest.raises(AssertionError, match=err.VOTE_INVALID),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.trigger_vote(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+
+def test_unregister_representative(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    representative: Representative,
+    representative_account: Account,
+) -> None:
+    representative_id = representative.__app_id__
+
+    with context.txn.create_group(
+        active_txn_overrides={"sender": representative_account}
+    ):
+        delegation_registry.unregister_representative()
+
+    assert not context.ledger.app_exists(representative_id)
+    assert (
+        arc4.Address(representative_account)
+        not in delegation_registry.representatives_box
+    )
+
+
+def open_trigger_rewards(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    trigger_account: Account,
+) -> None:
+    # The emulator does not charge the MBR of boxes
+    with context.txn.create_group(active_txn_overrides={"sender": trigger_account}):
+        delegation_registry.open_trigger_rewards(
+            pay(context, trigger_account, delegation_registry, 0)
+        )
+
+
+def test_trigger_vote_to_ledger(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    open_trigger_rewards(context, delegation_registry, no_role_account)
+    start_trigger_fund = delegation_registry.trigger_fund.value
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote_to_ledger(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+    # The award is credited instead of paid, and still held in the trigger fund
+    assert voter.votes_left.value == 0
+    ledger = arc4.Address(no_role_account)
+    assert delegation_registry.trigger_rewards_box[ledger] == regcfg.VOTE_TRIGGER_AWARD
+    assert delegation_registry.trigger_rewards.value == regcfg.VOTE_TRIGGER_AWARD
+    assert delegation_registry.trigger_fund.value == start_trigger_fund
+    itxns = [itxn for group in context.txn.last_group.itxn_groups for itxn in group]
+    assert itxns
+    assert all(itxn.type != TransactionType.Payment for itxn in itxns)
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        claimed = delegation_registry.claim_trigger_rewards()
+
+    assert claimed == regcfg.VOTE_TRIGGER_AWARD
+    award = context.txn.last_group.last_itxn.payment
+    assert award.receiver == no_role_account
+    assert award.amount == regcfg.VOTE_TRIGGER_AWARD
+    assert delegation_registry.trigger_rewards_box[ledger] == 0
+    assert delegation_registry.trigger_rewards.value == 0
+    assert delegation_registry.trigger_fund.value == start_trigger_fund - claimed
+
+    with (
+        pytest.raises(AssertionError, match=err.INSUFFICIENT_FUNDS),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.claim_trigger_rewards()
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.close_trigger_rewards()
+
+    assert ledger not in delegation_registry.trigger_rewards_box
+
+
+def test_trigger_vote_to_ledger_not_opened(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    with (
+        pytest.raises(AssertionError, match=err.NO_TRIGGER_REWARDS),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.trigger_vote_to_ledger(
+            arc4.Address(xgov),
+            arc4.UInt64(proposal_voter.__app_id__),
+        )
+
+    open_trigger_rewards(context, delegation_registry, no_role_account)
+    with (
+        pytest.raises(AssertionError, match=err.TRIGGER_REWARDS_OPENED),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.open_trigger_rewards(
+            pay(context, no_role_account, delegation_registry, 0)
+        )
+
+
+def test_trigger_vote_grouped_marks_triggered(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    open_trigger_rewards(context, delegation_registry, no_role_account)
+    proposal_id = arc4.UInt64(proposal_voter.__app_id__)
+
+    page_key = get_triggered_page_box(
+        proposal_voter.__app_id__, voter.index.value.value
+    )
+
+    # A lone call has no reference slot for the bitmap page
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote(arc4.Address(xgov), proposal_id)
+    assert not context.ledger.box_exists(delegation_registry, page_key)
+
+    # Grouped calls share the bitmap of trigger_vote_to_ledger, the Proposal deleted the
+    # voter box of the first vote
+    proposal_voter.set_voter_box(arc4.Address(xgov), arc4.UInt64(1))
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        delegation_registry.add_votes(
+            pay(context, xgov, delegation_registry, regcfg.FEE_VOTE_XGOV),
+            arc4.Address(xgov),
+            arc4.UInt64(1),
+        )
+    call = context.txn.defer_app_call(
+        delegation_registry.trigger_vote, arc4.Address(xgov), proposal_id
+    )
+    with context.txn.create_group([context.any.txn.payment(), call]):
+        call.submit()
+    assert context.ledger.box_exists(delegation_registry, page_key)
+    with (
+        pytest.raises(AssertionError, match=err.ALREADY_TRIGGERED),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.trigger_vote_to_ledger(arc4.Address(xgov), proposal_id)
+
+
+def test_trigger_vote_to_ledger_duplicate(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    open_trigger_rewards(context, delegation_registry, no_role_account)
+    proposal_id = arc4.UInt64(proposal_voter.__app_id__)
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote_to_ledger(arc4.Address(xgov), proposal_id)
+
+    # Duplicates fail on the bitmap, before the Voter checks its votes left
+    with (
+        pytest.raises(AssertionError, match=err.ALREADY_TRIGGERED),
+        context.txn.create_group(active_txn_overrides={"sender": no_role_account}),
+    ):
+        delegation_registry.trigger_vote_to_ledger(arc4.Address(xgov), proposal_id)
+
+    assert voter.index.value > 0
+    page = arc4.UInt64(voter.index.value // regcfg.TRIGGERED_PAGE_BITS)
+    proposal_voter.set_status(UInt64(enm.STATUS_VOTING))
+    with pytest.raises(AssertionError, match=err.PROPOSAL_VOTING):
+        delegation_registry.delete_triggered_page(proposal_id, page)
+
+    proposal_voter.set_status(UInt64(enm.STATUS_APPROVED))
+    delegation_registry.delete_triggered_page(proposal_id, page)
+
+    with pytest.raises(AssertionError, match=err.NO_TRIGGERED_PAGE):
+        delegation_registry.delete_triggered_page(proposal_id, page)
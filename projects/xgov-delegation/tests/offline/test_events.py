@@ -0,0 +1,145 @@
+from algopy import Account, arc4
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.artifacts.delegation_registry.delegation_registry_client import (
+    APP_SPEC as DELEGATION_REGISTRY_SPEC,
+)
+from smart_contracts.artifacts.representative.representative_client import (
+    APP_SPEC as REPRESENTATIVE_SPEC,
+)
+from smart_contracts.artifacts.voter.voter_client import APP_SPEC as VOTER_SPEC
+from smart_contracts.common import constants as const
+from smart_contracts.common.arc28 import Event, EventDecoder
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.delegation_registry.contract import DelegationRegistry
+from smart_contracts.proposal_mock.contract import ProposalMock
+from smart_contracts.representative.contract import Representative
+from smart_contracts.voter.contract import Voter
+from tests.offline.conftest import VOTES
+from tests.offline.emulator import get_app_logs
+
+DECODER = EventDecoder([DELEGATION_REGISTRY_SPEC, VOTER_SPEC, REPRESENTATIVE_SPEC])
+
+
+def get_events(context: AlgopyTestContext) -> list[Event]:
+    return DECODER.decode_logs(log for _, log in get_app_logs(context))
+
+
+def test_every_state_changing_method_declares_events() -> None:
+    for app_spec in (DELEGATION_REGISTRY_SPEC, VOTER_SPEC, REPRESENTATIVE_SPEC):
+        for method in app_spec.methods:
+            # Lifecycle of the Voter and Representative apps is logged by the registry
+            if method.readonly or method.name in ("create", "update", "delete"):
+                continue
+            assert method.events, f"{app_spec.name}.{method.name} emits no event"
+
+
+def test_delegation_events(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    representative: Representative,
+    representative_account: Account,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    proposal_id = proposal_voter.__app_id__
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote(arc4.Address(xgov), arc4.UInt64(proposal_id))
+
+    events = {event.name: event.args for event in get_events(context)}
+
+    assert events["VoterRegistered"] == {
+        "xgov_address": str(xgov),
+        "voter_id": voter.__app_id__,
+    }
+    assert events["XGovAssigned"] == {
+        "xgov_address": str(xgov),
+        "manager_address": str(xgov),
+    }
+    assert events["RepresentativeRegistered"] == {
+        "representative_address": str(representative_account),
+        "representative_id": representative.__app_id__,
+    }
+    assert events["VotePublished"] == {
+        "representative_address": str(representative_account),
+        "proposal_id": proposal_id,
+        "vote": [const.PPM, 0],
+    }
+    assert events["RepresentativeSet"] == {
+        "xgov_address": str(xgov),
+        "representative_id": representative.__app_id__,
+    }
+    assert events["VotesPaid"] == {
+        "xgov_address": str(xgov),
+        "votes": 1,
+        "fee": regcfg.FEE_VOTE_XGOV,
+    }
+    assert events["VotesAdded"] == {
+        "xgov_address": str(xgov),
+        "votes": 1,
+        "votes_left": 1,
+    }
+    assert events["VotedByRepresentative"] == {
+        "xgov_address": str(xgov),
+        "proposal_id": proposal_id,
+        "representative_id": representative.__app_id__,
+        "approvals": VOTES,
+        "rejections": 0,
+        "votes_left": 0,
+    }
+    assert events["VoteTriggered"] == {
+        "xgov_address": str(xgov),
+        "proposal_id": proposal_id,
+        "trigger_award": regcfg.VOTE_TRIGGER_AWARD,
+    }
+
+
+def test_unregister_events(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    representative: Representative,
+    representative_account: Account,
+    xgov: Account,
+) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        delegation_registry.unregister_voter(arc4.Address(xgov))
+    with context.txn.create_group(
+        active_txn_overrides={"sender": representative_account}
+    ):
+        delegation_registry.unregister_representative()
+
+    events = get_events(context)[-2:]
+
+    assert events == [
+        Event(
+            name="VoterUnregistered",
+            args={"xgov_address": str(xgov), "voter_id": voter.__app_id__},
+        ),
+        Event(
+            name="RepresentativeUnregistered",
+            args={
+                "representative_address": str(representative_account),
+                "representative_id": representative.__app_id__,
+            },
+        ),
+    ]
+
+
+def test_pause_events(
+    context: AlgopyTestContext,
+    representative: Representative,
+    representative_account: Account,
+) -> None:
+    for method in (representative.pause, representative.resume):
+        with context.txn.create_group(
+            active_txn_overrides={"sender": representative_account}
+        ):
+            method()
+
+    assert [event.args["paused"] for event in get_events(context)[-2:]] == [
+        True,
+        False,
+    ]
@@ -0,0 +1,61 @@
+from algosdk.account import generate_account
+from algosdk.encoding import decode_address
+
+from smart_contracts.common.fast_builder import RegistryCallBuilder
+from smart_contracts.common.resources import AppCallResources
+from smart_contracts.delegation_registry import config as regcfg
+from tests.load.build_benchmark import (
+    REGISTRY_ID,
+    SUGGESTED_PARAMS,
+    build_with_fast_builder,
+    build_with_typed_client,
+    get_triggers,
+    run_build_benchmark,
+)
+
+
+def test_trigger_vote_as_typed_client() -> None:
+    sender = generate_account()[1]
+    triggers = get_triggers(3)
+
+    typed = build_with_typed_client(sender, triggers)
+    fast = build_with_fast_builder(sender, triggers)
+
+    for typed_txn, fast_txn in zip(typed, fast, strict=True):
+        assert fast_txn.app_args == typed_txn.app_args
+        assert fast_txn.fee == typed_txn.fee
+        assert fast_txn.index == typed_txn.index
+        assert fast_txn.sender == typed_txn.sender
+
+
+def test_trigger_vote_resources() -> None:
+    sender, xgov = generate_account()[1], generate_account()[1]
+    builder = RegistryCallBuilder(REGISTRY_ID, sender, SUGGESTED_PARAMS)
+
+    txn = builder.trigger_vote(
+        xgov, 2000, AppCallResources(foreign_apps=(2000, 3000), boxes=((2000, b"V"),))
+    )
+
+    assert txn.foreign_apps == [2000, 3000]
+    assert [(box.app_index, box.name) for box in txn.boxes] == [
+        (0, regcfg.VOTERS_MAP_PREFIX + decode_address(xgov)),
+        (1, b"V"),
+    ]
+
+
+def test_add_votes_group() -> None:
+    sender, xgov = generate_account()[1], generate_account()[1]
+    builder = RegistryCallBuilder(REGISTRY_ID, sender, SUGGESTED_PARAMS)
+
+    payment, call = builder.add_votes(xgov, 2, 2 * regcfg.FEE_VOTE_XGOV)
+
+    assert payment.amt == 2 * regcfg.FEE_VOTE_XGOV
+    assert payment.group == call.group is not None
+    assert call.app_args[2] == (2).to_bytes(8)
+
+
+def test_run_build_benchmark() -> None:
+    report = run_build_benchmark(10)
+
+    assert report.calls == 10
+    assert report.speedup > 0
@@ -0,0 +1,102 @@
+from algosdk.account import generate_account
+from algosdk.constants import ZERO_ADDRESS
+
+from smart_contracts.common.fleet import FleetTable
+from smart_contracts.common.helpers import Representative, Voter, decode_uint64_array
+
+REGISTRY_APP = 1000
+MANAGER = generate_account()[1]
+XGOVS = [generate_account()[1] for _ in range(4)]
+
+
+def make_voter(app_id: int, xgov_address: str, representative_app: int) -> Voter:
+    return Voter(
+        id=app_id,
+        xgov_address=xgov_address,
+        registry_app=REGISTRY_APP,
+        representative_app=representative_app,
+        window_ts=app_id * 100,
+        votes_left=app_id % 10,
+        manager_address=MANAGER if xgov_address != ZERO_ADDRESS else ZERO_ADDRESS,
+    )
+
+
+def make_fleet() -> FleetTable:
+    return FleetTable.from_contracts(
+        [
+            Representative(
+                id=1,
+                representative_address=MANAGER,
+                registry_app=REGISTRY_APP,
+                paused=0,
+            ),
+            Representative(
+                id=2,
+                representative_address=MANAGER,
+                registry_app=REGISTRY_APP,
+                paused=1,
+            ),
+            make_voter(11, XGOVS[0], 1),
+            make_voter(12, XGOVS[1], 1),
+            make_voter(13, XGOVS[2], 2),
+            make_voter(14, XGOVS[3], 0),
+            make_voter(15, ZERO_ADDRESS, 0),
+        ]
+    )
+
+
+def test_fleet_columns() -> None:
+    fleet = make_fleet()
+
+    assert len(fleet) == 5
+    assert list(fleet.voter_ids) == [11, 12, 13, 14, 15]
+    assert list(fleet.representative_ids) == [1, 2]
+    # Zero address, manager and xGovs are interned once
+    assert len(fleet.addresses) == 2 + len(XGOVS)
+    assert fleet.get_voter(1, REGISTRY_APP) == make_voter(12, XGOVS[1], 1)
+
+
+def test_fleet_aggregates() -> None:
+    fleet = make_fleet()
+
+    assert fleet.total_votes_left() == 1 + 2 + 3 + 4 + 5
+    assert fleet.unassigned_voters() == [15]
+    assert fleet.active_representatives() == [1]
+    assert fleet.delegation_fan_in() == {1: 2, 2: 1, 0: 2}
+    assert fleet.votes_left_by_representative() == {1: 3, 2: 3, 0: 9}
+    assert fleet.window_distribution(bin_width=200) == {1000: 1, 1200: 2, 1400: 2}
+
+    # The NumPy views of the aggregates are released, so the columns can still grow
+    fleet.add_voter(make_voter(16, ZERO_ADDRESS, 2))
+    assert fleet.unassigned_voters() == [15, 16]
+    assert fleet.votes_left_by_representative() == {1: 3, 2: 9, 0: 9}
+
+
+def test_find_voter() -> None:
+    fleet = make_fleet()
+
+    assert fleet.find_voter(XGOVS[2]) == 2
+    assert fleet.find_voter(ZERO_ADDRESS) is None
+    assert fleet.find_voter(MANAGER) is None
+    assert fleet.find_voter(generate_account()[1]) is None
+
+
+def test_fleet_backup_representatives() -> None:
+    voter = make_voter(11, XGOVS[0], 1)
+    voter.backup_representatives = decode_uint64_array(
+        (2).to_bytes(2) + (2).to_bytes(8) + (3).to_bytes(8)
+    )
+    fleet = FleetTable.from_contracts([voter, make_voter(12, XGOVS[1], 1)])
+
+    assert fleet.backup_representatives == {11: (2, 3)}
+    assert fleet.get_voter(0).backup_representatives == (2, 3)
+    assert fleet.get_voter(1).backup_representatives == ()
+
+
+def test_fleet_memory_is_flat() -> None:
+    fleet = FleetTable.from_contracts(
+        make_voter(app_id, XGOVS[app_id % len(XGOVS)], 1) for app_id in range(1, 10_001)
+    )
+
+    # 5 uint64 and 2 address index columns per Voter
+    assert fleet.nbytes() == 10_000 * (5 * 8 + 2 * 4)
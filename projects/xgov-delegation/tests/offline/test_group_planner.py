@@ -0,0 +1,139 @@
+from algosdk import transaction
+from algosdk.constants import TX_GROUP_LIMIT
+
+from smart_contracts.common import constants as const
+from smart_contracts.common.fast_builder import (
+    TRIGGER_VOTE_INNER_TXNS,
+    TRIGGER_VOTE_TO_LEDGER_INNER_TXNS,
+    RegistryCallBuilder,
+)
+from smart_contracts.common.group_planner import GroupPlanner, layout_references
+from smart_contracts.common.resources import (
+    get_trigger_rewards_box,
+    get_triggered_page_box,
+)
+from tests.load.build_benchmark import SUGGESTED_PARAMS
+from tests.offline.test_fleet import MANAGER, REGISTRY_APP, XGOVS
+from tests.offline.test_resources import PROPOSAL, make_resolver
+
+
+def test_layout_references() -> None:
+    resolver = make_resolver()
+    resources = [resolver.trigger_vote(xgov, PROPOSAL) for xgov in XGOVS[:2]]
+
+    layout = layout_references(resources, 2)
+    assert layout is not None
+    # Representative, Proposal and xGov Registry are referenced once, with their boxes
+    apps = [app_id for call in layout for app_id in call.foreign_apps]
+    assert sorted(apps) == sorted({1, 11, 12, PROPOSAL, resolver.xgov_registry_id})
+    for call in layout:
+        assert all(app_id in call.foreign_apps for app_id, _ in call.boxes)
+        assert len(call.foreign_apps) + len(call.boxes) < const.MAX_TXN_REFERENCES
+    # Two triggers do not fit in a single call
+    assert layout_references(resources, 1) is None
+
+
+def test_plan() -> None:
+    resolver = make_resolver()
+    planner = GroupPlanner(resolver, max_group_size=2)
+    triggers = [(xgov, PROPOSAL + i) for i in range(2) for xgov in XGOVS[:3]]
+
+    groups = planner.plan([*triggers, triggers[0]])
+    # Sorted by Proposal and Representative, without duplicates
+    assert [len(group.triggers) for group in groups] == [2, 2, 2]
+    assert set(groups[0].triggers) == {(XGOVS[0], PROPOSAL), (XGOVS[1], PROPOSAL)}
+    assert groups[1].triggers[0] == (XGOVS[2], PROPOSAL)
+    report = planner.report
+    assert report.triggers == len(triggers)
+    assert report.groups == len(groups)
+    assert report.references_shared > 0
+    assert 0 < report.efficiency <= 1
+
+
+def test_plan_full_group() -> None:
+    resolver = make_resolver()
+    planner = GroupPlanner(resolver)
+
+    groups = planner.plan([(xgov, PROPOSAL) for xgov in XGOVS])
+    assert len(groups) == 1
+    assert planner.report.efficiency == len(XGOVS) / TX_GROUP_LIMIT
+
+    builder = RegistryCallBuilder(REGISTRY_APP, MANAGER, SUGGESTED_PARAMS)
+    txns = groups[0].build(builder)
+    assert len(txns) == len(XGOVS)
+    assert len({txn.group for txn in txns}) == 1
+    for txn in txns:
+        assert isinstance(txn, transaction.ApplicationCallTxn)
+        references = len(txn.foreign_apps or []) + len(txn.boxes or [])
+        assert references <= const.MAX_TXN_REFERENCES
+    assert groups[0].slots_used < sum(
+        1 + len(r.foreign_apps) + len(r.boxes)
+        for r in [resolver.trigger_vote(xgov, PROPOSAL) for xgov in XGOVS]
+    )
+
+
+def test_plan_marks_grouped_triggers() -> None:
+    resolver = make_resolver()
+    resolver.voter_index.update({11: 1, 12: 2})
+    planner = GroupPlanner(resolver)
+    page_box = (0, get_triggered_page_box(PROPOSAL, 1))
+
+    (group,) = planner.plan([(xgov, PROPOSAL) for xgov in XGOVS[:2]])
+    assert not group.to_ledger
+    # Both Voters are in the same page, referenced once
+    assert sum(page_box in r.boxes for r in group.resources) == 1
+
+    # A single trigger has no slot left for the page
+    (group,) = planner.plan([(XGOVS[0], PROPOSAL)])
+    assert page_box not in group.resources[0].boxes
+
+
+def test_plan_backup_representatives() -> None:
+    resolver = make_resolver()
+    resolver.set_backup_representatives(11, (2,))
+    planner = GroupPlanner(resolver)
+
+    # Two Representatives to try do not fit in a lone call, but do in a group
+    (group,) = planner.plan([(xgov, PROPOSAL) for xgov in XGOVS[:3]])
+    assert not planner.skipped
+
+    # Each backup tried is an inner call, paid by the fee of the trigger
+    backups_tried = dict(zip(group.triggers, group.backups_tried, strict=True))
+    assert backups_tried == {
+        (XGOVS[0], PROPOSAL): 1,
+        (XGOVS[1], PROPOSAL): 0,
+        (XGOVS[2], PROPOSAL): 0,
+    }
+    builder = RegistryCallBuilder(REGISTRY_APP, MANAGER, SUGGESTED_PARAMS)
+    for trigger, txn in zip(group.triggers, group.build(builder), strict=True):
+        assert txn.fee == (
+            (1 + TRIGGER_VOTE_INNER_TXNS + backups_tried[trigger]) * const.MIN_FEE
+        )
+
+    # Alone, the trigger is skipped instead
+    assert planner.plan([(XGOVS[0], PROPOSAL)]) == []
+    assert planner.skipped == [(XGOVS[0], PROPOSAL)]
+    assert planner.report.skipped == 1
+    assert "1 triggers skipped" in planner.report.summary()
+
+
+def test_plan_to_ledger() -> None:
+    resolver = make_resolver()
+    planner = GroupPlanner(resolver, ledger_address=MANAGER)
+
+    groups = planner.plan([(xgov, PROPOSAL) for xgov in XGOVS[:3]])
+    assert len(groups) == 1
+    assert groups[0].to_ledger
+    ledger_box = (0, get_trigger_rewards_box(MANAGER))
+    assert sum(ledger_box in r.boxes for r in groups[0].resources) == 1
+
+    builder = RegistryCallBuilder(REGISTRY_APP, MANAGER, SUGGESTED_PARAMS)
+    txns = groups[0].build(builder)
+    assert all(
+        txn.fee == (1 + TRIGGER_VOTE_TO_LEDGER_INNER_TXNS) * const.MIN_FEE
+        for txn in txns
+    )
+
+    # A single trigger has no slot left for the ledger box
+    groups = planner.plan([(XGOVS[0], PROPOSAL)])
+    assert not groups[0].to_ledger
@@ -0,0 +1,59 @@
+from algopy import Account, arc4
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.common import abi_types as typ
+from smart_contracts.proposal_mock.contract import ProposalMock
+from smart_contracts.xgov_registry_mock.contract import XgovRegistryMock
+
+
+def test_set_xgov_boxes(
+    context: AlgopyTestContext,
+    xgov_registry_mock: XgovRegistryMock,
+    no_role_account: Account,
+) -> None:
+    xgovs = [context.any.account() for _ in range(8)]
+
+    xgov_registry_mock.set_xgov_boxes(
+        arc4.DynamicArray(
+            *(
+                typ.XGovBoxEntry(
+                    xgov_address=arc4.Address(xgov),
+                    xgov_box=typ.XGovBoxValue(
+                        voting_address=arc4.Address(no_role_account),
+                        voted_proposals=arc4.UInt64(i),
+                        last_vote_timestamp=arc4.UInt64(0),
+                        subscription_round=arc4.UInt64(0),
+                    ),
+                )
+                for i, xgov in enumerate(xgovs)
+            )
+        )
+    )
+
+    for i, xgov in enumerate(xgovs):
+        xgov_box, exists = xgov_registry_mock.get_xgov_box(arc4.Address(xgov))
+        assert exists
+        assert xgov_box.voting_address == arc4.Address(no_role_account)
+        assert xgov_box.voted_proposals == i
+
+
+def test_set_voter_boxes(
+    context: AlgopyTestContext,
+    proposal_mock: ProposalMock,
+) -> None:
+    voters = [context.any.account() for _ in range(8)]
+
+    proposal_mock.set_voter_boxes(
+        arc4.DynamicArray(
+            *(
+                typ.VoterBoxEntry(
+                    voter_address=arc4.Address(voter),
+                    votes=arc4.UInt64(i + 1),
+                )
+                for i, voter in enumerate(voters)
+            )
+        )
+    )
+
+    for i, voter in enumerate(voters):
+        assert proposal_mock.get_voter_box(arc4.Address(voter)) == (i + 1, True)
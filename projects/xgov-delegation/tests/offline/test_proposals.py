@@ -0,0 +1,128 @@
+import base64
+
+from algosdk.encoding import decode_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.common.proposals import (
+    PROPOSAL_SCHEMA,
+    ProposalDiscovery,
+    ProposalEvent,
+    decode_proposal,
+)
+from smart_contracts.proposal import enums as enm
+from tests.offline.test_fleet import XGOVS
+
+XGOV_REGISTRY = 1000
+
+
+def make_app(
+    app_id: int,
+    status: int,
+    registry_app_id: int = XGOV_REGISTRY,
+    vote_open_ts: int = 0,
+) -> dict[str, object]:
+    values: dict[str, int | bytes] = {
+        name: 0 for name, (_, kind) in PROPOSAL_SCHEMA.items() if kind == "uint"
+    }
+    values |= {
+        "proposer": decode_address(XGOVS[0]),
+        "title": b"Proposal",
+        "registry_app_id": registry_app_id,
+        "status": status,
+        "vote_open_ts": vote_open_ts,
+        "voting_duration": 100,
+    }
+    global_state: list[dict[str, object]] = []
+    for name, (key, _) in PROPOSAL_SCHEMA.items():
+        value = values[name]
+        global_state.append(
+            {
+                "key": base64.b64encode(key).decode(),
+                "value": (
+                    {"type": 1, "bytes": base64.b64encode(value).decode()}
+                    if isinstance(value, bytes)
+                    else {"type": 2, "uint": value}
+                ),
+            }
+        )
+    return {"id": app_id, "params": {"global-state": global_state}}
+
+
+def make_discovery() -> tuple[ProposalDiscovery, list[ProposalEvent]]:
+    discovery = ProposalDiscovery(AlgodClient("", "http://localhost"), XGOV_REGISTRY)
+    events: list[ProposalEvent] = []
+    discovery.subscribe(events.append)
+    return discovery, events
+
+
+def test_decode_proposal() -> None:
+    app = make_app(2000, enm.STATUS_VOTING, vote_open_ts=50)
+    proposal = decode_proposal(2000, app["params"]["global-state"])  # type: ignore[index]
+
+    assert proposal is not None
+    assert proposal.proposer == XGOVS[0]
+    assert proposal.title == "Proposal"
+    assert proposal.is_voting
+    assert proposal.vote_close_ts == 150
+    assert decode_proposal(2001, []) is None
+
+
+def test_update_by_status() -> None:
+    discovery, events = make_discovery()
+    discovery.update(
+        10,
+        [
+            make_app(2000, enm.STATUS_DRAFT),
+            make_app(2001, enm.STATUS_VOTING, vote_open_ts=50),
+            make_app(2002, enm.STATUS_VOTING, vote_open_ts=10),
+            make_app(2003, enm.STATUS_VOTING, registry_app_id=XGOV_REGISTRY + 1),
+            {"id": 2004, "params": {"global-state": []}},
+        ],
+    )
+
+    assert sorted(discovery.proposals) == [2000, 2001, 2002]
+    assert [p.id for p in discovery.get_by_status(enm.STATUS_DRAFT)] == [2000]
+    assert [p.id for p in discovery.get_voting()] == [2002, 2001]
+    assert [(event.proposal.id, event.voting) for event in events] == [
+        (2001, True),
+        (2002, True),
+    ]
+
+
+def test_update_voting_events() -> None:
+    discovery, events = make_discovery()
+    discovery.update(
+        10,
+        [
+            make_app(2000, enm.STATUS_SUBMITTED),
+            make_app(2001, enm.STATUS_VOTING),
+            make_app(2002, enm.STATUS_VOTING),
+        ],
+    )
+    events.clear()
+
+    discovery.update(
+        20,
+        [
+            make_app(2000, enm.STATUS_VOTING),
+            make_app(2001, enm.STATUS_APPROVED),
+        ],
+    )
+
+    assert discovery.round == 20
+    assert [
+        (event.proposal.id, event.proposal.status, event.voting) for event in events
+    ] == [
+        (2000, enm.STATUS_VOTING, True),
+        (2001, enm.STATUS_APPROVED, False),
+        (2002, enm.STATUS_VOTING, False),  # deleted
+    ]
+
+
+def test_refresh_throttled() -> None:
+    discovery, _ = make_discovery()
+    discovery.refresh_rounds = 5
+    discovery.update(10, [])
+
+    # No request to algod while the cache is recent enough
+    assert not discovery.refresh(14)
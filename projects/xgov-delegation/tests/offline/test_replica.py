@@ -0,0 +1,184 @@
+import base64
+
+import pytest
+from algopy import Account, arc4
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.common import constants as const
+from smart_contracts.common.arc28 import Event
+from smart_contracts.common.follower import EVENT_DECODER, iter_app_logs
+from smart_contracts.common.replica import DelegationReplica
+from smart_contracts.delegation_registry import config as regcfg
+from smart_contracts.delegation_registry.contract import DelegationRegistry
+from smart_contracts.proposal_mock.contract import ProposalMock
+from smart_contracts.representative.contract import Representative
+from smart_contracts.voter.contract import Voter
+from tests.offline.emulator import get_app_logs
+from tests.offline.test_delegation_registry import open_trigger_rewards
+from tests.offline.test_fleet import REGISTRY_APP, make_fleet
+
+
+def get_events(context: AlgopyTestContext) -> list[tuple[int, Event]]:
+    events = []
+    for app_id, log in get_app_logs(context):
+        event = EVENT_DECODER.decode(log)
+        if event is not None:
+            events.append((app_id, event))
+    return events
+
+
+@pytest.fixture(scope="function")
+def replica(delegation_registry: DelegationRegistry) -> DelegationReplica:
+    return DelegationReplica(":memory:", delegation_registry.__app_id__)
+
+
+def test_replica_follows_events(
+    context: AlgopyTestContext,
+    replica: DelegationReplica,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    representative: Representative,
+    representative_account: Account,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    proposal_id = proposal_voter.__app_id__
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote(arc4.Address(xgov), arc4.UInt64(proposal_id))
+
+    replica.apply_round(1, get_events(context))
+
+    assert replica.round == 1
+    assert replica.get_voter_app_id(str(xgov)) == voter.__app_id__
+    assert replica.get_representative_app_id(str(representative_account)) == (
+        representative.__app_id__
+    )
+    # The Voter prepared for the next registration
+    (available_voter_id,) = replica.get_unassigned_voters()
+    assert available_voter_id != voter.__app_id__
+    assert replica.get_vote(representative.__app_id__, proposal_id) == (const.PPM, 0)
+    assert replica.has_voted(proposal_id, str(xgov))
+    assert replica.get_registry_value("votes_left") == 0
+    assert replica.get_registry_value("vote_trigger_award") == (
+        regcfg.VOTE_TRIGGER_AWARD
+    )
+    voter_row = replica.connection.execute(
+        "SELECT representative_id, votes_left FROM voters WHERE voter_id = ?",
+        (voter.__app_id__,),
+    ).fetchone()
+    assert voter_row == (representative.__app_id__, 0)
+
+
+def test_replica_follows_backup_representatives(
+    context: AlgopyTestContext,
+    replica: DelegationReplica,
+    voter: Voter,
+    representative: Representative,
+    xgov: Account,
+) -> None:
+    representative_id = arc4.UInt64(representative.__app_id__)
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.set_backup_representatives(arc4.DynamicArray(representative_id))
+    replica.apply_round(1, get_events(context))
+    assert replica.get_backup_representatives(voter.__app_id__) == [
+        representative.__app_id__
+    ]
+
+    with context.txn.create_group(active_txn_overrides={"sender": xgov}):
+        voter.set_backup_representatives(arc4.DynamicArray[arc4.UInt64]())
+    replica.apply_round(2, get_events(context)[-1:])
+    assert replica.get_backup_representatives(voter.__app_id__) == []
+
+
+def test_replica_follows_trigger_rewards(
+    context: AlgopyTestContext,
+    replica: DelegationReplica,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    proposal_voter: ProposalMock,
+    xgov: Account,
+    no_role_account: Account,
+) -> None:
+    trigger_address = str(no_role_account)
+    open_trigger_rewards(context, delegation_registry, no_role_account)
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.trigger_vote_to_ledger(
+            arc4.Address(xgov), arc4.UInt64(proposal_voter.__app_id__)
+        )
+    events = get_events(context)
+    replica.apply_round(1, events)
+    assert replica.get_trigger_rewards(trigger_address) == regcfg.VOTE_TRIGGER_AWARD
+
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.claim_trigger_rewards()
+    replica.apply_round(2, get_events(context)[len(events) :])
+    assert replica.get_trigger_rewards(trigger_address) == 0
+
+    events = get_events(context)
+    with context.txn.create_group(active_txn_overrides={"sender": no_role_account}):
+        delegation_registry.close_trigger_rewards()
+    replica.apply_round(3, get_events(context)[len(events) :])
+    assert replica.get_trigger_rewards(trigger_address) is None
+
+
+def test_replica_loads_fleet_backup_representatives() -> None:
+    fleet = make_fleet()
+    fleet.backup_representatives[13] = (1, 2)
+    replica = DelegationReplica(":memory:", REGISTRY_APP)
+
+    replica.load_fleet(fleet, 10)
+
+    assert replica.get_backup_representatives(13) == [1, 2]
+    assert replica.get_backup_representatives(11) == []
+
+
+def test_replica_ignores_untracked_apps(
+    context: AlgopyTestContext,
+    delegation_registry: DelegationRegistry,
+    voter: Voter,
+    xgov: Account,
+) -> None:
+    replica = DelegationReplica(":memory:", delegation_registry.__app_id__ + 1)
+
+    replica.apply_round(1, get_events(context))
+
+    assert replica.get_voter_app_id(str(xgov)) is None
+
+
+def test_replica_round_is_atomic(
+    context: AlgopyTestContext,
+    replica: DelegationReplica,
+    voter: Voter,
+    xgov: Account,
+) -> None:
+    events = get_events(context)
+    broken = Event(name="VoterRegistered", args={})
+
+    with pytest.raises(KeyError):
+        replica.apply_round(1, [*events, (voter.__app_id__, broken)])
+
+    assert replica.round == 0
+    assert replica.get_voter_app_id(str(xgov)) is None
+
+    replica.apply_round(1, events)
+    with pytest.raises(AssertionError):
+        replica.apply_round(1, events)
+
+
+def test_iter_app_logs() -> None:
+    def log(data: bytes) -> str:
+        return base64.b64encode(data).decode()
+
+    stxn = {
+        "txn": {"type": "appl", "apid": 1},
+        "dt": {
+            "lg": [log(b"outer")],
+            "itx": [
+                {"txn": {"type": "pay"}},
+                {"txn": {"type": "appl"}, "apid": 2, "dt": {"lg": [log(b"create")]}},
+            ],
+        },
+    }
+
+    assert list(iter_app_logs(stxn)) == [(2, b"create"), (1, b"outer")]
@@ -0,0 +1,161 @@
+from algokit_utils import BoxReference, CommonAppCallParams
+from algosdk.constants import ZERO_ADDRESS
+
+from smart_contracts.common import constants as const
+from smart_contracts.common.fast_builder import RegistryCallBuilder
+from smart_contracts.common.resources import (
+    AppCallResources,
+    ResourceResolver,
+    get_proposal_voter_box,
+    get_registry_voter_box,
+    get_representative_vote_box,
+    get_xgov_box,
+    with_resources,
+)
+from smart_contracts.delegation_registry import config as regcfg
+from tests.load.build_benchmark import SUGGESTED_PARAMS
+from tests.offline.test_fleet import MANAGER, REGISTRY_APP, XGOVS, make_fleet
+
+XGOV_REGISTRY_APP = 500
+PROPOSAL = 2000
+
+
+def make_resolver() -> ResourceResolver:
+    return ResourceResolver.from_fleet(make_fleet(), REGISTRY_APP, XGOV_REGISTRY_APP)
+
+
+def test_from_fleet() -> None:
+    resolver = make_resolver()
+
+    assert resolver.voter_ids == {
+        XGOVS[0]: 11,
+        XGOVS[1]: 12,
+        XGOVS[2]: 13,
+        XGOVS[3]: 14,
+        ZERO_ADDRESS: 15,
+    }
+    assert resolver.representative_of[13] == 2
+
+
+def test_from_fleet_backup_representatives() -> None:
+    fleet = make_fleet()
+    fleet.backup_representatives[13] = (3, 4)
+
+    resolver = ResourceResolver.from_fleet(fleet, REGISTRY_APP, XGOV_REGISTRY_APP)
+
+    assert resolver.backups_of == {13: (3, 4)}
+    assert resolver.get_backups_tried(XGOVS[2], PROPOSAL) == 2
+    assert resolver.get_backups_tried(XGOVS[3], PROPOSAL) == 0
+
+
+def test_trigger_vote() -> None:
+    resolver = make_resolver()
+
+    assert resolver.trigger_vote(XGOVS[2], PROPOSAL) == AppCallResources(
+        foreign_apps=(2, 13, PROPOSAL, XGOV_REGISTRY_APP),
+        boxes=(
+            (2, get_representative_vote_box(PROPOSAL)),
+            (PROPOSAL, get_proposal_voter_box(XGOVS[2])),
+            (XGOV_REGISTRY_APP, get_xgov_box(XGOVS[2])),
+        ),
+    )
+    # Without Representative
+    assert resolver.trigger_vote(XGOVS[3], PROPOSAL).foreign_apps == (
+        14,
+        PROPOSAL,
+        XGOV_REGISTRY_APP,
+    )
+    assert get_representative_vote_box(PROPOSAL) == b"pv" + PROPOSAL.to_bytes(8)
+
+
+def test_trigger_vote_backup_representatives() -> None:
+    resolver = make_resolver()
+    resolver.set_backup_representatives(13, (3, 4))
+
+    # Backups until one known to have published a vote
+    resolver.set_vote_published(3, PROPOSAL)
+    resources = resolver.trigger_vote(XGOVS[2], PROPOSAL)
+    assert resources.foreign_apps == (2, 3, 13, PROPOSAL, XGOV_REGISTRY_APP)
+    assert resources.boxes[:2] == (
+        (2, get_representative_vote_box(PROPOSAL)),
+        (3, get_representative_vote_box(PROPOSAL)),
+    )
+
+    # All of them, without any known vote
+    resolver.set_vote_published(3, PROPOSAL, published=False)
+    assert resolver.get_representatives_tried(13, PROPOSAL) == [2, 3, 4]
+
+
+def test_add_votes() -> None:
+    resolver = make_resolver()
+
+    assert resolver.add_votes(XGOVS[0], XGOVS[0]) == AppCallResources(
+        foreign_apps=(11,)
+    )
+    assert resolver.add_votes(XGOVS[0], MANAGER) == AppCallResources(
+        foreign_apps=(11, XGOV_REGISTRY_APP),
+        boxes=((XGOV_REGISTRY_APP, get_xgov_box(XGOVS[0])),),
+    )
+
+
+def test_publish_vote() -> None:
+    resolver = make_resolver()
+
+    # The xGov Registry is cached in the Representative, not read from the registry
+    assert resolver.publish_vote(2, PROPOSAL) == AppCallResources(
+        foreign_apps=(PROPOSAL, XGOV_REGISTRY_APP),
+        boxes=((2, get_representative_vote_box(PROPOSAL)),),
+    )
+
+
+def test_trigger_vote_params() -> None:
+    resolver = make_resolver()
+
+    params = resolver.get_trigger_vote_params(XGOVS[0], PROPOSAL, CommonAppCallParams())
+    assert params.app_references == [1, 11, PROPOSAL, XGOV_REGISTRY_APP]
+    assert params.box_references is not None
+    assert with_resources(REGISTRY_APP, AppCallResources(), params).box_references == []
+    assert params.box_references[:2] == [
+        BoxReference(REGISTRY_APP, get_registry_voter_box(XGOVS[0])),
+        BoxReference(1, get_representative_vote_box(PROPOSAL)),
+    ]
+
+
+def test_builder_resources() -> None:
+    resolver = make_resolver()
+    builder = RegistryCallBuilder(REGISTRY_APP, MANAGER, SUGGESTED_PARAMS)
+
+    txns = builder.trigger_votes(
+        [(xgov, PROPOSAL) for xgov in XGOVS[:3]], resources=resolver.trigger_vote
+    )
+    for txn in txns:
+        references = len(txn.foreign_apps) + len(txn.accounts or []) + len(txn.boxes)
+        assert references <= const.MAX_TXN_REFERENCES
+    assert txns[0].foreign_apps == [1, 11, PROPOSAL, XGOV_REGISTRY_APP]
+
+    # The backups tried are paid an inner call each
+    resolver.set_backup_representatives(11, (2, 3))
+    txns = builder.trigger_votes(
+        [(xgov, PROPOSAL) for xgov in XGOVS[:2]],
+        resources=resolver.trigger_vote,
+        backups_tried=resolver.get_backups_tried,
+    )
+    assert txns[0].fee == txns[1].fee + 2 * const.MIN_FEE
+
+
+def test_trigger_vote_to_ledger() -> None:
+    resolver = make_resolver()
+    resolver.voter_index[11] = regcfg.TRIGGERED_PAGE_BITS + 3
+
+    resources = resolver.trigger_vote_to_ledger(XGOVS[0], PROPOSAL)
+    assert resources.boxes[-1] == (
+        0,
+        b"b" + PROPOSAL.to_bytes(8) + (1).to_bytes(8),
+    )
+    # Grouped trigger_vote calls mark the Voter too, lone ones cannot
+    assert resolver.trigger_vote(XGOVS[0], PROPOSAL, grouped=True) == resources
+    assert resources.boxes[-1] not in resolver.trigger_vote(XGOVS[0], PROPOSAL).boxes
+    # Voters without index are not marked
+    assert resolver.trigger_vote_to_ledger(XGOVS[1], PROPOSAL) == (
+        resolver.trigger_vote(XGOVS[1], PROPOSAL)
+    )
@@ -0,0 +1,58 @@
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.errors import std_errors as err
+from tests.load.backends import ADD_VOTES, PUBLISH_VOTE, TRIGGER_VOTE, EmulatorBackend
+from tests.load.scenario import ScenarioConfig
+from tests.load.throughput import classify_failure, percentile, run_benchmark
+
+SCENARIO_CONFIG = ScenarioConfig(
+    xgovs=10,
+    representatives=3,
+    proposals=2,
+    publish_votes=False,
+)
+
+
+def test_run_benchmark(context: AlgopyTestContext) -> None:
+    report = run_benchmark(EmulatorBackend(context, SCENARIO_CONFIG), SCENARIO_CONFIG)
+
+    add_votes = report.get(ADD_VOTES)
+    publish_vote = report.get(PUBLISH_VOTE)
+    trigger_vote = report.get(TRIGGER_VOTE)
+    assert add_votes.successes == SCENARIO_CONFIG.xgovs
+    assert (
+        publish_vote.successes
+        == SCENARIO_CONFIG.representatives * SCENARIO_CONFIG.proposals
+    )
+    assert trigger_vote.successes == SCENARIO_CONFIG.xgovs * SCENARIO_CONFIG.proposals
+    assert not add_votes.failures | publish_vote.failures | trigger_vote.failures
+    assert report.votes_per_second > 0
+    assert report.fees_per_vote > 0
+    assert '"votes_per_second"' in report.to_json()
+
+
+def test_run_benchmark_failures(context: AlgopyTestContext) -> None:
+    backend = EmulatorBackend(context, SCENARIO_CONFIG)
+    backend.setup()
+
+    # No votes were bought
+    backend.setup = lambda: None  # type: ignore[method-assign]
+    backend.add_votes = lambda xgov, votes: 0  # type: ignore[method-assign]
+    report = run_benchmark(backend, SCENARIO_CONFIG)
+
+    assert report.get(TRIGGER_VOTE).failures == {
+        "NO_VOTES_LEFT": SCENARIO_CONFIG.xgovs * SCENARIO_CONFIG.proposals
+    }
+
+
+def test_classify_failure() -> None:
+    assert classify_failure(AssertionError(err.UNAUTHORIZED)) == "UNAUTHORIZED"
+    assert classify_failure(ValueError("unexpected")) == "ValueError"
+
+
+def test_percentile() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0
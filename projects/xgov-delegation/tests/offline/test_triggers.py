@@ -0,0 +1,32 @@
+from smart_contracts.common.triggers import VotedBitmap
+from tests.offline.test_fleet import XGOVS
+
+PROPOSAL = 2000
+
+
+def test_set_voters() -> None:
+    bitmap = VotedBitmap(XGOVS)
+    bitmap.set_voters(PROPOSAL, [XGOVS[0], XGOVS[2]])
+
+    assert [bitmap.has_voted(PROPOSAL, xgov) for xgov in XGOVS] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    # Unknown Proposal
+    assert not bitmap.has_voted(PROPOSAL + 1, XGOVS[1])
+
+
+def test_filter() -> None:
+    bitmap = VotedBitmap(XGOVS)
+    bitmap.set_voters(PROPOSAL, XGOVS)
+    bitmap.mark_voted(PROPOSAL, XGOVS[3])
+
+    pairs = [(xgov, PROPOSAL) for xgov in XGOVS] + [(XGOVS[3], PROPOSAL + 1)]
+    assert bitmap.filter(pairs) == [
+        (XGOVS[0], PROPOSAL),
+        (XGOVS[1], PROPOSAL),
+        (XGOVS[2], PROPOSAL),
+        (XGOVS[3], PROPOSAL + 1),
+    ]